@@ -1,6 +1,6 @@
 """Shared Garmin Connect client for data extraction."""
 
-from garmin_client.api.client import GarminClient
+from garmin_client.api.client import FetchError, GarminClient, RateLimitError
 from garmin_client.db.database import Database
 from garmin_client.db.models import (
     DailyWellness,
@@ -45,6 +45,8 @@ __version__ = "0.1.0"
 
 __all__ = [
     "GarminClient",
+    "RateLimitError",
+    "FetchError",
     "Database",
     "DailyWellness",
     "SleepData",
@@ -1,5 +1,5 @@
 """Garmin Connect API client."""
 
-from .client import GarminClient
+from .client import FetchError, GarminClient, RateLimitError
 
-__all__ = ["GarminClient"]
+__all__ = ["FetchError", "GarminClient", "RateLimitError"]
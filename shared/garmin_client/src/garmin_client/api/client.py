@@ -4,15 +4,44 @@ import json
 import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Dict, Optional, List, TypeVar
 
 import garth
+from garth.exc import GarthHTTPError
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
 
 from garmin_client.db.models import (
     DailyWellness, SleepData, HRVData, StressData, ActivityData
 )
 
 
+class RateLimitError(RuntimeError):
+    """Garmin Connect answered HTTP 429 Too Many Requests."""
+
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__("Rate limited by Garmin Connect")
+        self.retry_after = retry_after
+
+
+class FetchError(RuntimeError):
+    """A Garmin Connect request failed in a way worth retrying later.
+
+    Raised for server errors (5xx), request timeouts and dropped
+    connections, as opposed to data that simply is not there.
+    """
+
+
+T = TypeVar("T")
+
+
+def _retry_after(response) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds form only)."""
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
 class GarminClient:
     """Client for fetching wellness data from Garmin Connect."""
 
@@ -77,6 +106,27 @@ class GarminClient:
         if not self._authenticated:
             self.authenticate()
 
+    def _connectapi(self, path: str, **kwargs):
+        """Call the Connect API, raising RateLimitError on HTTP 429.
+
+        The fetch_* methods treat other errors as missing data, but a
+        rate limit has to reach the caller so it can back off, and a
+        transient failure (FetchError) so the day can be fetched again.
+        """
+        try:
+            return garth.connectapi(path, **kwargs)
+        except GarthHTTPError as e:
+            response = getattr(e.error, "response", None)
+            if response is not None and response.status_code == 429:
+                raise RateLimitError(_retry_after(response)) from e
+            if response is not None and (
+                response.status_code >= 500 or response.status_code == 408
+            ):
+                raise FetchError(f"HTTP {response.status_code} from {path}") from e
+            raise
+        except (RequestsConnectionError, Timeout) as e:
+            raise FetchError(f"Request to {path} failed: {e}") from e
+
     def fetch_sleep(self, date_str: str) -> Optional[SleepData]:
         """Fetch sleep data for a specific date.
 
@@ -89,7 +139,7 @@ class GarminClient:
         self._ensure_authenticated()
 
         try:
-            data = garth.connectapi(
+            data = self._connectapi(
                 f"/wellness-service/wellness/dailySleep?date={date_str}"
             )
 
@@ -121,6 +171,8 @@ class GarminClient:
                 avg_spo2=data.get("avgOxygenSaturation"),
                 avg_respiration=data.get("avgSleepRespirationValue"),
             )
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch sleep data: {e}")
             return None
@@ -130,7 +182,7 @@ class GarminClient:
         self._ensure_authenticated()
 
         try:
-            data = garth.connectapi(f"/hrv-service/hrv/{date_str}")
+            data = self._connectapi(f"/hrv-service/hrv/{date_str}")
 
             if not data:
                 return None
@@ -148,6 +200,8 @@ class GarminClient:
                 baseline_balanced_low=baseline.get("balancedLow"),
                 baseline_balanced_upper=baseline.get("balancedUpper"),
             )
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch HRV data: {e}")
             return None
@@ -161,20 +215,24 @@ class GarminClient:
 
         # Fetch stress data
         try:
-            stress_data = garth.connectapi(
+            stress_data = self._connectapi(
                 f"/wellness-service/wellness/dailyStress/{date_str}"
             )
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch stress data: {e}")
 
         # Fetch body battery data
         try:
-            bb_result = garth.connectapi(
+            bb_result = self._connectapi(
                 f"/wellness-service/wellness/bodyBattery/reports/daily"
                 f"?startDate={date_str}&endDate={date_str}"
             )
             if bb_result and len(bb_result) > 0:
                 bb_data = bb_result[0]
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch body battery data: {e}")
 
@@ -209,7 +267,7 @@ class GarminClient:
 
         # Fetch steps data
         try:
-            steps_data = garth.connectapi(
+            steps_data = self._connectapi(
                 f"/usersummary-service/stats/steps/daily/{date_str}/{date_str}"
             )
             if steps_data and len(steps_data) > 0:
@@ -217,12 +275,14 @@ class GarminClient:
                 steps = day_data.get("totalSteps", 0)
                 steps_goal = day_data.get("stepGoal", 10000)
                 total_distance_m = day_data.get("totalDistance", 0)
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch steps data: {e}")
 
         # Fetch daily user summary for calories and intensity minutes
         try:
-            summary_data = garth.connectapi(
+            summary_data = self._connectapi(
                 f"/usersummary-service/usersummary/daily/{date_str}"
             )
             if summary_data:
@@ -240,6 +300,8 @@ class GarminClient:
                     steps_goal = summary_data.get("dailyStepGoal", 10000)
                 if total_distance_m == 0:
                     total_distance_m = summary_data.get("totalDistanceMeters", 0)
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch daily summary: {e}")
 
@@ -271,7 +333,7 @@ class GarminClient:
 
         try:
             # Garmin API endpoint for daily heart rate with date as query param
-            data = garth.connectapi(
+            data = self._connectapi(
                 "/wellness-service/wellness/dailyHeartRate",
                 params={"date": date_str}
             )
@@ -282,6 +344,8 @@ class GarminClient:
             # Response contains restingHeartRate directly
             rhr = data.get("restingHeartRate")
             return rhr if rhr and rhr > 0 else None
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch resting heart rate: {e}")
             return None
@@ -293,18 +357,29 @@ class GarminClient:
             date_str: Date in YYYY-MM-DD format
 
         Returns:
-            DailyWellness object with all available metrics
+            DailyWellness object with all available metrics. Sources that
+            failed transiently are listed in its fetch_errors.
         """
         self._ensure_authenticated()
 
         print(f"Fetching wellness data for {date_str}...")
 
-        # Fetch all data sources
-        sleep = self.fetch_sleep(date_str)
-        hrv = self.fetch_hrv(date_str)
-        stress = self.fetch_stress(date_str)
-        activity = self.fetch_activity(date_str)
-        resting_heart_rate = self.fetch_resting_heart_rate(date_str)
+        # Fetch all data sources, noting the ones that failed transiently
+        fetch_errors: Dict[str, str] = {}
+
+        def attempt(source: str, fetch: Callable[[str], Optional[T]]) -> Optional[T]:
+            try:
+                return fetch(date_str)
+            except FetchError as e:
+                print(f"  Warning: Could not fetch {source} data: {e}")
+                fetch_errors[source] = str(e)
+                return None
+
+        sleep = attempt("sleep", self.fetch_sleep)
+        hrv = attempt("hrv", self.fetch_hrv)
+        stress = attempt("stress", self.fetch_stress)
+        activity = attempt("activity", self.fetch_activity)
+        resting_heart_rate = attempt("resting_heart_rate", self.fetch_resting_heart_rate)
 
         # Build raw JSON for debugging
         raw_data = {
@@ -324,6 +399,7 @@ class GarminClient:
             activity=activity,
             resting_heart_rate=resting_heart_rate,
             raw_json=json.dumps(raw_data),
+            fetch_errors=fetch_errors,
         )
 
         # Print summary
@@ -351,7 +427,7 @@ class GarminClient:
         self._ensure_authenticated()
 
         try:
-            data = garth.connectapi(f"/metrics-service/metrics/trainingreadiness/{date_str}")
+            data = self._connectapi(f"/metrics-service/metrics/trainingreadiness/{date_str}")
 
             if not data:
                 return None
@@ -366,6 +442,8 @@ class GarminClient:
                 "acclimation_feedback": data.get("acclimationFeedback"),
                 "primary_feedback": data.get("primaryFeedback"),
             }
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch training readiness: {e}")
             return None
@@ -383,7 +461,7 @@ class GarminClient:
         self._ensure_authenticated()
 
         try:
-            data = garth.connectapi(f"/wellness-service/wellness/sleepNeed/{date_str}")
+            data = self._connectapi(f"/wellness-service/wellness/sleepNeed/{date_str}")
 
             if not data:
                 return None
@@ -394,6 +472,8 @@ class GarminClient:
                 "recommended_sleep_need_seconds": data.get("recommendedSleepNeedSeconds"),
                 "sleep_debt_seconds": data.get("sleepDebtSeconds"),
             }
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch sleep need: {e}")
             return None
@@ -410,7 +490,7 @@ class GarminClient:
         self._ensure_authenticated()
 
         try:
-            data = garth.connectapi(f"/wellness-service/wellness/dailyRespirationData/{date_str}")
+            data = self._connectapi(f"/wellness-service/wellness/dailyRespirationData/{date_str}")
 
             if not data:
                 return None
@@ -422,6 +502,8 @@ class GarminClient:
                 "highest_respiration": data.get("highestRespirationValue"),
                 "lowest_respiration": data.get("lowestRespirationValue"),
             }
+        except (RateLimitError, FetchError):
+            raise
         except Exception as e:
             print(f"  Warning: Could not fetch respiration data: {e}")
             return None
@@ -4,7 +4,7 @@ import sqlite3
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, List, Optional, Set, Tuple
 from contextlib import contextmanager
 
 from .models import DailyWellness, SleepData, HRVData, StressData, ActivityData
@@ -126,6 +126,15 @@ class Database:
                     FOREIGN KEY (date) REFERENCES daily_wellness(date)
                 );
 
+                -- Per-date outcome of history fetches, so backfills can resume
+                CREATE TABLE IF NOT EXISTS fetch_progress (
+                    date TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    updated_at TEXT NOT NULL
+                );
+
                 -- Indexes for common queries
                 CREATE INDEX IF NOT EXISTS idx_wellness_date ON daily_wellness(date);
                 CREATE INDEX IF NOT EXISTS idx_sleep_date ON sleep_data(date);
@@ -178,78 +187,88 @@ class Database:
 
     def save_wellness(self, wellness: DailyWellness) -> None:
         """Save or update a daily wellness record."""
+        self.save_wellness_batch([wellness])
+
+    def save_wellness_batch(self, records: List[DailyWellness]) -> None:
+        """Save or update many daily wellness records in one transaction."""
         with self._get_connection() as conn:
-            # Main wellness record
+            for wellness in records:
+                self._write_wellness(conn, wellness)
+
+    @staticmethod
+    def _write_wellness(conn: sqlite3.Connection, wellness: DailyWellness) -> None:
+        """Write one wellness record and its component rows."""
+        # Main wellness record
+        conn.execute("""
+            INSERT OR REPLACE INTO daily_wellness
+            (date, fetched_at, resting_heart_rate, training_readiness_score,
+             training_readiness_level, raw_json)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (
+            wellness.date,
+            wellness.fetched_at,
+            wellness.resting_heart_rate,
+            wellness.training_readiness_score,
+            wellness.training_readiness_level,
+            wellness.raw_json,
+        ))
+
+        # Sleep data
+        if wellness.sleep:
+            s = wellness.sleep
+            conn.execute("""
+                INSERT OR REPLACE INTO sleep_data
+                (date, sleep_start, sleep_end, total_sleep_seconds, deep_sleep_seconds,
+                 light_sleep_seconds, rem_sleep_seconds, awake_seconds, sleep_score,
+                 sleep_efficiency, avg_spo2, avg_respiration)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                s.date, s.sleep_start, s.sleep_end, s.total_sleep_seconds,
+                s.deep_sleep_seconds, s.light_sleep_seconds, s.rem_sleep_seconds,
+                s.awake_seconds, s.sleep_score, s.sleep_efficiency,
+                s.avg_spo2, s.avg_respiration,
+            ))
+
+        # HRV data
+        if wellness.hrv:
+            h = wellness.hrv
             conn.execute("""
-                INSERT OR REPLACE INTO daily_wellness
-                (date, fetched_at, resting_heart_rate, training_readiness_score,
-                 training_readiness_level, raw_json)
-                VALUES (?, ?, ?, ?, ?, ?)
+                INSERT OR REPLACE INTO hrv_data
+                (date, hrv_weekly_avg, hrv_last_night_avg, hrv_last_night_5min_high,
+                 hrv_status, baseline_low, baseline_balanced_low, baseline_balanced_upper)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (
-                wellness.date,
-                wellness.fetched_at,
-                wellness.resting_heart_rate,
-                wellness.training_readiness_score,
-                wellness.training_readiness_level,
-                wellness.raw_json,
+                h.date, h.hrv_weekly_avg, h.hrv_last_night_avg, h.hrv_last_night_5min_high,
+                h.hrv_status, h.baseline_low, h.baseline_balanced_low, h.baseline_balanced_upper,
             ))
 
-            # Sleep data
-            if wellness.sleep:
-                s = wellness.sleep
-                conn.execute("""
-                    INSERT OR REPLACE INTO sleep_data
-                    (date, sleep_start, sleep_end, total_sleep_seconds, deep_sleep_seconds,
-                     light_sleep_seconds, rem_sleep_seconds, awake_seconds, sleep_score,
-                     sleep_efficiency, avg_spo2, avg_respiration)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    s.date, s.sleep_start, s.sleep_end, s.total_sleep_seconds,
-                    s.deep_sleep_seconds, s.light_sleep_seconds, s.rem_sleep_seconds,
-                    s.awake_seconds, s.sleep_score, s.sleep_efficiency,
-                    s.avg_spo2, s.avg_respiration,
-                ))
-
-            # HRV data
-            if wellness.hrv:
-                h = wellness.hrv
-                conn.execute("""
-                    INSERT OR REPLACE INTO hrv_data
-                    (date, hrv_weekly_avg, hrv_last_night_avg, hrv_last_night_5min_high,
-                     hrv_status, baseline_low, baseline_balanced_low, baseline_balanced_upper)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    h.date, h.hrv_weekly_avg, h.hrv_last_night_avg, h.hrv_last_night_5min_high,
-                    h.hrv_status, h.baseline_low, h.baseline_balanced_low, h.baseline_balanced_upper,
-                ))
-
-            # Stress data
-            if wellness.stress:
-                st = wellness.stress
-                conn.execute("""
-                    INSERT OR REPLACE INTO stress_data
-                    (date, avg_stress_level, max_stress_level, rest_stress_duration,
-                     low_stress_duration, medium_stress_duration, high_stress_duration,
-                     body_battery_charged, body_battery_drained, body_battery_high, body_battery_low)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    st.date, st.avg_stress_level, st.max_stress_level, st.rest_stress_duration,
-                    st.low_stress_duration, st.medium_stress_duration, st.high_stress_duration,
-                    st.body_battery_charged, st.body_battery_drained, st.body_battery_high, st.body_battery_low,
-                ))
-
-            # Activity data
-            if wellness.activity:
-                a = wellness.activity
-                conn.execute("""
-                    INSERT OR REPLACE INTO activity_data
-                    (date, steps, steps_goal, total_distance_m, active_calories,
-                     total_calories, intensity_minutes, floors_climbed)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    a.date, a.steps, a.steps_goal, a.total_distance_m,
-                    a.active_calories, a.total_calories, a.intensity_minutes, a.floors_climbed,
-                ))
+        # Stress data
+        if wellness.stress:
+            st = wellness.stress
+            conn.execute("""
+                INSERT OR REPLACE INTO stress_data
+                (date, avg_stress_level, max_stress_level, rest_stress_duration,
+                 low_stress_duration, medium_stress_duration, high_stress_duration,
+                 body_battery_charged, body_battery_drained, body_battery_high, body_battery_low)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                st.date, st.avg_stress_level, st.max_stress_level, st.rest_stress_duration,
+                st.low_stress_duration, st.medium_stress_duration, st.high_stress_duration,
+                st.body_battery_charged, st.body_battery_drained, st.body_battery_high, st.body_battery_low,
+            ))
+
+        # Activity data
+        if wellness.activity:
+            a = wellness.activity
+            conn.execute("""
+                INSERT OR REPLACE INTO activity_data
+                (date, steps, steps_goal, total_distance_m, active_calories,
+                 total_calories, intensity_minutes, floors_climbed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                a.date, a.steps, a.steps_goal, a.total_distance_m,
+                a.active_calories, a.total_calories, a.intensity_minutes, a.floors_climbed,
+            ))
 
     def get_wellness(self, date_str: str) -> Optional[DailyWellness]:
         """Get wellness data for a specific date."""
@@ -303,6 +322,52 @@ class Database:
 
         return [self.get_wellness(row["date"]) for row in rows]
 
+    def get_complete_dates(self, start_date: str, end_date: str) -> Set[str]:
+        """Dates in a range whose stored record is final.
+
+        A record is final once it was fetched after its day ended; one
+        fetched during the day has partial activity and stress data, and
+        one whose last backfill hit transient errors ('partial' in
+        fetch_progress) is missing whole sources.
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT date FROM daily_wellness
+                WHERE date >= ? AND date <= ?
+                  AND substr(fetched_at, 1, 10) > date
+                  AND date NOT IN (
+                      SELECT date FROM fetch_progress WHERE status = 'partial'
+                  )
+            """, (start_date, end_date)).fetchall()
+        return {row["date"] for row in rows}
+
+    def get_fetch_progress(self, start_date: str, end_date: str) -> Dict[str, dict]:
+        """Backfill progress rows in a range, keyed by date."""
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT * FROM fetch_progress
+                WHERE date >= ? AND date <= ?
+            """, (start_date, end_date)).fetchall()
+        return {row["date"]: dict(row) for row in rows}
+
+    def save_fetch_progress(self, entries: List[Tuple[str, str, Optional[str]]]) -> None:
+        """Record backfill outcomes as (date, status, error) tuples.
+
+        Attempts accumulate across runs so repeatedly failing dates can
+        be reported.
+        """
+        now = datetime.now().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO fetch_progress (date, status, attempts, last_error, updated_at)
+                VALUES (?, ?, 1, ?, ?)
+                ON CONFLICT(date) DO UPDATE SET
+                    status = excluded.status,
+                    attempts = fetch_progress.attempts + 1,
+                    last_error = excluded.last_error,
+                    updated_at = excluded.updated_at
+            """, [(date, status, error, now) for date, status, error in entries])
+
     def get_latest_date(self) -> Optional[str]:
         """Get the most recent date in the database."""
         with self._get_connection() as conn:
@@ -1,8 +1,8 @@
 """Data models for wellness metrics."""
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, date
-from typing import Optional
+from typing import Dict, Optional
 import json
 
 
@@ -133,6 +133,10 @@ class DailyWellness:
     # Raw JSON for debugging
     raw_json: Optional[str] = None
 
+    # Sources that failed transiently (source -> error), not stored.
+    # A record with errors is incomplete and should be fetched again.
+    fetch_errors: Dict[str, str] = field(default_factory=dict)
+
     def to_dict(self) -> dict:
         return {
             "date": self.date,
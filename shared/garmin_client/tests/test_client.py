@@ -0,0 +1,97 @@
+"""Tests for how GarminClient surfaces request failures."""
+
+import pytest
+import requests
+from garth.exc import GarthHTTPError
+
+from garmin_client import FetchError, GarminClient, RateLimitError
+
+
+def http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return GarthHTTPError(
+        msg="Error in request",
+        error=requests.HTTPError(f"{status}", response=response),
+    )
+
+
+@pytest.fixture
+def client(tmp_path):
+    client = GarminClient(token_dir=tmp_path)
+    client._authenticated = True
+    return client
+
+
+def serve(monkeypatch, handler):
+    monkeypatch.setattr("garmin_client.api.client.garth.connectapi", handler)
+
+
+class TestConnectApiErrors:
+    """Tests for the errors raised by _connectapi."""
+
+    def test_rate_limit(self, client, monkeypatch):
+        def handler(path, **kwargs):
+            raise http_error(429, {"Retry-After": "30"})
+
+        serve(monkeypatch, handler)
+
+        with pytest.raises(RateLimitError) as exc:
+            client._connectapi("/x")
+        assert exc.value.retry_after == 30.0
+
+    @pytest.mark.parametrize("failure", [
+        http_error(503),
+        http_error(408),
+        requests.Timeout("read timed out"),
+        requests.ConnectionError("connection reset"),
+    ])
+    def test_transient_failures(self, client, monkeypatch, failure):
+        def handler(path, **kwargs):
+            raise failure
+
+        serve(monkeypatch, handler)
+
+        with pytest.raises(FetchError):
+            client._connectapi("/x")
+
+    def test_client_errors_pass_through(self, client, monkeypatch):
+        def handler(path, **kwargs):
+            raise http_error(404)
+
+        serve(monkeypatch, handler)
+
+        with pytest.raises(GarthHTTPError):
+            client._connectapi("/x")
+
+
+class TestFetchWellness:
+    """Tests for per-source failures in fetch_wellness."""
+
+    def test_transient_failure_is_recorded(self, client, monkeypatch):
+        def handler(path, **kwargs):
+            if path.startswith("/hrv-service"):
+                raise http_error(502)
+            if "dailyStress" in path:
+                return {"overallStressLevel": 30}
+            raise http_error(404)
+
+        serve(monkeypatch, handler)
+
+        wellness = client.fetch_wellness("2024-03-01")
+
+        assert list(wellness.fetch_errors) == ["hrv"]
+        assert wellness.hrv is None
+        assert wellness.stress.avg_stress_level == 30
+
+    def test_missing_data_is_not_an_error(self, client, monkeypatch):
+        def handler(path, **kwargs):
+            raise http_error(404)
+
+        serve(monkeypatch, handler)
+
+        wellness = client.fetch_wellness("2024-03-01")
+
+        assert wellness.fetch_errors == {}
+        assert wellness.sleep is None
@@ -1687,6 +1687,9 @@ export interface SocialProofStats {
   pacePercentile?: PercentileRanking | null;
   streakPercentile?: PercentileRanking | null;
   levelPercentile?: PercentileRanking | null;
+  ctlPercentile?: PercentileRanking | null;
+  volumePercentile?: PercentileRanking | null;
+  vdotPercentile?: PercentileRanking | null;
   recentActivity: CommunityActivity[];
   generatedAt: string;
   cacheTtlSeconds: number;
@@ -1705,6 +1708,9 @@ export async function getSocialProofStats(): Promise<SocialProofStats> {
       pacePercentile: null,
       streakPercentile: null,
       levelPercentile: null,
+      ctlPercentile: null,
+      volumePercentile: null,
+      vdotPercentile: null,
       recentActivity: [],
       generatedAt: new Date().toISOString(),
       cacheTtlSeconds: 60,
@@ -19,6 +19,12 @@ Usage:
     # Set batch size for large tables
     python scripts/migrate_to_supabase.py --batch-size 500
 
+    # Resume an interrupted migration (progress is kept in the checkpoint file)
+    python scripts/migrate_to_supabase.py --checkpoint-file migration_checkpoint.json
+
+    # Start over, ignoring saved progress
+    python scripts/migrate_to_supabase.py --restart
+
 Environment Variables Required:
     SUPABASE_URL          - Your Supabase project URL
     SUPABASE_SERVICE_KEY  - Service role key (bypasses RLS)
@@ -32,6 +38,7 @@ import json
 import os
 import sqlite3
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -101,6 +108,15 @@ SKIP_COLUMNS = {
 # Default user ID for migrating single-user data to multi-user schema
 DEFAULT_USER_ID = "default"
 
+# Concurrent upload workers per table
+DEFAULT_UPLOAD_WORKERS = 4
+
+# Per-table progress, used to resume an interrupted migration
+DEFAULT_CHECKPOINT_PATH = "migration_checkpoint.json"
+
+# Keyset column for tables without a primary key
+ROWID_COLUMN = "_rowid_"
+
 
 # =============================================================================
 # Data Transformation Functions
@@ -227,18 +243,135 @@ def get_row_count(conn: sqlite3.Connection, table_name: str) -> int:
     return cursor.fetchone()[0]
 
 
-def fetch_all_rows(
+def get_keyset_columns(conn: sqlite3.Connection, table_name: str) -> List[str]:
+    """Get the columns to paginate a table on.
+
+    Uses the primary key (in key order) so each page is an index range
+    scan. Tables without a primary key fall back to SQLite's rowid.
+    """
+    pk_columns = sorted(
+        (col for col in get_table_info(conn, table_name) if col["pk"]),
+        key=lambda col: col["pk"],
+    )
+    if pk_columns:
+        return [col["name"] for col in pk_columns]
+    return [ROWID_COLUMN]
+
+
+def fetch_rows_after(
     conn: sqlite3.Connection,
     table_name: str,
+    key_columns: List[str],
+    after_key: Optional[List[Any]] = None,
     batch_size: int = 1000,
-    offset: int = 0
 ) -> List[Dict]:
-    """Fetch rows from SQLite table with pagination."""
+    """Fetch the next page of rows using keyset pagination.
+
+    Unlike LIMIT/OFFSET, each page seeks straight to the last key seen, so
+    reading a table stays linear in its size.
+
+    Args:
+        conn: SQLite connection
+        table_name: Table to read
+        key_columns: Columns from get_keyset_columns()
+        after_key: Key values of the last row of the previous page
+        batch_size: Maximum rows to return
+
+    Returns:
+        Rows as dictionaries, ordered by key
+    """
+    key_list = ", ".join(key_columns)
+    select = f"SELECT {ROWID_COLUMN} AS {ROWID_COLUMN}, *" if key_columns == [ROWID_COLUMN] else "SELECT *"
+    params: List[Any] = []
+    where = ""
+    if after_key is not None:
+        placeholders = ", ".join("?" for _ in key_columns)
+        where = f"WHERE ({key_list}) > ({placeholders})"
+        params.extend(after_key)
+
     cursor = conn.execute(
-        f"SELECT * FROM {table_name} LIMIT {batch_size} OFFSET {offset}"
+        f"{select} FROM {table_name} {where} ORDER BY {key_list} LIMIT ?",
+        (*params, batch_size),
     )
-    rows = cursor.fetchall()
-    return [dict(row) for row in rows]
+    return [dict(row) for row in cursor.fetchall()]
+
+
+def fetch_rows_by_keys(
+    conn: sqlite3.Connection,
+    table_name: str,
+    key_columns: List[str],
+    keys: List[List[Any]],
+) -> List[Dict]:
+    """Fetch the rows with the given keyset values (missing keys are skipped)."""
+    key_list = ", ".join(key_columns)
+    select = f"SELECT {ROWID_COLUMN} AS {ROWID_COLUMN}, *" if key_columns == [ROWID_COLUMN] else "SELECT *"
+    placeholders = ", ".join("?" for _ in key_columns)
+    rows = []
+    for key in keys:
+        cursor = conn.execute(
+            f"{select} FROM {table_name} WHERE ({key_list}) = ({placeholders})",
+            key,
+        )
+        rows.extend(dict(row) for row in cursor.fetchall())
+    return rows
+
+
+def row_key(row: Dict[str, Any], key_columns: List[str]) -> List[Any]:
+    """Get the keyset values of a row."""
+    return [row[column] for column in key_columns]
+
+
+# =============================================================================
+# Checkpoints
+# =============================================================================
+
+def load_checkpoint(path: Optional[str]) -> Dict[str, Any]:
+    """Load migration progress saved by a previous run."""
+    if not path or not Path(path).exists():
+        return {"tables": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: Optional[str], checkpoint: Dict[str, Any]) -> None:
+    """Atomically save migration progress."""
+    if not path:
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+
+# =============================================================================
+# Uploading
+# =============================================================================
+
+def upsert_with_bisect(
+    supabase_client,
+    table_name: str,
+    rows: List[Dict[str, Any]],
+) -> Tuple[int, List[Tuple[Dict[str, Any], str]]]:
+    """Upsert a batch, splitting it in halves when it fails.
+
+    A single bad row costs about log2(batch) extra requests to isolate,
+    instead of re-sending the whole batch one row at a time.
+
+    Returns:
+        Tuple of (upserted_count, [(failed_row, error_message), ...])
+    """
+    try:
+        # Note: upsert handles conflicts based on primary key
+        supabase_client.table(table_name).upsert(rows).execute()
+        return len(rows), []
+    except Exception as e:
+        if len(rows) == 1:
+            return 0, [(rows[0], str(e))]
+
+    middle = len(rows) // 2
+    left_ok, left_failed = upsert_with_bisect(supabase_client, table_name, rows[:middle])
+    right_ok, right_failed = upsert_with_bisect(supabase_client, table_name, rows[middle:])
+    return left_ok + right_ok, left_failed + right_failed
 
 
 def migrate_table(
@@ -247,10 +380,21 @@ def migrate_table(
     table_name: str,
     batch_size: int = 100,
     dry_run: bool = False,
-    default_user_id: str = DEFAULT_USER_ID
+    default_user_id: str = DEFAULT_USER_ID,
+    workers: int = DEFAULT_UPLOAD_WORKERS,
+    checkpoint: Optional[Dict[str, Any]] = None,
+    checkpoint_path: Optional[str] = None,
 ) -> Tuple[int, int]:
     """Migrate a single table from SQLite to Supabase.
 
+    Reading and transforming happen on the calling thread while batches are
+    uploaded by a pool of workers. Progress is checkpointed after every
+    batch as the key of the last row below which all batches have finished,
+    so an interrupted run resumes without re-reading completed rows.
+
+    Keys of rows that fail to upload are kept in the checkpoint and retried
+    on the next run; a table is only marked done once none are left.
+
     Args:
         sqlite_conn: SQLite connection
         supabase_client: Supabase client
@@ -258,9 +402,13 @@ def migrate_table(
         batch_size: Number of rows per insert batch
         dry_run: If True, don't actually insert data
         default_user_id: User ID for single-user data
+        workers: Number of concurrent upload workers
+        checkpoint: Progress loaded by load_checkpoint() (updated in place)
+        checkpoint_path: Where to save progress (None disables saving)
 
     Returns:
-        Tuple of (migrated_count, error_count)
+        Tuple of (migrated_count, error_count), where error_count is the
+        number of rows still failing
     """
     # Check if table exists in SQLite
     cursor = sqlite_conn.execute(
@@ -271,59 +419,125 @@ def migrate_table(
         print(f"  Table '{table_name}' does not exist in SQLite, skipping.")
         return 0, 0
 
+    checkpoint = checkpoint if checkpoint is not None else {"tables": {}}
+    progress = checkpoint["tables"].setdefault(table_name, {
+        "last_key": None,
+        "migrated": 0,
+        "errors": 0,
+        "failed_keys": [],
+        "done": False,
+    })
+    if progress["done"]:
+        print(f"  Table '{table_name}' already migrated (checkpoint), skipping.")
+        return progress["migrated"], progress["errors"]
+
     total_rows = get_row_count(sqlite_conn, table_name)
     if total_rows == 0:
         print(f"  Table '{table_name}' is empty, skipping.")
         return 0, 0
 
-    print(f"  Migrating {total_rows} rows from '{table_name}'...")
-
-    migrated = 0
-    errors = 0
-    offset = 0
-
-    while offset < total_rows:
-        # Fetch batch
-        rows = fetch_all_rows(sqlite_conn, table_name, batch_size, offset)
-        if not rows:
-            break
-
-        # Transform rows
-        transformed_rows = [
-            transform_row(table_name, row, default_user_id)
-            for row in rows
-        ]
-
+    key_columns = get_keyset_columns(sqlite_conn, table_name)
+
+    def prepare(rows: List[Dict]) -> Tuple[List[Dict[str, Any]], Dict[int, List[Any]]]:
+        """Transform rows, keeping each transformed row's key by identity."""
+        transformed_rows = []
+        keys: Dict[int, List[Any]] = {}
+        for row in rows:
+            key = row_key(row, key_columns)
+            row.pop(ROWID_COLUMN, None)
+            transformed = transform_row(table_name, row, default_user_id)
+            transformed_rows.append(transformed)
+            keys[id(transformed)] = key
+        return transformed_rows, keys
+
+    def upload(rows: List[Dict[str, Any]]) -> Tuple[int, List[Tuple[Dict[str, Any], str]]]:
         if dry_run:
-            print(f"    [DRY RUN] Would insert {len(transformed_rows)} rows")
-            migrated += len(transformed_rows)
-        else:
-            try:
-                # Insert into Supabase
-                # Note: upsert handles conflicts based on primary key
-                result = supabase_client.table(table_name).upsert(
-                    transformed_rows
-                ).execute()
-
-                migrated += len(transformed_rows)
-                print(f"    Inserted batch: {offset + 1}-{offset + len(rows)}")
-
-            except Exception as e:
-                errors += len(transformed_rows)
-                print(f"    ERROR inserting batch: {e}")
-
-                # Try inserting one by one to identify problematic rows
-                for i, row in enumerate(transformed_rows):
-                    try:
-                        supabase_client.table(table_name).upsert([row]).execute()
-                        migrated += 1
-                        errors -= 1
-                    except Exception as row_error:
-                        print(f"      Row {offset + i} failed: {row_error}")
-
-        offset += batch_size
+            return len(rows), []
+        return upsert_with_bisect(supabase_client, table_name, rows)
+
+    def record_failures(
+        failed: List[Tuple[Dict[str, Any], str]],
+        keys: Dict[int, List[Any]],
+    ) -> None:
+        progress["errors"] += len(failed)
+        for row, error in failed:
+            key = keys[id(row)]
+            progress["failed_keys"].append(key)
+            print(f"      Row {key} failed: {error}")
+
+    if progress["failed_keys"]:
+        retry_keys = progress["failed_keys"]
+        print(f"  Retrying {len(retry_keys)} failed rows from '{table_name}'...")
+        # Rows deleted from SQLite since the last run are simply dropped
+        transformed_rows, keys = prepare(
+            fetch_rows_by_keys(sqlite_conn, table_name, key_columns, retry_keys)
+        )
+        progress["failed_keys"] = []
+        progress["errors"] = 0
+        migrated, failed = upload(transformed_rows) if transformed_rows else (0, [])
+        progress["migrated"] += migrated
+        record_failures(failed, keys)
+        if not dry_run:
+            save_checkpoint(checkpoint_path, checkpoint)
+
+    if progress["last_key"] is not None:
+        print(f"  Resuming '{table_name}' after key {progress['last_key']}...")
+    else:
+        print(f"  Migrating {total_rows} rows from '{table_name}'...")
+
+    # Batches finish out of order; only advance the checkpoint over a
+    # contiguous run of finished batches
+    pending: Dict[int, Future] = {}
+    batch_keys: Dict[int, List[Any]] = {}
+    batch_row_keys: Dict[int, Dict[int, List[Any]]] = {}
+    next_to_commit = 0
+
+    def commit_finished(block: bool) -> None:
+        nonlocal next_to_commit
+        while next_to_commit in pending:
+            future = pending[next_to_commit]
+            if not block and not future.done():
+                return
+            migrated, failed = future.result()
+            progress["migrated"] += migrated
+            record_failures(failed, batch_row_keys.pop(next_to_commit))
+            progress["last_key"] = batch_keys.pop(next_to_commit)
+            del pending[next_to_commit]
+            next_to_commit += 1
+            if not dry_run:
+                save_checkpoint(checkpoint_path, checkpoint)
+
+    after_key = progress["last_key"]
+    batch_number = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while True:
+            rows = fetch_rows_after(sqlite_conn, table_name, key_columns, after_key, batch_size)
+            if not rows:
+                break
+            after_key = row_key(rows[-1], key_columns)
+            transformed_rows, keys = prepare(rows)
+
+            pending[batch_number] = executor.submit(upload, transformed_rows)
+            batch_keys[batch_number] = after_key
+            batch_row_keys[batch_number] = keys
+            batch_number += 1
+
+            # Bound the number of batches held in memory
+            commit_finished(block=len(pending) >= workers * 2)
+            if dry_run:
+                print(f"    [DRY RUN] Would insert {len(transformed_rows)} rows")
+
+        commit_finished(block=True)
+
+    # Failed rows keep the table open so the next run retries them
+    progress["done"] = not progress["failed_keys"]
+    if not dry_run:
+        save_checkpoint(checkpoint_path, checkpoint)
+    print(f"    Migrated {progress['migrated']} rows, {progress['errors']} errors")
+    if progress["failed_keys"]:
+        print(f"    {len(progress['failed_keys'])} failed rows will be retried on the next run")
 
-    return migrated, errors
+    return progress["migrated"], progress["errors"]
 
 
 def run_migration(
@@ -331,7 +545,10 @@ def run_migration(
     batch_size: int = 100,
     dry_run: bool = False,
     sqlite_path: Optional[str] = None,
-    default_user_id: str = DEFAULT_USER_ID
+    default_user_id: str = DEFAULT_USER_ID,
+    workers: int = DEFAULT_UPLOAD_WORKERS,
+    checkpoint_path: Optional[str] = DEFAULT_CHECKPOINT_PATH,
+    restart: bool = False,
 ) -> Dict[str, Any]:
     """Run the full migration.
 
@@ -341,6 +558,9 @@ def run_migration(
         dry_run: If True, don't actually insert data
         sqlite_path: Path to SQLite database
         default_user_id: User ID for single-user data
+        workers: Number of concurrent upload workers per table
+        checkpoint_path: File recording per-table progress for resuming
+        restart: If True, ignore any existing checkpoint
 
     Returns:
         Migration results summary
@@ -365,6 +585,13 @@ def run_migration(
     # Determine tables to migrate
     migration_tables = tables if tables else MIGRATION_TABLES
 
+    # Dry runs neither read nor write checkpoints
+    if dry_run:
+        checkpoint_path = None
+    checkpoint = {"tables": {}} if restart else load_checkpoint(checkpoint_path)
+    if checkpoint["tables"]:
+        print(f"Resuming from checkpoint {checkpoint_path}")
+
     print(f"\nTables to migrate: {len(migration_tables)}")
     print("-" * 40)
 
@@ -386,6 +613,9 @@ def run_migration(
             batch_size=batch_size,
             dry_run=dry_run,
             default_user_id=default_user_id,
+            workers=workers,
+            checkpoint=checkpoint,
+            checkpoint_path=checkpoint_path,
         )
 
         results["tables"][table_name] = {
@@ -648,6 +878,26 @@ Environment Variables:
         help="Number of rows per insert batch (default: 100)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_UPLOAD_WORKERS,
+        help=f"Concurrent upload workers (default: {DEFAULT_UPLOAD_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--checkpoint-file",
+        type=str,
+        default=DEFAULT_CHECKPOINT_PATH,
+        help=f"Progress file for resuming (default: {DEFAULT_CHECKPOINT_PATH})"
+    )
+
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the checkpoint file and migrate all tables from the start"
+    )
+
     parser.add_argument(
         "--sqlite-path",
         type=str,
@@ -698,6 +948,9 @@ Environment Variables:
         dry_run=args.dry_run,
         sqlite_path=args.sqlite_path,
         default_user_id=args.user_id,
+        workers=args.workers,
+        checkpoint_path=args.checkpoint_file,
+        restart=args.restart,
     )
 
     # Output results
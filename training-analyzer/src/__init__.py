@@ -10,7 +10,7 @@ from .metrics import (
     calculate_hr_zones_karvonen,
     calculate_hr_zones_lthr,
 )
-from .services.enrichment import EnrichmentService
+from .utils.lazy_import import lazy_exports
 
 __version__ = "0.1.0"
 
@@ -35,3 +35,6 @@ __all__ = [
     # Services
     "EnrichmentService",
 ]
+
+# Services load the LLM stack; import them on first use
+__getattr__ = lazy_exports(__name__, {"EnrichmentService": ".services.enrichment"})
@@ -1,76 +1,56 @@
-"""LangGraph agents for the trAIner App."""
+"""LangGraph agents for the trAIner App.
 
-from .base import (
-    BaseAgent,
-    AgentMetrics,
-)
+Agents are imported on first use of an exported name, so importing one
+agent does not load LangChain, LangGraph and every provider SDK.
+"""
 
-from .analysis_agent import (
-    AnalysisAgent,
-    AnalysisState,
-    build_athlete_context_from_briefing,
-    get_similar_workouts,
-)
+from ..utils.lazy_import import lazy_exports
 
-from .plan_agent import (
-    PlanAgent,
-    PlanState,
-    PlanGenerationError,
-    generate_plan_sync,
-)
-
-from .workout_agent import (
-    WorkoutDesignAgent,
-    get_workout_agent,
-)
-
-from .cycling_agent import (
-    CyclingWorkoutAgent,
-    CyclingAthleteContext,
-    CyclingWorkoutInterval,
-    get_cycling_agent,
-)
-
-from .swim_agent import (
-    SwimWorkoutAgent,
-    get_swim_agent,
-)
-
-from .triathlon_agent import (
-    TriathlonAgent,
-    TriathlonAthleteContext,
-    BrickWorkout,
-    MultiSportDay,
-    RaceDistance,
-    FatigueCarryoverModel,
-    get_triathlon_agent,
-)
-
-from .coach_agent import (
-    ConversationalCoach,
-    CoachingContext,
-    CoachingResponse,
-    CoachingIntent,
-    get_conversational_coach,
-)
-
-from .orchestrator import (
-    AgentOrchestrator,
-    OrchestratorRequest,
-    OrchestratorResponse,
-    TaskType,
-    get_orchestrator,
-)
-
-from .langchain_agent import (
-    LangChainCoachAgent,
-    get_langchain_agent,
-    reset_langchain_agent,
-    SYSTEM_PROMPT as LANGCHAIN_SYSTEM_PROMPT,
-    StreamEvent,
-    StreamEventType,
-    TOOL_MESSAGES,
-)
+# Exported name -> submodule (".module" or ".module:attr")
+_EXPORTS = {
+    "BaseAgent": ".base",
+    "AgentMetrics": ".base",
+    "AnalysisAgent": ".analysis_agent",
+    "AnalysisState": ".analysis_agent",
+    "build_athlete_context_from_briefing": ".analysis_agent",
+    "get_similar_workouts": ".analysis_agent",
+    "PlanAgent": ".plan_agent",
+    "PlanState": ".plan_agent",
+    "PlanGenerationError": ".errors",
+    "generate_plan_sync": ".plan_agent",
+    "WorkoutDesignAgent": ".workout_agent",
+    "get_workout_agent": ".workout_agent",
+    "CyclingWorkoutAgent": ".cycling_agent",
+    "CyclingAthleteContext": ".cycling_agent",
+    "CyclingWorkoutInterval": ".cycling_agent",
+    "get_cycling_agent": ".cycling_agent",
+    "SwimWorkoutAgent": ".swim_agent",
+    "get_swim_agent": ".swim_agent",
+    "TriathlonAgent": ".triathlon_agent",
+    "TriathlonAthleteContext": ".triathlon_agent",
+    "BrickWorkout": ".triathlon_agent",
+    "MultiSportDay": ".triathlon_agent",
+    "RaceDistance": ".triathlon_agent",
+    "FatigueCarryoverModel": ".triathlon_agent",
+    "get_triathlon_agent": ".triathlon_agent",
+    "ConversationalCoach": ".coach_agent",
+    "CoachingContext": ".coach_agent",
+    "CoachingResponse": ".coach_agent",
+    "CoachingIntent": ".coach_agent",
+    "get_conversational_coach": ".coach_agent",
+    "AgentOrchestrator": ".orchestrator",
+    "OrchestratorRequest": ".orchestrator",
+    "OrchestratorResponse": ".orchestrator",
+    "TaskType": ".orchestrator",
+    "get_orchestrator": ".orchestrator",
+    "LangChainCoachAgent": ".langchain_agent",
+    "get_langchain_agent": ".langchain_agent",
+    "reset_langchain_agent": ".langchain_agent",
+    "LANGCHAIN_SYSTEM_PROMPT": ".langchain_agent:SYSTEM_PROMPT",
+    "StreamEvent": ".langchain_agent",
+    "StreamEventType": ".langchain_agent",
+    "TOOL_MESSAGES": ".langchain_agent",
+}
 
 __all__ = [
     # Base Agent
@@ -127,3 +107,5 @@ __all__ = [
     "StreamEventType",
     "TOOL_MESSAGES",
 ]
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
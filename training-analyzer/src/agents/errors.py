@@ -0,0 +1,10 @@
+"""Exceptions raised by the agents.
+
+Kept free of LangChain/LangGraph imports so API routes can catch them
+without loading the agents themselves.
+"""
+
+
+class PlanGenerationError(Exception):
+    """Exception raised when plan generation fails."""
+    pass
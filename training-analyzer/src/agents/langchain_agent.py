@@ -85,7 +85,11 @@ def get_available_llm(
     )
 
 from ..observability.langfuse_config import get_langfuse_callback, is_langfuse_enabled
-from ..utils.token_counter import count_tokens, count_message_tokens
+from ..utils.token_counter import (
+    count_tokens,
+    count_message_tokens,
+    count_single_message_tokens,
+)
 
 # Try to import external tools (may not exist yet)
 try:
@@ -814,8 +818,14 @@ class LangChainCoachAgent:
                 messages.append(HumanMessage(content=content))
             elif role == "assistant":
                 messages.append(AIMessage(content=content))
+            elif role == "system":
+                messages.append(SystemMessage(content=content))
         return messages
 
+    def _count_history_tokens(self, history: List[Dict[str, Any]]) -> int:
+        """Sum history tokens, reusing counts stored on each message."""
+        return sum(count_single_message_tokens(msg) for msg in history)
+
     async def chat(
         self,
         message: str,
@@ -862,6 +872,7 @@ class LangChainCoachAgent:
 
         # Convert chat history
         history_messages = self._convert_chat_history(chat_history or [])
+        history_tokens = self._count_history_tokens(chat_history or [])
 
         # Language name for prompt - extended language support
         language_names = {
@@ -938,10 +949,8 @@ class LangChainCoachAgent:
                 except Exception as e:
                     logger.warning(f"Failed to record Langfuse generation: {e}")
 
-            # Estimate token usage using tiktoken for accuracy
-            input_tokens = count_tokens(message) + sum(
-                count_tokens(str(h)) for h in history_messages
-            )
+            # Estimate token usage; history counts are precomputed per message
+            input_tokens = count_tokens(message) + history_tokens
             output_tokens = count_tokens(response_text)
 
             return {
@@ -1019,6 +1028,7 @@ class LangChainCoachAgent:
 
         # Convert chat history
         history_messages = self._convert_chat_history(chat_history or [])
+        history_tokens = self._count_history_tokens(chat_history or [])
 
         # Language name for prompt
         language_names = {
@@ -1115,9 +1125,7 @@ class LangChainCoachAgent:
 
             # Estimate token usage if not captured (using tiktoken for accuracy)
             if input_tokens == 0:
-                input_tokens = count_tokens(message) + sum(
-                    count_tokens(str(h)) for h in history_messages
-                )
+                input_tokens = count_tokens(message) + history_tokens
             if output_tokens == 0:
                 output_tokens = count_tokens(response_text)
 
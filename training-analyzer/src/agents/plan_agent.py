@@ -7,11 +7,20 @@ This agent generates periodized training plans using a multi-step approach:
 3. Generate week-by-week plan
 4. Optimize session distribution
 5. Validate and refine
+
+Weeks are generated in blocks of consecutive weeks within one phase. The
+week targets are planned first in one cheap sequential pass, so blocks are
+independent and run concurrently in worker threads (bounded by
+MAX_CONCURRENT_BLOCKS), each with its own timeout and retries. A long plan
+takes about as long as its slowest block, and stream_plan hands out weeks
+as their block completes.
 """
 
+import asyncio
 import json
+import logging
 from datetime import date, datetime, timedelta
-from typing import Dict, Any, List, Optional, TypedDict, Annotated
+from typing import AsyncIterator, Dict, Any, List, Optional, Sequence, Tuple, TypedDict, Annotated
 from dataclasses import dataclass
 from enum import Enum
 
@@ -30,6 +39,7 @@ from ..models.plans import (
     WorkoutType,
 )
 from ..llm.providers import LLMClient, ModelType, get_llm_client
+from .errors import PlanGenerationError
 from ..llm.prompts import (
     PLAN_STRUCTURE_SYSTEM,
     PLAN_STRUCTURE_USER,
@@ -40,6 +50,39 @@ from ..llm.prompts import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Weeks per generation block; blocks never span two phases
+MAX_BLOCK_WEEKS = 4
+
+# Blocks generated at the same time
+MAX_CONCURRENT_BLOCKS = 4
+
+# Time budget for one attempt at a block, and attempts before giving up
+BLOCK_TIMEOUT_SECONDS = 60
+BLOCK_ATTEMPTS = 3
+
+
+@dataclass
+class WeekBlock:
+    """
+    Consecutive weeks of one phase, generated as one task.
+
+    Attributes:
+        index: Position of the block in the plan
+        phase: Training phase of every week in the block
+        weeks: Week targets (week_number, week_in_phase, phase_weeks,
+            target_load, is_cutback), planned before generation
+    """
+    index: int
+    phase: TrainingPhase
+    weeks: List[Dict[str, Any]]
+
+    @property
+    def week_numbers(self) -> List[int]:
+        return [w["week_number"] for w in self.weeks]
+
+
 class PlanState(TypedDict):
     """State for the plan generation agent."""
     # Input
@@ -129,21 +172,10 @@ class PlanAgent:
         if constraints is None:
             constraints = PlanConstraints()
 
-        initial_state: PlanState = {
-            "goal": goal.to_dict(),
-            "constraints": constraints.to_dict(),
-            "athlete_context": athlete_context.to_dict(),
-            "periodization_type": "",
-            "phase_distribution": [],
-            "weeks": [],
-            "current_week_index": 0,
-            "plan": None,
-            "errors": [],
-            "status": "initialized",
-        }
-
         # Run the graph
-        final_state = await self._graph.ainvoke(initial_state)
+        final_state = await self._graph.ainvoke(
+            self._initial_state(goal, athlete_context, constraints)
+        )
 
         if final_state["errors"]:
             raise PlanGenerationError(
@@ -155,6 +187,83 @@ class PlanAgent:
 
         return self._state_to_plan(final_state, goal, athlete_context, constraints)
 
+    async def stream_plan(
+        self,
+        goal: RaceGoal,
+        athlete_context: AthleteContext,
+        constraints: Optional[PlanConstraints] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a plan, yielding it as each block of weeks completes.
+
+        Runs the same steps as the graph, with week blocks generated
+        concurrently. Every event carries the plan so far under one plan ID,
+        so callers can persist finished weeks as they arrive.
+
+        Yields:
+            {"type": "weeks", "week_numbers": [...], "completed_weeks": n,
+             "total_weeks": n, "plan": TrainingPlan} per completed block,
+            then {"type": "done", "plan": TrainingPlan}
+
+        Raises:
+            PlanGenerationError: If the goal is infeasible, or a block failed
+                every attempt (after the other blocks were yielded)
+        """
+        if constraints is None:
+            constraints = PlanConstraints()
+
+        state = self._initial_state(goal, athlete_context, constraints)
+        state = await self._analyze_goal(state)
+        if state["errors"]:
+            raise PlanGenerationError(
+                f"Plan generation failed: {'; '.join(state['errors'])}"
+            )
+        state = await self._determine_structure(state)
+
+        blocks = self._plan_blocks(state)
+        total_weeks = sum(len(block.weeks) for block in blocks)
+        plan_id = TrainingPlan.generate_id()
+        weeks: List[Dict[str, Any]] = []
+
+        async for block, block_weeks in self.generate_blocks(blocks, state["constraints"]):
+            self._validate_weeks(block_weeks, state["constraints"])
+            weeks = sorted(weeks + block_weeks, key=lambda w: w["week_number"])
+            state["weeks"] = weeks
+            await self._finalize(state)
+            yield {
+                "type": "weeks",
+                "week_numbers": block.week_numbers,
+                "completed_weeks": len(weeks),
+                "total_weeks": total_weeks,
+                "plan": self._state_to_plan(
+                    state, goal, athlete_context, constraints, plan_id=plan_id
+                ),
+            }
+
+        yield {
+            "type": "done",
+            "plan": self._state_to_plan(state, goal, athlete_context, constraints, plan_id=plan_id),
+        }
+
+    def _initial_state(
+        self,
+        goal: RaceGoal,
+        athlete_context: AthleteContext,
+        constraints: PlanConstraints,
+    ) -> PlanState:
+        return {
+            "goal": goal.to_dict(),
+            "constraints": constraints.to_dict(),
+            "athlete_context": athlete_context.to_dict(),
+            "periodization_type": "",
+            "phase_distribution": [],
+            "weeks": [],
+            "current_week_index": 0,
+            "plan": None,
+            "errors": [],
+            "status": "initialized",
+        }
+
     async def adapt_plan(
         self,
         plan: TrainingPlan,
@@ -300,20 +409,36 @@ class PlanAgent:
         return state
 
     async def _generate_weeks(self, state: PlanState) -> PlanState:
-        """Generate detailed sessions for each week."""
-        goal = state["goal"]
-        athlete = state["athlete_context"]
-        constraints = state["constraints"]
-        phases = state["phase_distribution"]
-
+        """Generate detailed sessions for each week, block by block."""
         weeks = []
+        try:
+            async for _block, block_weeks in self.generate_blocks(
+                self._plan_blocks(state), state["constraints"]
+            ):
+                weeks.extend(block_weeks)
+        except PlanGenerationError as e:
+            state["errors"].append(str(e))
+
+        weeks.sort(key=lambda w: w["week_number"])
+        state["weeks"] = weeks
+        state["status"] = "generated"
+        return state
+
+    def _plan_blocks(self, state: PlanState) -> List[WeekBlock]:
+        """
+        Plan every week's target load and split the weeks into blocks.
+
+        The simulated CTL progression is the only dependency between
+        weeks, so it is run here and block generation needs nothing else.
+        """
+        current_ctl = state["athlete_context"].get("current_ctl", 30)
+        blocks: List[WeekBlock] = []
         week_number = 1
-        current_ctl = athlete.get("current_ctl", 30)
 
-        for phase_info in phases:
-            phase_name = phase_info["phase"]
+        for phase_info in state["phase_distribution"]:
             phase_weeks = phase_info["weeks"]
-            phase = TrainingPhase(phase_name)
+            phase = TrainingPhase(phase_info["phase"])
+            targets = []
 
             for week_in_phase in range(phase_weeks):
                 is_cutback = self._is_cutback_week(
@@ -329,22 +454,11 @@ class PlanAgent:
                     is_cutback=is_cutback,
                 )
 
-                # Generate sessions
-                sessions = self._generate_week_sessions(
-                    phase=phase,
-                    week_in_phase=week_in_phase + 1,
-                    target_load=target_load,
-                    constraints=constraints,
-                    is_cutback=is_cutback,
-                )
-
-                weeks.append({
+                targets.append({
                     "week_number": week_number,
-                    "phase": phase_name,
+                    "week_in_phase": week_in_phase + 1,
+                    "phase_weeks": phase_weeks,
                     "target_load": target_load,
-                    "sessions": sessions,
-                    "focus": self._get_phase_focus(phase, week_in_phase + 1, phase_weeks),
-                    "notes": self._get_week_notes(phase, week_in_phase + 1, phase_weeks),
                     "is_cutback": is_cutback,
                 })
 
@@ -352,16 +466,131 @@ class PlanAgent:
                 # Simulate CTL progression
                 current_ctl += target_load / 7 * 0.1
 
-        state["weeks"] = weeks
-        state["status"] = "generated"
-        return state
+            for start in range(0, len(targets), MAX_BLOCK_WEEKS):
+                blocks.append(WeekBlock(
+                    index=len(blocks),
+                    phase=phase,
+                    weeks=targets[start:start + MAX_BLOCK_WEEKS],
+                ))
+
+        return blocks
+
+    async def _generate_block(
+        self,
+        block: WeekBlock,
+        constraints: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate the sessions, focus and notes for the weeks of one block.
+
+        The work is synchronous, so it runs in a worker thread; that keeps
+        the event loop free and lets generate_blocks time out and retry a
+        block that hangs.
+        """
+        return await asyncio.to_thread(self._build_block_weeks, block, constraints)
+
+    def _build_block_weeks(
+        self,
+        block: WeekBlock,
+        constraints: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Build the week dictionaries of one block."""
+        weeks = []
+        for target in block.weeks:
+            week_in_phase = target["week_in_phase"]
+            phase_weeks = target["phase_weeks"]
+
+            sessions = self._generate_week_sessions(
+                phase=block.phase,
+                week_in_phase=week_in_phase,
+                target_load=target["target_load"],
+                constraints=constraints,
+                is_cutback=target["is_cutback"],
+            )
+
+            weeks.append({
+                "week_number": target["week_number"],
+                "phase": block.phase.value,
+                "target_load": target["target_load"],
+                "sessions": sessions,
+                "focus": self._get_phase_focus(block.phase, week_in_phase, phase_weeks),
+                "notes": self._get_week_notes(block.phase, week_in_phase, phase_weeks),
+                "is_cutback": target["is_cutback"],
+            })
+
+        return weeks
+
+    async def generate_blocks(
+        self,
+        blocks: Sequence[WeekBlock],
+        constraints: Dict[str, Any],
+        max_concurrency: int = MAX_CONCURRENT_BLOCKS,
+    ) -> AsyncIterator[Tuple[WeekBlock, List[Dict[str, Any]]]]:
+        """
+        Generate blocks concurrently, yielding each as it completes.
+
+        A block attempt that fails or exceeds BLOCK_TIMEOUT_SECONDS is
+        retried on its own; other blocks are unaffected.
+
+        Args:
+            blocks: Blocks from _plan_blocks
+            constraints: Plan constraints (dict form)
+            max_concurrency: Blocks generated at the same time
+
+        Yields:
+            (block, week dictionaries) in completion order
+
+        Raises:
+            PlanGenerationError: After all other blocks finished, if any
+                block failed every attempt
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(block: WeekBlock) -> Tuple[WeekBlock, List[Dict[str, Any]]]:
+            async with semaphore:
+                last_error: Optional[BaseException] = None
+                for attempt in range(1, BLOCK_ATTEMPTS + 1):
+                    try:
+                        async with asyncio.timeout(BLOCK_TIMEOUT_SECONDS):
+                            return block, await self._generate_block(block, constraints)
+                    except Exception as e:
+                        last_error = e
+                        logger.warning(
+                            f"Weeks {block.week_numbers} failed "
+                            f"(attempt {attempt}/{BLOCK_ATTEMPTS}): {e!r}"
+                        )
+            raise PlanGenerationError(
+                f"Weeks {block.week_numbers[0]}-{block.week_numbers[-1]} failed "
+                f"after {BLOCK_ATTEMPTS} attempts: {last_error!r}"
+            )
+
+        tasks = [asyncio.create_task(run(block)) for block in blocks]
+        failures = []
+        try:
+            for completed in asyncio.as_completed(tasks):
+                try:
+                    yield await completed
+                except PlanGenerationError as e:
+                    failures.append(str(e))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if failures:
+            raise PlanGenerationError("; ".join(failures))
 
     async def _validate_plan(self, state: PlanState) -> PlanState:
         """Validate the plan against constraints and optimize if needed."""
-        weeks = state["weeks"]
-        constraints = state["constraints"]
-        errors = []
+        self._validate_weeks(state["weeks"], state["constraints"])
+        state["status"] = "validated"
+        return state
 
+    def _validate_weeks(
+        self,
+        weeks: List[Dict[str, Any]],
+        constraints: Dict[str, Any],
+    ) -> None:
+        """Scale week and session durations down to the constraints, in place."""
         max_weekly_hours = constraints.get("max_weekly_hours", 8.0)
         max_session_duration = constraints.get("max_session_duration_min", 150)
 
@@ -382,13 +611,12 @@ class PlanAgent:
                 if session["target_duration_min"] > max_session_duration:
                     session["target_duration_min"] = max_session_duration
 
-        state["weeks"] = weeks
-        state["status"] = "validated"
-        return state
-
     async def _finalize(self, state: PlanState) -> PlanState:
         """Create the final plan object."""
         weeks = state["weeks"]
+        if not weeks:
+            state["status"] = "error"
+            return state
 
         # Find peak week
         peak_week = max(weeks, key=lambda w: w["target_load"])["week_number"]
@@ -409,6 +637,7 @@ class PlanAgent:
         goal: RaceGoal,
         athlete_context: AthleteContext,
         constraints: PlanConstraints,
+        plan_id: Optional[str] = None,
     ) -> TrainingPlan:
         """Convert final state to a TrainingPlan object."""
         plan_data = state["plan"]
@@ -416,7 +645,7 @@ class PlanAgent:
         weeks = self._parse_weeks(plan_data["weeks"])
 
         return TrainingPlan(
-            id=TrainingPlan.generate_id(),
+            id=plan_id or TrainingPlan.generate_id(),
             goal=goal,
             weeks=weeks,
             periodization=PeriodizationType(plan_data["periodization"]),
@@ -810,11 +1039,6 @@ class PlanAgent:
         raise ValueError(f"Could not parse JSON from response: {response[:200]}...")
 
 
-class PlanGenerationError(Exception):
-    """Exception raised when plan generation fails."""
-    pass
-
-
 # Synchronous wrapper for non-async contexts
 def generate_plan_sync(
     goal: RaceGoal,
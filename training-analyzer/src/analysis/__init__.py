@@ -11,10 +11,16 @@ from .trends import (
     calculate_fitness_trend,
     calculate_pace_at_hr_trend,
     detect_overtraining_signals,
+    detect_overtraining_signals_batch,
+    overtraining_signals_from_frames,
+    build_fitness_frame,
+    build_wellness_frame,
 )
 from .weekly import (
     WeeklyAnalysis,
+    WeeklyRollup,
     analyze_week,
+    analyze_rollup,
     generate_weekly_insights,
 )
 from .goals import (
@@ -56,9 +62,15 @@ __all__ = [
     "calculate_fitness_trend",
     "calculate_pace_at_hr_trend",
     "detect_overtraining_signals",
+    "detect_overtraining_signals_batch",
+    "overtraining_signals_from_frames",
+    "build_fitness_frame",
+    "build_wellness_frame",
     # Weekly
     "WeeklyAnalysis",
+    "WeeklyRollup",
     "analyze_week",
+    "analyze_rollup",
     "generate_weekly_insights",
     # Goals
     "RaceDistance",
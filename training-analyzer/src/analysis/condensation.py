@@ -17,6 +17,8 @@ from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 import statistics
 
+from ..metrics.zone_binning import ZoneBoundaries, bin_zone_times, classify_zones
+
 
 class TrendDirection(str, Enum):
     """Pace or HR trend direction."""
@@ -432,24 +434,29 @@ def calculate_hr_summary(
                     summary.time_to_steady_sec = timestamps[i]
                 break
 
-    # Zone transitions (if zones provided)
+    # Zone transitions and time in zone (if zones provided)
     if hr_zones:
-        current_zone = None
-        transitions = 0
-        zone_times: Dict[int, int] = {z: 0 for z in hr_zones.keys()}
-
-        for hr in hrs:
-            for zone, (min_hr, max_hr) in hr_zones.items():
-                if min_hr <= hr <= max_hr:
-                    zone_times[zone] = zone_times.get(zone, 0) + 1
-                    if current_zone is not None and current_zone != zone:
-                        transitions += 1
-                    current_zone = zone
-                    break
-
-        summary.zone_transitions = transitions
-        if zone_times:
-            summary.dominant_zone = max(zone_times, key=zone_times.get)
+        zone_ids = sorted(hr_zones, key=lambda z: hr_zones[z][0])
+        boundaries = ZoneBoundaries(
+            uppers=tuple(hr_zones[z][1] for z in zone_ids[:-1]),
+            floor=hr_zones[zone_ids[0]][0],
+        )
+
+        # Samples outside every zone (above the top max, between zones or
+        # below zone 1) are skipped rather than binned
+        in_zone = [
+            hr if any(lo <= hr <= hi for lo, hi in hr_zones.values()) else None
+            for hr in hrs
+        ]
+        classified = [b for b in classify_zones(in_zone, boundaries) if b is not None]
+        summary.zone_transitions = sum(
+            1 for prev, cur in zip(classified, classified[1:]) if prev != cur
+        )
+
+        hr_timestamps = [p.get("timestamp", 0) for p in hr_points if p.get("hr", 0) > 0]
+        seconds = bin_zone_times(in_zone, boundaries, hr_timestamps).seconds
+        zone_times = {zone: seconds[i + 1] for i, zone in enumerate(zone_ids)}
+        summary.dominant_zone = max(zone_times, key=zone_times.get)
 
     # Detect if this is an interval workout
     summary.is_interval_workout = summary.cv > 12 and summary.zone_transitions > 6
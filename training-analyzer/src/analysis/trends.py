@@ -2,12 +2,18 @@
 Performance Trend Analysis
 
 Track how fitness metrics evolve over time and detect patterns.
+
+Fitness and wellness histories are materialized into dense daily frames
+(see metrics.daily_frame) so every windowed check is a constant-time
+lookup; detect_overtraining_signals_batch() evaluates many athletes at once.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Callable, List, Mapping, Optional, Tuple, Dict, Any
 from datetime import date, datetime, timedelta
 
+from ..metrics.daily_frame import ROWS, DailyFrame
+
 
 @dataclass
 class FitnessTrend:
@@ -71,6 +77,51 @@ def _parse_date(date_value: Any) -> Optional[date]:
     return None
 
 
+def _first_of(*keys: str) -> Callable[[Mapping[str, Any]], Any]:
+    """Extractor returning the first truthy numeric value among keys."""
+    def extract(record: Mapping[str, Any]) -> Any:
+        for key in keys:
+            value = record.get(key)
+            if value and isinstance(value, (int, float)):
+                return value
+        return None
+    return extract
+
+
+# Columns of the daily fitness frame
+FITNESS_FIELDS = {
+    "ctl": "ctl",
+    "atl": "atl",
+    "tsb": "tsb",
+    "acwr": "acwr",
+    "daily_load": "daily_load",
+}
+
+# Columns of the daily wellness frame, with the alternative keys providers use
+WELLNESS_FIELDS = {
+    "hrv": _first_of("hrv_last_night_avg", "hrv"),
+    "resting_hr": _first_of("resting_hr", "rest_hr"),
+    "body_battery": _first_of("body_battery_high", "body_battery_charged", "body_battery"),
+    "sleep_score": _first_of("sleep_score"),
+}
+
+
+def build_fitness_frame(
+    fitness_history: List[dict],
+    end: Optional[date] = None,
+) -> DailyFrame:
+    """Materialize fitness metrics ('date', 'ctl', 'atl', 'tsb', 'acwr', 'daily_load')."""
+    return DailyFrame.from_records(fitness_history, FITNESS_FIELDS, end=end)
+
+
+def build_wellness_frame(
+    wellness_history: List[dict],
+    end: Optional[date] = None,
+) -> DailyFrame:
+    """Materialize wellness data ('date', HRV, resting HR, Body Battery, sleep score)."""
+    return DailyFrame.from_records(wellness_history, WELLNESS_FIELDS, end=end)
+
+
 def _determine_trend_direction(change_pct: float) -> str:
     """Determine trend direction from percentage change."""
     if change_pct > 5.0:
@@ -97,34 +148,22 @@ def calculate_fitness_trend(
     """
     if not fitness_history or len(fitness_history) < 2:
         return None
-
-    # Sort by date
-    sorted_history = sorted(
-        fitness_history,
-        key=lambda x: _parse_date(x.get("date")) or date.min
-    )
-
-    # Filter to period
-    end_date = _parse_date(sorted_history[-1].get("date"))
-    if end_date is None:
+    if not any(_parse_date(h.get("date")) for h in fitness_history):
         return None
 
-    start_date = end_date - timedelta(days=period_days)
+    frame = build_fitness_frame(fitness_history)
 
-    period_data = [
-        h for h in sorted_history
-        if (_parse_date(h.get("date")) or date.min) >= start_date
-    ]
-
-    if len(period_data) < 2:
+    # Days from end - period_days through the latest entry
+    lo, hi = frame.window(period_days + 1)
+    if frame.count(ROWS, lo, hi) < 2:
         return None
 
     # Get start and end CTL
-    first_entry = period_data[0]
-    last_entry = period_data[-1]
+    first = frame.first_present(ROWS, lo, hi)
+    last = frame.last_present(ROWS, lo, hi)
 
-    ctl_start = first_entry.get("ctl", 0) or 0
-    ctl_end = last_entry.get("ctl", 0) or 0
+    ctl_start = frame.values("ctl", first, first + 1)[0] or 0
+    ctl_end = frame.values("ctl", last, last + 1)[0] or 0
 
     # Calculate change
     ctl_change = ctl_end - ctl_start
@@ -134,19 +173,16 @@ def calculate_fitness_trend(
         ctl_change_pct = 0.0 if ctl_end == 0 else 100.0
 
     # Calculate weekly load average
-    total_load = sum(h.get("daily_load", 0) or 0 for h in period_data)
+    total_load = frame.sum("daily_load", lo, hi)
     weeks = max(1, period_days / 7)
     weekly_load_avg = total_load / weeks
 
     # Determine trend direction
     trend_direction = _determine_trend_direction(ctl_change_pct)
 
-    actual_start = _parse_date(first_entry.get("date")) or start_date
-    actual_end = _parse_date(last_entry.get("date")) or end_date
-
     return FitnessTrend(
-        period_start=actual_start,
-        period_end=actual_end,
+        period_start=frame.day(first),
+        period_end=frame.day(last),
         ctl_start=ctl_start,
         ctl_end=ctl_end,
         ctl_change=ctl_change,
@@ -244,20 +280,68 @@ def detect_overtraining_signals(
         fitness_history: List of fitness metrics with 'date', 'ctl', 'atl', 'tsb', 'acwr'
         wellness_history: List of wellness data with 'date', 'hrv', 'resting_hr', etc.
 
+    Returns:
+        List of warning signals detected
+    """
+    return overtraining_signals_from_frames(
+        build_fitness_frame(fitness_history) if fitness_history else None,
+        build_wellness_frame(wellness_history) if wellness_history else None,
+    )
+
+
+def detect_overtraining_signals_batch(
+    histories: Mapping[str, Tuple[List[dict], List[dict]]],
+    as_of: Optional[date] = None,
+) -> Dict[str, List[str]]:
+    """
+    Detect overtraining signals for many athletes in one pass.
+
+    Args:
+        histories: Athlete ID -> (fitness_history, wellness_history)
+        as_of: Evaluate the windows ending on this day (default: each
+            athlete's latest data)
+
+    Returns:
+        Athlete ID -> warning signals, only for athletes with signals
+    """
+    results = {}
+    for athlete_id, (fitness_history, wellness_history) in histories.items():
+        signals = overtraining_signals_from_frames(
+            build_fitness_frame(fitness_history, end=as_of) if fitness_history else None,
+            build_wellness_frame(wellness_history, end=as_of) if wellness_history else None,
+        )
+        if signals:
+            results[athlete_id] = signals
+    return results
+
+
+def overtraining_signals_from_frames(
+    fitness: Optional[DailyFrame],
+    wellness: Optional[DailyFrame],
+    as_of: Optional[date] = None,
+) -> List[str]:
+    """
+    Evaluate the overtraining checks on materialized daily frames.
+
+    Each check looks at the last 7 days (14 for the CTL trend) ending on
+    as_of, or on the frame's last day.
+
+    Args:
+        fitness: Frame from build_fitness_frame()
+        wellness: Frame from build_wellness_frame()
+        as_of: Last day of the evaluated windows
+
     Returns:
         List of warning signals detected
     """
     signals = []
 
     # Check fitness history signals if available
-    if fitness_history:
-        recent_fitness = fitness_history[-7:] if len(fitness_history) >= 7 else fitness_history
+    if fitness is not None and fitness.length:
+        lo, hi = fitness.window(7, as_of)
 
         # Check for ACWR danger zone
-        high_acwr_days = sum(
-            1 for f in recent_fitness
-            if (f.get("acwr") or 0) > 1.3
-        )
+        high_acwr_days = fitness.count_where("acwr", ">", 1.3, lo, hi)
 
         if high_acwr_days >= 3:
             signals.append(
@@ -266,10 +350,7 @@ def detect_overtraining_signals(
             )
 
         # Check for prolonged negative TSB
-        negative_tsb_days = sum(
-            1 for f in recent_fitness
-            if (f.get("tsb") or 0) < -20
-        )
+        negative_tsb_days = fitness.count_where("tsb", "<", -20, lo, hi)
 
         if negative_tsb_days >= 5:
             signals.append(
@@ -278,33 +359,36 @@ def detect_overtraining_signals(
             )
 
         # Check CTL trend (is fitness declining despite training?)
-        if len(fitness_history) >= 14:
-            week1_ctl = sum(f.get("ctl", 0) or 0 for f in fitness_history[-14:-7]) / 7
-            week2_ctl = sum(f.get("ctl", 0) or 0 for f in fitness_history[-7:]) / 7
-            week1_load = sum(f.get("daily_load", 0) or 0 for f in fitness_history[-14:-7])
-            week2_load = sum(f.get("daily_load", 0) or 0 for f in fitness_history[-7:])
+        lo, hi = fitness.window(14, as_of)
+        if hi - lo >= 14:
+            mid = lo + 7
+            # CTL is a level, so average only the days that have one
+            week1_ctl = fitness.mean("ctl", lo, mid)
+            week2_ctl = fitness.mean("ctl", mid, hi)
+            week1_load = fitness.sum("daily_load", lo, mid)
+            week2_load = fitness.sum("daily_load", mid, hi)
 
             # If load is maintained or increased but CTL is declining
-            if week2_load >= week1_load * 0.9 and week2_ctl < week1_ctl - 2:
+            if (
+                week1_ctl is not None
+                and week2_ctl is not None
+                and week2_load >= week1_load * 0.9
+                and week2_ctl < week1_ctl - 2
+            ):
                 signals.append(
                     "Fitness (CTL) is declining despite maintained training load - "
                     "possible overreaching or inadequate recovery"
                 )
 
     # Check wellness data if available
-    if wellness_history:
-        recent_wellness = wellness_history[-7:] if len(wellness_history) >= 7 else wellness_history
+    if wellness is not None and wellness.length:
+        lo, hi = wellness.window(7, as_of)
 
-        # Check HRV trend
-        hrv_values = [
-            w.get("hrv_last_night_avg") or w.get("hrv")
-            for w in recent_wellness
-            if w.get("hrv_last_night_avg") or w.get("hrv")
-        ]
+        # Check HRV trend (earlier vs later half of the week's readings)
+        hrv = wellness.split_means("hrv", lo, hi)
 
-        if len(hrv_values) >= 5:
-            first_half_avg = sum(hrv_values[:len(hrv_values)//2]) / (len(hrv_values)//2)
-            second_half_avg = sum(hrv_values[len(hrv_values)//2:]) / (len(hrv_values) - len(hrv_values)//2)
+        if hrv and hrv[2] >= 5:
+            first_half_avg, second_half_avg, _ = hrv
 
             if second_half_avg < first_half_avg * 0.85:
                 signals.append(
@@ -313,15 +397,10 @@ def detect_overtraining_signals(
                 )
 
         # Check resting HR trend
-        rhr_values = [
-            w.get("resting_hr") or w.get("rest_hr")
-            for w in recent_wellness
-            if w.get("resting_hr") or w.get("rest_hr")
-        ]
+        rhr = wellness.split_means("resting_hr", lo, hi)
 
-        if len(rhr_values) >= 5:
-            first_half_avg = sum(rhr_values[:len(rhr_values)//2]) / (len(rhr_values)//2)
-            second_half_avg = sum(rhr_values[len(rhr_values)//2:]) / (len(rhr_values) - len(rhr_values)//2)
+        if rhr and rhr[2] >= 5:
+            first_half_avg, second_half_avg, _ = rhr
 
             if second_half_avg > first_half_avg * 1.1:
                 signals.append(
@@ -330,34 +409,22 @@ def detect_overtraining_signals(
                 )
 
         # Check for consistently low Body Battery
-        bb_values = [
-            w.get("body_battery_high") or w.get("body_battery_charged") or w.get("body_battery")
-            for w in recent_wellness
-            if w.get("body_battery_high") or w.get("body_battery_charged") or w.get("body_battery")
-        ]
-
-        if bb_values:
-            avg_bb = sum(bb_values) / len(bb_values)
-            if avg_bb < 40:
-                signals.append(
-                    f"Average Body Battery is low ({avg_bb:.0f}/100) - "
-                    "energy reserves are depleted, prioritize recovery"
-                )
+        avg_bb = wellness.mean("body_battery", lo, hi)
+
+        if avg_bb is not None and avg_bb < 40:
+            signals.append(
+                f"Average Body Battery is low ({avg_bb:.0f}/100) - "
+                "energy reserves are depleted, prioritize recovery"
+            )
 
         # Check sleep quality
-        sleep_scores = [
-            w.get("sleep_score")
-            for w in recent_wellness
-            if w.get("sleep_score")
-        ]
-
-        if sleep_scores:
-            avg_sleep = sum(sleep_scores) / len(sleep_scores)
-            if avg_sleep < 60:
-                signals.append(
-                    f"Average sleep score is low ({avg_sleep:.0f}/100) - "
-                    "poor sleep compromises recovery"
-                )
+        avg_sleep = wellness.mean("sleep_score", lo, hi)
+
+        if avg_sleep is not None and avg_sleep < 60:
+            signals.append(
+                f"Average sleep score is low ({avg_sleep:.0f}/100) - "
+                "poor sleep compromises recovery"
+            )
 
     return signals
 
@@ -2,14 +2,24 @@
 Weekly Training Analysis
 
 Comprehensive weekly summaries with load distribution, compliance, and insights.
+
+Per-week totals are held in a WeeklyRollup, built either from activity
+dicts or from the persisted ISO-week rollup (services.weekly_rollup_service).
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import date, datetime, timedelta
 import json
 
 
+# A session counts as hard at or above either threshold
+HARD_SESSION_HRSS = 75
+HARD_SESSION_TRIMP = 100
+
+ZONE_COUNT = 5
+
+
 @dataclass
 class WeeklyAnalysis:
     """Complete weekly training analysis."""
@@ -71,6 +81,137 @@ class WeeklyAnalysis:
         return json.dumps(self.to_dict())
 
 
+@dataclass
+class WeeklyRollup:
+    """
+    Training totals for one ISO week, for one sport or all sports (sport=None).
+
+    Attributes:
+        week_start: Monday of the week
+        active_day_mask: Bit n set when there was a session on weekday n (0 = Monday)
+        load: Sum of HRSS (TRIMP when HRSS is missing)
+        zone_minutes: Minutes in HR zones 1-5
+    """
+
+    week_start: date
+    sport: Optional[str] = None
+    session_count: int = 0
+    hard_session_count: int = 0
+    active_day_mask: int = 0
+    distance_km: float = 0.0
+    duration_min: float = 0.0
+    load: float = 0.0
+    elevation_gain_m: float = 0.0
+    zone_minutes: List[float] = field(default_factory=lambda: [0.0] * ZONE_COUNT)
+    longest_session_min: float = 0.0
+    longest_distance_km: float = 0.0
+
+    @property
+    def week_end(self) -> date:
+        """Sunday of the week."""
+        return self.week_start + timedelta(days=6)
+
+    @property
+    def iso_week(self) -> str:
+        """ISO week label, e.g. '2025-W03'."""
+        year, week, _ = self.week_start.isocalendar()
+        return f"{year}-W{week:02d}"
+
+    @property
+    def active_days(self) -> int:
+        """Number of days with at least one session."""
+        return bin(self.active_day_mask).count("1")
+
+    def zone_distribution(self) -> Dict[str, float]:
+        """Percentage of zone time in each zone (zone1_pct..zone5_pct)."""
+        if self.duration_min <= 0:
+            return {f"zone{i}_pct": 0.0 for i in range(1, ZONE_COUNT + 1)}
+        return {
+            f"zone{i}_pct": minutes / self.duration_min * 100
+            for i, minutes in enumerate(self.zone_minutes, start=1)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "week_start": self.week_start.isoformat(),
+            "week_end": self.week_end.isoformat(),
+            "iso_week": self.iso_week,
+            "sport": self.sport,
+            "session_count": self.session_count,
+            "hard_session_count": self.hard_session_count,
+            "active_days": self.active_days,
+            "distance_km": round(self.distance_km, 2),
+            "duration_min": round(self.duration_min, 1),
+            "load": round(self.load, 1),
+            "elevation_gain_m": round(self.elevation_gain_m, 1),
+            "zone_minutes": {
+                f"zone{i}": round(minutes, 1)
+                for i, minutes in enumerate(self.zone_minutes, start=1)
+            },
+            "longest_session_min": round(self.longest_session_min, 1),
+            "longest_distance_km": round(self.longest_distance_km, 2),
+        }
+
+    @classmethod
+    def from_activities(
+        cls,
+        activities: Iterable[dict],
+        week_start: date,
+        sport: Optional[str] = None,
+    ) -> "WeeklyRollup":
+        """
+        Total the given activity dicts.
+
+        Uses the same rules as the persisted rollup; all activities are
+        counted, whatever their date.
+        """
+        rollup = cls(week_start=week_start, sport=sport)
+        for activity in activities:
+            duration = activity.get("duration_min", 0) or 0
+            distance = activity.get("distance_km", 0) or 0
+            hrss = activity.get("hrss", 0) or 0
+            trimp = activity.get("trimp", 0) or 0
+
+            rollup.session_count += 1
+            if hrss >= HARD_SESSION_HRSS or trimp >= HARD_SESSION_TRIMP:
+                rollup.hard_session_count += 1
+            activity_date = _parse_date(activity.get("date"))
+            if activity_date is not None:
+                rollup.active_day_mask |= 1 << activity_date.weekday()
+            rollup.distance_km += distance
+            rollup.duration_min += duration
+            rollup.load += hrss or trimp
+            rollup.elevation_gain_m += activity.get("elevation_gain_m", 0) or 0
+            for i in range(ZONE_COUNT):
+                rollup.zone_minutes[i] += duration * (activity.get(f"zone{i + 1}_pct", 0) or 0) / 100
+            rollup.longest_session_min = max(rollup.longest_session_min, duration)
+            rollup.longest_distance_km = max(rollup.longest_distance_km, distance)
+        return rollup
+
+    @classmethod
+    def combine(
+        cls,
+        rollups: Iterable["WeeklyRollup"],
+        week_start: date,
+        sport: Optional[str] = None,
+    ) -> "WeeklyRollup":
+        """Merge rollups (e.g. the sports of one week, or the weeks of a year)."""
+        total = cls(week_start=week_start, sport=sport)
+        for rollup in rollups:
+            total.session_count += rollup.session_count
+            total.hard_session_count += rollup.hard_session_count
+            total.active_day_mask |= rollup.active_day_mask
+            total.distance_km += rollup.distance_km
+            total.duration_min += rollup.duration_min
+            total.load += rollup.load
+            total.elevation_gain_m += rollup.elevation_gain_m
+            total.zone_minutes = [a + b for a, b in zip(total.zone_minutes, rollup.zone_minutes)]
+            total.longest_session_min = max(total.longest_session_min, rollup.longest_session_min)
+            total.longest_distance_km = max(total.longest_distance_km, rollup.longest_distance_km)
+        return total
+
+
 def _parse_date(date_value: Any) -> Optional[date]:
     """Parse date from string or date object."""
     if date_value is None:
@@ -87,47 +228,6 @@ def _parse_date(date_value: Any) -> Optional[date]:
     return None
 
 
-def _calculate_zone_distribution(activities: List[dict]) -> Dict[str, float]:
-    """Calculate weighted zone distribution across activities."""
-    total_duration = 0.0
-    zone_durations = {
-        "zone1": 0.0,
-        "zone2": 0.0,
-        "zone3": 0.0,
-        "zone4": 0.0,
-        "zone5": 0.0,
-    }
-
-    for activity in activities:
-        duration = activity.get("duration_min", 0) or 0
-
-        # Get zone percentages
-        z1_pct = activity.get("zone1_pct", 0) or 0
-        z2_pct = activity.get("zone2_pct", 0) or 0
-        z3_pct = activity.get("zone3_pct", 0) or 0
-        z4_pct = activity.get("zone4_pct", 0) or 0
-        z5_pct = activity.get("zone5_pct", 0) or 0
-
-        # Convert to minutes and accumulate
-        zone_durations["zone1"] += duration * (z1_pct / 100)
-        zone_durations["zone2"] += duration * (z2_pct / 100)
-        zone_durations["zone3"] += duration * (z3_pct / 100)
-        zone_durations["zone4"] += duration * (z4_pct / 100)
-        zone_durations["zone5"] += duration * (z5_pct / 100)
-        total_duration += duration
-
-    if total_duration == 0:
-        return {f"zone{i}_pct": 0.0 for i in range(1, 6)}
-
-    return {
-        "zone1_pct": (zone_durations["zone1"] / total_duration) * 100,
-        "zone2_pct": (zone_durations["zone2"] / total_duration) * 100,
-        "zone3_pct": (zone_durations["zone3"] / total_duration) * 100,
-        "zone4_pct": (zone_durations["zone4"] / total_duration) * 100,
-        "zone5_pct": (zone_durations["zone5"] / total_duration) * 100,
-    }
-
-
 def analyze_week(
     activities: List[dict],
     fitness_metrics: List[dict],
@@ -147,10 +247,56 @@ def analyze_week(
         WeeklyAnalysis object with complete analysis
     """
     if not activities:
+        today = date.today()
+        return analyze_rollup(
+            WeeklyRollup(week_start=today - timedelta(days=today.weekday())),
+            fitness_metrics,
+        )
+
+    # Determine week boundaries from activities
+    activity_dates = [
+        _parse_date(a.get("date"))
+        for a in activities
+        if _parse_date(a.get("date"))
+    ]
+
+    if activity_dates:
+        min_date = min(activity_dates)
+        week_start = min_date - timedelta(days=min_date.weekday())
+    else:
         today = date.today()
         week_start = today - timedelta(days=today.weekday())
-        week_end = week_start + timedelta(days=6)
 
+    return analyze_rollup(
+        WeeklyRollup.from_activities(activities, week_start),
+        fitness_metrics,
+        target_weekly_load=target_weekly_load,
+        previous_week_load=previous_week_load,
+    )
+
+
+def analyze_rollup(
+    rollup: WeeklyRollup,
+    fitness_metrics: List[dict],
+    target_weekly_load: Optional[float] = None,
+    previous_week_load: Optional[float] = None,
+) -> WeeklyAnalysis:
+    """
+    Generate weekly analysis from a week's totals.
+
+    Args:
+        rollup: Totals for the week (e.g. from the persisted weekly rollup)
+        fitness_metrics: List of daily fitness metrics
+        target_weekly_load: Target load for the week (optional)
+        previous_week_load: Previous week's total load (optional)
+
+    Returns:
+        WeeklyAnalysis object with complete analysis
+    """
+    week_start = rollup.week_start
+    week_end = rollup.week_end
+
+    if rollup.session_count == 0:
         return WeeklyAnalysis(
             week_start=week_start,
             week_end=week_end,
@@ -171,31 +317,8 @@ def analyze_week(
             insights=["No activities recorded this week."],
         )
 
-    # Determine week boundaries from activities
-    activity_dates = [
-        _parse_date(a.get("date"))
-        for a in activities
-        if _parse_date(a.get("date"))
-    ]
-
-    if activity_dates:
-        min_date = min(activity_dates)
-        max_date = max(activity_dates)
-        week_start = min_date - timedelta(days=min_date.weekday())
-        week_end = week_start + timedelta(days=6)
-    else:
-        today = date.today()
-        week_start = today - timedelta(days=today.weekday())
-        week_end = week_start + timedelta(days=6)
-
-    # Calculate totals
-    total_distance = sum(a.get("distance_km", 0) or 0 for a in activities)
-    total_duration = sum(a.get("duration_min", 0) or 0 for a in activities)
-    total_load = sum(a.get("hrss", 0) or a.get("trimp", 0) or 0 for a in activities)
-    activity_count = len(activities)
-
-    # Calculate zone distribution
-    zone_dist = _calculate_zone_distribution(activities)
+    total_load = rollup.load
+    zone_dist = rollup.zone_distribution()
 
     # Calculate week-over-week change
     if previous_week_load and previous_week_load > 0:
@@ -237,10 +360,10 @@ def analyze_week(
     analysis = WeeklyAnalysis(
         week_start=week_start,
         week_end=week_end,
-        total_distance_km=total_distance,
-        total_duration_min=total_duration,
+        total_distance_km=rollup.distance_km,
+        total_duration_min=rollup.duration_min,
         total_load=total_load,
-        activity_count=activity_count,
+        activity_count=rollup.session_count,
         zone1_pct=zone_dist["zone1_pct"],
         zone2_pct=zone_dist["zone2_pct"],
         zone3_pct=zone_dist["zone3_pct"],
@@ -11,6 +11,8 @@ from ..db.repositories.workout_repository import WorkoutRepository
 from ..db.repositories.plan_repository import PlanRepository
 from ..db.repositories.analysis_cache_repository import AnalysisCacheRepository
 from ..services.consent_service import ConsentService, get_consent_service
+from ..services.explanation_factor_service import ExplanationFactorService
+from ..services.weekly_rollup_service import WeeklyRollupService
 
 # Re-export auth dependencies for convenient imports
 from .middleware.auth import (
@@ -71,6 +73,18 @@ def get_analysis_cache_repository() -> AnalysisCacheRepository:
     return AnalysisCacheRepository()
 
 
+@lru_cache
+def get_explanation_factor_service() -> ExplanationFactorService:
+    """Get the explanation factor service instance."""
+    return ExplanationFactorService(training_db=get_training_db())
+
+
+@lru_cache
+def get_weekly_rollup_service() -> WeeklyRollupService:
+    """Get the weekly rollup service instance."""
+    return WeeklyRollupService(training_db=get_training_db())
+
+
 def get_consent_service_dep() -> ConsentService:
     """Get the consent service instance for dependency injection."""
     settings = get_settings()
@@ -4,6 +4,7 @@ Provides endpoints for data retention cleanup and system health monitoring.
 These endpoints require admin authentication.
 """
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -53,6 +54,8 @@ class CleanupReportResponse(BaseModel):
     results: list[CleanupResultResponse]
     total_deleted: int
     duration_seconds: float
+    bytes_reclaimed: int = 0
+    free_bytes: int = 0
 
 
 class RetentionSettingsResponse(BaseModel):
@@ -62,6 +65,7 @@ class RetentionSettingsResponse(BaseModel):
     retention_ai_usage_logs_days: int
     retention_sync_history_days: int
     retention_activity_data_days: int
+    retention_chat_conversations_days: int
     retention_cleanup_enabled: bool
     retention_cleanup_hour: int
 
@@ -110,6 +114,7 @@ async def get_retention_settings(
         retention_ai_usage_logs_days=settings.retention_ai_usage_logs_days,
         retention_sync_history_days=settings.retention_sync_history_days,
         retention_activity_data_days=settings.retention_activity_data_days,
+        retention_chat_conversations_days=settings.retention_chat_conversations_days,
         retention_cleanup_enabled=settings.retention_cleanup_enabled,
         retention_cleanup_hour=settings.retention_cleanup_hour,
     )
@@ -139,6 +144,7 @@ async def get_retention_stats(
             "ai_usage_logs_days": settings.retention_ai_usage_logs_days,
             "sync_history_days": settings.retention_sync_history_days,
             "activity_data_days": settings.retention_activity_data_days,
+            "chat_conversations_days": settings.retention_chat_conversations_days,
         },
     )
 
@@ -166,8 +172,8 @@ async def run_cleanup(
         f"(include_activity_data={include_activity_data})"
     )
 
-    # Run the cleanup
-    report = retention_service.run_full_cleanup()
+    # Run the cleanup (batched; keep the event loop free while it runs)
+    report = await asyncio.to_thread(retention_service.run_full_cleanup)
 
     # Convert to response model
     results = [
@@ -188,6 +194,8 @@ async def run_cleanup(
         results=results,
         total_deleted=sum(r.records_deleted for r in results if r.success),
         duration_seconds=report.duration_seconds,
+        bytes_reclaimed=report.bytes_reclaimed,
+        free_bytes=report.free_bytes,
     )
 
 
@@ -284,6 +292,25 @@ async def cleanup_sync_history(
     )
 
 
+@router.post("/retention/enable-incremental-vacuum")
+async def enable_incremental_vacuum(
+    current_user: CurrentUser = Depends(require_admin),
+    retention_service: DataRetentionService = Depends(get_retention_service),
+) -> dict:
+    """Convert the database to incremental auto-vacuum.
+
+    Databases created before incremental auto-vacuum was enabled keep
+    freed pages on the freelist. This runs a one-time full VACUUM (which
+    blocks writes while it rewrites the file) so later cleanups can return
+    space to the filesystem. Requires admin privileges.
+    """
+    logger.info(f"Admin {current_user.email} enabled incremental auto-vacuum")
+
+    converted = await asyncio.to_thread(retention_service.enable_incremental_vacuum)
+
+    return {"converted": converted}
+
+
 @router.get("/retention/scheduler", response_model=CleanupSchedulerStatusResponse)
 async def get_scheduler_status(
     current_user: CurrentUser = Depends(require_admin),
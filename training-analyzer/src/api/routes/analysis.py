@@ -13,7 +13,6 @@ from ..middleware.rate_limit import limiter, RATE_LIMIT_AI
 from ..middleware.quota import require_quota
 from ...db.repositories.workout_repository import WorkoutRepository
 from ...db.database import TrainingDatabase
-from ...llm.providers import get_llm_client, ModelType
 from ...llm.context_builder import build_athlete_context_prompt, format_workout_for_prompt
 from ...llm.prompts import (
     WORKOUT_ANALYSIS_SYSTEM,
@@ -21,11 +20,7 @@ from ...llm.prompts import (
     QUICK_SUMMARY_SYSTEM,
     QUICK_SUMMARY_USER,
 )
-from ...agents.analysis_agent import (
-    AnalysisAgent,
-    build_athlete_context_from_briefing,
-    get_similar_workouts,
-)
+from ...utils.lazy_import import lazy_import
 from ...models.analysis import (
     AnalysisRequest,
     AnalysisResponse,
@@ -38,6 +33,12 @@ from ...models.analysis import (
     WorkoutExecutionRating,
 )
 
+# The agent and LLM provider SDKs load on first use
+get_llm_client = lazy_import("...llm.providers", "get_llm_client", __package__)
+ModelType = lazy_import("...llm.providers", "ModelType", __package__)
+AnalysisAgent = lazy_import("...agents.analysis_agent", "AnalysisAgent", __package__)
+get_similar_workouts = lazy_import("...agents.analysis_agent", "get_similar_workouts", __package__)
+
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -11,10 +11,16 @@ personal health data including:
 from datetime import date, datetime, timedelta
 from typing import Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from pydantic import BaseModel
 
-from ..deps import get_coach_service, get_training_db, get_current_user, CurrentUser
+from ..deps import (
+    get_coach_service,
+    get_training_db,
+    get_weekly_rollup_service,
+    get_current_user,
+    CurrentUser,
+)
 
 
 router = APIRouter()
@@ -385,6 +391,49 @@ class TrainingPacesFromVO2maxResponse(BaseModel):
     repetition_pace_formatted: str
 
 
+@router.get("/weekly-rollups")
+async def get_weekly_rollups(
+    weeks: int = Query(12, ge=1, le=104, description="Number of weeks up to this one"),
+    sport: Optional[str] = Query(None, description="Restrict to one activity type"),
+    current_user: CurrentUser = Depends(get_current_user),
+    rollup_service = Depends(get_weekly_rollup_service),
+):
+    """Get per-week training totals for the most recent weeks, oldest first.
+
+    Weeks without activities are included with zero totals.
+
+    Requires authentication (contains training data).
+    """
+    try:
+        rollups = rollup_service.get_recent_weeks(weeks=weeks, sport=sport)
+        return {
+            "weeks": [rollup.to_dict() for rollup in rollups],
+            "sport": sport,
+        }
+    except Exception as e:
+        import logging
+        logging.getLogger(__name__).error(f"Failed to get weekly rollups: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get weekly rollups. Please try again later.")
+
+
+@router.get("/year-in-review/{year}")
+async def get_year_in_review(
+    year: int = Path(..., ge=2000, le=9998, description="ISO year"),
+    current_user: CurrentUser = Depends(get_current_user),
+    rollup_service = Depends(get_weekly_rollup_service),
+):
+    """Get a year's training summary: totals, per-sport totals and standout weeks.
+
+    Requires authentication (contains training data).
+    """
+    try:
+        return rollup_service.year_in_review(year)
+    except Exception as e:
+        import logging
+        logging.getLogger(__name__).error(f"Failed to get year in review: {e}")
+        raise HTTPException(status_code=500, detail="Failed to get year in review. Please try again later.")
+
+
 @router.get("/vo2max-trend", response_model=VO2maxTrendResponse)
 async def get_vo2max_trend(
     days: int = 90,
@@ -35,7 +35,11 @@ _users: dict[str, dict] = {}
 
 
 def _init_dev_user() -> None:
-    """Initialize a default dev user for local development."""
+    """Initialize a default dev user for local development.
+
+    Hashing the password costs a few hundred milliseconds of bcrypt, so it
+    runs on the first auth request rather than at import time.
+    """
     from datetime import datetime, timezone
     dev_user_id = "dev-user-123"
     if dev_user_id not in _users:
@@ -50,8 +54,10 @@ def _init_dev_user() -> None:
         }
 
 
-# Initialize dev user on module load
-_init_dev_user()
+def _get_users() -> dict[str, dict]:
+    """Return the user store, creating the dev user on first use."""
+    _init_dev_user()
+    return _users
 
 
 # Request/Response Models
@@ -130,7 +136,7 @@ async def register(
     """
     # Check if user already exists
     email_lower = register_request.email.lower()
-    for user in _users.values():
+    for user in _get_users().values():
         if user["email"].lower() == email_lower:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -151,7 +157,7 @@ async def register(
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
 
-    _users[user_id] = user
+    _get_users()[user_id] = user
 
     # Generate tokens
     token_pair = auth_service.create_token_pair(
@@ -185,7 +191,7 @@ async def login(
     # Find user by email
     email_lower = login_request.email.lower()
     user = None
-    for u in _users.values():
+    for u in _get_users().values():
         if u["email"].lower() == email_lower:
             user = u
             break
@@ -251,7 +257,7 @@ async def refresh(
     user_id = payload["sub"]
 
     # Get user from store
-    user = _users.get(user_id)
+    user = _get_users().get(user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -285,7 +291,7 @@ async def get_me(
     Returns user profile information and current feature usage.
     """
     # Get user from store
-    user = _users.get(current_user.user_id)
+    user = _get_users().get(current_user.user_id)
 
     if user is None:
         # If user is not in local store (e.g., token from previous session),
@@ -13,17 +13,23 @@ from pydantic import BaseModel, Field
 from ..deps import get_coach_service, get_training_db, get_current_user, CurrentUser, get_consent_service_dep
 from ..middleware.rate_limit import limiter, RATE_LIMIT_AI
 from ..middleware.quota import require_quota
+from ...config import get_settings
 from ...services.chat_service import (
     ChatService,
     ChatRequest,
     ChatResponse,
 )
-from ...agents.chat_agent import ChatAgent
-from ...agents.langchain_agent import get_langchain_agent, StreamEvent
+from ...exceptions import ConversationNotFoundError
 from ...db.repositories.ai_usage_repository import get_ai_usage_repository
+from ...db.repositories.chat_repository import get_chat_repository
 from ...observability.langfuse_config import get_langfuse_callback, is_langfuse_enabled
 from ...observability.scoring import score_response_quality
 from ...llm.prompt_sanitizer import sanitize_prompt, get_user_warning
+from ...utils.lazy_import import lazy_import
+
+# The agents and LLM provider SDKs load on first use
+ChatAgent = lazy_import("...agents.chat_agent", "ChatAgent", __package__)
+get_langchain_agent = lazy_import("...agents.langchain_agent", "get_langchain_agent", __package__)
 
 
 router = APIRouter()
@@ -271,12 +277,84 @@ def get_chat_service_instance(
             chat_agent=_chat_agent,
             coach_service=coach_service,
             training_db=training_db,
+            history_token_budget=get_settings().chat_history_token_budget,
+            conversation_store=get_chat_repository(),
         )
         logger.info("ChatService initialized successfully")
 
     return _chat_service
 
 
+async def _load_agent_history(
+    chat_service: Optional[ChatService],
+    session_id: str,
+    user_id: str,
+) -> List[dict]:
+    """Load the user's stored history for an agentic turn, degrading to no history."""
+    if chat_service is None:
+        return []
+    try:
+        return await chat_service.get_agent_history(session_id, user_id=user_id)
+    except Exception as e:
+        logger.warning(f"[chat] Failed to load conversation history: {e}")
+        return []
+
+
+async def _record_agent_exchange(
+    chat_service: Optional[ChatService],
+    session_id: str,
+    user_content: str,
+    assistant_content: str,
+    user_id: str,
+) -> None:
+    """Persist an agentic exchange without failing the request."""
+    if chat_service is None or not assistant_content:
+        return
+    try:
+        await chat_service.record_exchange(
+            session_id, user_content, assistant_content, user_id=user_id
+        )
+    except Exception as e:
+        logger.warning(f"[chat] Failed to record conversation history: {e}")
+
+
+def _get_chat_service_or_none(
+    current_user: CurrentUser,
+    coach_service,
+    training_db,
+) -> Optional[ChatService]:
+    """Get the chat service for history bookkeeping, if it can be initialized."""
+    try:
+        return get_chat_service_instance(
+            current_user=current_user,
+            coach_service=coach_service,
+            training_db=training_db,
+        )
+    except HTTPException:
+        return None
+
+
+async def _check_conversation_access(
+    conversation_id: Optional[str],
+    current_user: CurrentUser,
+    coach_service,
+    training_db,
+) -> None:
+    """Reject continuing another user's conversation with a 404."""
+    if not conversation_id:
+        return
+    chat_service = _get_chat_service_or_none(current_user, coach_service, training_db)
+    if chat_service is None:
+        return
+    try:
+        await chat_service.check_conversation_access(conversation_id, user_id=current_user.id)
+    except ConversationNotFoundError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Conversation {conversation_id} not found"
+        )
+
+
 # ============================================================================
 # API Routes
 # ============================================================================
@@ -349,6 +427,10 @@ async def send_message(
             detail="LLM data sharing consent required. Please accept the data sharing agreement to use AI features."
         )
 
+    await _check_conversation_access(
+        chat_request.conversation_id, current_user, coach_service, training_db
+    )
+
     # =========================================================================
     # PROMPT SANITIZATION: Detect and log potential injection patterns
     # =========================================================================
@@ -378,14 +460,26 @@ async def send_message(
                 user_id=user_id,
             )
 
+            chat_service = _get_chat_service_or_none(current_user, coach_service, training_db)
+            history = await _load_agent_history(chat_service, session_id, user_id)
+
             # Process through the agentic agent
             result = await agent.chat(
                 message=chat_request.message,
-                chat_history=[],  # TODO: Load from conversation history if needed
+                chat_history=history,
                 session_id=session_id,
                 language=chat_request.language or "en",
             )
 
+            if result.get("status") == "completed":
+                await _record_agent_exchange(
+                    chat_service,
+                    session_id,
+                    chat_request.message,
+                    result.get("response", ""),
+                    user_id,
+                )
+
             # Log token usage to ai_usage_logs
             try:
                 usage_repo = get_ai_usage_repository()
@@ -471,7 +565,7 @@ async def send_message(
         )
 
         # Process through service
-        result = await chat_service.process_message(chat_request)
+        result = await chat_service.process_message(chat_request, user_id=user_id)
 
         logger.info(
             f"[chat] Response generated, intent={result.intent}, "
@@ -486,6 +580,11 @@ async def send_message(
             is_agentic=False,
         )
 
+    except ConversationNotFoundError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Conversation {chat_request.conversation_id} not found"
+        )
     except Exception as e:
         logger.error(f"[chat] Error processing message: {e}", exc_info=True)
 
@@ -564,6 +663,10 @@ async def send_message_stream(
             detail="LLM data sharing consent required. Please accept the data sharing agreement to use AI features."
         )
 
+    await _check_conversation_access(
+        chat_request.conversation_id, current_user, coach_service, training_db
+    )
+
     # =========================================================================
     # PROMPT SANITIZATION: Detect and log potential injection patterns
     # =========================================================================
@@ -591,14 +694,18 @@ async def send_message_stream(
                 user_id=user_id,
             )
 
+            chat_service = _get_chat_service_or_none(current_user, coach_service, training_db)
+            history = await _load_agent_history(chat_service, session_id, user_id)
+
             # Track token usage for quota logging
             final_token_usage = {}
             final_tools_used = []
+            response_parts: List[str] = []
 
             # Stream events from the agent
             async for event in agent.chat_stream(
                 message=chat_request.message,
-                chat_history=[],  # TODO: Load from conversation history if needed
+                chat_history=history,
                 session_id=session_id,
                 language=chat_request.language or "en",
             ):
@@ -606,11 +713,22 @@ async def send_message_stream(
                 event_data = event.to_dict()
                 yield f"data: {json.dumps(event_data)}\n\n"
 
+                if event.type == "token" and event.content:
+                    response_parts.append(event.content)
+
                 # Capture final metadata from done event
                 if event.type == "done":
                     final_token_usage = event.token_usage or {}
                     final_tools_used = event.tools_used or []
 
+                    await _record_agent_exchange(
+                        chat_service,
+                        session_id,
+                        chat_request.message,
+                        "".join(response_parts),
+                        user_id,
+                    )
+
                     # Log token usage to ai_usage_logs
                     try:
                         usage_repo = get_ai_usage_repository()
@@ -709,6 +827,7 @@ async def get_suggested_questions(
 @router.get("/history/{conversation_id}", response_model=ConversationHistoryResponse)
 async def get_conversation_history(
     conversation_id: str,
+    current_user: CurrentUser = Depends(get_current_user),
     chat_service: ChatService = Depends(get_chat_service_instance),
 ):
     """
@@ -719,8 +838,14 @@ async def get_conversation_history(
 
     Returns:
         ConversationHistoryResponse with the message history
+
+    Raises:
+        HTTPException: 404 if the conversation does not exist or belongs to
+            another user
     """
-    conversation = await chat_service.get_conversation_history(conversation_id)
+    conversation = await chat_service.get_conversation_history(
+        conversation_id, user_id=current_user.id
+    )
 
     if not conversation:
         raise HTTPException(
@@ -747,6 +872,7 @@ async def get_conversation_history(
 @router.delete("/history/{conversation_id}")
 async def clear_conversation_history(
     conversation_id: str,
+    current_user: CurrentUser = Depends(get_current_user),
     chat_service: ChatService = Depends(get_chat_service_instance),
 ):
     """
@@ -757,8 +883,20 @@ async def clear_conversation_history(
 
     Returns:
         Success status
+
+    Raises:
+        HTTPException: 404 if the conversation does not exist or belongs to
+            another user
     """
-    cleared = await chat_service.clear_conversation(conversation_id)
+    cleared = await chat_service.clear_conversation(
+        conversation_id, user_id=current_user.id
+    )
+
+    if not cleared:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Conversation {conversation_id} not found"
+        )
 
     return {
         "conversation_id": conversation_id,
@@ -6,7 +6,7 @@ These endpoints provide running economy tracking and cardiac drift analysis.
 All economy routes require authentication since they expose sensitive performance data.
 """
 
-from datetime import date, datetime, timedelta
+from datetime import datetime
 from typing import Optional
 import logging
 
@@ -28,6 +28,10 @@ from ...services.running_economy_service import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Trends read per-workout results from the running_economy table, so
+# multi-year ranges cost about the same as a month
+MAX_DAYS = 5 * 365
+
 
 def get_economy_service() -> RunningEconomyService:
     """Get the running economy service instance."""
@@ -56,28 +60,7 @@ async def get_current_economy(
     Requires authentication (contains performance data).
     """
     try:
-        # Get recent activities (last 365 days for best economy comparison)
-        end_date = date.today().isoformat()
-        start_date = (date.today() - timedelta(days=365)).isoformat()
-        activities = training_db.get_activities_range(start_date, end_date)
-
-        if not activities:
-            return EconomyCurrentResponse(
-                has_data=False,
-                message="No running workouts found. Complete a run to see economy metrics.",
-            )
-
-        # Convert to dicts if needed
-        activity_dicts = []
-        for act in activities:
-            if hasattr(act, "to_dict"):
-                activity_dicts.append(act.to_dict())
-            elif isinstance(act, dict):
-                activity_dicts.append(act)
-            else:
-                activity_dicts.append(dict(act))
-
-        return economy_service.get_current_economy(activity_dicts)
+        return economy_service.get_indexed_current_economy(training_db)
 
     except Exception as e:
         logger.error(f"Failed to get current economy: {e}")
@@ -89,7 +72,7 @@ async def get_current_economy(
 
 @router.get("/trend", response_model=EconomyTrendResponse)
 async def get_economy_trend(
-    days: int = Query(default=90, ge=7, le=365, description="Number of days to analyze"),
+    days: int = Query(default=90, ge=7, le=MAX_DAYS, description="Number of days to analyze"),
     current_user: CurrentUser = Depends(get_current_user),
     training_db = Depends(get_training_db),
     economy_service: RunningEconomyService = Depends(get_economy_service),
@@ -108,30 +91,15 @@ async def get_economy_trend(
     Requires authentication (contains performance data).
     """
     try:
-        # Get activities for the requested period
-        end_date = date.today().isoformat()
-        start_date = (date.today() - timedelta(days=days)).isoformat()
-        activities = training_db.get_activities_range(start_date, end_date)
+        trend = economy_service.get_indexed_economy_trend(training_db, days)
 
-        if not activities:
+        if trend.workout_count == 0:
             return EconomyTrendResponse(
-                trend=economy_service.get_economy_trend([], days),
+                trend=trend,
                 success=True,
                 message="No running workouts found in the specified period.",
             )
 
-        # Convert to dicts
-        activity_dicts = []
-        for act in activities:
-            if hasattr(act, "to_dict"):
-                activity_dicts.append(act.to_dict())
-            elif isinstance(act, dict):
-                activity_dicts.append(act)
-            else:
-                activity_dicts.append(dict(act))
-
-        trend = economy_service.get_economy_trend(activity_dicts, days)
-
         return EconomyTrendResponse(
             trend=trend,
             success=True,
@@ -225,7 +193,7 @@ async def get_cardiac_drift(
 
 @router.get("/zones", response_model=PaceZonesEconomyResponse)
 async def get_pace_zones_economy(
-    days: int = Query(default=90, ge=7, le=365, description="Number of days to analyze"),
+    days: int = Query(default=90, ge=7, le=MAX_DAYS, description="Number of days to analyze"),
     current_user: CurrentUser = Depends(get_current_user),
     training_db = Depends(get_training_db),
     economy_service: RunningEconomyService = Depends(get_economy_service),
@@ -248,30 +216,15 @@ async def get_pace_zones_economy(
     Requires authentication (contains performance data).
     """
     try:
-        # Get activities for the requested period
-        end_date = date.today().isoformat()
-        start_date = (date.today() - timedelta(days=days)).isoformat()
-        activities = training_db.get_activities_range(start_date, end_date)
+        zones_economy = economy_service.get_indexed_pace_specific_economy(training_db, days)
 
-        if not activities:
+        if zones_economy.total_workouts == 0:
             return PaceZonesEconomyResponse(
-                zones_economy=economy_service.get_pace_specific_economy([], days),
+                zones_economy=zones_economy,
                 success=True,
                 message="No running workouts found in the specified period.",
             )
 
-        # Convert to dicts
-        activity_dicts = []
-        for act in activities:
-            if hasattr(act, "to_dict"):
-                activity_dicts.append(act.to_dict())
-            elif isinstance(act, dict):
-                activity_dicts.append(act)
-            else:
-                activity_dicts.append(dict(act))
-
-        zones_economy = economy_service.get_pace_specific_economy(activity_dicts, days)
-
         return PaceZonesEconomyResponse(
             zones_economy=zones_economy,
             success=True,
@@ -287,7 +240,7 @@ async def get_pace_zones_economy(
 
 @router.get("/drift-trend")
 async def get_cardiac_drift_trend(
-    days: int = Query(default=90, ge=7, le=365, description="Number of days to analyze"),
+    days: int = Query(default=90, ge=7, le=MAX_DAYS, description="Number of days to analyze"),
     current_user: CurrentUser = Depends(get_current_user),
     training_db = Depends(get_training_db),
     economy_service: RunningEconomyService = Depends(get_economy_service),
@@ -306,36 +259,7 @@ async def get_cardiac_drift_trend(
     Requires authentication (contains performance data).
     """
     try:
-        # Get activities for the requested period
-        end_date = date.today().isoformat()
-        start_date = (date.today() - timedelta(days=days)).isoformat()
-        activities = training_db.get_activities_range(start_date, end_date)
-
-        if not activities:
-            return {
-                "success": True,
-                "data": {
-                    "startDate": start_date,
-                    "endDate": date.today().isoformat(),
-                    "dataPoints": [],
-                    "avgDriftPercent": 0,
-                    "concerningCount": 0,
-                    "improvementTrend": "stable",
-                    "aerobicBaseAssessment": "No running workouts found to assess aerobic base.",
-                },
-            }
-
-        # Convert to dicts
-        activity_dicts = []
-        for act in activities:
-            if hasattr(act, "to_dict"):
-                activity_dicts.append(act.to_dict())
-            elif isinstance(act, dict):
-                activity_dicts.append(act)
-            else:
-                activity_dicts.append(dict(act))
-
-        drift_trend = economy_service.get_cardiac_drift_trend(activity_dicts, days=days)
+        drift_trend = economy_service.get_indexed_cardiac_drift_trend(training_db, days=days)
 
         return {
             "success": True,
@@ -8,7 +8,8 @@ Provides:
 """
 
 import logging
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, ConfigDict, Field
@@ -16,6 +17,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from ..deps import get_training_db, get_current_user, CurrentUser
 from ...services.social_proof_service import SocialProofService, SocialProofStats
 from ...services.achievement_service import AchievementService
+from ...metrics.vdot import calculate_vdot
 from ...services.comeback_service import ComebackService, get_comeback_service
 from ...services.pr_detection_service import PRDetectionService
 from ...db.models.comeback import ComebackChallengeStatus
@@ -51,6 +53,33 @@ def get_achievement_service(
     return AchievementService(str(training_db.db_path))
 
 
+def _current_cohort_values(training_db) -> Dict[str, Optional[float]]:
+    """Get the user's current CTL, 7-day volume and VDOT."""
+    values: Dict[str, Optional[float]] = {
+        "ctl": None,
+        "weekly_volume_km": None,
+        "vdot": None,
+    }
+
+    latest_fitness = training_db.get_latest_fitness_metrics()
+    if latest_fitness and latest_fitness.ctl:
+        values["ctl"] = latest_fitness.ctl
+
+    today = date.today()
+    activities = training_db.get_activities_range(
+        (today - timedelta(days=6)).isoformat(), today.isoformat()
+    )
+    volume = sum(a.distance_km or 0 for a in activities)
+    if volume > 0:
+        values["weekly_volume_km"] = volume
+
+    latest_garmin = training_db.get_latest_garmin_fitness_data()
+    if latest_garmin and latest_garmin.race_time_5k:
+        values["vdot"] = calculate_vdot(5000, latest_garmin.race_time_5k)
+
+    return values
+
+
 @router.get("/social-proof", response_model=SocialProofStats)
 async def get_social_proof(
     current_user: CurrentUser = Depends(get_current_user),
@@ -75,7 +104,7 @@ async def get_social_proof(
     """
     try:
         # Get user's progress for percentile calculations
-        user_progress = achievement_service.get_user_progress()
+        user_progress = achievement_service.get_user_progress(current_user.id)
 
         # Get user's level and streak
         user_level: Optional[int] = None
@@ -115,11 +144,31 @@ async def get_social_proof(
         except Exception as e:
             logger.debug(f"Could not calculate user average pace: {e}")
 
+        # Keep the user's training values current in the cohort distributions
+        # (streak and level are recorded as achievements update them)
+        user_values: Dict[str, Optional[float]] = {
+            "ctl": None,
+            "weekly_volume_km": None,
+            "vdot": None,
+            "pace": user_avg_pace,
+        }
+        user_age: Optional[int] = None
+        try:
+            user_values.update(_current_cohort_values(training_db))
+            user_age = training_db.get_user_profile().age
+            social_proof_service.record_user_values(current_user.id, user_values, user_age)
+        except Exception as e:
+            logger.debug(f"Could not update cohort distributions: {e}")
+
         # Get social proof stats with user context
         stats = social_proof_service.get_social_proof_stats(
             user_level=user_level,
             user_streak=user_streak,
             user_avg_pace=user_avg_pace,
+            user_ctl=user_values["ctl"],
+            user_weekly_volume_km=user_values["weekly_volume_km"],
+            user_vdot=user_values["vdot"],
+            user_age=user_age,
         )
 
         return stats
@@ -380,7 +429,7 @@ async def detect_emotional_context(
         # Get user progress for streak info
         try:
             achievement_service = AchievementService(str(training_db.db_path))
-            progress = achievement_service.get_user_progress()
+            progress = achievement_service.get_user_progress(current_user.id)
             current_streak = progress.current_streak
             consecutive_training_days = progress.current_streak
         except Exception:
@@ -5,13 +5,20 @@ Provides transparency endpoints that show the mathematical reasoning
 and data behind every recommendation, differentiating from "black box" competitors.
 """
 
-from datetime import date, datetime
-from typing import Optional, List, Dict, Any
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
-from ..deps import get_coach_service, get_training_db
+from ..deps import (
+    get_coach_service,
+    get_explanation_factor_service,
+    get_plan_repository,
+    get_training_db,
+)
+from ...db.repositories.plan_repository import PlanRepository
+from ...recommendations.factors import ExplanationFactors
 from ...recommendations.readiness import calculate_explained_readiness
 from ...recommendations.workout import recommend_explained_workout
 
@@ -103,6 +110,7 @@ async def get_explained_readiness(
     target_date: Optional[str] = Query(None, description="Date for assessment (YYYY-MM-DD)"),
     coach_service = Depends(get_coach_service),
     training_db = Depends(get_training_db),
+    factor_service = Depends(get_explanation_factor_service),
 ):
     """
     Get explained readiness breakdown.
@@ -126,8 +134,11 @@ async def get_explained_readiness(
         # Get the daily briefing data
         briefing = coach_service.get_daily_briefing(parsed_date)
 
+        # Recency and wellness factors shared by the explain endpoints
+        factors = factor_service.get_factors(parsed_date)
+
         # Extract wellness and fitness data
-        wellness_data = briefing.get("wellness", {})
+        wellness_data = briefing.get("wellness") or factors.wellness
         training_status = briefing.get("training_status", {})
 
         # Build fitness metrics dict
@@ -147,6 +158,7 @@ async def get_explained_readiness(
             fitness_metrics=fitness_metrics,
             recent_activities=recent_activities,
             target_date=parsed_date,
+            days_since_hard=factors.days_since_hard,
         )
 
         # Convert to response format
@@ -154,7 +166,7 @@ async def get_explained_readiness(
             date=explained.date,
             overall_score=explained.overall_score,
             zone=explained.zone,
-            recommendation=_to_recommendation_response(explained.recommendation),
+            recommendation=_to_recommendation_response(explained.recommendation, factors),
             factor_breakdown=[_to_factor_response(f) for f in explained.factor_breakdown],
             score_calculation=explained.score_calculation,
             comparison_to_baseline=explained.comparison_to_baseline,
@@ -175,6 +187,7 @@ async def get_explained_workout_recommendation(
     target_date: Optional[str] = Query(None, description="Date for recommendation (YYYY-MM-DD)"),
     coach_service = Depends(get_coach_service),
     training_db = Depends(get_training_db),
+    factor_service = Depends(get_explanation_factor_service),
 ):
     """
     Get explained workout recommendation.
@@ -207,10 +220,10 @@ async def get_explained_workout_recommendation(
         acwr = training_status.get("acwr", 1.0) or 1.0
         tsb = training_status.get("tsb", 0) or 0
 
-        # Calculate days since hard/long workouts
-        recent_activities = briefing.get("recent_activities", [])
-        days_since_hard = _calculate_days_since_hard(recent_activities, parsed_date)
-        days_since_long = _calculate_days_since_long(recent_activities, parsed_date)
+        # Days since hard/long workouts from the shared factor set
+        factors = factor_service.get_factors(parsed_date)
+        days_since_hard = factors.days_since_hard
+        days_since_long = factors.days_since_long
 
         # Get weekly load info
         weekly_load = briefing.get("weekly_load", {})
@@ -242,7 +255,7 @@ async def get_explained_workout_recommendation(
             duration_min=explained.duration_min,
             intensity_description=explained.intensity_description,
             hr_zone_target=explained.hr_zone_target,
-            recommendation=_to_recommendation_response(explained.recommendation),
+            recommendation=_to_recommendation_response(explained.recommendation, factors),
             decision_tree=explained.decision_tree,
             readiness_influence=explained.readiness_influence,
             load_influence=explained.load_influence,
@@ -261,11 +274,15 @@ async def get_explained_workout_recommendation(
 @router.get("/plan-session/{session_id}", response_model=SessionExplanationResponse)
 async def get_explained_plan_session(
     session_id: str,
-    training_db = Depends(get_training_db),
+    plan_repo: PlanRepository = Depends(get_plan_repository),
+    factor_service = Depends(get_explanation_factor_service),
 ):
     """
     Explain why a specific training plan session was scheduled.
 
+    `session_id` is `{plan_id}:{week_number}:{session_index}`, the same
+    position the plan session PATCH route uses.
+
     Shows:
     - The periodization context (what phase, what week)
     - Why this type of session was chosen for this day
@@ -275,58 +292,62 @@ async def get_explained_plan_session(
     This helps users understand the thought process behind each
     planned workout in their training plan.
     """
+    plan_id, week_number, session_index = _parse_session_id(session_id)
+
     try:
-        # Get the session from the database
-        session = training_db.get_planned_session(session_id)
-        if not session:
+        plan = plan_repo.get(plan_id)
+        week = plan.get_week(week_number) if plan else None
+        if not week or not 0 <= session_index < len(week.sessions):
             raise HTTPException(status_code=404, detail="Session not found")
-
-        # Get the plan for context
-        plan = training_db.get_plan_by_session(session_id)
-        if not plan:
-            raise HTTPException(status_code=404, detail="Plan not found for session")
+        session = week.sessions[session_index]
 
         # Build the explanation
-        week_number = session.get("week_number", 1)
-        phase = session.get("phase", "base")
-        session_type = session.get("session_type", "easy")
-        day_of_week = session.get("day_of_week", 0)
-
-        # Get week context
-        week_sessions = training_db.get_week_sessions(plan.get("id"), week_number)
-        hard_sessions_this_week = sum(
-            1 for s in week_sessions
-            if s.get("session_type") in ["interval", "tempo", "threshold", "long_run"]
-        )
-
-        # Determine weekly context
-        session_index = sum(
-            1 for s in week_sessions
-            if s.get("session_type") == session_type
-            and s.get("day_of_week", 0) < day_of_week
+        phase = week.phase.value
+        session_type = session.workout_type.value
+        day_of_week = session.day_of_week
+        total_weeks = plan.total_weeks
+
+        # Weekly context
+        quality_sessions = len(week.quality_sessions)
+        same_type_before = sum(
+            1 for s in week.sessions
+            if s.workout_type == session.workout_type and s.day_of_week < day_of_week
         ) + 1
 
-        weekly_context = f"Session {session_index} of {session_type} workouts this week"
-        if hard_sessions_this_week > 0:
-            weekly_context += f" ({hard_sessions_this_week} quality sessions planned)"
+        weekly_context = f"Session {same_type_before} of {session_type} workouts this week"
+        if quality_sessions > 0:
+            weekly_context += f" ({quality_sessions} quality sessions planned)"
 
         # Build periodization context
-        total_weeks = plan.get("total_weeks", 12)
         periodization_context = f"Week {week_number} of {total_weeks} - {phase.title()} Phase"
 
-        # Check for progression
-        previous_similar = training_db.get_previous_similar_session(
-            plan.get("id"), session_type, week_number
+        # Progression from the latest session of the same type in an earlier week
+        previous_similar = next(
+            (
+                s
+                for earlier in sorted(plan.weeks, key=lambda w: w.week_number, reverse=True)
+                if earlier.week_number < week_number
+                for s in earlier.sessions
+                if s.workout_type == session.workout_type
+            ),
+            None,
         )
         progression_note = None
         if previous_similar:
-            prev_load = previous_similar.get("target_load", 0)
-            curr_load = session.get("target_load", 0)
+            prev_load = previous_similar.target_load
+            curr_load = session.target_load
             if prev_load > 0 and curr_load > 0:
                 pct_change = ((curr_load - prev_load) / prev_load) * 100
                 if abs(pct_change) > 5:
                     progression_note = f"{pct_change:+.0f}% load from previous {session_type} session"
 
+        # Same week placement as the plan exports: the last week ends on race week
+        week_start = plan.goal.race_date - timedelta(weeks=total_weeks - week_number + 1)
+        session_date = week_start + timedelta(days=day_of_week)
+
+        # Recent training around the session date, from the shared factor set
+        recency = factor_service.get_factors(min(session_date, date.today()))
+
         # Build the rationale
         factors = [
             _build_session_factor("Periodization Phase", phase, _get_phase_explanation(phase)),
@@ -341,9 +362,11 @@ async def get_explained_plan_session(
             factors=factors,
             data_points={
                 "session_id": session_id,
+                "plan_id": plan_id,
                 "week_number": week_number,
                 "phase": phase,
                 "session_type": session_type,
+                "explanation_factors": _factor_data_points(recency),
             },
             calculation_summary=f"Scheduled based on {phase} phase periodization, day {day_of_week} placement, and weekly load distribution",
             alternatives_considered=[],
@@ -352,9 +375,9 @@ async def get_explained_plan_session(
 
         return SessionExplanationResponse(
             session_id=session_id,
-            session_name=session.get("name", session_type.title()),
+            session_name=session.description or session_type.title(),
             session_type=session_type,
-            scheduled_date=session.get("date", ""),
+            scheduled_date=session_date.isoformat(),
             rationale=rationale,
             periodization_context=periodization_context,
             weekly_context=weekly_context,
@@ -376,14 +399,19 @@ async def get_explained_plan_session(
 # Helper Functions
 # ============================================================================
 
-def _to_recommendation_response(rec) -> ExplainedRecommendationResponse:
+def _to_recommendation_response(
+    rec, factors: Optional[ExplanationFactors] = None
+) -> ExplainedRecommendationResponse:
     """Convert ExplainedRecommendation to response model."""
+    data_points = dict(rec.data_points)
+    if factors is not None:
+        data_points["explanation_factors"] = _factor_data_points(factors)
     return ExplainedRecommendationResponse(
         recommendation=rec.recommendation,
         confidence=rec.confidence,
         confidence_explanation=rec.confidence_explanation,
         factors=[_to_factor_response(f) for f in rec.factors],
-        data_points=rec.data_points,
+        data_points=data_points,
         calculation_summary=rec.calculation_summary,
         alternatives_considered=rec.alternatives_considered,
         key_driver=rec.key_driver,
@@ -414,68 +442,24 @@ def _to_factor_response(factor) -> ExplanationFactorResponse:
     )
 
 
-def _calculate_days_since_hard(activities: list, target_date: date) -> int:
-    """Calculate days since last hard workout."""
-    if not activities:
-        return 3
-
-    hard_threshold_hrss = 75.0
-    last_hard = None
-
-    for activity in activities:
-        activity_date_str = activity.get("date")
-        if not activity_date_str:
-            continue
-
-        try:
-            if isinstance(activity_date_str, str):
-                activity_date = datetime.strptime(activity_date_str, "%Y-%m-%d").date()
-            else:
-                activity_date = activity_date_str
-        except (ValueError, TypeError):
-            continue
+def _factor_data_points(factors: ExplanationFactors) -> Dict[str, Any]:
+    """Recency and wellness-delta factors for a response's data points."""
+    data = factors.to_dict()
+    # The raw wellness sections are already reflected in the factor breakdown
+    data.pop("wellness", None)
+    return data
 
-        hrss = activity.get("hrss", 0) or 0
-        if hrss >= hard_threshold_hrss:
-            if last_hard is None or activity_date > last_hard:
-                last_hard = activity_date
 
-    if last_hard is None:
-        return 3
-
-    return max(0, (target_date - last_hard).days)
-
-
-def _calculate_days_since_long(activities: list, target_date: date) -> int:
-    """Calculate days since last long workout."""
-    if not activities:
-        return 7
-
-    long_threshold_duration = 75 * 60  # 75 minutes in seconds
-    last_long = None
-
-    for activity in activities:
-        activity_date_str = activity.get("date")
-        if not activity_date_str:
-            continue
-
-        try:
-            if isinstance(activity_date_str, str):
-                activity_date = datetime.strptime(activity_date_str, "%Y-%m-%d").date()
-            else:
-                activity_date = activity_date_str
-        except (ValueError, TypeError):
-            continue
-
-        duration = activity.get("duration", 0) or 0
-        if duration >= long_threshold_duration:
-            if last_long is None or activity_date > last_long:
-                last_long = activity_date
-
-    if last_long is None:
-        return 7
-
-    return max(0, (target_date - last_long).days)
+def _parse_session_id(session_id: str) -> Tuple[str, int, int]:
+    """Split a `{plan_id}:{week_number}:{session_index}` session ID."""
+    try:
+        plan_id, week_number, session_index = session_id.rsplit(":", 2)
+        return plan_id, int(week_number), int(session_index)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Session ID must be '{plan_id}:{week_number}:{session_index}'",
+        )
 
 
 def _build_session_factor(name: str, value: Any, explanation: str) -> ExplanationFactorResponse:
@@ -517,9 +501,9 @@ def _get_day_explanation(day: int, session_type: str) -> str:
     day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
     day_name = day_names[day] if 0 <= day < 7 else f"Day {day}"
 
-    if session_type in ["long_run"]:
+    if session_type in ["long", "long_run"]:
         return f"{day_name} scheduled for long run - typical weekend placement for time availability."
-    elif session_type in ["interval", "tempo", "threshold"]:
+    elif session_type in ["intervals", "interval", "tempo", "threshold", "hills", "fartlek"]:
         return f"{day_name} quality session - placed mid-week with recovery days before and after."
     elif session_type in ["rest"]:
         return f"{day_name} rest day - strategically placed after hard effort or before quality session."
@@ -85,7 +85,7 @@ async def get_all_achievements(
     Requires authentication.
     """
     try:
-        achievements = achievement_service.get_all_achievements()
+        achievements = achievement_service.get_all_achievements(current_user.id)
 
         unlocked_count = sum(1 for a in achievements if a.unlocked)
 
@@ -121,7 +121,9 @@ async def get_recent_achievements(
     Requires authentication.
     """
     try:
-        achievements = achievement_service.get_recent_achievements(days=days)
+        achievements = achievement_service.get_recent_achievements(
+            days=days, user_id=current_user.id
+        )
 
         return RecentAchievementsResponse(
             achievements=achievements,
@@ -151,7 +153,7 @@ async def get_user_progress(
     Requires authentication.
     """
     try:
-        return achievement_service.get_user_progress()
+        return achievement_service.get_user_progress(current_user.id)
     except Exception as e:
         import logging
         logging.getLogger(__name__).error(f"Failed to get user progress: {e}")
@@ -171,8 +173,9 @@ async def check_achievements(
     """
     Manually trigger achievement check.
 
-    This endpoint checks for any newly earned achievements based on
-    the current state of the database. It's useful for:
+    This endpoint checks for any newly earned achievements against the
+    user's progress ledger, folding in the latest CTL and VO2 Max
+    readings. It's useful for:
     - Checking after a workout sync
     - Manual verification of achievement status
     - Testing achievement unlock logic
@@ -195,36 +198,18 @@ async def check_achievements(
         else:
             context["activity_date"] = date.today().isoformat()
 
-        # Get CTL from latest fitness metrics
+        # Latest readings; peaks and trends are tracked by the ledger
         latest_fitness = training_db.get_latest_fitness_metrics()
         if latest_fitness:
             context["ctl"] = latest_fitness.ctl or 0
 
-            # Get CTL peak from historical data
-            # Query all fitness metrics to find the peak
-            from datetime import timedelta
-            end_date = date.today()
-            start_date = end_date - timedelta(days=365)
-
-            fitness_range = training_db.get_fitness_range(
-                start_date.isoformat(),
-                end_date.isoformat(),
-            )
-
-            if fitness_range:
-                ctl_values = [f.ctl for f in fitness_range if f.ctl is not None]
-                if ctl_values:
-                    # Exclude current value to find historical peak
-                    historical_values = ctl_values[1:] if len(ctl_values) > 1 else [0]
-                    context["ctl_peak"] = max(historical_values) if historical_values else 0
-
-        # Get VO2 Max from latest Garmin fitness data
         latest_garmin = training_db.get_latest_garmin_fitness_data()
         if latest_garmin:
             context["vo2max_running"] = latest_garmin.vo2max_running or 0
             context["vo2max_cycling"] = latest_garmin.vo2max_cycling or 0
+            context["vo2max_date"] = latest_garmin.date
 
-        return achievement_service.check_and_unlock_achievements(context)
+        return achievement_service.check_and_unlock_achievements(context, current_user.id)
 
     except Exception as e:
         import logging
@@ -272,7 +257,9 @@ async def check_early_achievements(
     Requires authentication.
     """
     try:
-        return achievement_service.check_early_achievements(request.context)
+        return achievement_service.check_early_achievements(
+            request.context, current_user.id
+        )
 
     except Exception as e:
         import logging
@@ -2,16 +2,23 @@
 
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
-from enum import Enum
-import uuid
-import asyncio
+import json
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, EmailStr
 
 from ..deps import get_training_db
 from ...db.database import TrainingDatabase, ActivityMetrics, GarminFitnessData
 from ...metrics.load import calculate_hrss, calculate_trimp
+from ...services.garmin_session_pool import get_garmin_session_pool, is_auth_error
+from ...services.sync_job_queue import (
+    SyncChunk,
+    SyncCredentials,
+    SyncJobQueue,
+    SyncJobRecord,
+    get_sync_job_queue,
+)
 
 
 router = APIRouter()
@@ -19,42 +26,6 @@ router = APIRouter()
 
 # ============ Async Job Infrastructure ============
 
-class SyncJobStatus(str, Enum):
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-
-
-class SyncJob:
-    """In-memory sync job tracker."""
-    def __init__(self, job_id: str, days: int):
-        self.job_id = job_id
-        self.status = SyncJobStatus.PENDING
-        self.days = days
-        self.created_at = datetime.now()
-        self.started_at: Optional[datetime] = None
-        self.completed_at: Optional[datetime] = None
-        self.progress_percent = 0
-        self.current_step = "Starting..."
-        self.activities_synced = 0
-        self.fitness_days_synced = 0
-        self.error: Optional[str] = None
-        self.result: Optional[Dict[str, Any]] = None
-
-
-# In-memory job store (jobs expire after 1 hour)
-_sync_jobs: Dict[str, SyncJob] = {}
-
-
-def _cleanup_old_jobs():
-    """Remove jobs older than 1 hour."""
-    cutoff = datetime.now() - timedelta(hours=1)
-    expired = [jid for jid, job in _sync_jobs.items() if job.created_at < cutoff]
-    for jid in expired:
-        del _sync_jobs[jid]
-
-
 class SyncJobResponse(BaseModel):
     """Response for sync job status."""
     job_id: str
@@ -89,6 +60,16 @@ class GarminSyncRequest(BaseModel):
     )
 
 
+class GarminAsyncSyncRequest(GarminSyncRequest):
+    """Request to sync in the background; long backfills are split into chunks."""
+    days: int = Field(
+        default=30,
+        ge=1,
+        le=730,
+        description="Number of days to sync (1-730)"
+    )
+
+
 class GarminSyncResponse(BaseModel):
     """Response from Garmin sync operation."""
     success: bool
@@ -230,6 +211,19 @@ def _calculate_pace(distance_m: Optional[float], duration_sec: Optional[float])
     return duration_sec / distance_km
 
 
+def _get_garmin_client(request: "GarminSyncRequest"):
+    """Get an authenticated Garmin client, reusing a session for these credentials."""
+    return get_garmin_session_pool().get_client(
+        request.email.lower(), request.email, request.password
+    )
+
+
+def _drop_garmin_session(request: "GarminSyncRequest", error: Exception) -> None:
+    """Forget the cached session if Garmin rejected it."""
+    if is_auth_error(error):
+        get_garmin_session_pool().invalidate(request.email.lower())
+
+
 @router.post("/sync", response_model=GarminSyncDetailedResponse)
 async def sync_garmin(
     request: GarminSyncRequest,
@@ -269,17 +263,16 @@ async def _do_garmin_sync(request, training_db, logger):
     import traceback
 
     try:
-        from garminconnect import Garmin, GarminConnectAuthenticationError
+        from garminconnect import GarminConnectAuthenticationError
     except ImportError:
         raise HTTPException(
             status_code=500,
             detail="garminconnect library not installed. Run: pip install garminconnect"
         )
 
-    # Attempt login
+    # Attempt login (or reuse an existing session)
     try:
-        client = Garmin(request.email, request.password)
-        client.login()
+        client = _get_garmin_client(request)
     except GarminConnectAuthenticationError as e:
         raise HTTPException(
             status_code=401,
@@ -335,6 +328,7 @@ async def _do_garmin_sync(request, training_db, logger):
             start_index += BATCH_SIZE
 
     except Exception as e:
+        _drop_garmin_session(request, e)
         logger.error(f"Failed to fetch activities from Garmin: {e}")
         raise HTTPException(
             status_code=500,
@@ -575,263 +569,247 @@ async def recalculate_metrics(
 
 # ============ Async Sync Endpoints ============
 
-@router.post("/sync-async", response_model=AsyncSyncResponse)
-async def sync_garmin_async(
-    request: GarminSyncRequest,
-    training_db: TrainingDatabase = Depends(get_training_db),
-):
-    """
-    Start an async Garmin sync and return a job ID for polling.
-
-    Use /sync-status/{job_id} to poll for progress and completion.
-    This prevents frontend timeouts on long syncs.
-    """
-    _cleanup_old_jobs()
+def _activity_to_metrics(activity: Dict[str, Any], profile) -> Optional[ActivityMetrics]:
+    """Convert a Garmin activity summary to ActivityMetrics."""
+    activity_id = str(activity.get("activityId") or "")
+    if not activity_id:
+        return None
 
-    job_id = str(uuid.uuid4())
-    job = SyncJob(job_id=job_id, days=request.days)
-    _sync_jobs[job_id] = job
+    activity_type = activity.get("activityType", {}).get("typeKey", "unknown")
+    mapped_type = _map_garmin_activity_type(activity_type)
+
+    # Get activity details
+    start_time = activity.get("startTimeLocal")
+    activity_datetime = datetime.fromisoformat(start_time.replace("Z", "+00:00")) if start_time else datetime.now()
+    activity_name = activity.get("activityName", mapped_type.title())
+
+    # Metrics
+    avg_hr = activity.get("averageHR")
+    max_hr = activity.get("maxHR")
+    duration_sec = activity.get("duration")
+    distance_m = activity.get("distance")
+    elevation_gain = activity.get("elevationGain")
+    avg_speed = activity.get("averageSpeed")
+
+    # Convert units
+    distance_km = distance_m / 1000 if distance_m else None
+    duration_min = duration_sec / 60 if duration_sec else None
+    pace_sec_per_km = _calculate_pace(distance_m, duration_sec)
+    avg_speed_kmh = avg_speed * 3.6 if avg_speed else None
+
+    # Calculate HRSS/TRIMP
+    hrss = None
+    trimp = None
+    if avg_hr and duration_min and profile and profile.max_hr and profile.rest_hr:
+        max_hr_for_calc = max_hr or profile.max_hr
+        if profile.threshold_hr:
+            hrss = calculate_hrss(
+                duration_min=duration_min,
+                avg_hr=int(avg_hr),
+                threshold_hr=profile.threshold_hr,
+                max_hr=max_hr_for_calc,
+                rest_hr=profile.rest_hr,
+            )
+        trimp = calculate_trimp(
+            duration_min=duration_min,
+            avg_hr=int(avg_hr),
+            rest_hr=profile.rest_hr,
+            max_hr=max_hr_for_calc,
+            gender=profile.gender or "male",
+        )
 
-    # Start the sync in background
-    asyncio.create_task(
-        _do_garmin_sync_async(job, request, training_db)
+    return ActivityMetrics(
+        activity_id=activity_id,
+        date=activity_datetime.strftime("%Y-%m-%d"),
+        activity_type=mapped_type,
+        activity_name=activity_name,
+        hrss=hrss,
+        trimp=trimp,
+        avg_hr=int(avg_hr) if avg_hr else None,
+        max_hr=int(max_hr) if max_hr else None,
+        duration_min=duration_min,
+        distance_km=distance_km,
+        pace_sec_per_km=pace_sec_per_km,
+        zone1_pct=None,  # Zone data not available from simple API
+        zone2_pct=None,
+        zone3_pct=None,
+        zone4_pct=None,
+        zone5_pct=None,
+        start_time=activity_datetime.strftime("%Y-%m-%dT%H:%M:%S"),
+        sport_type=activity_type,
+        avg_speed_kmh=avg_speed_kmh,
+        elevation_gain_m=elevation_gain,
     )
 
-    return AsyncSyncResponse(
-        job_id=job_id,
-        status="pending",
-        message=f"Sync started for {request.days} days. Poll /sync-status/{job_id} for progress.",
-    )
 
+def _make_chunk_runner(training_db: TrainingDatabase):
+    """Build the function that syncs one date window of a queued job."""
+    import logging
+    logger = logging.getLogger(__name__)
 
-@router.get("/sync-status/{job_id}", response_model=SyncJobResponse)
-async def get_sync_status(job_id: str):
-    """
-    Get the status of an async sync job.
+    def run_chunk(job: SyncJobRecord, chunk: SyncChunk, credentials: SyncCredentials, progress) -> tuple:
+        key = credentials.email.lower()
+        window = f"{chunk.start_date} to {chunk.end_date}"
+        progress(f"Connecting to Garmin ({window})...", 0.0)
+        try:
+            client = get_garmin_session_pool().get_client(
+                key, credentials.email, credentials.password
+            )
 
-    Poll this endpoint every 1-2 seconds to track progress.
-    """
-    job = _sync_jobs.get(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found or expired")
+            progress(f"Fetching activities for {window}...", 0.05)
+            activities = client.get_activities_by_date(chunk.start_date, chunk.end_date) or []
+
+            profile = training_db.get_user_profile()
+            synced = 0
+            for i, activity in enumerate(activities):
+                try:
+                    metrics = _activity_to_metrics(activity, profile)
+                    if metrics is None:
+                        continue
+                    training_db.save_activity_metrics(metrics)
+                    synced += 1
+                except Exception as e:
+                    logger.warning(f"Error processing activity: {e}")
+                if (i + 1) % 10 == 0:
+                    progress(
+                        f"Processing activity {i + 1}/{len(activities)} ({window})...",
+                        0.05 + 0.6 * (i + 1) / len(activities),
+                    )
+
+            progress(f"Syncing fitness data for {window}...", 0.7)
+            end = datetime.fromisoformat(chunk.end_date).date()
+            days = (end - datetime.fromisoformat(chunk.start_date).date()).days + 1
+            fitness_days = 0
+            try:
+                fitness_new, fitness_updated, _ = _sync_fitness_data_internal(
+                    client, training_db, days, end_date=end
+                )
+                fitness_days = fitness_new + fitness_updated
+            except Exception as e:
+                if is_auth_error(e):
+                    raise
+                logger.warning(f"Failed to sync fitness data: {e}")
+
+            return synced, fitness_days
+        except Exception as e:
+            if is_auth_error(e):
+                get_garmin_session_pool().invalidate(key)
+            raise
+
+    return run_chunk
+
+
+def _get_queue(training_db: TrainingDatabase) -> SyncJobQueue:
+    return get_sync_job_queue(training_db, _make_chunk_runner(training_db))
 
+
+def _job_response(job: SyncJobRecord) -> "SyncJobResponse":
     return SyncJobResponse(
-        job_id=job.job_id,
+        job_id=job.id,
         status=job.status.value,
         progress_percent=job.progress_percent,
         current_step=job.current_step,
         activities_synced=job.activities_synced,
         fitness_days_synced=job.fitness_days_synced,
-        created_at=job.created_at.isoformat(),
-        started_at=job.started_at.isoformat() if job.started_at else None,
-        completed_at=job.completed_at.isoformat() if job.completed_at else None,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
         error=job.error,
         result=job.result,
     )
 
 
-async def _do_garmin_sync_async(job: SyncJob, request: GarminSyncRequest, training_db: TrainingDatabase):
-    """Background task to perform the actual Garmin sync."""
-    import logging
-    import traceback
-    logger = logging.getLogger(__name__)
-
-    job.status = SyncJobStatus.RUNNING
-    job.started_at = datetime.now()
-    job.current_step = "Connecting to Garmin..."
-
-    try:
-        from garminconnect import Garmin, GarminConnectAuthenticationError
-    except ImportError:
-        job.status = SyncJobStatus.FAILED
-        job.error = "garminconnect library not installed"
-        job.completed_at = datetime.now()
-        return
-
-    try:
-        # Login (blocking call - run in thread)
-        job.current_step = "Connecting to Garmin..."
-        job.progress_percent = 2
-        await asyncio.sleep(0)  # Yield to allow polling to see progress
-
-        client = Garmin(request.email, request.password)
-
-        job.current_step = "Authenticating..."
-        job.progress_percent = 5
-        await asyncio.sleep(0)
+def resume_sync_jobs(training_db: TrainingDatabase) -> list:
+    """Restart sync jobs interrupted by a restart or deploy (call at startup)."""
+    queue = _get_queue(training_db)
+    queue.purge_finished()
+    return queue.resume_interrupted()
 
-        await asyncio.to_thread(client.login)
 
-        job.current_step = "Logged in successfully"
-        job.progress_percent = 10
-        await asyncio.sleep(0)
+@router.post("/sync-async", response_model=AsyncSyncResponse)
+async def sync_garmin_async(
+    request: GarminAsyncSyncRequest,
+    training_db: TrainingDatabase = Depends(get_training_db),
+):
+    """
+    Start a background Garmin sync and return a job ID.
 
-        # Fetch activities (blocking call - run in thread)
-        job.current_step = "Fetching activity list..."
-        job.progress_percent = 12
-        await asyncio.sleep(0)
+    Jobs are stored in the database and processed in date-window chunks,
+    so a long backfill survives a restart and continues where it stopped.
+    Repeating a request while the same sync is still running returns the
+    existing job.
 
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=request.days)
+    Track progress with /sync-status/{job_id} or stream it from
+    /sync-stream/{job_id}.
+    """
+    queue = _get_queue(training_db)
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=request.days - 1)
 
-        activities = await asyncio.to_thread(
-            client.get_activities_by_date,
-            start_date.strftime("%Y-%m-%d"),
-            end_date.strftime("%Y-%m-%d"),
-        )
+    job, created = queue.enqueue(
+        user_key=request.email.lower(),
+        credentials=SyncCredentials(email=request.email, password=request.password),
+        start_date=start_date,
+        end_date=end_date,
+    )
+    if created:
+        queue.start(job.id)
+        message = f"Sync started for {request.days} days."
+    else:
+        message = f"A sync for these {request.days} days is already {job.status.value}."
 
-        total_activities = len(activities) if activities else 0
-        job.current_step = f"Found {total_activities} activities"
-        job.progress_percent = 15
-        await asyncio.sleep(0)
-
-        # Process activities (15-75% range = 60% for activities)
-        new_count = 0
-        updated_count = 0
-        profile = training_db.get_user_profile()
-
-        for i, activity in enumerate(activities or []):
-            # Update progress more smoothly (15-75% for activities)
-            # Use (i+1) so progress updates after processing, not before
-            progress = 15 + int(((i + 1) / max(total_activities, 1)) * 60)
-            job.progress_percent = min(progress, 75)  # Cap at 75%
-            job.current_step = f"Processing activity {i+1}/{total_activities}..."
-            job.activities_synced = new_count + updated_count
-            await asyncio.sleep(0)  # Yield to allow polling to see progress
+    return AsyncSyncResponse(
+        job_id=job.id,
+        status=job.status.value,
+        message=f"{message} Poll /sync-status/{job.id} or stream /sync-stream/{job.id} for progress.",
+    )
 
-            try:
-                activity_id = str(activity.get("activityId"))
-                activity_type = activity.get("activityType", {}).get("typeKey", "unknown")
-                mapped_type = _map_garmin_activity_type(activity_type)
-
-                # Get activity details
-                start_time = activity.get("startTimeLocal")
-                activity_datetime = datetime.fromisoformat(start_time.replace("Z", "+00:00")) if start_time else datetime.now()
-                activity_name = activity.get("activityName", mapped_type.title())
-
-                # Metrics
-                avg_hr = activity.get("averageHR")
-                max_hr = activity.get("maxHR")
-                duration_sec = activity.get("duration")
-                distance_m = activity.get("distance")
-                elevation_gain = activity.get("elevationGain")
-                avg_speed = activity.get("averageSpeed")
-
-                # Convert units
-                distance_km = distance_m / 1000 if distance_m else None
-                duration_min = duration_sec / 60 if duration_sec else None
-                pace_sec_per_km = _calculate_pace(distance_m, duration_sec)
-                avg_speed_kmh = avg_speed * 3.6 if avg_speed else None
-
-                # Check existing
-                existing = training_db.get_activity_metrics(activity_id)
-
-                # Calculate HRSS/TRIMP
-                hrss = None
-                trimp = None
-                if avg_hr and duration_min and profile and profile.max_hr and profile.rest_hr:
-                    max_hr_for_calc = max_hr or profile.max_hr
-                    if profile.threshold_hr:
-                        hrss = calculate_hrss(
-                            duration_min=duration_min,
-                            avg_hr=int(avg_hr),
-                            threshold_hr=profile.threshold_hr,
-                            max_hr=max_hr_for_calc,
-                            rest_hr=profile.rest_hr,
-                        )
-                    trimp = calculate_trimp(
-                        duration_min=duration_min,
-                        avg_hr=int(avg_hr),
-                        rest_hr=profile.rest_hr,
-                        max_hr=max_hr_for_calc,
-                        gender=profile.gender or "male",
-                    )
 
-                # Save
-                metrics = ActivityMetrics(
-                    activity_id=activity_id,
-                    date=activity_datetime.strftime("%Y-%m-%d"),
-                    activity_type=mapped_type,
-                    activity_name=activity_name,
-                    hrss=hrss,
-                    trimp=trimp,
-                    avg_hr=int(avg_hr) if avg_hr else None,
-                    max_hr=int(max_hr) if max_hr else None,
-                    duration_min=duration_min,
-                    distance_km=distance_km,
-                    pace_sec_per_km=pace_sec_per_km,
-                    zone1_pct=None,  # Zone data not available from simple API
-                    zone2_pct=None,
-                    zone3_pct=None,
-                    zone4_pct=None,
-                    zone5_pct=None,
-                    start_time=activity_datetime.strftime("%Y-%m-%dT%H:%M:%S"),
-                    sport_type=activity_type,
-                    avg_speed_kmh=avg_speed_kmh,
-                    elevation_gain_m=elevation_gain,
-                )
-                await asyncio.to_thread(training_db.save_activity_metrics, metrics)
-
-                if existing:
-                    updated_count += 1
-                else:
-                    new_count += 1
+@router.get("/sync-status/{job_id}", response_model=SyncJobResponse)
+async def get_sync_status(
+    job_id: str,
+    training_db: TrainingDatabase = Depends(get_training_db),
+):
+    """
+    Get the status of an async sync job.
 
-            except Exception as e:
-                logger.warning(f"Error processing activity: {e}")
-                continue
+    Poll this endpoint every 1-2 seconds to track progress.
+    """
+    job = _get_queue(training_db).get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
 
-        job.activities_synced = new_count + updated_count
+    return _job_response(job)
 
-        # Sync fitness data (75-95%)
-        job.current_step = "Fetching fitness metrics..."
-        job.progress_percent = 78
-        await asyncio.sleep(0)  # Yield to allow polling to see progress
 
-        try:
-            job.current_step = "Syncing VO2 Max data..."
-            job.progress_percent = 82
-            await asyncio.sleep(0)
-
-            # Run fitness sync in thread (it uses blocking Garmin API calls)
-            fitness_new, fitness_updated, _ = await asyncio.to_thread(
-                _sync_fitness_data_internal,
-                client, training_db, request.days
-            )
-            job.fitness_days_synced = fitness_new + fitness_updated
+@router.get("/sync-stream/{job_id}")
+async def stream_sync_status(
+    job_id: str,
+    training_db: TrainingDatabase = Depends(get_training_db),
+):
+    """
+    Stream the progress of an async sync job as Server-Sent Events.
 
-            job.current_step = "Fitness data synced"
-            job.progress_percent = 95
-            await asyncio.sleep(0)
-        except Exception as e:
-            logger.warning(f"Failed to sync fitness data: {e}")
-
-        # Complete
-        job.current_step = "Finishing up..."
-        job.progress_percent = 98
-        await asyncio.sleep(0)
-
-        job.progress_percent = 100
-        job.current_step = "Sync complete!"
-        job.status = SyncJobStatus.COMPLETED
-        job.completed_at = datetime.now()
-        job.result = {
-            "synced_count": new_count + updated_count,
-            "new_activities": new_count,
-            "updated_activities": updated_count,
-            "fitness_days": job.fitness_days_synced,
-        }
+    Sends the job status each time it changes and closes the stream once
+    the job has completed or failed.
+    """
+    queue = _get_queue(training_db)
+    if not queue.get_job(job_id):
+        raise HTTPException(status_code=404, detail="Job not found or expired")
 
-    except GarminConnectAuthenticationError:
-        job.status = SyncJobStatus.FAILED
-        job.error = "Invalid Garmin Connect credentials"
-        job.completed_at = datetime.now()
-    except Exception as e:
-        logger.error(f"Async sync failed: {e}")
-        logger.error(traceback.format_exc())
-        job.status = SyncJobStatus.FAILED
-        job.error = str(e)
-        job.completed_at = datetime.now()
+    async def event_generator():
+        async for job in queue.stream(job_id):
+            yield f"data: {json.dumps(_job_response(job).model_dump())}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 class BackfillStartTimeResponse(BaseModel):
@@ -856,17 +834,16 @@ async def backfill_start_time(
     logger = logging.getLogger(__name__)
 
     try:
-        from garminconnect import Garmin, GarminConnectAuthenticationError
+        from garminconnect import GarminConnectAuthenticationError
     except ImportError:
         raise HTTPException(
             status_code=500,
             detail="garminconnect library not installed"
         )
 
-    # Authenticate with Garmin
+    # Authenticate with Garmin (or reuse an existing session)
     try:
-        client = Garmin(request.email, request.password)
-        client.login()
+        client = _get_garmin_client(request)
     except GarminConnectAuthenticationError:
         raise HTTPException(
             status_code=401,
@@ -909,6 +886,7 @@ async def backfill_start_time(
 
             start_index += BATCH_SIZE
     except Exception as e:
+        _drop_garmin_session(request, e)
         logger.error(f"Failed to fetch activities from Garmin: {e}")
         raise HTTPException(
             status_code=500,
@@ -991,17 +969,16 @@ async def sync_wellness(request: GarminSyncRequest):
     logger = logging.getLogger(__name__)
 
     try:
-        from garminconnect import Garmin, GarminConnectAuthenticationError
+        from garminconnect import GarminConnectAuthenticationError
     except ImportError:
         raise HTTPException(
             status_code=500,
             detail="garminconnect library not installed"
         )
 
-    # Login
+    # Login (or reuse an existing session)
     try:
-        client = Garmin(request.email, request.password)
-        client.login()
+        client = _get_garmin_client(request)
     except GarminConnectAuthenticationError:
         raise HTTPException(
             status_code=401,
@@ -1372,15 +1349,19 @@ class FitnessSyncResponse(BaseModel):
     synced_days: list[SyncedFitnessDay] = []
 
 
-def _sync_fitness_data_internal(client, training_db: TrainingDatabase, days: int) -> tuple:
+def _sync_fitness_data_internal(
+    client, training_db: TrainingDatabase, days: int, end_date=None
+) -> tuple:
     """
     Internal helper to sync fitness data from Garmin.
+
+    Syncs the `days` days ending at end_date (default: today).
     Returns (new_days, updated_days, synced_days_list).
     """
     import logging
     logger = logging.getLogger(__name__)
 
-    end_date = datetime.now().date()
+    end_date = end_date or datetime.now().date()
     synced_days = []
     new_days = 0
     updated_days = 0
@@ -1509,17 +1490,16 @@ async def sync_fitness(
     logger = logging.getLogger(__name__)
 
     try:
-        from garminconnect import Garmin, GarminConnectAuthenticationError
+        from garminconnect import GarminConnectAuthenticationError
     except ImportError:
         raise HTTPException(
             status_code=500,
             detail="garminconnect library not installed. Run: pip install garminconnect"
         )
 
-    # Login
+    # Login (or reuse an existing session)
     try:
-        client = Garmin(request.email, request.password)
-        client.login()
+        client = _get_garmin_client(request)
     except GarminConnectAuthenticationError:
         raise HTTPException(
             status_code=401,
@@ -16,6 +16,7 @@ from ...metrics.vdot import (
     calculate_vdot,
     get_pace_zones,
     predict_race_times,
+    predict_performances,
     calculate_vdot_from_race,
     parse_race_time,
     pace_km_to_mile,
@@ -108,6 +109,34 @@ class SavePaceZonesRequest(BaseModel):
     )
 
 
+class BatchPredictionsRequest(BaseModel):
+    """Request for zones and predictions for many VDOT values."""
+    vdots: List[float] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="VDOT values, e.g. one per athlete or per date",
+    )
+    distances_m: Optional[Dict[str, float]] = Field(
+        None,
+        description="Race name to distance in meters (defaults to 5K, 10K, half, marathon)",
+    )
+
+    @field_validator('vdots')
+    @classmethod
+    def validate_vdots(cls, v):
+        if any(not 25 <= vdot <= 90 for vdot in v):
+            raise ValueError("VDOT values must be between 25 and 90")
+        return v
+
+    @field_validator('distances_m')
+    @classmethod
+    def validate_distances(cls, v):
+        if v is not None and any(not 100 <= d <= 100000 for d in v.values()):
+            raise ValueError("Distances must be between 100 and 100000 meters")
+        return v
+
+
 class UserPaceZonesResponse(BaseModel):
     """User's saved pace zones."""
     vdot: float
@@ -422,6 +451,38 @@ async def get_zones_from_vdot(
         )
 
 
+@router.post("/predictions/batch")
+async def get_batch_predictions(
+    request: BatchPredictionsRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    Get pace zones and race predictions for many VDOT values in one call.
+
+    Results are returned in the order of the requested VDOT values.
+
+    **Requires authentication.**
+    """
+    results = predict_performances(request.vdots, request.distances_m)
+
+    return {
+        "results": [
+            {
+                "vdot": result["vdot"],
+                "pace_zones": {
+                    name: _pace_zone_to_response(name, zone)
+                    for name, zone in result["pace_zones"].items()
+                },
+                "race_predictions": [
+                    _prediction_to_response(name, pred_data)
+                    for name, pred_data in result["race_predictions"].items()
+                ],
+            }
+            for result in results
+        ],
+    }
+
+
 @router.get("/race-equivalents")
 async def get_race_equivalents(
     distance: str = Query(..., description="Race distance (5K, 10K, half, marathon)"),
@@ -11,6 +11,7 @@ from ...models.patterns import (
     CorrelationAnalysis,
     FitnessPrediction,
     PerformanceCorrelations,
+    TaperExplorer,
     TimingAnalysis,
     TSBOptimalRange,
 )
@@ -179,6 +180,71 @@ async def get_peak_fitness_prediction(
         )
 
 
+@router.get("/taper-scenarios", response_model=TaperExplorer)
+async def get_taper_scenarios(
+    target_date: str = Query(
+        ...,
+        description="Race date (YYYY-MM-DD format)"
+    ),
+    build_pct_per_week: float = Query(
+        default=0.0,
+        ge=0.0,
+        le=15.0,
+        description="Weekly load increase before the taper (percent)"
+    ),
+    current_user: CurrentUser = Depends(get_current_user),
+    pattern_service: PatternRecognitionService = Depends(get_pattern_service),
+):
+    """
+    Project taper what-if scenarios into a race.
+
+    Returns race-day CTL/TSB, peak date and daily trajectories for every
+    combination of taper length, load reduction and taper shape, so the
+    UI can explore them without a request per change.
+
+    Args:
+        target_date: Race date in YYYY-MM-DD format
+        build_pct_per_week: Weekly load increase before the taper (0-15%)
+
+    Returns:
+        TaperExplorer with one result per scenario and a recommendation
+    """
+    user_id = current_user.id
+
+    try:
+        parsed_target_date = date.fromisoformat(target_date)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid date format. Use YYYY-MM-DD"
+        )
+    days_to_race = (parsed_target_date - date.today()).days
+    if days_to_race <= 0:
+        raise HTTPException(
+            status_code=400,
+            detail="Target date must be in the future"
+        )
+    if days_to_race > 365:
+        raise HTTPException(
+            status_code=400,
+            detail="Target date must be within a year"
+        )
+
+    try:
+        return pattern_service.explore_tapers(
+            user_id=user_id,
+            target_date=parsed_target_date,
+            build_pct_per_week=build_pct_per_week,
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to project taper scenarios for user {user_id}: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to project taper scenarios. Please try again later."
+        )
+
+
 @router.get("/correlations", response_model=PerformanceCorrelations)
 async def get_performance_correlations(
     days: int = Query(default=180, ge=60, le=365, description="Number of days to analyze"),
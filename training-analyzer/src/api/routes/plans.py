@@ -1,11 +1,12 @@
 """Training plan generation and management API routes."""
 
 from datetime import date, datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import json
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, field_validator
 
 from ..deps import get_coach_service, get_training_db, get_plan_repository, get_consent_service_dep, get_current_user, CurrentUser
 from ...models.plans import (
@@ -28,8 +29,12 @@ from ...models.plans import (
     parse_time_string,
     day_name_to_number,
 )
-from ...agents.plan_agent import PlanAgent, PlanGenerationError
+from ...agents.errors import PlanGenerationError
 from ...db.repositories.plan_repository import PlanRepository
+from ...utils.lazy_import import lazy_import
+
+# The plan agent (LangGraph + LLM SDKs) loads on first use
+PlanAgent = lazy_import("...agents.plan_agent", "PlanAgent", __package__)
 
 
 router = APIRouter()
@@ -76,6 +81,29 @@ class UpdatePlanRequest(BaseModel):
     weeks: Optional[List[Dict[str, Any]]] = None
 
 
+class UpdateSessionRequest(BaseModel):
+    """Request to update one planned session."""
+    day_of_week: Optional[int] = Field(None, ge=0, le=6)
+    workout_type: Optional[WorkoutType] = None
+    description: Optional[str] = None
+    target_duration_min: Optional[int] = Field(None, ge=0)
+    target_load: Optional[float] = Field(None, ge=0)
+    target_pace: Optional[str] = None
+    target_hr_zone: Optional[str] = None
+    intervals: Optional[List[Dict[str, Any]]] = None
+    notes: Optional[str] = None
+
+    @field_validator(
+        'day_of_week', 'workout_type', 'description', 'target_duration_min', 'target_load'
+    )
+    @classmethod
+    def validate_not_null(cls, v):
+        # These may be left out, but every session must keep a value
+        if v is None:
+            raise ValueError("may be omitted but not set to null")
+        return v
+
+
 class AdaptPlanRequest(BaseModel):
     """Request to adapt a training plan based on performance."""
     reason: Optional[str] = Field(None, description="Reason for adaptation")
@@ -190,6 +218,67 @@ def _get_athlete_context(coach_service, training_db) -> AthleteContext:
         )
 
 
+def _parse_generate_request(request: GeneratePlanRequest) -> Tuple[RaceGoal, PlanConstraints]:
+    """
+    Build the goal and constraints for a generation request.
+
+    Raises:
+        HTTPException: 400 if the race date is out of range
+        ValueError: If the target time or a day name cannot be parsed
+    """
+    # Parse goal
+    race_date = datetime.strptime(request.goal.race_date, "%Y-%m-%d").date()
+    weeks_until_race = (race_date - date.today()).days // 7
+
+    if weeks_until_race < 1:
+        raise HTTPException(
+            status_code=400,
+            detail="Race date must be at least 1 week away"
+        )
+
+    if weeks_until_race > 52:
+        raise HTTPException(
+            status_code=400,
+            detail="Race date too far in future (max 52 weeks)"
+        )
+
+    # Parse distance
+    distance_map = {
+        "5k": RaceDistance.FIVE_K,
+        "10k": RaceDistance.TEN_K,
+        "half": RaceDistance.HALF_MARATHON,
+        "half_marathon": RaceDistance.HALF_MARATHON,
+        "marathon": RaceDistance.MARATHON,
+        "ultra": RaceDistance.ULTRA,
+    }
+    distance = distance_map.get(request.goal.distance.lower(), RaceDistance.CUSTOM)
+
+    # Parse target time
+    target_seconds = parse_time_string(request.goal.target_time)
+
+    # Create goal object
+    goal = RaceGoal(
+        race_date=race_date,
+        distance=distance,
+        target_time_seconds=target_seconds,
+        race_name=request.goal.race_name,
+        priority=request.goal.priority,
+    )
+
+    # Create constraints
+    constraints = PlanConstraints(
+        days_per_week=request.constraints.days_per_week,
+        long_run_day=day_name_to_number(request.constraints.long_run_day),
+        rest_days=[day_name_to_number(d) for d in request.constraints.rest_days],
+        max_weekly_hours=request.constraints.max_weekly_hours,
+        max_session_duration_min=request.constraints.max_session_duration_min,
+        include_cross_training=request.constraints.include_cross_training,
+        back_to_back_hard_ok=request.constraints.back_to_back_hard_ok,
+    )
+
+    return goal, constraints
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -225,55 +314,7 @@ async def generate_plan(
         )
 
     try:
-        # Parse goal
-        race_date = datetime.strptime(request.goal.race_date, "%Y-%m-%d").date()
-        weeks_until_race = (race_date - date.today()).days // 7
-
-        if weeks_until_race < 1:
-            raise HTTPException(
-                status_code=400,
-                detail="Race date must be at least 1 week away"
-            )
-
-        if weeks_until_race > 52:
-            raise HTTPException(
-                status_code=400,
-                detail="Race date too far in future (max 52 weeks)"
-            )
-
-        # Parse distance
-        distance_map = {
-            "5k": RaceDistance.FIVE_K,
-            "10k": RaceDistance.TEN_K,
-            "half": RaceDistance.HALF_MARATHON,
-            "half_marathon": RaceDistance.HALF_MARATHON,
-            "marathon": RaceDistance.MARATHON,
-            "ultra": RaceDistance.ULTRA,
-        }
-        distance = distance_map.get(request.goal.distance.lower(), RaceDistance.CUSTOM)
-
-        # Parse target time
-        target_seconds = parse_time_string(request.goal.target_time)
-
-        # Create goal object
-        goal = RaceGoal(
-            race_date=race_date,
-            distance=distance,
-            target_time_seconds=target_seconds,
-            race_name=request.goal.race_name,
-            priority=request.goal.priority,
-        )
-
-        # Create constraints
-        constraints = PlanConstraints(
-            days_per_week=request.constraints.days_per_week,
-            long_run_day=day_name_to_number(request.constraints.long_run_day),
-            rest_days=[day_name_to_number(d) for d in request.constraints.rest_days],
-            max_weekly_hours=request.constraints.max_weekly_hours,
-            max_session_duration_min=request.constraints.max_session_duration_min,
-            include_cross_training=request.constraints.include_cross_training,
-            back_to_back_hard_ok=request.constraints.back_to_back_hard_ok,
-        )
+        goal, constraints = _parse_generate_request(request)
 
         # Get athlete context
         athlete_context = _get_athlete_context(coach_service, training_db)
@@ -308,52 +349,129 @@ async def generate_plan(
         )
 
 
+@router.post("/generate/stream")
+async def stream_generate_plan(
+    request: GeneratePlanRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    coach_service=Depends(get_coach_service),
+    training_db=Depends(get_training_db),
+    plan_repo: PlanRepository = Depends(get_plan_repository),
+):
+    """
+    Generate a training plan, streaming weeks as Server-Sent Events.
+
+    Week blocks are generated concurrently; each finished block's weeks are
+    saved to the plan (without rewriting earlier weeks) and sent as it
+    completes. If a block fails every retry, the
+    weeks that did finish stay saved under the plan ID in the error event.
+
+    SSE Format:
+        data: {"type": "weeks", "plan_id": "...", "week_numbers": [5, 6, 7, 8],
+               "completed_weeks": 8, "total_weeks": 16, "weeks": [...]}
+
+        data: {"type": "done", "plan": {...}}
+
+        data: {"type": "error", "plan_id": "...", "completed_weeks": 12, "message": "..."}
+    """
+    user_id = current_user.id
+    consent_service = get_consent_service_dep()
+    if not consent_service.check_llm_consent(user_id):
+        raise HTTPException(
+            status_code=403,
+            detail="LLM data sharing consent required. Please accept the data sharing agreement to use AI features."
+        )
+
+    try:
+        goal, constraints = _parse_generate_request(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    athlete_context = _get_athlete_context(coach_service, training_db)
+
+    async def event_generator():
+        plan = None
+        try:
+            async for event in PlanAgent().stream_plan(goal, athlete_context, constraints):
+                plan = event["plan"]
+                if event["type"] == "done":
+                    # Every week was written with its block; refresh the header
+                    plan_repo.save_weeks(plan, [])
+                    yield f"data: {json.dumps({'type': 'done', 'plan': plan.to_dict()})}\n\n"
+                    continue
+                weeks = [
+                    week.to_dict()
+                    for week in plan.weeks
+                    if week.week_number in event["week_numbers"]
+                ]
+                data = {
+                    "type": "weeks",
+                    "plan_id": plan.id,
+                    "week_numbers": event["week_numbers"],
+                    "completed_weeks": event["completed_weeks"],
+                    "total_weeks": event["total_weeks"],
+                    "weeks": weeks,
+                }
+                plan_repo.save_weeks(plan, event["week_numbers"])
+                yield f"data: {json.dumps(data)}\n\n"
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Plan generation failed: {e}")
+            data = {
+                "type": "error",
+                "plan_id": plan.id if plan else None,
+                "completed_weeks": len(plan.weeks) if plan else 0,
+                "message": "Plan generation failed. Please try again later.",
+            }
+            yield f"data: {json.dumps(data)}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("", response_model=Dict[str, Any])
 async def list_plans(
     active_only: bool = False,
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
     plan_repo: PlanRepository = Depends(get_plan_repository),
 ):
     """
     List all training plans.
 
     Plans are persisted in SQLite for durability across server restarts.
+    Pass the returned `next_cursor` as `cursor` to fetch the next page; cursor
+    pages skip the total count so they cost the same at any depth.
 
     Args:
         active_only: Only return active plans
         limit: Maximum number of plans to return
-        offset: Number of plans to skip
+        offset: Number of plans to skip (ignored when a cursor is given)
+        cursor: Position returned with the previous page
     """
-    # Get plans from the repository
-    plans = plan_repo.get_all_as_dicts(limit=limit, offset=offset, active_only=active_only)
-    total = plan_repo.count(active_only=active_only)
-
-    # Return summary format
-    summaries = []
-    for plan in plans:
-        summaries.append({
-            "id": plan["id"],
-            "name": plan.get("name"),
-            "goal": {
-                "race_date": plan["goal"]["race_date"],
-                "distance": plan["goal"]["distance"],
-                "target_time": plan["goal"]["target_time_formatted"],
-            },
-            "periodization": plan["periodization"],
-            "total_weeks": plan["total_weeks"],
-            "phases_summary": plan["phases_summary"],
-            "is_active": plan.get("is_active", False),
-            "created_at": plan["created_at"],
-        })
+    try:
+        summaries, next_cursor = plan_repo.list_summaries(
+            limit=limit, cursor=cursor, offset=offset, active_only=active_only
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return {
+    response = {
         "plans": summaries,
         "count": len(summaries),
-        "total": total,
         "offset": offset,
         "limit": limit,
+        "next_cursor": next_cursor,
     }
+    if cursor is None:
+        response["total"] = plan_repo.count(active_only=active_only)
+    return response
 
 
 @router.get("/active", response_model=Dict[str, Any])
@@ -417,15 +535,12 @@ async def get_plan_week(
     """
     Get a specific week from a training plan.
     """
-    plan_data = plan_repo.get_as_dict(plan_id)
-    if not plan_data:
-        raise HTTPException(status_code=404, detail=f"Plan {plan_id} not found")
-
-    weeks = plan_data.get("weeks", [])
+    week = plan_repo.get_week(plan_id, week_number)
+    if week:
+        return week.to_dict()
 
-    for week in weeks:
-        if week["week_number"] == week_number:
-            return week
+    if not plan_repo.exists(plan_id):
+        raise HTTPException(status_code=404, detail=f"Plan {plan_id} not found")
 
     raise HTTPException(
         status_code=404,
@@ -433,6 +548,31 @@ async def get_plan_week(
     )
 
 
+@router.patch("/{plan_id}/week/{week_number}/sessions/{session_index}", response_model=Dict[str, Any])
+async def update_plan_session(
+    plan_id: str,
+    week_number: int,
+    session_index: int,
+    request: UpdateSessionRequest,
+    plan_repo: PlanRepository = Depends(get_plan_repository),
+):
+    """
+    Update one session of a training plan.
+
+    Only the given fields change; the rest of the plan is not rewritten.
+    `session_index` is the session's position within the week, starting at 0.
+    """
+    fields = request.model_dump(exclude_unset=True)
+    session = plan_repo.update_session(plan_id, week_number, session_index, **fields)
+    if not session:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Session {session_index} of week {week_number} not found in plan {plan_id}"
+        )
+
+    return session.to_dict()
+
+
 @router.put("/{plan_id}", response_model=PlanOutput)
 async def update_plan(
     plan_id: str,
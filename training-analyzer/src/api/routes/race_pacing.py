@@ -1,16 +1,18 @@
 """Race pacing API routes.
 
-Endpoints for generating race pacing plans, calculating weather adjustments,
+Endpoints for generating race pacing plans (from a target time, a GPX/FIT
+course file or a stored activity), calculating weather adjustments,
 and retrieving available pacing strategies.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from ..deps import get_current_user, CurrentUser
+from ..deps import get_current_user, get_training_db, CurrentUser
 from ...models.race_pacing import (
+    ActivityPacingPlanRequest,
     PacingPlan,
     PacingStrategy,
     RaceDistance,
@@ -102,6 +104,149 @@ async def generate_pacing_plan(
         )
 
 
+def _race_distance_km(
+    race_distance: RaceDistance,
+    distance_km: Optional[float],
+) -> Optional[float]:
+    """Resolve the race distance, or None for a custom race without a distance."""
+    if race_distance == RaceDistance.CUSTOM:
+        return distance_km
+    resolved = RACE_DISTANCES_KM.get(race_distance)
+    if not resolved:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown race distance: {race_distance}"
+        )
+    return resolved
+
+
+@router.post("/pacing-plan/course", response_model=PacingPlan)
+async def generate_course_pacing_plan(
+    request: Request,
+    filename: str = Query(..., description="Course file name or format (gpx or fit)"),
+    target_time_sec: float = Query(..., gt=0, description="Target finish time in seconds"),
+    race_distance: RaceDistance = Query(RaceDistance.CUSTOM, description="Race distance category"),
+    distance_km: Optional[float] = Query(
+        None, gt=0, description="Race distance in km (defaults to the course length for custom races)"
+    ),
+    race_name: Optional[str] = Query(None, description="Optional race name"),
+    strategy: Optional[PacingStrategy] = Query(None, description="Preferred strategy"),
+    split_unit: str = Query("km", pattern="^(100m|km|mile)$", description="Split unit"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    Generate a pacing plan over a course recorded in a GPX or FIT file.
+
+    The file is sent as the raw request body. Its track is smoothed once and
+    graded per split; when the race distance differs from the recorded
+    length the course is stretched to fit.
+
+    Returns:
+        PacingPlan with elevation-adjusted splits
+    """
+    logger.info(
+        f"[generate_course_pacing_plan] User {current_user.id} requesting pacing plan "
+        f"from course file {filename}"
+    )
+
+    data = await request.body()
+    if not data:
+        raise HTTPException(status_code=400, detail="Course file is empty")
+
+    service = get_race_pacing_service()
+
+    try:
+        race_km = _race_distance_km(race_distance, distance_km)
+        course = service.load_course_file(data, filename, distance_km=race_km)
+
+        plan = service.generate_pacing_plan(
+            target_time_sec=target_time_sec,
+            distance_km=race_km or course.total_distance_km,
+            race_distance=race_distance,
+            race_name=race_name,
+            strategy=strategy,
+            split_unit=split_unit,
+            course=course,
+        )
+
+        logger.info(
+            f"[generate_course_pacing_plan] Generated plan with {len(plan.splits)} splits "
+            f"over {course.total_distance_km:.2f}km"
+        )
+
+        return plan
+
+    except ValueError as e:
+        logger.warning(f"[generate_course_pacing_plan] Validation error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[generate_course_pacing_plan] Error generating plan: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to generate pacing plan. Please try again."
+        )
+
+
+@router.post("/pacing-plan/activity/{activity_id}", response_model=PacingPlan)
+async def generate_activity_pacing_plan(
+    activity_id: str,
+    request: ActivityPacingPlanRequest,
+    current_user: CurrentUser = Depends(get_current_user),
+    training_db=Depends(get_training_db),
+):
+    """
+    Generate a pacing plan over the course of a stored activity.
+
+    Uses the activity's stored elevation and speed streams, so only
+    activities imported with their streams (e.g. from Strava) qualify.
+
+    Returns:
+        PacingPlan with elevation-adjusted splits
+    """
+    logger.info(
+        f"[generate_activity_pacing_plan] User {current_user.id} requesting pacing plan "
+        f"over activity {activity_id}"
+    )
+
+    service = get_race_pacing_service()
+
+    try:
+        race_km = _race_distance_km(request.race_distance, request.distance_km)
+        course = service.load_activity_course(training_db, activity_id, distance_km=race_km)
+        if course is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No stored course data for activity {activity_id}"
+            )
+
+        plan = service.generate_pacing_plan(
+            target_time_sec=request.target_time_sec,
+            distance_km=race_km or course.total_distance_km,
+            race_distance=request.race_distance,
+            race_name=request.race_name,
+            weather_conditions=request.weather_conditions,
+            strategy=request.strategy,
+            split_unit=request.split_unit,
+            course=course,
+        )
+
+        return plan
+
+    except ValueError as e:
+        logger.warning(f"[generate_activity_pacing_plan] Validation error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[generate_activity_pacing_plan] Error generating plan: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to generate pacing plan. Please try again."
+        )
+
+
 @router.post("/weather-adjustment", response_model=WeatherAdjustment)
 async def calculate_weather_adjustment(
     request: WeatherAdjustmentRequest,
@@ -20,6 +20,8 @@ from ...models.recovery import (
     RecoveryModuleData,
     RecoveryModuleResponse,
     RecoveryModuleRequest,
+    RecoveryReadinessResponse,
+    WellnessSnapshot,
 )
 from ...services.recovery_module_service import get_recovery_service
 
@@ -32,6 +34,104 @@ logger = logging.getLogger(__name__)
 # Helper Functions
 # =============================================================================
 
+# Longest lookback any recovery view needs (HRV baseline)
+RECOVERY_WINDOW_DAYS = 45
+
+
+def _parse_record_date(value) -> date:
+    """Wellness rows store dates as ISO strings."""
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
+def _load_wellness_window(db: TrainingDatabase, days: int = RECOVERY_WINDOW_DAYS) -> dict:
+    """
+    Load sleep, HRV, stress and resting HR for the window in one pass.
+
+    Every recovery calculation slices this in-memory window instead of
+    re-querying the wellness tables.
+    """
+    try:
+        return db.get_wellness_data(days=days)
+    except Exception as e:
+        logger.warning(f"Failed to load wellness data: {e}")
+        return {}
+
+
+def _sleep_records_from_wellness(wellness: dict, days: int = 30) -> List[SleepRecord]:
+    """Build sleep records for the last `days` days of a wellness window."""
+    cutoff = date.today() - timedelta(days=days)
+    sleep_records = []
+    for record in wellness.get("sleep", []):
+        if record.total_sleep_seconds is not None and record.total_sleep_seconds > 0:
+            record_date = _parse_record_date(record.date)
+            if record_date < cutoff:
+                continue
+
+            sleep_record = SleepRecord(
+                date=record_date,
+                duration_hours=record.total_sleep_seconds / 3600,
+                quality_score=record.sleep_score,
+                deep_sleep_hours=(record.deep_sleep_seconds or 0) / 3600,
+                rem_sleep_hours=(record.rem_sleep_seconds or 0) / 3600,
+                light_sleep_hours=(record.light_sleep_seconds or 0) / 3600,
+                awake_time_hours=(record.awake_seconds or 0) / 3600,
+            )
+            sleep_records.append(sleep_record)
+
+    return sorted(sleep_records, key=lambda r: r.date)
+
+
+def _hrv_records_from_wellness(wellness: dict, days: int = 30) -> List[HRVRecord]:
+    """Build HRV records for the last `days` days of a wellness window."""
+    cutoff = date.today() - timedelta(days=days)
+    hrv_records = []
+    for record in wellness.get("hrv", []):
+        # Use last_night_avg as the primary HRV value (RMSSD equivalent)
+        rmssd = record.hrv_last_night_avg or record.hrv_weekly_avg
+        if rmssd is not None and rmssd > 0:
+            record_date = _parse_record_date(record.date)
+            if record_date < cutoff:
+                continue
+
+            hrv_record = HRVRecord(
+                date=record_date,
+                rmssd=float(rmssd),
+                sdnn=None,  # Not provided by Garmin
+                lf_power=None,  # Not provided by Garmin
+                hf_power=None,  # Not provided by Garmin
+                lf_hf_ratio=None,  # Not provided by Garmin
+            )
+            hrv_records.append(hrv_record)
+
+    return sorted(hrv_records, key=lambda r: r.date)
+
+
+def _wellness_snapshot(wellness: dict) -> Optional[WellnessSnapshot]:
+    """Summarize the latest stress/Body Battery and resting HR readings."""
+    stress = wellness.get("stress") or []
+    resting = [r for r in wellness.get("resting_hr") or [] if r.resting_hr]
+    if not stress and not resting:
+        return None
+
+    # Range queries return newest first
+    latest_stress = stress[0] if stress else None
+    cutoff = date.today() - timedelta(days=7)
+    recent_rhr = [r.resting_hr for r in resting if _parse_record_date(r.date) >= cutoff]
+
+    return WellnessSnapshot(
+        date=_parse_record_date(latest_stress.date) if latest_stress else None,
+        avg_stress_level=latest_stress.avg_stress_level if latest_stress else None,
+        body_battery_high=latest_stress.body_battery_high if latest_stress else None,
+        body_battery_low=latest_stress.body_battery_low if latest_stress else None,
+        body_battery_charged=latest_stress.body_battery_charged if latest_stress else None,
+        body_battery_drained=latest_stress.body_battery_drained if latest_stress else None,
+        resting_hr=resting[0].resting_hr if resting else None,
+        resting_hr_7d_avg=round(sum(recent_rhr) / len(recent_rhr), 1) if recent_rhr else None,
+    )
+
+
 def _get_sleep_records_from_db(
     db: TrainingDatabase,
     days: int = 30,
@@ -42,28 +142,7 @@ def _get_sleep_records_from_db(
     This retrieves sleep data from Garmin wellness data.
     """
     try:
-        # Get wellness data which includes sleep
-        wellness_data = db.get_wellness_data(days=days)
-
-        sleep_records = []
-        for record in wellness_data.get("sleep", []):
-            if record.total_sleep_seconds is not None and record.total_sleep_seconds > 0:
-                record_date = record.date
-                if isinstance(record_date, str):
-                    record_date = date.fromisoformat(record_date)
-
-                sleep_record = SleepRecord(
-                    date=record_date,
-                    duration_hours=record.total_sleep_seconds / 3600,
-                    quality_score=record.sleep_score,
-                    deep_sleep_hours=(record.deep_sleep_seconds or 0) / 3600,
-                    rem_sleep_hours=(record.rem_sleep_seconds or 0) / 3600,
-                    light_sleep_hours=(record.light_sleep_seconds or 0) / 3600,
-                    awake_time_hours=(record.awake_seconds or 0) / 3600,
-                )
-                sleep_records.append(sleep_record)
-
-        return sorted(sleep_records, key=lambda r: r.date)
+        return _sleep_records_from_wellness(_load_wellness_window(db, days), days)
     except Exception as e:
         logger.warning(f"Failed to get sleep records: {e}")
         return []
@@ -79,28 +158,7 @@ def _get_hrv_records_from_db(
     This retrieves HRV data from Garmin wellness data.
     """
     try:
-        wellness_data = db.get_wellness_data(days=days)
-
-        hrv_records = []
-        for record in wellness_data.get("hrv", []):
-            # Use last_night_avg as the primary HRV value (RMSSD equivalent)
-            rmssd = record.hrv_last_night_avg or record.hrv_weekly_avg
-            if rmssd is not None and rmssd > 0:
-                record_date = record.date
-                if isinstance(record_date, str):
-                    record_date = date.fromisoformat(record_date)
-
-                hrv_record = HRVRecord(
-                    date=record_date,
-                    rmssd=float(rmssd),
-                    sdnn=None,  # Not provided by Garmin
-                    lf_power=None,  # Not provided by Garmin
-                    hf_power=None,  # Not provided by Garmin
-                    lf_hf_ratio=None,  # Not provided by Garmin
-                )
-                hrv_records.append(hrv_record)
-
-        return sorted(hrv_records, key=lambda r: r.date)
+        return _hrv_records_from_wellness(_load_wellness_window(db, days), days)
     except Exception as e:
         logger.warning(f"Failed to get HRV records: {e}")
         return []
@@ -184,8 +242,9 @@ async def get_recovery_data(
         recovery_service = get_recovery_service()
 
         # Fetch data from database
-        sleep_records = _get_sleep_records_from_db(training_db, days=30) if include_sleep_debt else None
-        hrv_records = _get_hrv_records_from_db(training_db, days=30) if include_hrv_trend else None
+        wellness = _load_wellness_window(training_db, days=30) if (include_sleep_debt or include_hrv_trend) else {}
+        sleep_records = _sleep_records_from_wellness(wellness, days=30) if include_sleep_debt else None
+        hrv_records = _hrv_records_from_wellness(wellness, days=30) if include_hrv_trend else None
         last_workout = _get_last_workout_info(training_db) if include_recovery_time else None
         fitness_state = _get_current_fitness_state(coach_service)
 
@@ -212,6 +271,57 @@ async def get_recovery_data(
         )
 
 
+@router.get("/readiness", response_model=RecoveryReadinessResponse)
+async def get_recovery_readiness(
+    sleep_target_hours: float = Query(8.0, ge=4.0, le=12.0, description="Target sleep hours"),
+    current_user: CurrentUser = Depends(get_current_user),
+    training_db: TrainingDatabase = Depends(get_training_db),
+    coach_service=Depends(get_coach_service),
+):
+    """
+    Get the full recovery dashboard in one request.
+
+    Loads sleep, HRV, stress/Body Battery and resting HR for the longest
+    lookback once and derives every component from that window:
+    - Sleep debt (30 days)
+    - HRV trend (45 days, for a stable baseline)
+    - Recovery time for the last workout
+    - Latest stress, Body Battery and resting HR
+    """
+    try:
+        recovery_service = get_recovery_service()
+
+        wellness = _load_wellness_window(training_db, days=RECOVERY_WINDOW_DAYS)
+        sleep_records = _sleep_records_from_wellness(wellness, days=30)
+        hrv_records = _hrv_records_from_wellness(wellness, days=RECOVERY_WINDOW_DAYS)
+        last_workout = _get_last_workout_info(training_db)
+        fitness_state = _get_current_fitness_state(coach_service)
+
+        recovery_data = recovery_service.get_full_recovery_data(
+            sleep_records=sleep_records,
+            hrv_records=hrv_records,
+            last_workout=last_workout,
+            current_tsb=fitness_state.get("tsb"),
+            vo2max=fitness_state.get("vo2max"),
+            target_sleep_hours=sleep_target_hours,
+        )
+        snapshot = _wellness_snapshot(wellness)
+
+        return RecoveryReadinessResponse(
+            success=True,
+            data=recovery_data,
+            wellness=snapshot,
+            has_data=bool(sleep_records or hrv_records or snapshot),
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to get recovery readiness: {e}")
+        return RecoveryReadinessResponse(
+            success=False,
+            error=f"Failed to calculate recovery readiness: {str(e)}",
+        )
+
+
 @router.get("/sleep-debt", response_model=SleepDebtResponse)
 async def get_sleep_debt(
     target_hours: float = Query(8.0, ge=4.0, le=12.0, description="Target sleep hours"),
@@ -355,8 +465,9 @@ async def get_recovery_time_estimate(
                 )
 
         # Get supporting data
-        sleep_records = _get_sleep_records_from_db(training_db, days=7)
-        hrv_records = _get_hrv_records_from_db(training_db, days=30)
+        wellness = _load_wellness_window(training_db, days=30)
+        sleep_records = _sleep_records_from_wellness(wellness, days=7)
+        hrv_records = _hrv_records_from_wellness(wellness, days=30)
         fitness_state = _get_current_fitness_state(coach_service)
 
         # Calculate sleep debt
@@ -411,8 +522,9 @@ async def get_recovery_score(
         recovery_service = get_recovery_service()
 
         # Fetch data
-        sleep_records = _get_sleep_records_from_db(training_db, days=7)
-        hrv_records = _get_hrv_records_from_db(training_db, days=30)
+        wellness = _load_wellness_window(training_db, days=30)
+        sleep_records = _sleep_records_from_wellness(wellness, days=7)
+        hrv_records = _hrv_records_from_wellness(wellness, days=30)
         fitness_state = _get_current_fitness_state(coach_service)
 
         # Calculate recovery data
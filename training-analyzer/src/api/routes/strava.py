@@ -4,11 +4,11 @@ Uses StravaRepository for credential storage with encryption at rest.
 OAuth tokens are automatically encrypted when saved and decrypted when retrieved.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
@@ -18,8 +18,10 @@ from ...db.database import TrainingDatabase
 from ...db.repositories.strava_repository import StravaRepository, get_strava_repository
 from ...integrations.strava import StravaOAuthFlow, StravaClient
 from ...integrations.base import OAuthCredentials, AuthenticationError
-from ...models.strava import StravaCredentials as StravaCredentialsModel
+from ...integrations.http_pool import get_http_pool
+from ...models.strava import StravaCredentials as StravaCredentialsModel, SyncStatus
 from ...services.encryption import CredentialEncryptionError
+from ...services.strava_import_service import StravaImportService
 
 logger = logging.getLogger(__name__)
 
@@ -267,12 +269,12 @@ def _save_preferences(
 
 
 
-async def _refresh_token_if_needed(
+async def _refresh_credentials(
     strava_repo: StravaRepository,
     credentials: OAuthCredentials,
     user_id: str = "default"
 ) -> OAuthCredentials:
-    """Refresh token if expired or about to expire.
+    """Refresh a Strava token and save the new credentials.
 
     Args:
         strava_repo: The Strava repository instance
@@ -280,53 +282,79 @@ async def _refresh_token_if_needed(
         user_id: User identifier (defaults to 'default')
 
     Returns:
-        Refreshed OAuthCredentials (or original if no refresh needed)
+        Refreshed OAuthCredentials
 
     Raises:
         AuthenticationError: If token refresh fails with Strava
         HTTPException: If encryption fails when saving new tokens
     """
-    if not credentials.needs_refresh:
-        return credentials
-
     settings = get_settings()
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://www.strava.com/oauth/token",
-            data={
-                "client_id": settings.strava_client_id,
-                "client_secret": settings.strava_client_secret,
-                "refresh_token": credentials.refresh_token,
-                "grant_type": "refresh_token",
-            }
+    client = get_http_pool("strava").get_client()
+    response = await client.post(
+        "https://www.strava.com/oauth/token",
+        data={
+            "client_id": settings.strava_client_id,
+            "client_secret": settings.strava_client_secret,
+            "refresh_token": credentials.refresh_token,
+            "grant_type": "refresh_token",
+        }
+    )
+
+    if response.status_code != 200:
+        logger.error(f"Strava token refresh failed: status={response.status_code}, response={response.text}")
+        raise AuthenticationError(
+            "Failed to refresh Strava token. Please reconnect your account.",
+            "strava"
         )
 
-        if response.status_code != 200:
-            logger.error(f"Strava token refresh failed: status={response.status_code}, response={response.text}")
-            raise AuthenticationError(
-                "Failed to refresh Strava token. Please reconnect your account.",
-                "strava"
-            )
+    data = response.json()
+
+    new_credentials = OAuthCredentials(
+        provider="strava",
+        access_token=data["access_token"],
+        refresh_token=data.get("refresh_token", credentials.refresh_token),
+        expires_at=datetime.fromtimestamp(data["expires_at"]) if data.get("expires_at") else None,
+        token_type="Bearer",
+        scope=credentials.scope,
+        user_id=credentials.user_id,
+        user_name=credentials.user_name,
+        created_at=credentials.created_at,
+    )
 
-        data = response.json()
+    # Save with encryption via repository
+    _save_credentials(strava_repo, new_credentials, user_id)
+    logger.info(f"Refreshed and saved encrypted Strava token for user {user_id}")
+    return new_credentials
 
-        new_credentials = OAuthCredentials(
-            provider="strava",
-            access_token=data["access_token"],
-            refresh_token=data.get("refresh_token", credentials.refresh_token),
-            expires_at=datetime.fromtimestamp(data["expires_at"]) if data.get("expires_at") else None,
-            token_type="Bearer",
-            scope=credentials.scope,
-            user_id=credentials.user_id,
-            user_name=credentials.user_name,
-            created_at=credentials.created_at,
-        )
 
-        # Save with encryption via repository
-        _save_credentials(strava_repo, new_credentials, user_id)
-        logger.info(f"Refreshed and saved encrypted Strava token for user {user_id}")
-        return new_credentials
+async def _refresh_token_if_needed(
+    strava_repo: StravaRepository,
+    credentials: OAuthCredentials,
+    user_id: str = "default"
+) -> OAuthCredentials:
+    """Refresh token if expired or about to expire.
+
+    Tokens are refreshed within the shared pool's refresh margin, and
+    concurrent callers for the same user share a single refresh.
+
+    Args:
+        strava_repo: The Strava repository instance
+        credentials: Current OAuth credentials
+        user_id: User identifier (defaults to 'default')
+
+    Returns:
+        Refreshed OAuthCredentials (or original if no refresh needed)
+
+    Raises:
+        AuthenticationError: If token refresh fails with Strava
+        HTTPException: If encryption fails when saving new tokens
+    """
+    return await get_http_pool("strava").ensure_fresh_token(
+        user_id,
+        credentials,
+        lambda current: _refresh_credentials(strava_repo, current, user_id),
+    )
 
 
 # =============================================================================
@@ -384,25 +412,25 @@ async def handle_strava_callback(
     settings = get_settings()
 
     # Exchange code for tokens
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://www.strava.com/oauth/token",
-            data={
-                "client_id": settings.strava_client_id,
-                "client_secret": settings.strava_client_secret,
-                "code": code,
-                "grant_type": "authorization_code",
-            }
-        )
+    client = get_http_pool("strava").get_client()
+    response = await client.post(
+        "https://www.strava.com/oauth/token",
+        data={
+            "client_id": settings.strava_client_id,
+            "client_secret": settings.strava_client_secret,
+            "code": code,
+            "grant_type": "authorization_code",
+        }
+    )
 
-        if response.status_code != 200:
-            logger.error(f"Strava token exchange failed: status={response.status_code}, response={response.text}")
-            raise HTTPException(
-                status_code=400,
-                detail="Failed to connect to Strava. Please try again."
-            )
+    if response.status_code != 200:
+        logger.error(f"Strava token exchange failed: status={response.status_code}, response={response.text}")
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to connect to Strava. Please try again."
+        )
 
-        data = response.json()
+    data = response.json()
 
     # Extract athlete info
     athlete = data.get("athlete", {})
@@ -452,14 +480,14 @@ async def disconnect_strava(
 
     # Attempt to deauthorize with Strava
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://www.strava.com/oauth/deauthorize",
-                headers={"Authorization": f"Bearer {credentials.access_token}"}
-            )
-            # We don't fail if deauthorization fails - just log and continue
-            if response.status_code != 200:
-                logger.warning(f"Strava deauthorization returned {response.status_code}: {response.text}")
+        client = get_http_pool("strava").get_client()
+        response = await client.post(
+            "https://www.strava.com/oauth/deauthorize",
+            headers={"Authorization": f"Bearer {credentials.access_token}"}
+        )
+        # We don't fail if deauthorization fails - just log and continue
+        if response.status_code != 200:
+            logger.warning(f"Strava deauthorization returned {response.status_code}: {response.text}")
     except Exception as e:
         logger.warning(f"Error deauthorizing with Strava: {e}")
 
@@ -829,3 +857,98 @@ async def sync_workout_to_strava(
             status_code=500,
             detail="Failed to sync to Strava. Please try again."
         )
+
+
+# =============================================================================
+# Bulk History Import
+# =============================================================================
+
+
+class StravaImportResponse(BaseModel):
+    """Progress of the Strava history import."""
+    running: bool
+    total: int = 0
+    pending: int = 0
+    imported: int = 0
+    failed: int = 0
+    message: Optional[str] = None
+
+
+# Import runs in progress, keyed by user (one per user at a time)
+_import_tasks: Dict[str, asyncio.Task] = {}
+
+
+def _import_progress(strava_repo: StravaRepository, user_id: str, message: Optional[str] = None) -> StravaImportResponse:
+    """Build the import progress response from the stored checkpoints."""
+    stats = strava_repo.get_import_stats()
+    task = _import_tasks.get(user_id)
+    return StravaImportResponse(
+        running=task is not None and not task.done(),
+        total=stats["total"],
+        pending=stats[SyncStatus.PENDING.value],
+        imported=stats[SyncStatus.SYNCED.value],
+        failed=stats[SyncStatus.FAILED.value],
+        message=message,
+    )
+
+
+async def _run_history_import(
+    strava_repo: StravaRepository,
+    training_db: TrainingDatabase,
+    credentials: OAuthCredentials,
+    user_id: str,
+) -> None:
+    """Run the history import with a client that refreshes its own token."""
+    client = StravaClient(
+        credentials,
+        token_refresher=lambda current: _refresh_credentials(strava_repo, current, user_id),
+    )
+    service = StravaImportService(training_db, strava_repo)
+    result = await service.run(client)
+    if result.success:
+        logger.info(
+            f"Strava import for {user_id}: {result.activities_discovered} discovered, "
+            f"{result.streams_imported} imported, {result.pending} pending"
+        )
+    else:
+        logger.error(f"Strava import for {user_id} failed: {result.error_message}")
+
+
+@router.post("/import", response_model=StravaImportResponse)
+async def start_history_import(
+    training_db: TrainingDatabase = Depends(get_training_db),
+    strava_repo: StravaRepository = Depends(get_strava_repository),
+):
+    """
+    Start (or resume) importing the athlete's full Strava history.
+
+    The import runs in the background, pacing itself to the Strava rate
+    limits. If the daily limit is reached it stops and can be resumed by
+    calling this endpoint again; already imported activities are skipped.
+    """
+    user_id = "default"
+    credentials = _get_stored_credentials(strava_repo)
+    if not credentials:
+        raise HTTPException(
+            status_code=400,
+            detail="Not connected to Strava. Please connect first."
+        )
+
+    task = _import_tasks.get(user_id)
+    if task is not None and not task.done():
+        return _import_progress(strava_repo, user_id, "Import already running")
+
+    credentials = await _refresh_token_if_needed(strava_repo, credentials, user_id)
+    _import_tasks[user_id] = asyncio.create_task(
+        _run_history_import(strava_repo, training_db, credentials, user_id)
+    )
+
+    return _import_progress(strava_repo, user_id, "Import started")
+
+
+@router.get("/import/status", response_model=StravaImportResponse)
+async def get_history_import_status(
+    strava_repo: StravaRepository = Depends(get_strava_repository),
+):
+    """Get progress of the Strava history import."""
+    return _import_progress(strava_repo, "default")
@@ -35,9 +35,15 @@ from ...models.workouts import (
     WorkoutInterval,
     WorkoutSport,
 )
-from ...agents.workout_agent import WorkoutDesignAgent, get_workout_agent
 from ...fit.encoder import FITEncoder, encode_workout_to_fit
 from ...db.repositories.workout_repository import WorkoutRepository
+from ...db.repositories.strava_repository import get_strava_repository
+from ...services.garmin_session_pool import get_garmin_session_pool
+from ...services.strava_import_service import STRAVA_ACTIVITY_PREFIX
+from ...utils.lazy_import import lazy_import
+
+# The workout design agent (LLM SDKs) loads on first use
+get_workout_agent = lazy_import("...agents.workout_agent", "get_workout_agent", __package__)
 
 
 router = APIRouter()
@@ -588,7 +594,7 @@ async def _fetch_garmin_activity_details(
     - Activity splits
     """
     try:
-        from garminconnect import Garmin
+        import garminconnect  # noqa: F401
     except ImportError:
         raise HTTPException(
             status_code=500,
@@ -653,8 +659,7 @@ async def _fetch_garmin_activity_details(
         else:
             # Fall back to garminconnect library
             try:
-                client = Garmin(email, password)
-                client.login()
+                client = get_garmin_session_pool().get_client(email.lower(), email, password)
 
                 # Fetch activity summary
                 summary = client.get_activity(activity_id)
@@ -752,6 +757,43 @@ async def _fetch_garmin_activity_details(
         )
 
 
+def _load_strava_activity_details(
+    activity_id: str,
+    local_activity,
+) -> Optional[ActivityDetailsResponse]:
+    """Build activity details for an activity imported from Strava."""
+    stored = get_strava_repository().get_activity_streams(activity_id)
+    if not stored or local_activity is None:
+        return None
+
+    is_running = _is_running_activity(local_activity.activity_type or "running")
+    basic_info = BasicActivityInfo(
+        activity_id=activity_id,
+        name=local_activity.activity_name or "Unnamed Activity",
+        activity_type=local_activity.activity_type or "running",
+        sport_type=local_activity.sport_type,
+        date=local_activity.date,
+        start_time=local_activity.start_time,
+        duration_sec=int((local_activity.duration_min or 0) * 60),
+        distance_m=(local_activity.distance_km or 0) * 1000,
+        avg_hr=local_activity.avg_hr,
+        max_hr=local_activity.max_hr,
+        avg_pace_sec_km=local_activity.pace_sec_per_km if is_running else None,
+        avg_speed_kmh=local_activity.avg_speed_kmh if not is_running else None,
+        elevation_gain_m=local_activity.elevation_gain_m,
+    )
+
+    return ActivityDetailsResponse(
+        basic_info=basic_info,
+        time_series=ActivityTimeSeries(**stored["time_series"]),
+        gps_coordinates=[GPSCoordinate(**point) for point in stored["gps_coordinates"]],
+        splits=[],
+        is_running=is_running,
+        data_source="strava",
+        cached=False,
+    )
+
+
 # ============================================================================
 # API Routes
 # ============================================================================
@@ -864,8 +906,12 @@ async def get_activity_details(
     # First, check if we have basic info in our database
     local_activity = training_db.get_activity_metrics(activity_id)
 
-    # Fetch detailed data from Garmin
-    details = await _fetch_garmin_activity_details(activity_id)
+    if activity_id.startswith(STRAVA_ACTIVITY_PREFIX):
+        # Imported from Strava: time series were stored at import time
+        details = _load_strava_activity_details(activity_id, local_activity)
+    else:
+        # Fetch detailed data from Garmin
+        details = await _fetch_garmin_activity_details(activity_id)
 
     if not details:
         # If we have local data, return minimal response
@@ -16,6 +16,8 @@ Usage:
     trainer week --weeks 1      # Detailed weekly analysis
     trainer goal             # Show/set race goals
     trainer dashboard        # Complete training dashboard
+    trainer cohorts          # Rebuild cohort percentile distributions
+    trainer achievements     # Rebuild the achievement progress ledger
 """
 
 import argparse
@@ -34,8 +36,11 @@ from rich.text import Text
 from rich import box
 
 from .db.database import TrainingDatabase
+from .db.repositories.cohort_repository import CohortDistributionRepository
+from .services.achievement_service import AchievementService
 from .services.enrichment import EnrichmentService
 from .services.coach import CoachService
+from .services.weekly_rollup_service import WeeklyRollupService
 from .metrics.zones import calculate_hr_zones_karvonen, estimate_max_hr_from_age
 from .analysis.trends import (
     calculate_fitness_trend,
@@ -43,7 +48,7 @@ from .analysis.trends import (
     generate_ascii_chart,
 )
 from .analysis.weekly import (
-    analyze_week,
+    analyze_rollup,
     format_weekly_summary,
     generate_zone_bar_chart,
 )
@@ -395,6 +400,51 @@ def cmd_stats(args, db: TrainingDatabase):
     console.print()
 
 
+def cmd_cohorts(args, db: TrainingDatabase):
+    """Rebuild cohort percentile distributions from stored data."""
+    repo = CohortDistributionRepository(str(db.db_path))
+    counts = repo.rebuild(owner_user_id=args.user)
+
+    console.print()
+    console.print(Panel("[bold]trAIner - Cohort Distributions[/bold]"))
+    console.print()
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Metric", style="cyan")
+    table.add_column("Athletes", style="white")
+
+    for metric, count in sorted(counts.items()):
+        table.add_row(metric, str(count))
+
+    console.print(table)
+    console.print()
+
+
+def cmd_achievements(args, db: TrainingDatabase):
+    """Rebuild a user's achievement progress ledger from stored data."""
+    service = AchievementService(str(db.db_path))
+    ledger = service.rebuild_ledger(args.user)
+
+    console.print()
+    console.print(Panel(f"[bold]trAIner - Achievement Ledger ({args.user})[/bold]"))
+    console.print()
+
+    table = Table(box=box.ROUNDED)
+    table.add_column("Counter", style="cyan")
+    table.add_column("Value", style="white")
+
+    table.add_row("Workouts", str(ledger.workout_count))
+    table.add_row("Interval workouts", str(ledger.interval_workout_count))
+    table.add_row("Zone 5 minutes", f"{ledger.zone5_minutes:.0f}")
+    table.add_row("Current streak", str(ledger.current_streak))
+    table.add_row("Longest streak", str(ledger.longest_streak))
+    table.add_row("VO2 Max", f"{ledger.vo2max_latest:.1f}")
+    table.add_row("CTL", f"{ledger.ctl_latest:.1f}")
+
+    console.print(table)
+    console.print()
+
+
 def cmd_today(args, db: TrainingDatabase):
     """Get today's training recommendation."""
     console.print()
@@ -649,7 +699,11 @@ def cmd_trends(args, db: TrainingDatabase):
             day = end_date - timedelta(days=i)
             wellness = coach.get_wellness_data(day.isoformat())
             if wellness:
-                wellness_history.append(wellness)
+                # Flatten the sections so the signal checks see hrv/sleep/stress fields
+                record = {"date": day.isoformat()}
+                for section in ("hrv", "sleep", "stress"):
+                    record.update(wellness.get(section) or {})
+                wellness_history.append(record)
     except Exception:
         pass
 
@@ -677,10 +731,9 @@ def cmd_week(args, db: TrainingDatabase):
     target_monday = current_monday - timedelta(weeks=args.weeks - 1)
     target_sunday = target_monday + timedelta(days=6)
 
-    # Get activities
-    activities = db.get_activities_range(
-        target_monday.isoformat(),
-        target_sunday.isoformat(),
+    # Week totals (and the week before, for the load change) from the rollup
+    previous_week, week = WeeklyRollupService(training_db=db).get_weeks(
+        target_monday - timedelta(weeks=1), target_monday
     )
 
     # Get fitness metrics
@@ -690,12 +743,12 @@ def cmd_week(args, db: TrainingDatabase):
     )
 
     fitness_dicts = [m.to_dict() for m in fitness_data]
-    activity_dicts = [a.to_dict() for a in activities]
 
     # Analyze the week
-    analysis = analyze_week(
-        activities=activity_dicts,
+    analysis = analyze_rollup(
+        week,
         fitness_metrics=fitness_dicts,
+        previous_week_load=previous_week.load or None,
     )
 
     # Display formatted summary
@@ -909,6 +962,7 @@ Examples:
   trainer enrich --days 30
   trainer fitness --days 7
   trainer status
+  trainer cohorts
   trainer today
   trainer summary --days 7
   trainer why
@@ -959,6 +1013,22 @@ Examples:
     # Stats command
     subparsers.add_parser("stats", help="Show database statistics")
 
+    # Cohorts command
+    cohorts_p = subparsers.add_parser(
+        "cohorts", help="Rebuild cohort percentile distributions"
+    )
+    cohorts_p.add_argument(
+        "--user", default="default", help="User ID owning the local training data"
+    )
+
+    # Achievements command
+    achievements_p = subparsers.add_parser(
+        "achievements", help="Rebuild the achievement progress ledger"
+    )
+    achievements_p.add_argument(
+        "--user", default="default", help="User ID whose ledger to rebuild"
+    )
+
     # Today command
     subparsers.add_parser("today", help="Get today's training recommendation")
 
@@ -1025,6 +1095,10 @@ Examples:
         cmd_status(args, db)
     elif args.command == "stats":
         cmd_stats(args, db)
+    elif args.command == "cohorts":
+        cmd_cohorts(args, db)
+    elif args.command == "achievements":
+        cmd_achievements(args, db)
     elif args.command == "today":
         cmd_today(args, db)
     elif args.command == "summary":
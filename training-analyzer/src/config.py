@@ -25,6 +25,11 @@ class Settings(BaseSettings):
     api_port: int = 8000
     debug: bool = False
 
+    # Agents, LLM SDKs and other heavy subsystems are imported on first use.
+    # "background" imports them in a worker thread once the app is serving,
+    # "eager" before startup completes, "off" only when a request needs them.
+    startup_warmup: str = "background"
+
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:3001", "http://127.0.0.1:3000", "http://127.0.0.1:3001"]
     cors_methods: list[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
@@ -41,6 +46,9 @@ class Settings(BaseSettings):
     llm_model_fast: str = "gpt-5-nano"  # For quick tasks
     llm_model_smart: str = "gpt-5-mini"  # For complex analysis
 
+    # Chat history sent to the agent is capped by tokens, not message count
+    chat_history_token_budget: int = 3000
+
     # Strava OAuth settings
     strava_client_id: str = ""
     strava_client_secret: str = ""
@@ -74,8 +82,12 @@ class Settings(BaseSettings):
     retention_ai_usage_logs_days: int = 90  # AI usage logs
     retention_sync_history_days: int = 90  # Garmin sync history
     retention_activity_data_days: int = 730  # Activity data (2 years, 0 = keep forever)
+    retention_chat_conversations_days: int = 180  # Chat conversations without activity
     retention_cleanup_enabled: bool = True  # Enable automatic cleanup
     retention_cleanup_hour: int = 3  # UTC hour for daily cleanup (3 AM)
+    retention_batch_size: int = 500  # Rows deleted per transaction
+    retention_batch_pause_ms: int = 20  # Pause between batches so other writers get the lock
+    retention_vacuum_pages: int = 256  # Free pages returned to the OS per incremental vacuum step
 
     # Privacy settings (GDPR compliance)
     # IP address logging in user sessions - can be disabled for GDPR compliance
@@ -404,6 +404,9 @@ class TrainingDatabase:
     def _init_db(self):
         """Initialize database tables."""
         with self._get_connection() as conn:
+            # Only takes effect on a new file (before the first table is created);
+            # lets the retention cleanup return freed pages without a full VACUUM
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
             conn.executescript(SCHEMA)
 
     @contextmanager
@@ -1139,6 +1142,179 @@ class TrainingDatabase:
             ).fetchall()
             return [row["workout_id"] for row in rows]
 
+    # =========================================================================
+    # Running Economy Index - per-workout economy and cardiac drift
+    # =========================================================================
+
+    def get_running_economy_pending(
+        self,
+        start_date: str,
+        end_date: str,
+        activity_types: List[str],
+    ) -> List[ActivityMetrics]:
+        """
+        Get activities in a date range whose economy row is missing or stale.
+
+        Unindexed activities are limited to the given (running) types; stale
+        rows are always returned so a run that changed type can be dropped.
+        """
+        placeholders = ", ".join("?" for _ in activity_types)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT a.* FROM activity_metrics a
+                LEFT JOIN running_economy e ON e.activity_id = a.activity_id
+                WHERE a.date >= ? AND a.date <= ?
+                  AND (e.stale = 1 OR (
+                      e.activity_id IS NULL
+                      AND LOWER(a.activity_type) IN ({placeholders})
+                  ))
+                ORDER BY a.date, a.activity_id
+                """,
+                (start_date, end_date, *activity_types),
+            ).fetchall()
+
+            return [ActivityMetrics(**dict(row)) for row in rows]
+
+    def save_running_economy(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert or replace per-workout economy rows.
+
+        Drift columns are kept from the existing row when the new row has no
+        drift, since a recompute from summary data cannot reproduce drift
+        measured from a time series.
+        """
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO running_economy (
+                    activity_id, date, economy_ratio, pace_sec_per_km, avg_hr,
+                    distance_km, duration_min, pace_zone, zones_key,
+                    first_half_hr, second_half_hr, drift_percent, drift_severity,
+                    stale, updated_at
+                ) VALUES (
+                    :activity_id, :date, :economy_ratio, :pace_sec_per_km, :avg_hr,
+                    :distance_km, :duration_min, :pace_zone, :zones_key,
+                    :first_half_hr, :second_half_hr, :drift_percent, :drift_severity,
+                    0, CURRENT_TIMESTAMP
+                )
+                ON CONFLICT(activity_id) DO UPDATE SET
+                    date = excluded.date,
+                    economy_ratio = excluded.economy_ratio,
+                    pace_sec_per_km = excluded.pace_sec_per_km,
+                    avg_hr = excluded.avg_hr,
+                    distance_km = excluded.distance_km,
+                    duration_min = excluded.duration_min,
+                    pace_zone = excluded.pace_zone,
+                    zones_key = excluded.zones_key,
+                    first_half_hr = CASE WHEN excluded.drift_percent IS NULL
+                        THEN first_half_hr ELSE excluded.first_half_hr END,
+                    second_half_hr = CASE WHEN excluded.drift_percent IS NULL
+                        THEN second_half_hr ELSE excluded.second_half_hr END,
+                    drift_severity = CASE WHEN excluded.drift_percent IS NULL
+                        THEN drift_severity ELSE excluded.drift_severity END,
+                    drift_percent = COALESCE(excluded.drift_percent, drift_percent),
+                    stale = 0,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                rows,
+            )
+
+    def delete_running_economy(self, activity_ids: List[str]) -> None:
+        """Remove economy rows for activities that are no longer runs."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                "DELETE FROM running_economy WHERE activity_id = ?",
+                [(activity_id,) for activity_id in activity_ids],
+            )
+
+    def get_running_economy_other_zones(self, zones_key: str) -> List[Dict[str, Any]]:
+        """Get rows whose pace zone was classified with other thresholds."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT activity_id, pace_sec_per_km FROM running_economy
+                WHERE economy_ratio IS NOT NULL AND zones_key IS NOT ?
+                """,
+                (zones_key,),
+            ).fetchall()
+
+            return [dict(row) for row in rows]
+
+    def update_running_economy_zones(
+        self,
+        zones: List[Tuple[str, str]],
+        zones_key: str,
+    ) -> None:
+        """Set (activity_id, pace_zone) pairs classified with zones_key."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                "UPDATE running_economy SET pace_zone = ?, zones_key = ? WHERE activity_id = ?",
+                [(zone, zones_key, activity_id) for activity_id, zone in zones],
+            )
+
+    def get_running_economy_range(
+        self, start_date: str, end_date: str
+    ) -> List[Dict[str, Any]]:
+        """Get runs with an economy ratio in a date range, oldest first."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT activity_id, date, economy_ratio, pace_sec_per_km, avg_hr, pace_zone
+                FROM running_economy
+                WHERE date >= ? AND date <= ? AND economy_ratio IS NOT NULL
+                ORDER BY date, activity_id
+                """,
+                (start_date, end_date),
+            ).fetchall()
+
+            return [dict(row) for row in rows]
+
+    def get_running_economy_by_zone(
+        self, start_date: str, end_date: str
+    ) -> List[Dict[str, Any]]:
+        """Aggregate economy, pace and HR per pace zone over a date range."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT
+                    pace_zone,
+                    COUNT(*) AS workout_count,
+                    AVG(economy_ratio) AS avg_economy,
+                    MIN(economy_ratio) AS best_economy,
+                    MAX(economy_ratio) AS worst_economy,
+                    SUM(pace_sec_per_km) / COUNT(*) AS avg_pace,
+                    MIN(pace_sec_per_km) AS min_pace,
+                    MAX(pace_sec_per_km) AS max_pace,
+                    SUM(avg_hr) / COUNT(*) AS avg_hr,
+                    MIN(avg_hr) AS min_hr,
+                    MAX(avg_hr) AS max_hr
+                FROM running_economy
+                WHERE date >= ? AND date <= ? AND economy_ratio IS NOT NULL
+                GROUP BY pace_zone
+                """,
+                (start_date, end_date),
+            ).fetchall()
+
+            return [dict(row) for row in rows]
+
+    def get_cardiac_drift_range(
+        self, start_date: str, end_date: str
+    ) -> List[Dict[str, Any]]:
+        """Get runs with a measured cardiac drift in a date range, oldest first."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT activity_id, date, drift_percent, drift_severity
+                FROM running_economy
+                WHERE date >= ? AND date <= ? AND drift_percent IS NOT NULL
+                ORDER BY date, activity_id
+                """,
+                (start_date, end_date),
+            ).fetchall()
+
+            return [dict(row) for row in rows]
+
     # =========================================================================
     # Wellness Data Methods - Sleep, HRV, Stress, Resting HR
     # =========================================================================
@@ -1391,13 +1567,28 @@ class TrainingDatabase:
             end_date = date.today().isoformat()
             start_date = (date.today() - timedelta(days=days)).isoformat()
 
-        return {
-            "sleep": self.get_sleep_range(start_date, end_date),
-            "hrv": self.get_hrv_range(start_date, end_date),
-            "stress": self.get_stress_range(start_date, end_date),
-            "resting_hr": self.get_resting_hr_range(start_date, end_date),
-            "date_range": {
-                "start": start_date,
-                "end": end_date,
-            },
+        # Read all four tables over one connection
+        sources = {
+            "sleep": ("wellness_sleep", WellnessSleepRecord),
+            "hrv": ("wellness_hrv", WellnessHRVRecord),
+            "stress": ("wellness_stress", WellnessStressRecord),
+            "resting_hr": ("wellness_resting_hr", WellnessRestingHRRecord),
+        }
+        result: Dict[str, Any] = {}
+        with self._get_connection() as conn:
+            for key, (table, record_cls) in sources.items():
+                rows = conn.execute(
+                    f"""
+                    SELECT * FROM {table}
+                    WHERE date >= ? AND date <= ?
+                    ORDER BY date DESC
+                    """,
+                    (start_date, end_date),
+                ).fetchall()
+                result[key] = [record_cls(**dict(row)) for row in rows]
+
+        result["date_range"] = {
+            "start": start_date,
+            "end": end_date,
         }
+        return result
@@ -20,6 +20,11 @@ from .garmin_credentials_repository import (
     get_garmin_credentials_repository,
 )
 from .ai_usage_repository import AIUsageRepository, get_ai_usage_repository
+from .chat_repository import ChatRepository, get_chat_repository
+from .cohort_repository import (
+    CohortDistributionRepository,
+    get_cohort_distribution_repository,
+)
 
 __all__ = [
     # Base classes
@@ -44,4 +49,10 @@ __all__ = [
     # AI usage tracking
     "AIUsageRepository",
     "get_ai_usage_repository",
+    # Chat conversations
+    "ChatRepository",
+    "get_chat_repository",
+    # Cohort percentile distributions
+    "CohortDistributionRepository",
+    "get_cohort_distribution_repository",
 ]
@@ -0,0 +1,317 @@
+"""SQLite-backed repository for chat conversations.
+
+Replaces the process-local `ChatService._conversations` dict as the source of
+truth for conversation history, enabling:
+- Conversations that survive server restarts
+- Chat continuity across API workers
+- Lazy loading of only the most recent messages of a conversation
+
+Messages are append-only and keyed by (conversation_id, seq), so reading the
+tail of a conversation is a single index range scan regardless of its length.
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+
+@dataclass
+class ChatConversationRecord:
+    """Header row for a stored conversation."""
+    conversation_id: str
+    user_id: Optional[str]
+    message_count: int
+    total_tokens: int
+    created_at: datetime
+    last_activity: datetime
+
+
+@dataclass
+class ChatMessageRecord:
+    """A single stored chat message."""
+    role: str
+    content: str
+    token_count: int = 0
+    created_at: Optional[datetime] = None
+    seq: Optional[int] = None
+
+
+class ChatRepository:
+    """
+    SQLite-backed repository for chat conversations and their messages.
+
+    Conversation headers keep running message and token counters so callers
+    can detect new messages written by other workers without reading them.
+    """
+
+    CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS chat_conversations (
+        id TEXT PRIMARY KEY,
+        user_id TEXT,
+        message_count INTEGER NOT NULL DEFAULT 0,
+        total_tokens INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        last_activity TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS chat_messages (
+        conversation_id TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL,
+        token_count INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (conversation_id, seq)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_chat_conversations_user
+        ON chat_conversations(user_id, last_activity);
+    CREATE INDEX IF NOT EXISTS idx_chat_conversations_activity
+        ON chat_conversations(last_activity);
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the chat repository.
+
+        Args:
+            db_path: Path to SQLite database file. If None, uses the default
+                    training.db in the training-analyzer directory.
+        """
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            env_path = os.environ.get("TRAINING_DB_PATH")
+            if env_path:
+                self.db_path = Path(env_path)
+            else:
+                self.db_path = Path(__file__).parent.parent.parent.parent / "training.db"
+
+        self._ensure_table_exists()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with context manager."""
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _ensure_table_exists(self) -> None:
+        """Create the tables if they don't exist."""
+        with self._get_connection() as conn:
+            conn.executescript(self.CREATE_TABLE_SQL)
+
+    def _row_to_conversation(self, row: sqlite3.Row) -> ChatConversationRecord:
+        """Convert a database row to a ChatConversationRecord."""
+        return ChatConversationRecord(
+            conversation_id=row["id"],
+            user_id=row["user_id"],
+            message_count=row["message_count"],
+            total_tokens=row["total_tokens"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            last_activity=datetime.fromisoformat(row["last_activity"]),
+        )
+
+    def append_messages(
+        self,
+        conversation_id: str,
+        messages: List[ChatMessageRecord],
+        user_id: Optional[str] = None,
+    ) -> ChatConversationRecord:
+        """
+        Append messages to a conversation, creating it if needed.
+
+        The header update and the inserts run in one write transaction, so
+        concurrent writers from several workers get distinct sequence numbers.
+
+        Args:
+            conversation_id: The conversation ID
+            messages: Messages to append, oldest first
+            user_id: Owner of the conversation (set on creation)
+
+        Returns:
+            The updated conversation header
+        """
+        now = datetime.utcnow()
+        now_str = now.isoformat()
+        added_tokens = sum(msg.token_count for msg in messages)
+
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO chat_conversations
+                (id, user_id, message_count, total_tokens, created_at, last_activity)
+                VALUES (?, ?, 0, 0, ?, ?)
+                """,
+                (conversation_id, user_id, now_str, now_str),
+            )
+            row = conn.execute(
+                "SELECT message_count FROM chat_conversations WHERE id = ?",
+                (conversation_id,),
+            ).fetchone()
+            next_seq = row["message_count"]
+
+            conn.executemany(
+                """
+                INSERT INTO chat_messages
+                (conversation_id, seq, role, content, token_count, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        conversation_id,
+                        next_seq + i,
+                        msg.role,
+                        msg.content,
+                        msg.token_count,
+                        (msg.created_at or now).isoformat(),
+                    )
+                    for i, msg in enumerate(messages)
+                ],
+            )
+            conn.execute(
+                """
+                UPDATE chat_conversations
+                SET message_count = message_count + ?,
+                    total_tokens = total_tokens + ?,
+                    last_activity = ?
+                WHERE id = ?
+                """,
+                (len(messages), added_tokens, now_str, conversation_id),
+            )
+            header = conn.execute(
+                "SELECT * FROM chat_conversations WHERE id = ?",
+                (conversation_id,),
+            ).fetchone()
+
+        for i, msg in enumerate(messages):
+            msg.seq = next_seq + i
+
+        return self._row_to_conversation(header)
+
+    def get_conversation(self, conversation_id: str) -> Optional[ChatConversationRecord]:
+        """
+        Get a conversation header without loading its messages.
+
+        Args:
+            conversation_id: The conversation ID
+
+        Returns:
+            ChatConversationRecord if found, None otherwise
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM chat_conversations WHERE id = ?",
+                (conversation_id,),
+            ).fetchone()
+
+        return self._row_to_conversation(row) if row else None
+
+    def get_recent_messages(
+        self,
+        conversation_id: str,
+        limit: int,
+    ) -> List[ChatMessageRecord]:
+        """
+        Get the last `limit` messages of a conversation.
+
+        Args:
+            conversation_id: The conversation ID
+            limit: Maximum number of messages to load
+
+        Returns:
+            Messages ordered oldest first
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT seq, role, content, token_count, created_at
+                FROM chat_messages
+                WHERE conversation_id = ?
+                ORDER BY seq DESC
+                LIMIT ?
+                """,
+                (conversation_id, limit),
+            ).fetchall()
+
+        return [
+            ChatMessageRecord(
+                role=row["role"],
+                content=row["content"],
+                token_count=row["token_count"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+                seq=row["seq"],
+            )
+            for row in reversed(rows)
+        ]
+
+    def delete_conversation(self, conversation_id: str) -> bool:
+        """
+        Delete a conversation and all of its messages.
+
+        Args:
+            conversation_id: The conversation ID
+
+        Returns:
+            True if the conversation existed, False otherwise
+        """
+        with self._get_connection() as conn:
+            conn.execute(
+                "DELETE FROM chat_messages WHERE conversation_id = ?",
+                (conversation_id,),
+            )
+            cursor = conn.execute(
+                "DELETE FROM chat_conversations WHERE id = ?",
+                (conversation_id,),
+            )
+            return cursor.rowcount > 0
+
+    def delete_inactive_conversations(self, inactive_before: datetime) -> int:
+        """
+        Delete conversations with no activity since a cutoff.
+
+        Args:
+            inactive_before: Conversations last active before this are removed
+
+        Returns:
+            Number of conversations deleted
+        """
+        cutoff = inactive_before.isoformat()
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                DELETE FROM chat_messages
+                WHERE conversation_id IN (
+                    SELECT id FROM chat_conversations WHERE last_activity < ?
+                )
+                """,
+                (cutoff,),
+            )
+            cursor = conn.execute(
+                "DELETE FROM chat_conversations WHERE last_activity < ?",
+                (cutoff,),
+            )
+            return cursor.rowcount
+
+
+# Singleton instance
+_chat_repository: Optional[ChatRepository] = None
+
+
+def get_chat_repository(db_path: Optional[str] = None) -> ChatRepository:
+    """Get the chat repository singleton."""
+    global _chat_repository
+    if _chat_repository is None:
+        _chat_repository = ChatRepository(db_path)
+    return _chat_repository
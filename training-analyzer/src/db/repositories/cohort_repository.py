@@ -0,0 +1,562 @@
+"""SQLite-backed cohort distributions for percentile rankings.
+
+Each ranked metric keeps a fixed-bucket histogram per (sport, age group)
+cohort. The histogram is adjusted in place whenever an athlete's value
+moves to a different bucket, so ranking an athlete reads one cohort's
+bucket counts and never scans athletes or their activity history.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# Cohort key used for "every sport" and "every age group"
+ALL = "all"
+
+# Rank against the whole sport when an age group has fewer athletes
+MIN_COHORT_SIZE = 20
+
+# Upper bounds (exclusive) of each age group
+AGE_GROUPS: List[Tuple[int, str]] = [
+    (25, "under_25"),
+    (35, "25_34"),
+    (45, "35_44"),
+    (55, "45_54"),
+    (65, "55_64"),
+]
+
+
+def age_group(age: Optional[int]) -> str:
+    """Map an age in years to its cohort age group."""
+    if not age or age <= 0:
+        return ALL
+    for upper, name in AGE_GROUPS:
+        if age < upper:
+            return name
+    return "65_plus"
+
+
+@dataclass(frozen=True)
+class CohortMetric:
+    """A ranked metric and the histogram layout used to summarize it."""
+
+    name: str
+    low: float
+    high: float
+    bucket_width: float
+    higher_is_better: bool = True
+    default_sport: str = ALL
+
+    @property
+    def bucket_count(self) -> int:
+        return int(round((self.high - self.low) / self.bucket_width))
+
+    def bucket_for(self, value: float) -> int:
+        """Histogram bucket for a value (out-of-range values are clamped)."""
+        bucket = int((value - self.low) // self.bucket_width)
+        return min(max(bucket, 0), self.bucket_count - 1)
+
+    def fraction_within(self, value: float, bucket: int) -> float:
+        """Position of a value inside its bucket, from 0 to 1."""
+        start = self.low + bucket * self.bucket_width
+        return min(max((value - start) / self.bucket_width, 0.0), 1.0)
+
+
+COHORT_METRICS: Dict[str, CohortMetric] = {
+    "ctl": CohortMetric("ctl", 0.0, 200.0, 2.5),
+    "weekly_volume_km": CohortMetric("weekly_volume_km", 0.0, 250.0, 2.5),
+    "vdot": CohortMetric("vdot", 20.0, 90.0, 0.5, default_sport="running"),
+    "streak": CohortMetric("streak", 0.0, 366.0, 1.0),
+    "level": CohortMetric("level", 1.0, 101.0, 1.0),
+    # Minutes per km
+    "pace": CohortMetric(
+        "pace", 2.5, 15.0, 0.1, higher_is_better=False, default_sport="running"
+    ),
+}
+
+
+def get_cohort_metric(metric: str) -> CohortMetric:
+    """Look up a ranked metric by name."""
+    try:
+        return COHORT_METRICS[metric]
+    except KeyError:
+        raise ValueError(f"Unknown cohort metric: {metric}") from None
+
+
+class CohortDistributionRepository:
+    """
+    Repository for per-cohort metric distributions.
+
+    Stores each athlete's latest value per metric (so a change can be
+    taken out of its old bucket) alongside the bucket counts that
+    percentile lookups read.
+    """
+
+    CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS cohort_members (
+        user_id TEXT PRIMARY KEY,
+        age_group TEXT NOT NULL DEFAULT 'all',
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS cohort_metric_values (
+        user_id TEXT NOT NULL,
+        metric TEXT NOT NULL,
+        sport TEXT NOT NULL,
+        age_group TEXT NOT NULL,
+        value REAL NOT NULL,
+        bucket INTEGER NOT NULL,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (user_id, metric, sport)
+    );
+
+    CREATE TABLE IF NOT EXISTS cohort_histograms (
+        metric TEXT NOT NULL,
+        sport TEXT NOT NULL,
+        age_group TEXT NOT NULL,
+        bucket INTEGER NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (metric, sport, age_group, bucket)
+    ) WITHOUT ROWID;
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the cohort distribution repository.
+
+        Args:
+            db_path: Path to SQLite database file. If None, uses the default
+                    training database path.
+        """
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            from ..database import get_default_db_path
+            self.db_path = get_default_db_path()
+
+        self._ensure_table_exists()
+
+    @contextmanager
+    def _get_connection(
+        self, conn: Optional[sqlite3.Connection] = None
+    ) -> Iterator[sqlite3.Connection]:
+        """Get database connection, or reuse the caller's transaction."""
+        if conn is not None:
+            yield conn
+            return
+
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _ensure_table_exists(self) -> None:
+        """Create the tables if they don't exist."""
+        with self._get_connection() as conn:
+            conn.executescript(self.CREATE_TABLE_SQL)
+
+    # =========================================================================
+    # Incremental maintenance
+    # =========================================================================
+
+    @staticmethod
+    def _bump(
+        conn: sqlite3.Connection,
+        metric: str,
+        sport: str,
+        group: str,
+        bucket: int,
+        delta: int,
+    ) -> None:
+        """Adjust a bucket count in the age group's and the overall cohort."""
+        for cohort_group in {group, ALL}:
+            conn.execute(
+                """
+                INSERT INTO cohort_histograms (metric, sport, age_group, bucket, count)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(metric, sport, age_group, bucket)
+                DO UPDATE SET count = MAX(count + excluded.count, 0)
+                """,
+                (metric, sport, cohort_group, bucket, delta),
+            )
+
+    def _member_age_group(self, conn: sqlite3.Connection, user_id: str) -> str:
+        row = conn.execute(
+            "SELECT age_group FROM cohort_members WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        return row[0] if row else ALL
+
+    def record_value(
+        self,
+        user_id: str,
+        metric: str,
+        value: Optional[float],
+        sport: Optional[str] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> None:
+        """
+        Record an athlete's current value for a metric.
+
+        Only the old and new buckets are touched, and nothing is written
+        when the value stays in the same bucket.
+
+        Args:
+            user_id: The athlete's user ID
+            metric: Metric name (see COHORT_METRICS)
+            value: Current value, or None to remove the athlete
+            sport: Sport cohort (defaults to the metric's sport)
+            conn: Optional open connection to write in the caller's transaction
+        """
+        if value is None:
+            self.remove_value(user_id, metric, sport, conn=conn)
+            return
+
+        spec = get_cohort_metric(metric)
+        sport = sport or spec.default_sport
+        bucket = spec.bucket_for(value)
+
+        with self._get_connection(conn) as c:
+            group = self._member_age_group(c, user_id)
+            current = c.execute(
+                """
+                SELECT value, bucket, age_group FROM cohort_metric_values
+                WHERE user_id = ? AND metric = ? AND sport = ?
+                """,
+                (user_id, metric, sport),
+            ).fetchone()
+
+            if current is not None:
+                if current[0] == value:
+                    return
+                moved = current[1] != bucket or current[2] != group
+                if moved:
+                    self._bump(c, metric, sport, current[2], current[1], -1)
+            else:
+                moved = True
+
+            if moved:
+                self._bump(c, metric, sport, group, bucket, 1)
+            c.execute(
+                """
+                INSERT INTO cohort_metric_values
+                    (user_id, metric, sport, age_group, value, bucket, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(user_id, metric, sport) DO UPDATE SET
+                    age_group = excluded.age_group,
+                    value = excluded.value,
+                    bucket = excluded.bucket,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (user_id, metric, sport, group, value, bucket),
+            )
+
+    def remove_value(
+        self,
+        user_id: str,
+        metric: str,
+        sport: Optional[str] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> None:
+        """Remove an athlete from a metric's distribution."""
+        sport = sport or get_cohort_metric(metric).default_sport
+        with self._get_connection(conn) as c:
+            current = c.execute(
+                """
+                SELECT bucket, age_group FROM cohort_metric_values
+                WHERE user_id = ? AND metric = ? AND sport = ?
+                """,
+                (user_id, metric, sport),
+            ).fetchone()
+            if current is not None:
+                self._bump(c, metric, sport, current[1], current[0], -1)
+                c.execute(
+                    """
+                    DELETE FROM cohort_metric_values
+                    WHERE user_id = ? AND metric = ? AND sport = ?
+                    """,
+                    (user_id, metric, sport),
+                )
+
+    def set_age(self, user_id: str, age: Optional[int]) -> None:
+        """
+        Set an athlete's age, moving their values to the new age group.
+
+        Args:
+            user_id: The athlete's user ID
+            age: Age in years (None for unknown)
+        """
+        group = age_group(age)
+        with self._get_connection() as conn:
+            if self._member_age_group(conn, user_id) == group:
+                return
+
+            rows = conn.execute(
+                """
+                SELECT metric, sport, age_group, bucket FROM cohort_metric_values
+                WHERE user_id = ?
+                """,
+                (user_id,),
+            ).fetchall()
+            for row in rows:
+                self._bump(conn, row[0], row[1], row[2], row[3], -1)
+                self._bump(conn, row[0], row[1], group, row[3], 1)
+
+            conn.execute(
+                "UPDATE cohort_metric_values SET age_group = ? WHERE user_id = ?",
+                (group, user_id),
+            )
+            conn.execute(
+                """
+                INSERT INTO cohort_members (user_id, age_group, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    age_group = excluded.age_group,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (user_id, group),
+            )
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    def percentile(
+        self,
+        metric: str,
+        value: float,
+        sport: Optional[str] = None,
+        age: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Rank a value against its cohort.
+
+        Uses the athlete's age group when it has at least MIN_COHORT_SIZE
+        athletes, otherwise everyone in the sport. Values are assumed to be
+        spread evenly within a bucket.
+
+        Args:
+            metric: Metric name (see COHORT_METRICS)
+            value: The value to rank
+            sport: Sport cohort (defaults to the metric's sport)
+            age: Athlete's age in years, if known
+
+        Returns:
+            Percentage of the cohort this value beats (0-100), or None if
+            nobody has a value for the metric yet
+        """
+        spec = get_cohort_metric(metric)
+        sport = sport or spec.default_sport
+        bucket = spec.bucket_for(value)
+        group = age_group(age)
+        groups = [group, ALL] if group != ALL else [ALL]
+
+        with self._get_connection() as conn:
+            for cohort_group in groups:
+                total, below, within = conn.execute(
+                    """
+                    SELECT
+                        COALESCE(SUM(count), 0),
+                        COALESCE(SUM(CASE WHEN bucket < ? THEN count END), 0),
+                        COALESCE(SUM(CASE WHEN bucket = ? THEN count END), 0)
+                    FROM cohort_histograms
+                    WHERE metric = ? AND sport = ? AND age_group = ?
+                    """,
+                    (bucket, bucket, metric, sport, cohort_group),
+                ).fetchone()
+                if total >= MIN_COHORT_SIZE or cohort_group == ALL:
+                    break
+
+        if total <= 0:
+            return None
+
+        rank = (below + within * spec.fraction_within(value, bucket)) / total * 100
+        if not spec.higher_is_better:
+            rank = 100 - rank
+        return int(round(min(max(rank, 0.0), 100.0)))
+
+    def get_cohort_size(
+        self,
+        metric: str,
+        sport: Optional[str] = None,
+        group: str = ALL,
+    ) -> int:
+        """Number of athletes with a value in a cohort."""
+        sport = sport or get_cohort_metric(metric).default_sport
+        with self._get_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT COALESCE(SUM(count), 0) FROM cohort_histograms
+                WHERE metric = ? AND sport = ? AND age_group = ?
+                """,
+                (metric, sport, group),
+            ).fetchone()
+            return row[0]
+
+    # =========================================================================
+    # Rebuild
+    # =========================================================================
+
+    def _collect_values(
+        self, conn: sqlite3.Connection, owner_user_id: str
+    ) -> List[Tuple[str, str, Optional[str], float]]:
+        """Read current metric values from the training tables."""
+        tables = {
+            row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        values: List[Tuple[str, str, Optional[str], float]] = []
+
+        if "user_progress" in tables:
+            for row in conn.execute(
+                "SELECT user_id, current_streak, current_level FROM user_progress"
+            ):
+                if row[1]:
+                    values.append((row[0], "streak", None, row[1]))
+                if row[2]:
+                    values.append((row[0], "level", None, row[2]))
+
+        # The remaining training tables are single-athlete
+        if "fitness_metrics" in tables:
+            row = conn.execute(
+                "SELECT ctl FROM fitness_metrics WHERE ctl IS NOT NULL "
+                "ORDER BY date DESC LIMIT 1"
+            ).fetchone()
+            if row:
+                values.append((owner_user_id, "ctl", None, row[0]))
+
+        if "activity_metrics" in tables:
+            since = (date.today() - timedelta(days=6)).isoformat()
+            row = conn.execute(
+                "SELECT SUM(distance_km) FROM activity_metrics WHERE date >= ?",
+                (since,),
+            ).fetchone()
+            if row and row[0]:
+                values.append((owner_user_id, "weekly_volume_km", None, row[0]))
+
+            since = (date.today() - timedelta(days=27)).isoformat()
+            row = conn.execute(
+                """
+                SELECT AVG(pace_sec_per_km) FROM activity_metrics
+                WHERE date >= ? AND pace_sec_per_km > 0
+                    AND LOWER(COALESCE(sport_type, activity_type, '')) LIKE '%run%'
+                """,
+                (since,),
+            ).fetchone()
+            if row and row[0]:
+                values.append((owner_user_id, "pace", None, row[0] / 60))
+
+        if "garmin_fitness_data" in tables:
+            row = conn.execute(
+                "SELECT race_time_5k FROM garmin_fitness_data "
+                "WHERE race_time_5k > 0 ORDER BY date DESC LIMIT 1"
+            ).fetchone()
+            if row:
+                from ...metrics.vdot import calculate_vdot
+                values.append((owner_user_id, "vdot", None, calculate_vdot(5000, row[0])))
+
+        return values
+
+    def rebuild(self, owner_user_id: str = "default") -> Dict[str, int]:
+        """
+        Rebuild all distributions from the stored training data.
+
+        Streak and level come from every athlete's progress; CTL, weekly
+        volume, pace and VDOT come from the single-athlete training tables
+        and are credited to owner_user_id.
+
+        Args:
+            owner_user_id: User ID owning the local training data
+
+        Returns:
+            Number of athletes ranked per metric
+        """
+        with self._get_connection() as conn:
+            tables = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+            if "user_profile" in tables:
+                row = conn.execute("SELECT age FROM user_profile WHERE id = 1").fetchone()
+                if row and row[0]:
+                    conn.execute(
+                        """
+                        INSERT INTO cohort_members (user_id, age_group, updated_at)
+                        VALUES (?, ?, CURRENT_TIMESTAMP)
+                        ON CONFLICT(user_id) DO UPDATE SET
+                            age_group = excluded.age_group,
+                            updated_at = CURRENT_TIMESTAMP
+                        """,
+                        (owner_user_id, age_group(row[0])),
+                    )
+
+            groups = dict(conn.execute("SELECT user_id, age_group FROM cohort_members"))
+            rows = []
+            for user_id, metric, sport, value in self._collect_values(conn, owner_user_id):
+                spec = COHORT_METRICS[metric]
+                rows.append((
+                    user_id,
+                    metric,
+                    sport or spec.default_sport,
+                    groups.get(user_id, ALL),
+                    value,
+                    spec.bucket_for(value),
+                ))
+
+            conn.execute("DELETE FROM cohort_metric_values")
+            conn.execute("DELETE FROM cohort_histograms")
+            conn.executemany(
+                """
+                INSERT INTO cohort_metric_values
+                    (user_id, metric, sport, age_group, value, bucket)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.execute(
+                """
+                INSERT INTO cohort_histograms (metric, sport, age_group, bucket, count)
+                SELECT metric, sport, age_group, bucket, COUNT(*)
+                FROM cohort_metric_values
+                WHERE age_group != 'all'
+                GROUP BY metric, sport, age_group, bucket
+                """
+            )
+            conn.execute(
+                """
+                INSERT INTO cohort_histograms (metric, sport, age_group, bucket, count)
+                SELECT metric, sport, 'all', bucket, COUNT(*)
+                FROM cohort_metric_values
+                GROUP BY metric, sport, bucket
+                """
+            )
+
+            counts: Dict[str, int] = {}
+            for row in rows:
+                counts[row[1]] = counts.get(row[1], 0) + 1
+            return counts
+
+
+# Singleton instance
+_cohort_repository: Optional[CohortDistributionRepository] = None
+
+
+def get_cohort_distribution_repository(
+    db_path: Optional[str] = None,
+) -> CohortDistributionRepository:
+    """Get the cohort distribution repository singleton."""
+    global _cohort_repository
+    if _cohort_repository is None:
+        _cohort_repository = CohortDistributionRepository(db_path)
+    return _cohort_repository
@@ -5,13 +5,17 @@ with persistent storage in SQLite, enabling:
 - Data persistence across server restarts
 - Concurrent access safety
 - Support for horizontal scaling
+
+Weeks and sessions are stored one row each in training_plan_weeks and
+training_plan_sessions, so reading a week or editing a session touches only
+those rows, and plan listings read the training_plans header alone.
 """
 
 import json
 import sqlite3
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from contextlib import contextmanager
 
 from .base import Repository
@@ -37,6 +41,19 @@ class PlanRepository(Repository[TrainingPlan]):
     replacing in-memory storage with database persistence.
     """
 
+    # Session fields stored as columns of training_plan_sessions
+    SESSION_FIELDS = (
+        "day_of_week",
+        "workout_type",
+        "description",
+        "target_duration_min",
+        "target_load",
+        "target_pace",
+        "target_hr_zone",
+        "intervals",
+        "notes",
+    )
+
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize the plan repository.
@@ -98,10 +115,180 @@ class PlanRepository(Repository[TrainingPlan]):
                 CREATE INDEX IF NOT EXISTS idx_training_plans_created_at
                 ON training_plans(created_at)
             """)
+            # Keyset pagination and the active-plan lookup walk these in order;
+            # the partial index replaces the old index on is_active
+            conn.execute("DROP INDEX IF EXISTS idx_training_plans_is_active")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_training_plans_listing
+                ON training_plans(created_at DESC, id DESC)
+            """)
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_training_plans_is_active
-                ON training_plans(is_active)
+                CREATE INDEX IF NOT EXISTS idx_training_plans_active_listing
+                ON training_plans(created_at DESC, id DESC) WHERE is_active = 1
             """)
+            # Plans saved before weeks had their own table
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_training_plans_legacy_weeks
+                ON training_plans(id) WHERE weeks_json != '[]'
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS training_plan_weeks (
+                    plan_id TEXT NOT NULL,
+                    week_number INTEGER NOT NULL,
+                    phase TEXT NOT NULL,
+                    target_load REAL NOT NULL,
+                    focus TEXT,
+                    notes TEXT,
+                    is_cutback INTEGER DEFAULT 0,
+                    PRIMARY KEY (plan_id, week_number)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS training_plan_sessions (
+                    plan_id TEXT NOT NULL,
+                    week_number INTEGER NOT NULL,
+                    session_index INTEGER NOT NULL,
+                    day_of_week INTEGER NOT NULL,
+                    workout_type TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    target_duration_min INTEGER NOT NULL,
+                    target_load REAL NOT NULL,
+                    target_pace TEXT,
+                    target_hr_zone TEXT,
+                    intervals_json TEXT,
+                    notes TEXT,
+                    PRIMARY KEY (plan_id, week_number, session_index)
+                )
+            """)
+            self._migrate_legacy_weeks(conn)
+
+    def _migrate_legacy_weeks(self, conn: sqlite3.Connection) -> None:
+        """Move weeks stored in training_plans.weeks_json into their own tables."""
+        rows = conn.execute(
+            "SELECT id, weeks_json FROM training_plans WHERE weeks_json != '[]'"
+        ).fetchall()
+        for row in rows:
+            self._write_weeks(conn, row["id"], json.loads(row["weeks_json"] or "[]"))
+            conn.execute(
+                "UPDATE training_plans SET weeks_json = '[]' WHERE id = ?",
+                (row["id"],)
+            )
+
+    def _write_weeks(
+        self,
+        conn: sqlite3.Connection,
+        plan_id: str,
+        weeks: List[Dict[str, Any]],
+    ) -> None:
+        """Replace a plan's week and session rows with the given week dicts."""
+        conn.execute("DELETE FROM training_plan_sessions WHERE plan_id = ?", (plan_id,))
+        conn.execute("DELETE FROM training_plan_weeks WHERE plan_id = ?", (plan_id,))
+        self._insert_weeks(conn, plan_id, weeks)
+
+    def _insert_weeks(
+        self,
+        conn: sqlite3.Connection,
+        plan_id: str,
+        weeks: List[Dict[str, Any]],
+    ) -> None:
+        """Insert week and session rows for the given week dicts."""
+        conn.executemany("""
+            INSERT INTO training_plan_weeks
+            (plan_id, week_number, phase, target_load, focus, notes, is_cutback)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                plan_id,
+                week["week_number"],
+                week["phase"],
+                week["target_load"],
+                week.get("focus"),
+                week.get("notes"),
+                1 if week.get("is_cutback") else 0,
+            )
+            for week in weeks
+        ])
+        conn.executemany("""
+            INSERT INTO training_plan_sessions
+            (plan_id, week_number, session_index, day_of_week, workout_type,
+             description, target_duration_min, target_load, target_pace,
+             target_hr_zone, intervals_json, notes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                plan_id,
+                week["week_number"],
+                index,
+                session["day_of_week"],
+                session["workout_type"],
+                session["description"],
+                session["target_duration_min"],
+                session["target_load"],
+                session.get("target_pace"),
+                session.get("target_hr_zone"),
+                json.dumps(session["intervals"]) if session.get("intervals") else None,
+                session.get("notes"),
+            )
+            for week in weeks
+            for index, session in enumerate(week.get("sessions", []))
+        ])
+
+    def _row_to_session(self, row: sqlite3.Row) -> PlannedSession:
+        """Convert a training_plan_sessions row to a PlannedSession."""
+        return PlannedSession(
+            day_of_week=row["day_of_week"],
+            workout_type=WorkoutType(row["workout_type"]),
+            description=row["description"],
+            target_duration_min=row["target_duration_min"],
+            target_load=row["target_load"],
+            target_pace=row["target_pace"],
+            target_hr_zone=row["target_hr_zone"],
+            intervals=json.loads(row["intervals_json"]) if row["intervals_json"] else None,
+            notes=row["notes"],
+        )
+
+    def _load_weeks(
+        self,
+        conn: sqlite3.Connection,
+        plan_ids: List[str],
+        week_number: Optional[int] = None,
+    ) -> Dict[str, List[TrainingWeek]]:
+        """Load the weeks of several plans (optionally a single week) keyed by plan ID."""
+        if not plan_ids:
+            return {}
+
+        where = f"plan_id IN ({', '.join('?' * len(plan_ids))})"
+        params: List[Any] = list(plan_ids)
+        if week_number is not None:
+            where += " AND week_number = ?"
+            params.append(week_number)
+
+        sessions: Dict[Tuple[str, int], List[PlannedSession]] = {}
+        for row in conn.execute(
+            f"SELECT * FROM training_plan_sessions WHERE {where} "
+            "ORDER BY plan_id, week_number, session_index",
+            params,
+        ):
+            sessions.setdefault((row["plan_id"], row["week_number"]), []).append(
+                self._row_to_session(row)
+            )
+
+        weeks: Dict[str, List[TrainingWeek]] = {plan_id: [] for plan_id in plan_ids}
+        for row in conn.execute(
+            f"SELECT * FROM training_plan_weeks WHERE {where} "
+            "ORDER BY plan_id, week_number",
+            params,
+        ):
+            weeks[row["plan_id"]].append(TrainingWeek(
+                week_number=row["week_number"],
+                phase=TrainingPhase(row["phase"]),
+                target_load=row["target_load"],
+                sessions=sessions.get((row["plan_id"], row["week_number"]), []),
+                focus=row["focus"],
+                notes=row["notes"],
+                is_cutback=bool(row["is_cutback"]),
+            ))
+        return weeks
 
     def _plan_to_row(self, plan: TrainingPlan) -> dict:
         """Convert a TrainingPlan to a database row dictionary."""
@@ -113,7 +300,7 @@ class PlanRepository(Repository[TrainingPlan]):
             "periodization": plan.periodization.value,
             "peak_week": plan.peak_week,
             "total_weeks": plan.total_weeks,
-            "weeks_json": json.dumps([w.to_dict() for w in plan.weeks]),
+            "weeks_json": "[]",
             "athlete_context_json": json.dumps(plan.athlete_context.to_dict()) if plan.athlete_context else None,
             "constraints_json": json.dumps(plan.constraints.to_dict()) if plan.constraints else None,
             "phases_summary_json": json.dumps(plan.phases_summary),
@@ -124,11 +311,10 @@ class PlanRepository(Repository[TrainingPlan]):
             "updated_at": plan.updated_at.isoformat() if plan.updated_at else datetime.now().isoformat(),
         }
 
-    def _row_to_plan(self, row: sqlite3.Row) -> TrainingPlan:
-        """Convert a database row to a TrainingPlan."""
-        # Parse goal
+    def _row_to_goal(self, row: sqlite3.Row) -> RaceGoal:
+        """Parse the race goal stored on a training_plans row."""
         goal_data = json.loads(row["goal_json"])
-        goal = RaceGoal(
+        return RaceGoal(
             race_date=datetime.strptime(goal_data["race_date"], "%Y-%m-%d").date(),
             distance=RaceDistance(goal_data["distance"]),
             target_time_seconds=goal_data["target_time_seconds"],
@@ -136,33 +322,9 @@ class PlanRepository(Repository[TrainingPlan]):
             priority=goal_data.get("priority", 1),
         )
 
-        # Parse weeks
-        weeks_data = json.loads(row["weeks_json"])
-        weeks = []
-        for week_data in weeks_data:
-            sessions = []
-            for session_data in week_data.get("sessions", []):
-                sessions.append(PlannedSession(
-                    day_of_week=session_data["day_of_week"],
-                    workout_type=WorkoutType(session_data["workout_type"]),
-                    description=session_data["description"],
-                    target_duration_min=session_data["target_duration_min"],
-                    target_load=session_data["target_load"],
-                    target_pace=session_data.get("target_pace"),
-                    target_hr_zone=session_data.get("target_hr_zone"),
-                    intervals=session_data.get("intervals"),
-                    notes=session_data.get("notes"),
-                ))
-
-            weeks.append(TrainingWeek(
-                week_number=week_data["week_number"],
-                phase=TrainingPhase(week_data["phase"]),
-                target_load=week_data["target_load"],
-                sessions=sessions,
-                focus=week_data.get("focus"),
-                notes=week_data.get("notes"),
-                is_cutback=week_data.get("is_cutback", False),
-            ))
+    def _row_to_plan(self, row: sqlite3.Row, weeks: List[TrainingWeek]) -> TrainingPlan:
+        """Convert a database row and its loaded weeks to a TrainingPlan."""
+        goal = self._row_to_goal(row)
 
         # Parse athlete context if available
         athlete_context = None
@@ -223,6 +385,46 @@ class PlanRepository(Repository[TrainingPlan]):
             adaptation_history=adaptation_history,
         )
 
+    def _rows_to_plans(
+        self,
+        conn: sqlite3.Connection,
+        rows: List[sqlite3.Row],
+    ) -> List[TrainingPlan]:
+        """Convert training_plans rows to plans, loading their weeks in one pass."""
+        weeks = self._load_weeks(conn, [row["id"] for row in rows])
+        return [self._row_to_plan(row, weeks[row["id"]]) for row in rows]
+
+    def _row_to_summary(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Build a plan listing entry from the training_plans header alone."""
+        goal = self._row_to_goal(row)
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "goal": {
+                "race_date": goal.race_date.isoformat(),
+                "distance": goal.distance.value,
+                "target_time": goal.target_time_formatted,
+            },
+            "periodization": row["periodization"],
+            "total_weeks": row["total_weeks"],
+            "phases_summary": json.loads(row["phases_summary_json"] or "{}"),
+            "is_active": bool(row["is_active"]),
+            "created_at": row["created_at"],
+        }
+
+    @staticmethod
+    def _encode_cursor(row: sqlite3.Row) -> str:
+        """Encode the listing position after a row."""
+        return f"{row['created_at']}|{row['id']}"
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, str]:
+        """Decode a listing cursor into (created_at, id)."""
+        created_at, sep, plan_id = cursor.partition("|")
+        if not sep or not created_at or not plan_id:
+            raise ValueError(f"Invalid plan cursor: {cursor!r}")
+        return created_at, plan_id
+
     def _plan_to_dict(self, plan: TrainingPlan) -> Dict[str, Any]:
         """Convert a TrainingPlan to a dictionary (for compatibility with routes)."""
         return plan.to_dict()
@@ -243,37 +445,72 @@ class PlanRepository(Repository[TrainingPlan]):
         # Update the updated_at timestamp
         entity.updated_at = datetime.now()
 
-        row = self._plan_to_row(entity)
+        with self._get_connection() as conn:
+            self._write_header(conn, entity)
+            self._write_weeks(conn, entity.id, [w.to_dict() for w in entity.weeks])
+
+        return entity
+
+    def save_weeks(self, entity: TrainingPlan, week_numbers: Sequence[int]) -> TrainingPlan:
+        """
+        Save a plan's header and only the given weeks.
+
+        For plans that grow a few weeks at a time (streamed generation):
+        the rows of the plan's other weeks are left as they are.
+
+        Args:
+            entity: The plan to save
+            week_numbers: Weeks whose rows are (re)written
+
+        Returns:
+            The saved plan
+        """
+        entity.updated_at = datetime.now()
+        numbers = set(week_numbers)
+        weeks = [w.to_dict() for w in entity.weeks if w.week_number in numbers]
 
         with self._get_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO training_plans
-                (id, name, description, goal_json, periodization, peak_week,
-                 total_weeks, weeks_json, athlete_context_json, constraints_json,
-                 phases_summary_json, total_planned_load, is_active,
-                 adaptation_history_json, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                row["id"],
-                row["name"],
-                row["description"],
-                row["goal_json"],
-                row["periodization"],
-                row["peak_week"],
-                row["total_weeks"],
-                row["weeks_json"],
-                row["athlete_context_json"],
-                row["constraints_json"],
-                row["phases_summary_json"],
-                row["total_planned_load"],
-                row["is_active"],
-                row["adaptation_history_json"],
-                row["created_at"],
-                row["updated_at"],
-            ))
+            self._write_header(conn, entity)
+            if numbers:
+                placeholders = ",".join("?" * len(numbers))
+                for table in ("training_plan_sessions", "training_plan_weeks"):
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE plan_id = ? AND week_number IN ({placeholders})",
+                        (entity.id, *numbers),
+                    )
+                self._insert_weeks(conn, entity.id, weeks)
 
         return entity
 
+    def _write_header(self, conn: sqlite3.Connection, entity: TrainingPlan) -> None:
+        """Insert or replace a plan's training_plans row."""
+        row = self._plan_to_row(entity)
+        conn.execute("""
+            INSERT OR REPLACE INTO training_plans
+            (id, name, description, goal_json, periodization, peak_week,
+             total_weeks, weeks_json, athlete_context_json, constraints_json,
+             phases_summary_json, total_planned_load, is_active,
+             adaptation_history_json, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            row["id"],
+            row["name"],
+            row["description"],
+            row["goal_json"],
+            row["periodization"],
+            row["peak_week"],
+            row["total_weeks"],
+            row["weeks_json"],
+            row["athlete_context_json"],
+            row["constraints_json"],
+            row["phases_summary_json"],
+            row["total_planned_load"],
+            row["is_active"],
+            row["adaptation_history_json"],
+            row["created_at"],
+            row["updated_at"],
+        ))
+
     def save_dict(self, plan_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Save a plan from dictionary format (for backward compatibility with routes).
@@ -289,7 +526,6 @@ class PlanRepository(Repository[TrainingPlan]):
         with self._get_connection() as conn:
             # Extract and prepare JSON fields
             goal_json = json.dumps(plan_data["goal"])
-            weeks_json = json.dumps(plan_data.get("weeks", []))
             athlete_context_json = json.dumps(plan_data["athlete_context"]) if plan_data.get("athlete_context") else None
             constraints_json = json.dumps(plan_data["constraints"]) if plan_data.get("constraints") else None
             phases_summary_json = json.dumps(plan_data.get("phases_summary", {}))
@@ -310,7 +546,7 @@ class PlanRepository(Repository[TrainingPlan]):
                 plan_data["periodization"],
                 plan_data["peak_week"],
                 plan_data["total_weeks"],
-                weeks_json,
+                "[]",
                 athlete_context_json,
                 constraints_json,
                 phases_summary_json,
@@ -320,6 +556,7 @@ class PlanRepository(Repository[TrainingPlan]):
                 plan_data["created_at"],
                 plan_data["updated_at"],
             ))
+            self._write_weeks(conn, plan_data["id"], plan_data.get("weeks", []))
 
         return plan_data
 
@@ -340,7 +577,8 @@ class PlanRepository(Repository[TrainingPlan]):
             ).fetchone()
 
             if row:
-                return self._row_to_plan(row)
+                weeks = self._load_weeks(conn, [row["id"]])
+                return self._row_to_plan(row, weeks[row["id"]])
             return None
 
     def get_as_dict(self, entity_id: str) -> Optional[Dict[str, Any]]:
@@ -387,12 +625,12 @@ class PlanRepository(Repository[TrainingPlan]):
             query += " AND periodization = ?"
             params.append(filters["periodization"])
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        query += " ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
-            return [self._row_to_plan(row) for row in rows]
+            return self._rows_to_plans(conn, rows)
 
     def get_all_as_dicts(
         self,
@@ -414,6 +652,154 @@ class PlanRepository(Repository[TrainingPlan]):
         plans = self.get_all(limit=limit, offset=offset, **filters)
         return [self._plan_to_dict(p) for p in plans]
 
+    def list_summaries(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+        active_only: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List plan summaries, newest first, without loading weeks.
+
+        With a cursor (the `next_cursor` of the previous page) the page is
+        found by seeking the (created_at, id) index, so every page costs the
+        same however many plans exist. `offset` is kept for older clients.
+
+        Args:
+            limit: Maximum number of summaries to return
+            cursor: Position returned with the previous page
+            offset: Number of plans to skip when no cursor is given
+            active_only: If True, only list active plans
+
+        Returns:
+            Tuple of (summaries, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = "SELECT * FROM training_plans WHERE 1=1"
+        params: List[Any] = []
+
+        if active_only:
+            query += " AND is_active = 1"
+
+        if cursor:
+            query += " AND (created_at, id) < (?, ?)"
+            params.extend(self._decode_cursor(cursor))
+            offset = 0
+
+        # Fetch one extra row to know whether another page follows
+        query += " ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+        params.extend([limit + 1, offset])
+
+        with self._get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        next_cursor = self._encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+        return [self._row_to_summary(row) for row in rows[:limit]], next_cursor
+
+    def get_week(self, plan_id: str, week_number: int) -> Optional[TrainingWeek]:
+        """
+        Retrieve a single week of a plan.
+
+        Args:
+            plan_id: The plan ID
+            week_number: The week number (1-based)
+
+        Returns:
+            The week if found, None otherwise
+        """
+        with self._get_connection() as conn:
+            weeks = self._load_weeks(conn, [plan_id], week_number=week_number)
+        return weeks[plan_id][0] if weeks[plan_id] else None
+
+    def update_session(
+        self,
+        plan_id: str,
+        week_number: int,
+        session_index: int,
+        **fields: Any,
+    ) -> Optional[PlannedSession]:
+        """
+        Update fields of one planned session in place.
+
+        Only the session's row (and the plan's updated_at) is written.
+
+        Args:
+            plan_id: The plan ID
+            week_number: The week number (1-based)
+            session_index: Position of the session within the week (0-based)
+            **fields: Session fields to change; `workout_type` may be a
+                      WorkoutType or its value and `intervals` a list
+
+        Returns:
+            The updated session, or None if it does not exist
+
+        Raises:
+            ValueError: If a field is not a stored session field
+        """
+        unknown = set(fields) - set(self.SESSION_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown session fields: {', '.join(sorted(unknown))}")
+
+        values = dict(fields)
+        if isinstance(values.get("workout_type"), WorkoutType):
+            values["workout_type"] = values["workout_type"].value
+        if "intervals" in values:
+            intervals = values.pop("intervals")
+            values["intervals_json"] = json.dumps(intervals) if intervals else None
+
+        key = (plan_id, week_number, session_index)
+        with self._get_connection() as conn:
+            if values:
+                assignments = ", ".join(f"{column} = ?" for column in values)
+                cursor = conn.execute(
+                    f"UPDATE training_plan_sessions SET {assignments} "
+                    "WHERE plan_id = ? AND week_number = ? AND session_index = ?",
+                    (*values.values(), *key)
+                )
+                if cursor.rowcount == 0:
+                    return None
+                conn.execute(
+                    "UPDATE training_plans SET updated_at = ? WHERE id = ?",
+                    (datetime.now().isoformat(), plan_id)
+                )
+
+            row = conn.execute(
+                "SELECT * FROM training_plan_sessions "
+                "WHERE plan_id = ? AND week_number = ? AND session_index = ?",
+                key
+            ).fetchone()
+            return self._row_to_session(row) if row else None
+
+    def save_session(
+        self,
+        plan_id: str,
+        week_number: int,
+        session_index: int,
+        session: PlannedSession,
+    ) -> Optional[PlannedSession]:
+        """
+        Overwrite one planned session with the given session.
+
+        Args:
+            plan_id: The plan ID
+            week_number: The week number (1-based)
+            session_index: Position of the session within the week (0-based)
+            session: The new session contents
+
+        Returns:
+            The saved session, or None if the slot does not exist
+        """
+        data = session.to_dict()
+        return self.update_session(
+            plan_id,
+            week_number,
+            session_index,
+            **{name: data[name] for name in self.SESSION_FIELDS},
+        )
+
     def delete(self, entity_id: str) -> bool:
         """
         Delete a training plan by its ID.
@@ -425,6 +811,8 @@ class PlanRepository(Repository[TrainingPlan]):
             True if the plan was deleted, False if not found
         """
         with self._get_connection() as conn:
+            conn.execute("DELETE FROM training_plan_sessions WHERE plan_id = ?", (entity_id,))
+            conn.execute("DELETE FROM training_plan_weeks WHERE plan_id = ?", (entity_id,))
             cursor = conn.execute(
                 "DELETE FROM training_plans WHERE id = ?",
                 (entity_id,)
@@ -483,12 +871,13 @@ class PlanRepository(Repository[TrainingPlan]):
             row = conn.execute("""
                 SELECT * FROM training_plans
                 WHERE is_active = 1
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
                 LIMIT 1
             """).fetchone()
 
             if row:
-                return self._row_to_plan(row)
+                weeks = self._load_weeks(conn, [row["id"]])
+                return self._row_to_plan(row, weeks[row["id"]])
             return None
 
     def set_active(self, plan_id: str) -> bool:
@@ -514,7 +903,7 @@ class PlanRepository(Repository[TrainingPlan]):
                 return False
 
             # Deactivate all plans
-            conn.execute("UPDATE training_plans SET is_active = 0")
+            conn.execute("UPDATE training_plans SET is_active = 0 WHERE is_active = 1")
 
             # Activate the specified plan
             conn.execute(
@@ -556,7 +945,7 @@ class PlanRepository(Repository[TrainingPlan]):
                 ORDER BY json_extract(goal_json, '$.race_date') ASC
                 LIMIT ?
             """, (today, limit)).fetchall()
-            return [self._row_to_plan(row) for row in rows]
+            return self._rows_to_plans(conn, rows)
 
 
 # Singleton instance for dependency injection
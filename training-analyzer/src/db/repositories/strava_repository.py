@@ -11,11 +11,12 @@ The repository automatically:
 - Supports migration from legacy unencrypted storage
 """
 
+import json
 import logging
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from contextlib import contextmanager
 import os
 
@@ -156,11 +157,38 @@ class StravaRepository:
                 )
             """)
 
+            # Bulk import columns: rows with source='import' were discovered
+            # by walking the athlete's Strava history
+            cursor = conn.execute("PRAGMA table_info(strava_activity_sync)")
+            sync_columns = {row[1] for row in cursor.fetchall()}
+            if "source" not in sync_columns:
+                conn.execute(
+                    "ALTER TABLE strava_activity_sync ADD COLUMN source TEXT DEFAULT 'local'"
+                )
+            if "start_date" not in sync_columns:
+                conn.execute(
+                    "ALTER TABLE strava_activity_sync ADD COLUMN start_date TEXT"
+                )
+
+            # Imported activity time series (same shape as Garmin activity details)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS strava_activity_streams (
+                    local_activity_id TEXT PRIMARY KEY,
+                    time_series TEXT NOT NULL,
+                    gps_coordinates TEXT,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
             # Create indexes
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_strava_sync_status
                 ON strava_activity_sync(sync_status)
             """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_strava_sync_import
+                ON strava_activity_sync(source, sync_status, start_date)
+            """)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_strava_activity
                 ON strava_activity_sync(strava_activity_id)
@@ -845,6 +873,161 @@ class StravaRepository:
             }
 
 
+    # =========================================================================
+    # Bulk Import Methods
+    # =========================================================================
+
+    def record_imported_activities(
+        self,
+        activities: List[Tuple[str, int, str]],
+    ) -> int:
+        """
+        Record activities discovered while walking the Strava history.
+
+        New activities are stored as pending so their streams are downloaded
+        later; activities that are already tracked are left untouched.
+
+        Args:
+            activities: (local_activity_id, strava_activity_id, start_date ISO) tuples
+
+        Returns:
+            Number of newly recorded activities
+        """
+        if not activities:
+            return 0
+
+        with self._get_connection() as conn:
+            before = conn.total_changes
+            conn.executemany("""
+                INSERT OR IGNORE INTO strava_activity_sync
+                (local_activity_id, strava_activity_id, sync_status,
+                 source, start_date, created_at)
+                VALUES (?, ?, ?, 'import', ?, CURRENT_TIMESTAMP)
+            """, [
+                (local_id, strava_id, SyncStatus.PENDING.value, start_date)
+                for local_id, strava_id, start_date in activities
+            ])
+            return conn.total_changes - before
+
+    def get_import_bounds(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get the oldest and newest start dates of imported activities.
+
+        These are the import checkpoints: history is resumed before the
+        oldest date and new activities are picked up after the newest.
+
+        Returns:
+            (oldest_start_date, newest_start_date), both None if nothing imported
+        """
+        with self._get_connection() as conn:
+            row = conn.execute("""
+                SELECT MIN(start_date) AS oldest, MAX(start_date) AS newest
+                FROM strava_activity_sync
+                WHERE source = 'import'
+            """).fetchone()
+            return row["oldest"], row["newest"]
+
+    def get_pending_imports(self, limit: int = 100) -> List[StravaActivitySync]:
+        """
+        Get imported activities whose streams have not been downloaded yet.
+
+        Args:
+            limit: Maximum number of records to return
+
+        Returns:
+            Pending records, most recent activities first
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT * FROM strava_activity_sync
+                WHERE source = 'import' AND sync_status = ?
+                ORDER BY start_date DESC
+                LIMIT ?
+            """, (SyncStatus.PENDING.value, limit)).fetchall()
+
+            return [
+                StravaActivitySync(
+                    local_activity_id=row["local_activity_id"],
+                    strava_activity_id=row["strava_activity_id"],
+                    sync_status=SyncStatus(row["sync_status"]),
+                    last_synced_at=row["last_synced_at"],
+                    description_updated=bool(row["description_updated"]),
+                    error_message=row["error_message"],
+                    created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
+                )
+                for row in rows
+            ]
+
+    def get_import_stats(self) -> dict:
+        """
+        Get progress counters for the bulk import.
+
+        Returns:
+            Dictionary with counts per sync status
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT sync_status, COUNT(*) AS count
+                FROM strava_activity_sync
+                WHERE source = 'import'
+                GROUP BY sync_status
+            """).fetchall()
+
+        stats = {status.value: 0 for status in SyncStatus}
+        for row in rows:
+            stats[row["sync_status"]] = row["count"]
+        stats["total"] = sum(stats.values())
+        return stats
+
+    def save_activity_streams(
+        self,
+        local_activity_id: str,
+        time_series: dict,
+        gps_coordinates: Optional[list] = None,
+    ) -> None:
+        """
+        Store the converted time series of an imported activity.
+
+        Args:
+            local_activity_id: The local activity ID
+            time_series: Time series keyed like ActivityTimeSeries
+            gps_coordinates: Optional list of {"lat", "lon"} points
+        """
+        with self._get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO strava_activity_streams
+                (local_activity_id, time_series, gps_coordinates, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, (
+                local_activity_id,
+                json.dumps(time_series, separators=(",", ":")),
+                json.dumps(gps_coordinates or [], separators=(",", ":")),
+            ))
+
+    def get_activity_streams(self, local_activity_id: str) -> Optional[dict]:
+        """
+        Get the stored time series of an imported activity.
+
+        Args:
+            local_activity_id: The local activity ID
+
+        Returns:
+            Dict with "time_series" and "gps_coordinates", or None if not stored
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM strava_activity_streams WHERE local_activity_id = ?",
+                (local_activity_id,)
+            ).fetchone()
+
+        if not row:
+            return None
+        return {
+            "time_series": json.loads(row["time_series"]),
+            "gps_coordinates": json.loads(row["gps_coordinates"] or "[]"),
+        }
+
+
 # Singleton instance for dependency injection
 _strava_repository: Optional[StravaRepository] = None
 
@@ -66,6 +66,100 @@ CREATE INDEX IF NOT EXISTS idx_activity_metrics_sport_type ON activity_metrics(s
 -- Composite indexes for common query patterns
 CREATE INDEX IF NOT EXISTS idx_activity_metrics_date_type ON activity_metrics(date, activity_type);
 
+-- Per-day aggregates behind the training pattern profile (8-week sliding window).
+-- Triggers mark a day stale when its activities change; the pattern service
+-- recomputes stale days on read and evicts days that left the window.
+CREATE TABLE IF NOT EXISTS training_pattern_days (
+    date TEXT PRIMARY KEY,
+    activity_count INTEGER DEFAULT 0,
+    long_run_count INTEGER DEFAULT 0,
+    durations TEXT DEFAULT '[]',             -- JSON list of session minutes (> 0)
+    time_of_day TEXT DEFAULT '{}',           -- JSON {"morning": n, "afternoon": n, "evening": n}
+    sport_mix TEXT DEFAULT '[]',             -- JSON [[sport_type, activity_type, count], ...]
+    run_distance_km REAL DEFAULT 0,
+    load REAL DEFAULT 0,
+    stale INTEGER DEFAULT 1
+);
+
+-- Set once the window has been built from existing history
+CREATE TABLE IF NOT EXISTS training_pattern_profile (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    built_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_pattern_days_insert
+AFTER INSERT ON activity_metrics
+WHEN NEW.date >= date('now', '-60 days')
+BEGIN
+    INSERT INTO training_pattern_days (date, stale) VALUES (NEW.date, 1)
+    ON CONFLICT(date) DO UPDATE SET stale = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pattern_days_update
+AFTER UPDATE ON activity_metrics
+WHEN NEW.date >= date('now', '-60 days') OR OLD.date >= date('now', '-60 days')
+BEGIN
+    INSERT INTO training_pattern_days (date, stale) VALUES (NEW.date, 1)
+    ON CONFLICT(date) DO UPDATE SET stale = 1;
+    INSERT INTO training_pattern_days (date, stale) VALUES (OLD.date, 1)
+    ON CONFLICT(date) DO UPDATE SET stale = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_pattern_days_delete
+AFTER DELETE ON activity_metrics
+WHEN OLD.date >= date('now', '-60 days')
+BEGIN
+    INSERT INTO training_pattern_days (date, stale) VALUES (OLD.date, 1)
+    ON CONFLICT(date) DO UPDATE SET stale = 1;
+END;
+
+-- Per-workout running economy and cardiac drift, computed once per run.
+-- One row per running activity; economy_ratio is NULL when the run lacks
+-- pace/HR or is too short. Drift needs splits or a time series, so it is
+-- only filled when one was available at ingest and survives recomputes.
+-- zones_key records the pace thresholds pace_zone was classified with.
+CREATE TABLE IF NOT EXISTS running_economy (
+    activity_id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    economy_ratio REAL,
+    pace_sec_per_km INTEGER,
+    avg_hr INTEGER,
+    distance_km REAL,
+    duration_min REAL,
+    pace_zone TEXT,
+    zones_key TEXT,
+    first_half_hr REAL,
+    second_half_hr REAL,
+    drift_percent REAL,
+    drift_severity TEXT,
+    stale INTEGER DEFAULT 0,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_running_economy_date ON running_economy(date, economy_ratio);
+CREATE INDEX IF NOT EXISTS idx_running_economy_zone ON running_economy(pace_zone, date);
+
+-- Re-ingested or edited activities are recomputed on the next read
+CREATE TRIGGER IF NOT EXISTS trg_running_economy_insert
+AFTER INSERT ON activity_metrics
+BEGIN
+    UPDATE running_economy SET stale = 1, date = NEW.date
+    WHERE activity_id = NEW.activity_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_running_economy_update
+AFTER UPDATE ON activity_metrics
+BEGIN
+    UPDATE running_economy SET stale = 1, date = NEW.date
+    WHERE activity_id = NEW.activity_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_running_economy_delete
+AFTER DELETE ON activity_metrics
+BEGIN
+    DELETE FROM running_economy WHERE activity_id = OLD.activity_id;
+END;
+
 -- =============================================================================
 -- Phase 2: Multi-sport Extensions - Power Zones Table
 -- =============================================================================
@@ -177,6 +271,79 @@ CREATE TABLE IF NOT EXISTS weekly_summaries (
 CREATE INDEX IF NOT EXISTS idx_race_goals_date ON race_goals(race_date);
 CREATE INDEX IF NOT EXISTS idx_weekly_summaries_start ON weekly_summaries(week_start);
 
+-- ISO-week rollup of activities per user and sport (week_start is the Monday).
+-- Triggers mark a week stale when its activities change; the weekly rollup
+-- service recomputes stale weeks on read. zone*_min are minutes in each HR
+-- zone; active_day_mask has bit n set when there was a session on weekday n
+-- (0 = Monday).
+CREATE TABLE IF NOT EXISTS weekly_rollups (
+    user_id TEXT NOT NULL DEFAULT 'default',
+    week_start TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    session_count INTEGER DEFAULT 0,
+    hard_session_count INTEGER DEFAULT 0,
+    active_day_mask INTEGER DEFAULT 0,
+    distance_km REAL DEFAULT 0,
+    duration_min REAL DEFAULT 0,
+    load REAL DEFAULT 0,
+    elevation_gain_m REAL DEFAULT 0,
+    zone1_min REAL DEFAULT 0,
+    zone2_min REAL DEFAULT 0,
+    zone3_min REAL DEFAULT 0,
+    zone4_min REAL DEFAULT 0,
+    zone5_min REAL DEFAULT 0,
+    longest_session_min REAL DEFAULT 0,
+    longest_distance_km REAL DEFAULT 0,
+    stale INTEGER DEFAULT 1,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, week_start, sport)
+);
+
+CREATE INDEX IF NOT EXISTS idx_weekly_rollups_stale ON weekly_rollups(stale) WHERE stale = 1;
+
+-- Set once the rollup has been built from existing history
+CREATE TABLE IF NOT EXISTS weekly_rollup_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    built_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- INSERT OR REPLACE does not fire delete triggers: mark the replaced row's week here
+CREATE TRIGGER IF NOT EXISTS trg_weekly_rollups_replace
+BEFORE INSERT ON activity_metrics
+BEGIN
+    INSERT INTO weekly_rollups (week_start, sport, stale)
+    SELECT date(date, 'weekday 0', '-6 days'), COALESCE(NULLIF(activity_type, ''), 'other'), 1
+    FROM activity_metrics WHERE activity_id = NEW.activity_id
+    ON CONFLICT(user_id, week_start, sport) DO UPDATE SET stale = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_weekly_rollups_insert
+AFTER INSERT ON activity_metrics
+BEGIN
+    INSERT INTO weekly_rollups (week_start, sport, stale)
+    VALUES (date(NEW.date, 'weekday 0', '-6 days'), COALESCE(NULLIF(NEW.activity_type, ''), 'other'), 1)
+    ON CONFLICT(user_id, week_start, sport) DO UPDATE SET stale = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_weekly_rollups_update
+AFTER UPDATE ON activity_metrics
+BEGIN
+    INSERT INTO weekly_rollups (week_start, sport, stale)
+    VALUES (date(NEW.date, 'weekday 0', '-6 days'), COALESCE(NULLIF(NEW.activity_type, ''), 'other'), 1)
+    ON CONFLICT(user_id, week_start, sport) DO UPDATE SET stale = 1;
+    INSERT INTO weekly_rollups (week_start, sport, stale)
+    VALUES (date(OLD.date, 'weekday 0', '-6 days'), COALESCE(NULLIF(OLD.activity_type, ''), 'other'), 1)
+    ON CONFLICT(user_id, week_start, sport) DO UPDATE SET stale = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_weekly_rollups_delete
+AFTER DELETE ON activity_metrics
+BEGIN
+    INSERT INTO weekly_rollups (week_start, sport, stale)
+    VALUES (date(OLD.date, 'weekday 0', '-6 days'), COALESCE(NULLIF(OLD.activity_type, ''), 'other'), 1)
+    ON CONFLICT(user_id, week_start, sport) DO UPDATE SET stale = 1;
+END;
+
 -- =============================================================================
 -- Phase 1: Database Persistence - New Tables
 -- =============================================================================
@@ -208,7 +375,7 @@ CREATE TABLE IF NOT EXISTS training_plans (
     periodization TEXT NOT NULL,        -- linear, reverse, block, undulating
     peak_week INTEGER NOT NULL,
     total_weeks INTEGER NOT NULL,
-    weeks_json TEXT NOT NULL,          -- JSON array of training weeks
+    weeks_json TEXT NOT NULL,          -- Legacy; weeks live in training_plan_weeks
     athlete_context_json TEXT,         -- JSON object with athlete context
     constraints_json TEXT,             -- JSON object with plan constraints
     phases_summary_json TEXT,          -- JSON object with phase counts
@@ -221,8 +388,38 @@ CREATE TABLE IF NOT EXISTS training_plans (
 
 -- Indexes for efficient plan queries
 CREATE INDEX IF NOT EXISTS idx_training_plans_created_at ON training_plans(created_at);
-CREATE INDEX IF NOT EXISTS idx_training_plans_is_active ON training_plans(is_active);
 CREATE INDEX IF NOT EXISTS idx_training_plans_goal_race_date ON training_plans(json_extract(goal_json, '$.race_date'));
+CREATE INDEX IF NOT EXISTS idx_training_plans_listing ON training_plans(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_training_plans_active_listing ON training_plans(created_at DESC, id DESC) WHERE is_active = 1;
+CREATE INDEX IF NOT EXISTS idx_training_plans_legacy_weeks ON training_plans(id) WHERE weeks_json != '[]';
+
+-- Plan weeks and sessions, one row each (training_plans.weeks_json is legacy)
+CREATE TABLE IF NOT EXISTS training_plan_weeks (
+    plan_id TEXT NOT NULL,
+    week_number INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    target_load REAL NOT NULL,
+    focus TEXT,
+    notes TEXT,
+    is_cutback INTEGER DEFAULT 0,
+    PRIMARY KEY (plan_id, week_number)
+);
+
+CREATE TABLE IF NOT EXISTS training_plan_sessions (
+    plan_id TEXT NOT NULL,
+    week_number INTEGER NOT NULL,
+    session_index INTEGER NOT NULL,    -- 0-based position within the week
+    day_of_week INTEGER NOT NULL,
+    workout_type TEXT NOT NULL,
+    description TEXT NOT NULL,
+    target_duration_min INTEGER NOT NULL,
+    target_load REAL NOT NULL,
+    target_pace TEXT,
+    target_hr_zone TEXT,
+    intervals_json TEXT,               -- JSON array of structured intervals
+    notes TEXT,
+    PRIMARY KEY (plan_id, week_number, session_index)
+);
 
 -- Workout analyses - permanent storage for AI-generated workout insights
 CREATE TABLE IF NOT EXISTS workout_analyses (
@@ -304,12 +501,13 @@ CREATE TABLE IF NOT EXISTS achievements (
 -- User achievement unlocks
 CREATE TABLE IF NOT EXISTS user_achievements (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL DEFAULT 'default',
     achievement_id TEXT NOT NULL,
     unlocked_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
     workout_id TEXT,
     metadata_json TEXT,
     FOREIGN KEY (achievement_id) REFERENCES achievements(id),
-    UNIQUE(achievement_id)
+    UNIQUE(user_id, achievement_id)
 );
 
 -- User progress tracking
@@ -324,6 +522,99 @@ CREATE TABLE IF NOT EXISTS user_progress (
     updated_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Per-user achievement counters, updated incrementally as activities are ingested
+-- (streak counters live in user_progress)
+CREATE TABLE IF NOT EXISTS achievement_ledger (
+    user_id TEXT PRIMARY KEY,
+    workout_count INTEGER DEFAULT 0,
+    interval_workout_count INTEGER DEFAULT 0,
+    zone5_minutes REAL DEFAULT 0,
+    vo2max_latest REAL DEFAULT 0,
+    vo2max_baseline REAL DEFAULT 0,
+    vo2max_peak REAL DEFAULT 0,
+    vo2max_previous_peak REAL DEFAULT 0,
+    vo2max_week TEXT,                        -- Monday of the latest VO2 Max reading
+    vo2max_week_value REAL DEFAULT 0,
+    vo2max_prior_week_value REAL DEFAULT 0,
+    vo2max_trend_weeks INTEGER DEFAULT 0,
+    ctl_latest REAL DEFAULT 0,
+    ctl_peak REAL DEFAULT 0,
+    ctl_previous_peak REAL DEFAULT 0,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Activities already counted in a user's ledger (makes ingestion idempotent).
+-- activity_metrics has no user column, so this is also what ties an activity
+-- to a user: activities nobody recorded belong to the local athlete
+-- ('default'), whose ledger claims them when it is rebuilt.
+CREATE TABLE IF NOT EXISTS achievement_ledger_activities (
+    user_id TEXT NOT NULL,
+    activity_id TEXT NOT NULL,
+    PRIMARY KEY (user_id, activity_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_achievement_ledger_activities_activity
+    ON achievement_ledger_activities(activity_id);
+
+-- Triggers drop the ledger of every user an activity change affects; the
+-- achievement service rebuilds a missing ledger on read. Ingestion paths
+-- that never call record_activity are covered this way.
+
+-- A user recording an activity takes it over from the local athlete
+CREATE TRIGGER IF NOT EXISTS trg_achievement_ledger_claim
+AFTER INSERT ON achievement_ledger_activities
+WHEN NEW.user_id != 'default'
+BEGIN
+    DELETE FROM achievement_ledger_activities
+    WHERE user_id = 'default' AND activity_id = NEW.activity_id;
+    DELETE FROM achievement_ledger WHERE user_id = 'default';
+END;
+
+-- New activities nobody recorded yet count for the local athlete
+CREATE TRIGGER IF NOT EXISTS trg_achievement_ledger_activity_insert
+AFTER INSERT ON activity_metrics
+WHEN NOT EXISTS (
+    SELECT 1 FROM achievement_ledger_activities WHERE activity_id = NEW.activity_id
+)
+BEGIN
+    DELETE FROM achievement_ledger WHERE user_id = 'default';
+END;
+
+-- INSERT OR REPLACE does not fire delete triggers: compare with the replaced
+-- row here, so re-syncing an unchanged activity keeps the ledger
+CREATE TRIGGER IF NOT EXISTS trg_achievement_ledger_activity_replace
+BEFORE INSERT ON activity_metrics
+WHEN EXISTS (
+    SELECT 1 FROM activity_metrics
+    WHERE activity_id = NEW.activity_id
+      AND (date IS NOT NEW.date
+           OR duration_min IS NOT NEW.duration_min
+           OR zone4_pct IS NOT NEW.zone4_pct
+           OR zone5_pct IS NOT NEW.zone5_pct)
+)
+BEGIN
+    DELETE FROM achievement_ledger WHERE user_id IN (
+        SELECT user_id FROM achievement_ledger_activities WHERE activity_id = NEW.activity_id
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_achievement_ledger_activity_update
+AFTER UPDATE OF activity_id, date, duration_min, zone4_pct, zone5_pct ON activity_metrics
+BEGIN
+    DELETE FROM achievement_ledger WHERE user_id IN (
+        SELECT user_id FROM achievement_ledger_activities
+        WHERE activity_id IN (OLD.activity_id, NEW.activity_id)
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_achievement_ledger_activity_delete
+AFTER DELETE ON activity_metrics
+BEGIN
+    DELETE FROM achievement_ledger WHERE user_id IN (
+        SELECT user_id FROM achievement_ledger_activities WHERE activity_id = OLD.activity_id
+    );
+END;
+
 -- Create indexes for gamification tables
 CREATE INDEX IF NOT EXISTS idx_user_achievements_unlocked ON user_achievements(unlocked_at);
 CREATE INDEX IF NOT EXISTS idx_achievements_category ON achievements(category);
@@ -366,7 +657,17 @@ CREATE TABLE IF NOT EXISTS strava_activity_sync (
     last_synced_at TEXT,
     description_updated BOOLEAN DEFAULT FALSE,
     error_message TEXT,
-    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    source TEXT DEFAULT 'local',   -- 'local' (description sync) or 'import' (history import)
+    start_date TEXT                -- Strava start time, set for imported activities
+);
+
+-- Time series of activities imported from Strava
+CREATE TABLE IF NOT EXISTS strava_activity_streams (
+    local_activity_id TEXT PRIMARY KEY,
+    time_series TEXT NOT NULL,     -- JSON keyed like the activity details time series
+    gps_coordinates TEXT,          -- JSON list of {lat, lon}
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
 );
 
 -- OAuth state tokens for CSRF protection (database-backed for multi-instance support)
@@ -486,6 +787,7 @@ CREATE TABLE IF NOT EXISTS garmin_credentials (
     encryption_key_id TEXT NOT NULL,        -- Reference for key rotation
     garmin_user_id TEXT,
     garmin_display_name TEXT,
+    session_data TEXT,                      -- Encrypted Garmin OAuth tokens (reused across syncs)
     is_valid INTEGER DEFAULT 1,
     last_validation_at TEXT,
     validation_error TEXT,
@@ -537,6 +839,50 @@ CREATE TABLE IF NOT EXISTS garmin_sync_history (
 CREATE INDEX IF NOT EXISTS idx_sync_history_user ON garmin_sync_history(user_id);
 CREATE INDEX IF NOT EXISTS idx_sync_history_started ON garmin_sync_history(started_at DESC);
 
+-- Durable background sync jobs (survive restarts, one active job per range)
+CREATE TABLE IF NOT EXISTS sync_jobs (
+    id TEXT PRIMARY KEY,                    -- UUID
+    user_key TEXT NOT NULL,                 -- User ID, or Garmin email for ad-hoc syncs
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending', -- 'pending', 'running', 'completed', 'failed'
+    progress_percent INTEGER DEFAULT 0,
+    current_step TEXT,
+    activities_synced INTEGER DEFAULT 0,
+    fitness_days_synced INTEGER DEFAULT 0,
+    chunks_total INTEGER DEFAULT 0,
+    chunks_done INTEGER DEFAULT 0,
+    encrypted_credentials TEXT,             -- Cleared once the job finishes
+    worker_id TEXT,                         -- Process currently running the job
+    heartbeat_at TEXT,                      -- Lease; stale leases are resumed
+    error TEXT,
+    result_json TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    started_at TEXT,
+    completed_at TEXT
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sync_jobs_active
+    ON sync_jobs(user_key, start_date, end_date)
+    WHERE status IN ('pending', 'running');
+CREATE INDEX IF NOT EXISTS idx_sync_jobs_status ON sync_jobs(status);
+
+-- Date windows of a sync job, completed independently so work resumes
+CREATE TABLE IF NOT EXISTS sync_job_chunks (
+    job_id TEXT NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending', -- 'pending', 'completed'
+    attempts INTEGER DEFAULT 0,
+    activities_synced INTEGER DEFAULT 0,
+    fitness_days_synced INTEGER DEFAULT 0,
+    error TEXT,
+    completed_at TEXT,
+    PRIMARY KEY (job_id, chunk_index),
+    FOREIGN KEY (job_id) REFERENCES sync_jobs(id) ON DELETE CASCADE
+);
+
 -- =============================================================================
 -- User Consent Tracking
 -- =============================================================================
@@ -581,6 +927,26 @@ CREATE INDEX IF NOT EXISTS idx_manual_workouts_user ON manual_workouts(user_id);
 CREATE INDEX IF NOT EXISTS idx_manual_workouts_date ON manual_workouts(date);
 CREATE INDEX IF NOT EXISTS idx_manual_workouts_user_date ON manual_workouts(user_id, date);
 
+-- Manual workouts count towards their user's achievement ledger, which is
+-- rebuilt on read once dropped here
+CREATE TRIGGER IF NOT EXISTS trg_achievement_ledger_manual_insert
+AFTER INSERT ON manual_workouts
+BEGIN
+    DELETE FROM achievement_ledger WHERE user_id = NEW.user_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_achievement_ledger_manual_update
+AFTER UPDATE ON manual_workouts
+BEGIN
+    DELETE FROM achievement_ledger WHERE user_id IN (OLD.user_id, NEW.user_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_achievement_ledger_manual_delete
+AFTER DELETE ON manual_workouts
+BEGIN
+    DELETE FROM achievement_ledger WHERE user_id = OLD.user_id;
+END;
+
 -- =============================================================================
 -- User Preferences (Beginner Mode, UI Settings)
 -- =============================================================================
@@ -698,6 +1064,123 @@ CREATE TABLE IF NOT EXISTS wellness_resting_hr (
 -- Create index for resting HR queries
 CREATE INDEX IF NOT EXISTS idx_wellness_rhr_date ON wellness_resting_hr(date);
 CREATE INDEX IF NOT EXISTS idx_wellness_rhr_user ON wellness_resting_hr(user_id);
+
+-- =============================================================================
+-- Explanation Factor Cache
+-- =============================================================================
+
+-- Recency and wellness factors behind the explain endpoints, one JSON set
+-- per user and day. A day's factors only depend on data dated on or before
+-- it, so a new or changed activity or wellness day drops the cached sets
+-- from its date onwards for every user: activities carry no user and the
+-- wellness tables hold one row per day whichever user synced it.
+CREATE TABLE IF NOT EXISTS explanation_factors (
+    user_id TEXT NOT NULL DEFAULT 'default',
+    date TEXT NOT NULL,
+    factors TEXT NOT NULL,                     -- JSON ExplanationFactors
+    computed_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, date)
+);
+
+CREATE INDEX IF NOT EXISTS idx_explanation_factors_date ON explanation_factors(date);
+
+-- INSERT OR REPLACE does not fire delete triggers: cover the replaced row's date here
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_activity_replace
+BEFORE INSERT ON activity_metrics
+BEGIN
+    DELETE FROM explanation_factors
+    WHERE date >= (SELECT date FROM activity_metrics WHERE activity_id = NEW.activity_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_activity_insert
+AFTER INSERT ON activity_metrics
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= NEW.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_activity_update
+AFTER UPDATE ON activity_metrics
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= MIN(OLD.date, NEW.date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_activity_delete
+AFTER DELETE ON activity_metrics
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= OLD.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_sleep_insert
+AFTER INSERT ON wellness_sleep
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= NEW.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_sleep_update
+AFTER UPDATE ON wellness_sleep
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= MIN(OLD.date, NEW.date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_sleep_delete
+AFTER DELETE ON wellness_sleep
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= OLD.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_hrv_insert
+AFTER INSERT ON wellness_hrv
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= NEW.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_hrv_update
+AFTER UPDATE ON wellness_hrv
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= MIN(OLD.date, NEW.date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_hrv_delete
+AFTER DELETE ON wellness_hrv
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= OLD.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_stress_insert
+AFTER INSERT ON wellness_stress
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= NEW.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_stress_update
+AFTER UPDATE ON wellness_stress
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= MIN(OLD.date, NEW.date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_stress_delete
+AFTER DELETE ON wellness_stress
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= OLD.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_resting_hr_insert
+AFTER INSERT ON wellness_resting_hr
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= NEW.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_resting_hr_update
+AFTER UPDATE ON wellness_resting_hr
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= MIN(OLD.date, NEW.date);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_explanation_factors_resting_hr_delete
+AFTER DELETE ON wellness_resting_hr
+BEGIN
+    DELETE FROM explanation_factors WHERE date >= OLD.date;
+END;
 """
 
 # Separate schema for updating user profile
@@ -38,6 +38,9 @@ class ErrorCode(str, Enum):
     PLAN_ADAPTATION_FAILED = "PLAN_ADAPTATION_FAILED"
     PLAN_ALREADY_ACTIVE = "PLAN_ALREADY_ACTIVE"
 
+    # Chat errors (3100-3199)
+    CONVERSATION_NOT_FOUND = "CONVERSATION_NOT_FOUND"
+
     # LLM errors (4000-4099)
     LLM_SERVICE_UNAVAILABLE = "LLM_SERVICE_UNAVAILABLE"
     LLM_RATE_LIMITED = "LLM_RATE_LIMITED"
@@ -197,6 +200,18 @@ class PlanNotFoundError(NotFoundError):
         self.code = ErrorCode.PLAN_NOT_FOUND
 
 
+class ConversationNotFoundError(NotFoundError):
+    """Raised when a chat conversation is not found or belongs to another user."""
+
+    def __init__(self, conversation_id: str, details: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__(
+            resource_type="Conversation",
+            resource_id=conversation_id,
+            details=details,
+        )
+        self.code = ErrorCode.CONVERSATION_NOT_FOUND
+
+
 # ============================================================================
 # Conflict Errors (409)
 # ============================================================================
@@ -76,7 +76,13 @@ class OAuthCredentials:
     def needs_refresh(self) -> bool:
         """Check if token needs refresh."""
         return self.is_expired and self.refresh_token is not None
-    
+
+    def expires_within(self, margin: timedelta) -> bool:
+        """Check if the token expires within the given margin."""
+        if self.expires_at is None:
+            return False
+        return datetime.now() >= (self.expires_at - margin)
+
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
         return {
@@ -20,6 +20,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import secrets
 import base64
 
+import httpx
+
 from .base import (
     AuthenticationError,
     IntegrationClient,
@@ -28,6 +30,7 @@ from .base import (
     OAuthFlow,
     RateLimitError,
 )
+from .http_pool import ProviderHTTPPool, get_http_pool
 
 
 # Garmin uses OAuth 1.0a, so we need different credential handling
@@ -329,10 +332,38 @@ class GarminConnectClient:
     BASE_URL = "https://connect.garmin.com"
     API_URL = "https://connectapi.garmin.com"
     
-    def __init__(self, credentials: GarminCredentials):
+    def __init__(
+        self,
+        credentials: GarminCredentials,
+        http_pool: Optional[ProviderHTTPPool] = None,
+    ):
         if not credentials.is_authenticated:
             raise AuthenticationError("Garmin credentials not authenticated", "garmin")
         self.credentials = credentials
+        self._pool = http_pool or get_http_pool(self.provider)
+    
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Sign and send a request over the shared Garmin connection pool.
+        
+        Each request is signed individually (OAuth 1.0a nonces are single
+        use) but reuses pooled keep-alive connections.
+        """
+        headers = self._sign_request(method, url, params)
+        async with self._pool.slot() as client:
+            return await client.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json_data,
+            )
     
     def _sign_request(
         self,
@@ -393,7 +424,7 @@ class GarminConnectClient:
         headers = self._sign_request("GET", url)
         
         # In production, make actual HTTP request
-        # response = await httpx.get(url, headers=headers)
+        # response = await self._request("GET", url)
         
         return {
             "user_id": self.credentials.user_id,
@@ -429,7 +460,7 @@ class GarminConnectClient:
         headers = self._sign_request("GET", url, params)
         
         # In production, make actual HTTP request
-        # response = await httpx.get(url, headers=headers, params=params)
+        # response = await self._request("GET", url, params)
         
         return []  # Would return parsed activities
     
@@ -535,7 +566,7 @@ class GarminWorkoutPush:
         headers["Content-Type"] = "application/json"
         
         # In production:
-        # response = await httpx.post(url, headers=headers, json=workout_data)
+        # response = await self.client._request("POST", url, json_data=workout_data)
         # return response.json()["workoutId"]
         
         return "placeholder_workout_id"
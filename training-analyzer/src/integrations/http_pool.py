@@ -0,0 +1,342 @@
+"""
+Shared HTTP connection pools for external integrations.
+
+Every integration client used to open its own httpx.AsyncClient, so each
+request paid for a fresh TLS handshake and each client tracked provider rate
+limits on its own. This module keeps one pool per provider per process with:
+- Keep-alive connections (and HTTP/2 when the optional `h2` package is installed)
+- Bounded request concurrency
+- A rate-limit budget shared by every client of the provider
+- Single-flight, proactive OAuth token refresh
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from .base import OAuthCredentials, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+# HTTP/2 is only available when the optional `h2` package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Refresh OAuth tokens this long before they expire
+TOKEN_REFRESH_MARGIN = timedelta(minutes=15)
+
+
+class RateLimitBudget:
+    """
+    Process-wide view of a provider's rate limits.
+
+    Mirrors Strava's model of a short window (15 minutes, resetting on the
+    quarter hour) and a daily window (resetting at midnight UTC). Usage is
+    counted locally as requests are sent and corrected from the provider's
+    response headers, so concurrent clients never overshoot the limit.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        limit_15min: int = 200,
+        limit_daily: int = 2000,
+        window: timedelta = timedelta(minutes=15),
+    ):
+        self.provider = provider
+        self.limit_15min = limit_15min
+        self.limit_daily = limit_daily
+        self.usage_15min = 0
+        self.usage_daily = 0
+        self._window = window
+        self._window_start: Optional[datetime] = None
+        self._day: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def _window_start_for(self, now: datetime) -> datetime:
+        """Start of the short window containing `now`."""
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        elapsed = now - day_start
+        windows = int(elapsed.total_seconds() // self._window.total_seconds())
+        return day_start + windows * self._window
+
+    def _roll(self, now: datetime) -> None:
+        """Reset usage counters whose window has elapsed."""
+        window_start = self._window_start_for(now)
+        if self._window_start != window_start:
+            self._window_start = window_start
+            self.usage_15min = 0
+        day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if self._day != day:
+            self._day = day
+            self.usage_daily = 0
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    def remaining(self, now: Optional[datetime] = None) -> Tuple[int, int]:
+        """Get remaining (15-minute, daily) requests."""
+        with self._lock:
+            self._roll(now or self._now())
+            return (
+                max(0, self.limit_15min - self.usage_15min),
+                max(0, self.limit_daily - self.usage_daily),
+            )
+
+    @property
+    def remaining_15min(self) -> int:
+        """Remaining requests in the current 15-minute window."""
+        return self.remaining()[0]
+
+    @property
+    def remaining_daily(self) -> int:
+        """Remaining requests in the current day."""
+        return self.remaining()[1]
+
+    def seconds_until_available(self, now: Optional[datetime] = None) -> float:
+        """Seconds until at least one request may be sent (0 if now)."""
+        now = now or self._now()
+        with self._lock:
+            self._roll(now)
+            if self.usage_daily >= self.limit_daily:
+                next_day = self._day + timedelta(days=1)
+                return (next_day - now).total_seconds()
+            if self.usage_15min >= self.limit_15min:
+                next_window = self._window_start + self._window
+                return (next_window - now).total_seconds()
+            return 0.0
+
+    def seconds_until_reset(self, daily: bool = False, now: Optional[datetime] = None) -> float:
+        """Seconds until the next 15-minute (or daily) window starts."""
+        now = now or self._now()
+        with self._lock:
+            self._roll(now)
+            if daily:
+                return (self._day + timedelta(days=1) - now).total_seconds()
+            return (self._window_start + self._window - now).total_seconds()
+
+    def try_acquire(self, now: Optional[datetime] = None) -> float:
+        """
+        Reserve one request if the budget allows it.
+
+        Returns:
+            0 if a request was reserved, otherwise seconds until one can be
+        """
+        now = now or self._now()
+        with self._lock:
+            self._roll(now)
+            if self.usage_daily < self.limit_daily and self.usage_15min < self.limit_15min:
+                self.usage_15min += 1
+                self.usage_daily += 1
+                return 0.0
+        return self.seconds_until_available(now)
+
+    async def acquire(self, max_wait: float) -> None:
+        """
+        Reserve one request, waiting for the next window if needed.
+
+        Args:
+            max_wait: Longest acceptable wait in seconds
+
+        Raises:
+            RateLimitError: If the budget frees up later than max_wait
+        """
+        while True:
+            wait = self.try_acquire()
+            if wait <= 0:
+                return
+            if wait > max_wait:
+                raise RateLimitError(
+                    f"{self.provider} rate limit budget exhausted",
+                    self.provider,
+                    int(wait) + 1,
+                )
+            await asyncio.sleep(wait)
+
+    def update(
+        self,
+        limits: Optional[Tuple[int, int]] = None,
+        usage: Optional[Tuple[int, int]] = None,
+        now: Optional[datetime] = None,
+    ) -> None:
+        """Apply authoritative limits/usage reported by the provider."""
+        with self._lock:
+            self._roll(now or self._now())
+            if limits:
+                self.limit_15min, self.limit_daily = limits
+            if usage:
+                self.usage_15min, self.usage_daily = usage
+
+    def mark_exhausted(self, now: Optional[datetime] = None) -> None:
+        """Treat the short window as used up (e.g. after an HTTP 429)."""
+        with self._lock:
+            self._roll(now or self._now())
+            self.usage_15min = self.limit_15min
+
+
+class ProviderHTTPPool:
+    """
+    Shared httpx client, concurrency limit and rate budget for one provider.
+
+    httpx clients and asyncio primitives are bound to the event loop they
+    were created on, so they are rebuilt transparently if the running loop
+    changes (e.g. between test cases or worker restarts).
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        timeout: float = 30.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        max_concurrency: int = 8,
+        rate_budget: Optional[RateLimitBudget] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.provider = provider
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.rate_budget = rate_budget or RateLimitBudget(provider)
+        self._transport = transport
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._refresh_locks: Dict[str, asyncio.Lock] = {}
+        self._fresh_credentials: Dict[str, OAuthCredentials] = {}
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Get the shared client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self._limits,
+                http2=HTTP2_AVAILABLE,
+                transport=self._transport,
+            )
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._refresh_locks = {}
+        return self._client
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Hold one of the pool's concurrency slots while making a request."""
+        client = self.get_client()
+        async with self._semaphore:
+            yield client
+
+    async def ensure_fresh_token(
+        self,
+        key: str,
+        credentials: OAuthCredentials,
+        refresh: Callable[[OAuthCredentials], Awaitable[OAuthCredentials]],
+        margin: timedelta = TOKEN_REFRESH_MARGIN,
+        force: bool = False,
+    ) -> OAuthCredentials:
+        """
+        Refresh credentials ahead of expiry, at most once per key at a time.
+
+        Concurrent callers for the same athlete wait for the refresh in
+        flight and then reuse its result instead of refreshing again.
+
+        Args:
+            key: Identifies the token owner (e.g. user ID)
+            credentials: Credentials the caller currently holds
+            refresh: Coroutine performing the refresh (and persisting it)
+            margin: Refresh when the token expires within this window
+            force: Refresh even if the token looks valid (e.g. after a 401)
+
+        Returns:
+            Valid credentials
+        """
+        if not force and not credentials.expires_within(margin):
+            return credentials
+        if not credentials.refresh_token:
+            return credentials
+
+        self.get_client()
+        lock = self._refresh_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._fresh_credentials.get(key)
+            if (
+                cached is not None
+                and cached.access_token != credentials.access_token
+                and not cached.expires_within(margin)
+            ):
+                return cached
+
+            refreshed = await refresh(credentials)
+            self._fresh_credentials[key] = refreshed
+            logger.info(f"Refreshed {self.provider} token for {key}")
+            return refreshed
+
+    async def aclose(self) -> None:
+        """Close the shared client if it belongs to the running loop."""
+        client, self._client = self._client, None
+        if client is None or client.is_closed:
+            return
+        try:
+            if self._loop is asyncio.get_running_loop():
+                await client.aclose()
+        except RuntimeError:
+            pass
+
+
+# Pool settings per provider. Strava allows 200 requests per 15 minutes and
+# 2,000 per day for the whole application, across all athletes.
+POOL_DEFAULTS: Dict[str, Dict[str, int]] = {
+    "strava": {"max_concurrency": 8, "limit_15min": 200, "limit_daily": 2000},
+    "garmin": {"max_concurrency": 4, "limit_15min": 1000, "limit_daily": 20000},
+}
+
+_pools: Dict[str, ProviderHTTPPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_http_pool(provider: str) -> ProviderHTTPPool:
+    """Get the process-wide HTTP pool for a provider."""
+    with _pools_lock:
+        pool = _pools.get(provider)
+        if pool is None:
+            defaults = POOL_DEFAULTS.get(provider, {})
+            pool = ProviderHTTPPool(
+                provider,
+                max_concurrency=defaults.get("max_concurrency", 8),
+                rate_budget=RateLimitBudget(
+                    provider,
+                    limit_15min=defaults.get("limit_15min", 200),
+                    limit_daily=defaults.get("limit_daily", 2000),
+                ),
+            )
+            _pools[provider] = pool
+        return pool
+
+
+async def close_http_pools() -> None:
+    """Close all provider pools (call on application shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        await pool.aclose()
+
+
+def reset_http_pools() -> None:
+    """Drop all provider pools without closing them (for testing)."""
+    with _pools_lock:
+        _pools.clear()
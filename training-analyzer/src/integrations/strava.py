@@ -14,7 +14,7 @@ import urllib.parse
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import httpx
 
@@ -26,6 +26,7 @@ from .base import (
     OAuthFlow,
     RateLimitError,
 )
+from .http_pool import TOKEN_REFRESH_MARGIN, ProviderHTTPPool, RateLimitBudget, get_http_pool
 
 
 class ActivityNotFoundError(IntegrationError):
@@ -331,23 +332,23 @@ class StravaOAuthFlow(OAuthFlow):
         Raises:
             AuthenticationError: If code exchange fails
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.token_url,
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "code": code,
-                    "grant_type": "authorization_code",
-                },
-            )
+        client = get_http_pool(self.provider).get_client()
+        response = await client.post(
+            self.token_url,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "code": code,
+                "grant_type": "authorization_code",
+            },
+        )
 
-            if response.status_code != 200:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get("message", f"Token exchange failed: {response.status_code}")
-                raise AuthenticationError(error_msg, "strava")
+        if response.status_code != 200:
+            error_data = response.json() if response.content else {}
+            error_msg = error_data.get("message", f"Token exchange failed: {response.status_code}")
+            raise AuthenticationError(error_msg, "strava")
 
-            data = response.json()
+        data = response.json()
 
         athlete = data.get("athlete", {})
         firstname = athlete.get("firstname", "")
@@ -381,23 +382,23 @@ class StravaOAuthFlow(OAuthFlow):
         if not credentials.refresh_token:
             raise AuthenticationError("No refresh token available", "strava")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.token_url,
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "refresh_token": credentials.refresh_token,
-                    "grant_type": "refresh_token",
-                },
-            )
+        client = get_http_pool(self.provider).get_client()
+        response = await client.post(
+            self.token_url,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": credentials.refresh_token,
+                "grant_type": "refresh_token",
+            },
+        )
 
-            if response.status_code != 200:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get("message", f"Token refresh failed: {response.status_code}")
-                raise AuthenticationError(error_msg, "strava")
+        if response.status_code != 200:
+            error_data = response.json() if response.content else {}
+            error_msg = error_data.get("message", f"Token refresh failed: {response.status_code}")
+            raise AuthenticationError(error_msg, "strava")
 
-            data = response.json()
+        data = response.json()
 
         return OAuthCredentials(
             provider=self.provider,
@@ -424,9 +425,10 @@ class StravaClient(IntegrationClient):
     - Athlete stats
     - Route downloads
 
-    Rate limits (Strava API):
+    Rate limits (Strava API, per application):
     - 15-minute limit: 200 requests
     - Daily limit: 2,000 requests
+    Usage is tracked in the shared Strava HTTP pool, not per client.
 
     Usage:
         credentials = await oauth_flow.exchange_code(code)
@@ -437,29 +439,43 @@ class StravaClient(IntegrationClient):
     provider = "strava"
     base_url = "https://www.strava.com/api/v3"
 
-    # Rate limit tracking
-    _rate_limit_15min: int = 200
-    _rate_limit_daily: int = 2000
-    _rate_limit_usage_15min: int = 0
-    _rate_limit_usage_daily: int = 0
+    def __init__(
+        self,
+        credentials: OAuthCredentials,
+        token_refresher: Optional[Callable[[OAuthCredentials], Awaitable[OAuthCredentials]]] = None,
+        http_pool: Optional[ProviderHTTPPool] = None,
+        max_rate_limit_wait: float = 60.0,
+    ):
+        """
+        Initialize the Strava client.
 
-    def __init__(self, credentials: OAuthCredentials):
+        Args:
+            credentials: Strava OAuth credentials
+            token_refresher: Coroutine that refreshes (and persists) credentials.
+                When given, tokens are refreshed shortly before they expire and
+                once more if the API rejects them.
+            http_pool: Connection pool to use (defaults to the shared Strava pool)
+            max_rate_limit_wait: Longest time in seconds to wait for the shared
+                rate budget before raising RateLimitError
+        """
         if credentials.provider != "strava":
             raise ValueError("Credentials must be for Strava")
         super().__init__(credentials)
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self._pool = http_pool or get_http_pool(self.provider)
+        self._token_refresher = token_refresher
+        self._max_rate_limit_wait = max_rate_limit_wait
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._http_client is None or self._http_client.is_closed:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
-        return self._http_client
+        """Get the shared, keep-alive HTTP client."""
+        return self._pool.get_client()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._http_client is not None and not self._http_client.is_closed:
-            await self._http_client.aclose()
-            self._http_client = None
+        """
+        Release the client.
+
+        Connections belong to the shared pool and stay open for reuse; they
+        are closed on application shutdown via close_http_pools().
+        """
 
     async def __aenter__(self) -> "StravaClient":
         return self
@@ -467,6 +483,19 @@ class StravaClient(IntegrationClient):
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
 
+    async def _ensure_fresh_token(self, force: bool = False) -> None:
+        """Refresh the access token if it is about to expire."""
+        if self._token_refresher is None:
+            return
+        key = self.credentials.user_id or self.credentials.refresh_token or ""
+        self.credentials = await self._pool.ensure_fresh_token(
+            key,
+            self.credentials,
+            self._token_refresher,
+            margin=TOKEN_REFRESH_MARGIN,
+            force=force,
+        )
+
     async def _request(
         self,
         method: str,
@@ -478,6 +507,11 @@ class StravaClient(IntegrationClient):
         """
         Make an API request with rate limit handling.
 
+        Requests go through the shared Strava pool: they reuse keep-alive
+        connections, respect the pool's concurrency limit and draw from the
+        process-wide rate budget, so concurrent syncs for different athletes
+        cannot jointly exceed Strava's application limits.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint (e.g., "/athlete/activities")
@@ -495,18 +529,21 @@ class StravaClient(IntegrationClient):
             IntegrationError: For other API errors
         """
         url = f"{self.base_url}{endpoint}"
-        headers = self.get_auth_headers()
+        refreshed_after_401 = False
 
-        client = await self._get_client()
+        await self._ensure_fresh_token()
 
         for attempt in range(max_retries):
-            response = await client.request(
-                method,
-                url,
-                headers=headers,
-                params=params,
-                json=json_data,
-            )
+            await self._pool.rate_budget.acquire(self._max_rate_limit_wait)
+
+            async with self._pool.slot() as client:
+                response = await client.request(
+                    method,
+                    url,
+                    headers=self.get_auth_headers(),
+                    params=params,
+                    json=json_data,
+                )
 
             # Update rate limit tracking from response headers
             self._update_rate_limits(response)
@@ -524,6 +561,11 @@ class StravaClient(IntegrationClient):
                 return {}
 
             if response.status_code == 401:
+                if self._token_refresher is not None and not refreshed_after_401:
+                    # Token may have been revoked early; refresh once and retry
+                    refreshed_after_401 = True
+                    await self._ensure_fresh_token(force=True)
+                    continue
                 raise AuthenticationError(
                     "Token expired or invalid. Please re-authenticate.",
                     "strava",
@@ -538,6 +580,7 @@ class StravaClient(IntegrationClient):
 
             if response.status_code == 429:
                 # Rate limit exceeded
+                self._pool.rate_budget.mark_exhausted()
                 retry_after = self._get_retry_after(response)
                 if attempt < max_retries - 1:
                     # Wait and retry
@@ -566,23 +609,27 @@ class StravaClient(IntegrationClient):
         raise IntegrationError("Max retries exceeded", "strava")
 
     def _update_rate_limits(self, response: httpx.Response) -> None:
-        """Update rate limit tracking from response headers."""
+        """Update the shared rate budget from response headers."""
         # Strava returns: X-RateLimit-Limit, X-RateLimit-Usage
         # Format: "15min_limit,daily_limit" and "15min_usage,daily_usage"
         limit_header = response.headers.get("X-RateLimit-Limit", "")
         usage_header = response.headers.get("X-RateLimit-Usage", "")
 
+        limits = None
+        usage = None
+
         if limit_header:
             parts = limit_header.split(",")
             if len(parts) >= 2:
-                self._rate_limit_15min = int(parts[0])
-                self._rate_limit_daily = int(parts[1])
+                limits = (int(parts[0]), int(parts[1]))
 
         if usage_header:
             parts = usage_header.split(",")
             if len(parts) >= 2:
-                self._rate_limit_usage_15min = int(parts[0])
-                self._rate_limit_usage_daily = int(parts[1])
+                usage = (int(parts[0]), int(parts[1]))
+
+        if limits or usage:
+            self._pool.rate_budget.update(limits=limits, usage=usage)
 
     def _get_retry_after(self, response: httpx.Response) -> int:
         """Get retry-after time from rate limit response."""
@@ -591,18 +638,23 @@ class StravaClient(IntegrationClient):
         if retry_after:
             return int(retry_after)
 
-        # Fallback to 15 minutes if header not present
-        return 900
+        # Fallback to the next window if header not present
+        return int(self._pool.rate_budget.seconds_until_available()) or 900
+
+    @property
+    def rate_budget(self) -> RateLimitBudget:
+        """Rate budget shared by all Strava clients in this process."""
+        return self._pool.rate_budget
 
     @property
     def rate_limit_remaining_15min(self) -> int:
-        """Get remaining requests in 15-minute window."""
-        return max(0, self._rate_limit_15min - self._rate_limit_usage_15min)
+        """Get remaining requests in 15-minute window (shared across clients)."""
+        return self._pool.rate_budget.remaining_15min
 
     @property
     def rate_limit_remaining_daily(self) -> int:
-        """Get remaining requests in daily window."""
-        return max(0, self._rate_limit_daily - self._rate_limit_usage_daily)
+        """Get remaining requests in daily window (shared across clients)."""
+        return self._pool.rate_budget.remaining_daily
     
     async def get_user_profile(self) -> Dict[str, Any]:
         """Get authenticated athlete profile."""
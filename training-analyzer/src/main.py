@@ -1,5 +1,7 @@
 """FastAPI application for trAIner."""
 
+import asyncio
+import importlib
 import logging
 from contextlib import asynccontextmanager
 
@@ -9,13 +11,15 @@ from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 
 from .config import get_settings
-from .api.routes import athlete, analysis, plans, workouts, export, garmin, chat, explain, gamification, strava, garmin_credentials, usage, stripe_webhook, admin, auth, safety, mileage_cap, preferences, pace_zones, manual_workouts, emotional, comparison, race_pacing, economy, recovery, patterns
 from .api.exception_handlers import register_exception_handlers
 from .api.middleware.rate_limit import limiter
 from .api.middleware.security_headers import SecurityHeadersMiddleware
 from .db.database import TrainingDatabase
 from .services.garmin_scheduler import get_scheduler, shutdown_scheduler
 from .services.cleanup_scheduler import get_cleanup_scheduler, shutdown_cleanup_scheduler
+from .integrations.http_pool import close_http_pools
+from .observability.startup import get_startup_report, mark_ready, record_warmup, startup_phase
+from .utils.lazy_import import warm_up
 from .utils.log_sanitizer import install_log_sanitizer
 
 # Install log sanitization filter to prevent credential/PII leakage
@@ -25,6 +29,55 @@ install_log_sanitizer()
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# (module in api.routes, prefix, tag) in registration order. Route modules
+# defer their agents and LLM SDKs, so importing them here is cheap.
+ROUTERS = [
+    ("athlete", "/api/v1/athlete", "athlete"),
+    ("analysis", "/api/v1/analysis", "analysis"),
+    ("plans", "/api/v1/plans", "plans"),
+    ("workouts", "/api/v1/workouts", "workouts"),
+    ("export", "/api/v1/export", "export"),
+    ("garmin", "/api/v1/garmin", "garmin"),
+    ("chat", "/api/v1/chat", "chat"),
+    ("explain", "/api/v1/explain", "explain"),
+    ("gamification", "/api/v1/gamification", "gamification"),
+    ("strava", "/api/v1/strava", "strava"),
+    ("garmin_credentials", "/api/v1/garmin", "garmin-credentials"),
+    ("usage", "/api/v1/usage", "usage"),
+    ("stripe_webhook", "/api/v1", "stripe"),
+    ("admin", "/api/v1", "admin"),
+    ("auth", "/api/v1", "auth"),
+    ("safety", "/api/v1/safety", "safety"),
+    ("mileage_cap", "/api/v1/athlete/mileage-cap", "mileage-cap"),
+    ("preferences", "/api/v1", "preferences"),
+    ("pace_zones", "/api/v1/pace-zones", "pace-zones"),
+    ("manual_workouts", "/api/v1/workouts/manual", "manual-workouts"),
+    ("emotional", "/api/v1/emotional", "emotional"),
+    ("comparison", "/api/v1/comparison", "comparison"),
+    ("race_pacing", "/api/v1/race", "race-pacing"),
+    ("economy", "/api/v1/economy", "economy"),
+    ("recovery", "/api/v1/recovery", "recovery"),
+    ("patterns", "/api/v1/patterns", "patterns"),
+]
+
+# Keeps the background warm-up task referenced while it runs
+_warmup_task: asyncio.Task | None = None
+
+
+def include_routers(app: FastAPI) -> None:
+    """Import each route module, timing it, and register its router."""
+    for name, prefix, tag in ROUTERS:
+        with startup_phase(f"routes.{name}"):
+            module = importlib.import_module(f".api.routes.{name}", __package__)
+        app.include_router(module.router, prefix=prefix, tags=[tag])
+
+
+async def _warm_up_in_background() -> None:
+    """Import deferred subsystems in a worker thread after startup."""
+    timings = await asyncio.to_thread(warm_up)
+    record_warmup(timings)
+    logger.info(f"Warm-up imported {len(timings)} deferred module(s) in {sum(timings.values()):.0f} ms")
+
 
 def validate_security_keys(settings) -> None:
     """Validate critical security keys at startup.
@@ -94,6 +147,7 @@ def validate_security_keys(settings) -> None:
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
+    global _warmup_task
     settings = get_settings()
     logger.info("Starting trAIner v0.1.0")
     logger.info(f"Training DB: {settings.training_db_path}")
@@ -128,12 +182,32 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Data retention cleanup is disabled")
 
+    # Resume background Garmin syncs interrupted by the last shutdown
+    try:
+        from .api.routes.garmin import resume_sync_jobs
+        resumed = resume_sync_jobs(training_db)
+        if resumed:
+            logger.info(f"Resumed {len(resumed)} interrupted Garmin sync job(s)")
+    except Exception as e:
+        logger.warning(f"Failed to resume Garmin sync jobs: {e}")
+
+    # Load the agents and LLM SDKs the routes deferred
+    if settings.startup_warmup == "eager":
+        with startup_phase("warmup"):
+            record_warmup(warm_up())
+    elif settings.startup_warmup == "background":
+        _warmup_task = asyncio.create_task(_warm_up_in_background())
+
+    mark_ready()
+    logger.info(f"Startup complete ({get_startup_report().to_dict()['ready_after_ms']} ms after process start)")
+
     yield
 
     # Shutdown
     logger.info("Shutting down trAIner")
     shutdown_scheduler()
     shutdown_cleanup_scheduler()
+    await close_http_pools()
 
 
 app = FastAPI(
@@ -187,32 +261,8 @@ app.add_middleware(
 register_exception_handlers(app)
 
 # Include routers
-app.include_router(athlete.router, prefix="/api/v1/athlete", tags=["athlete"])
-app.include_router(analysis.router, prefix="/api/v1/analysis", tags=["analysis"])
-app.include_router(plans.router, prefix="/api/v1/plans", tags=["plans"])
-app.include_router(workouts.router, prefix="/api/v1/workouts", tags=["workouts"])
-app.include_router(export.router, prefix="/api/v1/export", tags=["export"])
-app.include_router(garmin.router, prefix="/api/v1/garmin", tags=["garmin"])
-app.include_router(chat.router, prefix="/api/v1/chat", tags=["chat"])
-app.include_router(explain.router, prefix="/api/v1/explain", tags=["explain"])
-app.include_router(gamification.router, prefix="/api/v1/gamification", tags=["gamification"])
-app.include_router(strava.router, prefix="/api/v1/strava", tags=["strava"])
-app.include_router(garmin_credentials.router, prefix="/api/v1/garmin", tags=["garmin-credentials"])
-app.include_router(usage.router, prefix="/api/v1/usage", tags=["usage"])
-app.include_router(stripe_webhook.router, prefix="/api/v1", tags=["stripe"])
-app.include_router(admin.router, prefix="/api/v1", tags=["admin"])
-app.include_router(auth.router, prefix="/api/v1", tags=["auth"])
-app.include_router(safety.router, prefix="/api/v1/safety", tags=["safety"])
-app.include_router(mileage_cap.router, prefix="/api/v1/athlete/mileage-cap", tags=["mileage-cap"])
-app.include_router(preferences.router, prefix="/api/v1", tags=["preferences"])
-app.include_router(pace_zones.router, prefix="/api/v1/pace-zones", tags=["pace-zones"])
-app.include_router(manual_workouts.router, prefix="/api/v1/workouts/manual", tags=["manual-workouts"])
-app.include_router(emotional.router, prefix="/api/v1/emotional", tags=["emotional"])
-app.include_router(comparison.router, prefix="/api/v1/comparison", tags=["comparison"])
-app.include_router(race_pacing.router, prefix="/api/v1/race", tags=["race-pacing"])
-app.include_router(economy.router, prefix="/api/v1/economy", tags=["economy"])
-app.include_router(recovery.router, prefix="/api/v1/recovery", tags=["recovery"])
-app.include_router(patterns.router, prefix="/api/v1/patterns", tags=["patterns"])
+with startup_phase("include_routers"):
+    include_routers(app)
 
 
 @app.get("/")
@@ -231,6 +281,12 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/health/startup")
+async def startup_report():
+    """Startup timings: time to ready, per-phase and warm-up import times."""
+    return get_startup_report().to_dict()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
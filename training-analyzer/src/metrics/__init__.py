@@ -6,12 +6,36 @@ from .fitness import (
     calculate_ewma,
     calculate_fitness_metrics,
 )
+from .course import (
+    CourseModel,
+    SPLIT_UNITS_KM,
+    grade_adjustment_pct,
+)
+from .daily_frame import (
+    DailyFrame,
+    parse_day,
+)
+from .projection import (
+    LoadScenario,
+    ScenarioProjection,
+    project_scenarios,
+    steady_scenario,
+    taper_scenario,
+    taper_grid,
+)
 from .zones import (
     HRZones,
     calculate_hr_zones_karvonen,
     calculate_hr_zones_lthr,
     get_zone_for_hr,
 )
+from .zone_binning import (
+    ZoneBoundaries,
+    ZoneTimes,
+    bin_zone_times,
+    bin_zone_times_batch,
+    classify_zones,
+)
 from .power import (
     # Power zone dataclasses
     PowerZones,
@@ -57,6 +81,8 @@ from .vdot import (
     calculate_vdot,
     get_pace_zones,
     predict_race_times,
+    predict_performances,
+    get_vdot_table,
     calculate_vdot_from_race,
     calculate_equivalent_performances,
     parse_race_time,
@@ -78,11 +104,31 @@ __all__ = [
     "FitnessMetrics",
     "calculate_ewma",
     "calculate_fitness_metrics",
+    # Course elevation model
+    "CourseModel",
+    "SPLIT_UNITS_KM",
+    "grade_adjustment_pct",
+    # Daily series windows
+    "DailyFrame",
+    "parse_day",
+    # Load scenario projection
+    "LoadScenario",
+    "ScenarioProjection",
+    "project_scenarios",
+    "steady_scenario",
+    "taper_scenario",
+    "taper_grid",
     # HR Zones
     "HRZones",
     "calculate_hr_zones_karvonen",
     "calculate_hr_zones_lthr",
     "get_zone_for_hr",
+    # Time-in-zone binning
+    "ZoneBoundaries",
+    "ZoneTimes",
+    "bin_zone_times",
+    "bin_zone_times_batch",
+    "classify_zones",
     # Power zone dataclasses
     "PowerZones",
     "CyclingAthleteContext",
@@ -121,6 +167,8 @@ __all__ = [
     "calculate_vdot",
     "get_pace_zones",
     "predict_race_times",
+    "predict_performances",
+    "get_vdot_table",
     "calculate_vdot_from_race",
     "calculate_equivalent_performances",
     "parse_race_time",
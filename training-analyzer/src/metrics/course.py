@@ -0,0 +1,482 @@
+"""Course elevation model for grade-adjusted race pacing.
+
+A course is built once from an elevation track of any density (a handful
+of user-entered points, a GPX/FIT recording with tens of thousands of
+samples, or a stored activity stream):
+
+- The track is resampled onto a uniform distance grid and smoothed with
+  a centred moving average, so GPS/barometer noise does not show up as
+  short steep grades.
+- Each grid step gets a pace adjustment from its grade, and the running
+  integral of those adjustments is stored. The adjustment for any split
+  is the distance-weighted mean over the split, read off the integral at
+  the split boundaries, so splits of any size (100 m, km, mile) cost one
+  interpolation per boundary.
+- Building and querying run as whole-array operations when numpy is
+  available, with an equivalent pure Python path otherwise.
+
+Uphill steps slow the pace by UPHILL_ADJUSTMENT_PER_PCT per percent of
+grade; downhill steps speed it up by DOWNHILL_ADJUSTMENT_PER_PCT per
+percent, capped at MAX_DOWNHILL_ADJUSTMENT.
+"""
+
+import math
+import xml.etree.ElementTree as ET
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Elevation adjustment factors
+UPHILL_ADJUSTMENT_PER_PCT = 0.08     # +8% pace per 1% grade uphill
+DOWNHILL_ADJUSTMENT_PER_PCT = -0.03  # -3% pace per 1% grade downhill (capped)
+MAX_DOWNHILL_ADJUSTMENT = -0.06      # Max 6% faster on downhills
+
+# Grid spacing the track is resampled to
+RESAMPLE_STEP_M = 10.0
+
+# Width of the moving average applied to the resampled track
+DEFAULT_SMOOTHING_M = 50.0
+
+# Split lengths accepted by split_adjustments()
+SPLIT_UNITS_KM = {
+    "100m": 0.1,
+    "km": 1.0,
+    "mile": 1.609344,
+}
+
+EARTH_RADIUS_M = 6371008.8
+
+# FIT positions are stored in semicircles
+_SEMICIRCLES_TO_DEGREES = 180.0 / 2 ** 31
+
+
+def grade_adjustment_pct(grade_pct: float) -> float:
+    """Pace adjustment (percent, positive = slower) for a grade in percent."""
+    if grade_pct > 0:
+        return grade_pct * UPHILL_ADJUSTMENT_PER_PCT * 100
+    # Downhills are faster: the factor is negative, so apply it to the magnitude
+    return max(MAX_DOWNHILL_ADJUSTMENT * 100, abs(grade_pct) * DOWNHILL_ADJUSTMENT_PER_PCT * 100)
+
+
+def split_boundaries(distance_km: float, split_km: float) -> List[float]:
+    """Split boundaries from 0 to distance_km; the last split may be partial."""
+    if distance_km <= 0 or split_km <= 0:
+        raise ValueError("distance_km and split_km must be positive")
+    # Tolerance keeps e.g. 5 km / 100 m at 50 splits despite float error
+    count = max(1, math.ceil(distance_km / split_km - 1e-9))
+    return [min(i * split_km, distance_km) for i in range(count)] + [distance_km]
+
+
+class CourseModel:
+    """
+    Smoothed elevation track of a course with per-split grade adjustments.
+
+    Attributes:
+        distances_km: Resampled grid distances (ascending, from 0)
+        elevations_m: Smoothed elevation at each grid distance
+    """
+
+    def __init__(
+        self,
+        distances_km: Sequence[float],
+        elevations_m: Sequence[float],
+        smoothing_m: float = DEFAULT_SMOOTHING_M,
+        step_m: float = RESAMPLE_STEP_M,
+    ):
+        """
+        Build the course from an elevation track.
+
+        Samples that do not advance in distance (GPS standstill, duplicates)
+        are dropped. The track is shifted to start at distance 0.
+
+        Raises:
+            ValueError: If fewer than two usable samples are given
+        """
+        distances, elevations = _increasing(distances_km, elevations_m)
+        if len(distances) < 2:
+            raise ValueError("A course needs at least two points at increasing distance")
+
+        start = distances[0]
+        distances = [d - start for d in distances]
+        grid = _grid(distances[-1], step_m / 1000.0)
+        window = max(0, int(round(smoothing_m / step_m)) // 2)
+
+        if HAS_NUMPY:
+            elevations = _smooth_np(np.interp(grid, distances, elevations), window).tolist()
+        else:
+            elevations = _smooth(_interp_sorted(grid, distances, elevations), window)
+
+        self.distances_km = grid
+        self.elevations_m = elevations
+        self._integral = _adjustment_integral(grid, elevations)
+
+    @property
+    def total_distance_km(self) -> float:
+        """Length of the course."""
+        return self.distances_km[-1]
+
+    @property
+    def elevation_gain_m(self) -> float:
+        """Total ascent of the smoothed track."""
+        return sum(max(0.0, b - a) for a, b in zip(self.elevations_m, self.elevations_m[1:]))
+
+    @property
+    def elevation_loss_m(self) -> float:
+        """Total descent of the smoothed track."""
+        return sum(max(0.0, a - b) for a, b in zip(self.elevations_m, self.elevations_m[1:]))
+
+    def split_adjustments(
+        self,
+        split_km: float = 1.0,
+        distance_km: Optional[float] = None,
+    ) -> List[float]:
+        """
+        Grade-adjusted pace change for each split, in percent.
+
+        Args:
+            split_km: Split length in km (see SPLIT_UNITS_KM)
+            distance_km: Race distance; defaults to the course length.
+                Beyond the end of the course the track is treated as flat.
+
+        Returns:
+            One adjustment per split, rounded to 0.01%
+        """
+        bounds = split_boundaries(distance_km or self.total_distance_km, split_km)
+
+        if HAS_NUMPY:
+            b = np.asarray(bounds)
+            integral = np.interp(b, self.distances_km, self._integral)
+            lengths = np.diff(b)
+            means = np.divide(
+                np.diff(integral), lengths, out=np.zeros_like(lengths), where=lengths > 0
+            )
+            return np.round(means, 2).tolist()
+
+        integral = _interp_sorted(bounds, self.distances_km, self._integral)
+        return [
+            round((i1 - i0) / (b1 - b0), 2) if b1 > b0 else 0.0
+            for i0, i1, b0, b1 in zip(integral, integral[1:], bounds, bounds[1:])
+        ]
+
+    def rescaled(self, distance_km: float) -> "CourseModel":
+        """
+        Stretch the course to a given length.
+
+        Recorded tracks rarely measure exactly the official distance;
+        rescaling keeps each climb at the same fraction of the race.
+        """
+        factor = distance_km / self.total_distance_km
+        model = CourseModel.__new__(CourseModel)
+        model.distances_km = [d * factor for d in self.distances_km]
+        model.elevations_m = list(self.elevations_m)
+        model._integral = _adjustment_integral(model.distances_km, model.elevations_m)
+        return model
+
+    def profile_points(self, spacing_km: float = 0.1) -> List[Tuple[float, float]]:
+        """(distance_km, elevation_m) pairs of the smoothed track at a coarser spacing."""
+        marks = split_boundaries(self.total_distance_km, spacing_km)
+        if HAS_NUMPY:
+            elevations = np.interp(marks, self.distances_km, self.elevations_m).tolist()
+        else:
+            elevations = _interp_sorted(marks, self.distances_km, self.elevations_m)
+        points: List[Tuple[float, float]] = []
+        for d, e in zip(marks, elevations):
+            # A very short final segment can round onto the previous mark
+            if not points or round(d, 3) > points[-1][0]:
+                points.append((round(d, 3), round(e, 1)))
+        return points
+
+    # ------------------------------------------------------------------
+    # Builders
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_points(cls, points: Sequence[Any], **kwargs) -> "CourseModel":
+        """Build from objects with distance_km and elevation_m attributes."""
+        return cls(
+            [p.distance_km for p in points],
+            [p.elevation_m for p in points],
+            **kwargs,
+        )
+
+    @classmethod
+    def from_gpx(cls, data: Union[bytes, str], **kwargs) -> "CourseModel":
+        """
+        Build from a GPX document (track or route points with <ele>).
+
+        Raises:
+            ValueError: If the document is not GPX or has no elevations
+        """
+        try:
+            root = ET.fromstring(data)
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid GPX file: {e}") from e
+
+        lats, lons, elevations = [], [], []
+        for element in root.iter():
+            if _local_name(element.tag) not in ("trkpt", "rtept"):
+                continue
+            try:
+                lat = float(element.attrib["lat"])
+                lon = float(element.attrib["lon"])
+            except (KeyError, ValueError):
+                continue
+            ele = next(
+                (child.text for child in element if _local_name(child.tag) == "ele"),
+                None,
+            )
+            lats.append(lat)
+            lons.append(lon)
+            elevations.append(float(ele) if ele not in (None, "") else None)
+
+        return cls._from_positions(lats, lons, elevations, "GPX", **kwargs)
+
+    @classmethod
+    def from_fit(cls, data: bytes, **kwargs) -> "CourseModel":
+        """
+        Build from a FIT activity or course file (record messages).
+
+        Uses the recorded distance when present, otherwise the GPS positions.
+
+        Raises:
+            ValueError: If the file cannot be decoded or has no elevations
+        """
+        from fit_tool.fit_file import FitFile
+        from fit_tool.profile.messages.record_message import RecordMessage
+
+        try:
+            fit_file = FitFile.from_bytes(data)
+        except Exception as e:
+            raise ValueError(f"Invalid FIT file: {e}") from e
+
+        distances, lats, lons, elevations = [], [], [], []
+        for record in fit_file.records:
+            message = record.message
+            if not isinstance(message, RecordMessage):
+                continue
+            altitude = message.enhanced_altitude
+            if altitude is None:
+                altitude = message.altitude
+            distances.append(message.distance)
+            lats.append(message.position_lat)
+            lons.append(message.position_long)
+            elevations.append(altitude)
+
+        if distances and all(d is not None for d in distances):
+            kept = [(d / 1000.0, e) for d, e in zip(distances, elevations) if e is not None]
+            if len(kept) < 2:
+                raise ValueError("FIT file has no elevation data")
+            return cls([d for d, _ in kept], [e for _, e in kept], **kwargs)
+
+        positions = [
+            (lat * _SEMICIRCLES_TO_DEGREES, lon * _SEMICIRCLES_TO_DEGREES, e)
+            for lat, lon, e in zip(lats, lons, elevations)
+            if lat is not None and lon is not None
+        ]
+        return cls._from_positions(
+            [p[0] for p in positions],
+            [p[1] for p in positions],
+            [p[2] for p in positions],
+            "FIT",
+            **kwargs,
+        )
+
+    @classmethod
+    def from_time_series(
+        cls,
+        elevation: Sequence[Dict[str, Any]],
+        pace_or_speed: Sequence[Dict[str, Any]],
+        is_running: bool,
+        total_distance_km: Optional[float] = None,
+        **kwargs,
+    ) -> "CourseModel":
+        """
+        Build from stored activity streams.
+
+        Distance is integrated from the pace/speed stream over time and
+        matched to the elevation samples by timestamp.
+
+        Args:
+            elevation: [{"timestamp": sec, "elevation": m}, ...]
+            pace_or_speed: [{"timestamp": sec, "value": ...}, ...] in sec/km
+                when running, km/h otherwise
+            is_running: Whether pace_or_speed holds pace
+            total_distance_km: Recorded distance the integral is scaled to
+
+        Raises:
+            ValueError: If the streams are too short to build a course
+        """
+        if len(elevation) < 2 or len(pace_or_speed) < 2:
+            raise ValueError("Activity has no elevation or speed stream")
+
+        times = [float(p["timestamp"]) for p in pace_or_speed]
+        speeds = [
+            (1000.0 / p["value"] if is_running else p["value"] / 3.6) if p["value"] else 0.0
+            for p in pace_or_speed
+        ]
+        # Trapezoidal distance (km) at each speed sample
+        covered = [0.0]
+        for t0, t1, s0, s1 in zip(times, times[1:], speeds, speeds[1:]):
+            covered.append(covered[-1] + (t1 - t0) * (s0 + s1) / 2 / 1000.0)
+        if total_distance_km and covered[-1] > 0:
+            covered = [c * total_distance_km / covered[-1] for c in covered]
+
+        elevation_times = [float(p["timestamp"]) for p in elevation]
+        distances = _interp_sorted(elevation_times, times, covered)
+        return cls(distances, [p["elevation"] for p in elevation], **kwargs)
+
+    @classmethod
+    def _from_positions(
+        cls,
+        lats: Sequence[float],
+        lons: Sequence[float],
+        elevations: Sequence[Optional[float]],
+        source: str,
+        **kwargs,
+    ) -> "CourseModel":
+        """Build from GPS positions, measuring distance along the track."""
+        if len(lats) < 2:
+            raise ValueError(f"{source} file has no track points")
+
+        covered = _cumulative_distance_km(lats, lons)
+        kept = [(d, e) for d, e in zip(covered, elevations) if e is not None]
+        if len(kept) < 2:
+            raise ValueError(f"{source} file has no elevation data")
+        return cls([d for d, _ in kept], [e for _, e in kept], **kwargs)
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+def _local_name(tag: str) -> str:
+    """Tag name without its XML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _increasing(
+    distances: Sequence[float],
+    elevations: Sequence[float],
+) -> Tuple[List[float], List[float]]:
+    """Keep samples whose distance is strictly greater than the previous kept one."""
+    kept_d: List[float] = []
+    kept_e: List[float] = []
+    for d, e in zip(distances, elevations):
+        if d is None or e is None:
+            continue
+        if not kept_d or d > kept_d[-1]:
+            kept_d.append(float(d))
+            kept_e.append(float(e))
+    return kept_d, kept_e
+
+
+def _grid(length_km: float, step_km: float) -> List[float]:
+    """Uniform grid from 0 to length_km with spacing at most step_km."""
+    # Stretching the step (rather than adding a short final one) keeps the
+    # moving average unbiased at the finish
+    count = max(1, math.ceil(length_km / step_km - 1e-9))
+    return [length_km * i / count for i in range(count + 1)]
+
+
+def _interp_sorted(
+    xs: Sequence[float],
+    xp: Sequence[float],
+    fp: Sequence[float],
+) -> List[float]:
+    """Linear interpolation like numpy.interp (xp ascending, ends held flat)."""
+    out = []
+    last = len(xp) - 1
+    for x in xs:
+        if x <= xp[0]:
+            out.append(fp[0])
+        elif x >= xp[last]:
+            out.append(fp[last])
+        else:
+            i = bisect_right(xp, x)
+            x0, x1 = xp[i - 1], xp[i]
+            out.append(fp[i - 1] + (x - x0) / (x1 - x0) * (fp[i] - fp[i - 1]))
+    return out
+
+
+def _smooth(values: List[float], half_window: int) -> List[float]:
+    """Centred moving average; the window narrows symmetrically at the ends."""
+    if half_window <= 0:
+        return list(values)
+    sums = [0.0] + list(accumulate(values))
+    n = len(values)
+    out = []
+    for i in range(n):
+        half = min(half_window, i, n - 1 - i)
+        lo, hi = i - half, i + half + 1
+        out.append((sums[hi] - sums[lo]) / (hi - lo))
+    return out
+
+
+def _cumulative_distance_km(lats: Sequence[float], lons: Sequence[float]) -> List[float]:
+    """Haversine distance along a track, in km, starting at 0."""
+    if HAS_NUMPY:
+        lat = np.radians(np.asarray(lats, dtype=float))
+        lon = np.radians(np.asarray(lons, dtype=float))
+        a = (
+            np.sin(np.diff(lat) / 2) ** 2
+            + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2
+        )
+        steps = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0))) / 1000.0
+        return np.concatenate(([0.0], np.cumsum(steps))).tolist()
+
+    covered = [0.0]
+    for lat0, lon0, lat1, lon1 in zip(lats, lons, lats[1:], lons[1:]):
+        p0, p1 = math.radians(lat0), math.radians(lat1)
+        a = (
+            math.sin((p1 - p0) / 2) ** 2
+            + math.cos(p0) * math.cos(p1) * math.sin(math.radians(lon1 - lon0) / 2) ** 2
+        )
+        step = 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(1.0, max(0.0, a))))
+        covered.append(covered[-1] + step / 1000.0)
+    return covered
+
+
+def _adjustment_integral(distances: List[float], elevations: List[float]) -> List[float]:
+    """Running integral (percent * km) of the per-step pace adjustments."""
+    if HAS_NUMPY:
+        grid = np.asarray(distances)
+        adjustments = _adjustments_np(grid, np.asarray(elevations))
+        return np.concatenate(([0.0], np.cumsum(adjustments * np.diff(grid)))).tolist()
+
+    steps = [b - a for a, b in zip(distances, distances[1:])]
+    adjustments = [
+        grade_adjustment_pct((e1 - e0) / (step * 1000) * 100)
+        for e0, e1, step in zip(elevations, elevations[1:], steps)
+    ]
+    return [0.0] + list(accumulate(a * s for a, s in zip(adjustments, steps)))
+
+
+if HAS_NUMPY:
+
+    def _smooth_np(values: "np.ndarray", half_window: int) -> "np.ndarray":
+        """Centred moving average; the window narrows symmetrically at the ends."""
+        if half_window <= 0:
+            return values
+        n = len(values)
+        sums = np.concatenate(([0.0], np.cumsum(values)))
+        index = np.arange(n)
+        half = np.minimum(half_window, np.minimum(index, n - 1 - index))
+        lo = index - half
+        hi = index + half + 1
+        return (sums[hi] - sums[lo]) / (hi - lo)
+
+    def _adjustments_np(grid: "np.ndarray", elevations: "np.ndarray") -> "np.ndarray":
+        """Pace adjustment (percent) for each grid step."""
+        grade = np.diff(elevations) / (np.diff(grid) * 1000) * 100
+        return np.where(
+            grade > 0,
+            grade * UPHILL_ADJUSTMENT_PER_PCT * 100,
+            np.maximum(MAX_DOWNHILL_ADJUSTMENT * 100, np.abs(grade) * DOWNHILL_ADJUSTMENT_PER_PCT * 100),
+        )
@@ -0,0 +1,298 @@
+"""Dense daily series with O(1) window aggregates.
+
+Trend and overtraining checks ask the same kinds of questions of a
+history: the sum or mean of a column over the last N days, or how many
+of those days crossed a threshold. A DailyFrame lays every column out on
+one dense calendar (one slot per day, None where nothing was recorded)
+and keeps prefix sums of the values and of the present-value counts, so
+each of those questions is two lookups regardless of the window length.
+Threshold counts get their own prefix array, built on first use and
+cached per (column, comparison, threshold).
+
+Windows are half-open index ranges [lo, hi) into the calendar; window()
+turns "the last N days up to a date" into one.
+"""
+
+import operator
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Comparisons accepted by count_where()
+COMPARISONS: Dict[str, Callable[[float, float], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# Pseudo-column counting the days that had a record at all
+ROWS = "_rows"
+
+FieldSpec = Union[str, Callable[[Mapping[str, Any]], Any]]
+
+
+def parse_day(value: Any) -> Optional[date]:
+    """Parse a date, datetime or YYYY-MM-DD string (None if unparseable)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        try:
+            # fromisoformat is several times faster than strptime
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+class DailyFrame:
+    """
+    Named daily columns on a dense calendar with prefix-sum window queries.
+
+    Attributes:
+        start: Date of index 0
+        length: Number of days covered
+    """
+
+    def __init__(self, start: date, columns: Mapping[str, Sequence[Optional[float]]]):
+        """
+        Build the frame from dense columns.
+
+        Args:
+            start: Date of the first slot
+            columns: Column name -> one value (or None) per day; all the
+                same length. A ROWS column marks days with a record; it
+                defaults to days where any column has a value.
+
+        Raises:
+            ValueError: If the columns differ in length
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must cover the same number of days")
+
+        self.start = start
+        self.length = lengths.pop() if lengths else 0
+        self._values: Dict[str, List[Optional[float]]] = {
+            name: [None if v is None else float(v) for v in values]
+            for name, values in columns.items()
+        }
+        if ROWS not in self._values:
+            self._values[ROWS] = [
+                1.0 if any(col[i] is not None for col in self._values.values()) else None
+                for i in range(self.length)
+            ]
+
+        self._sums: Dict[str, List[float]] = {}
+        self._counts: Dict[str, List[int]] = {}
+        for name, values in self._values.items():
+            self._sums[name], self._counts[name] = _prefix(values)
+        self._threshold_counts: Dict[Tuple[str, str, float], List[int]] = {}
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        fields: Mapping[str, FieldSpec],
+        date_key: str = "date",
+        end: Optional[date] = None,
+    ) -> "DailyFrame":
+        """
+        Materialize a frame from per-day records (in any order).
+
+        Records are placed on the calendar by their date; when several
+        share a day, later non-missing values win. If no record carries a
+        date, records are taken as consecutive days ending on `end`
+        (default today), in the order given.
+
+        Args:
+            records: Dicts such as fitness or wellness rows
+            fields: Column name -> record key, or a function extracting
+                the value from a record. Non-numeric results are missing.
+            date_key: Key holding the record's date
+            end: Last day of the frame (default: the latest record);
+                later records are left out
+        """
+        records = list(records)
+        days = [parse_day(r.get(date_key)) for r in records]
+        if records and not any(days):
+            last = end or date.today()
+            days = [last - timedelta(days=len(records) - 1 - i) for i in range(len(records))]
+
+        dated = [
+            (d, r) for d, r in zip(days, records)
+            if d is not None and (end is None or d <= end)
+        ]
+        if not dated:
+            return cls(end or date.today(), {name: [] for name in fields})
+
+        first = min(d for d, _ in dated)
+        last = end or max(d for d, _ in dated)
+        length = (last - first).days + 1
+
+        extractors = {
+            name: (lambda r, key=spec: r.get(key)) if isinstance(spec, str) else spec
+            for name, spec in fields.items()
+        }
+        columns: Dict[str, List[Optional[float]]] = {name: [None] * length for name in fields}
+        rows: List[Optional[float]] = [None] * length
+        for day, record in dated:
+            i = (day - first).days
+            rows[i] = 1.0
+            for name, extract in extractors.items():
+                value = _number(extract(record))
+                if value is not None:
+                    columns[name][i] = value
+        columns[ROWS] = rows
+        return cls(first, columns)
+
+    # ------------------------------------------------------------------
+    # Calendar
+    # ------------------------------------------------------------------
+
+    @property
+    def end(self) -> date:
+        """Date of the last slot."""
+        return self.start + timedelta(days=self.length - 1)
+
+    def day(self, index: int) -> date:
+        """Date of a slot."""
+        return self.start + timedelta(days=index)
+
+    def window(self, days: int, end: Optional[date] = None) -> Tuple[int, int]:
+        """
+        Index range [lo, hi) of the `days` days ending on `end` (inclusive).
+
+        The range is clipped to the frame, so it may be shorter than
+        `days` (or empty) near the edges.
+        """
+        last = (end or self.end) - self.start
+        hi = min(self.length, last.days + 1)
+        lo = max(0, hi - days)
+        return lo, max(lo, hi)
+
+    def values(self, column: str, lo: int = 0, hi: Optional[int] = None) -> List[Optional[float]]:
+        """Raw daily values of a column (None where missing)."""
+        return self._values[column][lo:hi]
+
+    # ------------------------------------------------------------------
+    # Window aggregates
+    # ------------------------------------------------------------------
+
+    def sum(self, column: str, lo: int, hi: int) -> float:
+        """Sum of the present values in [lo, hi)."""
+        sums = self._sums[column]
+        return sums[hi] - sums[lo]
+
+    def count(self, column: str, lo: int, hi: int) -> int:
+        """Number of days in [lo, hi) with a value."""
+        counts = self._counts[column]
+        return counts[hi] - counts[lo]
+
+    def mean(self, column: str, lo: int, hi: int) -> Optional[float]:
+        """Mean of the present values in [lo, hi), None if there are none."""
+        n = self.count(column, lo, hi)
+        return self.sum(column, lo, hi) / n if n else None
+
+    def count_where(self, column: str, op: str, threshold: float, lo: int, hi: int) -> int:
+        """Number of days in [lo, hi) whose value compares `op` to threshold."""
+        key = (column, op, float(threshold))
+        counts = self._threshold_counts.get(key)
+        if counts is None:
+            counts = self._threshold_prefix(column, op, float(threshold))
+            self._threshold_counts[key] = counts
+        return counts[hi] - counts[lo]
+
+    def first_present(self, column: str, lo: int, hi: int) -> Optional[int]:
+        """Index of the first day in [lo, hi) with a value."""
+        if self.count(column, lo, hi) == 0:
+            return None
+        counts = self._counts[column]
+        return bisect_right(counts, counts[lo], lo, hi + 1) - 1
+
+    def last_present(self, column: str, lo: int, hi: int) -> Optional[int]:
+        """Index of the last day in [lo, hi) with a value."""
+        if self.count(column, lo, hi) == 0:
+            return None
+        counts = self._counts[column]
+        return bisect_right(counts, counts[hi] - 1, lo, hi + 1) - 1
+
+    def split_means(
+        self, column: str, lo: int, hi: int
+    ) -> Optional[Tuple[float, float, int]]:
+        """
+        Means of the earlier and later halves of the present values in [lo, hi).
+
+        With n present values the earlier half holds the first n // 2.
+
+        Returns:
+            (earlier mean, later mean, n), or None with fewer than two values
+        """
+        n = self.count(column, lo, hi)
+        if n < 2:
+            return None
+        counts = self._counts[column]
+        # Slot after the (n // 2)-th present value in the window
+        mid = bisect_right(counts, counts[lo] + n // 2 - 1, lo, hi + 1)
+        return (
+            self.sum(column, lo, mid) / (n // 2),
+            self.sum(column, mid, hi) / (n - n // 2),
+            n,
+        )
+
+    def _threshold_prefix(self, column: str, op: str, threshold: float) -> List[int]:
+        compare = COMPARISONS.get(op)
+        if compare is None:
+            raise ValueError(f"Unsupported comparison: {op}")
+        values = self._values[column]
+        if HAS_NUMPY:
+            array = np.array([np.nan if v is None else v for v in values], dtype=float)
+            with np.errstate(invalid="ignore"):
+                hits = compare(array, threshold) & ~np.isnan(array)
+            return np.concatenate(([0], np.cumsum(hits))).astype(int).tolist()
+        return [0] + list(accumulate(
+            1 if v is not None and compare(v, threshold) else 0 for v in values
+        ))
+
+
+def _number(value: Any) -> Optional[float]:
+    """Numeric value of a field, None for missing or non-numeric values."""
+    if value is None or value.__class__ is bool or not isinstance(value, (int, float)):
+        return None
+    return value
+
+
+def _prefix(values: Sequence[Optional[float]]) -> Tuple[List[float], List[int]]:
+    """Prefix sums of the present values and prefix counts of present days."""
+    if HAS_NUMPY:
+        present = np.array([v is not None for v in values], dtype=bool)
+        filled = np.array([v if v is not None else 0.0 for v in values], dtype=float)
+        return (
+            np.concatenate(([0.0], np.cumsum(filled))).tolist(),
+            np.concatenate(([0], np.cumsum(present))).astype(int).tolist(),
+        )
+    return (
+        [0.0] + list(accumulate(v if v is not None else 0.0 for v in values)),
+        [0] + list(accumulate(1 if v is not None else 0 for v in values)),
+    )
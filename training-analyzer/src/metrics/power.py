@@ -2,7 +2,9 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .zone_binning import ZoneBoundaries, bin_zone_times
 
 
 @dataclass
@@ -499,6 +501,7 @@ def estimate_ftp_from_ramp_test(max_1min_power: float) -> int:
 def get_power_zone_distribution(
     power_samples: List[int],
     ftp: int,
+    timestamps: Optional[Sequence[float]] = None,
 ) -> Dict[int, float]:
     """
     Calculate percentage of time in each power zone.
@@ -506,6 +509,8 @@ def get_power_zone_distribution(
     Args:
         power_samples: List of power values in watts (one per time unit)
         ftp: Functional Threshold Power in watts
+        timestamps: Optional seconds for each sample; samples are then
+            weighted by elapsed time and pauses are not counted
 
     Returns:
         Dictionary with zone percentages, e.g., {1: 10.5, 2: 45.2, ...}
@@ -514,25 +519,15 @@ def get_power_zone_distribution(
         return {zone: 0.0 for zone in range(1, 8)}
 
     zones = calculate_power_zones(ftp)
-    zone_counts = {zone: 0 for zone in range(1, 8)}
-
-    for power in power_samples:
-        # Skip zero/negative power (coasting or data errors)
-        if power <= 0:
-            continue
-        zone = get_zone_for_power(power, zones)
-        zone_counts[zone] += 1
-
-    # Count total valid samples (non-zero power)
-    total_valid = sum(zone_counts.values())
 
-    if total_valid == 0:
-        return {zone: 0.0 for zone in range(1, 8)}
+    # Zero/negative power (coasting or data errors) is skipped
+    boundaries = ZoneBoundaries(
+        uppers=tuple(zones[zone][1] for zone in range(1, 7)),
+        skip_non_positive=True,
+    )
+    pct = bin_zone_times(power_samples, boundaries, timestamps).percentages()
 
-    return {
-        zone: round(count / total_valid * 100, 1)
-        for zone, count in zone_counts.items()
-    }
+    return {zone: pct[zone] for zone in range(1, 8)}
 
 
 def calculate_efficiency_factor(
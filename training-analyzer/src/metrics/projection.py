@@ -0,0 +1,280 @@
+"""Batched CTL/ATL/TSB projection for training load scenarios.
+
+CTL and ATL are EWMAs of daily load, so their response to a load
+sequence has a closed form. With d = e^(-1/tau) and w_k = (1 - d) * d^-(k+1):
+
+    x_n = d^n * (x_0 + sum_{k<n} L_k * w_k)
+
+The whole trajectory is one cumulative sum, and with numpy a batch of
+scenarios (one row of daily loads each) is evaluated as whole-array
+operations. The horizon is processed in blocks so d^-n stays well inside
+float range for multi-year projections. Without numpy, an equivalent
+day-by-day recursion is used.
+
+Scenario builders cover the common what-ifs: holding the current load,
+tapering into a race (step, linear or exponential shapes) and building
+load towards a race before tapering.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from .fitness import calculate_ewma
+
+
+CTL_TIME_CONSTANT = 42
+ATL_TIME_CONSTANT = 7
+
+# Days per closed-form block; keeps d^-n below ~e^52 for ATL
+_BLOCK_DAYS = 364
+
+TAPER_SHAPES = ("step", "linear", "exponential")
+
+
+@dataclass(frozen=True)
+class LoadScenario:
+    """
+    A planned daily load sequence.
+
+    Attributes:
+        name: Label shown to the user
+        daily_loads: Load for each day after today (index 0 = tomorrow)
+        taper_days: Length of the taper, if the scenario has one
+        reduction: Load reduction at the end of the taper (0-1)
+        shape: Taper shape ("step", "linear", "exponential")
+    """
+    name: str
+    daily_loads: Tuple[float, ...]
+    taper_days: int = 0
+    reduction: float = 0.0
+    shape: str = "step"
+
+
+@dataclass
+class ScenarioProjection:
+    """Projected fitness for one scenario (index 0 = tomorrow)."""
+    scenario: LoadScenario
+    ctl: List[float]
+    atl: List[float]
+    peak_day: Optional[int]  # Days from today; None if CTL never rises
+    peak_ctl: float
+    race_day: Optional[int] = None
+
+    @property
+    def tsb(self) -> List[float]:
+        return [c - a for c, a in zip(self.ctl, self.atl)]
+
+    def _on(self, values: List[float], day: Optional[int]) -> Optional[float]:
+        if day is None or not 1 <= day <= len(values):
+            return None
+        return values[day - 1]
+
+    @property
+    def race_ctl(self) -> Optional[float]:
+        return self._on(self.ctl, self.race_day)
+
+    @property
+    def race_tsb(self) -> Optional[float]:
+        if self.race_day is None:
+            return None
+        ctl, atl = self._on(self.ctl, self.race_day), self._on(self.atl, self.race_day)
+        return None if ctl is None else ctl - atl
+
+
+def steady_scenario(daily_load: float, days: int, name: str = "Steady") -> LoadScenario:
+    """Hold the same daily load for `days` days."""
+    return LoadScenario(name=name, daily_loads=(float(daily_load),) * days)
+
+
+def _taper_factor(day: int, taper_days: int, reduction: float, shape: str) -> float:
+    """Load multiplier on taper day `day` (1..taper_days)."""
+    if shape == "step":
+        return 1 - reduction
+    progress = day / taper_days
+    if shape == "linear":
+        return 1 - reduction * progress
+    if shape == "exponential":
+        # Falls fast at first, reaching 1 - reduction on the last day
+        return (1 - reduction) ** math.sqrt(progress)
+    raise ValueError(f"Unknown taper shape: {shape}")
+
+
+def taper_scenario(
+    daily_load: float,
+    days_to_race: int,
+    taper_days: int,
+    reduction: float,
+    shape: str = "step",
+    days: Optional[int] = None,
+    build_pct_per_week: float = 0.0,
+    name: Optional[str] = None,
+) -> LoadScenario:
+    """
+    Build (or hold) load, then taper into a race.
+
+    Args:
+        daily_load: Current daily load
+        days_to_race: Race day as days from today (race day is tapered)
+        taper_days: Days of reduced load ending on race day
+        reduction: Load reduction reached by race day (0-1)
+        shape: "step", "linear" or "exponential"
+        days: Scenario length (default: through race day); days after
+            the race return to the pre-taper load
+        build_pct_per_week: Weekly load increase before the taper
+        name: Label (default describes the taper)
+
+    Returns:
+        LoadScenario
+    """
+    days = days or days_to_race
+    taper_days = max(0, min(taper_days, days_to_race))
+    taper_start = days_to_race - taper_days  # Index of the first taper day
+    weekly_growth = 1 + build_pct_per_week / 100
+
+    loads = []
+    peak_load = daily_load
+    for i in range(days):
+        if i < taper_start:
+            peak_load = daily_load * weekly_growth ** (i / 7)
+            loads.append(peak_load)
+        elif i < days_to_race:
+            factor = _taper_factor(i - taper_start + 1, taper_days, reduction, shape)
+            loads.append(peak_load * factor)
+        else:
+            loads.append(daily_load)
+
+    label = name or f"{taper_days}d {shape} taper -{round(reduction * 100)}%"
+    return LoadScenario(
+        name=label,
+        daily_loads=tuple(loads),
+        taper_days=taper_days,
+        reduction=reduction,
+        shape=shape,
+    )
+
+
+def _project_numpy(start: float, loads: "np.ndarray", tau: int) -> "np.ndarray":
+    """Closed-form EWMA trajectories for a (scenarios, days) load matrix."""
+    decay = math.exp(-1 / tau)
+    out = np.empty_like(loads)
+    x0 = np.full(loads.shape[0], float(start))
+    for begin in range(0, loads.shape[1], _BLOCK_DAYS):
+        block = loads[:, begin:begin + _BLOCK_DAYS]
+        k = np.arange(block.shape[1])
+        weights = (1 - decay) * decay ** -(k + 1.0)
+        grow = decay ** (k + 1.0)
+        traj = grow * (x0[:, None] + np.cumsum(block * weights, axis=1))
+        out[:, begin:begin + block.shape[1]] = traj
+        x0 = traj[:, -1]
+    return out
+
+
+def _project_python(start: float, loads: Sequence[float], tau: int) -> List[float]:
+    values = []
+    x = start
+    for load in loads:
+        x = calculate_ewma(load, x, tau)
+        values.append(x)
+    return values
+
+
+def project_scenarios(
+    ctl: float,
+    atl: float,
+    scenarios: Sequence[LoadScenario],
+    race_day: Optional[int] = None,
+) -> List[ScenarioProjection]:
+    """
+    Project CTL/ATL/TSB for many load scenarios at once.
+
+    Args:
+        ctl: Today's CTL
+        atl: Today's ATL
+        scenarios: Scenarios of equal length
+        race_day: Race day as days from today, for race-day CTL/TSB
+
+    Returns:
+        One ScenarioProjection per scenario, in the same order
+    """
+    if not scenarios:
+        return []
+    days = len(scenarios[0].daily_loads)
+    if any(len(s.daily_loads) != days for s in scenarios):
+        raise ValueError("All scenarios must cover the same number of days")
+    if days == 0:
+        return [
+            ScenarioProjection(s, [], [], None, ctl, race_day) for s in scenarios
+        ]
+
+    if HAS_NUMPY:
+        loads = np.array([s.daily_loads for s in scenarios], dtype=float)
+        ctl_rows = _project_numpy(ctl, loads, CTL_TIME_CONSTANT)
+        atl_rows = _project_numpy(atl, loads, ATL_TIME_CONSTANT)
+        peaks = ctl_rows.argmax(axis=1)
+        results = []
+        for i, scenario in enumerate(scenarios):
+            peak_ctl = float(ctl_rows[i, peaks[i]])
+            rises = peak_ctl > ctl
+            results.append(
+                ScenarioProjection(
+                    scenario=scenario,
+                    ctl=ctl_rows[i].tolist(),
+                    atl=atl_rows[i].tolist(),
+                    peak_day=int(peaks[i]) + 1 if rises else None,
+                    peak_ctl=peak_ctl if rises else ctl,
+                    race_day=race_day,
+                )
+            )
+        return results
+
+    results = []
+    for scenario in scenarios:
+        ctl_values = _project_python(ctl, scenario.daily_loads, CTL_TIME_CONSTANT)
+        atl_values = _project_python(atl, scenario.daily_loads, ATL_TIME_CONSTANT)
+        peak_idx = max(range(days), key=ctl_values.__getitem__)
+        rises = ctl_values[peak_idx] > ctl
+        results.append(
+            ScenarioProjection(
+                scenario=scenario,
+                ctl=ctl_values,
+                atl=atl_values,
+                peak_day=peak_idx + 1 if rises else None,
+                peak_ctl=ctl_values[peak_idx] if rises else ctl,
+                race_day=race_day,
+            )
+        )
+    return results
+
+
+def taper_grid(
+    daily_load: float,
+    days_to_race: int,
+    taper_days: Sequence[int] = (7, 10, 14, 21),
+    reductions: Sequence[float] = (0.3, 0.4, 0.5, 0.6),
+    shapes: Sequence[str] = TAPER_SHAPES,
+    build_pct_per_week: float = 0.0,
+    days: Optional[int] = None,
+) -> List[LoadScenario]:
+    """All combinations of taper length, reduction and shape for one race."""
+    return [
+        taper_scenario(
+            daily_load,
+            days_to_race,
+            t,
+            r,
+            shape=shape,
+            days=days,
+            build_pct_per_week=build_pct_per_week,
+        )
+        for t in taper_days
+        if t <= days_to_race
+        for r in reductions
+        for shape in shapes
+    ]
@@ -16,11 +16,18 @@ References:
 """
 
 import math
-from typing import Dict, Tuple, Optional, List
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Tuple, Optional, List, Iterable, Any
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Range of VDOT values the calculator works with
+VDOT_MIN = 25.0
+VDOT_MAX = 90.0
+
+
 class RaceDistance(Enum):
     """Common race distances with values in meters."""
     FIVE_K = 5000
@@ -151,6 +158,16 @@ def calculate_vdot(race_distance_m: float, race_time_sec: float) -> float:
     if race_time_sec <= 0 or race_distance_m <= 0:
         raise ValueError("Race time and distance must be positive")
 
+    vdot = _vdot_exact(race_distance_m, race_time_sec)
+
+    # Clamp to reasonable range (very rare to be outside 25-90)
+    vdot = max(VDOT_MIN, min(VDOT_MAX, vdot))
+
+    return round(vdot, 1)
+
+
+def _vdot_exact(race_distance_m: float, race_time_sec: float) -> float:
+    """Daniels' VDOT for a performance, without rounding or clamping."""
     # Velocity in meters per minute
     velocity_m_per_min = (race_distance_m / race_time_sec) * 60
 
@@ -175,12 +192,7 @@ def calculate_vdot(race_distance_m: float, race_time_sec: float) -> float:
     )
 
     # VDOT is the VO2max that would produce this performance
-    vdot = oxygen_cost / pct_max
-
-    # Clamp to reasonable range (very rare to be outside 25-90)
-    vdot = max(25.0, min(90.0, vdot))
-
-    return round(vdot, 1)
+    return oxygen_cost / pct_max
 
 
 def _vdot_to_velocity(vdot: float, intensity_pct: float) -> float:
@@ -320,15 +332,29 @@ def get_pace_zones(vdot: float) -> Dict[str, PaceZone]:
     return zones
 
 
-def predict_race_times(vdot: float) -> Dict[str, Dict[str, any]]:
+# Distances predicted by default, in meters
+STANDARD_DISTANCES = {
+    '5K': RaceDistance.FIVE_K.value,
+    '10K': RaceDistance.TEN_K.value,
+    'Half Marathon': RaceDistance.HALF_MARATHON.value,
+    'Marathon': RaceDistance.MARATHON.value,
+}
+
+
+def predict_race_times(
+    vdot: float,
+    distances: Optional[Dict[str, float]] = None,
+) -> Dict[str, Dict[str, any]]:
     """
     Predict race times for common distances based on VDOT.
 
-    Uses the inverse of the VDOT calculation to predict finish times
-    for standard race distances.
+    Looks up finish times in the precomputed VDOT tables for each
+    distance.
 
     Args:
         vdot: VDOT value
+        distances: Optional race name to distance in meters, instead of
+            the standard distances
 
     Returns:
         Dictionary with predictions for 5K, 10K, Half Marathon, Marathon
@@ -337,24 +363,21 @@ def predict_race_times(vdot: float) -> Dict[str, Dict[str, any]]:
     Example:
         >>> predictions = predict_race_times(50)
         >>> predictions['5K']['time_formatted']
-        '21:03'
+        '19:56'
     """
-    distances = {
-        '5K': RaceDistance.FIVE_K,
-        '10K': RaceDistance.TEN_K,
-        'Half Marathon': RaceDistance.HALF_MARATHON,
-        'Marathon': RaceDistance.MARATHON,
-    }
+    if distances is None:
+        distances = STANDARD_DISTANCES
 
     predictions = {}
 
-    for name, distance in distances.items():
-        time_sec = _predict_time_from_vdot(vdot, distance.value)
-        pace_sec_per_km = time_sec / distance.distance_km
+    for name, distance_m in distances.items():
+        time_sec = _predict_time_from_vdot(vdot, distance_m)
+        distance_km = distance_m / 1000
+        pace_sec_per_km = time_sec / distance_km
 
         predictions[name] = {
-            'distance_m': distance.value,
-            'distance_km': distance.distance_km,
+            'distance_m': distance_m,
+            'distance_km': distance_km,
             'time_sec': int(time_sec),
             'time_formatted': _format_time(int(time_sec)),
             'pace_sec_per_km': round(pace_sec_per_km, 1),
@@ -364,46 +387,131 @@ def predict_race_times(vdot: float) -> Dict[str, Dict[str, any]]:
     return predictions
 
 
-def _predict_time_from_vdot(vdot: float, distance_m: float) -> float:
+def _solve_time_for_vdot(vdot: float, distance_m: float) -> float:
     """
-    Predict race time from VDOT for a given distance.
+    Solve Daniels' equations for the race time that yields a VDOT.
 
-    This uses an iterative approach to find the time that would
-    produce the given VDOT for the specified distance.
+    Bisects on the unrounded formula until the bracket is below a
+    millisecond. Used to build the lookup tables; call
+    _predict_time_from_vdot() for predictions.
 
     Args:
         vdot: VDOT value
         distance_m: Race distance in meters
 
     Returns:
-        Predicted time in seconds
+        Race time in seconds
     """
-    # Initial estimate using a simplified formula
-    # Roughly: pace decreases ~6% per doubling of distance for same VDOT
-    base_velocity = _vdot_to_velocity(vdot, 0.95)  # Start at ~interval pace
-    initial_time = distance_m / base_velocity * 60
-
-    # Binary search to find exact time
-    low = initial_time * 0.5
-    high = initial_time * 2.0
+    # VDOT falls as the time gets longer; start from a bracket around
+    # the time at interval pace
+    base_velocity = _vdot_to_velocity(vdot, 0.95)
+    low = distance_m / base_velocity * 60 * 0.5
+    high = low * 4.0
 
-    for _ in range(50):  # Max iterations
+    while high - low > 1e-3:
         mid = (low + high) / 2
-        calculated_vdot = calculate_vdot(distance_m, mid)
-
-        if abs(calculated_vdot - vdot) < 0.1:
-            return mid
-
-        if calculated_vdot > vdot:
-            # Calculated VDOT too high means time is too fast
+        if _vdot_exact(distance_m, mid) > vdot:
             low = mid
         else:
-            # Calculated VDOT too low means time is too slow
             high = mid
 
     return (low + high) / 2
 
 
+# Grid points per lookup table
+VDOT_TABLE_SIZE = 1024
+
+
+class VDOTTable:
+    """
+    Precomputed VDOT to race time lookup for one distance.
+
+    Times are sampled on a geometric grid covering VDOT_MIN..VDOT_MAX and
+    paired with their exact VDOT (the forward formula is closed form), so
+    building a table needs only two solver calls. Lookups interpolate
+    linearly between neighbouring points; both columns are monotone, so
+    the interpolation is too, and it stays well within a second of the
+    exact solution across the whole range.
+    """
+
+    def __init__(self, distance_m: float, size: int = VDOT_TABLE_SIZE):
+        self.distance_m = distance_m
+        fastest = _solve_time_for_vdot(VDOT_MAX, distance_m)
+        slowest = _solve_time_for_vdot(VDOT_MIN, distance_m)
+
+        # Slowest first so VDOT values ascend
+        ratio = (fastest / slowest) ** (1 / (size - 1))
+        self.times = [slowest * ratio ** i for i in range(size)]
+        self.times[-1] = fastest
+        self.vdots = [_vdot_exact(distance_m, t) for t in self.times]
+
+    def time_for_vdot(self, vdot: float) -> float:
+        """Race time in seconds for a VDOT (clamped to the table range)."""
+        vdots = self.vdots
+        vdot = max(vdots[0], min(vdots[-1], vdot))
+        i = min(max(bisect_left(vdots, vdot), 1), len(vdots) - 1)
+        v0, v1 = vdots[i - 1], vdots[i]
+        t0, t1 = self.times[i - 1], self.times[i]
+        return t0 + (t1 - t0) * (vdot - v0) / (v1 - v0)
+
+
+@lru_cache(maxsize=64)
+def get_vdot_table(distance_m: float) -> VDOTTable:
+    """Get the (cached) lookup table for a distance in meters."""
+    return VDOTTable(distance_m)
+
+
+def _predict_time_from_vdot(vdot: float, distance_m: float) -> float:
+    """
+    Predict race time from VDOT for a given distance.
+
+    Args:
+        vdot: VDOT value
+        distance_m: Race distance in meters
+
+    Returns:
+        Predicted time in seconds
+    """
+    return get_vdot_table(round(float(distance_m), 1)).time_for_vdot(vdot)
+
+
+def predict_performances(
+    vdots: Iterable[float],
+    distances: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Predict race times and training paces for many VDOT values at once.
+
+    For rankings, cohort views or a VDOT history: each distinct VDOT is
+    computed once and reused for repeats.
+
+    Args:
+        vdots: VDOT values (e.g. one per athlete or per date)
+        distances: Race name to distance in meters. Defaults to the
+            standard 5K, 10K, half marathon and marathon.
+
+    Returns:
+        One dict per input VDOT, in order, with 'vdot',
+        'race_predictions' (as predict_race_times) and 'pace_zones'
+        (PaceZone.to_dict() per zone)
+    """
+    results: Dict[float, Dict[str, Any]] = {}
+    output = []
+    for vdot in vdots:
+        key = round(float(vdot), 1)
+        if key not in results:
+            results[key] = {
+                'vdot': key,
+                'race_predictions': predict_race_times(key, distances),
+                'pace_zones': {
+                    name: zone.to_dict()
+                    for name, zone in get_pace_zones(key).items()
+                },
+            }
+        output.append(results[key])
+    return output
+
+
 def _format_time(seconds: int) -> str:
     """Format time in seconds to H:MM:SS or MM:SS string."""
     hours = seconds // 3600
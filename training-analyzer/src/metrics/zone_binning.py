@@ -0,0 +1,260 @@
+"""Time-in-zone binning for HR, power and pace streams.
+
+One engine classifies every sample of a stream against a set of zone
+boundaries and sums the time spent in each zone:
+
+- Each sample is weighted by the time until the next sample, so streams
+  with smart recording or dropped samples are timed correctly.
+- Gaps longer than max_gap_sec (auto-pause, recording stopped) count as a
+  single nominal interval instead of crediting the whole pause to a zone.
+- Classification and summation run as whole-array operations when numpy
+  is available, with an equivalent pure Python path otherwise.
+
+Zones use the same convention as the existing calculators: zone n
+covers (upper[n-2], upper[n-1]], values below `floor` fall in zone 0 and
+values above the last upper bound fall in the top zone. Pace streams
+(lower is faster) use descending=True.
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Pauses longer than this are not credited to a zone
+MAX_SAMPLE_GAP_SEC = 10.0
+
+# Time credited to a sample without timestamps, or before a pause
+DEFAULT_SAMPLE_INTERVAL_SEC = 1.0
+
+
+@dataclass(frozen=True)
+class ZoneBoundaries:
+    """
+    Zone boundaries for binning.
+
+    Attributes:
+        uppers: Inclusive upper bound of zones 1..n-1 (ascending values,
+            or descending for pace). The top zone is open-ended.
+        floor: Values below this fall in zone 0 (None: no zone 0 floor).
+        descending: True when lower values mean a higher zone (pace).
+        skip_non_positive: Ignore samples <= 0 (missing HR, coasting).
+    """
+    uppers: Tuple[float, ...]
+    floor: Optional[float] = None
+    descending: bool = False
+    skip_non_positive: bool = False
+
+    @property
+    def zone_count(self) -> int:
+        """Number of bins, including zone 0."""
+        return len(self.uppers) + 2
+
+    def _keys(self) -> Tuple[List[float], Optional[float]]:
+        """Bounds on an ascending scale (pace is negated)."""
+        if self.descending:
+            floor = -self.floor if self.floor is not None else None
+            return [-u for u in self.uppers], floor
+        return list(self.uppers), self.floor
+
+
+@dataclass
+class ZoneTimes:
+    """Seconds spent in each zone (index 0 = below zone 1)."""
+    seconds: List[float] = field(default_factory=list)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.seconds)
+
+    def percentages(self, include_zone0: bool = True) -> List[float]:
+        """Share of time per zone in percent, rounded to 0.1."""
+        seconds = self.seconds if include_zone0 else [0.0] + self.seconds[1:]
+        total = sum(seconds)
+        if total <= 0:
+            return [0.0] * len(self.seconds)
+        return [round(s / total * 100, 1) for s in seconds]
+
+
+def _sample_weights(
+    count: int,
+    timestamps: Optional[Sequence[float]],
+    max_gap_sec: float,
+    sample_interval: float,
+) -> List[float]:
+    """Seconds credited to each sample (pure Python path)."""
+    if timestamps is None:
+        return [sample_interval] * count
+    weights = []
+    for i in range(count - 1):
+        dt = timestamps[i + 1] - timestamps[i]
+        if dt > max_gap_sec:
+            dt = sample_interval
+        weights.append(max(dt, 0.0))
+    if count:
+        weights.append(sample_interval)
+    return weights
+
+
+def classify_zones(values: Sequence[float], boundaries: ZoneBoundaries) -> List[Optional[int]]:
+    """
+    Zone of each sample (None for skipped samples).
+
+    Args:
+        values: Stream values (None for missing samples)
+        boundaries: Zone boundaries
+
+    Returns:
+        Zone number per sample
+    """
+    uppers, floor = boundaries._keys()
+    sign = -1 if boundaries.descending else 1
+    locate = partial(bisect_left, uppers)
+
+    zones: List[Optional[int]] = []
+    for value in values:
+        if value is None or (boundaries.skip_non_positive and value <= 0):
+            zones.append(None)
+            continue
+        key = sign * value
+        if floor is not None and key < floor:
+            zones.append(0)
+        else:
+            zones.append(locate(key) + 1)
+    return zones
+
+
+def _bin_numpy(
+    values: Sequence[float],
+    timestamps: Optional[Sequence[float]],
+    boundaries: ZoneBoundaries,
+    max_gap_sec: float,
+    sample_interval: float,
+    stream_ids=None,
+    stream_count: int = 1,
+):
+    """Vectorized binning; returns a (stream_count, zone_count) array."""
+    uppers, floor = boundaries._keys()
+    # None (missing samples) converts to NaN
+    raw = np.asarray(values, dtype=float)
+    count = raw.size
+    if count == 0:
+        return np.zeros((stream_count, boundaries.zone_count))
+
+    if timestamps is None:
+        weights = np.full(count, sample_interval)
+    else:
+        ts = np.asarray(timestamps, dtype=float)
+        dt = np.diff(ts)
+        dt = np.where(dt > max_gap_sec, sample_interval, dt)
+        weights = np.append(np.maximum(dt, 0.0), sample_interval)
+        if stream_ids is not None and count:
+            # The last sample of each stream gets a nominal interval
+            last = np.append(stream_ids[1:] != stream_ids[:-1], True)
+            weights = np.where(last, sample_interval, weights)
+
+    valid = ~np.isnan(raw)
+    if boundaries.skip_non_positive:
+        valid &= raw > 0
+    keys = -raw if boundaries.descending else raw
+
+    bins = np.searchsorted(np.asarray(uppers, dtype=float), keys, side="left") + 1
+    if floor is not None:
+        bins = np.where(keys < floor, 0, bins)
+
+    zone_count = boundaries.zone_count
+    if stream_ids is None:
+        stream_ids = np.zeros(count, dtype=int)
+    flat = stream_ids[valid] * zone_count + bins[valid]
+    totals = np.bincount(flat, weights=weights[valid], minlength=stream_count * zone_count)
+    return totals.reshape(stream_count, zone_count)
+
+
+def bin_zone_times(
+    values: Sequence[float],
+    boundaries: ZoneBoundaries,
+    timestamps: Optional[Sequence[float]] = None,
+    max_gap_sec: float = MAX_SAMPLE_GAP_SEC,
+    sample_interval: float = DEFAULT_SAMPLE_INTERVAL_SEC,
+) -> ZoneTimes:
+    """
+    Sum the time spent in each zone for one stream.
+
+    Args:
+        values: Stream values (HR, watts or sec/km), None for missing
+        boundaries: Zone boundaries
+        timestamps: Seconds for each sample (default: one sample per
+            sample_interval)
+        max_gap_sec: Longer gaps count as one sample_interval
+        sample_interval: Nominal seconds per sample
+
+    Returns:
+        ZoneTimes with boundaries.zone_count entries
+    """
+    if timestamps is not None and len(timestamps) != len(values):
+        raise ValueError("timestamps and values must have the same length")
+
+    if HAS_NUMPY:
+        totals = _bin_numpy(values, timestamps, boundaries, max_gap_sec, sample_interval)
+        return ZoneTimes(seconds=[float(s) for s in totals[0]])
+
+    seconds = [0.0] * boundaries.zone_count
+    weights = _sample_weights(len(values), timestamps, max_gap_sec, sample_interval)
+    for zone, weight in zip(classify_zones(values, boundaries), weights):
+        if zone is not None:
+            seconds[zone] += weight
+    return ZoneTimes(seconds=seconds)
+
+
+def bin_zone_times_batch(
+    streams: Iterable[Tuple[Sequence[float], Optional[Sequence[float]]]],
+    boundaries: ZoneBoundaries,
+    max_gap_sec: float = MAX_SAMPLE_GAP_SEC,
+    sample_interval: float = DEFAULT_SAMPLE_INTERVAL_SEC,
+) -> List[ZoneTimes]:
+    """
+    Bin many activities against the same boundaries in one pass.
+
+    Args:
+        streams: (values, timestamps) per activity; timestamps may be None
+        boundaries: Zone boundaries shared by all activities
+        max_gap_sec: Longer gaps count as one sample_interval
+        sample_interval: Nominal seconds per sample
+
+    Returns:
+        ZoneTimes per activity, in order
+    """
+    streams = list(streams)
+    if not HAS_NUMPY or not streams:
+        return [
+            bin_zone_times(values, boundaries, timestamps, max_gap_sec, sample_interval)
+            for values, timestamps in streams
+        ]
+
+    # Streams without timestamps get synthetic ones at the nominal interval
+    values: List[float] = []
+    timestamps: List[float] = []
+    lengths = []
+    for stream_values, stream_timestamps in streams:
+        if stream_timestamps is not None and len(stream_timestamps) != len(stream_values):
+            raise ValueError("timestamps and values must have the same length")
+        values.extend(stream_values)
+        if stream_timestamps is None:
+            timestamps.extend(i * sample_interval for i in range(len(stream_values)))
+        else:
+            timestamps.extend(stream_timestamps)
+        lengths.append(len(stream_values))
+
+    stream_ids = np.repeat(np.arange(len(streams)), lengths)
+    totals = _bin_numpy(
+        values, timestamps, boundaries, max_gap_sec, sample_interval,
+        stream_ids=stream_ids, stream_count=len(streams),
+    )
+    return [ZoneTimes(seconds=[float(s) for s in row]) for row in totals]
@@ -1,7 +1,9 @@
 """Heart rate zone calculations."""
 
 from dataclasses import dataclass
-from typing import Tuple, List
+from typing import Tuple, List, Optional, Sequence
+
+from .zone_binning import ZoneBoundaries, bin_zone_times
 
 
 @dataclass
@@ -34,6 +36,13 @@ class HRZones:
             (5, self.zone5[0], self.zone5[1], "VO2max"),
         ]
 
+    def boundaries(self) -> ZoneBoundaries:
+        """Zone boundaries for time-in-zone binning (matches get_zone_for_hr)."""
+        return ZoneBoundaries(
+            uppers=(self.zone1[1], self.zone2[1], self.zone3[1], self.zone4[1]),
+            floor=self.zone1[0],
+        )
+
 
 def calculate_hr_zones_karvonen(max_hr: int, rest_hr: int) -> HRZones:
     """
@@ -159,6 +168,7 @@ def get_zone_for_hr(hr: int, zones: HRZones) -> int:
 def calculate_zone_time_distribution(
     hr_samples: List[int],
     zones: HRZones,
+    timestamps: Optional[Sequence[float]] = None,
 ) -> dict:
     """
     Calculate time spent in each zone from HR samples.
@@ -166,6 +176,8 @@ def calculate_zone_time_distribution(
     Args:
         hr_samples: List of heart rate values (one per time unit)
         zones: HRZones object with zone boundaries
+        timestamps: Optional seconds for each sample; samples are then
+            weighted by elapsed time and pauses are not counted
 
     Returns:
         Dictionary with zone percentages and counts
@@ -180,22 +192,16 @@ def calculate_zone_time_distribution(
             "total_samples": 0,
         }
 
-    zone_counts = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 0: 0}
-
-    for hr in hr_samples:
-        zone = get_zone_for_hr(hr, zones)
-        zone_counts[zone] = zone_counts.get(zone, 0) + 1
-
-    total = len(hr_samples)
+    pct = bin_zone_times(hr_samples, zones.boundaries(), timestamps).percentages()
 
     return {
-        "zone1_pct": round(zone_counts[1] / total * 100, 1),
-        "zone2_pct": round(zone_counts[2] / total * 100, 1),
-        "zone3_pct": round(zone_counts[3] / total * 100, 1),
-        "zone4_pct": round(zone_counts[4] / total * 100, 1),
-        "zone5_pct": round(zone_counts[5] / total * 100, 1),
-        "below_zone1_pct": round(zone_counts[0] / total * 100, 1),
-        "total_samples": total,
+        "zone1_pct": pct[1],
+        "zone2_pct": pct[2],
+        "zone3_pct": pct[3],
+        "zone4_pct": pct[4],
+        "zone5_pct": pct[5],
+        "below_zone1_pct": pct[0],
+        "total_samples": len(hr_samples),
     }
 
 
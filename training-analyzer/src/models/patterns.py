@@ -244,6 +244,42 @@ class FitnessPrediction(BaseModel):
     planned_events: List[PlannedEvent] = Field(default_factory=list)
 
 
+class TaperScenarioResult(BaseModel):
+    """Projected outcome of one taper scenario."""
+    name: str
+    taper_days: int
+    reduction_pct: float
+    shape: str  # step, linear, exponential
+    taper_start_date: Optional[date] = None
+    peak_date: Optional[date] = None
+    peak_ctl: float
+    race_day_ctl: float
+    race_day_tsb: float
+    ctl_trajectory: List[float] = Field(default_factory=list)  # Daily, tomorrow to race day
+    tsb_trajectory: List[float] = Field(default_factory=list)
+
+
+class TaperExplorer(BaseModel):
+    """Taper what-if scenarios for a target race, evaluated in one batch."""
+    user_id: str
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    target_date: date
+    days_to_race: int
+    build_pct_per_week: float = 0.0
+
+    current_ctl: float = 0.0
+    current_atl: float = 0.0
+    current_tsb: float = 0.0
+    current_weekly_load: float = 0.0
+
+    # Holding the current load with no taper, for comparison
+    steady_race_day_ctl: Optional[float] = None
+    steady_race_day_tsb: Optional[float] = None
+
+    scenarios: List[TaperScenarioResult] = Field(default_factory=list)
+    recommended_scenario: Optional[str] = None
+
+
 # ==============================================================================
 # Correlation Analysis Models
 # ==============================================================================
@@ -287,7 +287,7 @@ class GeneratePacingPlanRequest(BaseModel):
     course_profile: Optional[CourseProfile] = Field(None, description="Course elevation profile")
     weather_conditions: Optional[WeatherConditions] = Field(None, description="Expected weather conditions")
 
-    split_unit: str = Field(default="km", pattern="^(km|mile)$", description="Split unit (km or mile)")
+    split_unit: str = Field(default="km", pattern="^(100m|km|mile)$", description="Split unit (100m, km or mile)")
 
     @field_validator('distance_km')
     @classmethod
@@ -314,6 +314,21 @@ class GeneratePacingPlanRequest(BaseModel):
         }
 
 
+class ActivityPacingPlanRequest(BaseModel):
+    """Request to generate a pacing plan over the course of a stored activity."""
+    target_time_sec: float = Field(..., gt=0, description="Target finish time in seconds")
+    race_distance: RaceDistance = Field(default=RaceDistance.CUSTOM, description="Race distance category")
+    distance_km: Optional[float] = Field(
+        None, gt=0, description="Race distance in km (defaults to the activity distance for custom races)"
+    )
+    race_name: Optional[str] = Field(None, description="Optional race name")
+
+    strategy: Optional[PacingStrategy] = Field(None, description="Preferred strategy (auto if not specified)")
+    weather_conditions: Optional[WeatherConditions] = Field(None, description="Expected weather conditions")
+
+    split_unit: str = Field(default="km", pattern="^(100m|km|mile)$", description="Split unit (100m, km or mile)")
+
+
 class WeatherAdjustmentRequest(BaseModel):
     """Request to calculate weather impact on pace."""
     base_pace_sec_km: float = Field(..., gt=0, description="Base target pace in sec/km")
@@ -301,6 +301,26 @@ class RecoveryModuleData(BaseModel):
     )
 
 
+class WellnessSnapshot(BaseModel):
+    """Latest stress, Body Battery and resting HR readings."""
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    date: Optional[date_type] = Field(None, description="Date of the latest stress reading")
+    avg_stress_level: Optional[int] = Field(None, description="Average stress (0-100)")
+    body_battery_high: Optional[int] = Field(None, description="Max Body Battery")
+    body_battery_low: Optional[int] = Field(None, description="Min Body Battery")
+    body_battery_charged: Optional[int] = Field(None, description="Body Battery points charged")
+    body_battery_drained: Optional[int] = Field(None, description="Body Battery points drained")
+    resting_hr: Optional[int] = Field(None, description="Latest resting heart rate")
+    resting_hr_7d_avg: Optional[float] = Field(
+        None, description="7-day average resting heart rate"
+    )
+
+
 # =============================================================================
 # API Request/Response Models
 # =============================================================================
@@ -383,3 +403,18 @@ class RecoveryTimeResponse(BaseModel):
     data: Optional[RecoveryTimeEstimate] = Field(None)
     workout_id: Optional[str] = Field(None, description="Workout this estimate is for")
     error: Optional[str] = Field(None)
+
+
+class RecoveryReadinessResponse(BaseModel):
+    """API response for the composite recovery/readiness view."""
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    success: bool = Field(...)
+    data: Optional[RecoveryModuleData] = Field(None)
+    wellness: Optional[WellnessSnapshot] = Field(None)
+    has_data: bool = Field(default=False, description="Whether any wellness data was found")
+    error: Optional[str] = Field(None)
@@ -5,6 +5,7 @@ This module provides:
 - Quality scoring for AI responses
 - Token usage tracking integrated with quota system
 - User feedback collection
+- Startup timing report
 """
 
 from .langfuse_config import (
@@ -25,6 +26,13 @@ from .scoring import (
     get_trace_usage_summary,
     UNNECESSARY_QUESTIONS,
 )
+from .startup import (
+    StartupReport,
+    get_startup_report,
+    mark_ready,
+    record_warmup,
+    startup_phase,
+)
 
 __all__ = [
     # Langfuse configuration
@@ -43,4 +51,10 @@ __all__ = [
     "sync_langfuse_to_quota",
     "get_trace_usage_summary",
     "UNNECESSARY_QUESTIONS",
+    # Startup timing
+    "StartupReport",
+    "get_startup_report",
+    "mark_ready",
+    "record_warmup",
+    "startup_phase",
 ]
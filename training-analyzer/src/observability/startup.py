@@ -0,0 +1,82 @@
+"""Startup timing report.
+
+Records how long each startup phase takes (route imports, lifespan
+setup, warm-up of deferred imports) and how long after the process was
+spawned the app became ready to serve, so cold starts on autoscaled
+workers can be measured rather than guessed.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+
+def _process_start_time() -> Optional[float]:
+    """Wall-clock time the process was spawned (Linux only, else None)."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime), counted after the parenthesised command name
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/stat") as f:
+            boot_time = next(
+                int(line.split()[1]) for line in f if line.startswith("btime")
+            )
+        return boot_time + start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, StopIteration):
+        return None
+
+
+@dataclass
+class StartupReport:
+    """Timings of one process's startup."""
+    process_started_at: float
+    phases: Dict[str, float] = field(default_factory=dict)
+    warmup: Dict[str, float] = field(default_factory=dict)
+    ready_at: Optional[float] = None
+    warmup_finished_at: Optional[float] = None
+
+    def _since_spawn_ms(self, at: Optional[float]) -> Optional[float]:
+        if at is None:
+            return None
+        return round((at - self.process_started_at) * 1000, 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready_at is not None,
+            "ready_after_ms": self._since_spawn_ms(self.ready_at),
+            "phases_ms": dict(self.phases),
+            "warmup_done": self.warmup_finished_at is not None,
+            "warmup_after_ms": self._since_spawn_ms(self.warmup_finished_at),
+            "warmup_ms": dict(self.warmup),
+        }
+
+
+_report = StartupReport(process_started_at=_process_start_time() or time.time())
+
+
+@contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    """Time a block of startup work under `name` (milliseconds)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _report.phases[name] = round((time.perf_counter() - start) * 1000, 1)
+
+
+def mark_ready() -> None:
+    """Record that the app is ready to serve requests."""
+    _report.ready_at = time.time()
+
+
+def record_warmup(timings: Dict[str, float]) -> None:
+    """Record per-module import times of the post-startup warm-up."""
+    _report.warmup.update(timings)
+    _report.warmup_finished_at = time.time()
+
+
+def get_startup_report() -> StartupReport:
+    """Get the startup report of this process."""
+    return _report
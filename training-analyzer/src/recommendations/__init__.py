@@ -15,6 +15,10 @@ from .workout import (
     recommend_workout,
     recommend_explained_workout,
 )
+from .factors import (
+    ExplanationFactors,
+    compute_explanation_factors,
+)
 from .explain import (
     explain_readiness,
     explain_workout,
@@ -33,6 +37,8 @@ __all__ = [
     "WorkoutRecommendation",
     "recommend_workout",
     "recommend_explained_workout",
+    "ExplanationFactors",
+    "compute_explanation_factors",
     "explain_readiness",
     "explain_workout",
     "generate_daily_narrative",
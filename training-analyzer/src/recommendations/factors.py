@@ -0,0 +1,216 @@
+"""
+Recency and wellness factors shared by the explanation endpoints.
+
+Readiness, workout and plan-session explanations all lean on the same
+handful of facts about the days before a date: how long since the last
+hard, long and rest day, how hard the recent sessions were, and how the
+day's wellness compares with the days before it. compute_explanation_factors
+derives all of them in one pass over the recent activities and one over
+the recent wellness days, so callers can compute (and cache) a single
+factor set per day.
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from ..analysis.weekly import HARD_SESSION_HRSS, HARD_SESSION_TRIMP
+from ..metrics.daily_frame import parse_day
+
+
+# Days of history considered (the target day plus the days before it)
+LOOKBACK_DAYS = 7
+
+# Sessions at least this long count as long sessions
+LONG_SESSION_MIN = 60.0
+
+# Values reported when no qualifying session falls in the lookback window
+DEFAULT_DAYS_SINCE_HARD = 3
+DEFAULT_DAYS_SINCE_LONG = 7
+
+# Wellness metrics compared with their mean over the preceding days:
+# name -> (wellness section, field)
+WELLNESS_DELTA_FIELDS: Dict[str, Tuple[str, str]] = {
+    "hrv": ("hrv", "hrv_last_night_avg"),
+    "sleep_hours": ("sleep", "total_sleep_hours"),
+    "sleep_score": ("sleep", "sleep_score"),
+    "resting_hr": ("resting_hr", "resting_hr"),
+    "stress": ("stress", "avg_stress_level"),
+    "body_battery": ("stress", "body_battery_high"),
+}
+
+# HR zones grouped into the intensity mix
+INTENSITY_ZONES = {
+    "low": (1, 2),
+    "moderate": (3,),
+    "high": (4, 5),
+}
+
+
+@dataclass
+class ExplanationFactors:
+    """
+    Precomputed factors for one day's explanations.
+
+    Attributes:
+        date: Day the factors describe (YYYY-MM-DD)
+        days_since_hard: Days since the last hard session (HRSS/TRIMP threshold)
+        days_since_long: Days since the last session of LONG_SESSION_MIN or more
+        days_since_rest: Days since the last day without activity, capped
+            at the lookback window
+        intensity_mix: Percent of recent zone time that was low, moderate
+            and high intensity
+        wellness: The day's wellness sections (hrv, sleep, stress, resting_hr)
+        wellness_deltas: Per metric, the day's value, the baseline mean of
+            the preceding days and the difference
+    """
+
+    date: str
+    lookback_days: int = LOOKBACK_DAYS
+    days_since_hard: int = DEFAULT_DAYS_SINCE_HARD
+    days_since_long: int = DEFAULT_DAYS_SINCE_LONG
+    days_since_rest: int = 0
+    session_count: int = 0
+    hard_session_count: int = 0
+    long_session_count: int = 0
+    active_days: int = 0
+    total_load: float = 0.0
+    total_duration_min: float = 0.0
+    intensity_mix: Dict[str, float] = field(default_factory=dict)
+    wellness: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    wellness_deltas: Dict[str, Dict[str, Optional[float]]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ExplanationFactors":
+        """Rebuild from to_dict() output, ignoring unknown keys."""
+        known = cls.__dataclass_fields__
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+def compute_explanation_factors(
+    activities: Iterable[Mapping[str, Any]],
+    wellness_days: Mapping[str, Mapping[str, Mapping[str, Any]]],
+    target_date: date,
+    lookback_days: int = LOOKBACK_DAYS,
+) -> ExplanationFactors:
+    """
+    Compute the recency and wellness factors for a day.
+
+    Args:
+        activities: Activity dicts (date, duration_min, hrss, trimp,
+            zone1_pct..zone5_pct); those outside the lookback window
+            ending on target_date are ignored
+        wellness_days: Date (YYYY-MM-DD) -> wellness sections for that day
+        target_date: Day to describe
+        lookback_days: Days before target_date to consider
+
+    Returns:
+        ExplanationFactors for target_date
+    """
+    first_day = target_date - timedelta(days=lookback_days)
+    factors = ExplanationFactors(date=target_date.isoformat(), lookback_days=lookback_days)
+
+    last_hard: Optional[date] = None
+    last_long: Optional[date] = None
+    active_days = set()
+    zone_minutes = {name: 0.0 for name in INTENSITY_ZONES}
+
+    for activity in activities:
+        day = parse_day(activity.get("date"))
+        if day is None or day < first_day or day > target_date:
+            continue
+
+        duration = activity.get("duration_min") or 0
+        hrss = activity.get("hrss") or 0
+        trimp = activity.get("trimp") or 0
+
+        active_days.add(day)
+        factors.session_count += 1
+        factors.total_duration_min += duration
+        factors.total_load += hrss or trimp
+
+        if hrss >= HARD_SESSION_HRSS or trimp >= HARD_SESSION_TRIMP:
+            factors.hard_session_count += 1
+            if last_hard is None or day > last_hard:
+                last_hard = day
+        if duration >= LONG_SESSION_MIN:
+            factors.long_session_count += 1
+            if last_long is None or day > last_long:
+                last_long = day
+
+        for name, zones in INTENSITY_ZONES.items():
+            zone_minutes[name] += duration * sum(
+                activity.get(f"zone{zone}_pct") or 0 for zone in zones
+            ) / 100
+
+    if last_hard is not None:
+        factors.days_since_hard = (target_date - last_hard).days
+    if last_long is not None:
+        factors.days_since_long = (target_date - last_long).days
+
+    factors.active_days = len(active_days)
+    factors.days_since_rest = lookback_days
+    for offset in range(1, lookback_days + 1):
+        if target_date - timedelta(days=offset) not in active_days:
+            factors.days_since_rest = offset
+            break
+
+    zone_total = sum(zone_minutes.values())
+    if zone_total > 0:
+        factors.intensity_mix = {
+            name: round(minutes / zone_total * 100, 1)
+            for name, minutes in zone_minutes.items()
+        }
+
+    factors.wellness = {
+        section: dict(values)
+        for section, values in wellness_days.get(target_date.isoformat(), {}).items()
+    }
+    factors.wellness_deltas = _wellness_deltas(wellness_days, target_date, first_day)
+    return factors
+
+
+def _wellness_deltas(
+    wellness_days: Mapping[str, Mapping[str, Mapping[str, Any]]],
+    target_date: date,
+    first_day: date,
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """Each metric's value on target_date against its mean over the days before."""
+    sums = {name: 0.0 for name in WELLNESS_DELTA_FIELDS}
+    counts = {name: 0 for name in WELLNESS_DELTA_FIELDS}
+    today: Dict[str, Optional[float]] = {name: None for name in WELLNESS_DELTA_FIELDS}
+
+    for day_key, sections in wellness_days.items():
+        day = parse_day(day_key)
+        if day is None or day < first_day or day > target_date:
+            continue
+        for name, (section, key) in WELLNESS_DELTA_FIELDS.items():
+            value = (sections.get(section) or {}).get(key)
+            if value is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            if day == target_date:
+                today[name] = float(value)
+            else:
+                sums[name] += value
+                counts[name] += 1
+
+    deltas: Dict[str, Dict[str, Optional[float]]] = {}
+    for name in WELLNESS_DELTA_FIELDS:
+        value = today[name]
+        baseline = sums[name] / counts[name] if counts[name] else None
+        if value is None and baseline is None:
+            continue
+        delta = value - baseline if value is not None and baseline is not None else None
+        deltas[name] = {
+            "value": value,
+            "baseline": round(baseline, 2) if baseline is not None else None,
+            "delta": round(delta, 2) if delta is not None else None,
+            "delta_pct": (
+                round(delta / baseline * 100, 1) if delta is not None and baseline else None
+            ),
+        }
+    return deltas
@@ -426,6 +426,7 @@ def calculate_readiness(
     recent_activities: list,
     weights: Optional[Dict[str, float]] = None,
     target_date: Optional[date] = None,
+    days_since_hard: Optional[int] = None,
 ) -> ReadinessResult:
     """
     Calculate overall readiness score.
@@ -436,6 +437,8 @@ def calculate_readiness(
         recent_activities: Last 7 days of activities
         weights: Optional custom weights for factors
         target_date: Date for assessment (defaults to today)
+        days_since_hard: Precomputed days since the last hard workout;
+            derived from recent_activities when not given
 
     Returns:
         ReadinessResult with score, zone, and recommendation
@@ -495,7 +498,9 @@ def calculate_readiness(
         )
 
     # Calculate days since last hard workout
-    if recent_activities:
+    if days_since_hard is not None:
+        factors.recovery_days = days_since_hard
+    elif recent_activities:
         factors.recovery_days = _calculate_days_since_hard(recent_activities, target_date)
 
     # Calculate weighted average score
@@ -622,6 +627,7 @@ def calculate_explained_readiness(
     recent_activities: list,
     weights: Optional[Dict[str, float]] = None,
     target_date: Optional[date] = None,
+    days_since_hard: Optional[int] = None,
 ) -> ExplainedReadiness:
     """
     Calculate readiness with full explainability.
@@ -636,6 +642,8 @@ def calculate_explained_readiness(
         recent_activities: Last 7 days of activities
         weights: Optional custom weights for factors
         target_date: Date for assessment (defaults to today)
+        days_since_hard: Precomputed days since the last hard workout;
+            derived from recent_activities when not given
 
     Returns:
         ExplainedReadiness with full factor breakdown
@@ -653,6 +661,7 @@ def calculate_explained_readiness(
         recent_activities=recent_activities,
         weights=weights,
         target_date=target_date,
+        days_since_hard=days_since_hard,
     )
 
     # Now build the detailed factor breakdown
@@ -1,68 +1,73 @@
-"""Services for training analysis."""
+"""Services for training analysis.
 
-from .enrichment import EnrichmentService, get_n8n_db_path
-from .coach import CoachService, find_wellness_db
-from .base import BaseService, CacheProtocol, PaginationParams, PaginatedResult
-from .analysis_service import AnalysisService
-from .plan_service import PlanService
-from .workout_service import WorkoutService
+Submodules are imported on first use of an exported name, so importing
+one service does not load the LLM agents and SDKs behind the others.
+"""
 
-# Phase 4: Adaptive Training Intelligence
-from .adaptation import (
-    WorkoutAdaptationEngine,
-    WorkoutCompletion,
-    PerformanceTrend,
-    AdaptationRecommendation,
-    WorkoutPrediction,
-    AdaptationTrigger,
-    AdaptationType,
-    get_adaptation_engine,
-)
-from .fatigue_prediction import (
-    FatiguePredictionService,
-    DailyReadiness,
-    FatiguePrediction,
-    ACWRAlert,
-    RecoveryEstimate,
-    FatigueLevel,
-    RecoveryState,
-    RiskLevel,
-    get_fatigue_service,
-)
+from ..utils.lazy_import import lazy_exports
 
-# Strava integration
-from .strava_service import (
-    StravaService,
-    StravaPreferences,
-    StravaSyncStatus,
-    format_strava_description_simple,
-    format_strava_description_extended,
-    format_strava_description_custom,
-)
-
-# AI Agentic - Training Pattern Detection
-from .training_pattern_service import (
-    TrainingPatternService,
-    TrainingPatterns,
-    get_training_pattern_service,
-    reset_training_pattern_service,
-)
-
-# AI Agentic - Workout Query Service
-from .workout_query_service import (
-    WorkoutQueryService,
-    WorkoutSummary,
-    get_workout_query_service,
-    reset_workout_query_service,
-)
-
-# Consent service for LLM data sharing
-from .consent_service import (
-    ConsentService,
-    ConsentStatus,
-    get_consent_service,
-    reset_consent_service,
-)
+# Exported name -> submodule (".module" or ".module:attr")
+_EXPORTS = {
+    "EnrichmentService": ".enrichment",
+    "get_n8n_db_path": ".enrichment",
+    "CoachService": ".coach",
+    "find_wellness_db": ".coach",
+    "BaseService": ".base",
+    "CacheProtocol": ".base",
+    "PaginationParams": ".base",
+    "PaginatedResult": ".base",
+    "AnalysisService": ".analysis_service",
+    "PlanService": ".plan_service",
+    "WorkoutService": ".workout_service",
+    # Phase 4: Adaptive Training Intelligence
+    "WorkoutAdaptationEngine": ".adaptation",
+    "WorkoutCompletion": ".adaptation",
+    "PerformanceTrend": ".adaptation",
+    "AdaptationRecommendation": ".adaptation",
+    "WorkoutPrediction": ".adaptation",
+    "AdaptationTrigger": ".adaptation",
+    "AdaptationType": ".adaptation",
+    "get_adaptation_engine": ".adaptation",
+    "FatiguePredictionService": ".fatigue_prediction",
+    "DailyReadiness": ".fatigue_prediction",
+    "FatiguePrediction": ".fatigue_prediction",
+    "ACWRAlert": ".fatigue_prediction",
+    "RecoveryEstimate": ".fatigue_prediction",
+    "FatigueLevel": ".fatigue_prediction",
+    "RecoveryState": ".fatigue_prediction",
+    "RiskLevel": ".fatigue_prediction",
+    "get_fatigue_service": ".fatigue_prediction",
+    # Strava integration
+    "StravaService": ".strava_service",
+    "StravaPreferences": ".strava_service",
+    "StravaSyncStatus": ".strava_service",
+    "format_strava_description_simple": ".strava_service",
+    "format_strava_description_extended": ".strava_service",
+    "format_strava_description_custom": ".strava_service",
+    # AI Agentic - Training Pattern Detection
+    "TrainingPatternService": ".training_pattern_service",
+    "TrainingPatterns": ".training_pattern_service",
+    "get_training_pattern_service": ".training_pattern_service",
+    "reset_training_pattern_service": ".training_pattern_service",
+    # Persisted weekly rollup
+    "WeeklyRollupService": ".weekly_rollup_service",
+    "get_weekly_rollup_service": ".weekly_rollup_service",
+    "reset_weekly_rollup_service": ".weekly_rollup_service",
+    # Cached explanation factors
+    "ExplanationFactorService": ".explanation_factor_service",
+    "get_explanation_factor_service": ".explanation_factor_service",
+    "reset_explanation_factor_service": ".explanation_factor_service",
+    # AI Agentic - Workout Query Service
+    "WorkoutQueryService": ".workout_query_service",
+    "WorkoutSummary": ".workout_query_service",
+    "get_workout_query_service": ".workout_query_service",
+    "reset_workout_query_service": ".workout_query_service",
+    # Consent service for LLM data sharing
+    "ConsentService": ".consent_service",
+    "ConsentStatus": ".consent_service",
+    "get_consent_service": ".consent_service",
+    "reset_consent_service": ".consent_service",
+}
 
 __all__ = [
     # Core services
@@ -110,6 +115,14 @@ __all__ = [
     "TrainingPatterns",
     "get_training_pattern_service",
     "reset_training_pattern_service",
+    # Persisted weekly rollup
+    "WeeklyRollupService",
+    "get_weekly_rollup_service",
+    "reset_weekly_rollup_service",
+    # Cached explanation factors
+    "ExplanationFactorService",
+    "get_explanation_factor_service",
+    "reset_explanation_factor_service",
     # AI Agentic - Workout Query Service
     "WorkoutQueryService",
     "WorkoutSummary",
@@ -121,3 +134,5 @@ __all__ = [
     "get_consent_service",
     "reset_consent_service",
 ]
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
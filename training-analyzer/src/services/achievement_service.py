@@ -5,16 +5,20 @@ Handles:
 - Achievement tracking and unlocking
 - XP and level progression
 - Streak tracking and management
+- Per-user progress ledger, updated incrementally as activities arrive and
+  rebuilt on read after activities change
 """
 
 import json
 import logging
 import sqlite3
 from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from ..db.repositories.cohort_repository import CohortDistributionRepository
 from ..db.schema import SCHEMA
 from ..models.gamification import (
     Achievement,
@@ -452,6 +456,192 @@ LEVEL_REWARDS: Dict[int, Dict[str, Any]] = {
 }
 
 
+# =============================================================================
+# Achievement Progress Ledger
+# =============================================================================
+
+# A workout counts as a high-intensity interval session when at least this
+# share of its time is spent in heart rate zones 4-5
+INTERVAL_HIGH_INTENSITY_PCT = 20.0
+
+
+def _advance_streak(
+    current: int,
+    longest: int,
+    last_activity_date: Optional[str],
+    activity_date: str,
+) -> Tuple[int, int, Optional[str], bool]:
+    """
+    Apply an activity date to a streak.
+
+    Returns:
+        Tuple of (current, longest, last_activity_date, streak_updated)
+    """
+    activity_dt = datetime.strptime(activity_date, "%Y-%m-%d").date()
+    if last_activity_date:
+        last_dt = datetime.strptime(last_activity_date, "%Y-%m-%d").date()
+        days_diff = (activity_dt - last_dt).days
+    else:
+        days_diff = None
+
+    if days_diff is None or days_diff > 1:
+        # First activity ever, or streak broken - start new
+        current, updated = 1, True
+    elif days_diff == 1:
+        # Consecutive day, increment streak
+        current, updated = current + 1, True
+    else:
+        # Same day or an activity in the past, no change
+        updated = False
+
+    # Only move last_activity_date forward
+    if days_diff is None or days_diff >= 0:
+        last_activity_date = activity_date
+
+    return current, max(longest, current), last_activity_date, updated
+
+
+def _week_start(day: str) -> str:
+    """Monday of the week containing a YYYY-MM-DD date."""
+    parsed = datetime.strptime(day[:10], "%Y-%m-%d").date()
+    return (parsed - timedelta(days=parsed.weekday())).isoformat()
+
+
+@dataclass
+class AchievementLedger:
+    """
+    Running per-user counters that achievement conditions are checked against.
+
+    Each activity or fitness reading updates the counters once, so checking
+    an achievement is a comparison rather than a query over history.
+    Streak fields are stored in user_progress; everything else in
+    achievement_ledger.
+    """
+
+    user_id: str = "default"
+    workout_count: int = 0
+    interval_workout_count: int = 0
+    zone5_minutes: float = 0.0
+    current_streak: int = 0
+    longest_streak: int = 0
+    last_activity_date: Optional[str] = None
+    vo2max_latest: float = 0.0
+    vo2max_baseline: float = 0.0
+    vo2max_peak: float = 0.0
+    vo2max_previous_peak: float = 0.0
+    vo2max_week: Optional[str] = None
+    vo2max_week_value: float = 0.0
+    vo2max_prior_week_value: float = 0.0
+    vo2max_trend_weeks: int = 0
+    ctl_latest: float = 0.0
+    ctl_peak: float = 0.0
+    ctl_previous_peak: float = 0.0
+
+    def apply_activity_date(self, activity_date: str) -> bool:
+        """Advance the streak for an activity date. Returns True if it changed."""
+        (
+            self.current_streak,
+            self.longest_streak,
+            self.last_activity_date,
+            updated,
+        ) = _advance_streak(
+            self.current_streak,
+            self.longest_streak,
+            self.last_activity_date,
+            activity_date,
+        )
+        return updated
+
+    def apply_activity(
+        self,
+        activity_date: str,
+        duration_min: Optional[float] = None,
+        zone4_pct: Optional[float] = None,
+        zone5_pct: Optional[float] = None,
+    ) -> bool:
+        """Count a newly ingested workout. Returns True if the streak changed."""
+        self.workout_count += 1
+
+        high_intensity_pct = (zone4_pct or 0) + (zone5_pct or 0)
+        if high_intensity_pct >= INTERVAL_HIGH_INTENSITY_PCT:
+            self.interval_workout_count += 1
+
+        if duration_min and zone5_pct:
+            self.zone5_minutes += duration_min * zone5_pct / 100
+
+        return self.apply_activity_date(activity_date[:10])
+
+    def apply_vo2max(self, reading_date: str, value: float) -> None:
+        """
+        Record a VO2 Max reading.
+
+        The trend counts consecutive calendar weeks whose best reading beat
+        the previous week's, and is updated when a new week starts.
+        """
+        if not value or value <= 0:
+            return
+
+        if self.vo2max_baseline <= 0:
+            self.vo2max_baseline = value
+        self.vo2max_previous_peak = self.vo2max_peak
+        self.vo2max_peak = max(self.vo2max_peak, value)
+        self.vo2max_latest = value
+
+        week = _week_start(reading_date)
+        if self.vo2max_week is None:
+            self.vo2max_week, self.vo2max_week_value = week, value
+        elif week == self.vo2max_week:
+            self.vo2max_week_value = max(self.vo2max_week_value, value)
+        elif week > self.vo2max_week:
+            # Close out the finished week
+            weeks_apart = (
+                date.fromisoformat(week) - date.fromisoformat(self.vo2max_week)
+            ).days // 7
+            rising = 0 < self.vo2max_prior_week_value < self.vo2max_week_value
+            self.vo2max_trend_weeks = self.vo2max_trend_weeks + 1 if rising else 0
+            # A week without readings breaks the chain for the new week
+            self.vo2max_prior_week_value = self.vo2max_week_value if weeks_apart == 1 else 0.0
+            self.vo2max_week, self.vo2max_week_value = week, value
+
+    def apply_ctl(self, value: float) -> None:
+        """Record the latest CTL value."""
+        if value is None:
+            return
+        self.ctl_previous_peak = self.ctl_peak
+        self.ctl_peak = max(self.ctl_peak, value)
+        self.ctl_latest = value
+
+    @property
+    def vo2max_improvement_pct(self) -> float:
+        """Improvement of the latest VO2 Max over the baseline, in percent."""
+        if self.vo2max_baseline <= 0 or self.vo2max_latest <= 0:
+            return 0.0
+        return (self.vo2max_latest - self.vo2max_baseline) / self.vo2max_baseline * 100
+
+
+# Ledger value each achievement condition type is compared against. Personal
+# best conditions are 1 only when the latest reading beat an earlier peak.
+LEDGER_CONDITIONS: Dict[str, Callable[[AchievementLedger], float]] = {
+    "workout_count": lambda ledger: ledger.workout_count,
+    "streak": lambda ledger: ledger.current_streak,
+    "interval_workouts": lambda ledger: ledger.interval_workout_count,
+    "zone5_minutes": lambda ledger: ledger.zone5_minutes,
+    "vo2max_baseline": lambda ledger: 1 if ledger.vo2max_baseline > 0 else 0,
+    "vo2max_improvement": lambda ledger: ledger.vo2max_improvement_pct,
+    "vo2max_trend": lambda ledger: ledger.vo2max_trend_weeks,
+    "vo2max_pr": lambda ledger: 1 if 0 < ledger.vo2max_previous_peak < ledger.vo2max_latest else 0,
+    "ctl": lambda ledger: ledger.ctl_latest,
+    "ctl_peak": lambda ledger: 1 if 0 < ledger.ctl_previous_peak < ledger.ctl_latest else 0,
+}
+
+# Ledger columns persisted in achievement_ledger (streak lives in user_progress)
+_STREAK_FIELDS = ("current_streak", "longest_streak", "last_activity_date")
+_LEDGER_COLUMNS = [
+    f.name for f in fields(AchievementLedger)
+    if f.name != "user_id" and f.name not in _STREAK_FIELDS
+]
+
+
 class AchievementService:
     """
     Service for managing achievements and gamification features.
@@ -461,6 +651,7 @@ class AchievementService:
     - Achievement unlock checking and tracking
     - XP progression and level calculation
     - Streak tracking and updates
+    - The per-user progress ledger behind workout achievements
     """
 
     def __init__(self, db_path: Optional[str] = None):
@@ -476,6 +667,9 @@ class AchievementService:
             from ..db.database import get_default_db_path
             self.db_path = get_default_db_path()
 
+        self._definitions: Optional[List[Tuple[Achievement, float]]] = None
+        self._cohorts = CohortDistributionRepository(str(self.db_path))
+
         self._init_db()
         self._seed_achievements()
 
@@ -483,6 +677,43 @@ class AchievementService:
         """Initialize database tables if they don't exist."""
         with self._get_connection() as conn:
             conn.executescript(SCHEMA)
+            self._migrate_user_achievements(conn)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_user_achievements_user "
+                "ON user_achievements(user_id, unlocked_at)"
+            )
+
+    def _migrate_user_achievements(self, conn: sqlite3.Connection) -> None:
+        """Rebuild single-user user_achievements tables with a user_id column.
+
+        The old table was UNIQUE on achievement_id alone, so the column
+        cannot simply be added. Existing unlocks are kept for 'default'.
+        """
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(user_achievements)")}
+        if "user_id" in columns:
+            return
+
+        conn.executescript("""
+            ALTER TABLE user_achievements RENAME TO user_achievements_legacy;
+            CREATE TABLE user_achievements (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL DEFAULT 'default',
+                achievement_id TEXT NOT NULL,
+                unlocked_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                workout_id TEXT,
+                metadata_json TEXT,
+                FOREIGN KEY (achievement_id) REFERENCES achievements(id),
+                UNIQUE(user_id, achievement_id)
+            );
+            INSERT INTO user_achievements
+                (id, user_id, achievement_id, unlocked_at, workout_id, metadata_json)
+            SELECT id, 'default', achievement_id, unlocked_at, workout_id, metadata_json
+            FROM user_achievements_legacy;
+            DROP TABLE user_achievements_legacy;
+            CREATE INDEX IF NOT EXISTS idx_user_achievements_unlocked
+                ON user_achievements(unlocked_at);
+        """)
+        logger.info("Migrated user_achievements to per-user unlocks")
 
     @contextmanager
     def _get_connection(self):
@@ -538,10 +769,13 @@ class AchievementService:
     # Achievement Methods
     # =========================================================================
 
-    def get_all_achievements(self) -> List[AchievementWithStatus]:
+    def get_all_achievements(self, user_id: str = "default") -> List[AchievementWithStatus]:
         """
         Get all achievements with unlock status for the user.
 
+        Args:
+            user_id: The user ID
+
         Returns:
             List of achievements with their unlock status
         """
@@ -552,9 +786,11 @@ class AchievementService:
                     a.*,
                     ua.unlocked_at
                 FROM achievements a
-                LEFT JOIN user_achievements ua ON a.id = ua.achievement_id
+                LEFT JOIN user_achievements ua
+                    ON a.id = ua.achievement_id AND ua.user_id = ?
                 ORDER BY a.display_order, a.id
-                """
+                """,
+                (user_id,),
             ).fetchall()
 
             result = []
@@ -584,10 +820,13 @@ class AchievementService:
 
             return result
 
-    def get_user_achievements(self) -> List[AchievementUnlock]:
+    def get_user_achievements(self, user_id: str = "default") -> List[AchievementUnlock]:
         """
         Get all achievements unlocked by the user.
 
+        Args:
+            user_id: The user ID
+
         Returns:
             List of unlocked achievements with unlock details
         """
@@ -599,8 +838,10 @@ class AchievementService:
                     ua.unlocked_at
                 FROM user_achievements ua
                 JOIN achievements a ON a.id = ua.achievement_id
+                WHERE ua.user_id = ?
                 ORDER BY ua.unlocked_at DESC
-                """
+                """,
+                (user_id,),
             ).fetchall()
 
             result = []
@@ -626,12 +867,15 @@ class AchievementService:
 
             return result
 
-    def get_recent_achievements(self, days: int = 7) -> List[AchievementUnlock]:
+    def get_recent_achievements(
+        self, days: int = 7, user_id: str = "default"
+    ) -> List[AchievementUnlock]:
         """
         Get recently unlocked achievements.
 
         Args:
             days: Number of days to look back
+            user_id: The user ID
 
         Returns:
             List of recently unlocked achievements
@@ -646,10 +890,10 @@ class AchievementService:
                     ua.unlocked_at
                 FROM user_achievements ua
                 JOIN achievements a ON a.id = ua.achievement_id
-                WHERE ua.unlocked_at >= ?
+                WHERE ua.user_id = ? AND ua.unlocked_at >= ?
                 ORDER BY ua.unlocked_at DESC
                 """,
-                (cutoff,),
+                (user_id, cutoff),
             ).fetchall()
 
             result = []
@@ -675,20 +919,30 @@ class AchievementService:
 
             return result
 
-    def _is_achievement_unlocked(self, achievement_id: str) -> bool:
+    def _is_achievement_unlocked(self, achievement_id: str, user_id: str = "default") -> bool:
         """Check if an achievement is already unlocked."""
         with self._get_connection() as conn:
             row = conn.execute(
-                "SELECT 1 FROM user_achievements WHERE achievement_id = ?",
-                (achievement_id,),
+                "SELECT 1 FROM user_achievements WHERE user_id = ? AND achievement_id = ?",
+                (user_id, achievement_id),
             ).fetchone()
             return row is not None
 
+    def _get_unlocked_ids(self, user_id: str) -> Set[str]:
+        """Get the IDs of all achievements a user has unlocked."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT achievement_id FROM user_achievements WHERE user_id = ?",
+                (user_id,),
+            ).fetchall()
+            return {row["achievement_id"] for row in rows}
+
     def _unlock_achievement(
         self,
         achievement_id: str,
         workout_id: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        user_id: str = "default",
     ) -> Optional[AchievementUnlock]:
         """
         Unlock an achievement for the user.
@@ -697,11 +951,12 @@ class AchievementService:
             achievement_id: ID of the achievement to unlock
             workout_id: Optional workout that triggered the unlock
             metadata: Optional additional metadata
+            user_id: The user ID
 
         Returns:
             AchievementUnlock if newly unlocked, None if already unlocked
         """
-        if self._is_achievement_unlocked(achievement_id):
+        if self._is_achievement_unlocked(achievement_id, user_id):
             return None
 
         with self._get_connection() as conn:
@@ -722,10 +977,10 @@ class AchievementService:
             conn.execute(
                 """
                 INSERT INTO user_achievements
-                (achievement_id, unlocked_at, workout_id, metadata_json)
-                VALUES (?, ?, ?, ?)
+                (user_id, achievement_id, unlocked_at, workout_id, metadata_json)
+                VALUES (?, ?, ?, ?, ?)
                 """,
-                (achievement_id, unlocked_at, workout_id, metadata_json),
+                (user_id, achievement_id, unlocked_at, workout_id, metadata_json),
             )
 
             achievement = Achievement(
@@ -753,17 +1008,20 @@ class AchievementService:
     # Progress Methods
     # =========================================================================
 
-    def get_user_progress(self) -> UserProgress:
+    def get_user_progress(self, user_id: str = "default") -> UserProgress:
         """
         Get the user's overall gamification progress.
 
+        Args:
+            user_id: The user ID
+
         Returns:
             UserProgress with XP, level, and streak info
         """
         with self._get_connection() as conn:
             # Get or create user progress
             row = conn.execute(
-                "SELECT * FROM user_progress WHERE user_id = 'default'"
+                "SELECT * FROM user_progress WHERE user_id = ?", (user_id,)
             ).fetchone()
 
             if not row:
@@ -772,16 +1030,18 @@ class AchievementService:
                     """
                     INSERT INTO user_progress (user_id, total_xp, current_level,
                         current_streak, longest_streak, streak_freeze_tokens)
-                    VALUES ('default', 0, 1, 0, 0, 0)
-                    """
+                    VALUES (?, 0, 1, 0, 0, 0)
+                    """,
+                    (user_id,),
                 )
                 row = conn.execute(
-                    "SELECT * FROM user_progress WHERE user_id = 'default'"
+                    "SELECT * FROM user_progress WHERE user_id = ?", (user_id,)
                 ).fetchone()
 
             # Count unlocked achievements
             achievement_count = conn.execute(
-                "SELECT COUNT(*) as cnt FROM user_achievements"
+                "SELECT COUNT(*) as cnt FROM user_achievements WHERE user_id = ?",
+                (user_id,),
             ).fetchone()["cnt"]
 
             total_xp = row["total_xp"] or 0
@@ -817,7 +1077,7 @@ class AchievementService:
                 )
 
             return UserProgress(
-                user_id="default",
+                user_id=user_id,
                 total_xp=total_xp,
                 level=level_info,
                 streak=streak_info,
@@ -828,13 +1088,16 @@ class AchievementService:
                 next_reward=next_reward,
             )
 
-    def add_xp(self, amount: int, source: str) -> Tuple[int, bool, Optional[int]]:
+    def add_xp(
+        self, amount: int, source: str, user_id: str = "default"
+    ) -> Tuple[int, bool, Optional[int]]:
         """
         Add XP to the user's progress.
 
         Args:
             amount: Amount of XP to add
             source: Description of XP source
+            user_id: The user ID
 
         Returns:
             Tuple of (new_total_xp, level_up_occurred, new_level)
@@ -842,7 +1105,8 @@ class AchievementService:
         with self._get_connection() as conn:
             # Get current progress
             row = conn.execute(
-                "SELECT total_xp, current_level FROM user_progress WHERE user_id = 'default'"
+                "SELECT total_xp, current_level FROM user_progress WHERE user_id = ?",
+                (user_id,),
             ).fetchone()
 
             if not row:
@@ -861,20 +1125,18 @@ class AchievementService:
             # Update progress
             conn.execute(
                 """
-                INSERT OR REPLACE INTO user_progress
+                INSERT INTO user_progress
                 (user_id, total_xp, current_level, current_streak, longest_streak,
-                 streak_freeze_tokens, last_activity_date, updated_at)
-                VALUES (
-                    'default', ?, ?,
-                    COALESCE((SELECT current_streak FROM user_progress WHERE user_id = 'default'), 0),
-                    COALESCE((SELECT longest_streak FROM user_progress WHERE user_id = 'default'), 0),
-                    COALESCE((SELECT streak_freeze_tokens FROM user_progress WHERE user_id = 'default'), 0),
-                    (SELECT last_activity_date FROM user_progress WHERE user_id = 'default'),
-                    CURRENT_TIMESTAMP
-                )
+                 streak_freeze_tokens, updated_at)
+                VALUES (?, ?, ?, 0, 0, 0, CURRENT_TIMESTAMP)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    total_xp = excluded.total_xp,
+                    current_level = excluded.current_level,
+                    updated_at = CURRENT_TIMESTAMP
                 """,
-                (new_xp, new_level),
+                (user_id, new_xp, new_level),
             )
+            self._cohorts.record_value(user_id, "level", new_level, conn=conn)
 
             logger.info(f"Added {amount} XP from {source}. Total: {new_xp}")
 
@@ -887,100 +1149,360 @@ class AchievementService:
     # Streak Methods
     # =========================================================================
 
-    def update_streak(self, activity_date: str) -> Tuple[int, bool]:
+    def update_streak(self, activity_date: str, user_id: str = "default") -> Tuple[int, bool]:
         """
         Update the user's workout streak based on activity date.
 
         Args:
             activity_date: Date of the activity (YYYY-MM-DD)
+            user_id: The user ID
 
         Returns:
             Tuple of (current_streak, streak_updated)
         """
         with self._get_connection() as conn:
-            # Get current progress
             row = conn.execute(
-                "SELECT * FROM user_progress WHERE user_id = 'default'"
+                "SELECT * FROM user_progress WHERE user_id = ?", (user_id,)
             ).fetchone()
 
-            if not row:
-                # Create new progress
-                conn.execute(
-                    """
-                    INSERT INTO user_progress (user_id, total_xp, current_level,
-                        current_streak, longest_streak, streak_freeze_tokens,
-                        last_activity_date, updated_at)
-                    VALUES ('default', 0, 1, 1, 1, 0, ?, CURRENT_TIMESTAMP)
-                    """,
-                    (activity_date,),
-                )
-                return 1, True
+            current, longest, last_activity, updated = _advance_streak(
+                row["current_streak"] or 0 if row else 0,
+                row["longest_streak"] or 0 if row else 0,
+                row["last_activity_date"] if row else None,
+                activity_date,
+            )
+            self._save_streak(conn, user_id, current, longest, last_activity)
+            return current, updated
 
-            last_activity = row["last_activity_date"]
-            current_streak = row["current_streak"] or 0
-            longest_streak = row["longest_streak"] or 0
+    def _save_streak(
+        self,
+        conn: sqlite3.Connection,
+        user_id: str,
+        current: int,
+        longest: int,
+        last_activity_date: Optional[str],
+    ) -> None:
+        """Upsert streak counters in user_progress, keeping XP intact."""
+        conn.execute(
+            """
+            INSERT INTO user_progress (user_id, total_xp, current_level,
+                current_streak, longest_streak, streak_freeze_tokens,
+                last_activity_date, updated_at)
+            VALUES (?, 0, 1, ?, ?, 0, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(user_id) DO UPDATE SET
+                current_streak = excluded.current_streak,
+                longest_streak = excluded.longest_streak,
+                last_activity_date = excluded.last_activity_date,
+                updated_at = CURRENT_TIMESTAMP
+            """,
+            (user_id, current, longest, last_activity_date),
+        )
+        self._cohorts.record_value(user_id, "streak", current, conn=conn)
 
-            # Parse dates
-            activity_dt = datetime.strptime(activity_date, "%Y-%m-%d").date()
+    # =========================================================================
+    # Progress Ledger
+    # =========================================================================
 
-            if last_activity:
-                last_dt = datetime.strptime(last_activity, "%Y-%m-%d").date()
-                days_diff = (activity_dt - last_dt).days
-            else:
-                days_diff = None
+    def _load_ledger(
+        self, conn: sqlite3.Connection, user_id: str
+    ) -> Optional[AchievementLedger]:
+        """Load a user's ledger, or None if it was never built."""
+        row = conn.execute(
+            "SELECT * FROM achievement_ledger WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        if row is None:
+            return None
 
-            streak_updated = False
+        ledger = AchievementLedger(user_id=user_id)
+        for column in _LEDGER_COLUMNS:
+            if row[column] is not None:
+                setattr(ledger, column, row[column])
+
+        progress = conn.execute(
+            "SELECT current_streak, longest_streak, last_activity_date "
+            "FROM user_progress WHERE user_id = ?",
+            (user_id,),
+        ).fetchone()
+        if progress is not None:
+            ledger.current_streak = progress["current_streak"] or 0
+            ledger.longest_streak = progress["longest_streak"] or 0
+            ledger.last_activity_date = progress["last_activity_date"]
+        return ledger
+
+    def _save_ledger(self, conn: sqlite3.Connection, ledger: AchievementLedger) -> None:
+        """Persist a ledger (and its streak) in the caller's transaction."""
+        placeholders = ", ".join("?" for _ in _LEDGER_COLUMNS)
+        updates = ", ".join(f"{c} = excluded.{c}" for c in _LEDGER_COLUMNS)
+        conn.execute(
+            f"""
+            INSERT INTO achievement_ledger (user_id, {", ".join(_LEDGER_COLUMNS)}, updated_at)
+            VALUES (?, {placeholders}, CURRENT_TIMESTAMP)
+            ON CONFLICT(user_id) DO UPDATE SET {updates}, updated_at = CURRENT_TIMESTAMP
+            """,
+            (ledger.user_id, *(getattr(ledger, c) for c in _LEDGER_COLUMNS)),
+        )
+        self._save_streak(
+            conn,
+            ledger.user_id,
+            ledger.current_streak,
+            ledger.longest_streak,
+            ledger.last_activity_date,
+        )
 
-            if days_diff is None:
-                # First activity ever
-                new_streak = 1
-                streak_updated = True
-            elif days_diff == 0:
-                # Same day activity, no change
-                new_streak = current_streak
-            elif days_diff == 1:
-                # Consecutive day, increment streak
-                new_streak = current_streak + 1
-                streak_updated = True
-            elif days_diff > 1:
-                # Streak broken, start new
-                new_streak = 1
-                streak_updated = True
-            else:
-                # Activity in the past, don't update streak
-                new_streak = current_streak
+    def get_ledger(self, user_id: str = "default") -> AchievementLedger:
+        """
+        Get a user's progress ledger, building it from history when missing.
 
-            # Update longest streak
-            new_longest = max(longest_streak, new_streak)
+        The ledger is missing until first use and after a trigger dropped it
+        because one of the user's activities or manual workouts changed.
 
-            # Only update last_activity_date if this is a new or future date
-            update_last = days_diff is None or days_diff >= 0
+        Args:
+            user_id: The user ID
 
-            if update_last:
-                conn.execute(
-                    """
-                    UPDATE user_progress
-                    SET current_streak = ?,
-                        longest_streak = ?,
-                        last_activity_date = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE user_id = 'default'
-                    """,
-                    (new_streak, new_longest, activity_date),
+        Returns:
+            The user's AchievementLedger
+        """
+        with self._get_connection() as conn:
+            ledger = self._load_ledger(conn, user_id)
+        if ledger is None:
+            ledger = self.rebuild_ledger(user_id)
+        return ledger
+
+    def rebuild_ledger(self, user_id: str = "default") -> AchievementLedger:
+        """
+        Rebuild a user's ledger from their stored activities and fitness history.
+
+        A user's activities are the synced activities recorded for them and
+        their manual workouts; activities nobody recorded belong to the local
+        athlete ('default'), whose rebuild claims them. VO2 Max and CTL
+        history have no user either, so they are only folded in for the
+        local athlete and for users who own synced activities. A user
+        without data gets an empty ledger.
+
+        History is folded into the counters in memory and written once, so
+        backfilling thousands of workouts costs a few queries.
+
+        Args:
+            user_id: The user ID
+
+        Returns:
+            The rebuilt AchievementLedger
+        """
+        ledger = AchievementLedger(user_id=user_id)
+
+        with self._get_connection() as conn:
+            # Forget activities that were deleted since they were recorded
+            conn.execute(
+                """
+                DELETE FROM achievement_ledger_activities
+                WHERE user_id = ?
+                  AND activity_id NOT IN (SELECT activity_id FROM activity_metrics)
+                """,
+                (user_id,),
+            )
+            activities = conn.execute(
+                """
+                SELECT a.activity_id, a.date, a.start_time, a.duration_min,
+                       a.zone4_pct, a.zone5_pct
+                FROM activity_metrics a
+                WHERE EXISTS (
+                    SELECT 1 FROM achievement_ledger_activities l
+                    WHERE l.activity_id = a.activity_id AND l.user_id = :user_id
+                ) OR (:user_id = 'default' AND NOT EXISTS (
+                    SELECT 1 FROM achievement_ledger_activities l
+                    WHERE l.activity_id = a.activity_id
+                ))
+                """,
+                {"user_id": user_id},
+            ).fetchall()
+            manual_workouts = conn.execute(
+                """
+                SELECT activity_id, date, NULL AS start_time, duration_min,
+                       NULL AS zone4_pct, NULL AS zone5_pct
+                FROM manual_workouts
+                WHERE user_id = ?
+                """,
+                (user_id,),
+            ).fetchall()
+
+            workouts = sorted(
+                activities + manual_workouts,
+                key=lambda row: (row["date"], row["start_time"] or ""),
+            )
+            for workout in workouts:
+                ledger.apply_activity(
+                    workout["date"],
+                    workout["duration_min"],
+                    workout["zone4_pct"],
+                    workout["zone5_pct"],
                 )
-            else:
-                conn.execute(
+
+            if user_id == "default" or activities:
+                for row in conn.execute(
                     """
-                    UPDATE user_progress
-                    SET current_streak = ?,
-                        longest_streak = ?,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE user_id = 'default'
-                    """,
-                    (new_streak, new_longest),
+                    SELECT date, vo2max_running FROM garmin_fitness_data
+                    WHERE vo2max_running > 0
+                    ORDER BY date
+                    """
+                ):
+                    ledger.apply_vo2max(row["date"], row["vo2max_running"])
+
+                for row in conn.execute(
+                    "SELECT ctl FROM fitness_metrics WHERE ctl IS NOT NULL ORDER BY date"
+                ):
+                    ledger.apply_ctl(row["ctl"])
+
+            # Claims the local athlete's unrecorded activities (a no-op for
+            # activities already recorded for this user)
+            conn.executemany(
+                "INSERT OR IGNORE INTO achievement_ledger_activities (user_id, activity_id) "
+                "VALUES (?, ?)",
+                ((user_id, activity["activity_id"]) for activity in activities),
+            )
+            self._save_ledger(conn, ledger)
+
+        logger.info(
+            f"Rebuilt achievement ledger for {user_id} from {len(workouts)} workouts"
+        )
+        return ledger
+
+    def record_activity(
+        self,
+        activity: Any,
+        user_id: str = "default",
+    ) -> CheckAchievementsResponse:
+        """
+        Count a newly ingested activity and unlock any achievements it earns.
+
+        Recording the same activity twice has no effect.
+
+        Args:
+            activity: ActivityMetrics (or any object with activity_id, date,
+                duration_min, zone4_pct and zone5_pct)
+            user_id: The user ID
+
+        Returns:
+            CheckAchievementsResponse with new unlocks and XP earned
+        """
+        # Make sure history is counted before the new activity
+        self.get_ledger(user_id)
+
+        with self._get_connection() as conn:
+            ledger = self._load_ledger(conn, user_id)
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO achievement_ledger_activities (user_id, activity_id) "
+                "VALUES (?, ?)",
+                (user_id, activity.activity_id),
+            ).rowcount
+            streak_updated = False
+            if inserted:
+                streak_updated = ledger.apply_activity(
+                    activity.date,
+                    activity.duration_min,
+                    activity.zone4_pct,
+                    activity.zone5_pct,
                 )
+                self._save_ledger(conn, ledger)
 
-            return new_streak, streak_updated
+        return self._evaluate_ledger(
+            ledger,
+            workout_id=activity.activity_id,
+            streak_updated=streak_updated,
+        )
+
+    def _get_definitions(self) -> List[Tuple[Achievement, float]]:
+        """Get ledger-backed achievements with their numeric thresholds."""
+        if self._definitions is None:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT * FROM achievements ORDER BY display_order, id"
+                ).fetchall()
+
+            definitions = []
+            for row in rows:
+                if row["condition_type"] not in LEDGER_CONDITIONS:
+                    continue
+                try:
+                    threshold = float(row["condition_value"])
+                except (TypeError, ValueError):
+                    threshold = 1.0  # e.g. "personal_best"
+                definitions.append((self._row_to_achievement(row), threshold))
+            self._definitions = definitions
+        return self._definitions
+
+    @staticmethod
+    def _row_to_achievement(row: sqlite3.Row) -> Achievement:
+        """Convert an achievements row to an Achievement."""
+        return Achievement(
+            id=row["id"],
+            name=row["name"],
+            description=row["description"],
+            category=AchievementCategory(row["category"]),
+            icon=row["icon"],
+            xp_value=row["xp_value"],
+            rarity=AchievementRarity(row["rarity"]),
+            condition_type=row["condition_type"],
+            condition_value=row["condition_value"],
+            display_order=row["display_order"],
+        )
+
+    def _evaluate_ledger(
+        self,
+        ledger: AchievementLedger,
+        workout_id: Optional[str] = None,
+        streak_updated: bool = False,
+    ) -> CheckAchievementsResponse:
+        """Unlock every achievement whose threshold the ledger meets."""
+        unlocked_ids = self._get_unlocked_ids(ledger.user_id)
+        earned = []
+        for achievement, threshold in self._get_definitions():
+            if achievement.id in unlocked_ids:
+                continue
+            value = LEDGER_CONDITIONS[achievement.condition_type](ledger)
+            if value >= threshold:
+                earned.append((achievement, value))
+
+        new_achievements: List[AchievementUnlock] = []
+        if earned:
+            unlocked_at = datetime.now()
+            with self._get_connection() as conn:
+                for achievement, value in earned:
+                    inserted = conn.execute(
+                        """
+                        INSERT OR IGNORE INTO user_achievements
+                        (user_id, achievement_id, unlocked_at, workout_id, metadata_json)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        (
+                            ledger.user_id,
+                            achievement.id,
+                            unlocked_at.isoformat(),
+                            workout_id,
+                            json.dumps({achievement.condition_type: round(value, 1)}),
+                        ),
+                    ).rowcount
+                    if inserted:
+                        logger.info(f"Achievement unlocked: {achievement.name}")
+                        new_achievements.append(AchievementUnlock(
+                            achievement=achievement,
+                            unlocked_at=unlocked_at,
+                            is_new=True,
+                        ))
+
+        total_xp = sum(unlock.achievement.xp_value for unlock in new_achievements)
+        level_up = False
+        new_level = None
+        if total_xp > 0:
+            _, level_up, new_level = self.add_xp(total_xp, "achievements", ledger.user_id)
+
+        return CheckAchievementsResponse(
+            new_achievements=new_achievements,
+            xp_earned=total_xp,
+            level_up=level_up,
+            new_level=new_level,
+            streak_updated=streak_updated,
+            current_streak=ledger.current_streak,
+        )
 
     # =========================================================================
     # Achievement Checking
@@ -989,214 +1511,64 @@ class AchievementService:
     def check_and_unlock_achievements(
         self,
         context: Dict[str, Any],
+        user_id: str = "default",
     ) -> CheckAchievementsResponse:
         """
         Check conditions and unlock any newly earned achievements.
 
+        The context's readings are folded into the user's ledger, then every
+        achievement is checked against the ledger's counters.
+
         Args:
             context: Dictionary with context data:
                 - workout_id: Optional workout ID
                 - activity_date: Activity date (YYYY-MM-DD)
                 - ctl: Current CTL value
-                - ctl_peak: Historical peak CTL
+                - ctl_peak: Historical peak CTL (optional, tracked by the ledger)
+                - vo2max_running: Latest VO2 Max
+                - vo2max_date: Date of the VO2 Max reading (defaults to activity_date)
+                - vo2max_baseline, vo2max_peak, vo2max_trend_weeks,
+                  interval_workout_count, zone5_total_minutes: Optional
+                  overrides for counters tracked by the ledger
+            user_id: The user ID
 
         Returns:
             CheckAchievementsResponse with new unlocks and XP earned
         """
-        new_achievements: List[AchievementUnlock] = []
-        total_xp = 0
-
-        workout_id = context.get("workout_id")
-        activity_date = context.get("activity_date", date.today().isoformat())
+        activity_date = context.get("activity_date") or date.today().isoformat()
+        ledger = self.get_ledger(user_id)
 
-        # Update streak
-        current_streak, streak_updated = self.update_streak(activity_date)
+        streak_updated = ledger.apply_activity_date(activity_date)
 
-        # Get current progress for context
-        progress = self.get_user_progress()
-        workout_count = self._get_workout_count()
-
-        # Check first workout
-        if workout_count >= 1:
-            unlock = self._unlock_achievement("first_workout", workout_id)
-            if unlock:
-                new_achievements.append(unlock)
-                total_xp += unlock.achievement.xp_value
+        # Externally supplied aggregates can only raise the ledger's counters
+        ledger.interval_workout_count = max(
+            ledger.interval_workout_count, context.get("interval_workout_count") or 0
+        )
+        ledger.zone5_minutes = max(ledger.zone5_minutes, context.get("zone5_total_minutes") or 0)
+        ledger.vo2max_trend_weeks = max(
+            ledger.vo2max_trend_weeks, context.get("vo2max_trend_weeks") or 0
+        )
+        if (context.get("vo2max_baseline") or 0) > 0 and ledger.vo2max_baseline <= 0:
+            ledger.vo2max_baseline = context["vo2max_baseline"]
+        ledger.vo2max_peak = max(ledger.vo2max_peak, context.get("vo2max_peak") or 0)
+        ledger.ctl_peak = max(ledger.ctl_peak, context.get("ctl_peak") or 0)
 
-        # Check streak achievements
-        streak_thresholds = [
-            ("streak_3", 3),
-            ("streak_7", 7),
-            ("streak_14", 14),
-            ("streak_30", 30),
-        ]
-
-        for achievement_id, threshold in streak_thresholds:
-            if current_streak >= threshold:
-                unlock = self._unlock_achievement(achievement_id, workout_id)
-                if unlock:
-                    new_achievements.append(unlock)
-                    total_xp += unlock.achievement.xp_value
-
-        # Check VO2 Max achievements (sports science based - relative improvements)
-        vo2max_running = context.get("vo2max_running", 0) or 0
-        vo2max_baseline = context.get("vo2max_baseline", 0) or 0
-        vo2max_peak = context.get("vo2max_peak", 0) or 0
-        vo2max_trend_weeks = context.get("vo2max_trend_weeks", 0) or 0
-        interval_workout_count = context.get("interval_workout_count", 0) or 0
-        zone5_total_minutes = context.get("zone5_total_minutes", 0) or 0
-
-        # First VO2 Max measurement (baseline)
+        # Readings are applied after peaks so a new record is detected
+        vo2max_running = context.get("vo2max_running") or 0
         if vo2max_running > 0:
-            unlock = self._unlock_achievement(
-                "vo2max_first",
-                workout_id,
-                metadata={"vo2max_running": vo2max_running},
-            )
-            if unlock:
-                new_achievements.append(unlock)
-                total_xp += unlock.achievement.xp_value
-
-        # Relative improvement achievements (percentage based)
-        if vo2max_baseline > 0 and vo2max_running > 0:
-            improvement_pct = ((vo2max_running - vo2max_baseline) / vo2max_baseline) * 100
-
-            vo2max_improvement_thresholds = [
-                ("vo2max_up_3", 3),
-                ("vo2max_up_5", 5),
-                ("vo2max_up_10", 10),
-                ("vo2max_up_15", 15),
-            ]
-
-            for achievement_id, threshold in vo2max_improvement_thresholds:
-                if improvement_pct >= threshold:
-                    unlock = self._unlock_achievement(
-                        achievement_id,
-                        workout_id,
-                        metadata={
-                            "vo2max_running": vo2max_running,
-                            "vo2max_baseline": vo2max_baseline,
-                            "improvement_pct": round(improvement_pct, 1),
-                        },
-                    )
-                    if unlock:
-                        new_achievements.append(unlock)
-                        total_xp += unlock.achievement.xp_value
-
-        # Trend-based achievements (consistency)
-        vo2max_trend_thresholds = [
-            ("vo2max_trend_4w", 4),
-            ("vo2max_trend_8w", 8),
-        ]
-
-        for achievement_id, threshold in vo2max_trend_thresholds:
-            if vo2max_trend_weeks >= threshold:
-                unlock = self._unlock_achievement(
-                    achievement_id,
-                    workout_id,
-                    metadata={"trend_weeks": vo2max_trend_weeks},
-                )
-                if unlock:
-                    new_achievements.append(unlock)
-                    total_xp += unlock.achievement.xp_value
-
-        # Process-based achievements (interval workouts)
-        interval_thresholds = [
-            ("interval_starter", 5),
-            ("interval_master", 20),
-        ]
-
-        for achievement_id, threshold in interval_thresholds:
-            if interval_workout_count >= threshold:
-                unlock = self._unlock_achievement(
-                    achievement_id,
-                    workout_id,
-                    metadata={"interval_workouts": interval_workout_count},
-                )
-                if unlock:
-                    new_achievements.append(unlock)
-                    total_xp += unlock.achievement.xp_value
-
-        # Zone 5 time achievement
-        if zone5_total_minutes >= 60:
-            unlock = self._unlock_achievement(
-                "zone5_warrior",
-                workout_id,
-                metadata={"zone5_minutes": zone5_total_minutes},
-            )
-            if unlock:
-                new_achievements.append(unlock)
-                total_xp += unlock.achievement.xp_value
-
-        # VO2 Max personal record
-        if vo2max_running > 0 and vo2max_peak > 0 and vo2max_running > vo2max_peak:
-            unlock = self._unlock_achievement(
-                "vo2max_pr",
-                workout_id,
-                metadata={"new_pr": vo2max_running, "old_pr": vo2max_peak},
-            )
-            if unlock:
-                new_achievements.append(unlock)
-                total_xp += unlock.achievement.xp_value
-
-        # Check CTL achievements
-        current_ctl = context.get("ctl", 0)
-        ctl_peak = context.get("ctl_peak", 0)
-
-        ctl_thresholds = [
-            ("ctl_30", 30),
-            ("ctl_50", 50),
-            ("ctl_70", 70),
-        ]
-
-        for achievement_id, threshold in ctl_thresholds:
-            if current_ctl >= threshold:
-                unlock = self._unlock_achievement(
-                    achievement_id,
-                    workout_id,
-                    metadata={"ctl": current_ctl},
-                )
-                if unlock:
-                    new_achievements.append(unlock)
-                    total_xp += unlock.achievement.xp_value
-
-        # Check CTL peak achievement
-        if current_ctl > 0 and current_ctl >= ctl_peak:
-            # Only unlock if this is a new peak (not first CTL value)
-            if ctl_peak > 0 and current_ctl > ctl_peak:
-                unlock = self._unlock_achievement(
-                    "ctl_peak",
-                    workout_id,
-                    metadata={"new_peak": current_ctl, "old_peak": ctl_peak},
-                )
-                if unlock:
-                    new_achievements.append(unlock)
-                    total_xp += unlock.achievement.xp_value
-
-        # Add XP and check for level up
-        level_up = False
-        new_level = None
+            ledger.apply_vo2max(context.get("vo2max_date") or activity_date, vo2max_running)
+        if context.get("ctl") is not None:
+            ledger.apply_ctl(context["ctl"])
 
-        if total_xp > 0:
-            _, level_up, new_level = self.add_xp(total_xp, "achievements")
+        with self._get_connection() as conn:
+            self._save_ledger(conn, ledger)
 
-        return CheckAchievementsResponse(
-            new_achievements=new_achievements,
-            xp_earned=total_xp,
-            level_up=level_up,
-            new_level=new_level,
+        return self._evaluate_ledger(
+            ledger,
+            workout_id=context.get("workout_id"),
             streak_updated=streak_updated,
-            current_streak=current_streak,
         )
 
-    def _get_workout_count(self) -> int:
-        """Get total number of workouts (activities) in the database."""
-        with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT COUNT(*) as cnt FROM activity_metrics"
-            ).fetchone()
-            return row["cnt"] if row else 0
-
     # =========================================================================
     # Level Rewards Methods
     # =========================================================================
@@ -1300,17 +1672,19 @@ class AchievementService:
     # Early Win Achievement Methods
     # =========================================================================
 
-    def _get_total_unlocked_count(self) -> int:
+    def _get_total_unlocked_count(self, user_id: str = "default") -> int:
         """Get total number of achievements unlocked by the user."""
         with self._get_connection() as conn:
             row = conn.execute(
-                "SELECT COUNT(*) as cnt FROM user_achievements"
+                "SELECT COUNT(*) as cnt FROM user_achievements WHERE user_id = ?",
+                (user_id,),
             ).fetchone()
             return row["cnt"] if row else 0
 
     def check_early_achievements(
         self,
         context: EarlyAchievementContext,
+        user_id: str = "default",
     ) -> CheckEarlyAchievementsResponse:
         """
         Check and unlock early win achievements for new users.
@@ -1320,6 +1694,7 @@ class AchievementService:
 
         Args:
             context: EarlyAchievementContext with user activity info
+            user_id: The user ID
 
         Returns:
             CheckEarlyAchievementsResponse with new unlocks and XP earned
@@ -1328,7 +1703,7 @@ class AchievementService:
         total_xp = 0
 
         # Track if this is the user's first ever achievement
-        unlocked_before = self._get_total_unlocked_count()
+        unlocked_before = self._get_total_unlocked_count(user_id)
         is_first_achievement = unlocked_before == 0
 
         # Check "First Steps" - first login after connecting device
@@ -1336,6 +1711,7 @@ class AchievementService:
             unlock = self._unlock_achievement(
                 "early_first_steps",
                 metadata={"trigger": "first_login"},
+                user_id=user_id,
             )
             if unlock:
                 new_achievements.append(unlock)
@@ -1346,6 +1722,7 @@ class AchievementService:
             unlock = self._unlock_achievement(
                 "early_profile_complete",
                 metadata={"trigger": "profile_complete"},
+                user_id=user_id,
             )
             if unlock:
                 new_achievements.append(unlock)
@@ -1356,6 +1733,7 @@ class AchievementService:
             unlock = self._unlock_achievement(
                 "early_first_workout",
                 metadata={"trigger": "first_workout"},
+                user_id=user_id,
             )
             if unlock:
                 new_achievements.append(unlock)
@@ -1366,6 +1744,7 @@ class AchievementService:
             unlock = self._unlock_achievement(
                 "early_bird",
                 metadata={"login_hour": context.login_hour},
+                user_id=user_id,
             )
             if unlock:
                 new_achievements.append(unlock)
@@ -1376,6 +1755,7 @@ class AchievementService:
             unlock = self._unlock_achievement(
                 "night_owl",
                 metadata={"login_hour": context.login_hour},
+                user_id=user_id,
             )
             if unlock:
                 new_achievements.append(unlock)
@@ -1386,6 +1766,7 @@ class AchievementService:
             unlock = self._unlock_achievement(
                 "early_explorer",
                 metadata={"pages_visited": context.pages_visited[:5]},  # Store first 5
+                user_id=user_id,
             )
             if unlock:
                 new_achievements.append(unlock)
@@ -1396,6 +1777,7 @@ class AchievementService:
             unlock = self._unlock_achievement(
                 "early_curious_mind",
                 metadata={"trigger": "workout_details_viewed"},
+                user_id=user_id,
             )
             if unlock:
                 new_achievements.append(unlock)
@@ -1406,10 +1788,10 @@ class AchievementService:
         new_level = None
 
         if total_xp > 0:
-            _, level_up, new_level = self.add_xp(total_xp, "early_achievements")
+            _, level_up, new_level = self.add_xp(total_xp, "early_achievements", user_id)
 
         # Get updated count
-        total_unlocked = self._get_total_unlocked_count()
+        total_unlocked = self._get_total_unlocked_count(user_id)
 
         # If we unlocked anything and had nothing before, this is the first achievement
         is_first = is_first_achievement and len(new_achievements) > 0
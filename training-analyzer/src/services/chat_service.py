@@ -10,13 +10,23 @@ This service orchestrates:
 """
 
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from .base import BaseService, CacheProtocol
-from ..agents.chat_agent import ChatAgent
+from ..exceptions import ConversationNotFoundError
+from ..db.repositories.chat_repository import ChatMessageRecord, ChatRepository
+from ..utils.token_counter import (
+    count_single_message_tokens,
+    select_recent_within_budget,
+)
+
+if TYPE_CHECKING:
+    from ..agents.chat_agent import ChatAgent
 
 
 class ChatMessage(BaseModel):
@@ -24,6 +34,45 @@ class ChatMessage(BaseModel):
     role: str = Field(..., description="user or assistant")
     content: str = Field(..., description="Message content")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
+    token_count: int = Field(
+        default=0,
+        ge=0,
+        description="Tokens including role overhead, computed once on creation",
+    )
+
+    @model_validator(mode="after")
+    def _compute_token_count(self) -> "ChatMessage":
+        """Tokenize the content once unless a count was already stored."""
+        if not self.token_count:
+            self.token_count = count_single_message_tokens({"content": self.content})
+        return self
+
+    @classmethod
+    def from_record(cls, record: ChatMessageRecord) -> "ChatMessage":
+        """Build a message from a stored record, keeping its token count."""
+        return cls(
+            role=record.role,
+            content=record.content,
+            timestamp=record.created_at or datetime.utcnow(),
+            token_count=record.token_count,
+        )
+
+    def to_record(self) -> ChatMessageRecord:
+        """Convert the message to a record for the conversation store."""
+        return ChatMessageRecord(
+            role=self.role,
+            content=self.content,
+            token_count=self.token_count,
+            created_at=self.timestamp,
+        )
+
+    def to_history_entry(self) -> Dict[str, Any]:
+        """Format the message for an agent's conversation history."""
+        return {
+            "role": self.role,
+            "content": self.content,
+            "token_count": self.token_count,
+        }
 
 
 class ChatRequest(BaseModel):
@@ -45,10 +94,38 @@ class ChatResponse(BaseModel):
 class ConversationContext(BaseModel):
     """Context for a conversation session."""
     conversation_id: str
+    user_id: Optional[str] = None
     messages: List[ChatMessage] = Field(default_factory=list)
+    total_tokens: int = Field(default=0, ge=0, description="Running token total of messages")
+    stored_message_count: int = Field(
+        default=0,
+        ge=0,
+        description="Messages persisted in the conversation store, including unloaded ones",
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
     last_activity: datetime = Field(default_factory=datetime.utcnow)
 
+    @model_validator(mode="after")
+    def _sync_total_tokens(self) -> "ConversationContext":
+        """Recover the running total for contexts restored without one."""
+        if self.messages and not self.total_tokens:
+            self.total_tokens = sum(msg.token_count for msg in self.messages)
+        return self
+
+    def add_message(self, message: ChatMessage) -> None:
+        """Append a message and update the running token total."""
+        self.messages.append(message)
+        self.total_tokens += message.token_count
+
+    def trim_to(self, max_messages: int) -> None:
+        """Drop the oldest messages beyond max_messages."""
+        excess = len(self.messages) - max_messages
+        if excess <= 0:
+            return
+        removed = self.messages[:excess]
+        self.messages = self.messages[excess:]
+        self.total_tokens -= sum(msg.token_count for msg in removed)
+
 
 class ChatService(BaseService):
     """
@@ -59,20 +136,33 @@ class ChatService(BaseService):
     - Conversation history tracking
     - Context management
     - Response formatting
+
+    When a conversation store is configured it is the source of truth, and
+    the in-memory dict only holds recently active conversations (evicted
+    after CONVERSATION_TTL_SECONDS or beyond MAX_HOT_CONVERSATIONS).
     """
 
     # Maximum conversation history to maintain
-    MAX_HISTORY_LENGTH = 10
+    MAX_HISTORY_LENGTH = 50
+    # Default token budget for history passed to the agent
+    DEFAULT_HISTORY_TOKEN_BUDGET = 3000
+    # Tokens reserved for the summary of older turns (when a summarizer is set)
+    SUMMARY_TOKEN_RESERVE = 300
     # Cache TTL for conversations (1 hour)
     CONVERSATION_TTL_SECONDS = 3600
+    # Maximum conversations kept in the in-memory hot tier
+    MAX_HOT_CONVERSATIONS = 500
 
     def __init__(
         self,
-        chat_agent: Optional[ChatAgent] = None,
+        chat_agent: Optional["ChatAgent"] = None,
         coach_service: Any = None,
         training_db: Any = None,
         cache: Optional[CacheProtocol] = None,
         logger: Optional[logging.Logger] = None,
+        history_token_budget: Optional[int] = None,
+        history_summarizer: Optional[Callable[[List[ChatMessage]], str]] = None,
+        conversation_store: Optional[ChatRepository] = None,
     ) -> None:
         """
         Initialize the chat service.
@@ -83,40 +173,62 @@ class ChatService(BaseService):
             training_db: TrainingDatabase for data queries
             cache: Optional cache for conversation history
             logger: Optional logger instance
+            history_token_budget: Max tokens of history sent to the agent
+            history_summarizer: Optional callable condensing turns that no
+                longer fit the budget into a single summary string
+            conversation_store: Optional durable store shared across workers
         """
         super().__init__(cache=cache, logger=logger)
         self._coach_service = coach_service
         self._training_db = training_db
+        self._history_token_budget = (
+            history_token_budget
+            if history_token_budget is not None
+            else self.DEFAULT_HISTORY_TOKEN_BUDGET
+        )
+        self._history_summarizer = history_summarizer
 
         # Initialize or create chat agent
         if chat_agent:
             self._chat_agent = chat_agent
         else:
+            # Imported here: the agent pulls in the LLM provider SDKs
+            from ..agents.chat_agent import ChatAgent
+
             self._chat_agent = ChatAgent(
                 coach_service=coach_service,
                 training_db=training_db,
             )
 
-        # In-memory conversation store (for simplicity)
-        # In production, this could be Redis or a database
-        self._conversations: Dict[str, ConversationContext] = {}
+        self._conversation_store = conversation_store
+
+        # Hot tier of recently active conversations, least recently used first,
+        # with the monotonic time each one was last touched
+        self._conversations: "OrderedDict[str, ConversationContext]" = OrderedDict()
+        self._touched_at: Dict[str, float] = {}
 
     async def process_message(
         self,
         request: ChatRequest,
+        user_id: Optional[str] = None,
     ) -> ChatResponse:
         """
         Process a chat message and return a response.
 
         Args:
             request: ChatRequest with the user's message
+            user_id: Owner recorded on new conversations; an existing
+                conversation must belong to this user
 
         Returns:
             ChatResponse with the AI's response and metadata
+
+        Raises:
+            ConversationNotFoundError: If the conversation belongs to another user
         """
         # Get or create conversation context
         conversation_id = request.conversation_id or self._generate_conversation_id()
-        conversation = await self._get_or_create_conversation(conversation_id)
+        conversation = await self._get_or_create_conversation(conversation_id, user_id)
 
         # Build conversation history for context
         history = self._build_history_for_agent(conversation)
@@ -126,7 +238,7 @@ class ChatService(BaseService):
             role="user",
             content=request.message,
         )
-        conversation.messages.append(user_message)
+        conversation.add_message(user_message)
 
         try:
             # Process through chat agent
@@ -141,11 +253,14 @@ class ChatService(BaseService):
                 role="assistant",
                 content=result.get("response", ""),
             )
-            conversation.messages.append(assistant_message)
+            conversation.add_message(assistant_message)
 
             # Update conversation
             conversation.last_activity = datetime.utcnow()
-            await self._save_conversation(conversation)
+            await self._save_conversation(
+                conversation,
+                new_messages=[user_message, assistant_message],
+            )
 
             # Trim history if too long
             self._trim_conversation_history(conversation)
@@ -176,36 +291,119 @@ class ChatService(BaseService):
     async def get_conversation_history(
         self,
         conversation_id: str,
+        user_id: Optional[str] = None,
     ) -> Optional[ConversationContext]:
         """
         Get conversation history by ID.
 
         Args:
             conversation_id: The conversation ID
+            user_id: If given, only return the conversation if this user owns it
 
         Returns:
             ConversationContext if found, None otherwise
         """
-        return await self._get_conversation(conversation_id)
+        return await self._get_owned_conversation(conversation_id, user_id)
+
+    async def get_agent_history(
+        self,
+        conversation_id: str,
+        user_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the token-budgeted history of a conversation for an agent.
+
+        Args:
+            conversation_id: The conversation ID
+            user_id: If given, only use the conversation if this user owns it
+
+        Returns:
+            History entries (empty for unknown or foreign conversations)
+        """
+        conversation = await self._get_owned_conversation(conversation_id, user_id)
+        if not conversation:
+            return []
+        return self._build_history_for_agent(conversation)
+
+    async def record_exchange(
+        self,
+        conversation_id: str,
+        user_content: str,
+        assistant_content: str,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """
+        Record a user/assistant exchange handled outside process_message.
+
+        Used by the agentic endpoints so their conversations are stored
+        the same way as standard chat.
+
+        Args:
+            conversation_id: The conversation ID
+            user_content: The user's message
+            assistant_content: The assistant's response
+            user_id: Owner recorded on new conversations; an existing
+                conversation must belong to this user
+
+        Raises:
+            ConversationNotFoundError: If the conversation belongs to another user
+        """
+        conversation = await self._get_or_create_conversation(conversation_id, user_id)
+        user_message = ChatMessage(role="user", content=user_content)
+        assistant_message = ChatMessage(role="assistant", content=assistant_content)
+        conversation.add_message(user_message)
+        conversation.add_message(assistant_message)
+        conversation.last_activity = datetime.utcnow()
+        await self._save_conversation(
+            conversation,
+            new_messages=[user_message, assistant_message],
+        )
+        self._trim_conversation_history(conversation)
+
+    async def check_conversation_access(
+        self,
+        conversation_id: str,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """
+        Check that a user may continue a conversation.
+
+        Unknown conversations are allowed (they are created on first use).
+
+        Args:
+            conversation_id: The conversation ID
+            user_id: The user continuing the conversation
+
+        Raises:
+            ConversationNotFoundError: If the conversation belongs to another user
+        """
+        conversation = await self._get_conversation(conversation_id)
+        if conversation and not self._is_owner(conversation, user_id):
+            raise ConversationNotFoundError(conversation_id)
 
     async def clear_conversation(
         self,
         conversation_id: str,
+        user_id: Optional[str] = None,
     ) -> bool:
         """
         Clear a conversation's history.
 
         Args:
             conversation_id: The conversation ID
+            user_id: If given, only clear the conversation if this user owns it
 
         Returns:
-            True if cleared, False if not found
+            True if cleared, False if not found (or owned by another user)
         """
-        if conversation_id in self._conversations:
-            del self._conversations[conversation_id]
+        if user_id is not None and not await self._get_owned_conversation(conversation_id, user_id):
+            return False
+        cleared = self._forget(conversation_id)
+        if self._conversation_store:
+            cleared = self._conversation_store.delete_conversation(conversation_id) or cleared
+        if cleared:
             await self._delete_from_cache(f"chat:conversation:{conversation_id}")
-            return True
-        return False
+        return cleared
 
     def get_suggested_questions(self) -> List[str]:
         """
@@ -237,15 +435,19 @@ class ChatService(BaseService):
     async def _get_or_create_conversation(
         self,
         conversation_id: str,
+        user_id: Optional[str] = None,
     ) -> ConversationContext:
-        """Get existing conversation or create new one."""
+        """Get the user's existing conversation or create a new one."""
         conversation = await self._get_conversation(conversation_id)
+        if conversation and not self._is_owner(conversation, user_id):
+            raise ConversationNotFoundError(conversation_id)
 
         if not conversation:
             conversation = ConversationContext(
                 conversation_id=conversation_id,
+                user_id=user_id,
             )
-            self._conversations[conversation_id] = conversation
+            self._remember(conversation)
 
         return conversation
 
@@ -253,29 +455,120 @@ class ChatService(BaseService):
         self,
         conversation_id: str,
     ) -> Optional[ConversationContext]:
-        """Get conversation from memory or cache."""
+        """Get conversation from memory, cache or the conversation store."""
+        self._evict_expired()
+
         # Check memory first
-        if conversation_id in self._conversations:
-            return self._conversations[conversation_id]
+        conversation = self._conversations.get(conversation_id)
+        if conversation:
+            if self._is_stale(conversation):
+                self._forget(conversation_id)
+                conversation = self._load_from_store(conversation_id)
+            if conversation:
+                self._remember(conversation)
+            return conversation
 
         # Check cache
         cached = await self._get_from_cache(f"chat:conversation:{conversation_id}")
         if cached:
             try:
                 conversation = ConversationContext(**cached)
-                self._conversations[conversation_id] = conversation
-                return conversation
+                if not self._is_stale(conversation):
+                    self._remember(conversation)
+                    return conversation
             except Exception:
                 pass
 
-        return None
+        # Lazily load the tail of the conversation from the store
+        conversation = self._load_from_store(conversation_id)
+        if conversation:
+            self._remember(conversation)
+        return conversation
+
+    async def _get_owned_conversation(
+        self,
+        conversation_id: str,
+        user_id: Optional[str] = None,
+    ) -> Optional[ConversationContext]:
+        """Get a conversation, treating one owned by another user as missing."""
+        conversation = await self._get_conversation(conversation_id)
+        if conversation and not self._is_owner(conversation, user_id):
+            return None
+        return conversation
+
+    @staticmethod
+    def _is_owner(conversation: ConversationContext, user_id: Optional[str]) -> bool:
+        """Check a conversation against its owner (any caller when user_id is None)."""
+        return user_id is None or conversation.user_id == user_id
+
+    def _is_stale(self, conversation: ConversationContext) -> bool:
+        """Check whether another worker appended to a conversation."""
+        if not self._conversation_store:
+            return False
+        header = self._conversation_store.get_conversation(conversation.conversation_id)
+        if header is None:
+            # Cleared elsewhere; only keep it if nothing was ever persisted
+            return conversation.stored_message_count > 0
+        return header.message_count != conversation.stored_message_count
+
+    def _load_from_store(self, conversation_id: str) -> Optional[ConversationContext]:
+        """Load a conversation header and its most recent messages."""
+        if not self._conversation_store:
+            return None
+        header = self._conversation_store.get_conversation(conversation_id)
+        if header is None:
+            return None
+        records = self._conversation_store.get_recent_messages(
+            conversation_id, limit=self.MAX_HISTORY_LENGTH
+        )
+        return ConversationContext(
+            conversation_id=conversation_id,
+            user_id=header.user_id,
+            messages=[ChatMessage.from_record(record) for record in records],
+            stored_message_count=header.message_count,
+            created_at=header.created_at,
+            last_activity=header.last_activity,
+        )
+
+    def _remember(self, conversation: ConversationContext) -> None:
+        """Put a conversation at the most recent end of the hot tier."""
+        conversation_id = conversation.conversation_id
+        self._conversations[conversation_id] = conversation
+        self._conversations.move_to_end(conversation_id)
+        self._touched_at[conversation_id] = time.monotonic()
+        while len(self._conversations) > self.MAX_HOT_CONVERSATIONS:
+            evicted_id, _ = self._conversations.popitem(last=False)
+            self._touched_at.pop(evicted_id, None)
+
+    def _forget(self, conversation_id: str) -> bool:
+        """Remove a conversation from the hot tier."""
+        self._touched_at.pop(conversation_id, None)
+        return self._conversations.pop(conversation_id, None) is not None
+
+    def _evict_expired(self) -> None:
+        """Drop hot-tier conversations untouched for longer than the TTL."""
+        cutoff = time.monotonic() - self.CONVERSATION_TTL_SECONDS
+        while self._conversations:
+            oldest_id = next(iter(self._conversations))
+            if self._touched_at.get(oldest_id, 0.0) >= cutoff:
+                break
+            self._forget(oldest_id)
 
     async def _save_conversation(
         self,
         conversation: ConversationContext,
+        new_messages: Optional[List[ChatMessage]] = None,
     ) -> None:
-        """Save conversation to memory and cache."""
-        self._conversations[conversation.conversation_id] = conversation
+        """Save conversation to memory and cache, appending new messages to the store."""
+        if self._conversation_store and new_messages:
+            header = self._conversation_store.append_messages(
+                conversation.conversation_id,
+                [msg.to_record() for msg in new_messages],
+                user_id=conversation.user_id,
+            )
+            conversation.stored_message_count = header.message_count
+
+        self._remember(conversation)
 
         # Save to cache
         await self._set_in_cache(
@@ -287,14 +580,41 @@ class ChatService(BaseService):
     def _build_history_for_agent(
         self,
         conversation: ConversationContext,
-    ) -> List[Dict[str, str]]:
-        """Build conversation history in format expected by agent."""
-        history = []
-        for msg in conversation.messages[-self.MAX_HISTORY_LENGTH:]:
-            history.append({
-                "role": msg.role,
-                "content": msg.content,
-            })
+    ) -> List[Dict[str, Any]]:
+        """Build conversation history in format expected by agent.
+
+        Selects the most recent messages that fit the token budget using
+        the counts stored on each message, so nothing is re-tokenized.
+        Older turns are condensed by the summarizer when one is configured.
+        """
+        messages = conversation.messages
+        budget = self._history_token_budget
+
+        # Fast path: the whole conversation fits
+        if conversation.total_tokens <= budget:
+            return [msg.to_history_entry() for msg in messages]
+
+        if self._history_summarizer:
+            budget = max(budget - self.SUMMARY_TOKEN_RESERVE, 0)
+
+        start = select_recent_within_budget(
+            [msg.token_count for msg in messages], budget
+        )
+        history = [msg.to_history_entry() for msg in messages[start:]]
+
+        if self._history_summarizer and start > 0:
+            try:
+                summary = self._history_summarizer(messages[:start])
+            except Exception as e:
+                self.logger.warning(f"History summarization failed: {e}")
+                summary = ""
+            if summary:
+                summary_message = ChatMessage(
+                    role="system",
+                    content=f"Summary of earlier conversation: {summary}",
+                )
+                history.insert(0, summary_message.to_history_entry())
+
         return history
 
     def _trim_conversation_history(
@@ -302,9 +622,8 @@ class ChatService(BaseService):
         conversation: ConversationContext,
     ) -> None:
         """Trim conversation history if too long."""
-        if len(conversation.messages) > self.MAX_HISTORY_LENGTH:
-            # Keep only the most recent messages
-            conversation.messages = conversation.messages[-self.MAX_HISTORY_LENGTH:]
+        # Keep only the most recent messages
+        conversation.trim_to(self.MAX_HISTORY_LENGTH)
 
 
 # ============================================================================
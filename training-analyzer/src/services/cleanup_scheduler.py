@@ -4,6 +4,7 @@ Manages scheduled background cleanup jobs for data retention.
 Runs daily at a configurable time (default 3 AM UTC).
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
@@ -97,12 +98,13 @@ class CleanupScheduler:
     async def _run_cleanup(self) -> None:
         """Execute the scheduled cleanup.
 
-        This is the main scheduled job that runs daily.
+        This is the main scheduled job that runs daily. The batched purge
+        runs in a worker thread so the event loop keeps serving requests.
         """
         logger.info("Starting scheduled data retention cleanup")
 
         try:
-            report = self.retention_service.run_full_cleanup()
+            report = await asyncio.to_thread(self.retention_service.run_full_cleanup)
             self._last_cleanup_report = report
 
             # Log results
@@ -118,7 +120,8 @@ class CleanupScheduler:
             else:
                 logger.info(
                     f"Cleanup completed successfully: "
-                    f"{report.total_deleted} records deleted from {successful_categories}"
+                    f"{report.total_deleted} records deleted from {successful_categories}, "
+                    f"{report.bytes_reclaimed} bytes reclaimed"
                 )
 
         except Exception as e:
@@ -131,7 +134,7 @@ class CleanupScheduler:
             DataRetentionReport with cleanup details.
         """
         logger.info("Manual cleanup triggered")
-        report = self.retention_service.run_full_cleanup()
+        report = await asyncio.to_thread(self.retention_service.run_full_cleanup)
         self._last_cleanup_report = report
         return report
 
@@ -169,6 +172,7 @@ class CleanupScheduler:
                 "ai_usage_logs_days": settings.retention_ai_usage_logs_days,
                 "sync_history_days": settings.retention_sync_history_days,
                 "activity_data_days": settings.retention_activity_data_days,
+                "chat_conversations_days": settings.retention_chat_conversations_days,
             },
         }
 
@@ -182,6 +186,7 @@ class CleanupScheduler:
                 "timestamp": self._last_cleanup_report.timestamp,
                 "total_deleted": self._last_cleanup_report.total_deleted,
                 "duration_seconds": self._last_cleanup_report.duration_seconds,
+                "bytes_reclaimed": self._last_cleanup_report.bytes_reclaimed,
             }
 
         return status
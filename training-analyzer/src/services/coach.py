@@ -36,6 +36,7 @@ from ..recommendations.explain import (
     format_readiness_factors,
     generate_weekly_narrative,
 )
+from .weekly_rollup_service import WeeklyRollupService
 
 
 def find_wellness_db() -> Optional[Path]:
@@ -87,6 +88,7 @@ class CoachService:
         """
         self.training_db = training_db or TrainingDatabase()
         self._wellness_db_path = wellness_db_path
+        self.weekly_rollups = WeeklyRollupService(training_db=self.training_db)
 
     @property
     def wellness_db_path(self) -> Optional[Path]:
@@ -536,20 +538,11 @@ class CoachService:
         start_fitness = self.training_db.get_fitness_metrics(target_monday.isoformat())
         end_fitness = self.training_db.get_fitness_metrics(target_sunday.isoformat())
 
-        # Calculate stats
-        total_load = sum(a.hrss or 0 for a in activities)
-        total_duration = sum(a.duration_min or 0 for a in activities)
-        total_distance = sum(a.distance_km or 0 for a in activities)
-
-        # Count workout types
-        hard_days = sum(
-            1 for a in activities if (a.hrss or 0) >= 75 or (a.trimp or 0) >= 100
-        )
-
-        # Get unique workout days
-        workout_dates = set(a.date for a in activities)
-        easy_days = len(workout_dates) - hard_days
-        rest_days = 7 - len(workout_dates)
+        # Weekly totals come from the persisted rollup
+        rollup = self.weekly_rollups.get_week(target_monday)
+        hard_days = rollup.hard_session_count
+        easy_days = rollup.active_days - hard_days
+        rest_days = 7 - rollup.active_days
 
         # CTL change
         ctl_start = start_fitness.ctl if start_fitness else 0
@@ -580,11 +573,11 @@ class CoachService:
         weekly_stats = {
             "week_start": target_monday.isoformat(),
             "week_end": target_sunday.isoformat(),
-            "total_load": total_load,
+            "total_load": rollup.load,
             "target_load": target_load,
-            "total_duration_min": total_duration,
-            "total_distance_km": total_distance,
-            "workout_count": len(activities),
+            "total_duration_min": rollup.duration_min,
+            "total_distance_km": rollup.distance_km,
+            "workout_count": rollup.session_count,
             "hard_days": hard_days,
             "easy_days": easy_days,
             "rest_days": rest_days,
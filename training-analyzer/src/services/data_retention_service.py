@@ -4,18 +4,26 @@ Handles automatic cleanup of:
 - Expired user sessions (older than 30 days by default)
 - Old AI usage logs (older than 90 days by default)
 - Historical sync logs (older than 90 days by default)
+- Inactive chat conversations (no messages for 180 days by default)
 - Old activity data (configurable, disabled by default)
 
+Deletes run in small batches, each in its own short transaction, with a
+pause in between so API writes are never blocked for long. Freed pages
+are returned to the filesystem with incremental auto-vacuum.
+
 Addresses SECURITY.md finding #17 - No Data Retention Policy.
 """
 
 import logging
+import sqlite3
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from ..config import get_settings
 from ..db.database import TrainingDatabase
+from ..db.repositories.chat_repository import ChatRepository
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +47,8 @@ class DataRetentionReport:
     results: list[CleanupResult]
     total_deleted: int
     duration_seconds: float
+    bytes_reclaimed: int = 0
+    free_bytes: int = 0
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -56,6 +66,8 @@ class DataRetentionReport:
             ],
             "total_deleted": self.total_deleted,
             "duration_seconds": self.duration_seconds,
+            "bytes_reclaimed": self.bytes_reclaimed,
+            "free_bytes": self.free_bytes,
         }
 
 
@@ -74,6 +86,136 @@ class DataRetentionService:
         """
         self._db = db
         self._settings = get_settings()
+        self._batch_size = max(1, self._settings.retention_batch_size)
+        self._batch_pause = self._settings.retention_batch_pause_ms / 1000
+
+    def _table_exists(self, table: str) -> bool:
+        """Check whether a table exists (some are created lazily by repositories)."""
+        with self._db._get_connection() as conn:
+            return conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table,),
+            ).fetchone() is not None
+
+    def _purge(self, table: str, where: str, params: tuple = ()) -> int:
+        """Delete rows matching `where` in bounded batches.
+
+        Rows are visited in rowid (primary key storage) order with a keyset
+        cursor, so each batch reads and rewrites a contiguous run of pages.
+        Every batch is its own transaction, followed by a short pause to let
+        other writers take the lock.
+
+        Args:
+            table: Table to purge.
+            where: SQL condition selecting the rows to delete.
+            params: Parameters for the condition.
+
+        Returns:
+            Number of rows deleted.
+        """
+        if not self._table_exists(table):
+            return 0
+
+        select_batch = f"""
+            SELECT MAX(rowid), COUNT(*) FROM (
+                SELECT rowid FROM {table}
+                WHERE rowid > ? AND ({where})
+                ORDER BY rowid
+                LIMIT ?
+            )
+        """
+        delete_batch = f"""
+            DELETE FROM {table}
+            WHERE rowid > ? AND rowid <= ? AND ({where})
+        """
+
+        deleted = 0
+        last_rowid = -1
+        while True:
+            with self._db._get_connection() as conn:
+                upper, matched = conn.execute(
+                    select_batch, (last_rowid, *params, self._batch_size)
+                ).fetchone()
+                if not matched:
+                    break
+                deleted += conn.execute(
+                    delete_batch, (last_rowid, upper, *params)
+                ).rowcount
+            last_rowid = upper
+            if matched < self._batch_size:
+                break
+            time.sleep(self._batch_pause)
+
+        return deleted
+
+    def _count(self, query: str, params: tuple) -> int:
+        """Run a COUNT query."""
+        with self._db._get_connection() as conn:
+            return conn.execute(query, params).fetchone()[0]
+
+    def _database_size(self) -> tuple[int, int]:
+        """Get (database size, size of free pages) in bytes."""
+        with self._db._get_connection() as conn:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return page_count * page_size, free_pages * page_size
+
+    def reclaim_space(self) -> int:
+        """Return free pages to the filesystem with incremental vacuum.
+
+        Vacuums a bounded number of pages per transaction, pausing between
+        steps like the batched deletes. Does nothing if the database was
+        created before incremental auto-vacuum was enabled; see
+        enable_incremental_vacuum().
+
+        Returns:
+            Number of bytes the database file shrank by.
+        """
+        with self._db._get_connection() as conn:
+            mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if mode != 2:
+            logger.info(
+                "Incremental auto-vacuum is not enabled on this database; "
+                "freed pages stay on the freelist for reuse"
+            )
+            return 0
+
+        size_before, free_bytes = self._database_size()
+        pages = max(1, self._settings.retention_vacuum_pages)
+        while free_bytes > 0:
+            with self._db._get_connection() as conn:
+                conn.execute(f"PRAGMA incremental_vacuum({pages})").fetchall()
+            size, remaining = self._database_size()
+            if remaining >= free_bytes:
+                break
+            free_bytes = remaining
+            time.sleep(self._batch_pause)
+
+        return size_before - self._database_size()[0]
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Switch an existing database to incremental auto-vacuum.
+
+        Requires a one-time full VACUUM, which rewrites the whole file and
+        blocks writers while it runs, so this is only done on request.
+
+        Returns:
+            True if the database was converted, False if it already was.
+        """
+        with self._db._get_connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return False
+
+        # VACUUM cannot run inside a transaction
+        conn = sqlite3.connect(str(self._db.db_path), isolation_level=None)
+        try:
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+        logger.info("Enabled incremental auto-vacuum")
+        return True
 
     def cleanup_expired_sessions(
         self, retention_days: Optional[int] = None
@@ -94,13 +236,11 @@ class DataRetentionService:
             # Delete sessions that are:
             # 1. Expired (expires_at < now), OR
             # 2. Created more than retention_days ago
-            query = """
-                DELETE FROM user_sessions
-                WHERE expires_at < ? OR created_at < ?
-            """
-            cursor = self._db.conn.execute(query, (cutoff_str, cutoff_str))
-            deleted_count = cursor.rowcount
-            self._db.conn.commit()
+            deleted_count = self._purge(
+                "user_sessions",
+                "expires_at < ? OR created_at < ?",
+                (cutoff_str, cutoff_str),
+            )
 
             logger.info(
                 f"Cleaned up {deleted_count} expired sessions "
@@ -141,19 +281,24 @@ class DataRetentionService:
         try:
             # Delete user_usage records older than retention period
             # Keep at least the current period for each user
-            query = """
-                DELETE FROM user_usage
-                WHERE period_end < ?
+            deleted_count = self._purge(
+                "user_usage",
+                """
+                period_end < ?
                 AND id NOT IN (
                     SELECT id FROM user_usage
                     WHERE user_id IN (SELECT DISTINCT user_id FROM user_usage)
                     GROUP BY user_id
                     HAVING period_start = MAX(period_start)
                 )
-            """
-            cursor = self._db.conn.execute(query, (cutoff_str,))
-            deleted_count = cursor.rowcount
-            self._db.conn.commit()
+                """,
+                (cutoff_str,),
+            )
+
+            # Per-request AI call logs
+            deleted_count += self._purge(
+                "ai_usage_logs", "created_at < ?", (cutoff_str,)
+            )
 
             logger.info(
                 f"Cleaned up {deleted_count} old AI usage records "
@@ -193,13 +338,9 @@ class DataRetentionService:
 
         try:
             # Delete old sync history records
-            query = """
-                DELETE FROM garmin_sync_history
-                WHERE started_at < ?
-            """
-            cursor = self._db.conn.execute(query, (cutoff_str,))
-            deleted_count = cursor.rowcount
-            self._db.conn.commit()
+            deleted_count = self._purge(
+                "garmin_sync_history", "started_at < ?", (cutoff_str,)
+            )
 
             logger.info(
                 f"Cleaned up {deleted_count} old sync history records "
@@ -253,28 +394,15 @@ class DataRetentionService:
 
         try:
             total_deleted = 0
-
-            # Delete from activity_metrics
-            query1 = "DELETE FROM activity_metrics WHERE date < ?"
-            cursor1 = self._db.conn.execute(query1, (cutoff_str,))
-            total_deleted += cursor1.rowcount
-
-            # Delete from fitness_metrics
-            query2 = "DELETE FROM fitness_metrics WHERE date < ?"
-            cursor2 = self._db.conn.execute(query2, (cutoff_str,))
-            total_deleted += cursor2.rowcount
-
-            # Delete from garmin_fitness_data
-            query3 = "DELETE FROM garmin_fitness_data WHERE date < ?"
-            cursor3 = self._db.conn.execute(query3, (cutoff_str,))
-            total_deleted += cursor3.rowcount
-
-            # Delete from weekly_summaries
-            query4 = "DELETE FROM weekly_summaries WHERE week_start < ?"
-            cursor4 = self._db.conn.execute(query4, (cutoff_str,))
-            total_deleted += cursor4.rowcount
-
-            self._db.conn.commit()
+            for table, date_column in (
+                ("activity_metrics", "date"),
+                ("fitness_metrics", "date"),
+                ("garmin_fitness_data", "date"),
+                ("weekly_summaries", "week_start"),
+            ):
+                total_deleted += self._purge(
+                    table, f"{date_column} < ?", (cutoff_str,)
+                )
 
             logger.info(
                 f"Cleaned up {total_deleted} old activity data records "
@@ -315,14 +443,11 @@ class DataRetentionService:
         try:
             # Delete orphaned sync records (where local activity no longer exists)
             # and old completed syncs
-            query = """
-                DELETE FROM strava_activity_sync
-                WHERE created_at < ?
-                AND sync_status = 'completed'
-            """
-            cursor = self._db.conn.execute(query, (cutoff_str,))
-            deleted_count = cursor.rowcount
-            self._db.conn.commit()
+            deleted_count = self._purge(
+                "strava_activity_sync",
+                "created_at < ? AND sync_status = 'completed'",
+                (cutoff_str,),
+            )
 
             logger.info(
                 f"Cleaned up {deleted_count} old Strava sync records "
@@ -373,14 +498,11 @@ class DataRetentionService:
         try:
             # Delete analyses for workouts that no longer exist in activity_metrics
             # or analyses older than retention period
-            query = """
-                DELETE FROM workout_analyses
-                WHERE created_at < ?
-                OR workout_id NOT IN (SELECT activity_id FROM activity_metrics)
-            """
-            cursor = self._db.conn.execute(query, (cutoff_str,))
-            deleted_count = cursor.rowcount
-            self._db.conn.commit()
+            deleted_count = self._purge(
+                "workout_analyses",
+                "created_at < ? OR workout_id NOT IN (SELECT activity_id FROM activity_metrics)",
+                (cutoff_str,),
+            )
 
             logger.info(
                 f"Cleaned up {deleted_count} old/orphaned workout analyses "
@@ -403,6 +525,49 @@ class DataRetentionService:
                 error=str(e),
             )
 
+    def cleanup_chat_conversations(
+        self, retention_days: Optional[int] = None
+    ) -> CleanupResult:
+        """Delete chat conversations, and their messages, with no recent activity.
+
+        Args:
+            retention_days: Override for retention period. Defaults to config value.
+
+        Returns:
+            CleanupResult with details of the cleanup operation.
+        """
+        days = retention_days or self._settings.retention_chat_conversations_days
+        # Conversation timestamps are stored as naive UTC
+        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_str = cutoff_date.isoformat()
+
+        try:
+            deleted_count = 0
+            if self._table_exists("chat_conversations"):
+                repository = ChatRepository(str(self._db.db_path))
+                deleted_count = repository.delete_inactive_conversations(cutoff_date)
+
+            logger.info(
+                f"Cleaned up {deleted_count} inactive chat conversations "
+                f"(cutoff: {cutoff_str})"
+            )
+
+            return CleanupResult(
+                category="chat_conversations",
+                records_deleted=deleted_count,
+                cutoff_date=cutoff_str,
+                success=True,
+            )
+        except Exception as e:
+            logger.error(f"Failed to cleanup chat conversations: {e}")
+            return CleanupResult(
+                category="chat_conversations",
+                records_deleted=0,
+                cutoff_date=cutoff_str,
+                success=False,
+                error=str(e),
+            )
+
     def run_full_cleanup(self, dry_run: bool = False) -> DataRetentionReport:
         """Run all cleanup operations.
 
@@ -427,26 +592,39 @@ class DataRetentionService:
         results.append(self.cleanup_sync_history())
         results.append(self.cleanup_strava_sync_records())
         results.append(self.cleanup_old_workout_analyses())
+        results.append(self.cleanup_chat_conversations())
 
         # Only run activity data cleanup if explicitly enabled (non-zero retention)
         if self._settings.retention_activity_data_days > 0:
             results.append(self.cleanup_old_activity_data())
 
+        total_deleted = sum(r.records_deleted for r in results if r.success)
+
+        bytes_reclaimed = 0
+        free_bytes = 0
+        try:
+            if total_deleted:
+                bytes_reclaimed = self.reclaim_space()
+            free_bytes = self._database_size()[1]
+        except Exception as e:
+            logger.error(f"Failed to reclaim free space: {e}")
+
         end_time = datetime.now(timezone.utc)
         duration = (end_time - start_time).total_seconds()
 
-        total_deleted = sum(r.records_deleted for r in results if r.success)
-
         report = DataRetentionReport(
             timestamp=start_time.isoformat(),
             results=results,
             total_deleted=total_deleted,
             duration_seconds=duration,
+            bytes_reclaimed=bytes_reclaimed,
+            free_bytes=free_bytes,
         )
 
         logger.info(
             f"Data retention cleanup complete: "
-            f"{total_deleted} records deleted in {duration:.2f}s"
+            f"{total_deleted} records deleted, {bytes_reclaimed} bytes reclaimed "
+            f"in {duration:.2f}s"
         )
 
         return report
@@ -463,55 +641,62 @@ class DataRetentionService:
         # Sessions
         cutoff = (now - timedelta(days=self._settings.retention_sessions_days)).isoformat()
         try:
-            cursor = self._db.conn.execute(
+            stats["expired_sessions"] = self._count(
                 "SELECT COUNT(*) FROM user_sessions WHERE expires_at < ? OR created_at < ?",
                 (cutoff, cutoff),
             )
-            stats["expired_sessions"] = cursor.fetchone()[0]
         except Exception:
             stats["expired_sessions"] = "N/A"
 
         # AI usage logs
         cutoff = (now - timedelta(days=self._settings.retention_ai_usage_logs_days)).isoformat()
         try:
-            cursor = self._db.conn.execute(
+            stats["old_ai_usage_logs"] = self._count(
                 "SELECT COUNT(*) FROM user_usage WHERE period_end < ?",
                 (cutoff,),
             )
-            stats["old_ai_usage_logs"] = cursor.fetchone()[0]
         except Exception:
             stats["old_ai_usage_logs"] = "N/A"
 
         # Sync history
         cutoff = (now - timedelta(days=self._settings.retention_sync_history_days)).isoformat()
         try:
-            cursor = self._db.conn.execute(
+            stats["old_sync_history"] = self._count(
                 "SELECT COUNT(*) FROM garmin_sync_history WHERE started_at < ?",
                 (cutoff,),
             )
-            stats["old_sync_history"] = cursor.fetchone()[0]
         except Exception:
             stats["old_sync_history"] = "N/A"
 
         # Strava sync records
         try:
-            cursor = self._db.conn.execute(
+            stats["old_strava_sync_records"] = self._count(
                 "SELECT COUNT(*) FROM strava_activity_sync WHERE created_at < ? AND sync_status = 'completed'",
                 (cutoff,),
             )
-            stats["old_strava_sync_records"] = cursor.fetchone()[0]
         except Exception:
             stats["old_strava_sync_records"] = "N/A"
 
+        # Chat conversations
+        cutoff = (
+            datetime.utcnow() - timedelta(days=self._settings.retention_chat_conversations_days)
+        ).isoformat()
+        try:
+            stats["inactive_chat_conversations"] = self._count(
+                "SELECT COUNT(*) FROM chat_conversations WHERE last_activity < ?",
+                (cutoff,),
+            )
+        except Exception:
+            stats["inactive_chat_conversations"] = "N/A"
+
         # Activity data (only if retention is enabled)
         if self._settings.retention_activity_data_days > 0:
             cutoff = (now - timedelta(days=self._settings.retention_activity_data_days)).strftime("%Y-%m-%d")
             try:
-                cursor = self._db.conn.execute(
+                stats["old_activity_metrics"] = self._count(
                     "SELECT COUNT(*) FROM activity_metrics WHERE date < ?",
                     (cutoff,),
                 )
-                stats["old_activity_metrics"] = cursor.fetchone()[0]
             except Exception:
                 stats["old_activity_metrics"] = "N/A"
         else:
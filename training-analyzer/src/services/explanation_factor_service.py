@@ -0,0 +1,163 @@
+"""
+Explanation Factor Service for the explain endpoints.
+
+The readiness, workout and plan-session explanations share one set of
+recency and wellness factors per user and day (see
+recommendations.factors). The set is computed from one activity query and
+one wellness query, stored in explanation_factors, and served from there
+until a new or changed activity or wellness day drops it (triggers in the
+schema clear every user's cached days on or after the changed date, since
+the activity and wellness tables are not kept per user).
+"""
+
+import json
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..db.database import TrainingDatabase
+from ..recommendations.factors import (
+    LOOKBACK_DAYS,
+    ExplanationFactors,
+    compute_explanation_factors,
+)
+
+
+DEFAULT_USER_ID = "default"
+
+
+class ExplanationFactorService:
+    """Computes and caches the explanation factors for a day."""
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        training_db: Optional[TrainingDatabase] = None,
+    ):
+        """
+        Initialize the explanation factor service.
+
+        Args:
+            db_path: Path to SQLite database. If not provided, uses default.
+            training_db: TrainingDatabase instance. If provided, uses this instead.
+        """
+        self._training_db = training_db or TrainingDatabase(db_path)
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with context manager."""
+        with self._training_db._get_connection() as conn:
+            yield conn
+
+    def get_factors(
+        self,
+        target_date: Optional[date] = None,
+        user_id: str = DEFAULT_USER_ID,
+    ) -> ExplanationFactors:
+        """
+        Get the factors for a day, computing and caching them if needed.
+
+        Args:
+            target_date: Day to describe (defaults to today)
+            user_id: User the factors belong to
+
+        Returns:
+            ExplanationFactors for the day
+        """
+        if target_date is None:
+            target_date = date.today()
+        key = target_date.isoformat()
+
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT factors FROM explanation_factors WHERE user_id = ? AND date = ?",
+                (user_id, key),
+            ).fetchone()
+        if row is not None:
+            return ExplanationFactors.from_dict(json.loads(row["factors"]))
+
+        factors = self._compute(target_date)
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO explanation_factors (user_id, date, factors, computed_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                (user_id, key, json.dumps(factors.to_dict())),
+            )
+        return factors
+
+    def invalidate(
+        self,
+        since: Optional[date] = None,
+        user_id: Optional[str] = None,
+    ) -> int:
+        """
+        Drop cached factor sets.
+
+        Args:
+            since: Only drop days on or after this date (all days if None)
+            user_id: Only drop this user's sets (all users if None)
+
+        Returns:
+            Number of cached days removed
+        """
+        query = "DELETE FROM explanation_factors WHERE 1 = 1"
+        params = []
+        if since is not None:
+            query += " AND date >= ?"
+            params.append(since.isoformat())
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params.append(user_id)
+        with self._get_connection() as conn:
+            return conn.execute(query, params).rowcount
+
+    def _compute(self, target_date: date) -> ExplanationFactors:
+        """Compute the factors from the lookback window of activities and wellness."""
+        start = (target_date - timedelta(days=LOOKBACK_DAYS)).isoformat()
+        end = target_date.isoformat()
+
+        activities = [
+            activity.to_dict()
+            for activity in self._training_db.get_activities_range(start, end)
+        ]
+
+        wellness = self._training_db.get_wellness_data(start_date=start, end_date=end)
+        wellness_days: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for section in ("sleep", "hrv", "stress", "resting_hr"):
+            for record in wellness.get(section, []):
+                wellness_days.setdefault(record.date, {})[section] = record.to_dict()
+
+        return compute_explanation_factors(activities, wellness_days, target_date)
+
+
+# Singleton instance
+_explanation_factor_service: Optional[ExplanationFactorService] = None
+
+
+def get_explanation_factor_service(
+    db_path: Optional[Union[str, Path]] = None,
+) -> ExplanationFactorService:
+    """
+    Get or create the singleton ExplanationFactorService instance.
+
+    Args:
+        db_path: Optional database path. Only used on first initialization.
+
+    Returns:
+        ExplanationFactorService singleton instance
+    """
+    global _explanation_factor_service
+
+    if _explanation_factor_service is None:
+        _explanation_factor_service = ExplanationFactorService(db_path=db_path)
+
+    return _explanation_factor_service
+
+
+def reset_explanation_factor_service() -> None:
+    """Reset the singleton instance (for testing)."""
+    global _explanation_factor_service
+    _explanation_factor_service = None
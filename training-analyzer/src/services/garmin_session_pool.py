@@ -0,0 +1,292 @@
+"""Reusable authenticated Garmin Connect sessions.
+
+Logging in to Garmin Connect goes through a multi-second SSO handshake, and
+repeated logins risk the account being temporarily locked. This module keeps
+one authenticated client per user, and persists the underlying OAuth tokens
+(which the client refreshes on its own) so a new process can resume the
+session without logging in again.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+# Drop idle in-memory sessions after this long (tokens stay persisted)
+DEFAULT_SESSION_IDLE_TTL = timedelta(minutes=30)
+
+# Maximum number of in-memory sessions kept at once
+DEFAULT_MAX_SESSIONS = 64
+
+
+class GarminTokenStore(Protocol):
+    """Persistent storage for serialized Garmin OAuth tokens."""
+
+    def get_session_tokens(self, user_id: str) -> Optional[str]:
+        ...
+
+    def save_session_tokens(self, user_id: str, tokens: str) -> None:
+        ...
+
+    def clear_session_tokens(self, user_id: str) -> None:
+        ...
+
+
+def _default_client_factory(email: str, password: str) -> Any:
+    """Create a garminconnect client (imported lazily, it is optional)."""
+    from garminconnect import Garmin
+
+    return Garmin(email, password)
+
+
+def _credential_fingerprint(email: str, password: str) -> str:
+    """Hash credentials so a session is never handed to a different login."""
+    return hashlib.sha256(f"{email}\0{password}".encode()).hexdigest()
+
+
+def dump_session_tokens(client: Any) -> Optional[str]:
+    """Serialize a client's OAuth tokens, if the client supports it.
+
+    garminconnect exposes its token client as `garth` in older releases
+    and as `client` in newer ones; both provide `dumps()`.
+    """
+    for attr in ("garth", "client"):
+        dumps = getattr(getattr(client, attr, None), "dumps", None)
+        if callable(dumps):
+            try:
+                return dumps()
+            except Exception as e:
+                logger.debug(f"Failed to serialize Garmin tokens: {e}")
+                return None
+    return None
+
+
+def is_auth_error(error: Exception) -> bool:
+    """Check whether an error means the Garmin session is no longer valid."""
+    if type(error).__name__ == "GarminConnectAuthenticationError":
+        return True
+    message = str(error).lower()
+    return "401" in message or "unauthorized" in message
+
+
+@dataclass
+class _Session:
+    """An authenticated client and its bookkeeping."""
+    client: Any
+    fingerprint: str
+    last_used: datetime = field(default_factory=datetime.now)
+    persisted_tokens: Optional[str] = None
+
+
+class GarminSessionPool:
+    """Per-user cache of authenticated Garmin Connect clients.
+
+    Clients are resolved in order of cost:
+    1. An in-memory session for the same credentials
+    2. A client restored from persisted OAuth tokens (no SSO)
+    3. A full username/password login
+
+    Concurrent requests for the same user share a single login.
+    """
+
+    def __init__(
+        self,
+        client_factory: Optional[Callable[[str, str], Any]] = None,
+        idle_ttl: timedelta = DEFAULT_SESSION_IDLE_TTL,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+    ):
+        """Initialize the pool.
+
+        Args:
+            client_factory: Creates an unauthenticated client from
+                (email, password). Defaults to garminconnect.Garmin.
+            idle_ttl: Evict in-memory sessions unused for this long.
+            max_sessions: Maximum in-memory sessions (least recently used
+                are evicted first).
+        """
+        self._client_factory = client_factory or _default_client_factory
+        self.idle_ttl = idle_ttl
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+        # Counters for monitoring
+        self.logins = 0
+        self.token_resumes = 0
+        self.hits = 0
+
+    def _user_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _evict_expired(self, now: datetime) -> None:
+        with self._lock:
+            expired = [
+                key for key, session in self._sessions.items()
+                if now - session.last_used > self.idle_ttl
+            ]
+            for key in expired:
+                del self._sessions[key]
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def _login(
+        self,
+        key: str,
+        email: str,
+        password: str,
+        token_store: Optional[GarminTokenStore],
+    ) -> _Session:
+        """Authenticate a new client, preferring persisted tokens."""
+        fingerprint = _credential_fingerprint(email, password)
+
+        tokens = token_store.get_session_tokens(key) if token_store else None
+        if tokens:
+            client = self._client_factory(email, password)
+            try:
+                client.login(tokens)
+                self.token_resumes += 1
+                logger.info(f"Resumed Garmin session for {key} from stored tokens")
+                return _Session(client, fingerprint, persisted_tokens=tokens)
+            except Exception as e:
+                logger.info(f"Stored Garmin tokens for {key} rejected, logging in: {e}")
+                token_store.clear_session_tokens(key)
+
+        client = self._client_factory(email, password)
+        client.login()
+        self.logins += 1
+        logger.info(f"Logged in to Garmin Connect for {key}")
+
+        session = _Session(client, fingerprint)
+        self._persist(key, session, token_store)
+        return session
+
+    def _persist(
+        self,
+        key: str,
+        session: _Session,
+        token_store: Optional[GarminTokenStore],
+    ) -> None:
+        """Save the session's tokens if they changed since the last save."""
+        if token_store is None:
+            return
+        tokens = dump_session_tokens(session.client)
+        if tokens and tokens != session.persisted_tokens:
+            try:
+                token_store.save_session_tokens(key, tokens)
+                session.persisted_tokens = tokens
+            except Exception as e:
+                logger.warning(f"Failed to persist Garmin tokens for {key}: {e}")
+
+    def get_client(
+        self,
+        key: str,
+        email: str,
+        password: str,
+        token_store: Optional[GarminTokenStore] = None,
+    ) -> Any:
+        """Get an authenticated client for a user.
+
+        Args:
+            key: Identifies the session owner (user ID, or email when there
+                is no user).
+            email: Garmin Connect email.
+            password: Garmin Connect password.
+            token_store: Where to load/save OAuth tokens (None keeps the
+                session in memory only).
+
+        Returns:
+            An authenticated garminconnect client.
+
+        Raises:
+            Whatever the client raises on login (e.g.
+            GarminConnectAuthenticationError).
+        """
+        now = datetime.now()
+        self._evict_expired(now)
+        fingerprint = _credential_fingerprint(email, password)
+
+        with self._user_lock(key):
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is not None and session.fingerprint == fingerprint:
+                    session.last_used = now
+                    self._sessions.move_to_end(key)
+                    self.hits += 1
+                    return session.client
+
+            session = self._login(key, email, password, token_store)
+            with self._lock:
+                self._sessions[key] = session
+                self._sessions.move_to_end(key)
+            return session.client
+
+    def persist(self, key: str, token_store: Optional[GarminTokenStore]) -> None:
+        """Save refreshed tokens for a user's session (call after use)."""
+        with self._lock:
+            session = self._sessions.get(key)
+        if session is not None:
+            self._persist(key, session, token_store)
+
+    def invalidate(self, key: str, token_store: Optional[GarminTokenStore] = None) -> None:
+        """Forget a user's session (e.g. after an authentication error)."""
+        with self._lock:
+            self._sessions.pop(key, None)
+        if token_store is not None:
+            token_store.clear_session_tokens(key)
+
+    @contextmanager
+    def session(
+        self,
+        key: str,
+        email: str,
+        password: str,
+        token_store: Optional[GarminTokenStore] = None,
+    ) -> Iterator[Any]:
+        """Use an authenticated client, persisting or dropping it afterwards.
+
+        Tokens refreshed during use are saved when the block exits normally;
+        an authentication error invalidates the session.
+        """
+        client = self.get_client(key, email, password, token_store)
+        try:
+            yield client
+        except Exception as e:
+            if is_auth_error(e):
+                self.invalidate(key, token_store)
+            raise
+        self.persist(key, token_store)
+
+    def clear(self) -> None:
+        """Drop all in-memory sessions."""
+        with self._lock:
+            self._sessions.clear()
+            self._locks.clear()
+
+
+_session_pool: Optional[GarminSessionPool] = None
+_session_pool_lock = threading.Lock()
+
+
+def get_garmin_session_pool() -> GarminSessionPool:
+    """Get the process-wide Garmin session pool."""
+    global _session_pool
+    with _session_pool_lock:
+        if _session_pool is None:
+            _session_pool = GarminSessionPool()
+        return _session_pool
+
+
+def reset_garmin_session_pool() -> None:
+    """Reset the session pool singleton (for testing)."""
+    global _session_pool
+    with _session_pool_lock:
+        _session_pool = None
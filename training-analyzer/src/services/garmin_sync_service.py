@@ -19,7 +19,10 @@ from ..db.database import (
     WellnessRestingHRRecord,
 )
 from ..metrics.load import calculate_hrss, calculate_trimp
+from .achievement_service import AchievementService
+from .running_economy_service import get_running_economy_service
 from .encryption import CredentialEncryption, CredentialEncryptionError
+from .garmin_session_pool import GarminSessionPool, get_garmin_session_pool, is_auth_error
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +68,7 @@ class GarminCredentialsRepository:
         """
         self.db = training_db
         self._encryption: Optional[CredentialEncryption] = None
+        self._session_column_checked = False
 
     def _get_encryption(self) -> CredentialEncryption:
         """Get or create the encryption service."""
@@ -117,6 +121,9 @@ class GarminCredentialsRepository:
                 (user_id, encrypted_email, encrypted_password, garmin_user_id, garmin_display_name),
             )
 
+        # Tokens from a previous login belong to the old credentials
+        self.clear_session_tokens(user_id)
+
         return GarminCredentials(
             user_id=user_id,
             email=email,
@@ -194,6 +201,71 @@ class GarminCredentialsRepository:
                 (error_message, user_id),
             )
 
+    def _ensure_session_column(self, conn) -> None:
+        """Add the session_data column to databases created before it existed."""
+        if self._session_column_checked:
+            return
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(garmin_credentials)")}
+        if "session_data" not in columns:
+            conn.execute("ALTER TABLE garmin_credentials ADD COLUMN session_data TEXT")
+        self._session_column_checked = True
+
+    def get_session_tokens(self, user_id: str) -> Optional[str]:
+        """Retrieve and decrypt persisted Garmin OAuth tokens.
+
+        Args:
+            user_id: The user ID.
+
+        Returns:
+            Serialized tokens, or None if none are stored.
+        """
+        with self.db._get_connection() as conn:
+            self._ensure_session_column(conn)
+            row = conn.execute(
+                "SELECT session_data FROM garmin_credentials WHERE user_id = ? AND is_valid = 1",
+                (user_id,),
+            ).fetchone()
+
+        if not row or not row["session_data"]:
+            return None
+        try:
+            return self._get_encryption().decrypt(row["session_data"])
+        except CredentialEncryptionError as e:
+            logger.warning(f"Failed to decrypt Garmin session for user {user_id}: {e}")
+            return None
+
+    def save_session_tokens(self, user_id: str, tokens: str) -> None:
+        """Encrypt and persist Garmin OAuth tokens.
+
+        Args:
+            user_id: The user ID.
+            tokens: Serialized tokens from the Garmin client.
+        """
+        encrypted = self._get_encryption().encrypt(tokens)
+        with self.db._get_connection() as conn:
+            self._ensure_session_column(conn)
+            conn.execute(
+                """
+                UPDATE garmin_credentials
+                SET session_data = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE user_id = ?
+                """,
+                (encrypted, user_id),
+            )
+
+    def clear_session_tokens(self, user_id: str) -> None:
+        """Remove persisted Garmin OAuth tokens.
+
+        Args:
+            user_id: The user ID.
+        """
+        with self.db._get_connection() as conn:
+            self._ensure_session_column(conn)
+            conn.execute(
+                "UPDATE garmin_credentials SET session_data = NULL WHERE user_id = ?",
+                (user_id,),
+            )
+
     def get_sync_config(self, user_id: str) -> dict:
         """Get sync configuration for a user.
 
@@ -410,14 +482,37 @@ class GarminSyncService:
     using encrypted credentials.
     """
 
-    def __init__(self, training_db: TrainingDatabase):
+    def __init__(
+        self,
+        training_db: TrainingDatabase,
+        session_pool: Optional[GarminSessionPool] = None,
+    ):
         """Initialize the sync service.
 
         Args:
             training_db: The training database instance.
+            session_pool: Authenticated session cache (defaults to the
+                process-wide pool).
         """
         self.db = training_db
         self.repo = GarminCredentialsRepository(training_db)
+        self.sessions = session_pool or get_garmin_session_pool()
+
+    def _get_client(self, credentials: GarminCredentials):
+        """Get an authenticated client, reusing the user's session if possible."""
+        return self.sessions.get_client(
+            credentials.user_id,
+            credentials.email,
+            credentials.password,
+            token_store=self.repo,
+        )
+
+    def _release_client(self, user_id: str, error: Optional[Exception] = None) -> None:
+        """Persist refreshed tokens, or drop the session after an auth error."""
+        if error is not None and is_auth_error(error):
+            self.sessions.invalidate(user_id, self.repo)
+        else:
+            self.sessions.persist(user_id, self.repo)
 
     def validate_credentials(self, email: str, password: str) -> tuple[bool, Optional[str], Optional[str]]:
         """Validate Garmin credentials by attempting login.
@@ -466,16 +561,16 @@ class GarminSyncService:
             return result
 
         try:
-            from garminconnect import Garmin, GarminConnectAuthenticationError
+            from garminconnect import GarminConnectAuthenticationError
         except ImportError:
             result.error_message = "garminconnect library not installed"
             result.completed_at = datetime.now()
             return result
 
         try:
-            client = Garmin(credentials.email, credentials.password)
-            client.login()
+            client = self._get_client(credentials)
         except GarminConnectAuthenticationError:
+            self.sessions.invalidate(user_id, self.repo)
             self.repo.mark_credentials_invalid(user_id, "Authentication failed")
             result.error_message = "Invalid credentials"
             result.completed_at = datetime.now()
@@ -496,22 +591,38 @@ class GarminSyncService:
 
             synced_count = 0
             profile = self.db.get_user_profile()
+            achievements = AchievementService(str(self.db.db_path))
+            economy = get_running_economy_service()
 
             for activity in activities or []:
                 try:
                     metrics = self._process_activity(activity, profile)
-                    if metrics:
-                        self.db.save_activity_metrics(metrics)
-                        synced_count += 1
+                    if not metrics:
+                        continue
+                    self.db.save_activity_metrics(metrics)
+                    synced_count += 1
                 except Exception as e:
                     logger.warning(f"Error processing activity: {e}")
                     continue
 
+                # Achievements must never fail the sync
+                try:
+                    achievements.record_activity(metrics, user_id)
+                except Exception as e:
+                    logger.warning(f"Failed to record achievement progress: {e}")
+
+                try:
+                    economy.record_workout(self.db, metrics.to_dict())
+                except Exception as e:
+                    logger.warning(f"Failed to record running economy: {e}")
+
             result.success = True
             result.activities_synced = synced_count
             result.completed_at = datetime.now()
+            self._release_client(user_id)
 
         except Exception as e:
+            self._release_client(user_id, e)
             result.error_message = f"Sync failed: {str(e)}"
             result.completed_at = datetime.now()
 
@@ -536,15 +647,14 @@ class GarminSyncService:
             return result
 
         try:
-            from garminconnect import Garmin
+            import garminconnect  # noqa: F401
         except ImportError:
             result.error_message = "garminconnect library not installed"
             result.completed_at = datetime.now()
             return result
 
         try:
-            client = Garmin(credentials.email, credentials.password)
-            client.login()
+            client = self._get_client(credentials)
 
             synced = False
 
@@ -607,8 +717,10 @@ class GarminSyncService:
             result.success = True
             result.wellness_days_synced = 1 if synced else 0
             result.completed_at = datetime.now()
+            self._release_client(user_id)
 
         except Exception as e:
+            self._release_client(user_id, e)
             result.error_message = f"Wellness sync failed: {str(e)}"
             result.completed_at = datetime.now()
 
@@ -790,15 +902,14 @@ class GarminSyncService:
             return result
 
         try:
-            from garminconnect import Garmin
+            import garminconnect  # noqa: F401
         except ImportError:
             result.error_message = "garminconnect library not installed"
             result.completed_at = datetime.now()
             return result
 
         try:
-            client = Garmin(credentials.email, credentials.password)
-            client.login()
+            client = self._get_client(credentials)
 
             fitness_data = GarminFitnessData(date=date)
 
@@ -838,8 +949,10 @@ class GarminSyncService:
                 result.fitness_days_synced = 0
 
             result.completed_at = datetime.now()
+            self._release_client(user_id)
 
         except Exception as e:
+            self._release_client(user_id, e)
             result.error_message = f"Fitness sync failed: {str(e)}"
             result.completed_at = datetime.now()
 
@@ -23,6 +23,8 @@ from ..models.patterns import (
     OptimalWindow,
     PerformanceCorrelations,
     PlannedEvent,
+    TaperExplorer,
+    TaperScenarioResult,
     TimeOfDay,
     TimeSlotPerformance,
     TimingAnalysis,
@@ -35,11 +37,20 @@ from ..models.patterns import (
     get_tsb_zone,
     get_tsb_zone_range,
 )
-from ..metrics.fitness import calculate_ewma
+from ..metrics.projection import (
+    ScenarioProjection,
+    project_scenarios,
+    steady_scenario,
+    taper_grid,
+)
+from ..utils.asof_join import asof_join
 
 
 logger = logging.getLogger(__name__)
 
+# Race-day form a taper should land in (TSB)
+RACE_DAY_TSB_RANGE = (5.0, 25.0)
+
 
 class PatternRecognitionService:
     """
@@ -392,8 +403,9 @@ class PatternRecognitionService:
         Returns:
             FitnessPrediction with trajectory and recommendations
         """
-        # Get current fitness state
-        current_fitness = self._get_current_fitness(user_id)
+        # Current state, 30 days of history and recent loads in two queries
+        historical = self._get_historical_fitness(user_id, days=30)
+        current_fitness = self._latest_fitness(historical) or self._get_current_fitness(user_id)
         if not current_fitness:
             return FitnessPrediction(
                 user_id=user_id,
@@ -413,7 +425,6 @@ class PatternRecognitionService:
         today = date.today()
 
         # Add historical data points (last 30 days)
-        historical = self._get_historical_fitness(user_id, days=30)
         for entry in historical:
             entry_date = entry.get("date")
             if isinstance(entry_date, str):
@@ -428,43 +439,30 @@ class PatternRecognitionService:
                 )
             )
 
-        # Project future CTL
-        projected_ctl = current_ctl
+        # Project future CTL assuming a consistent daily load
         daily_load = avg_weekly_load / 7 if avg_weekly_load > 0 else 50  # Default if no data
+        steady = project_scenarios(
+            current_ctl, current_atl, [steady_scenario(daily_load, horizon_days)]
+        )[0]
 
-        natural_peak_date = None
-        natural_peak_ctl = current_ctl
-
-        for i in range(1, horizon_days + 1):
-            future_date = today + timedelta(days=i)
-
-            # Simple projection: assume consistent daily load
-            projected_ctl = calculate_ewma(daily_load, projected_ctl, 42)
-
+        for i, projected_ctl in enumerate(steady.ctl, start=1):
             # Calculate confidence bounds (wider as we go further)
             uncertainty = 0.05 * i  # 5% per day
-            confidence_lower = projected_ctl * (1 - uncertainty)
-            confidence_upper = projected_ctl * (1 + uncertainty)
-
             ctl_projection.append(
                 CTLProjection(
-                    date=future_date,
+                    date=today + timedelta(days=i),
                     projected_ctl=projected_ctl,
-                    confidence_lower=confidence_lower,
-                    confidence_upper=confidence_upper,
+                    confidence_lower=projected_ctl * (1 - uncertainty),
+                    confidence_upper=projected_ctl * (1 + uncertainty),
                     is_historical=False,
                 )
             )
 
-            # Track peak
-            if projected_ctl > natural_peak_ctl:
-                natural_peak_ctl = projected_ctl
-                natural_peak_date = future_date
-
-        # Calculate days to natural peak
-        days_to_natural_peak = None
-        if natural_peak_date:
-            days_to_natural_peak = (natural_peak_date - today).days
+        natural_peak_date = None
+        natural_peak_ctl = steady.peak_ctl
+        days_to_natural_peak = steady.peak_day
+        if steady.peak_day:
+            natural_peak_date = today + timedelta(days=steady.peak_day)
 
         # Target date analysis
         projected_ctl_at_target = None
@@ -477,28 +475,31 @@ class PatternRecognitionService:
         if target_date:
             days_to_target = (target_date - today).days
             if days_to_target > 0:
-                # Find CTL at target date
-                for proj in ctl_projection:
-                    if proj.date == target_date:
-                        projected_ctl_at_target = proj.projected_ctl
-                        break
-
-                # Estimate TSB at target (simplified: assume ~10 day taper)
-                taper_days = min(14, max(7, days_to_target // 3))
-                taper_start_date = target_date - timedelta(days=taper_days)
-
-                # During taper, load drops to ~50%, TSB rises
-                if days_to_target >= taper_days:
-                    projected_tsb_at_target = 10.0  # Target fresh state
-                else:
-                    projected_tsb_at_target = current_tsb + (days_to_target * 2)
+                steady_ctl_at_target = (
+                    steady.ctl[days_to_target - 1] if days_to_target <= horizon_days else None
+                )
+
+                # Best of the candidate tapers into the target date; races
+                # too close for the shortest taper hold the current load
+                scenarios = taper_grid(daily_load, days_to_target) or [
+                    steady_scenario(daily_load, days_to_target)
+                ]
+                tapers = project_scenarios(
+                    current_ctl, current_atl, scenarios, race_day=days_to_target
+                )
+                best = self._recommend_taper(tapers)
+                if best:
+                    projected_ctl_at_target = best.race_ctl
+                    projected_tsb_at_target = best.race_tsb
+                    if best.scenario.taper_days:
+                        taper_start_date = target_date - timedelta(days=best.scenario.taper_days)
 
                 # Calculate load recommendations
-                if projected_ctl_at_target and projected_ctl_at_target < current_ctl * 0.95:
+                if steady_ctl_at_target and steady_ctl_at_target < current_ctl * 0.95:
                     # Need to increase load to reach target
                     load_change_percentage = 10.0
                     weekly_load_recommendation = avg_weekly_load * 1.1
-                elif projected_ctl_at_target and projected_ctl_at_target > current_ctl * 1.1:
+                elif steady_ctl_at_target and steady_ctl_at_target > current_ctl * 1.1:
                     # Can reduce load slightly
                     load_change_percentage = -5.0
                     weekly_load_recommendation = avg_weekly_load * 0.95
@@ -540,6 +541,78 @@ class PatternRecognitionService:
             planned_events=planned_events,
         )
 
+    def explore_tapers(
+        self,
+        user_id: str,
+        target_date: date,
+        build_pct_per_week: float = 0.0,
+    ) -> TaperExplorer:
+        """
+        Project a grid of taper scenarios into a target race.
+
+        Every combination of taper length, load reduction and taper shape
+        is evaluated in one batch, so a UI can explore them without a
+        request per change.
+
+        Args:
+            user_id: User ID to analyze
+            target_date: Race date
+            build_pct_per_week: Weekly load increase before the taper
+
+        Returns:
+            TaperExplorer with race-day CTL/TSB for each scenario
+        """
+        today = date.today()
+        days_to_race = (target_date - today).days
+        explorer = TaperExplorer(
+            user_id=user_id,
+            target_date=target_date,
+            days_to_race=days_to_race,
+            build_pct_per_week=build_pct_per_week,
+        )
+
+        current_fitness = self._get_current_fitness(user_id)
+        if not current_fitness or days_to_race <= 0:
+            return explorer
+
+        explorer.current_ctl = current_fitness.get("ctl", 0)
+        explorer.current_atl = current_fitness.get("atl", 0)
+        explorer.current_tsb = current_fitness.get("tsb", 0)
+        recent_loads = self._get_recent_weekly_loads(user_id, weeks=4)
+        explorer.current_weekly_load = sum(recent_loads) / len(recent_loads) if recent_loads else 0
+        daily_load = explorer.current_weekly_load / 7 if explorer.current_weekly_load > 0 else 50
+
+        scenarios = [steady_scenario(daily_load, days_to_race)] + taper_grid(
+            daily_load, days_to_race, build_pct_per_week=build_pct_per_week
+        )
+        steady, *tapers = project_scenarios(
+            explorer.current_ctl, explorer.current_atl, scenarios, race_day=days_to_race
+        )
+        explorer.steady_race_day_ctl = round(steady.race_ctl, 1)
+        explorer.steady_race_day_tsb = round(steady.race_tsb, 1)
+
+        for proj in tapers:
+            scenario = proj.scenario
+            explorer.scenarios.append(
+                TaperScenarioResult(
+                    name=scenario.name,
+                    taper_days=scenario.taper_days,
+                    reduction_pct=round(scenario.reduction * 100, 1),
+                    shape=scenario.shape,
+                    taper_start_date=target_date - timedelta(days=scenario.taper_days),
+                    peak_date=today + timedelta(days=proj.peak_day) if proj.peak_day else None,
+                    peak_ctl=round(proj.peak_ctl, 1),
+                    race_day_ctl=round(proj.race_ctl, 1),
+                    race_day_tsb=round(proj.race_tsb, 1),
+                    ctl_trajectory=[round(v, 1) for v in proj.ctl],
+                    tsb_trajectory=[round(v, 1) for v in proj.tsb],
+                )
+            )
+
+        best = self._recommend_taper(tapers)
+        explorer.recommended_scenario = best.scenario.name if best else None
+        return explorer
+
     def get_performance_correlations(
         self,
         user_id: str,
@@ -620,6 +693,24 @@ class PatternRecognitionService:
                 )
             )
 
+        # Overnight HRV relative to its baseline (if available)
+        hrv_values = [p["workout"].get("hrv_vs_baseline") for p in performances]
+        valid_hrv = [(h, p) for h, p in zip(hrv_values, perf_values) if h is not None]
+        if len(valid_hrv) >= 10:
+            r, p = self._calculate_correlation(
+                [v[0] for v in valid_hrv],
+                [v[1] for v in valid_hrv],
+            )
+            correlations.append(
+                CorrelationFactor(
+                    factor_name="HRV vs Baseline",
+                    correlation_coefficient=r,
+                    p_value=p,
+                    sample_size=len(valid_hrv),
+                    is_significant=p < 0.05,
+                )
+            )
+
         # Days since last workout
         days_rest = [p["workout"].get("days_since_last_workout") for p in performances]
         valid_rest = [(d, p) for d, p in zip(days_rest, perf_values) if d is not None]
@@ -736,48 +827,25 @@ class PatternRecognitionService:
     ) -> List[Dict]:
         """Fetch workouts with fitness metrics (CTL, ATL, TSB)."""
         try:
-            # Get workouts
             activities = self._db.get_activities_range(
                 start_date.isoformat(),
                 end_date.isoformat(),
             )
             workout_list = [a.to_dict() if hasattr(a, "to_dict") else a for a in activities]
 
-            # Fetch all fitness data for the date range (with some buffer)
-            fitness_start = (start_date - timedelta(days=7)).isoformat()
-            fitness_end = end_date.isoformat()
-            fitness_list = self._db.get_fitness_range(fitness_start, fitness_end)
-
-            # Build a lookup dict by date
-            fitness_by_date = {}
-            for f in fitness_list:
-                f_dict = f.to_dict() if hasattr(f, "to_dict") else f
-                f_date = f_dict.get("date")
-                if f_date:
-                    fitness_by_date[f_date] = f_dict
-
-            # Sort fitness dates for finding closest match
-            sorted_fitness_dates = sorted(fitness_by_date.keys())
+            # Fitness rows from a week earlier so the first workouts have a match
+            fitness_list = self._db.get_fitness_range(
+                (start_date - timedelta(days=7)).isoformat(),
+                end_date.isoformat(),
+            )
+            fitness_list = [f.to_dict() if hasattr(f, "to_dict") else f for f in fitness_list]
 
-            # Enrich with fitness data
-            for w in workout_list:
-                workout_date = w.get("date")
-                if workout_date:
-                    # Try exact match first
-                    if workout_date in fitness_by_date:
-                        fitness = fitness_by_date[workout_date]
-                    else:
-                        # Find closest earlier date
-                        fitness = None
-                        for f_date in reversed(sorted_fitness_dates):
-                            if f_date <= workout_date:
-                                fitness = fitness_by_date[f_date]
-                                break
-
-                    if fitness:
-                        w["ctl"] = fitness.get("ctl", 0)
-                        w["atl"] = fitness.get("atl", 0)
-                        w["tsb"] = fitness.get("tsb", 0)
+            # Latest fitness on or before each workout's date
+            for w, fitness in zip(workout_list, asof_join(workout_list, fitness_list)):
+                if fitness:
+                    w["ctl"] = fitness.get("ctl", 0)
+                    w["atl"] = fitness.get("atl", 0)
+                    w["tsb"] = fitness.get("tsb", 0)
 
             return workout_list
         except Exception as e:
@@ -790,8 +858,62 @@ class PatternRecognitionService:
         start_date: date,
         end_date: date,
     ) -> List[Dict]:
-        """Fetch workouts with full context for correlation analysis."""
-        return self._get_workouts_with_fitness(user_id, start_date, end_date)
+        """
+        Fetch workouts with full context for correlation analysis.
+
+        On top of fitness metrics, attaches the night's sleep and HRV
+        relative to its baseline (same-day wellness records), days since
+        the previous workout and week-to-date load before the workout.
+        """
+        workouts = self._get_workouts_with_fitness(user_id, start_date, end_date)
+        if not workouts:
+            return workouts
+
+        self._attach_wellness(workouts, start_date, end_date)
+
+        # Rest and weekly load from the workouts themselves, in date order
+        dated = sorted(
+            (w for w in workouts if w.get("date")),
+            key=lambda w: (str(w["date"])[:10], str(w.get("start_time") or "")),
+        )
+        prev_day: Optional[date] = None
+        week: Optional[Tuple[int, int]] = None
+        week_load = 0.0
+        for w in dated:
+            day = date.fromisoformat(str(w["date"])[:10])
+            w["days_since_last_workout"] = (day - prev_day).days if prev_day else None
+            prev_day = day
+
+            iso_week = day.isocalendar()[:2]
+            if iso_week != week:
+                week, week_load = iso_week, 0.0
+            w["weekly_load_so_far"] = week_load
+            week_load += w.get("hrss") or w.get("trimp") or 0
+
+        return workouts
+
+    def _attach_wellness(
+        self,
+        workouts: List[Dict],
+        start_date: date,
+        end_date: date,
+    ) -> None:
+        """Attach same-day sleep and HRV-vs-baseline to workouts, if stored."""
+        start, end = start_date.isoformat(), end_date.isoformat()
+        try:
+            if hasattr(self._db, "get_sleep_range"):
+                sleep = self._db.get_sleep_range(start, end)
+                for w, night in zip(workouts, asof_join(workouts, sleep, max_gap_days=0)):
+                    if night and night.total_sleep_hours is not None:
+                        w["prev_night_sleep_hours"] = night.total_sleep_hours
+
+            if hasattr(self._db, "get_hrv_range"):
+                hrv = self._db.get_hrv_range(start, end)
+                for w, night in zip(workouts, asof_join(workouts, hrv, max_gap_days=0)):
+                    if night and night.hrv_last_night_avg and night.hrv_weekly_avg:
+                        w["hrv_vs_baseline"] = night.hrv_last_night_avg / night.hrv_weekly_avg
+        except Exception as e:
+            logger.warning(f"Failed to attach wellness context: {e}")
 
     def _get_current_fitness(self, user_id: str) -> Optional[Dict]:
         """Get current fitness state."""
@@ -804,23 +926,43 @@ class PatternRecognitionService:
             logger.error(f"Failed to get current fitness: {e}")
             return None
 
+    @staticmethod
+    def _latest_fitness(history: List[Dict]) -> Optional[Dict]:
+        """Most recent entry of a fitness history, if any."""
+        dated = [f for f in history if f.get("date")]
+        if not dated:
+            return None
+        return max(dated, key=lambda f: str(f["date"]))
+
+    def _recommend_taper(self, tapers: List[ScenarioProjection]) -> Optional[ScenarioProjection]:
+        """
+        Pick the taper with the highest race-day CTL among those that
+        arrive fresh (TSB in the target range), else the freshest one.
+        """
+        if not tapers:
+            return None
+        low, high = RACE_DAY_TSB_RANGE
+        fresh = [p for p in tapers if low <= p.race_tsb <= high]
+        if fresh:
+            return max(fresh, key=lambda p: p.race_ctl)
+        return max(tapers, key=lambda p: p.race_tsb)
+
     def _get_recent_weekly_loads(self, user_id: str, weeks: int = 4) -> List[float]:
-        """Get weekly training loads for recent weeks."""
+        """Get weekly training loads for recent weeks (most recent first)."""
         try:
-            loads = []
             today = date.today()
-            for week in range(weeks):
-                start = today - timedelta(days=7 * (week + 1))
-                end = today - timedelta(days=7 * week)
-                activities = self._db.get_activities_range(
-                    start.isoformat(),
-                    end.isoformat(),
-                )
-                weekly_load = sum(
-                    a.get("hrss", 0) or a.get("trimp", 0) or 0
-                    for a in [act.to_dict() if hasattr(act, "to_dict") else act for act in activities]
-                )
-                loads.append(weekly_load)
+            activities = self._db.get_activities_range(
+                (today - timedelta(days=7 * weeks - 1)).isoformat(),
+                today.isoformat(),
+            )
+            loads = [0.0] * weeks
+            for act in activities:
+                a = act.to_dict() if hasattr(act, "to_dict") else act
+                if not a.get("date"):
+                    continue
+                week = (today - date.fromisoformat(str(a["date"])[:10])).days // 7
+                if 0 <= week < weeks:
+                    loads[week] += a.get("hrss", 0) or a.get("trimp", 0) or 0
             return loads
         except Exception as e:
             logger.error(f"Failed to get weekly loads: {e}")
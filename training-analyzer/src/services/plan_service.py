@@ -18,6 +18,7 @@ import uuid
 from pydantic import BaseModel, Field
 
 from .base import BaseService, CacheProtocol, PaginationParams, PaginatedResult
+from ..db.repositories.plan_repository import PlanRepository, get_plan_repository
 from ..exceptions import (
     PlanNotFoundError,
     PlanValidationError,
@@ -108,6 +109,10 @@ class PlanService(BaseService):
 
     CACHE_TTL_SECONDS = 600  # 10 minutes
     GENERATION_TIMEOUT_SECONDS = 120
+    # Streamed generation: weeks run concurrently, each with its own budget
+    MAX_CONCURRENT_WEEKS = 4
+    WEEK_TIMEOUT_SECONDS = 30
+    WEEK_ATTEMPTS = 3
 
     def __init__(
         self,
@@ -116,13 +121,14 @@ class PlanService(BaseService):
         coach_service: Any,  # CoachService for athlete context
         cache: Optional[CacheProtocol] = None,
         logger: Optional[logging.Logger] = None,
+        plan_repository: Optional[PlanRepository] = None,
     ) -> None:
         super().__init__(cache=cache, logger=logger)
         self._plan_agent = plan_agent
         self._workout_service = workout_service
         self._coach_service = coach_service
-        # In-memory storage for demo (replace with database)
-        self._plans: Dict[str, TrainingPlan] = {}
+        # Plans, weeks and sessions are persisted in SQLite
+        self._plan_repository = plan_repository or get_plan_repository()
 
     async def get_plan(self, plan_id: str) -> TrainingPlan:
         """
@@ -144,7 +150,7 @@ class PlanService(BaseService):
             return TrainingPlan.model_validate(cached)
 
         # Fetch from storage
-        plan = self._plans.get(plan_id)
+        plan = self._plan_repository.get(plan_id)
         if not plan:
             raise PlanNotFoundError(plan_id)
 
@@ -171,24 +177,28 @@ class PlanService(BaseService):
 
         Returns:
             PaginatedResult containing plan summaries
-        """
-        # Filter plans
-        plans = list(self._plans.values())
-
-        if filters:
-            if filters.status:
-                plans = [p for p in plans if p.status.value == filters.status]
 
-        # Sort
-        sort_key = pagination.sort_by or "created_at"
-        reverse = pagination.sort_order == "desc"
-        plans.sort(key=lambda p: getattr(p, sort_key, ""), reverse=reverse)
+        Raises:
+            PlanValidationError: If filtering by a status other than active
+        """
+        # Only whether a plan is active is stored, so that is the one status
+        # the repository can filter on
+        status = filters.status if filters else None
+        if status is not None and status != PlanStatus.ACTIVE.value:
+            raise PlanValidationError(
+                f"Cannot filter plans by status '{status}'; "
+                f"only '{PlanStatus.ACTIVE.value}' is supported",
+                field="status",
+            )
+        active_only = status == PlanStatus.ACTIVE.value
 
-        # Paginate
-        total = len(plans)
-        start = pagination.offset
-        end = start + pagination.limit
-        page_plans = plans[start:end]
+        # The repository lists newest first from the (created_at, id) index
+        page_plans = self._plan_repository.get_all(
+            limit=pagination.limit,
+            offset=pagination.offset,
+            active_only=active_only,
+        )
+        total = self._plan_repository.count(active_only=active_only)
 
         # Convert to summaries
         summaries = [self._plan_to_summary(p) for p in page_plans]
@@ -207,10 +217,7 @@ class PlanService(BaseService):
         Returns:
             The active plan or None if no plan is active
         """
-        for plan in self._plans.values():
-            if plan.status == PlanStatus.ACTIVE:
-                return plan
-        return None
+        return self._plan_repository.get_active()
 
     async def create_plan(self, request: CreatePlanRequest) -> TrainingPlan:
         """
@@ -244,7 +251,7 @@ class PlanService(BaseService):
             updated_at=datetime.utcnow().isoformat(),
         )
 
-        self._plans[plan_id] = plan
+        self._plan_repository.save(plan)
         self.logger.info(f"Created plan {plan_id}: {request.name}")
 
         return plan
@@ -286,19 +293,19 @@ class PlanService(BaseService):
                 plan.weeks = self._parse_generated_weeks(result, plan)
                 plan.updated_at = datetime.utcnow().isoformat()
 
-                self._plans[plan.id] = plan
+                self._plan_repository.save(plan)
                 await self._invalidate_plan_cache(plan.id)
 
         except asyncio.TimeoutError:
             # Cleanup the plan on timeout
-            del self._plans[plan.id]
+            self._plan_repository.delete(plan.id)
             raise PlanGenerationError(
                 message="Plan generation timed out",
                 phase="generation",
             )
         except Exception as e:
             # Cleanup on error
-            del self._plans[plan.id]
+            self._plan_repository.delete(plan.id)
             self.logger.error(f"Plan generation failed: {e}")
             raise PlanGenerationError(
                 message=f"Failed to generate plan: {e}",
@@ -314,8 +321,11 @@ class PlanService(BaseService):
         """
         Stream plan generation progress.
 
+        Weeks are generated concurrently and each is stored on the plan and
+        yielded as soon as it completes.
+
         Yields:
-            Progress updates and final plan
+            Progress updates, each generated week, and the final plan
         """
         yield {
             "type": "progress",
@@ -348,35 +358,27 @@ class PlanService(BaseService):
             "percentage": 40,
         }
 
-        # Generate weeks
+        # Generate weeks concurrently; each finished week is stored on the
+        # plan right away, so a failure keeps the weeks already generated
         try:
-            weeks = []
-            weeks_per_progress = max(1, plan.total_weeks // 4)
-
-            for i in range(plan.total_weeks):
-                week = await self._generate_single_week(
-                    plan=plan,
-                    week_number=i + 1,
-                    athlete_context=athlete_context,
-                )
-                weeks.append(week)
-
-                if (i + 1) % weeks_per_progress == 0:
-                    progress = 40 + int((i + 1) / plan.total_weeks * 50)
-                    yield {
-                        "type": "progress",
-                        "phase": "generating",
-                        "message": f"Generated week {i + 1} of {plan.total_weeks}...",
-                        "percentage": progress,
-                    }
-
-            plan.weeks = weeks
-            plan.updated_at = datetime.utcnow().isoformat()
-            self._plans[plan.id] = plan
+            async for week in self._generate_weeks_concurrently(plan, athlete_context):
+                plan.weeks = sorted(plan.weeks + [week], key=lambda w: w.week_number)
+                plan.updated_at = datetime.utcnow().isoformat()
+                self._plan_repository.save(plan)
+                await self._invalidate_plan_cache(plan.id)
+                yield {
+                    "type": "week",
+                    "week": week.model_dump(mode="json"),
+                    "percentage": 40 + int(len(plan.weeks) / plan.total_weeks * 50),
+                }
 
         except Exception as e:
-            del self._plans[plan.id]
-            yield {"type": "error", "error": str(e)}
+            yield {
+                "type": "error",
+                "error": str(e),
+                "plan_id": plan.id,
+                "completed_weeks": len(plan.weeks),
+            }
             return
 
         yield {
@@ -416,7 +418,7 @@ class PlanService(BaseService):
             plan.status = PlanStatus(request.status)
 
         plan.updated_at = datetime.utcnow().isoformat()
-        self._plans[plan_id] = plan
+        self._plan_repository.save(plan)
         await self._invalidate_plan_cache(plan_id)
 
         return plan
@@ -431,10 +433,9 @@ class PlanService(BaseService):
         Raises:
             PlanNotFoundError: If plan doesn't exist
         """
-        if plan_id not in self._plans:
+        if not self._plan_repository.delete(plan_id):
             raise PlanNotFoundError(plan_id)
 
-        del self._plans[plan_id]
         await self._invalidate_plan_cache(plan_id)
         self.logger.info(f"Deleted plan {plan_id}")
 
@@ -460,7 +461,7 @@ class PlanService(BaseService):
         plan.status = PlanStatus.ACTIVE
         plan.updated_at = datetime.utcnow().isoformat()
 
-        self._plans[plan_id] = plan
+        self._plan_repository.save(plan)
         await self._invalidate_plan_cache(plan_id)
 
         self.logger.info(f"Activated plan {plan_id}")
@@ -480,7 +481,7 @@ class PlanService(BaseService):
         plan.status = PlanStatus.PAUSED
         plan.updated_at = datetime.utcnow().isoformat()
 
-        self._plans[plan_id] = plan
+        self._plan_repository.save(plan)
         await self._invalidate_plan_cache(plan_id)
 
         self.logger.info(f"Paused plan {plan_id}")
@@ -505,10 +506,10 @@ class PlanService(BaseService):
         """
         plan = await self.get_plan(plan_id)
 
-        # Find the session
+        # Find the session and its position within the plan
         session = None
         for week in plan.weeks:
-            for sess in week.sessions:
+            for session_index, sess in enumerate(week.sessions):
                 if sess.id == session_id:
                     session = sess
                     break
@@ -532,8 +533,8 @@ class PlanService(BaseService):
         if request.notes is not None:
             session.notes = request.notes
 
-        plan.updated_at = datetime.utcnow().isoformat()
-        self._plans[plan_id] = plan
+        # Only the session's row is rewritten
+        self._plan_repository.save_session(plan_id, week.week_number, session_index, session)
         await self._invalidate_plan_cache(plan_id)
 
         return session
@@ -578,7 +579,7 @@ class PlanService(BaseService):
                     )
 
             plan.updated_at = datetime.utcnow().isoformat()
-            self._plans[plan_id] = plan
+            self._plan_repository.save(plan)
             await self._invalidate_plan_cache(plan_id)
 
         except Exception as e:
@@ -681,6 +682,65 @@ class PlanService(BaseService):
             focus_areas=[],
         )
 
+    async def _generate_weeks_concurrently(
+        self,
+        plan: TrainingPlan,
+        athlete_context: Optional[Dict[str, Any]],
+    ) -> AsyncIterator[TrainingWeek]:
+        """
+        Generate all weeks of a plan concurrently, yielding each as it completes.
+
+        At most MAX_CONCURRENT_WEEKS run at once. A week whose attempt fails
+        or exceeds WEEK_TIMEOUT_SECONDS is retried on its own, up to
+        WEEK_ATTEMPTS times.
+
+        Raises:
+            PlanGenerationError: After the other weeks finished, if any week
+                failed every attempt
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_WEEKS)
+
+        async def run(week_number: int) -> TrainingWeek:
+            async with semaphore:
+                for attempt in range(1, self.WEEK_ATTEMPTS + 1):
+                    try:
+                        async with asyncio.timeout(self.WEEK_TIMEOUT_SECONDS):
+                            return await self._generate_single_week(
+                                plan=plan,
+                                week_number=week_number,
+                                athlete_context=athlete_context,
+                            )
+                    except Exception as e:
+                        self.logger.warning(
+                            f"Week {week_number} of plan {plan.id} failed "
+                            f"(attempt {attempt}/{self.WEEK_ATTEMPTS}): {e!r}"
+                        )
+            raise PlanGenerationError(
+                message=f"Week {week_number} failed after {self.WEEK_ATTEMPTS} attempts",
+                phase="generation",
+            )
+
+        tasks = [
+            asyncio.create_task(run(week_number))
+            for week_number in range(1, plan.total_weeks + 1)
+        ]
+        failed = 0
+        try:
+            for completed in asyncio.as_completed(tasks):
+                try:
+                    yield await completed
+                except PlanGenerationError:
+                    failed += 1
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if failed:
+            raise PlanGenerationError(
+                message=f"{failed} of {plan.total_weeks} weeks failed to generate",
+                phase="generation",
+            )
+
     def _determine_phase(self, week_number: int, total_weeks: int) -> PlanPhase:
         """Determine the training phase for a week."""
         progress = week_number / total_weeks
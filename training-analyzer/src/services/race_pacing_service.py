@@ -3,20 +3,28 @@
 This service handles:
 - Pacing plan generation based on target time and distance
 - Weather-based pace adjustments
-- Elevation-based pace adjustments
+- Elevation-based pace adjustments from a course model, which can be built
+  from a profile, a GPX/FIT file or a stored activity
+- Splits per 100 m, km or mile
 - Strategy recommendations (even, negative split, course-specific)
 """
 
 import logging
 import math
+from pathlib import Path
 from typing import List, Optional, Tuple
 
+from ..metrics.course import (
+    CourseModel,
+    SPLIT_UNITS_KM,
+)
 from ..models.race_pacing import (
     PacingPlan,
     PacingStrategy,
     RaceDistance,
     RACE_DISTANCES_KM,
     CourseProfile,
+    ElevationPoint,
     WeatherConditions,
     WeatherAdjustment,
     SplitTarget,
@@ -43,10 +51,11 @@ WEATHER_ADJUSTMENTS = {
 OPTIMAL_TEMPERATURE_C = 12.0
 OPTIMAL_HUMIDITY_PCT = 60.0
 
-# Elevation adjustment factors
-UPHILL_ADJUSTMENT_PER_PCT = 0.08     # +8% pace per 1% grade uphill
-DOWNHILL_ADJUSTMENT_PER_PCT = -0.03  # -3% pace per 1% grade downhill (capped)
-MAX_DOWNHILL_ADJUSTMENT = -0.06      # Max 6% faster on downhills
+# Spacing of the elevation profile returned with plans built from a course model
+PROFILE_POINT_SPACING_KM = 0.1
+
+# Course files accepted by load_course_file()
+COURSE_FILE_FORMATS = ("gpx", "fit")
 
 
 class RacePacingService:
@@ -65,6 +74,7 @@ class RacePacingService:
         weather_conditions: Optional[WeatherConditions] = None,
         strategy: Optional[PacingStrategy] = None,
         split_unit: str = "km",
+        course: Optional[CourseModel] = None,
     ) -> PacingPlan:
         """
         Generate a complete pacing plan for a race.
@@ -77,15 +87,30 @@ class RacePacingService:
             course_profile: Optional course elevation profile
             weather_conditions: Optional weather conditions
             strategy: Preferred pacing strategy (auto-selected if None)
-            split_unit: Unit for splits ("km" or "mile")
+            split_unit: Unit for splits ("100m", "km" or "mile")
+            course: Optional course model (e.g. from a GPX/FIT file); takes
+                precedence over course_profile for elevation adjustments
 
         Returns:
             PacingPlan with all splits and recommendations
+
+        Raises:
+            ValueError: If the split unit is not supported
         """
         self.logger.info(
             f"Generating pacing plan: {distance_km}km in {format_time(target_time_sec)}"
         )
 
+        split_km = SPLIT_UNITS_KM.get(split_unit)
+        if split_km is None:
+            raise ValueError(f"Unsupported split unit: {split_unit}")
+
+        # Build the course model once; dense profiles are smoothed here
+        if course is None and course_profile and len(course_profile.elevation_points) >= 2:
+            course = CourseModel.from_points(course_profile.elevation_points)
+        elif course is not None and course_profile is None:
+            course_profile = self.course_profile_from_model(course, race_name)
+
         # Calculate base pace
         base_pace_sec_km = target_time_sec / distance_km
 
@@ -112,8 +137,9 @@ class RacePacingService:
         elevation_adjustments = []
         if course_profile and course_profile.elevation_points:
             course_profile.calculate_elevation_metrics()
+        if course is not None:
             elevation_adjustments = self._calculate_elevation_adjustments(
-                course_profile, distance_km
+                course, distance_km, split_km
             )
 
         # Generate splits based on strategy
@@ -124,7 +150,7 @@ class RacePacingService:
             strategy=strategy,
             elevation_adjustments=elevation_adjustments,
             weather_adjustment=weather_adjustment,
-            split_unit=split_unit,
+            split_km=split_km,
         )
 
         # Generate tips
@@ -206,80 +232,121 @@ class RacePacingService:
             adjusted_target_pace_sec_km=round(adjusted_pace, 1),
         )
 
-    def _calculate_elevation_adjustments(
+    def course_profile_from_model(
         self,
-        profile: CourseProfile,
-        distance_km: float,
-    ) -> List[float]:
+        course: CourseModel,
+        name: Optional[str] = None,
+    ) -> CourseProfile:
         """
-        Calculate per-km pace adjustments based on elevation profile.
+        Summarize a course model as a CourseProfile.
+
+        The profile is sampled every PROFILE_POINT_SPACING_KM so plans built
+        from dense tracks stay small; gain and loss come from the full track.
+        """
+        return CourseProfile(
+            name=name,
+            total_distance_km=course.total_distance_km,
+            elevation_points=[
+                ElevationPoint(distance_km=d, elevation_m=e)
+                for d, e in course.profile_points(PROFILE_POINT_SPACING_KM)
+            ],
+            total_elevation_gain_m=round(course.elevation_gain_m, 1),
+            total_elevation_loss_m=round(course.elevation_loss_m, 1),
+        )
+
+    def load_course_file(
+        self,
+        data: bytes,
+        filename: str,
+        distance_km: Optional[float] = None,
+    ) -> CourseModel:
+        """
+        Build a course model from a GPX or FIT file.
 
         Args:
-            profile: Course elevation profile
-            distance_km: Total distance
+            data: File contents
+            filename: File name or bare format ("gpx", "fit")
+            distance_km: Race distance to stretch the recorded track to
 
         Returns:
-            List of percentage adjustments per km
+            The course model
+
+        Raises:
+            ValueError: If the format is unsupported or the file has no usable track
         """
-        if not profile.elevation_points or len(profile.elevation_points) < 2:
-            return [0.0] * int(math.ceil(distance_km))
-
-        adjustments = []
-        num_splits = int(math.ceil(distance_km))
-
-        for km in range(num_splits):
-            km_start = float(km)
-            km_end = min(float(km + 1), distance_km)
-
-            # Interpolate elevation at km_start and km_end
-            elev_start = self._interpolate_elevation(profile.elevation_points, km_start)
-            elev_end = self._interpolate_elevation(profile.elevation_points, km_end)
-
-            # Calculate grade percentage
-            distance_m = (km_end - km_start) * 1000
-            elevation_change_m = elev_end - elev_start
-            grade_pct = (elevation_change_m / distance_m) * 100 if distance_m > 0 else 0
-
-            # Calculate adjustment
-            if grade_pct > 0:
-                # Uphill: slower
-                adjustment = grade_pct * UPHILL_ADJUSTMENT_PER_PCT * 100
-            else:
-                # Downhill: faster, but capped
-                adjustment = max(
-                    MAX_DOWNHILL_ADJUSTMENT * 100,
-                    grade_pct * DOWNHILL_ADJUSTMENT_PER_PCT * 100
-                )
+        file_format = (Path(filename).suffix.lstrip(".") or filename).lower()
+        if file_format == "gpx":
+            course = CourseModel.from_gpx(data)
+        elif file_format == "fit":
+            course = CourseModel.from_fit(data)
+        else:
+            raise ValueError(
+                f"Unsupported course file: {filename} "
+                f"(expected {', '.join(COURSE_FILE_FORMATS)})"
+            )
+
+        return course.rescaled(distance_km) if distance_km else course
+
+    def load_activity_course(
+        self,
+        training_db,
+        activity_id: str,
+        distance_km: Optional[float] = None,
+    ) -> Optional[CourseModel]:
+        """
+        Build a course model from a stored activity's elevation stream.
+
+        Only activities whose time series are stored locally (Strava
+        imports) can be used.
 
-            adjustments.append(round(adjustment, 2))
+        Args:
+            training_db: Training database holding the activity summary
+            activity_id: Local activity ID
+            distance_km: Race distance to stretch the recorded track to
 
-        return adjustments
+        Returns:
+            The course model, or None if the activity or its streams are not stored
 
-    def _interpolate_elevation(
+        Raises:
+            ValueError: If the stored streams have no usable elevation data
+        """
+        from ..db.repositories.strava_repository import get_strava_repository
+        from .strava_import_service import RUNNING_TYPES
+
+        activity = training_db.get_activity_metrics(activity_id)
+        stored = get_strava_repository().get_activity_streams(activity_id)
+        if activity is None or not stored:
+            return None
+
+        time_series = stored["time_series"]
+        course = CourseModel.from_time_series(
+            elevation=time_series.get("elevation") or [],
+            pace_or_speed=time_series.get("pace_or_speed") or [],
+            # Same rule the importer used when storing pace vs speed
+            is_running=(activity.activity_type or "") in RUNNING_TYPES,
+            total_distance_km=activity.distance_km,
+        )
+
+        return course.rescaled(distance_km) if distance_km else course
+
+    def _calculate_elevation_adjustments(
         self,
-        points: List,
+        course: CourseModel,
         distance_km: float,
-    ) -> float:
-        """Interpolate elevation at a given distance."""
-        if not points:
-            return 0.0
+        split_km: float = 1.0,
+    ) -> List[float]:
+        """
+        Calculate per-split pace adjustments from the course model.
 
-        # Find surrounding points
-        for i, point in enumerate(points):
-            if point.distance_km >= distance_km:
-                if i == 0:
-                    return point.elevation_m
-                prev_point = points[i - 1]
-                # Linear interpolation
-                ratio = (distance_km - prev_point.distance_km) / (
-                    point.distance_km - prev_point.distance_km
-                )
-                return prev_point.elevation_m + ratio * (
-                    point.elevation_m - prev_point.elevation_m
-                )
+        Args:
+            course: Course elevation model
+            distance_km: Total distance
+            split_km: Split length in km
 
-        # Beyond last point
-        return points[-1].elevation_m
+        Returns:
+            List of percentage adjustments per split
+        """
+        return course.split_adjustments(split_km, distance_km)
 
     def _recommend_strategy(
         self,
@@ -351,11 +418,11 @@ class RacePacingService:
         strategy: PacingStrategy,
         elevation_adjustments: List[float],
         weather_adjustment: Optional[WeatherAdjustment],
-        split_unit: str = "km",
+        split_km: float = 1.0,
     ) -> List[SplitTarget]:
         """Generate splits based on strategy and adjustments."""
         splits = []
-        num_splits = int(math.ceil(distance_km))
+        num_splits = max(1, math.ceil(distance_km / split_km - 1e-9))
         cumulative_time = 0.0
 
         # Get base pace (potentially weather-adjusted)
@@ -365,7 +432,7 @@ class RacePacingService:
 
         for i in range(num_splits):
             split_num = i + 1
-            split_distance = min(1.0, distance_km - i)  # Handle partial last split
+            split_distance = min(split_km, distance_km - i * split_km)  # Handle partial last split
 
             # Calculate pace modifiers based on strategy
             strategy_modifier = self._get_strategy_modifier(
@@ -389,7 +456,7 @@ class RacePacingService:
 
             splits.append(SplitTarget(
                 split_number=split_num,
-                distance_km=round(split_num * 1.0 if split_num < num_splits else distance_km, 3),
+                distance_km=round(split_num * split_km if split_num < num_splits else distance_km, 3),
                 target_pace_sec_km=round(target_pace, 1),
                 target_pace_formatted=format_pace(target_pace),
                 cumulative_time_sec=round(cumulative_time, 1),
@@ -374,6 +374,16 @@ class RunningEconomyService:
                 except (ValueError, TypeError):
                     continue
 
+        return self._summarize_economy_trend(economy_data, start_date, end_date, days)
+
+    def _summarize_economy_trend(
+        self,
+        economy_data: List[EconomyDataPoint],
+        start_date: date,
+        end_date: date,
+        days: int,
+    ) -> EconomyTrend:
+        """Build trend statistics from the economy data points of a period."""
         # Sort by date
         economy_data.sort(key=lambda x: x.date)
 
@@ -487,6 +497,33 @@ class RunningEconomyService:
                 except (ValueError, TypeError):
                     continue
 
+        zone_stats: Dict[PaceZone, Dict[str, Any]] = {}
+        for zone in PaceZone:
+            data = zone_data[zone]
+            if not data:
+                continue
+            paces = zone_paces[zone]
+            hrs = zone_hrs[zone]
+            zone_stats[zone] = {
+                "workout_count": len(data),
+                "avg_economy": sum(data) / len(data),
+                "best_economy": min(data),
+                "worst_economy": max(data),
+                "avg_pace": sum(paces) // len(paces),
+                "min_pace": min(paces),
+                "max_pace": max(paces),
+                "avg_hr": sum(hrs) // len(hrs),
+                "min_hr": min(hrs),
+                "max_hr": max(hrs),
+            }
+
+        return self._summarize_pace_zones(zone_stats)
+
+    def _summarize_pace_zones(
+        self,
+        zone_stats: Dict[PaceZone, Dict[str, Any]],
+    ) -> PaceZonesEconomy:
+        """Build the zone breakdown from per-zone economy, pace and HR statistics."""
         # Build zone economy list
         zones: List[ZoneEconomy] = []
         total_workouts = 0
@@ -502,45 +539,30 @@ class RunningEconomyService:
         }
 
         for zone in PaceZone:
-            data = zone_data[zone]
-            if not data:
+            stats = zone_stats.get(zone)
+            if not stats:
                 continue
 
-            avg_economy = sum(data) / len(data)
-            min_economy = min(data)
-            max_economy = max(data)
-
-            paces = zone_paces[zone]
-            hrs = zone_hrs[zone]
-
-            avg_pace = sum(paces) // len(paces) if paces else 0
-            avg_hr = sum(hrs) // len(hrs) if hrs else 0
+            min_economy = stats["best_economy"]
 
             # Pace and HR ranges
-            if paces:
-                pace_range = f"{format_pace(min(paces))} - {format_pace(max(paces))}"
-            else:
-                pace_range = ""
-
-            if hrs:
-                hr_range = f"{min(hrs)} - {max(hrs)} bpm"
-            else:
-                hr_range = ""
+            pace_range = f"{format_pace(stats['min_pace'])} - {format_pace(stats['max_pace'])}"
+            hr_range = f"{stats['min_hr']} - {stats['max_hr']} bpm"
 
             zones.append(ZoneEconomy(
                 pace_zone=zone,
                 zone_name=zone_names[zone],
-                avg_economy=round(avg_economy, 3),
+                avg_economy=round(stats["avg_economy"], 3),
                 best_economy=min_economy,
-                worst_economy=max_economy,
-                workout_count=len(data),
-                avg_pace_sec_per_km=avg_pace,
-                avg_hr=avg_hr,
+                worst_economy=stats["worst_economy"],
+                workout_count=stats["workout_count"],
+                avg_pace_sec_per_km=stats["avg_pace"],
+                avg_hr=stats["avg_hr"],
                 pace_range=pace_range,
                 hr_range=hr_range,
             ))
 
-            total_workouts += len(data)
+            total_workouts += stats["workout_count"]
 
             if min_economy < best_economy:
                 best_economy = min_economy
@@ -600,6 +622,16 @@ class RunningEconomyService:
                 except (ValueError, TypeError):
                     continue
 
+        return self._summarize_drift_trend(drift_data, concerning_count, start_date, end_date)
+
+    def _summarize_drift_trend(
+        self,
+        drift_data: List[Dict[str, Any]],
+        concerning_count: int,
+        start_date: date,
+        end_date: date,
+    ) -> CardiacDriftTrend:
+        """Build drift trend statistics from the drift data points of a period."""
         # Sort by date
         drift_data.sort(key=lambda x: x["date"])
 
@@ -683,6 +715,206 @@ class RunningEconomyService:
             message="No recent running workouts found with pace and HR data.",
         )
 
+    # =========================================================================
+    # Persisted Economy Index
+    # =========================================================================
+
+    @property
+    def zones_key(self) -> str:
+        """Identifies the pace thresholds stored pace zones were classified with."""
+        return f"{self._easy_pace}:{self._tempo_pace}:{self._threshold_pace}"
+
+    def _index_row(
+        self,
+        activity: Dict[str, Any],
+        time_series_data: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Compute the running_economy row for a workout (None if not a run)."""
+        if not self._is_running_workout(activity):
+            return None
+
+        metrics = self.calculate_economy(activity)
+        drift = self.detect_cardiac_drift(activity, time_series_data)
+
+        workout_date = activity.get("date", "")
+        if isinstance(workout_date, datetime):
+            workout_date = workout_date.date().isoformat()
+        elif isinstance(workout_date, date):
+            workout_date = workout_date.isoformat()
+        elif isinstance(workout_date, str) and "T" in workout_date:
+            workout_date = workout_date.split("T")[0]
+
+        return {
+            "activity_id": activity.get("id") or activity.get("activity_id", ""),
+            "date": workout_date,
+            "economy_ratio": metrics.economy_ratio if metrics else None,
+            "pace_sec_per_km": metrics.pace_sec_per_km if metrics else None,
+            "avg_hr": metrics.avg_hr if metrics else None,
+            "distance_km": metrics.distance_km if metrics else None,
+            "duration_min": metrics.duration_min if metrics else None,
+            "pace_zone": metrics.pace_zone.value if metrics and metrics.pace_zone else None,
+            "zones_key": self.zones_key,
+            "first_half_hr": drift.first_half_hr if drift else None,
+            "second_half_hr": drift.second_half_hr if drift else None,
+            "drift_percent": drift.drift_percent if drift else None,
+            "drift_severity": drift.severity.value if drift else None,
+        }
+
+    def record_workout(
+        self,
+        training_db: Any,
+        activity: Dict[str, Any],
+        time_series_data: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Store economy and cardiac drift for one workout at ingest.
+
+        Args:
+            training_db: TrainingDatabase holding the running_economy table
+            activity: Activity dictionary (as stored in activity_metrics)
+            time_series_data: Optional HR time series for drift
+        """
+        row = self._index_row(activity, time_series_data)
+        if row is None:
+            activity_id = activity.get("id") or activity.get("activity_id")
+            if activity_id:
+                training_db.delete_running_economy([activity_id])
+            return
+        training_db.save_running_economy([row])
+
+    def refresh_index(self, training_db: Any, start_date: date, end_date: date) -> int:
+        """
+        Bring the running_economy table up to date for a date range.
+
+        Computes runs that were never indexed or changed since they were
+        (activity_metrics triggers mark them stale), and reclassifies stored
+        pace zones if the pace thresholds changed.
+
+        Returns:
+            Number of workouts recomputed
+        """
+        pending = training_db.get_running_economy_pending(
+            start_date.isoformat(),
+            end_date.isoformat(),
+            sorted(RUNNING_ACTIVITY_TYPES),
+        )
+        rows, dropped = [], []
+        for activity in pending:
+            row = self._index_row(activity.to_dict())
+            if row is None:
+                dropped.append(activity.activity_id)
+            else:
+                rows.append(row)
+        if rows:
+            training_db.save_running_economy(rows)
+        if dropped:
+            training_db.delete_running_economy(dropped)
+
+        rezone = training_db.get_running_economy_other_zones(self.zones_key)
+        if rezone:
+            training_db.update_running_economy_zones(
+                [
+                    (
+                        row["activity_id"],
+                        classify_pace_zone(
+                            row["pace_sec_per_km"],
+                            self._easy_pace,
+                            self._tempo_pace,
+                            self._threshold_pace,
+                        ).value,
+                    )
+                    for row in rezone
+                ],
+                self.zones_key,
+            )
+        return len(pending)
+
+    def _indexed_range(self, training_db: Any, days: int) -> Tuple[date, date]:
+        end_date = date.today()
+        start_date = end_date - timedelta(days=days)
+        self.refresh_index(training_db, start_date, end_date)
+        return start_date, end_date
+
+    def get_indexed_economy_trend(self, training_db: Any, days: int = 90) -> EconomyTrend:
+        """Economy trend read from the running_economy table (see get_economy_trend)."""
+        start_date, end_date = self._indexed_range(training_db, days)
+        rows = training_db.get_running_economy_range(
+            start_date.isoformat(), end_date.isoformat()
+        )
+        economy_data = [
+            EconomyDataPoint(
+                date=row["date"],
+                economy_ratio=row["economy_ratio"],
+                pace_sec_per_km=row["pace_sec_per_km"],
+                avg_hr=row["avg_hr"],
+                workout_id=row["activity_id"],
+                pace_zone=row["pace_zone"],
+            )
+            for row in rows
+        ]
+        return self._summarize_economy_trend(economy_data, start_date, end_date, days)
+
+    def get_indexed_pace_specific_economy(
+        self,
+        training_db: Any,
+        days: int = 90,
+    ) -> PaceZonesEconomy:
+        """Zone breakdown aggregated in the running_economy table (see get_pace_specific_economy)."""
+        start_date, end_date = self._indexed_range(training_db, days)
+        rows = training_db.get_running_economy_by_zone(
+            start_date.isoformat(), end_date.isoformat()
+        )
+        return self._summarize_pace_zones(
+            {PaceZone(row["pace_zone"]): row for row in rows if row["pace_zone"]}
+        )
+
+    def get_indexed_cardiac_drift_trend(
+        self,
+        training_db: Any,
+        days: int = 90,
+    ) -> CardiacDriftTrend:
+        """Drift trend read from the running_economy table (see get_cardiac_drift_trend)."""
+        start_date, end_date = self._indexed_range(training_db, days)
+        rows = training_db.get_cardiac_drift_range(
+            start_date.isoformat(), end_date.isoformat()
+        )
+        concerning = {
+            CardiacDriftSeverity.CONCERNING.value,
+            CardiacDriftSeverity.SIGNIFICANT.value,
+        }
+        drift_data = [
+            {
+                "date": row["date"],
+                "drift_percent": row["drift_percent"],
+                "severity": row["drift_severity"],
+                "workout_id": row["activity_id"],
+            }
+            for row in rows
+        ]
+        concerning_count = sum(1 for row in rows if row["drift_severity"] in concerning)
+        return self._summarize_drift_trend(drift_data, concerning_count, start_date, end_date)
+
+    def get_indexed_current_economy(self, training_db: Any) -> EconomyCurrentResponse:
+        """Latest run's economy against the 365-day best (see get_current_economy)."""
+        start_date, end_date = self._indexed_range(training_db, 365)
+        rows = training_db.get_running_economy_range(
+            start_date.isoformat(), end_date.isoformat()
+        )
+        if rows:
+            best_economy = min(row["economy_ratio"] for row in rows)
+            # Newest date first, then activity id, as activities are listed
+            latest_date = rows[-1]["date"]
+            latest = next(row for row in rows if row["date"] == latest_date)
+            activity = training_db.get_activity_metrics(latest["activity_id"])
+            metrics = activity and self.calculate_economy(activity.to_dict(), best_economy)
+            if metrics:
+                return EconomyCurrentResponse(metrics=metrics, has_data=True)
+
+        return EconomyCurrentResponse(
+            has_data=False,
+            message="No recent running workouts found with pace and HR data.",
+        )
+
 
 # =============================================================================
 # Singleton Instance
@@ -4,16 +4,18 @@ Social Proof service for community engagement features.
 Provides aggregated statistics and percentile rankings to create
 a sense of community and social validation for users.
 
-For demo/development, uses simulated data that looks realistic.
-In production, this would use cached/aggregated data from the database.
+Percentile rankings come from the cohort distributions maintained by
+CohortDistributionRepository. Community activity counts are simulated.
 """
 
 import logging
 import random
 from datetime import datetime, date, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, ConfigDict
 
+from ..db.repositories.cohort_repository import CohortDistributionRepository
+
 logger = logging.getLogger(__name__)
 
 
@@ -88,6 +90,15 @@ class SocialProofStats(BaseModel):
     level_percentile: Optional[PercentileRanking] = Field(
         None, description="User's level percentile"
     )
+    ctl_percentile: Optional[PercentileRanking] = Field(
+        None, description="User's fitness (CTL) percentile"
+    )
+    volume_percentile: Optional[PercentileRanking] = Field(
+        None, description="User's weekly volume percentile"
+    )
+    vdot_percentile: Optional[PercentileRanking] = Field(
+        None, description="User's VDOT percentile"
+    )
 
     # Community activity feed
     recent_activity: List[CommunityActivity] = Field(
@@ -108,12 +119,28 @@ class SocialProofStats(BaseModel):
 # =============================================================================
 
 
+# Label template and unit for each ranked metric
+PERCENTILE_LABELS: Dict[str, Tuple[str, Optional[str]]] = {
+    "pace": ("faster than {pct}% of athletes", "min/km"),
+    "streak": ("longer streak than {pct}% of athletes", "days"),
+    "level": ("top {top}% by level", None),
+    "ctl": ("fitter than {pct}% of athletes", "CTL"),
+    "weekly_volume_km": ("more weekly volume than {pct}% of athletes", "km"),
+    "vdot": ("higher VDOT than {pct}% of athletes", None),
+}
+
+# Category names shown in rankings (defaults to the metric name)
+PERCENTILE_CATEGORIES: Dict[str, str] = {
+    "weekly_volume_km": "volume",
+}
+
+
 class SocialProofService:
     """
     Service for social proof and community engagement features.
 
-    For demo/development, generates realistic simulated data.
-    In production, would use cached aggregates from the database.
+    Community counts are simulated; percentile rankings are looked up in
+    the cohort distributions stored in the database.
     """
 
     def __init__(self, db_path: Optional[str] = None):
@@ -121,9 +148,11 @@ class SocialProofService:
         Initialize the social proof service.
 
         Args:
-            db_path: Path to SQLite database (for future production use)
+            db_path: Path to SQLite database holding the cohort distributions.
+                Without it, no percentile rankings are returned.
         """
         self.db_path = db_path
+        self._cohorts = CohortDistributionRepository(db_path) if db_path else None
         self._cache: Dict[str, Any] = {}
         self._cache_time: Optional[datetime] = None
         self._cache_ttl = timedelta(seconds=60)  # Cache for 60 seconds
@@ -133,31 +162,45 @@ class SocialProofService:
         user_level: Optional[int] = None,
         user_streak: Optional[int] = None,
         user_avg_pace: Optional[float] = None,
+        user_ctl: Optional[float] = None,
+        user_weekly_volume_km: Optional[float] = None,
+        user_vdot: Optional[float] = None,
+        user_age: Optional[int] = None,
     ) -> SocialProofStats:
         """
         Get social proof statistics.
 
         Uses cached/aggregated data for performance.
-        For demo purposes, generates realistic simulated data.
+        For demo purposes, community counts are simulated.
 
         Args:
             user_level: User's current level (for percentile calculation)
             user_streak: User's current streak (for percentile calculation)
             user_avg_pace: User's average pace in min/km (for percentile calculation)
+            user_ctl: User's current CTL (for percentile calculation)
+            user_weekly_volume_km: User's distance over the last 7 days
+            user_vdot: User's current VDOT (for percentile calculation)
+            user_age: User's age, to rank within their age group
 
         Returns:
             SocialProofStats with community data and optional percentiles
         """
         now = datetime.now()
+        user_values = {
+            "pace": user_avg_pace,
+            "streak": user_streak,
+            "level": user_level,
+            "ctl": user_ctl,
+            "weekly_volume_km": user_weekly_volume_km,
+            "vdot": user_vdot,
+        }
 
         # Check cache
         if self._cache_time and now - self._cache_time < self._cache_ttl:
             stats = self._cache.get("stats")
             if stats:
                 # Recalculate percentiles for this user
-                return self._add_user_percentiles(
-                    stats, user_level, user_streak, user_avg_pace
-                )
+                return self._add_user_percentiles(stats, user_values, user_age)
 
         # Generate base community stats (simulated for demo)
         base_stats = self._generate_community_stats()
@@ -167,9 +210,28 @@ class SocialProofService:
         self._cache_time = now
 
         # Add user-specific percentiles
-        return self._add_user_percentiles(
-            base_stats, user_level, user_streak, user_avg_pace
-        )
+        return self._add_user_percentiles(base_stats, user_values, user_age)
+
+    def record_user_values(
+        self,
+        user_id: str,
+        values: Dict[str, Optional[float]],
+        age: Optional[int] = None,
+    ) -> None:
+        """
+        Update a user's entries in the cohort distributions.
+
+        Args:
+            user_id: The user ID
+            values: Current value per metric (None values are skipped)
+            age: User's age in years, if known
+        """
+        if self._cohorts is None:
+            return
+        self._cohorts.set_age(user_id, age)
+        for metric, value in values.items():
+            if value is not None and value > 0:
+                self._cohorts.record_value(user_id, metric, value)
 
     def _generate_community_stats(self) -> SocialProofStats:
         """
@@ -238,100 +300,57 @@ class SocialProofService:
         ]
         return activities
 
+    def _rank(
+        self,
+        metric: str,
+        value: Optional[float],
+        age: Optional[int],
+    ) -> Optional[PercentileRanking]:
+        """Rank one of the user's values against its cohort."""
+        if self._cohorts is None or value is None or value <= 0:
+            return None
+
+        percentile = self._cohorts.percentile(metric, value, age=age)
+        if percentile is None:
+            return None
+
+        label, unit = PERCENTILE_LABELS[metric]
+        return PercentileRanking(
+            category=PERCENTILE_CATEGORIES.get(metric, metric),
+            percentile=percentile,
+            label=label.format(pct=percentile, top=100 - percentile),
+            value=float(value),
+            unit=unit,
+        )
+
     def _add_user_percentiles(
         self,
         stats: SocialProofStats,
-        user_level: Optional[int],
-        user_streak: Optional[int],
-        user_avg_pace: Optional[float],
+        user_values: Dict[str, Optional[float]],
+        user_age: Optional[int],
     ) -> SocialProofStats:
         """
         Add user-specific percentile rankings to stats.
 
-        For demo, calculates approximate percentiles.
-        In production, would use pre-computed percentile tables.
+        Each ranking reads one cohort histogram, so this stays cheap
+        regardless of how many athletes there are.
         """
-        percentiles: Dict[str, Optional[PercentileRanking]] = {
-            "pace_percentile": None,
-            "streak_percentile": None,
-            "level_percentile": None,
+        rankings = {
+            metric: self._rank(metric, value, user_age)
+            for metric, value in user_values.items()
         }
 
-        # Calculate pace percentile if user has pace data
-        if user_avg_pace is not None and user_avg_pace > 0:
-            # Pace: lower is better
-            # Assume distribution: 4:00 = 99th, 5:00 = 80th, 6:00 = 50th, 7:00 = 25th
-            if user_avg_pace <= 4.0:
-                pace_pct = random.randint(95, 99)
-            elif user_avg_pace <= 5.0:
-                pace_pct = random.randint(75, 90)
-            elif user_avg_pace <= 6.0:
-                pace_pct = random.randint(45, 65)
-            elif user_avg_pace <= 7.0:
-                pace_pct = random.randint(20, 40)
-            else:
-                pace_pct = random.randint(5, 25)
-
-            percentiles["pace_percentile"] = PercentileRanking(
-                category="pace",
-                percentile=pace_pct,
-                label=f"faster than {pace_pct}% of athletes",
-                value=user_avg_pace,
-                unit="min/km",
-            )
-
-        # Calculate streak percentile
-        if user_streak is not None and user_streak > 0:
-            # Streak distribution: 30+ = 95th, 14+ = 80th, 7+ = 60th, 3+ = 40th
-            if user_streak >= 30:
-                streak_pct = random.randint(92, 99)
-            elif user_streak >= 14:
-                streak_pct = random.randint(75, 88)
-            elif user_streak >= 7:
-                streak_pct = random.randint(55, 72)
-            elif user_streak >= 3:
-                streak_pct = random.randint(35, 52)
-            else:
-                streak_pct = random.randint(15, 35)
-
-            percentiles["streak_percentile"] = PercentileRanking(
-                category="streak",
-                percentile=streak_pct,
-                label=f"longer streak than {streak_pct}% of athletes",
-                value=float(user_streak),
-                unit="days",
-            )
-
-        # Calculate level percentile
-        if user_level is not None and user_level > 0:
-            # Level distribution: 20+ = 95th, 10+ = 70th, 5+ = 45th, 3+ = 25th
-            if user_level >= 20:
-                level_pct = random.randint(92, 99)
-            elif user_level >= 10:
-                level_pct = random.randint(65, 82)
-            elif user_level >= 5:
-                level_pct = random.randint(40, 58)
-            elif user_level >= 3:
-                level_pct = random.randint(20, 38)
-            else:
-                level_pct = random.randint(5, 20)
-
-            percentiles["level_percentile"] = PercentileRanking(
-                category="level",
-                percentile=level_pct,
-                label=f"top {100 - level_pct}% by level",
-                value=float(user_level),
-                unit=None,
-            )
-
         # Create new stats with percentiles
         return SocialProofStats(
             athletes_trained_today=stats.athletes_trained_today,
             workouts_completed_today=stats.workouts_completed_today,
             athletes_training_now=stats.athletes_training_now,
-            pace_percentile=percentiles["pace_percentile"],
-            streak_percentile=percentiles["streak_percentile"],
-            level_percentile=percentiles["level_percentile"],
+            pace_percentile=rankings.get("pace"),
+            streak_percentile=rankings.get("streak"),
+            level_percentile=rankings.get("level"),
+            ctl_percentile=rankings.get("ctl"),
+            volume_percentile=rankings.get("weekly_volume_km"),
+            vdot_percentile=rankings.get("vdot"),
             recent_activity=stats.recent_activity,
             generated_at=stats.generated_at,
             cache_ttl_seconds=stats.cache_ttl_seconds,
@@ -0,0 +1,557 @@
+"""Bulk Strava history import.
+
+Walks an athlete's full Strava history, downloads activity streams within
+the shared Strava rate budget, and stores the results in the same shape as
+Garmin data:
+- Activity summaries become ActivityMetrics rows (IDs prefixed "strava_")
+- Streams become the time series used by the activity details view
+
+Progress is checkpointed per activity in the strava_activity_sync table, so
+an import interrupted by a restart or an exhausted daily budget resumes
+where it stopped.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..db.database import ActivityMetrics, TrainingDatabase, UserProfile
+from ..db.repositories.strava_repository import StravaRepository
+from ..integrations.base import RateLimitError
+from ..integrations.strava import StravaActivity, StravaClient, StravaSport
+from ..metrics.load import calculate_hrss, calculate_trimp
+from ..metrics.power import calculate_normalized_power, calculate_variability_index
+from ..metrics.zones import calculate_hr_zones_karvonen, get_zone_for_hr
+from ..models.strava import SyncStatus
+from .running_economy_service import get_running_economy_service
+
+logger = logging.getLogger(__name__)
+
+
+# Local activity IDs of imported activities
+STRAVA_ACTIVITY_PREFIX = "strava_"
+
+# Strava's maximum page size for /athlete/activities
+IMPORT_PAGE_SIZE = 200
+
+# Streams needed to rebuild the activity time series
+IMPORT_STREAM_TYPES = [
+    "time", "heartrate", "velocity_smooth", "altitude", "cadence", "watts", "latlng",
+]
+
+# Same resolution Garmin activity details are requested with
+MAX_CHART_POINTS = 2000
+MAX_GPS_POINTS = 4000
+
+# Requests left untouched in each window for interactive Strava calls
+DEFAULT_REQUEST_RESERVE = 10
+
+SPORT_TYPE_MAP = {
+    StravaSport.RUN: "running",
+    StravaSport.VIRTUAL_RUN: "running",
+    StravaSport.RIDE: "cycling",
+    StravaSport.VIRTUAL_RIDE: "cycling",
+    StravaSport.SWIM: "swimming",
+    StravaSport.WALK: "walking",
+    StravaSport.HIKE: "hiking",
+    StravaSport.WEIGHT_TRAINING: "strength",
+}
+
+RUNNING_TYPES = {"running", "walking", "hiking"}
+
+
+@dataclass
+class StravaImportResult:
+    """Result of one import run."""
+    success: bool = True
+    activities_discovered: int = 0
+    streams_imported: int = 0
+    streams_failed: int = 0
+    pending: int = 0
+    history_complete: bool = False
+    resume_after: Optional[datetime] = None
+    error_message: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    @property
+    def duration_seconds(self) -> Optional[int]:
+        """Calculate import duration in seconds."""
+        if self.started_at and self.completed_at:
+            return int((self.completed_at - self.started_at).total_seconds())
+        return None
+
+
+def local_activity_id(strava_activity_id: int) -> str:
+    """Get the local activity ID for a Strava activity."""
+    return f"{STRAVA_ACTIVITY_PREFIX}{strava_activity_id}"
+
+
+def strava_activity_to_metrics(
+    activity: StravaActivity,
+    profile: Optional[UserProfile] = None,
+) -> ActivityMetrics:
+    """
+    Convert a Strava activity summary into ActivityMetrics.
+
+    Mirrors GarminSyncService._process_activity so imported activities feed
+    the fitness model exactly like Garmin ones.
+    """
+    activity_type = SPORT_TYPE_MAP.get(activity.sport_type, "other")
+    start = activity.start_date.astimezone(timezone.utc).replace(tzinfo=None)
+
+    duration_sec = activity.moving_time_sec or activity.elapsed_time_sec
+    duration_min = duration_sec / 60 if duration_sec else None
+    distance_km = activity.distance_m / 1000 if activity.distance_m else None
+    pace_sec_per_km = duration_sec / distance_km if distance_km and duration_sec else None
+    avg_speed_kmh = activity.average_speed_mps * 3.6 if activity.average_speed_mps else None
+    avg_hr = int(activity.average_heartrate) if activity.average_heartrate else None
+    max_hr = int(activity.max_heartrate) if activity.max_heartrate else None
+
+    hrss = None
+    trimp = None
+    if avg_hr and duration_min and profile and profile.max_hr and profile.rest_hr:
+        max_hr_for_calc = max_hr or profile.max_hr
+        if profile.threshold_hr:
+            hrss = calculate_hrss(
+                duration_min=duration_min,
+                avg_hr=avg_hr,
+                threshold_hr=profile.threshold_hr,
+                max_hr=max_hr_for_calc,
+                rest_hr=profile.rest_hr,
+            )
+        trimp = calculate_trimp(
+            duration_min=duration_min,
+            avg_hr=avg_hr,
+            rest_hr=profile.rest_hr,
+            max_hr=max_hr_for_calc,
+            gender=profile.gender or "male",
+        )
+
+    return ActivityMetrics(
+        activity_id=local_activity_id(activity.id),
+        date=start.strftime("%Y-%m-%d"),
+        start_time=start.strftime("%Y-%m-%dT%H:%M:%S"),
+        activity_type=activity_type,
+        activity_name=activity.name,
+        hrss=hrss,
+        trimp=trimp,
+        avg_hr=avg_hr,
+        max_hr=max_hr,
+        duration_min=duration_min,
+        distance_km=distance_km,
+        pace_sec_per_km=pace_sec_per_km,
+        zone1_pct=None,
+        zone2_pct=None,
+        zone3_pct=None,
+        zone4_pct=None,
+        zone5_pct=None,
+        sport_type=activity.sport_type.value,
+        avg_power=int(activity.average_watts) if activity.average_watts else None,
+        max_power=int(activity.max_watts) if activity.max_watts else None,
+        normalized_power=(
+            int(activity.weighted_average_watts) if activity.weighted_average_watts else None
+        ),
+        avg_speed_kmh=avg_speed_kmh,
+        elevation_gain_m=activity.total_elevation_gain_m,
+    )
+
+
+def _stream_data(streams: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Normalize key_by_type stream responses to {type: data}."""
+    data = {}
+    for key, value in (streams or {}).items():
+        if isinstance(value, dict):
+            data[key] = value.get("data") or []
+        elif isinstance(value, list):
+            data[key] = value
+    return data
+
+
+def _downsample(points: List[Any], max_points: int) -> List[Any]:
+    """Keep at most max_points evenly spaced points."""
+    if len(points) <= max_points:
+        return points
+    step = len(points) / max_points
+    return [points[int(i * step)] for i in range(max_points)]
+
+
+def strava_streams_to_time_series(
+    streams: Dict[str, Any],
+    is_running: bool,
+) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Dict[str, float]]]:
+    """
+    Convert Strava streams into the activity details time series.
+
+    The output matches the Garmin parser in the workouts routes: pace in
+    sec/km for running and speed in km/h otherwise, running cadence in
+    steps/min (Strava reports one foot, like Garmin), at most
+    MAX_CHART_POINTS points per series and MAX_GPS_POINTS GPS points.
+
+    Args:
+        streams: Streams response (key_by_type) from Strava
+        is_running: Whether the activity uses pace rather than speed
+
+    Returns:
+        (time_series, gps_coordinates)
+    """
+    data = _stream_data(streams)
+    times = data.get("time") or []
+
+    def at(key: str, i: int) -> Optional[float]:
+        values = data.get(key)
+        if values and i < len(values):
+            return values[i]
+        return None
+
+    time_series: Dict[str, List[Dict[str, Any]]] = {
+        "heart_rate": [],
+        "pace_or_speed": [],
+        "elevation": [],
+        "cadence": [],
+        "power": [],
+    }
+
+    for i, t in enumerate(times):
+        timestamp = int(t)
+
+        hr = at("heartrate", i)
+        if hr is not None and 30 < hr < 250:
+            time_series["heart_rate"].append({"timestamp": timestamp, "hr": int(hr)})
+
+        speed_ms = at("velocity_smooth", i)
+        if speed_ms is not None and speed_ms > 0:
+            value = round(1000 / speed_ms, 1) if is_running else round(speed_ms * 3.6, 2)
+            time_series["pace_or_speed"].append({"timestamp": timestamp, "value": value})
+
+        altitude = at("altitude", i)
+        if altitude is not None:
+            time_series["elevation"].append(
+                {"timestamp": timestamp, "elevation": round(float(altitude), 1)}
+            )
+
+        cadence = at("cadence", i)
+        if cadence is not None:
+            cadence = int(cadence) * 2 if is_running else int(cadence)
+            if cadence > 0:
+                time_series["cadence"].append({"timestamp": timestamp, "cadence": cadence})
+
+        watts = at("watts", i)
+        if watts is not None and watts > 0:
+            time_series["power"].append({"timestamp": timestamp, "power": int(watts)})
+
+    time_series = {
+        key: _downsample(points, MAX_CHART_POINTS) for key, points in time_series.items()
+    }
+
+    gps = [
+        {"lat": point[0], "lon": point[1]}
+        for point in data.get("latlng") or []
+        if point and len(point) == 2
+    ]
+
+    return time_series, _downsample(gps, MAX_GPS_POINTS)
+
+
+def enrich_metrics_from_streams(
+    metrics: ActivityMetrics,
+    streams: Dict[str, Any],
+    profile: Optional[UserProfile] = None,
+) -> ActivityMetrics:
+    """
+    Fill in stream-derived fields (HR zones, cadence, power) on ActivityMetrics.
+
+    Zone percentages are weighted by sample duration, since Strava records
+    samples at irregular intervals.
+    """
+    data = _stream_data(streams)
+    times = data.get("time") or []
+    heart_rates = data.get("heartrate") or []
+
+    if profile and profile.max_hr and profile.rest_hr and heart_rates and times:
+        zones = calculate_hr_zones_karvonen(profile.max_hr, profile.rest_hr)
+        zone_seconds = {1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0, 5: 0.0}
+        total = 0.0
+        for i in range(min(len(times), len(heart_rates)) - 1):
+            hr = heart_rates[i]
+            dt = times[i + 1] - times[i]
+            if hr is None or dt <= 0:
+                continue
+            zone = get_zone_for_hr(int(hr), zones)
+            total += dt
+            if zone in zone_seconds:
+                zone_seconds[zone] += dt
+        if total > 0:
+            metrics.zone1_pct = round(zone_seconds[1] / total * 100, 1)
+            metrics.zone2_pct = round(zone_seconds[2] / total * 100, 1)
+            metrics.zone3_pct = round(zone_seconds[3] / total * 100, 1)
+            metrics.zone4_pct = round(zone_seconds[4] / total * 100, 1)
+            metrics.zone5_pct = round(zone_seconds[5] / total * 100, 1)
+
+    cadences = [c for c in data.get("cadence") or [] if c]
+    if cadences and metrics.cadence is None:
+        avg_cadence = sum(cadences) / len(cadences)
+        is_running = (metrics.activity_type or "") in RUNNING_TYPES
+        metrics.cadence = int(avg_cadence * 2) if is_running else int(avg_cadence)
+
+    watts = [int(w or 0) for w in data.get("watts") or []]
+    if any(watts):
+        avg_power = sum(watts) / len(watts)
+        metrics.avg_power = metrics.avg_power or int(avg_power)
+        metrics.max_power = metrics.max_power or max(watts)
+        if metrics.normalized_power is None:
+            metrics.normalized_power = int(calculate_normalized_power(watts))
+        if metrics.normalized_power and avg_power > 0:
+            metrics.variability_index = calculate_variability_index(
+                metrics.normalized_power, avg_power
+            )
+
+    return metrics
+
+
+class StravaImportService:
+    """
+    Resumable importer for an athlete's full Strava history.
+
+    Each run:
+    1. Lists activities newer than the newest imported one, then keeps
+       walking backwards from the oldest imported one until the start of
+       the history is reached. Summaries are stored immediately and the
+       activities are checkpointed as pending.
+    2. Downloads streams for pending activities in batches sized to exactly
+       fit the remaining 15-minute/daily budget, keeping a small reserve for
+       interactive requests. When the budget is used up the run waits for
+       the next window, or stops (resumable) if that is further away than
+       max_wait_seconds.
+    """
+
+    def __init__(
+        self,
+        training_db: TrainingDatabase,
+        strava_repo: StravaRepository,
+        request_reserve: int = DEFAULT_REQUEST_RESERVE,
+        max_wait_seconds: float = 15 * 60,
+    ):
+        """Initialize the import service.
+
+        Args:
+            training_db: Database receiving ActivityMetrics.
+            strava_repo: Repository holding import checkpoints and streams.
+            request_reserve: Requests per window kept free for other calls.
+            max_wait_seconds: Longest wait for the rate budget before the
+                run stops and leaves the rest for the next run.
+        """
+        self.db = training_db
+        self.strava_repo = strava_repo
+        self.request_reserve = request_reserve
+        self.max_wait_seconds = max_wait_seconds
+
+    def _available_requests(self, client: StravaClient) -> int:
+        """Requests that can be sent now without touching the reserve."""
+        remaining_15min, remaining_daily = client.rate_budget.remaining()
+        return min(remaining_15min, remaining_daily) - self.request_reserve
+
+    async def _wait_for_budget(
+        self,
+        client: StravaClient,
+        result: StravaImportResult,
+    ) -> bool:
+        """
+        Wait until requests are available again.
+
+        Returns:
+            True if the run can continue, False if it should stop
+        """
+        budget = client.rate_budget
+        _, remaining_daily = budget.remaining()
+        wait = budget.seconds_until_reset(daily=remaining_daily <= self.request_reserve)
+
+        if wait > self.max_wait_seconds:
+            result.resume_after = datetime.now(timezone.utc) + timedelta(seconds=wait)
+            logger.info(f"Strava import paused until {result.resume_after.isoformat()}")
+            return False
+
+        logger.info(f"Strava import waiting {wait:.0f}s for the next rate limit window")
+        await asyncio.sleep(wait)
+        return True
+
+    def _store_summaries(
+        self,
+        activities: List[StravaActivity],
+        profile: Optional[UserProfile],
+    ) -> int:
+        """Store listed activities and checkpoint them as pending."""
+        for activity in activities:
+            self.db.save_activity_metrics(strava_activity_to_metrics(activity, profile))
+
+        return self.strava_repo.record_imported_activities([
+            (
+                local_activity_id(activity.id),
+                activity.id,
+                activity.start_date.astimezone(timezone.utc).isoformat(),
+            )
+            for activity in activities
+        ])
+
+    async def _list_pages(
+        self,
+        client: StravaClient,
+        profile: Optional[UserProfile],
+        result: StravaImportResult,
+        after: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Page through activities in a date range, storing each page.
+
+        Returns:
+            True if the range was exhausted, False if the run should stop
+        """
+        page = 1
+        while True:
+            if self._available_requests(client) <= 0:
+                if not await self._wait_for_budget(client, result):
+                    return False
+                continue
+
+            activities = await client.get_activities(
+                start_date=after,
+                end_date=before,
+                limit=IMPORT_PAGE_SIZE,
+                page=page,
+            )
+            result.activities_discovered += self._store_summaries(activities, profile)
+
+            if len(activities) < IMPORT_PAGE_SIZE:
+                return True
+            page += 1
+
+    async def _import_streams(
+        self,
+        client: StravaClient,
+        record,
+        profile: Optional[UserProfile],
+    ) -> bool:
+        """
+        Download, convert and store the streams of one activity.
+
+        Returns:
+            True if stored, False if the activity was marked failed
+
+        Raises:
+            RateLimitError: If the budget ran out; the activity stays pending
+        """
+        activity_id = record.local_activity_id
+        try:
+            return await self._store_streams(client, record, profile)
+        except RateLimitError:
+            raise
+        except Exception as e:
+            # Failed activities leave the pending queue so they cannot block it
+            logger.warning(f"Strava stream import failed for {activity_id}: {e}")
+            self.strava_repo.update_activity_sync_status(
+                activity_id, SyncStatus.FAILED, error_message=str(e)
+            )
+            return False
+
+    async def _store_streams(
+        self,
+        client: StravaClient,
+        record,
+        profile: Optional[UserProfile],
+    ) -> bool:
+        activity_id = record.local_activity_id
+        streams = await client.get_activity_streams(
+            record.strava_activity_id,
+            stream_types=IMPORT_STREAM_TYPES,
+        )
+
+        metrics = self.db.get_activity_metrics(activity_id)
+        is_running = metrics is not None and (metrics.activity_type or "") in RUNNING_TYPES
+
+        time_series, gps = strava_streams_to_time_series(streams, is_running)
+        self.strava_repo.save_activity_streams(activity_id, time_series, gps)
+
+        if metrics is not None:
+            metrics = enrich_metrics_from_streams(metrics, streams, profile)
+            self.db.save_activity_metrics(metrics)
+            # The HR stream is only at hand here, so drift is indexed now
+            try:
+                get_running_economy_service().record_workout(
+                    self.db, metrics.to_dict(), time_series["heart_rate"]
+                )
+            except Exception as e:
+                logger.warning(f"Failed to record running economy: {e}")
+
+        self.strava_repo.update_activity_sync_status(activity_id, SyncStatus.SYNCED)
+        return True
+
+    async def run(
+        self,
+        client: StravaClient,
+        max_activities: Optional[int] = None,
+    ) -> StravaImportResult:
+        """
+        Run (or resume) the import.
+
+        Args:
+            client: Authenticated Strava client
+            max_activities: Optional cap on stream downloads in this run
+
+        Returns:
+            StravaImportResult with progress counters
+        """
+        result = StravaImportResult(started_at=datetime.now())
+        profile = self.db.get_user_profile()
+
+        try:
+            # 1. Discover activities: new ones first, then older history
+            oldest, newest = self.strava_repo.get_import_bounds()
+            if newest:
+                if not await self._list_pages(
+                    client, profile, result, after=datetime.fromisoformat(newest)
+                ):
+                    return self._finish(result)
+            before = datetime.fromisoformat(oldest) if oldest else None
+            if not await self._list_pages(client, profile, result, before=before):
+                return self._finish(result)
+            result.history_complete = True
+
+            # 2. Download streams in batches that fit the remaining budget
+            while max_activities is None or result.streams_imported < max_activities:
+                available = self._available_requests(client)
+                if available <= 0:
+                    if not await self._wait_for_budget(client, result):
+                        break
+                    continue
+
+                if max_activities is not None:
+                    available = min(available, max_activities - result.streams_imported)
+                batch = self.strava_repo.get_pending_imports(limit=available)
+                if not batch:
+                    break
+
+                outcomes = await asyncio.gather(
+                    *(self._import_streams(client, record, profile) for record in batch),
+                    return_exceptions=True,
+                )
+                result.streams_imported += sum(1 for ok in outcomes if ok is True)
+                result.streams_failed += sum(1 for ok in outcomes if ok is False)
+                errors = [e for e in outcomes if isinstance(e, BaseException)]
+                if errors:
+                    raise errors[0]
+
+        except Exception as e:
+            logger.error(f"Strava import failed: {e}")
+            result.success = False
+            result.error_message = str(e)
+
+        return self._finish(result)
+
+    def _finish(self, result: StravaImportResult) -> StravaImportResult:
+        """Fill in final counters."""
+        result.pending = self.strava_repo.get_import_stats().get(SyncStatus.PENDING.value, 0)
+        result.completed_at = datetime.now()
+        return result
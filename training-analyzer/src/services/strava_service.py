@@ -17,7 +17,7 @@ from pydantic import BaseModel, Field
 
 from .base import BaseService, CacheProtocol
 from ..models.analysis import WorkoutAnalysisResult
-from ..integrations.strava import StravaClient
+from ..integrations.strava import StravaClient, StravaOAuthFlow
 from ..integrations.base import OAuthCredentials
 
 
@@ -349,21 +349,36 @@ class StravaService(BaseService):
             user_id: User ID for credentials lookup
 
         Returns:
-            Authenticated StravaClient or None if not connected
+            Authenticated StravaClient or None if not connected.
+            When client credentials are configured, the returned client
+            refreshes and persists the access token as needed.
         """
         credentials = await self._db.get_strava_credentials(user_id)
         if not credentials:
             self.logger.warning(f"No Strava credentials found for user {user_id}")
             return None
 
-        # Check if token needs refresh
-        if credentials.needs_refresh:
-            self.logger.info(f"Refreshing Strava token for user {user_id}")
-            # Token refresh would be handled by StravaOAuthFlow
-            # For now, we just log and return the client
-            # In production, integrate with OAuth flow for refresh
+        token_refresher = None
+        if self._config and self._config.strava_client_id and self._config.strava_client_secret:
+            oauth_flow = StravaOAuthFlow(
+                client_id=self._config.strava_client_id,
+                client_secret=self._config.strava_client_secret,
+                redirect_uri="",
+            )
+
+            async def token_refresher(current: OAuthCredentials) -> OAuthCredentials:
+                self.logger.info(f"Refreshing Strava token for user {user_id}")
+                refreshed = await oauth_flow.refresh_token(current)
+                await self._db.save_strava_credentials(refreshed, user_id)
+                return refreshed
+        elif credentials.needs_refresh:
+            self.logger.warning(
+                f"Strava token for user {user_id} needs refresh but no client credentials are configured"
+            )
 
-        return StravaClient(credentials)
+        # The client refreshes the token shortly before expiry (once per user
+        # across concurrent requests) and shares the process-wide Strava pool
+        return StravaClient(credentials, token_refresher=token_refresher)
 
     async def format_description(
         self,
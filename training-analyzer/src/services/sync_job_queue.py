@@ -0,0 +1,638 @@
+"""Durable queue for background Garmin syncs.
+
+Sync jobs and their progress live in SQLite instead of process memory:
+- A job is split into date-window chunks that complete independently, so
+  an interrupted job resumes at the first unfinished chunk.
+- Only one pending or running job exists per user and date range; a
+  duplicate request gets the existing job back.
+- A running job holds a lease that it renews as it makes progress and on
+  a timer while a chunk runs. Jobs whose lease expired (the process died
+  or was redeployed) are picked up again by resume_interrupted() at
+  startup.
+- Progress can be polled (get_job) or streamed (stream).
+
+Credentials needed to resume a job are stored encrypted with the job and
+cleared as soon as it finishes.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from ..db.database import TrainingDatabase
+from .encryption import CredentialEncryption, CredentialEncryptionError
+from .garmin_session_pool import is_auth_error
+
+logger = logging.getLogger(__name__)
+
+
+# Days of history fetched per work item
+SYNC_CHUNK_DAYS = 30
+
+# A running job whose heartbeat is older than this is considered abandoned
+JOB_LEASE = timedelta(minutes=5)
+
+# How often a running job renews its lease while a chunk makes no progress
+LEASE_RENEW_INTERVAL = JOB_LEASE / 5
+
+# Retries per chunk before the job fails (authentication errors fail at once)
+MAX_CHUNK_ATTEMPTS = 3
+
+# Finished jobs are kept this long for status lookups
+FINISHED_JOB_RETENTION = timedelta(days=7)
+
+# How often a stream re-reads the job when no local update arrives
+STREAM_POLL_SECONDS = 1.0
+
+
+class SyncJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class SyncChunk:
+    """One date window of a sync job."""
+    job_id: str
+    chunk_index: int
+    start_date: str
+    end_date: str
+    attempts: int = 0
+
+
+@dataclass
+class SyncJobRecord:
+    """Persisted state of a sync job."""
+    id: str
+    user_key: str
+    start_date: str
+    end_date: str
+    status: SyncJobStatus
+    progress_percent: int = 0
+    current_step: str = ""
+    activities_synced: int = 0
+    fitness_days_synced: int = 0
+    chunks_total: int = 0
+    chunks_done: int = 0
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (SyncJobStatus.COMPLETED, SyncJobStatus.FAILED)
+
+    def progress_key(self) -> Tuple[Any, ...]:
+        """Fields that change as the job makes progress."""
+        return (
+            self.status,
+            self.progress_percent,
+            self.current_step,
+            self.activities_synced,
+            self.fitness_days_synced,
+        )
+
+
+@dataclass
+class SyncCredentials:
+    """Garmin credentials for running a job."""
+    email: str
+    password: str = field(repr=False)
+
+
+# Reports (step description, fraction of the current chunk done)
+ProgressCallback = Callable[[str, float], None]
+
+# Runs one chunk in a worker thread and returns
+# (activities_synced, fitness_days_synced)
+ChunkRunner = Callable[
+    [SyncJobRecord, SyncChunk, SyncCredentials, ProgressCallback], Tuple[int, int]
+]
+
+
+def split_date_range(start: date, end: date, chunk_days: int) -> List[Tuple[str, str]]:
+    """Split an inclusive date range into windows, newest first."""
+    windows = []
+    window_end = end
+    while window_end >= start:
+        window_start = max(start, window_end - timedelta(days=chunk_days - 1))
+        windows.append((window_start.isoformat(), window_end.isoformat()))
+        window_end = window_start - timedelta(days=1)
+    return windows
+
+
+class SyncJobQueue:
+    """SQLite-backed queue of resumable sync jobs."""
+
+    def __init__(
+        self,
+        training_db: TrainingDatabase,
+        runner: ChunkRunner,
+        chunk_days: int = SYNC_CHUNK_DAYS,
+        encryption: Optional[CredentialEncryption] = None,
+        lease_renew_interval: timedelta = LEASE_RENEW_INTERVAL,
+    ):
+        """Initialize the queue.
+
+        Args:
+            training_db: Database holding the sync_jobs tables.
+            runner: Performs one chunk of work (called in a worker thread).
+            chunk_days: Days of history per chunk.
+            encryption: Encrypts stored credentials. Defaults to the
+                configured credential encryption key.
+            lease_renew_interval: How often a running job renews its lease
+                between progress reports.
+        """
+        self.db = training_db
+        self._runner = runner
+        self.chunk_days = chunk_days
+        self._encryption = encryption
+        self.lease_renew_interval = lease_renew_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        # Credentials for jobs started here, in case they could not be stored
+        self._credentials: Dict[str, SyncCredentials] = {}
+        self._events: Dict[str, asyncio.Event] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # Persistence helpers
+    # =========================================================================
+
+    def _get_encryption(self) -> CredentialEncryption:
+        """Get or create the encryption service."""
+        if self._encryption is None:
+            from ..config import get_settings
+            settings = get_settings()
+            self._encryption = CredentialEncryption(key=settings.credential_encryption_key)
+        return self._encryption
+
+    def _encrypt_credentials(self, credentials: SyncCredentials) -> Optional[str]:
+        try:
+            return self._get_encryption().encrypt(
+                json.dumps({"email": credentials.email, "password": credentials.password})
+            )
+        except CredentialEncryptionError as e:
+            logger.warning(f"Sync job credentials not stored, job cannot resume after restart: {e}")
+            return None
+
+    def _decrypt_credentials(self, encrypted: Optional[str]) -> Optional[SyncCredentials]:
+        if not encrypted:
+            return None
+        try:
+            data = json.loads(self._get_encryption().decrypt(encrypted))
+            return SyncCredentials(email=data["email"], password=data["password"])
+        except (CredentialEncryptionError, ValueError, KeyError) as e:
+            logger.warning(f"Could not decrypt sync job credentials: {e}")
+            return None
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> SyncJobRecord:
+        return SyncJobRecord(
+            id=row["id"],
+            user_key=row["user_key"],
+            start_date=row["start_date"],
+            end_date=row["end_date"],
+            status=SyncJobStatus(row["status"]),
+            progress_percent=row["progress_percent"] or 0,
+            current_step=row["current_step"] or "",
+            activities_synced=row["activities_synced"] or 0,
+            fitness_days_synced=row["fitness_days_synced"] or 0,
+            chunks_total=row["chunks_total"] or 0,
+            chunks_done=row["chunks_done"] or 0,
+            error=row["error"],
+            result=json.loads(row["result_json"]) if row["result_json"] else None,
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            completed_at=row["completed_at"],
+        )
+
+    def get_job(self, job_id: str) -> Optional[SyncJobRecord]:
+        """Get a job by ID."""
+        with self.db._get_connection() as conn:
+            row = conn.execute("SELECT * FROM sync_jobs WHERE id = ?", (job_id,)).fetchone()
+            return self._row_to_job(row) if row else None
+
+    def _active_job(
+        self, conn: sqlite3.Connection, user_key: str, start: str, end: str
+    ) -> Optional[SyncJobRecord]:
+        row = conn.execute(
+            """
+            SELECT * FROM sync_jobs
+            WHERE user_key = ? AND start_date = ? AND end_date = ?
+                AND status IN ('pending', 'running')
+            """,
+            (user_key, start, end),
+        ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def purge_finished(self, older_than: timedelta = FINISHED_JOB_RETENTION) -> int:
+        """Delete finished jobs (and their chunks) older than the retention."""
+        cutoff = (datetime.now() - older_than).isoformat()
+        with self.db._get_connection() as conn:
+            conn.execute(
+                """
+                DELETE FROM sync_job_chunks WHERE job_id IN (
+                    SELECT id FROM sync_jobs
+                    WHERE status IN ('completed', 'failed') AND completed_at < ?
+                )
+                """,
+                (cutoff,),
+            )
+            return conn.execute(
+                """
+                DELETE FROM sync_jobs
+                WHERE status IN ('completed', 'failed') AND completed_at < ?
+                """,
+                (cutoff,),
+            ).rowcount
+
+    # =========================================================================
+    # Enqueueing
+    # =========================================================================
+
+    def enqueue(
+        self,
+        user_key: str,
+        credentials: SyncCredentials,
+        start_date: date,
+        end_date: date,
+    ) -> Tuple[SyncJobRecord, bool]:
+        """
+        Create a sync job, or return the active one for the same range.
+
+        Args:
+            user_key: Owner of the job (user ID or Garmin email)
+            credentials: Garmin credentials to run the job with
+            start_date: First day to sync
+            end_date: Last day to sync
+
+        Returns:
+            (job, created) where created is False for a deduplicated request
+        """
+        start, end = start_date.isoformat(), end_date.isoformat()
+        windows = split_date_range(start_date, end_date, self.chunk_days)
+        encrypted = self._encrypt_credentials(credentials)
+        job_id = str(uuid.uuid4())
+
+        with self.db._get_connection() as conn:
+            existing = self._active_job(conn, user_key, start, end)
+            if existing:
+                return existing, False
+
+            try:
+                conn.execute(
+                    """
+                    INSERT INTO sync_jobs
+                        (id, user_key, start_date, end_date, status, current_step,
+                         chunks_total, encrypted_credentials, created_at)
+                    VALUES (?, ?, ?, ?, 'pending', 'Queued', ?, ?, ?)
+                    """,
+                    (job_id, user_key, start, end, len(windows), encrypted,
+                     datetime.now().isoformat()),
+                )
+            except sqlite3.IntegrityError:
+                # Another worker created the same job in the meantime
+                conn.rollback()
+                return self._active_job(conn, user_key, start, end), False
+
+            conn.executemany(
+                """
+                INSERT INTO sync_job_chunks (job_id, chunk_index, start_date, end_date)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(job_id, i, ws, we) for i, (ws, we) in enumerate(windows)],
+            )
+
+        self._credentials[job_id] = credentials
+        return self.get_job(job_id), True
+
+    # =========================================================================
+    # Running
+    # =========================================================================
+
+    def _claim(self, job_id: str) -> bool:
+        """Take the lease on a pending or abandoned job."""
+        now = datetime.now()
+        stale = (now - JOB_LEASE).isoformat()
+        with self.db._get_connection() as conn:
+            return conn.execute(
+                """
+                UPDATE sync_jobs
+                SET status = 'running', worker_id = ?, heartbeat_at = ?,
+                    started_at = COALESCE(started_at, ?)
+                WHERE id = ? AND (
+                    status = 'pending'
+                    OR (status = 'running' AND (worker_id = ? OR heartbeat_at IS NULL
+                                                OR heartbeat_at < ?))
+                )
+                """,
+                (self.worker_id, now.isoformat(), now.isoformat(), job_id,
+                 self.worker_id, stale),
+            ).rowcount == 1
+
+    def _pending_chunks(self, job_id: str) -> List[SyncChunk]:
+        with self.db._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT * FROM sync_job_chunks
+                WHERE job_id = ? AND status = 'pending'
+                ORDER BY chunk_index
+                """,
+                (job_id,),
+            ).fetchall()
+            return [
+                SyncChunk(
+                    job_id=row["job_id"],
+                    chunk_index=row["chunk_index"],
+                    start_date=row["start_date"],
+                    end_date=row["end_date"],
+                    attempts=row["attempts"] or 0,
+                )
+                for row in rows
+            ]
+
+    def _update_progress(self, job_id: str, step: str, percent: int) -> None:
+        with self.db._get_connection() as conn:
+            conn.execute(
+                """
+                UPDATE sync_jobs
+                SET current_step = ?, progress_percent = MAX(progress_percent, ?),
+                    heartbeat_at = ?
+                WHERE id = ? AND worker_id = ?
+                """,
+                (step, percent, datetime.now().isoformat(), job_id, self.worker_id),
+            )
+
+    def _renew_lease(self, job_id: str) -> None:
+        with self.db._get_connection() as conn:
+            conn.execute(
+                "UPDATE sync_jobs SET heartbeat_at = ? WHERE id = ? AND worker_id = ?",
+                (datetime.now().isoformat(), job_id, self.worker_id),
+            )
+
+    async def _hold_lease(self, job_id: str) -> None:
+        """Renew a job's lease until cancelled.
+
+        Parts of a chunk (such as the fitness data sync) report no
+        progress, so the lease cannot rely on progress callbacks alone.
+        """
+        while True:
+            await asyncio.sleep(self.lease_renew_interval.total_seconds())
+            try:
+                self._renew_lease(job_id)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not renew lease on sync job {job_id}: {e}")
+
+    def _complete_chunk(self, chunk: SyncChunk, activities: int, fitness_days: int) -> None:
+        now = datetime.now().isoformat()
+        with self.db._get_connection() as conn:
+            conn.execute(
+                """
+                UPDATE sync_job_chunks
+                SET status = 'completed', activities_synced = ?, fitness_days_synced = ?,
+                    error = NULL, completed_at = ?
+                WHERE job_id = ? AND chunk_index = ?
+                """,
+                (activities, fitness_days, now, chunk.job_id, chunk.chunk_index),
+            )
+            conn.execute(
+                """
+                UPDATE sync_jobs
+                SET chunks_done = chunks_done + 1,
+                    activities_synced = activities_synced + ?,
+                    fitness_days_synced = fitness_days_synced + ?,
+                    progress_percent = (chunks_done + 1) * 100 / MAX(chunks_total, 1),
+                    heartbeat_at = ?
+                WHERE id = ?
+                """,
+                (activities, fitness_days, now, chunk.job_id),
+            )
+
+    def _record_chunk_failure(self, chunk: SyncChunk, error: Exception) -> int:
+        with self.db._get_connection() as conn:
+            conn.execute(
+                """
+                UPDATE sync_job_chunks SET attempts = attempts + 1, error = ?
+                WHERE job_id = ? AND chunk_index = ?
+                """,
+                (str(error), chunk.job_id, chunk.chunk_index),
+            )
+        return chunk.attempts + 1
+
+    def _finish(self, job_id: str, status: SyncJobStatus, error: Optional[str] = None) -> None:
+        """Mark a job finished and drop its stored credentials."""
+        with self.db._get_connection() as conn:
+            row = conn.execute(
+                "SELECT activities_synced, fitness_days_synced FROM sync_jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+            result = None
+            if status == SyncJobStatus.COMPLETED and row:
+                result = {
+                    "synced_count": row["activities_synced"],
+                    "fitness_days": row["fitness_days_synced"],
+                }
+            conn.execute(
+                """
+                UPDATE sync_jobs
+                SET status = ?, error = ?, result_json = ?, completed_at = ?,
+                    current_step = ?, progress_percent = CASE WHEN ? THEN 100
+                        ELSE progress_percent END,
+                    encrypted_credentials = NULL, worker_id = NULL
+                WHERE id = ?
+                """,
+                (
+                    status.value,
+                    error,
+                    json.dumps(result) if result else None,
+                    datetime.now().isoformat(),
+                    "Sync complete!" if status == SyncJobStatus.COMPLETED else "Sync failed",
+                    status == SyncJobStatus.COMPLETED,
+                    job_id,
+                ),
+            )
+        self._credentials.pop(job_id, None)
+
+    def _load_credentials(self, job_id: str) -> Optional[SyncCredentials]:
+        if job_id in self._credentials:
+            return self._credentials[job_id]
+        with self.db._get_connection() as conn:
+            row = conn.execute(
+                "SELECT encrypted_credentials FROM sync_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._decrypt_credentials(row["encrypted_credentials"] if row else None)
+
+    async def run_job(self, job_id: str) -> Optional[SyncJobRecord]:
+        """
+        Run a job's remaining chunks.
+
+        Returns immediately if another worker holds the job's lease.
+
+        Returns:
+            The job's final state, or None if it could not be claimed
+        """
+        if not self._claim(job_id):
+            return None
+
+        loop = asyncio.get_running_loop()
+        self._notify(job_id)
+
+        credentials = self._load_credentials(job_id)
+        if credentials is None:
+            self._finish(
+                job_id,
+                SyncJobStatus.FAILED,
+                "Sync was interrupted and its credentials were not retained. "
+                "Please start the sync again.",
+            )
+            self._notify(job_id)
+            return self.get_job(job_id)
+
+        job = self.get_job(job_id)
+        lease = asyncio.create_task(self._hold_lease(job_id))
+        try:
+            for chunk in self._pending_chunks(job_id):
+                share = 100 / max(job.chunks_total, 1)
+                base = chunk.chunk_index * share
+
+                def progress(step: str, fraction: float, base=base, share=share) -> None:
+                    self._update_progress(job_id, step, int(base + share * min(max(fraction, 0.0), 1.0)))
+                    loop.call_soon_threadsafe(self._notify, job_id)
+
+                while True:
+                    try:
+                        activities, fitness_days = await asyncio.to_thread(
+                            self._runner, job, chunk, credentials, progress
+                        )
+                        self._complete_chunk(chunk, activities, fitness_days)
+                        self._notify(job_id)
+                        break
+                    except Exception as e:
+                        attempts = self._record_chunk_failure(chunk, e)
+                        chunk.attempts = attempts
+                        if is_auth_error(e) or attempts >= MAX_CHUNK_ATTEMPTS:
+                            logger.error(f"Sync job {job_id} failed on {chunk.start_date}..{chunk.end_date}: {e}")
+                            error = "Invalid Garmin Connect credentials" if is_auth_error(e) else str(e)
+                            self._finish(job_id, SyncJobStatus.FAILED, error)
+                            self._notify(job_id)
+                            return self.get_job(job_id)
+                        logger.warning(f"Sync job {job_id} chunk {chunk.chunk_index} failed, retrying: {e}")
+        finally:
+            lease.cancel()
+
+        self._finish(job_id, SyncJobStatus.COMPLETED)
+        self._notify(job_id)
+        return self.get_job(job_id)
+
+    def start(self, job_id: str) -> asyncio.Task:
+        """Run a job in the background on the current event loop."""
+        task = asyncio.create_task(self.run_job(job_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def resume_interrupted(self) -> List[str]:
+        """
+        Restart pending jobs and jobs whose worker stopped renewing its lease.
+
+        Must be called from a running event loop (e.g. application startup).
+
+        Returns:
+            IDs of the jobs that were restarted
+        """
+        stale = (datetime.now() - JOB_LEASE).isoformat()
+        with self.db._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id FROM sync_jobs
+                WHERE status = 'pending'
+                    OR (status = 'running' AND (heartbeat_at IS NULL OR heartbeat_at < ?))
+                ORDER BY created_at
+                """,
+                (stale,),
+            ).fetchall()
+
+        job_ids = [row["id"] for row in rows]
+        for job_id in job_ids:
+            logger.info(f"Resuming sync job {job_id}")
+            self.start(job_id)
+        return job_ids
+
+    # =========================================================================
+    # Progress streaming
+    # =========================================================================
+
+    def _notify(self, job_id: str) -> None:
+        """Wake up streams following a job (call on the event loop)."""
+        event = self._events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    async def _wait_for_update(self, job_id: str, timeout: float) -> None:
+        event = self._events.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def stream(
+        self,
+        job_id: str,
+        poll_interval: float = STREAM_POLL_SECONDS,
+    ) -> AsyncIterator[SyncJobRecord]:
+        """
+        Yield a job's state each time it changes, until it finishes.
+
+        Updates made in this process are delivered immediately; updates
+        from other workers are picked up by re-reading the job every
+        poll_interval seconds.
+        """
+        last_key = None
+        while True:
+            job = self.get_job(job_id)
+            if job is None:
+                return
+            if job.progress_key() != last_key:
+                last_key = job.progress_key()
+                yield job
+            if job.is_finished:
+                return
+            await self._wait_for_update(job_id, poll_interval)
+
+
+_sync_job_queue: Optional[SyncJobQueue] = None
+_sync_job_queue_lock = threading.Lock()
+
+
+def get_sync_job_queue(
+    training_db: TrainingDatabase,
+    runner: ChunkRunner,
+) -> SyncJobQueue:
+    """Get the process-wide sync job queue."""
+    global _sync_job_queue
+    with _sync_job_queue_lock:
+        if _sync_job_queue is None:
+            _sync_job_queue = SyncJobQueue(training_db, runner)
+        return _sync_job_queue
+
+
+def reset_sync_job_queue() -> None:
+    """Reset the sync job queue singleton (for testing)."""
+    global _sync_job_queue
+    with _sync_job_queue_lock:
+        _sync_job_queue = None
@@ -15,9 +15,10 @@ Pattern detection includes:
 - Weekly distance and load averages
 """
 
+import json
 import sqlite3
 import statistics
-from collections import Counter
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from pathlib import Path
@@ -25,6 +26,7 @@ from typing import Dict, List, Optional, Tuple, Union
 from contextlib import contextmanager
 
 from ..db.database import TrainingDatabase, get_default_db_path
+from ..db.schema import SCHEMA
 
 
 @dataclass
@@ -91,6 +93,107 @@ class TrainingPatterns:
         return None
 
 
+@dataclass
+class TrainingPatternProfile:
+    """
+    Aggregates behind TrainingPatterns for the sliding analysis window.
+
+    Built from per-day rows in training_pattern_days, which are kept up
+    to date as activities are ingested or deleted, so reading the profile
+    does not touch activity_metrics.
+    """
+
+    window_start: date
+    window_end: date
+
+    # Dates (YYYY-MM-DD) with at least one activity, most recent first
+    active_dates: List[str] = field(default_factory=list)
+
+    # Active days per weekday (0=Monday)
+    weekday_histogram: Dict[int, int] = field(default_factory=dict)
+
+    # Long runs per weekday, and the latest long-run date for each weekday
+    long_run_weekdays: Dict[int, int] = field(default_factory=dict)
+    last_long_run: Dict[int, str] = field(default_factory=dict)
+
+    # Sessions started per time-of-day bucket
+    time_of_day: Dict[str, int] = field(
+        default_factory=lambda: {"morning": 0, "afternoon": 0, "evening": 0}
+    )
+
+    # Session durations in minutes (> 0)
+    durations: List[float] = field(default_factory=list)
+
+    # Session counts per (sport_type, activity_type), lowercased
+    sport_mix: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
+    # Weekly rollups keyed by the Monday of each week
+    weekly_distance_km: Dict[str, float] = field(default_factory=dict)
+    weekly_load: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def weeks(self) -> float:
+        """Length of the window in weeks."""
+        return max(1, ((self.window_end - self.window_start).days + 1) / 7)
+
+    def avg_days_per_week(self) -> float:
+        return len(self.active_dates) / self.weeks
+
+    def long_run_day(self) -> Optional[int]:
+        """Most common long-run weekday (ties go to the most recent)."""
+        if not self.long_run_weekdays:
+            return None
+        return max(
+            self.long_run_weekdays,
+            key=lambda d: (self.long_run_weekdays[d], self.last_long_run[d]),
+        )
+
+    def rest_days(self, threshold_pct: float) -> List[int]:
+        """Weekdays without activity in at least threshold_pct of active weeks."""
+        active_by_week: Dict[date, set] = defaultdict(set)
+        for day_str in self.active_dates:
+            try:
+                day = datetime.strptime(day_str, "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            active_by_week[day - timedelta(days=day.weekday())].add(day.weekday())
+
+        if not active_by_week:
+            return list(range(7))
+
+        threshold = threshold_pct / 100 * len(active_by_week)
+        return [
+            d for d in range(7)
+            if sum(d not in days for days in active_by_week.values()) >= threshold
+        ]
+
+    def max_session_duration(self) -> int:
+        """90th percentile session duration in minutes (60 if unknown)."""
+        if not self.durations:
+            return 60
+        durations = sorted(self.durations)
+        return int(durations[min(int(len(durations) * 0.9), len(durations) - 1)])
+
+    def has_sport(self, keywords: List[str]) -> bool:
+        """Whether any session's sport or activity type contains a keyword."""
+        return any(
+            keyword in sport or keyword in activity
+            for sport, activity in self.sport_mix
+            for keyword in keywords
+        )
+
+    def preferred_time_of_day(self) -> str:
+        if sum(self.time_of_day.values()) == 0:
+            return "morning"
+        return max(self.time_of_day, key=self.time_of_day.get)
+
+    def avg_weekly_distance_km(self) -> float:
+        return sum(self.weekly_distance_km.values()) / self.weeks
+
+    def avg_weekly_load(self) -> float:
+        return sum(self.weekly_load.values()) / self.weeks
+
+
 class TrainingPatternService:
     """
     Service for detecting training patterns from workout history.
@@ -155,6 +258,7 @@ class TrainingPatternService:
         else:
             self._db_path = Path(db_path) if db_path else get_default_db_path()
             self._training_db = None
+        self._schema_ready = training_db is not None
 
     @contextmanager
     def _get_connection(self):
@@ -169,6 +273,10 @@ class TrainingPatternService:
             conn.row_factory = sqlite3.Row
             try:
                 yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
             finally:
                 conn.close()
 
@@ -177,7 +285,8 @@ class TrainingPatternService:
         Detect all training patterns from workout history.
 
         This is the main entry point for the AI agent to get athlete patterns.
-        All patterns are detected from the last 8 weeks of activity data.
+        All patterns are derived from the last 8 weeks of activity data, read
+        from the incrementally maintained pattern profile.
 
         Args:
             user_id: Optional user ID for multi-tenant filtering (future use)
@@ -185,13 +294,9 @@ class TrainingPatternService:
         Returns:
             TrainingPatterns dataclass with all detected patterns
         """
-        end_date = date.today()
-        start_date = end_date - timedelta(weeks=self.WEEKS_TO_ANALYZE)
+        profile = self.get_profile()
 
-        # Fetch activities for the analysis window
-        activities = self._fetch_activities(start_date, end_date)
-
-        if not activities:
+        if not profile.active_dates:
             # Return defaults if no activities
             return TrainingPatterns(
                 avg_days_per_week=0.0,
@@ -205,29 +310,268 @@ class TrainingPatternService:
                 avg_weekly_load=0.0,
             )
 
-        # Detect each pattern
-        avg_days = self._detect_avg_days_per_week(activities, start_date, end_date)
-        long_run_day = self._detect_long_run_day(activities)
-        rest_days = self._detect_rest_days(activities, start_date, end_date)
-        max_duration = self._detect_max_session_duration(activities)
-        does_strength = self._detect_strength_training(activities)
-        does_cross = self._detect_cross_training(activities)
-        time_pref = self._detect_preferred_time(activities)
-        weekly_distance = self._detect_avg_weekly_distance(activities, start_date, end_date)
-        weekly_load = self._detect_avg_weekly_load(activities, start_date, end_date)
-
         return TrainingPatterns(
-            avg_days_per_week=avg_days,
-            typical_long_run_day=long_run_day,
-            typical_rest_days=rest_days,
-            max_session_duration_min=max_duration,
-            does_strength=does_strength,
-            does_cross_training=does_cross,
-            preferred_time_of_day=time_pref,
-            avg_weekly_distance_km=weekly_distance,
-            avg_weekly_load=weekly_load,
+            avg_days_per_week=profile.avg_days_per_week(),
+            typical_long_run_day=profile.long_run_day(),
+            typical_rest_days=profile.rest_days(self.REST_DAY_THRESHOLD_PCT),
+            max_session_duration_min=profile.max_session_duration(),
+            does_strength=profile.has_sport(self.STRENGTH_SPORT_TYPES),
+            does_cross_training=profile.has_sport(self.CROSS_TRAINING_SPORT_TYPES),
+            preferred_time_of_day=profile.preferred_time_of_day(),
+            avg_weekly_distance_km=profile.avg_weekly_distance_km(),
+            avg_weekly_load=profile.avg_weekly_load(),
+        )
+
+    # === Pattern Profile ===
+
+    def get_profile(self) -> TrainingPatternProfile:
+        """
+        Get the pattern profile for the last 8 weeks.
+
+        Days whose activities changed since the last read are recomputed
+        and days that left the window are evicted; everything else is read
+        as stored. The first call builds the window from history.
+
+        Returns:
+            TrainingPatternProfile for the current window
+        """
+        end_date = date.today()
+        start_date = end_date - timedelta(weeks=self.WEEKS_TO_ANALYZE)
+        self._ensure_schema()
+
+        with self._get_connection() as conn:
+            # Evict first: the write also holds off other writers until the
+            # stale days below are recomputed and committed
+            conn.execute(
+                "DELETE FROM training_pattern_days WHERE date < ?",
+                (start_date.isoformat(),),
+            )
+            built = conn.execute(
+                "SELECT 1 FROM training_pattern_profile WHERE id = 1"
+            ).fetchone()
+            if built is None:
+                self._build_days(conn, start_date)
+            else:
+                stale = [
+                    row["date"] for row in conn.execute(
+                        "SELECT date FROM training_pattern_days WHERE stale = 1 AND date <= ?",
+                        (end_date.isoformat(),),
+                    )
+                ]
+                if stale:
+                    self._refresh_days(conn, stale)
+
+            rows = conn.execute(
+                """
+                SELECT * FROM training_pattern_days
+                WHERE date >= ? AND date <= ? AND stale = 0
+                ORDER BY date DESC
+                """,
+                (start_date.isoformat(), end_date.isoformat()),
+            ).fetchall()
+
+        return self._profile_from_rows(rows, start_date, end_date)
+
+    def rebuild_profile(self) -> TrainingPatternProfile:
+        """
+        Rebuild the pattern profile from activity history.
+
+        Returns:
+            The rebuilt TrainingPatternProfile
+        """
+        start_date = date.today() - timedelta(weeks=self.WEEKS_TO_ANALYZE)
+        self._ensure_schema()
+        with self._get_connection() as conn:
+            self._build_days(conn, start_date)
+        return self.get_profile()
+
+    def _ensure_schema(self) -> None:
+        """Create the profile tables on databases not opened via TrainingDatabase."""
+        if not self._schema_ready:
+            with self._get_connection() as conn:
+                conn.executescript(SCHEMA)
+            self._schema_ready = True
+
+    def _build_days(self, conn: sqlite3.Connection, start_date: date) -> None:
+        """Replace all per-day rows with aggregates of activities since start_date."""
+        activities = conn.execute(
+            f"SELECT {self._ACTIVITY_COLUMNS} FROM activity_metrics WHERE date >= ?",
+            (start_date.isoformat(),),
+        ).fetchall()
+        conn.execute("DELETE FROM training_pattern_days")
+        self._save_days(conn, self._aggregate_days(dict(row) for row in activities))
+        conn.execute(
+            "INSERT OR REPLACE INTO training_pattern_profile (id, built_at) "
+            "VALUES (1, CURRENT_TIMESTAMP)"
+        )
+
+    def _refresh_days(self, conn: sqlite3.Connection, dates: List[str]) -> None:
+        """Recompute the given days from their activities."""
+        activities = []
+        for i in range(0, len(dates), 500):
+            chunk = dates[i:i + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            activities.extend(
+                dict(row) for row in conn.execute(
+                    f"SELECT {self._ACTIVITY_COLUMNS} FROM activity_metrics "
+                    f"WHERE date IN ({placeholders})",
+                    chunk,
+                )
+            )
+        days = self._aggregate_days(activities)
+        # Days whose last activity was deleted
+        conn.executemany(
+            "DELETE FROM training_pattern_days WHERE date = ?",
+            [(d,) for d in dates if d not in days],
+        )
+        self._save_days(conn, days)
+
+    @staticmethod
+    def _save_days(conn: sqlite3.Connection, days: Dict[str, Dict]) -> None:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO training_pattern_days
+            (date, activity_count, long_run_count, durations, time_of_day,
+             sport_mix, run_distance_km, load, stale)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+            """,
+            [
+                (
+                    day,
+                    agg["activity_count"],
+                    agg["long_run_count"],
+                    json.dumps(agg["durations"]),
+                    json.dumps(agg["time_of_day"]),
+                    json.dumps([[*pair, n] for pair, n in agg["sport_mix"].items()]),
+                    agg["run_distance_km"],
+                    agg["load"],
+                )
+                for day, agg in days.items()
+            ],
         )
 
+    def _aggregate_days(self, activities) -> Dict[str, Dict]:
+        """Fold activities into per-day aggregates, using the detectors' rules."""
+        days: Dict[str, Dict] = {}
+        for activity in activities:
+            day = activity.get("date")
+            if not day:
+                continue
+            agg = days.setdefault(day, {
+                "activity_count": 0,
+                "long_run_count": 0,
+                "durations": [],
+                "time_of_day": {bucket: 0 for bucket in self.TIME_BUCKETS},
+                "sport_mix": Counter(),
+                "run_distance_km": 0.0,
+                "load": 0.0,
+            })
+            agg["activity_count"] += 1
+            if self._is_long_run(activity):
+                agg["long_run_count"] += 1
+            duration = activity.get("duration_min")
+            if duration and duration > 0:
+                agg["durations"].append(float(duration))
+            bucket = self._time_bucket(activity.get("start_time"))
+            if bucket:
+                agg["time_of_day"][bucket] += 1
+            sport, kind = self._sport_pair(activity)
+            agg["sport_mix"][(sport, kind)] += 1
+            if "run" in sport or "run" in kind:
+                agg["run_distance_km"] += float(activity.get("distance_km") or 0)
+            agg["load"] += self._activity_load(activity)
+        return days
+
+    def _profile_from_rows(
+        self,
+        rows: List[sqlite3.Row],
+        start_date: date,
+        end_date: date,
+    ) -> TrainingPatternProfile:
+        """Combine per-day rows (most recent first) into a profile."""
+        profile = TrainingPatternProfile(window_start=start_date, window_end=end_date)
+        weekday_histogram: Counter = Counter()
+        long_runs: Counter = Counter()
+        sport_mix: Counter = Counter()
+        weekly_distance: Dict[str, float] = defaultdict(float)
+        weekly_load: Dict[str, float] = defaultdict(float)
+
+        for row in rows:
+            day_str = row["date"]
+            profile.active_dates.append(day_str)
+            profile.durations.extend(json.loads(row["durations"] or "[]"))
+            for bucket, count in json.loads(row["time_of_day"] or "{}").items():
+                profile.time_of_day[bucket] = profile.time_of_day.get(bucket, 0) + count
+            for sport, kind, count in json.loads(row["sport_mix"] or "[]"):
+                sport_mix[(sport, kind)] += count
+
+            try:
+                day = datetime.strptime(day_str, "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            week = (day - timedelta(days=day.weekday())).isoformat()
+            weekday_histogram[day.weekday()] += 1
+            weekly_distance[week] += row["run_distance_km"] or 0.0
+            weekly_load[week] += row["load"] or 0.0
+            if row["long_run_count"]:
+                long_runs[day.weekday()] += row["long_run_count"]
+                profile.last_long_run.setdefault(day.weekday(), day_str)
+
+        profile.weekday_histogram = dict(weekday_histogram)
+        profile.long_run_weekdays = dict(long_runs)
+        profile.sport_mix = dict(sport_mix)
+        profile.weekly_distance_km = dict(weekly_distance)
+        profile.weekly_load = dict(weekly_load)
+        return profile
+
+    # === Per-activity rules shared by the detectors and the profile ===
+
+    _ACTIVITY_COLUMNS = (
+        "activity_id, date, start_time, sport_type, activity_type, "
+        "duration_min, distance_km, hrss, trimp"
+    )
+
+    def _is_long_run(self, activity: Dict) -> bool:
+        distance_km = activity.get("distance_km") or 0
+        duration_min = activity.get("duration_min") or 0
+        return (
+            distance_km >= self.LONG_RUN_MIN_DISTANCE_KM or
+            duration_min >= self.LONG_RUN_MIN_DURATION_MIN
+        )
+
+    def _time_bucket(self, start_time) -> Optional[str]:
+        """Time-of-day bucket of a start time, or None if outside all buckets."""
+        if not start_time:
+            return None
+        try:
+            # Handle formats like "2024-01-15T07:30:00" or "07:30:00"
+            if isinstance(start_time, str):
+                time_part = start_time.split("T")[1] if "T" in start_time else start_time
+                hour = int(time_part.split(":")[0])
+            else:
+                hour = start_time.hour if hasattr(start_time, "hour") else 12
+        except (ValueError, AttributeError, IndexError):
+            return None
+
+        for bucket, (start_hour, end_hour) in self.TIME_BUCKETS.items():
+            if start_hour <= hour < end_hour:
+                return bucket
+        return None
+
+    @staticmethod
+    def _sport_pair(activity: Dict) -> Tuple[str, str]:
+        return (
+            (activity.get("sport_type") or "").lower(),
+            (activity.get("activity_type") or "").lower(),
+        )
+
+    @staticmethod
+    def _activity_load(activity: Dict) -> float:
+        """HRSS if available, else TRIMP."""
+        hrss = activity.get("hrss") or 0
+        trimp = activity.get("trimp") or 0
+        return float(hrss) if hrss > 0 else float(trimp)
+
     def _fetch_activities(
         self,
         start_date: date,
@@ -625,6 +969,9 @@ class TrainingPatternService:
         Returns:
             Average training days per week
         """
+        if weeks == self.WEEKS_TO_ANALYZE:
+            return self.get_profile().avg_days_per_week()
+
         end_date = date.today()
         start_date = end_date - timedelta(weeks=weeks)
         activities = self._fetch_activities(start_date, end_date)
@@ -637,10 +984,7 @@ class TrainingPatternService:
         Returns:
             Tuple of (day_index, day_name) or None if no pattern detected
         """
-        end_date = date.today()
-        start_date = end_date - timedelta(weeks=self.WEEKS_TO_ANALYZE)
-        activities = self._fetch_activities(start_date, end_date)
-        day_idx = self._detect_long_run_day(activities)
+        day_idx = self.get_profile().long_run_day()
 
         if day_idx is None:
             return None
@@ -656,16 +1000,9 @@ class TrainingPatternService:
         Returns:
             List of unique cross-training sport types
         """
-        end_date = date.today()
-        start_date = end_date - timedelta(weeks=self.WEEKS_TO_ANALYZE)
-        activities = self._fetch_activities(start_date, end_date)
-
         cross_training_types = set()
 
-        for activity in activities:
-            sport_type = (activity.get("sport_type") or "").lower()
-            activity_type = (activity.get("activity_type") or "").lower()
-
+        for sport_type, activity_type in self.get_profile().sport_mix:
             for keyword in self.CROSS_TRAINING_SPORT_TYPES:
                 if keyword in sport_type:
                     cross_training_types.add(sport_type)
@@ -0,0 +1,376 @@
+"""
+Weekly Rollup Service for persisted ISO-week training totals.
+
+Weekly reports, multi-week comparisons and year-in-review views all need
+the same per-week numbers: volume, load, zone minutes, session counts and
+the longest session. They are kept in the weekly_rollups table, one row
+per user, ISO week and sport:
+
+- Triggers on activity_metrics mark the affected week stale whenever an
+  activity is added, edited or removed.
+- Reads recompute only the stale weeks (one indexed date-range query per
+  week), then answer from the table, so a 52-week summary is a single
+  primary-key range scan.
+- The first read builds the rollup from existing history.
+
+Aggregation rules match WeeklyRollup.from_activities in analysis.weekly.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..analysis.weekly import (
+    HARD_SESSION_HRSS,
+    HARD_SESSION_TRIMP,
+    ZONE_COUNT,
+    WeeklyRollup,
+)
+from ..db.database import TrainingDatabase, get_default_db_path
+from ..db.schema import SCHEMA
+
+
+# Rows written by the activity_metrics triggers belong to this user
+DEFAULT_USER_ID = "default"
+
+_ZONE_COLUMNS = ", ".join(f"zone{i}_min" for i in range(1, ZONE_COUNT + 1))
+
+_ROLLUP_COLUMNS = (
+    "week_start, sport, session_count, hard_session_count, active_day_mask, "
+    "distance_km, duration_min, load, elevation_gain_m, "
+    f"{_ZONE_COLUMNS}, longest_session_min, longest_distance_km"
+)
+
+# One row per (week, sport) of the matched activities. The active-day mask
+# sums the distinct weekday bits, which is their bitwise OR.
+_AGGREGATE_SQL = f"""
+    SELECT
+        date(date, 'weekday 0', '-6 days') AS week_start,
+        COALESCE(NULLIF(activity_type, ''), 'other') AS sport,
+        COUNT(*),
+        SUM(CASE WHEN COALESCE(hrss, 0) >= {HARD_SESSION_HRSS}
+                   OR COALESCE(trimp, 0) >= {HARD_SESSION_TRIMP} THEN 1 ELSE 0 END),
+        SUM(DISTINCT 1 << ((CAST(strftime('%w', date) AS INTEGER) + 6) % 7)),
+        SUM(COALESCE(distance_km, 0)),
+        SUM(COALESCE(duration_min, 0)),
+        SUM(COALESCE(NULLIF(hrss, 0), NULLIF(trimp, 0), 0)),
+        SUM(COALESCE(elevation_gain_m, 0)),
+        {", ".join(
+            f"SUM(COALESCE(duration_min, 0) * COALESCE(zone{i}_pct, 0) / 100.0)"
+            for i in range(1, ZONE_COUNT + 1)
+        )},
+        MAX(COALESCE(duration_min, 0)),
+        MAX(COALESCE(distance_km, 0))
+    FROM activity_metrics
+    WHERE date >= ? AND date < ?
+    GROUP BY week_start, sport
+"""
+
+
+def week_start_of(day: date) -> date:
+    """Monday of the ISO week containing day."""
+    return day - timedelta(days=day.weekday())
+
+
+class WeeklyRollupService:
+    """Reads and maintains the persisted weekly rollup."""
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        training_db: Optional[TrainingDatabase] = None,
+    ):
+        """
+        Initialize the weekly rollup service.
+
+        Args:
+            db_path: Path to SQLite database. If not provided, uses default.
+            training_db: TrainingDatabase instance. If provided, uses this instead.
+        """
+        if training_db is not None:
+            self._training_db = training_db
+            self._db_path = training_db.db_path
+        else:
+            self._db_path = Path(db_path) if db_path else get_default_db_path()
+            self._training_db = None
+        self._schema_ready = training_db is not None
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with context manager."""
+        if self._training_db is not None:
+            with self._training_db._get_connection() as conn:
+                yield conn
+        else:
+            conn = sqlite3.connect(self._db_path)
+            conn.row_factory = sqlite3.Row
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+
+    # === Queries ===
+
+    def get_week(
+        self,
+        week_start: date,
+        sport: Optional[str] = None,
+        user_id: str = DEFAULT_USER_ID,
+    ) -> WeeklyRollup:
+        """
+        Totals for one week.
+
+        Args:
+            week_start: Any day of the week (normalized to its Monday)
+            sport: Restrict to one sport (activity type); all sports if None
+            user_id: User whose rollup to read
+
+        Returns:
+            WeeklyRollup (zeroed if nothing was recorded)
+        """
+        return self.get_weeks(week_start, week_start, sport=sport, user_id=user_id)[0]
+
+    def get_weeks(
+        self,
+        start: date,
+        end: date,
+        sport: Optional[str] = None,
+        user_id: str = DEFAULT_USER_ID,
+    ) -> List[WeeklyRollup]:
+        """
+        Per-week totals for every week from start to end, oldest first.
+
+        Weeks without activities are included with zero totals so weeks
+        line up for comparisons.
+
+        Args:
+            start: Any day of the first week
+            end: Any day of the last week
+            sport: Restrict to one sport (activity type); all sports if None
+            user_id: User whose rollup to read
+        """
+        first, last = week_start_of(start), week_start_of(end)
+        by_week: Dict[date, List[WeeklyRollup]] = {}
+        for rollup in self._read(first, last, sport, user_id):
+            by_week.setdefault(rollup.week_start, []).append(rollup)
+
+        weeks = []
+        week = first
+        while week <= last:
+            weeks.append(WeeklyRollup.combine(by_week.get(week, []), week, sport=sport))
+            week += timedelta(weeks=1)
+        return weeks
+
+    def get_recent_weeks(
+        self,
+        weeks: int = 52,
+        sport: Optional[str] = None,
+        user_id: str = DEFAULT_USER_ID,
+        end: Optional[date] = None,
+    ) -> List[WeeklyRollup]:
+        """Totals for the last `weeks` weeks up to and including end's week (default today)."""
+        last = week_start_of(end or date.today())
+        return self.get_weeks(
+            last - timedelta(weeks=weeks - 1), last, sport=sport, user_id=user_id
+        )
+
+    def get_sport_totals(
+        self,
+        start: date,
+        end: date,
+        user_id: str = DEFAULT_USER_ID,
+    ) -> Dict[str, WeeklyRollup]:
+        """Totals per sport over the weeks from start to end."""
+        first = week_start_of(start)
+        by_sport: Dict[str, List[WeeklyRollup]] = {}
+        for rollup in self._read(first, week_start_of(end), None, user_id):
+            by_sport.setdefault(rollup.sport, []).append(rollup)
+        return {
+            sport: WeeklyRollup.combine(rollups, first, sport=sport)
+            for sport, rollups in by_sport.items()
+        }
+
+    def year_in_review(self, year: int, user_id: str = DEFAULT_USER_ID) -> Dict[str, Any]:
+        """
+        Summary of an ISO year: totals, per-sport totals and standout weeks.
+
+        Args:
+            year: ISO year (its weeks run from the Monday of ISO week 1)
+            user_id: User whose rollup to read
+
+        Returns:
+            Dictionary with totals, sports, weeks and highlights
+        """
+        first = date.fromisocalendar(year, 1, 1)
+        last = date.fromisocalendar(year + 1, 1, 1) - timedelta(weeks=1)
+
+        rows = self._read(first, last, None, user_id)
+        by_week: Dict[date, List[WeeklyRollup]] = {}
+        by_sport: Dict[str, List[WeeklyRollup]] = {}
+        for rollup in rows:
+            by_week.setdefault(rollup.week_start, []).append(rollup)
+            by_sport.setdefault(rollup.sport, []).append(rollup)
+
+        weeks = [WeeklyRollup.combine(r, week) for week, r in sorted(by_week.items())]
+        total = WeeklyRollup.combine(weeks, first)
+        week_count = (last - first).days // 7 + 1
+
+        def best(key) -> Optional[Dict[str, Any]]:
+            top = max(weeks, key=key, default=None)
+            return top.to_dict() if top is not None and key(top) > 0 else None
+
+        return {
+            "year": year,
+            "start": first.isoformat(),
+            "end": (last + timedelta(days=6)).isoformat(),
+            "totals": total.to_dict(),
+            "sports": {
+                sport: WeeklyRollup.combine(r, first, sport=sport).to_dict()
+                for sport, r in sorted(by_sport.items())
+            },
+            "active_days": sum(w.active_days for w in weeks),
+            "active_weeks": len(weeks),
+            "total_weeks": week_count,
+            "consistency_pct": round(len(weeks) / week_count * 100, 1),
+            "avg_weekly_load": round(total.load / week_count, 1),
+            "avg_weekly_duration_min": round(total.duration_min / week_count, 1),
+            "biggest_load_week": best(lambda w: w.load),
+            "biggest_volume_week": best(lambda w: w.duration_min),
+            "longest_session_min": round(total.longest_session_min, 1),
+            "longest_distance_km": round(total.longest_distance_km, 2),
+        }
+
+    # === Maintenance ===
+
+    def rebuild(self) -> None:
+        """Rebuild the rollup from the whole activity history."""
+        self._ensure_schema()
+        with self._get_connection() as conn:
+            self._build(conn)
+
+    def _ensure_schema(self) -> None:
+        """Create the rollup tables on databases not opened via TrainingDatabase."""
+        if not self._schema_ready:
+            with self._get_connection() as conn:
+                conn.executescript(SCHEMA)
+            self._schema_ready = True
+
+    def _read(
+        self,
+        first: date,
+        last: date,
+        sport: Optional[str],
+        user_id: str,
+    ) -> List[WeeklyRollup]:
+        """Refresh stale weeks, then read the stored rows for the range."""
+        self._ensure_schema()
+        query = (
+            f"SELECT {_ROLLUP_COLUMNS} FROM weekly_rollups "
+            "WHERE user_id = ? AND week_start >= ? AND week_start <= ?"
+        )
+        params: List[Any] = [user_id, first.isoformat(), last.isoformat()]
+        if sport is not None:
+            query += " AND sport = ?"
+            params.append(sport)
+
+        with self._get_connection() as conn:
+            built = conn.execute(
+                "SELECT 1 FROM weekly_rollup_state WHERE id = 1"
+            ).fetchone()
+            if built is None:
+                self._build(conn)
+            else:
+                self._refresh_stale(conn)
+            rows = conn.execute(query + " ORDER BY week_start", params).fetchall()
+
+        return [self._row_to_rollup(row) for row in rows]
+
+    def _build(self, conn: sqlite3.Connection) -> None:
+        """Replace the default user's rollup with aggregates of all activities."""
+        conn.execute("DELETE FROM weekly_rollups WHERE user_id = ?", (DEFAULT_USER_ID,))
+        self._insert_aggregates(conn, "0000-01-01", "9999-12-31")
+        conn.execute(
+            "INSERT OR REPLACE INTO weekly_rollup_state (id, built_at) "
+            "VALUES (1, CURRENT_TIMESTAMP)"
+        )
+
+    def _refresh_stale(self, conn: sqlite3.Connection) -> None:
+        """Recompute every week that has a stale row."""
+        weeks = [
+            row[0] for row in conn.execute(
+                "SELECT DISTINCT week_start FROM weekly_rollups WHERE stale = 1"
+            )
+        ]
+        for week in weeks:
+            # Drop the whole week (including sports whose last activity was
+            # removed or retyped) and re-aggregate it
+            conn.execute(
+                "DELETE FROM weekly_rollups WHERE user_id = ? AND week_start = ?",
+                (DEFAULT_USER_ID, week),
+            )
+            next_week = (date.fromisoformat(week) + timedelta(weeks=1)).isoformat()
+            self._insert_aggregates(conn, week, next_week)
+
+    @staticmethod
+    def _insert_aggregates(conn: sqlite3.Connection, start: str, end: str) -> None:
+        """Store the aggregates of activities dated in [start, end)."""
+        conn.execute(
+            f"""
+            INSERT INTO weekly_rollups ({_ROLLUP_COLUMNS}, user_id, stale, updated_at)
+            SELECT *, ?, 0, CURRENT_TIMESTAMP FROM ({_AGGREGATE_SQL})
+            """,
+            (DEFAULT_USER_ID, start, end),
+        )
+
+    @staticmethod
+    def _row_to_rollup(row: sqlite3.Row) -> WeeklyRollup:
+        return WeeklyRollup(
+            week_start=date.fromisoformat(row["week_start"]),
+            sport=row["sport"],
+            session_count=row["session_count"],
+            hard_session_count=row["hard_session_count"],
+            active_day_mask=row["active_day_mask"],
+            distance_km=row["distance_km"],
+            duration_min=row["duration_min"],
+            load=row["load"],
+            elevation_gain_m=row["elevation_gain_m"],
+            zone_minutes=[row[f"zone{i}_min"] for i in range(1, ZONE_COUNT + 1)],
+            longest_session_min=row["longest_session_min"],
+            longest_distance_km=row["longest_distance_km"],
+        )
+
+
+# Singleton instance
+_weekly_rollup_service: Optional[WeeklyRollupService] = None
+
+
+def get_weekly_rollup_service(
+    db_path: Optional[Union[str, Path]] = None,
+) -> WeeklyRollupService:
+    """
+    Get or create the singleton WeeklyRollupService instance.
+
+    Args:
+        db_path: Optional database path. Only used on first initialization.
+
+    Returns:
+        WeeklyRollupService singleton instance
+    """
+    global _weekly_rollup_service
+
+    if _weekly_rollup_service is None:
+        _weekly_rollup_service = WeeklyRollupService(db_path=db_path)
+
+    return _weekly_rollup_service
+
+
+def reset_weekly_rollup_service() -> None:
+    """Reset the singleton instance (for testing)."""
+    global _weekly_rollup_service
+    _weekly_rollup_service = None
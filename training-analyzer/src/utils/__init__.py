@@ -3,8 +3,10 @@
 from .token_counter import (
     count_tokens,
     count_message_tokens,
+    count_single_message_tokens,
     estimate_cost,
     get_encoding,
+    select_recent_within_budget,
 )
 from .log_sanitizer import (
     LogSanitizationFilter,
@@ -12,14 +14,18 @@ from .log_sanitizer import (
     get_sanitization_filter,
     sanitize_string,
 )
+from .asof_join import asof_join
 
 __all__ = [
     "count_tokens",
     "count_message_tokens",
+    "count_single_message_tokens",
     "estimate_cost",
     "get_encoding",
+    "select_recent_within_budget",
     "LogSanitizationFilter",
     "install_log_sanitizer",
     "get_sanitization_filter",
     "sanitize_string",
+    "asof_join",
 ]
@@ -0,0 +1,80 @@
+"""As-of join between dated records and a dated history.
+
+For each record, finds the latest history row dated on or before it,
+e.g. the CTL/ATL/TSB in effect on a workout's day, or the most recent
+wellness reading. Both sides are sorted once and matched in a single
+merge pass, so joining N workouts to M history rows costs
+O((N + M) log(N + M)) instead of a scan of the history per workout.
+"""
+
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, TypeVar, Union
+
+L = TypeVar("L")
+R = TypeVar("R")
+
+DateKey = Union[str, date, datetime, None]
+
+
+def _as_date(value: DateKey) -> Optional[date]:
+    """Normalize an ISO string, date or datetime to a date."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _dict_key(field: str) -> Callable[[Any], DateKey]:
+    return lambda row: row.get(field) if isinstance(row, dict) else getattr(row, field, None)
+
+
+def asof_join(
+    left: Sequence[L],
+    right: Sequence[R],
+    left_key: Union[str, Callable[[L], DateKey]] = "date",
+    right_key: Union[str, Callable[[R], DateKey]] = "date",
+    max_gap_days: Optional[int] = None,
+) -> List[Optional[R]]:
+    """
+    Match each left row to the latest right row dated on or before it.
+
+    Args:
+        left: Rows to enrich (e.g. workouts), in any order
+        right: History rows (e.g. daily fitness metrics), in any order
+        left_key: Field name or function giving a left row's date
+        right_key: Field name or function giving a right row's date
+        max_gap_days: Ignore matches older than this many days (0 = same day only)
+
+    Returns:
+        Matched right row (or None) for each left row, aligned with `left`.
+        Rows without a date match nothing.
+    """
+    get_left = _dict_key(left_key) if isinstance(left_key, str) else left_key
+    get_right = _dict_key(right_key) if isinstance(right_key, str) else right_key
+
+    left_dates = [_as_date(get_left(row)) for row in left]
+    history = sorted(
+        ((d, row) for d, row in ((_as_date(get_right(r)), r) for r in right) if d is not None),
+        key=lambda pair: pair[0],
+    )
+    order = sorted(
+        (i for i, d in enumerate(left_dates) if d is not None),
+        key=lambda i: left_dates[i],
+    )
+
+    matches: List[Optional[R]] = [None] * len(left)
+    pos = -1
+    for i in order:
+        target = left_dates[i]
+        while pos + 1 < len(history) and history[pos + 1][0] <= target:
+            pos += 1
+        if pos < 0:
+            continue
+        matched_date, row = history[pos]
+        if max_gap_days is None or (target - matched_date).days <= max_gap_days:
+            matches[i] = row
+
+    return matches
@@ -0,0 +1,136 @@
+"""Deferred imports for heavy optional subsystems.
+
+Importing the LangChain/LangGraph agents, the LLM provider SDKs, the
+Garmin and Strava clients and the FIT encoder costs several seconds.
+Routes and packages that only need them inside request handlers refer
+to them through the helpers below, so the application can register its
+routes and answer health checks before any of them are loaded:
+
+- lazy_import() returns a stand-in for a module attribute that imports
+  the module on first call or attribute access. Route modules keep the
+  same global names, so tests can still patch them.
+- lazy_exports() builds a PEP 562 module __getattr__ for package
+  __init__ files that re-export names from their submodules.
+- warm_up() imports everything registered as deferred, for a background
+  warm-up after startup.
+"""
+
+import importlib
+import importlib.util
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Modules referenced through lazy_import(), in registration order
+_deferred_modules: Dict[str, None] = {}
+
+
+class LazyObject:
+    """Stand-in for an attribute of a module that has not been imported yet.
+
+    Calling the object or reading an attribute imports the module and
+    forwards to the real object. Use it for functions and classes that
+    are only called; exception types and annotations need the real
+    object and should be imported where they are used.
+    """
+
+    __slots__ = ("_module", "_name", "_target")
+
+    def __init__(self, module: str, name: str):
+        self._module = module
+        self._name = name
+        self._target = None
+
+    def resolve(self) -> Any:
+        """Import the module and return the real object."""
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        # Introspection (typing, inspect, mock) probes dunder and private
+        # names; those must not trigger the import
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "deferred"
+        return f"<LazyObject {self._module}.{self._name} ({state})>"
+
+
+def lazy_import(module: str, name: str, package: Optional[str] = None) -> Any:
+    """
+    Defer `from module import name` until the object is first used.
+
+    Args:
+        module: Module path, relative to `package` when it starts with "."
+        name: Attribute to load from the module
+        package: Package for relative module paths (the caller's __package__)
+
+    Returns:
+        A LazyObject forwarding calls and attribute access to the target
+    """
+    module = importlib.util.resolve_name(module, package)
+    _deferred_modules.setdefault(module, None)
+    return LazyObject(module, name)
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ for a package's re-exports.
+
+    Args:
+        package: The package's __name__
+        exports: Exported name -> relative submodule (".enrichment").
+            A value of "module:attr" exports `attr` under another name.
+
+    Returns:
+        A __getattr__ that imports the submodule on first access and
+        caches the result in the package namespace
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        submodule, _, attr = target.partition(":")
+        value = getattr(importlib.import_module(submodule, package), attr or name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
+
+
+def deferred_modules() -> List[str]:
+    """Modules registered through lazy_import() that are not loaded yet."""
+    return [module for module in _deferred_modules if module not in sys.modules]
+
+
+def warm_up() -> Dict[str, float]:
+    """
+    Import every deferred module.
+
+    Failures are logged and skipped; a missing optional dependency is
+    reported again when the feature is used.
+
+    Returns:
+        Milliseconds spent importing each module that was loaded
+    """
+    timings: Dict[str, float] = {}
+    for module in deferred_modules():
+        start = time.perf_counter()
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning(f"Warm-up import of {module} failed: {e}")
+            continue
+        timings[module] = round((time.perf_counter() - start) * 1000, 1)
+    return timings
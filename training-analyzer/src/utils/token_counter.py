@@ -6,13 +6,18 @@ Falls back to character-based approximation if tiktoken is unavailable.
 
 import logging
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
 # Claude uses cl100k_base encoding (same as GPT-4)
 ENCODING_NAME = "cl100k_base"
 
+# Per-message overhead for role tokens: <|im_start|>role\n ... <|im_end|>\n
+MESSAGE_OVERHEAD_TOKENS = 4
+# Assistant priming tokens appended once per request
+ASSISTANT_PRIMING_TOKENS = 2
+
 
 @lru_cache(maxsize=1)
 def get_encoding():
@@ -57,6 +62,36 @@ def count_tokens(text: str) -> int:
         return len(text) // 4
 
 
+def count_single_message_tokens(message: Dict[str, Any]) -> int:
+    """Count tokens in one chat message, including role overhead.
+
+    A precomputed ``token_count`` on the message is trusted as-is, so
+    stored messages are only ever tokenized once.
+
+    Args:
+        message: Message dict with 'role' and 'content' keys
+
+    Returns:
+        Token count for the message including overhead
+    """
+    precomputed = message.get("token_count")
+    if isinstance(precomputed, int) and precomputed > 0:
+        return precomputed
+
+    total = MESSAGE_OVERHEAD_TOKENS
+
+    content = message.get("content", "")
+    if isinstance(content, str):
+        total += count_tokens(content)
+    elif isinstance(content, list):
+        # Handle multimodal content
+        for part in content:
+            if isinstance(part, dict) and part.get("type") == "text":
+                total += count_tokens(part.get("text", ""))
+
+    return total
+
+
 def count_message_tokens(messages: List[Dict[str, Any]]) -> int:
     """Count tokens in a list of chat messages.
 
@@ -68,28 +103,39 @@ def count_message_tokens(messages: List[Dict[str, Any]]) -> int:
     Returns:
         Total token count including overhead
     """
-    total = 0
-
-    for msg in messages:
-        # Each message has overhead for role tokens
-        # <|im_start|>role\n ... <|im_end|>\n
-        total += 4
-
-        content = msg.get("content", "")
-        if isinstance(content, str):
-            total += count_tokens(content)
-        elif isinstance(content, list):
-            # Handle multimodal content
-            for part in content:
-                if isinstance(part, dict) and part.get("type") == "text":
-                    total += count_tokens(part.get("text", ""))
+    total = sum(count_single_message_tokens(msg) for msg in messages)
 
     # Assistant priming tokens
-    total += 2
+    total += ASSISTANT_PRIMING_TOKENS
 
     return total
 
 
+def select_recent_within_budget(token_counts: Sequence[int], budget: int) -> int:
+    """Find how many trailing messages fit in a token budget.
+
+    Walks backwards from the newest message and stops at the first one
+    that would exceed the budget, so the selected window is always a
+    contiguous run of the most recent messages.
+
+    Args:
+        token_counts: Per-message token counts, oldest first
+        budget: Maximum number of tokens for the selected messages
+
+    Returns:
+        Index of the first message to keep (``len(token_counts)`` if none fit)
+    """
+    used = 0
+    start = len(token_counts)
+    while start > 0:
+        cost = token_counts[start - 1]
+        if used + cost > budget:
+            break
+        used += cost
+        start -= 1
+    return start
+
+
 def estimate_cost(
     input_tokens: int,
     output_tokens: int,
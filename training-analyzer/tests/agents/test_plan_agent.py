@@ -1,10 +1,14 @@
 """Tests for the Plan Agent (LangGraph-based plan generation)."""
 
+import asyncio
+import time
+
 import pytest
 from datetime import date, datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 import json
 
+from training_analyzer.agents import plan_agent
 from training_analyzer.agents.plan_agent import (
     PlanAgent,
     PlanState,
@@ -858,3 +862,153 @@ class TestJsonParsing:
 
         with pytest.raises(ValueError):
             agent._parse_json_response(response)
+
+
+# ============================================================================
+# Test Block Generation
+# ============================================================================
+
+class TestBlockGeneration:
+    """Tests for concurrent week block generation and streaming."""
+
+    async def _structured_state(self, agent, goal, athlete_context, constraints):
+        state = agent._initial_state(goal, athlete_context, constraints)
+        state = await agent._analyze_goal(state)
+        return await agent._determine_structure(state)
+
+    @pytest.mark.asyncio
+    async def test_blocks_cover_weeks_within_phases(
+        self, sample_goal, sample_athlete_context, sample_constraints
+    ):
+        """Test that blocks are consecutive, single-phase and bounded."""
+        agent = PlanAgent()
+        state = await self._structured_state(
+            agent, sample_goal, sample_athlete_context, sample_constraints
+        )
+
+        blocks = agent._plan_blocks(state)
+        week_numbers = [n for block in blocks for n in block.week_numbers]
+
+        assert week_numbers == list(range(1, len(week_numbers) + 1))
+        assert len(week_numbers) == sum(p["weeks"] for p in state["phase_distribution"])
+        assert all(1 <= len(block.weeks) <= plan_agent.MAX_BLOCK_WEEKS for block in blocks)
+
+    @pytest.mark.asyncio
+    async def test_block_size_does_not_change_the_plan(
+        self, sample_goal, sample_athlete_context, sample_constraints, monkeypatch
+    ):
+        """Test that weeks match however the plan is split."""
+        agent = PlanAgent()
+        plan = await agent.generate_plan(sample_goal, sample_athlete_context, sample_constraints)
+
+        monkeypatch.setattr(plan_agent, "MAX_BLOCK_WEEKS", 1)
+        single = await agent.generate_plan(sample_goal, sample_athlete_context, sample_constraints)
+        events = [
+            e async for e in agent.stream_plan(sample_goal, sample_athlete_context, sample_constraints)
+        ]
+
+        assert [w.to_dict() for w in single.weeks] == [w.to_dict() for w in plan.weeks]
+        assert [w.to_dict() for w in events[-1]["plan"].weeks] == [w.to_dict() for w in plan.weeks]
+        assert events[-1]["plan"].peak_week == plan.peak_week
+
+    @pytest.mark.asyncio
+    async def test_blocks_run_concurrently_up_to_limit(
+        self, sample_goal, sample_athlete_context, sample_constraints
+    ):
+        """Test that a slow plan takes about as long as its slowest blocks."""
+        agent = PlanAgent()
+        generate = agent._generate_block
+        running = {"now": 0, "peak": 0}
+
+        async def slow_block(block, constraints):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.2)
+            running["now"] -= 1
+            return await generate(block, constraints)
+
+        agent._generate_block = slow_block
+        started = time.monotonic()
+        events = [
+            e async for e in agent.stream_plan(sample_goal, sample_athlete_context, sample_constraints)
+        ]
+        elapsed = time.monotonic() - started
+
+        block_events = [e for e in events if e["type"] == "weeks"]
+        assert len(block_events) > plan_agent.MAX_CONCURRENT_BLOCKS
+        assert running["peak"] == plan_agent.MAX_CONCURRENT_BLOCKS
+        assert elapsed < 0.2 * len(block_events) * 0.7
+        assert len({e["plan"].id for e in events}) == 1
+        assert [e["completed_weeks"] for e in block_events] == sorted(
+            e["completed_weeks"] for e in block_events
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_failed_blocks_are_retried(
+        self, sample_goal, sample_athlete_context, sample_constraints, monkeypatch
+    ):
+        """Test that a timed-out block is retried without redoing the others."""
+        monkeypatch.setattr(plan_agent, "BLOCK_TIMEOUT_SECONDS", 0.05)
+        agent = PlanAgent()
+        generate = agent._generate_block
+        calls = {}
+
+        async def flaky_block(block, constraints):
+            calls[block.index] = calls.get(block.index, 0) + 1
+            if block.index == 1 and calls[block.index] == 1:
+                await asyncio.sleep(1)
+            return await generate(block, constraints)
+
+        agent._generate_block = flaky_block
+        plan = await agent.generate_plan(sample_goal, sample_athlete_context, sample_constraints)
+
+        assert calls[1] == 2
+        assert all(count == 1 for index, count in calls.items() if index != 1)
+        assert [w.week_number for w in plan.weeks] == list(range(1, plan.total_weeks + 1))
+
+    @pytest.mark.asyncio
+    async def test_blocking_block_times_out_and_is_retried(
+        self, sample_goal, sample_athlete_context, sample_constraints, monkeypatch
+    ):
+        """Test that a block stuck in synchronous work is timed out and retried."""
+        monkeypatch.setattr(plan_agent, "BLOCK_TIMEOUT_SECONDS", 0.05)
+        agent = PlanAgent()
+        build = agent._build_block_weeks
+        calls = {}
+
+        def stuck_block(block, constraints):
+            calls[block.index] = calls.get(block.index, 0) + 1
+            if block.index == 1 and calls[block.index] == 1:
+                time.sleep(0.5)
+            return build(block, constraints)
+
+        agent._build_block_weeks = stuck_block
+        plan = await agent.generate_plan(sample_goal, sample_athlete_context, sample_constraints)
+
+        assert calls[1] == 2
+        assert [w.week_number for w in plan.weeks] == list(range(1, plan.total_weeks + 1))
+
+    @pytest.mark.asyncio
+    async def test_failed_block_keeps_finished_weeks(
+        self, sample_goal, sample_athlete_context, sample_constraints
+    ):
+        """Test that other blocks still stream when one fails every attempt."""
+        agent = PlanAgent()
+        generate = agent._generate_block
+
+        async def broken_block(block, constraints):
+            if block.index == 0:
+                raise RuntimeError("LLM unavailable")
+            return await generate(block, constraints)
+
+        agent._generate_block = broken_block
+        events = []
+        with pytest.raises(PlanGenerationError, match="Weeks 1-"):
+            async for event in agent.stream_plan(
+                sample_goal, sample_athlete_context, sample_constraints
+            ):
+                events.append(event)
+
+        assert events and events[-1]["type"] == "weeks"
+        assert 1 not in [w.week_number for w in events[-1]["plan"].weeks]
+        assert events[-1]["completed_weeks"] == events[-1]["total_weeks"] - 4
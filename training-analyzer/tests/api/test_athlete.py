@@ -0,0 +1,105 @@
+"""Tests for the weekly rollup athlete routes."""
+
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from training_analyzer.main import app
+from training_analyzer.api import deps
+from training_analyzer.api.middleware.auth import CurrentUser
+from training_analyzer.db.database import ActivityMetrics, TrainingDatabase
+from training_analyzer.services.weekly_rollup_service import (
+    WeeklyRollupService,
+    week_start_of,
+)
+
+
+client = TestClient(app)
+
+
+def _activity(activity_id, day, activity_type="running", **values):
+    fields = dict(
+        activity_id=activity_id,
+        date=day.isoformat(),
+        activity_name=None,
+        avg_hr=None,
+        max_hr=None,
+        pace_sec_per_km=None,
+        zone1_pct=None,
+        zone2_pct=None,
+        zone3_pct=None,
+        zone4_pct=None,
+        zone5_pct=None,
+        activity_type=activity_type,
+        trimp=None,
+        distance_km=None,
+        hrss=None,
+    )
+    fields.update(values)
+    return ActivityMetrics(**fields)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return TrainingDatabase(str(tmp_path / "training.db"))
+
+
+@pytest.fixture(autouse=True)
+def overrides(db):
+    """Serve the rollup from a temporary database for an authenticated user."""
+    service = WeeklyRollupService(training_db=db)
+    app.dependency_overrides[deps.get_current_user] = lambda: CurrentUser(
+        user_id="u1", email="u1@example.com"
+    )
+    app.dependency_overrides[deps.get_weekly_rollup_service] = lambda: service
+    yield
+    app.dependency_overrides.pop(deps.get_current_user, None)
+    app.dependency_overrides.pop(deps.get_weekly_rollup_service, None)
+
+
+class TestWeeklyRollups:
+    """Tests for GET /athlete/weekly-rollups."""
+
+    def test_recent_weeks(self, db):
+        this_week = week_start_of(date.today())
+        db.save_activity_metrics(_activity("a", this_week, duration_min=40.0, distance_km=8.0))
+        db.save_activity_metrics(
+            _activity("b", this_week - timedelta(weeks=2), "road_biking", duration_min=90.0)
+        )
+
+        response = client.get("/api/v1/athlete/weekly-rollups?weeks=3")
+
+        assert response.status_code == 200
+        weeks = response.json()["weeks"]
+        assert [w["week_start"] for w in weeks] == [
+            (this_week - timedelta(weeks=n)).isoformat() for n in (2, 1, 0)
+        ]
+        assert [w["session_count"] for w in weeks] == [1, 0, 1]
+        assert weeks[2]["distance_km"] == 8.0
+
+        running = client.get("/api/v1/athlete/weekly-rollups?weeks=3&sport=running").json()
+        assert [w["session_count"] for w in running["weeks"]] == [0, 0, 1]
+
+    def test_weeks_out_of_range(self):
+        assert client.get("/api/v1/athlete/weekly-rollups?weeks=0").status_code == 422
+
+
+class TestYearInReview:
+    """Tests for GET /athlete/year-in-review/{year}."""
+
+    def test_year_summary(self, db):
+        db.save_activity_metrics(_activity("a", date(2024, 3, 4), duration_min=60.0, hrss=80.0))
+        db.save_activity_metrics(_activity("b", date(2024, 3, 6), duration_min=30.0, hrss=40.0))
+
+        response = client.get("/api/v1/athlete/year-in-review/2024")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["year"] == 2024
+        assert data["active_weeks"] == 1
+        assert data["totals"]["session_count"] == 2
+        assert data["biggest_load_week"]["week_start"] == "2024-03-04"
+
+    def test_invalid_year(self):
+        assert client.get("/api/v1/athlete/year-in-review/99999").status_code == 422
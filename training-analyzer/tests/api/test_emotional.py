@@ -0,0 +1,56 @@
+"""Tests for the social proof route."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from training_analyzer.main import app
+from training_analyzer.api.middleware.auth import CurrentUser, get_current_user
+from training_analyzer.api.routes import emotional
+from training_analyzer.api.deps import get_training_db
+from training_analyzer.services.social_proof_service import SocialProofService
+
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def training_db():
+    """A training database whose cohort value lookups fail."""
+    db = MagicMock()
+    db.get_recent_activities.return_value = []
+    db.get_latest_fitness_metrics.side_effect = RuntimeError("database is locked")
+    db.get_user_profile.side_effect = RuntimeError("database is locked")
+    return db
+
+
+@pytest.fixture(autouse=True)
+def overrides(training_db):
+    achievements = MagicMock()
+    achievements.get_user_progress.return_value = None
+
+    app.dependency_overrides[get_current_user] = lambda: CurrentUser(
+        user_id="u1", email="u1@example.com"
+    )
+    app.dependency_overrides[get_training_db] = lambda: training_db
+    app.dependency_overrides[emotional.get_social_proof_service] = SocialProofService
+    app.dependency_overrides[emotional.get_achievement_service] = lambda: achievements
+    yield
+    for dependency in (
+        get_current_user,
+        get_training_db,
+        emotional.get_social_proof_service,
+        emotional.get_achievement_service,
+    ):
+        app.dependency_overrides.pop(dependency, None)
+
+
+class TestSocialProof:
+    """Tests for GET /emotional/social-proof."""
+
+    def test_cohort_lookup_failure_still_returns_stats(self):
+        response = client.get("/api/v1/emotional/social-proof")
+
+        assert response.status_code == 200
+        assert response.json()["ctlPercentile"] is None
@@ -0,0 +1,112 @@
+"""Tests for the plan-session explanation route."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from training_analyzer.main import app
+from training_analyzer.api import deps
+from training_analyzer.db.database import TrainingDatabase
+from training_analyzer.db.repositories.plan_repository import PlanRepository
+from training_analyzer.models.plans import (
+    PeriodizationType,
+    PlannedSession,
+    RaceDistance,
+    RaceGoal,
+    TrainingPhase,
+    TrainingPlan,
+    TrainingWeek,
+    WorkoutType,
+)
+from training_analyzer.services.explanation_factor_service import ExplanationFactorService
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def plan_repo(tmp_path):
+    """Serve plans and explanation factors from a temporary database."""
+    db_path = str(tmp_path / "test_training.db")
+    repo = PlanRepository(db_path)
+    factor_service = ExplanationFactorService(training_db=TrainingDatabase(db_path))
+
+    app.dependency_overrides[deps.get_plan_repository] = lambda: repo
+    app.dependency_overrides[deps.get_explanation_factor_service] = lambda: factor_service
+    yield repo
+    app.dependency_overrides.pop(deps.get_plan_repository, None)
+    app.dependency_overrides.pop(deps.get_explanation_factor_service, None)
+
+
+def _week(week_number, phase, tempo_load):
+    return TrainingWeek(
+        week_number=week_number,
+        phase=phase,
+        target_load=200.0,
+        sessions=[
+            PlannedSession(
+                day_of_week=1,
+                workout_type=WorkoutType.TEMPO,
+                description="Tempo run",
+                target_duration_min=45,
+                target_load=tempo_load,
+            ),
+            PlannedSession(
+                day_of_week=6,
+                workout_type=WorkoutType.LONG,
+                description="Long run",
+                target_duration_min=100,
+                target_load=110.0,
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def sample_plan(plan_repo):
+    race_date = date.today() + timedelta(weeks=3)
+    plan = TrainingPlan(
+        id="plan_explain",
+        goal=RaceGoal(
+            race_date=race_date,
+            distance=RaceDistance.HALF_MARATHON,
+            target_time_seconds=5400,
+        ),
+        weeks=[
+            _week(1, TrainingPhase.BASE, 60.0),
+            _week(2, TrainingPhase.BUILD, 75.0),
+            _week(3, TrainingPhase.TAPER, 50.0),
+        ],
+        periodization=PeriodizationType.LINEAR,
+        peak_week=2,
+        created_at=datetime.now(),
+    )
+    plan_repo.save(plan)
+    return plan
+
+
+class TestExplainPlanSession:
+    """Tests for GET /explain/plan-session/{session_id}."""
+
+    def test_explains_session(self, sample_plan):
+        response = client.get("/api/v1/explain/plan-session/plan_explain:2:0")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["session_type"] == "tempo"
+        assert data["session_name"] == "Tempo run"
+        assert data["periodization_context"] == "Week 2 of 3 - Build Phase"
+        assert data["progression_note"] == "+25% load from previous tempo session"
+        assert "1 quality sessions planned" in data["weekly_context"]
+        week_start = sample_plan.goal.race_date - timedelta(weeks=2)
+        assert data["scheduled_date"] == (week_start + timedelta(days=1)).isoformat()
+        assert "explanation_factors" in data["rationale"]["data_points"]
+
+    def test_unknown_session(self, sample_plan):
+        assert client.get("/api/v1/explain/plan-session/plan_explain:2:5").status_code == 404
+        assert client.get("/api/v1/explain/plan-session/plan_explain:9:0").status_code == 404
+        assert client.get("/api/v1/explain/plan-session/plan_missing:1:0").status_code == 404
+
+    def test_malformed_session_id(self):
+        assert client.get("/api/v1/explain/plan-session/not-a-session").status_code == 400
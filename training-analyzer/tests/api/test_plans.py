@@ -331,6 +331,32 @@ class TestListPlans:
         assert response.json()["count"] == 2
         assert response.json()["total"] == 5
 
+    def test_list_plans_cursor(self, sample_plan, clear_plans_storage):
+        """Test walking the plan list with cursors."""
+        import copy
+        for i in range(5):
+            plan = copy.deepcopy(sample_plan)
+            plan.id = f"plan_{i}"
+            plan.created_at = datetime.now() - timedelta(hours=i)
+            clear_plans_storage.save(plan)
+
+        ids, cursor = [], None
+        while True:
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            data = client.get("/api/v1/plans", params=params).json()
+            ids.extend(p["id"] for p in data["plans"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert ids == [f"plan_{i}" for i in range(5)]
+
+    def test_list_plans_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/api/v1/plans?cursor=garbage")
+
+        assert response.status_code == 400
+
 
 # ============================================================================
 # Test Get Plan
@@ -385,6 +411,72 @@ class TestGetPlanWeek:
         assert response.status_code == 404
 
 
+# ============================================================================
+# Test Update Session
+# ============================================================================
+
+class TestUpdateSession:
+    """Tests for the PATCH /plans/{id}/week/{n}/sessions/{i} endpoint."""
+
+    def test_update_session_success(self, sample_plan, clear_plans_storage):
+        """Test updating one session leaves the rest of the plan alone."""
+        clear_plans_storage.save(sample_plan)
+
+        response = client.patch(
+            f"/api/v1/plans/{sample_plan.id}/week/3/sessions/1",
+            json={"workout_type": "intervals", "target_duration_min": 55},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["workout_type"] == "intervals"
+        assert response.json()["description"] == "Tempo run"
+        plan = clear_plans_storage.get(sample_plan.id)
+        assert plan.weeks[2].sessions[1].target_duration_min == 55
+        assert plan.weeks[3].sessions[1].workout_type == WorkoutType.TEMPO
+
+    def test_update_session_not_found(self, sample_plan, clear_plans_storage):
+        """Test updating a session that does not exist."""
+        clear_plans_storage.save(sample_plan)
+
+        response = client.patch(
+            f"/api/v1/plans/{sample_plan.id}/week/3/sessions/9",
+            json={"notes": "Moved"},
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("field", [
+        "day_of_week", "workout_type", "description", "target_duration_min", "target_load",
+    ])
+    def test_update_session_rejects_null_required_field(self, field, sample_plan, clear_plans_storage):
+        """Test that nulling a field every session needs is a validation error."""
+        clear_plans_storage.save(sample_plan)
+
+        response = client.patch(
+            f"/api/v1/plans/{sample_plan.id}/week/3/sessions/1",
+            json={field: None},
+        )
+
+        assert response.status_code == 422
+        assert clear_plans_storage.get(sample_plan.id).weeks[2].sessions[1].description == "Tempo run"
+
+    def test_update_session_clears_optional_field(self, sample_plan, clear_plans_storage):
+        """Test that optional fields can still be cleared with null."""
+        clear_plans_storage.save(sample_plan)
+        client.patch(
+            f"/api/v1/plans/{sample_plan.id}/week/3/sessions/1",
+            json={"notes": "Hilly route"},
+        )
+
+        response = client.patch(
+            f"/api/v1/plans/{sample_plan.id}/week/3/sessions/1",
+            json={"notes": None},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["notes"] is None
+
+
 # ============================================================================
 # Test Update Plan
 # ============================================================================
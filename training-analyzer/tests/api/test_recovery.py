@@ -0,0 +1,98 @@
+"""Tests for the recovery readiness route."""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from training_analyzer.main import app
+from training_analyzer.api import deps
+from training_analyzer.api.middleware.auth import CurrentUser
+from training_analyzer.db.database import (
+    TrainingDatabase,
+    WellnessHRVRecord,
+    WellnessRestingHRRecord,
+    WellnessSleepRecord,
+    WellnessStressRecord,
+)
+
+
+client = TestClient(app)
+
+
+def _day(offset):
+    return (date.today() - timedelta(days=offset)).isoformat()
+
+
+@pytest.fixture
+def db(tmp_path):
+    return TrainingDatabase(str(tmp_path / "training.db"))
+
+
+@pytest.fixture(autouse=True)
+def overrides(db):
+    """Serve recovery data from a temporary database for an authenticated user."""
+    coach_service = MagicMock()
+    coach_service.get_athlete_context.return_value = {
+        "fitness_metrics": {"tsb": -5.0},
+        "physiology": {"vo2max_running": 52.0},
+    }
+    app.dependency_overrides[deps.get_current_user] = lambda: CurrentUser(
+        user_id="u1", email="u1@example.com"
+    )
+    app.dependency_overrides[deps.get_training_db] = lambda: db
+    app.dependency_overrides[deps.get_coach_service] = lambda: coach_service
+    yield
+    for dependency in (deps.get_current_user, deps.get_training_db, deps.get_coach_service):
+        app.dependency_overrides.pop(dependency, None)
+
+
+class TestRecoveryReadiness:
+    """Tests for GET /recovery/readiness."""
+
+    def test_readiness_payload(self, db):
+        for offset in range(14):
+            db.save_sleep_record(
+                WellnessSleepRecord(date=_day(offset), total_sleep_seconds=7 * 3600)
+            )
+            db.save_hrv_record(WellnessHRVRecord(date=_day(offset), hrv_last_night_avg=60))
+        db.save_stress_record(
+            WellnessStressRecord(
+                date=_day(0), avg_stress_level=28, body_battery_high=90, body_battery_low=25
+            )
+        )
+        db.save_resting_hr_record(WellnessRestingHRRecord(date=_day(0), resting_hr=48))
+        db.save_resting_hr_record(WellnessRestingHRRecord(date=_day(2), resting_hr=52))
+
+        response = client.get("/api/v1/recovery/readiness?sleep_target_hours=8")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is True
+        assert body["hasData"] is True
+        assert body["data"]["sleepDebt"] is not None
+        assert body["data"]["hrvTrend"] is not None
+        assert body["wellness"] == {
+            "date": _day(0),
+            "avgStressLevel": 28,
+            "bodyBatteryHigh": 90,
+            "bodyBatteryLow": 25,
+            "bodyBatteryCharged": None,
+            "bodyBatteryDrained": None,
+            "restingHr": 48,
+            "restingHr7DAvg": 50.0,
+        }
+
+    def test_no_data(self):
+        response = client.get("/api/v1/recovery/readiness")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is True
+        assert body["hasData"] is False
+        assert body["wellness"] is None
+        assert body["error"] is None
+
+    def test_sleep_target_out_of_range(self):
+        assert client.get("/api/v1/recovery/readiness?sleep_target_hours=2").status_code == 422
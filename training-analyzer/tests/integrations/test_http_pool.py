@@ -0,0 +1,175 @@
+"""Tests for the shared integration HTTP pools."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from training_analyzer.integrations.base import OAuthCredentials, RateLimitError
+from training_analyzer.integrations.http_pool import (
+    ProviderHTTPPool,
+    RateLimitBudget,
+    get_http_pool,
+    reset_http_pools,
+)
+from training_analyzer.integrations.strava import StravaClient
+
+
+def _credentials(expires_in: timedelta = timedelta(hours=6), access_token: str = "old") -> OAuthCredentials:
+    return OAuthCredentials(
+        provider="strava",
+        access_token=access_token,
+        refresh_token="refresh",
+        expires_at=datetime.now() + expires_in,
+        user_id="athlete-1",
+    )
+
+
+class TestRateLimitBudget:
+    """Tests for RateLimitBudget."""
+
+    def test_acquire_until_exhausted(self):
+        """Requests are counted locally until the short window is used up."""
+        budget = RateLimitBudget("strava", limit_15min=2, limit_daily=10)
+        now = datetime(2024, 1, 1, 10, 7, tzinfo=timezone.utc)
+
+        assert budget.try_acquire(now) == 0
+        assert budget.try_acquire(now) == 0
+        # Next window starts at 10:15
+        assert budget.try_acquire(now) == 8 * 60
+        assert budget.remaining(now) == (0, 8)
+
+    def test_window_rolls_over_on_quarter_hour(self):
+        """Short-window usage resets at the quarter hour, daily usage does not."""
+        budget = RateLimitBudget("strava", limit_15min=1, limit_daily=10)
+        budget.try_acquire(datetime(2024, 1, 1, 10, 14, tzinfo=timezone.utc))
+
+        later = datetime(2024, 1, 1, 10, 15, tzinfo=timezone.utc)
+        assert budget.remaining(later) == (1, 9)
+
+    def test_daily_exhaustion_waits_until_midnight(self):
+        """An exhausted daily budget is not available until midnight UTC."""
+        budget = RateLimitBudget("strava", limit_15min=100, limit_daily=1)
+        now = datetime(2024, 1, 1, 23, 0, tzinfo=timezone.utc)
+        budget.try_acquire(now)
+
+        assert budget.seconds_until_available(now) == 3600
+
+    def test_update_from_provider(self):
+        """Provider-reported usage replaces local counts."""
+        budget = RateLimitBudget("strava")
+        budget.update(limits=(100, 1000), usage=(40, 400))
+
+        assert budget.remaining_15min == 60
+        assert budget.remaining_daily == 600
+
+    async def test_acquire_raises_beyond_max_wait(self):
+        """Waiting longer than allowed raises RateLimitError."""
+        budget = RateLimitBudget("strava", limit_15min=1, limit_daily=10)
+        await budget.acquire(max_wait=0)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await budget.acquire(max_wait=0)
+        assert exc_info.value.retry_after > 0
+
+
+class TestProviderHTTPPool:
+    """Tests for ProviderHTTPPool."""
+
+    async def test_client_is_shared(self):
+        """The same client is reused within an event loop."""
+        pool = ProviderHTTPPool("test")
+        try:
+            assert pool.get_client() is pool.get_client()
+        finally:
+            await pool.aclose()
+
+    def test_registry_returns_singleton(self):
+        """get_http_pool returns one pool per provider."""
+        reset_http_pools()
+        try:
+            assert get_http_pool("strava") is get_http_pool("strava")
+            assert get_http_pool("strava") is not get_http_pool("garmin")
+        finally:
+            reset_http_pools()
+
+    async def test_concurrent_refresh_is_single_flight(self):
+        """Concurrent callers for one athlete share a single refresh."""
+        pool = ProviderHTTPPool("strava")
+        calls = 0
+
+        async def refresh(current: OAuthCredentials) -> OAuthCredentials:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _credentials(access_token="new")
+
+        stale = _credentials(expires_in=timedelta(minutes=5))
+        results = await asyncio.gather(
+            *[pool.ensure_fresh_token("athlete-1", stale, refresh) for _ in range(5)]
+        )
+
+        assert calls == 1
+        assert {creds.access_token for creds in results} == {"new"}
+
+    async def test_valid_token_is_not_refreshed(self):
+        """Tokens outside the refresh margin are returned unchanged."""
+        pool = ProviderHTTPPool("strava")
+
+        async def refresh(current: OAuthCredentials) -> OAuthCredentials:
+            raise AssertionError("refresh should not be called")
+
+        creds = _credentials()
+        assert await pool.ensure_fresh_token("athlete-1", creds, refresh) is creds
+
+
+class TestStravaClientPooling:
+    """Tests for StravaClient requests through the shared pool."""
+
+    async def test_rate_limit_headers_update_shared_budget(self):
+        """Usage reported by Strava is visible to every client of the pool."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={"id": 1},
+                headers={"X-RateLimit-Limit": "200,2000", "X-RateLimit-Usage": "50,500"},
+            )
+
+        pool = ProviderHTTPPool("strava", transport=httpx.MockTransport(handler))
+        client = StravaClient(_credentials(), http_pool=pool)
+        other = StravaClient(_credentials(), http_pool=pool)
+
+        await client.get_user_profile()
+
+        assert other.rate_limit_remaining_15min == 150
+        assert other.rate_limit_remaining_daily == 1500
+        await pool.aclose()
+
+    async def test_refreshes_and_retries_after_401(self):
+        """A rejected token is refreshed once and the request retried."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers["Authorization"] == "Bearer old":
+                return httpx.Response(401, json={"message": "Authorization Error"})
+            return httpx.Response(200, json={"id": 1})
+
+        async def refresh(current: OAuthCredentials) -> OAuthCredentials:
+            return _credentials(access_token="new")
+
+        pool = ProviderHTTPPool("strava", transport=httpx.MockTransport(handler))
+        client = StravaClient(_credentials(), token_refresher=refresh, http_pool=pool)
+
+        assert await client.get_user_profile() == {"id": 1}
+        assert client.credentials.access_token == "new"
+        await pool.aclose()
+
+    async def test_close_keeps_shared_connections(self):
+        """Closing a client leaves the pool's connections open for reuse."""
+        pool = ProviderHTTPPool("strava")
+        client = StravaClient(_credentials(), http_pool=pool)
+        shared = pool.get_client()
+
+        await client.close()
+
+        assert not shared.is_closed
+        await pool.aclose()
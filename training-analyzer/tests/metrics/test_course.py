@@ -0,0 +1,181 @@
+"""Tests for the course elevation model."""
+
+import pytest
+
+from training_analyzer.metrics import course as course_module
+from training_analyzer.metrics.course import (
+    SPLIT_UNITS_KM,
+    CourseModel,
+    grade_adjustment_pct,
+    split_boundaries,
+)
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def engine(request, monkeypatch):
+    """Run each test against both implementations."""
+    if request.param and not course_module.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(course_module, "HAS_NUMPY", request.param)
+    return request.param
+
+
+GPX = """<?xml version="1.0"?>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1">
+  <trk><trkseg>
+    {points}
+  </trkseg></trk>
+</gpx>"""
+
+
+def _gpx(n=101, step_deg=0.0009, climb_m=0.9):
+    # Due north ~100 m per point, climbing ~0.9 m per point (~0.9%)
+    points = "\n".join(
+        f'<trkpt lat="{45 + i * step_deg:.6f}" lon="7.0"><ele>{100 + i * climb_m:.2f}</ele></trkpt>'
+        for i in range(n)
+    )
+    return GPX.format(points=points)
+
+
+class TestGradeAdjustment:
+    def test_uphill_and_capped_downhill(self):
+        assert grade_adjustment_pct(2.0) == pytest.approx(16.0)
+        assert grade_adjustment_pct(-1.0) == pytest.approx(-3.0)
+        assert grade_adjustment_pct(-10.0) == pytest.approx(-6.0)
+
+    def test_split_boundaries_partial_last(self):
+        assert split_boundaries(2.5, 1.0) == [0.0, 1.0, 2.0, 2.5]
+        assert split_boundaries(3.0, 1.0) == [0.0, 1.0, 2.0, 3.0]
+        with pytest.raises(ValueError):
+            split_boundaries(3.0, 0)
+
+
+class TestSplitAdjustments:
+    def test_constant_grade(self, engine):
+        model = CourseModel([0.0, 5.0], [0.0, 100.0])
+
+        assert model.split_adjustments(1.0) == [16.0] * 5
+        assert model.split_adjustments(SPLIT_UNITS_KM["100m"]) == [16.0] * 50
+
+    def test_climb_then_descent(self, engine):
+        model = CourseModel([0.0, 3.0, 6.0], [0.0, 60.0, 0.0])
+
+        adjustments = model.split_adjustments(1.0)
+
+        assert adjustments[:2] == [16.0, 16.0]
+        assert adjustments[4:] == [-6.0, -6.0]
+        # The summit split averages both sides
+        assert -6.0 < adjustments[2] < 16.0
+        assert -6.0 < adjustments[3] < 16.0
+
+    def test_mile_splits_and_flat_beyond_course(self, engine):
+        model = CourseModel([0.0, 2.0], [0.0, 20.0])
+
+        adjustments = model.split_adjustments(SPLIT_UNITS_KM["mile"], distance_km=5.0)
+
+        assert len(adjustments) == 4
+        assert adjustments[0] == 8.0
+        assert adjustments[-1] == 0.0
+
+    def test_smoothing_removes_gps_noise(self, engine):
+        distances = [i * 0.005 for i in range(401)]
+        noisy = [100 + (3.0 if i % 2 else -3.0) for i in range(401)]
+
+        model = CourseModel(distances, noisy)
+
+        assert model.elevation_gain_m < 10
+        assert all(abs(a) < 1.0 for a in model.split_adjustments(0.5))
+
+    def test_drops_non_increasing_samples(self, engine):
+        model = CourseModel([1.0, 1.0, 2.0, 1.5, 3.0], [10, 11, 20, 99, 30])
+
+        assert model.total_distance_km == pytest.approx(2.0)
+        assert model.split_adjustments(1.0) == [8.0, 8.0]
+
+    def test_engines_agree(self, monkeypatch):
+        if not course_module.HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        distances = [i * 0.013 for i in range(3000)]
+        elevations = [200 + 40 * ((i * 7919) % 97) / 97 + i * 0.02 for i in range(3000)]
+
+        fast = CourseModel(distances, elevations)
+        fast_splits = fast.split_adjustments(0.1)
+        monkeypatch.setattr(course_module, "HAS_NUMPY", False)
+        slow = CourseModel(distances, elevations)
+
+        assert slow.split_adjustments(0.1) == pytest.approx(fast_splits, abs=0.011)
+        assert slow.elevation_gain_m == pytest.approx(fast.elevation_gain_m)
+
+    def test_too_few_points(self):
+        with pytest.raises(ValueError):
+            CourseModel([0.0], [10.0])
+
+
+class TestRescaleAndProfile:
+    def test_rescaled_keeps_shape(self, engine):
+        model = CourseModel([0.0, 2.0, 4.0], [0.0, 40.0, 40.0])
+
+        stretched = model.rescaled(8.0)
+
+        assert stretched.total_distance_km == pytest.approx(8.0)
+        assert stretched.split_adjustments(4.0) == pytest.approx([8.0, 0.0], abs=0.05)
+
+    def test_profile_points(self, engine):
+        model = CourseModel([0.0, 1.05], [0.0, 10.5])
+
+        points = model.profile_points(0.1)
+
+        assert points[0] == (0.0, 0.0)
+        assert points[-1] == (1.05, 10.5)
+        assert len(points) == 12
+
+
+class TestBuilders:
+    def test_from_gpx(self):
+        model = CourseModel.from_gpx(_gpx())
+
+        assert model.total_distance_km == pytest.approx(10.0, rel=0.01)
+        assert model.elevation_gain_m == pytest.approx(90.0, rel=0.01)
+        assert all(a == pytest.approx(7.2, abs=0.1) for a in model.split_adjustments(1.0))
+
+    def test_from_gpx_rejects_invalid(self):
+        with pytest.raises(ValueError):
+            CourseModel.from_gpx("not xml")
+        with pytest.raises(ValueError):
+            CourseModel.from_gpx(GPX.format(points=""))
+
+    def test_from_fit_uses_recorded_distance(self):
+        from fit_tool.fit_file_builder import FitFileBuilder
+        from fit_tool.profile.messages.record_message import RecordMessage
+
+        builder = FitFileBuilder(auto_define=True)
+        for i in range(31):
+            message = RecordMessage()
+            message.timestamp = 1_700_000_000_000 + i * 30_000
+            message.distance = i * 100.0
+            message.altitude = 50.0 + i * 2.0
+            builder.add(message)
+
+        model = CourseModel.from_fit(builder.build().to_bytes())
+
+        assert model.total_distance_km == pytest.approx(3.0)
+        assert model.split_adjustments(1.0) == pytest.approx([16.0] * 3, abs=0.1)
+
+    def test_from_fit_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            CourseModel.from_fit(b"definitely not a fit file")
+
+    def test_from_time_series(self):
+        # Running at 5:00/km for 10 minutes while climbing 1 m every 30 s (1%)
+        pace = [{"timestamp": t, "value": 300.0} for t in range(0, 601, 10)]
+        elevation = [{"timestamp": t, "elevation": 100 + t / 30} for t in range(0, 601, 30)]
+
+        model = CourseModel.from_time_series(elevation, pace, is_running=True)
+
+        assert model.total_distance_km == pytest.approx(2.0)
+        assert model.split_adjustments(1.0) == pytest.approx([8.0, 8.0], abs=0.05)
+
+        scaled = CourseModel.from_time_series(
+            elevation, pace, is_running=True, total_distance_km=2.2
+        )
+        assert scaled.total_distance_km == pytest.approx(2.2)
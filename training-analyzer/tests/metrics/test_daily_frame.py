@@ -0,0 +1,178 @@
+"""Tests for the dense daily frame and its window aggregates."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from training_analyzer.analysis.trends import (
+    build_fitness_frame,
+    detect_overtraining_signals,
+    detect_overtraining_signals_batch,
+)
+from training_analyzer.metrics import daily_frame
+from training_analyzer.metrics.daily_frame import ROWS, DailyFrame
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def engine(request, monkeypatch):
+    """Run each test against both implementations."""
+    if request.param and not daily_frame.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(daily_frame, "HAS_NUMPY", request.param)
+    return request.param
+
+
+START = date(2025, 3, 1)
+
+
+def _records(values, key="load", skip=()):
+    return [
+        {"date": (START + timedelta(days=i)).isoformat(), key: v}
+        for i, v in enumerate(values)
+        if i not in skip
+    ]
+
+
+class TestMaterialize:
+    def test_dense_calendar_with_gaps(self, engine):
+        records = _records([10, 20, 30, 40, 50], skip={2})
+        random.Random(1).shuffle(records)
+
+        frame = DailyFrame.from_records(records, {"load": "load"})
+
+        assert frame.start == START
+        assert frame.length == 5
+        assert frame.values("load") == [10, 20, None, 40, 50]
+        assert frame.count(ROWS, 0, 5) == 4
+
+    def test_undated_records_are_consecutive(self, engine):
+        frame = DailyFrame.from_records(
+            [{"v": 1}, {"v": 2}, {"v": 3}], {"v": "v"}, end=START
+        )
+
+        assert frame.end == START
+        assert frame.values("v") == [1, 2, 3]
+
+    def test_end_cuts_later_records(self, engine):
+        frame = DailyFrame.from_records(
+            _records(range(10)), {"load": "load"}, end=START + timedelta(days=5)
+        )
+
+        assert frame.length == 6
+        assert frame.sum("load", 0, 6) == 15
+
+    def test_column_lengths_must_match(self):
+        with pytest.raises(ValueError):
+            DailyFrame(START, {"a": [1, 2], "b": [1]})
+
+
+class TestWindows:
+    def test_matches_brute_force(self, engine):
+        rng = random.Random(7)
+        values = [rng.choice([None, rng.uniform(-30, 30)]) for _ in range(200)]
+        frame = DailyFrame(START, {"tsb": values})
+
+        for _ in range(300):
+            lo = rng.randrange(0, 200)
+            hi = rng.randrange(lo, 201)
+            present = [v for v in values[lo:hi] if v is not None]
+            assert frame.sum("tsb", lo, hi) == pytest.approx(sum(present))
+            assert frame.count("tsb", lo, hi) == len(present)
+            assert frame.count_where("tsb", "<", -20, lo, hi) == sum(v < -20 for v in present)
+            if present:
+                assert frame.mean("tsb", lo, hi) == pytest.approx(sum(present) / len(present))
+            else:
+                assert frame.mean("tsb", lo, hi) is None
+
+    def test_window_is_clipped(self, engine):
+        frame = DailyFrame(START, {"v": [1] * 10})
+
+        assert frame.window(7) == (3, 10)
+        assert frame.window(30) == (0, 10)
+        assert frame.window(7, end=START + timedelta(days=4)) == (0, 5)
+        assert frame.window(7, end=START - timedelta(days=1)) == (0, 0)
+
+    def test_first_last_and_split_means(self, engine):
+        frame = DailyFrame(START, {"hrv": [None, 60, None, 58, 55, None, 40, 38, 35, None]})
+
+        assert frame.first_present("hrv", 0, 10) == 1
+        assert frame.last_present("hrv", 0, 10) == 8
+        assert frame.first_present("hrv", 9, 10) is None
+        first, second, n = frame.split_means("hrv", 0, 10)
+        assert (first, second, n) == (pytest.approx(57.67, abs=0.01), pytest.approx(37.67, abs=0.01), 6)
+
+    def test_unknown_comparison(self):
+        frame = DailyFrame(START, {"v": [1]})
+        with pytest.raises(ValueError):
+            frame.count_where("v", "!=", 1, 0, 1)
+
+
+class TestOvertrainingSignals:
+    def test_uses_latest_days_regardless_of_order(self):
+        # Newest first, as TrainingDatabase.get_fitness_range returns them
+        history = [
+            {"date": (date.today() - timedelta(days=i)).isoformat(),
+             "acwr": 1.5 if i < 7 else 1.0, "tsb": 0}
+            for i in range(21)
+        ]
+
+        signals = detect_overtraining_signals(history, [])
+
+        assert any("ACWR has been elevated (>1.3) for 7 of the last 7 days" in s for s in signals)
+
+    def test_ctl_decline_with_maintained_load(self):
+        history = [
+            {"date": (START + timedelta(days=i)).isoformat(),
+             "ctl": 60 if i < 7 else 55, "daily_load": 80, "acwr": 1.0, "tsb": 0}
+            for i in range(14)
+        ]
+
+        signals = detect_overtraining_signals(history, [])
+
+        assert any("CTL" in s for s in signals)
+
+    def test_missing_ctl_day_is_not_a_decline(self):
+        # Steady fitness and load, with no CTL recorded for one day of the second week
+        history = [
+            {"date": (START + timedelta(days=i)).isoformat(),
+             "ctl": None if i == 10 else 60, "daily_load": 80, "acwr": 1.0, "tsb": 0}
+            for i in range(14)
+        ]
+
+        signals = detect_overtraining_signals(history, [])
+
+        assert not any("CTL" in s for s in signals)
+
+    def test_batch_matches_single_athlete(self):
+        healthy = [{"date": (START + timedelta(days=i)).isoformat(), "acwr": 1.0, "tsb": 5}
+                   for i in range(14)]
+        strained = [{"date": (START + timedelta(days=i)).isoformat(), "acwr": 1.0, "tsb": -30}
+                    for i in range(14)]
+        wellness = [{"date": (START + timedelta(days=i)).isoformat(), "sleep_score": 50}
+                    for i in range(7)]
+
+        results = detect_overtraining_signals_batch({
+            "a": (healthy, []),
+            "b": (strained, wellness),
+        })
+
+        assert set(results) == {"b"}
+        assert results["b"] == detect_overtraining_signals(strained, wellness)
+
+    def test_batch_as_of(self):
+        strained_last_week = [
+            {"date": (START + timedelta(days=i)).isoformat(), "tsb": -30 if i >= 7 else 0}
+            for i in range(14)
+        ]
+
+        assert detect_overtraining_signals_batch(
+            {"a": (strained_last_week, [])}, as_of=START + timedelta(days=6)
+        ) == {}
+        assert "a" in detect_overtraining_signals_batch({"a": (strained_last_week, [])})
+
+    def test_fitness_frame_columns(self):
+        frame = build_fitness_frame(_records([1, 2, 3], key="ctl"))
+
+        assert frame.values("ctl") == [1, 2, 3]
+        assert frame.values("acwr") == [None, None, None]
@@ -0,0 +1,146 @@
+"""Tests for batched CTL/ATL projection of load scenarios."""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from training_analyzer.metrics import projection
+from training_analyzer.metrics.fitness import calculate_ewma
+from training_analyzer.metrics.projection import (
+    LoadScenario,
+    project_scenarios,
+    steady_scenario,
+    taper_grid,
+    taper_scenario,
+)
+from training_analyzer.services.pattern_recognition_service import PatternRecognitionService
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def engine(request, monkeypatch):
+    """Run each test against both implementations."""
+    if request.param and not projection.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(projection, "HAS_NUMPY", request.param)
+    return request.param
+
+
+def _recurse(start, loads, tau):
+    x, out = start, []
+    for load in loads:
+        x = calculate_ewma(load, x, tau)
+        out.append(x)
+    return out
+
+
+def test_matches_day_by_day_ewma(engine):
+    loads = [(i * 37) % 120 for i in range(900)]
+    scenario = LoadScenario(name="varied", daily_loads=tuple(loads))
+
+    proj = project_scenarios(55.0, 70.0, [scenario])[0]
+
+    assert proj.ctl == pytest.approx(_recurse(55.0, loads, 42), rel=1e-9)
+    assert proj.atl == pytest.approx(_recurse(70.0, loads, 7), rel=1e-9)
+
+
+def test_steady_load_peak_and_race_day(engine):
+    rising, falling = project_scenarios(
+        40.0,
+        50.0,
+        [steady_scenario(60, 30), steady_scenario(20, 30)],
+        race_day=10,
+    )
+
+    assert rising.peak_day == 30
+    assert rising.peak_ctl > 40.0
+    assert rising.race_ctl == rising.ctl[9]
+    assert rising.race_tsb == pytest.approx(rising.ctl[9] - rising.atl[9])
+    assert falling.peak_day is None
+    assert falling.peak_ctl == 40.0
+
+
+def test_deeper_taper_arrives_fresher(engine):
+    scenarios = [taper_scenario(70, 30, 10, r) for r in (0.2, 0.4, 0.6)]
+
+    results = project_scenarios(60.0, 75.0, scenarios, race_day=30)
+    tsbs = [p.race_tsb for p in results]
+    ctls = [p.race_ctl for p in results]
+
+    assert tsbs == sorted(tsbs)
+    assert ctls == sorted(ctls, reverse=True)
+
+
+def test_taper_shapes_and_build():
+    step = taper_scenario(100, 20, 10, 0.5, shape="step")
+    linear = taper_scenario(100, 20, 10, 0.5, shape="linear")
+    expo = taper_scenario(100, 20, 10, 0.5, shape="exponential", days=25)
+    build = taper_scenario(100, 20, 5, 0.5, build_pct_per_week=7)
+
+    assert step.daily_loads[9] == 100 and step.daily_loads[10] == 50
+    assert linear.daily_loads[10] == pytest.approx(95) and linear.daily_loads[19] == pytest.approx(50)
+    assert expo.daily_loads[19] == pytest.approx(50) and len(expo.daily_loads) == 25
+    assert expo.daily_loads[20:] == (100,) * 5
+    assert build.daily_loads[14] > build.daily_loads[0]
+    assert build.daily_loads[19] == pytest.approx(build.daily_loads[14] * 0.5)
+    with pytest.raises(ValueError):
+        taper_scenario(100, 20, 10, 0.5, shape="cliff")
+
+
+def test_grid_and_validation():
+    grid = taper_grid(60, 10)
+
+    assert len(grid) == 2 * 4 * 3  # 14 and 21 day tapers do not fit
+    assert all(len(s.daily_loads) == 10 for s in grid)
+    with pytest.raises(ValueError):
+        project_scenarios(50, 50, [steady_scenario(50, 5), steady_scenario(50, 6)])
+
+
+def _fitness_db(today):
+    db = MagicMock()
+    history = [
+        {"date": (today - timedelta(days=i)).isoformat(), "ctl": 50.0, "atl": 60.0, "tsb": -10.0}
+        for i in range(30)
+    ]
+    db.get_fitness_range.return_value = history
+    db.get_latest_fitness_metrics.return_value = history[0]
+    db.get_activities_range.return_value = [
+        {"date": (today - timedelta(days=i)).isoformat(), "hrss": 70.0} for i in range(28)
+    ]
+    db.get_race_goals.return_value = []
+    return db
+
+
+def test_services_explore_and_predict_share_the_engine():
+    today = date.today()
+    db = _fitness_db(today)
+    service = PatternRecognitionService(db)
+
+    explorer = service.explore_tapers("u", today + timedelta(days=42))
+
+    assert explorer.current_weekly_load == 490.0
+    assert len(explorer.scenarios) == 4 * 4 * 3
+    assert explorer.recommended_scenario in {s.name for s in explorer.scenarios}
+    assert all(len(s.ctl_trajectory) == 42 for s in explorer.scenarios)
+
+    db.reset_mock()
+    prediction = service.predict_peak_fitness("u", target_date=today + timedelta(days=42))
+
+    # Current state, history and weekly loads come from two queries
+    assert db.get_fitness_range.call_count == 1
+    assert db.get_activities_range.call_count == 1
+    assert prediction.projected_tsb_at_target is not None
+    assert prediction.taper_start_date is not None
+    assert len([p for p in prediction.ctl_projection if not p.is_historical]) == 90
+
+
+def test_predict_race_within_a_week_holds_current_load():
+    today = date.today()
+    service = PatternRecognitionService(_fitness_db(today))
+
+    prediction = service.predict_peak_fitness("u", target_date=today + timedelta(days=4))
+
+    steady = project_scenarios(50.0, 60.0, [steady_scenario(70.0, 4)], race_day=4)[0]
+    assert prediction.projected_ctl_at_target == pytest.approx(steady.race_ctl)
+    assert prediction.projected_tsb_at_target == pytest.approx(steady.race_tsb)
+    assert prediction.taper_start_date is None
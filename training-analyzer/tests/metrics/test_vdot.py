@@ -0,0 +1,64 @@
+"""Tests for VDOT race time lookup tables."""
+
+import pytest
+
+from training_analyzer.metrics.vdot import (
+    VDOT_MAX,
+    VDOT_MIN,
+    _predict_time_from_vdot,
+    _solve_time_for_vdot,
+    calculate_vdot,
+    get_vdot_table,
+    predict_performances,
+    predict_race_times,
+)
+
+
+@pytest.mark.parametrize("distance_m", [800, 1609.34, 5000, 10000, 21097.5, 42195, 100000])
+def test_table_matches_solver_within_a_second(distance_m):
+    for i in range(0, 651, 5):
+        vdot = VDOT_MIN + i * 0.1
+        exact = _solve_time_for_vdot(vdot, distance_m)
+        assert _predict_time_from_vdot(vdot, distance_m) == pytest.approx(exact, abs=1.0)
+
+
+def test_table_is_monotone():
+    table = get_vdot_table(42195)
+
+    assert all(a < b for a, b in zip(table.vdots, table.vdots[1:]))
+    assert all(a > b for a, b in zip(table.times, table.times[1:]))
+    assert table.vdots[0] == pytest.approx(VDOT_MIN, abs=1e-3)
+    assert table.vdots[-1] == pytest.approx(VDOT_MAX, abs=1e-3)
+
+
+def test_prediction_round_trips_to_vdot():
+    for vdot in (32.0, 45.5, 61.2, 78.9):
+        time_sec = _predict_time_from_vdot(vdot, 10000)
+        assert calculate_vdot(10000, time_sec) == pytest.approx(vdot, abs=0.05)
+
+
+def test_out_of_range_vdot_is_clamped():
+    assert _predict_time_from_vdot(120, 5000) == pytest.approx(
+        _predict_time_from_vdot(VDOT_MAX, 5000)
+    )
+    assert _predict_time_from_vdot(10, 5000) == pytest.approx(
+        _predict_time_from_vdot(VDOT_MIN, 5000)
+    )
+
+
+def test_custom_distances():
+    predictions = predict_race_times(50, {"Mile": 1609.34})
+
+    assert list(predictions) == ["Mile"]
+    assert predictions["Mile"]["distance_km"] == pytest.approx(1.60934)
+    assert predictions["Mile"]["time_sec"] < predict_race_times(50)["5K"]["time_sec"]
+
+
+def test_batch_predictions_keep_order_and_match_single_calls():
+    results = predict_performances([50, 42.3, 50.0])
+
+    assert [r["vdot"] for r in results] == [50.0, 42.3, 50.0]
+    assert results[1]["race_predictions"] == predict_race_times(42.3)
+    assert set(results[0]["pace_zones"]) == {
+        "easy", "marathon", "threshold", "interval", "repetition"
+    }
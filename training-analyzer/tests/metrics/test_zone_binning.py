@@ -0,0 +1,146 @@
+"""Tests for the time-in-zone binning engine."""
+
+import random
+
+import pytest
+
+from training_analyzer.analysis.condensation import calculate_hr_summary
+from training_analyzer.metrics import zone_binning
+from training_analyzer.metrics.power import calculate_power_zones, get_zone_for_power
+from training_analyzer.metrics.zone_binning import (
+    ZoneBoundaries,
+    bin_zone_times,
+    bin_zone_times_batch,
+    classify_zones,
+)
+from training_analyzer.metrics.zones import calculate_hr_zones_karvonen, get_zone_for_hr
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def engine(request, monkeypatch):
+    """Run each test against both implementations."""
+    if request.param and not zone_binning.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(zone_binning, "HAS_NUMPY", request.param)
+    return request.param
+
+
+def test_hr_classification_matches_get_zone_for_hr(engine):
+    zones = calculate_hr_zones_karvonen(max_hr=185, rest_hr=55)
+    samples = list(range(60, 200))
+
+    times = bin_zone_times(samples, zones.boundaries())
+
+    expected = [0.0] * 6
+    for hr in samples:
+        expected[get_zone_for_hr(hr, zones)] += 1
+    assert times.seconds == expected
+    assert classify_zones(samples, zones.boundaries()) == [
+        get_zone_for_hr(hr, zones) for hr in samples
+    ]
+
+
+def test_power_classification_matches_get_zone_for_power(engine):
+    zones = calculate_power_zones(250)
+    boundaries = ZoneBoundaries(
+        uppers=tuple(zones[z][1] for z in range(1, 7)), skip_non_positive=True
+    )
+    samples = [0, -5] + list(range(1, 600, 3))
+
+    times = bin_zone_times(samples, boundaries)
+
+    expected = [0.0] * 8
+    for watts in samples[2:]:
+        expected[get_zone_for_power(watts, zones)] += 1
+    assert times.seconds == expected
+
+
+def test_pace_zones_are_descending(engine):
+    # Zone 1 slower than 6:00/km, zone 2 to 5:00/km, zone 3 faster
+    boundaries = ZoneBoundaries(uppers=(360, 300), descending=True)
+
+    times = bin_zone_times([400, 360, 330, 300, 280], boundaries)
+
+    assert times.seconds == [0.0, 2.0, 2.0, 1.0]
+
+
+def test_time_weighting_skips_pauses(engine):
+    boundaries = ZoneBoundaries(uppers=(140,))
+    # 1 Hz, then smart recording every 5 s, then a 10-minute pause
+    timestamps = [0, 1, 2, 7, 12, 612, 613]
+    values = [120, 120, 150, 150, 150, 120, 120]
+
+    times = bin_zone_times(values, boundaries, timestamps, max_gap_sec=10)
+
+    # 150 bpm: 5 + 5 + (pause counted as 1 s); 120 bpm: 1 + 1 + 1 + last sample
+    assert times.seconds == [0.0, 4.0, 11.0]
+
+
+def test_empty_stream(engine):
+    assert bin_zone_times([], ZoneBoundaries(uppers=(140,)), []).seconds == [0.0, 0.0, 0.0]
+
+
+def test_missing_samples_are_ignored(engine):
+    boundaries = ZoneBoundaries(uppers=(140,))
+
+    times = bin_zone_times([None, 120, None, 150], boundaries)
+
+    assert times.seconds == [0.0, 1.0, 1.0]
+
+
+def test_batch_matches_single_streams(engine):
+    rng = random.Random(7)
+    zones = calculate_hr_zones_karvonen(max_hr=190, rest_hr=50)
+    streams = []
+    for length in (0, 1, 50, 3600):
+        values = [rng.randint(80, 195) for _ in range(length)]
+        timestamps = sorted(rng.uniform(0, length * 2) for _ in range(length))
+        streams.append((values, timestamps))
+    streams.append(([150, 160, 170], None))
+
+    batch = bin_zone_times_batch(streams, zones.boundaries())
+
+    for (values, timestamps), result in zip(streams, batch):
+        single = bin_zone_times(values, zones.boundaries(), timestamps)
+        assert result.seconds == pytest.approx(single.seconds)
+
+
+def test_engines_agree_on_random_streams(monkeypatch):
+    if not zone_binning.HAS_NUMPY:
+        pytest.skip("numpy not installed")
+    rng = random.Random(3)
+    boundaries = ZoneBoundaries(uppers=(120, 140, 160, 175), floor=100)
+    values = [rng.choice([None, rng.uniform(60, 200)]) for _ in range(5000)]
+    timestamps = sorted(rng.uniform(0, 20000) for _ in range(5000))
+
+    vectorized = bin_zone_times(values, boundaries, timestamps).seconds
+    monkeypatch.setattr(zone_binning, "HAS_NUMPY", False)
+    pure = bin_zone_times(values, boundaries, timestamps).seconds
+
+    assert vectorized == pytest.approx(pure)
+
+
+def test_hr_summary_uses_time_in_zone():
+    hr_zones = {1: (100, 130), 2: (130, 150), 3: (150, 200)}
+    # Few samples at 160 bpm but recorded every 10 s; many 1 Hz samples at 120
+    points = [{"timestamp": t, "hr": 120} for t in range(30)]
+    points += [{"timestamp": 30 + 10 * i, "hr": 160} for i in range(20)]
+
+    summary = calculate_hr_summary(points, hr_zones, duration_sec=230)
+
+    assert summary.dominant_zone == 3
+    assert summary.zone_transitions == 1
+
+
+def test_hr_summary_skips_samples_outside_zones():
+    hr_zones = {1: (100, 130), 2: (140, 160)}
+    # Samples above zone 2 and in the 131-139 gap fall in no zone
+    points = [{"timestamp": t, "hr": 120} for t in range(10)]
+    points += [{"timestamp": 10 + t, "hr": 135 if t % 2 else 190} for t in range(40)]
+    points += [{"timestamp": 50 + t, "hr": 150} for t in range(5)]
+
+    summary = calculate_hr_summary(points, hr_zones, duration_sec=55)
+
+    assert summary.dominant_zone == 1
+    assert summary.zone_transitions == 1
+    assert summary.is_interval_workout is False
@@ -0,0 +1,263 @@
+"""Tests for the incremental achievement ledger."""
+
+import sqlite3
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from training_analyzer.db.database import ActivityMetrics, GarminFitnessData, TrainingDatabase
+from training_analyzer.services.achievement_service import AchievementLedger, AchievementService
+from training_analyzer.services.manual_workout_service import (
+    ManualWorkoutCreate,
+    ManualWorkoutService,
+)
+
+
+def make_activity(activity_id, day, duration=60.0, zone4=5.0, zone5=0.0):
+    return ActivityMetrics(
+        activity_id=activity_id,
+        date=day,
+        activity_type="running",
+        activity_name="Run",
+        hrss=50.0,
+        trimp=60.0,
+        avg_hr=150,
+        max_hr=175,
+        duration_min=duration,
+        distance_km=10.0,
+        pace_sec_per_km=330.0,
+        zone1_pct=10.0,
+        zone2_pct=50.0,
+        zone3_pct=30.0,
+        zone4_pct=zone4,
+        zone5_pct=zone5,
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "training.db"
+    TrainingDatabase(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def service(db_path):
+    return AchievementService(db_path)
+
+
+def unlocked(service, user_id):
+    return {a.achievement.id for a in service.get_user_achievements(user_id)}
+
+
+class TestLedger:
+    def test_activity_counters_and_streak(self):
+        ledger = AchievementLedger()
+        ledger.apply_activity("2024-01-01", duration_min=60, zone4_pct=15, zone5_pct=10)
+        ledger.apply_activity("2024-01-02", duration_min=30, zone4_pct=5, zone5_pct=0)
+        ledger.apply_activity("2024-01-03T07:00:00", duration_min=40)
+
+        assert ledger.workout_count == 3
+        assert ledger.interval_workout_count == 1
+        assert ledger.zone5_minutes == pytest.approx(6.0)
+        assert ledger.current_streak == 3
+        assert ledger.longest_streak == 3
+
+    def test_out_of_order_activity_does_not_break_streak(self):
+        ledger = AchievementLedger()
+        ledger.apply_activity("2024-01-05")
+        ledger.apply_activity("2024-01-06")
+        ledger.apply_activity("2024-01-01")
+
+        assert ledger.current_streak == 2
+        assert ledger.last_activity_date == "2024-01-06"
+
+    def test_vo2max_trend_counts_rising_weeks(self):
+        ledger = AchievementLedger()
+        start = date(2024, 1, 1)  # Monday
+        for week, value in enumerate([50, 51, 52, 53, 54, 55]):
+            ledger.apply_vo2max((start + timedelta(weeks=week)).isoformat(), value)
+
+        # The current week is still open, so four rising weeks are closed
+        assert ledger.vo2max_trend_weeks == 4
+        assert ledger.vo2max_improvement_pct == pytest.approx(10.0)
+
+    def test_vo2max_trend_resets_after_gap(self):
+        ledger = AchievementLedger()
+        for day, value in [("2024-01-01", 50), ("2024-01-08", 51), ("2024-01-29", 52),
+                           ("2024-02-05", 53)]:
+            ledger.apply_vo2max(day, value)
+
+        assert ledger.vo2max_trend_weeks == 0
+
+
+class TestRecordActivity:
+    def test_record_activity_is_idempotent(self, service):
+        activity = make_activity("a1", "2024-01-01")
+
+        first = service.record_activity(activity, "u1")
+        second = service.record_activity(activity, "u1")
+
+        assert [a.achievement.id for a in first.new_achievements] == ["first_workout"]
+        assert second.new_achievements == []
+        assert service.get_ledger("u1").workout_count == 1
+
+    def test_streak_achievements_unlock_incrementally(self, service):
+        for day in range(3):
+            response = service.record_activity(
+                make_activity(f"a{day}", f"2024-01-0{day + 1}"), "u1"
+            )
+
+        assert "streak_3" in [a.achievement.id for a in response.new_achievements]
+        assert response.current_streak == 3
+        assert service.get_user_progress("u1").streak.current == 3
+
+    def test_unlocks_are_per_user(self, service):
+        service.record_activity(make_activity("a1", "2024-01-01"), "u1")
+
+        assert "first_workout" in unlocked(service, "u1")
+        assert unlocked(service, "u2") == set()
+        assert service.get_user_progress("u2").total_xp == 0
+
+
+class TestRebuildLedger:
+    def test_backfill_of_long_history_is_fast(self, db_path):
+        training_db = TrainingDatabase(db_path)
+        start = date(2019, 1, 1)
+        for i in range(2000):
+            training_db.save_activity_metrics(make_activity(
+                f"a{i}", (start + timedelta(days=i)).isoformat(),
+                zone4=15.0, zone5=10.0,
+            ))
+
+        service = AchievementService(db_path)
+        started = time.perf_counter()
+        ledger = service.rebuild_ledger("default")
+        response = service.check_and_unlock_achievements(
+            {"activity_date": "2024-06-30"}, "default"
+        )
+        elapsed = time.perf_counter() - started
+
+        assert ledger.workout_count == 2000
+        assert ledger.interval_workout_count == 2000
+        assert ledger.longest_streak == 2000
+        earned = {a.achievement.id for a in response.new_achievements}
+        assert {"first_workout", "interval_master", "zone5_warrior"} <= earned
+        assert elapsed < 5
+
+    def test_backfill_reads_vo2max_history(self, db_path):
+        training_db = TrainingDatabase(db_path)
+        start = date(2024, 1, 1)
+        for week, value in enumerate([50.0, 51.0, 52.0, 53.0, 54.0, 55.0, 56.0]):
+            training_db.save_garmin_fitness_data(GarminFitnessData(
+                date=(start + timedelta(weeks=week)).isoformat(),
+                vo2max_running=value,
+            ))
+
+        service = AchievementService(db_path)
+        response = service.check_and_unlock_achievements(
+            {"activity_date": "2024-02-15"}, "default"
+        )
+
+        earned = {a.achievement.id for a in response.new_achievements}
+        assert {"vo2max_first", "vo2max_up_10", "vo2max_trend_4w", "vo2max_pr"} <= earned
+        assert "vo2max_up_15" not in earned
+
+
+class TestLedgerFreshness:
+    """Ledgers follow activity changes made outside record_activity."""
+
+    def test_new_user_does_not_inherit_local_activities(self, db_path, service):
+        training_db = TrainingDatabase(db_path)
+        training_db.save_activity_metrics(make_activity("a1", "2024-01-01"))
+        training_db.save_garmin_fitness_data(
+            GarminFitnessData(date="2024-01-01", vo2max_running=50.0)
+        )
+
+        assert service.rebuild_ledger("u2").workout_count == 0
+        assert service.get_ledger("u2").vo2max_latest == 0
+        assert service.get_ledger("default").workout_count == 1
+        assert service.get_ledger("default").vo2max_latest == 50.0
+
+    def test_unrecorded_sync_refreshes_local_ledger(self, db_path, service):
+        training_db = TrainingDatabase(db_path)
+        training_db.save_activity_metrics(make_activity("a1", "2024-01-01"))
+        assert service.get_ledger("default").workout_count == 1
+
+        # e.g. the manual Garmin sync route or a Strava import
+        training_db.save_activity_metrics(make_activity("a2", "2024-01-02", zone5=50.0))
+
+        ledger = service.get_ledger("default")
+        assert ledger.workout_count == 2
+        assert ledger.current_streak == 2
+        assert ledger.zone5_minutes == pytest.approx(30.0)
+
+    def test_recorded_activity_moves_to_its_user(self, db_path, service):
+        training_db = TrainingDatabase(db_path)
+        activity = make_activity("a1", "2024-01-01")
+        training_db.save_activity_metrics(activity)
+        assert service.get_ledger("default").workout_count == 1
+
+        service.record_activity(activity, "u1")
+
+        assert service.get_ledger("u1").workout_count == 1
+        assert service.get_ledger("default").workout_count == 0
+
+    def test_edits_and_deletes_rebuild_owner_ledger(self, db_path, service):
+        training_db = TrainingDatabase(db_path)
+        activity = make_activity("a1", "2024-01-01")
+        training_db.save_activity_metrics(activity)
+        service.record_activity(activity, "u1")
+
+        # Re-syncing an unchanged activity keeps the ledger
+        training_db.save_activity_metrics(activity)
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM achievement_ledger WHERE user_id = 'u1'"
+            ).fetchone()[0] == 1
+
+        training_db.save_activity_metrics(make_activity("a1", "2024-01-01", zone5=50.0))
+        assert service.get_ledger("u1").zone5_minutes == pytest.approx(30.0)
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DELETE FROM activity_metrics WHERE activity_id = 'a1'")
+        assert service.get_ledger("u1").workout_count == 0
+
+    def test_manual_workouts_count_for_their_user(self, db_path, service):
+        activity = make_activity("a1", "2024-01-01")
+        TrainingDatabase(db_path).save_activity_metrics(activity)
+        service.record_activity(activity, "u1")
+        ManualWorkoutService(db_path).log_manual_workout(
+            "u1",
+            ManualWorkoutCreate(date="2024-01-02", duration_min=45, rpe=6),
+        )
+
+        ledger = service.get_ledger("u1")
+        assert ledger.workout_count == 2
+        assert ledger.current_streak == 2
+        assert service.get_ledger("u2").workout_count == 0
+
+
+def test_migrates_single_user_unlocks(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE user_achievements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            achievement_id TEXT NOT NULL UNIQUE,
+            unlocked_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            workout_id TEXT,
+            metadata_json TEXT
+        );
+        INSERT INTO user_achievements (achievement_id, unlocked_at)
+        VALUES ('first_workout', '2024-01-01T08:00:00');
+    """)
+    conn.close()
+
+    service = AchievementService(path)
+
+    assert unlocked(service, "default") == {"first_workout"}
+    # Another user can now unlock the same achievement
+    service.record_activity(make_activity("a1", "2024-01-01"), "u1")
+    assert "first_workout" in unlocked(service, "u1")
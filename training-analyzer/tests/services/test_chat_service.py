@@ -0,0 +1,263 @@
+"""Tests for ChatService token accounting and history building."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from training_analyzer.services.chat_service import (
+    ChatMessage,
+    ChatRequest,
+    ChatService,
+    ConversationContext,
+)
+from training_analyzer.exceptions import ConversationNotFoundError
+
+
+def _make_service(**kwargs) -> ChatService:
+    agent = MagicMock()
+    agent.chat = AsyncMock(return_value={"response": "Nice work!", "intent": "general"})
+    return ChatService(chat_agent=agent, **kwargs)
+
+
+class TestChatMessageTokens:
+    """Tests for per-message token counts."""
+
+    def test_token_count_computed_on_creation(self):
+        """Token count includes the role overhead."""
+        msg = ChatMessage(role="user", content="hello")
+
+        # 1 token for "hello" + 4 overhead
+        assert msg.token_count == 5
+
+    def test_stored_token_count_not_recomputed(self):
+        """Restoring a message keeps its stored count without tokenizing."""
+        with patch(
+            "training_analyzer.services.chat_service.count_single_message_tokens"
+        ) as counter:
+            msg = ChatMessage(role="user", content="hello", token_count=9)
+
+        counter.assert_not_called()
+        assert msg.token_count == 9
+
+
+class TestConversationContext:
+    """Tests for running token totals."""
+
+    def test_add_message_updates_total(self):
+        conversation = ConversationContext(conversation_id="c1")
+        conversation.add_message(ChatMessage(role="user", content="a", token_count=10))
+        conversation.add_message(ChatMessage(role="assistant", content="b", token_count=7))
+
+        assert conversation.total_tokens == 17
+
+    def test_trim_to_subtracts_removed(self):
+        conversation = ConversationContext(conversation_id="c1")
+        for count in (10, 20, 30):
+            conversation.add_message(ChatMessage(role="user", content="x", token_count=count))
+
+        conversation.trim_to(2)
+
+        assert [m.token_count for m in conversation.messages] == [20, 30]
+        assert conversation.total_tokens == 50
+
+    def test_total_restored_from_messages(self):
+        """Contexts restored from older cache entries recover their total."""
+        conversation = ConversationContext(
+            conversation_id="c1",
+            messages=[
+                {"role": "user", "content": "x", "token_count": 12},
+                {"role": "assistant", "content": "y", "token_count": 8},
+            ],
+        )
+
+        assert conversation.total_tokens == 20
+
+
+class TestBuildHistory:
+    """Tests for token-budgeted history selection."""
+
+    def _conversation(self, counts):
+        conversation = ConversationContext(conversation_id="c1")
+        for i, count in enumerate(counts):
+            role = "user" if i % 2 == 0 else "assistant"
+            conversation.add_message(
+                ChatMessage(role=role, content=f"m{i}", token_count=count)
+            )
+        return conversation
+
+    def test_whole_conversation_fits(self):
+        service = _make_service(history_token_budget=100)
+        history = service._build_history_for_agent(self._conversation([10, 20, 30]))
+
+        assert [h["content"] for h in history] == ["m0", "m1", "m2"]
+        assert [h["token_count"] for h in history] == [10, 20, 30]
+
+    def test_keeps_most_recent_within_budget(self):
+        service = _make_service(history_token_budget=55)
+        history = service._build_history_for_agent(self._conversation([40, 10, 20, 30]))
+
+        assert [h["content"] for h in history] == ["m2", "m3"]
+
+    def test_summarizes_older_turns(self):
+        summarizer = MagicMock(return_value="athlete asked about tempo runs")
+        service = _make_service(history_token_budget=350, history_summarizer=summarizer)
+        history = service._build_history_for_agent(self._conversation([310, 20, 25]))
+
+        dropped = summarizer.call_args[0][0]
+        assert [m.content for m in dropped] == ["m0"]
+        assert history[0]["role"] == "system"
+        assert "tempo runs" in history[0]["content"]
+        assert [h["content"] for h in history[1:]] == ["m1", "m2"]
+
+    def test_summarizer_failure_falls_back_to_window(self):
+        summarizer = MagicMock(side_effect=RuntimeError("boom"))
+        service = _make_service(history_token_budget=350, history_summarizer=summarizer)
+        history = service._build_history_for_agent(self._conversation([310, 20, 25]))
+
+        assert [h["content"] for h in history] == ["m1", "m2"]
+
+
+class TestProcessMessage:
+    """Tests for history passed to the agent."""
+
+    @pytest.mark.asyncio
+    async def test_history_respects_budget_across_turns(self):
+        service = _make_service(history_token_budget=50)
+
+        first = await service.process_message(ChatRequest(message="How was my week?"))
+        await service.process_message(
+            ChatRequest(message="And today?", conversation_id=first.conversation_id)
+        )
+
+        history = service._chat_agent.chat.call_args.kwargs["conversation_history"]
+        assert sum(h["token_count"] for h in history) <= 50
+        conversation = await service.get_conversation_history(first.conversation_id)
+        assert conversation.total_tokens == sum(
+            m.token_count for m in conversation.messages
+        )
+
+
+class TestConversationStore:
+    """Tests for the durable conversation store and hot tier."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        from training_analyzer.db.repositories.chat_repository import ChatRepository
+
+        return ChatRepository(db_path=str(tmp_path / "chat.db"))
+
+    @pytest.mark.asyncio
+    async def test_conversation_survives_restart(self, store):
+        service = _make_service(conversation_store=store)
+        first = await service.process_message(
+            ChatRequest(message="How was my week?"), user_id="user-1"
+        )
+
+        restarted = _make_service(conversation_store=store)
+        history = await restarted.get_agent_history(first.conversation_id)
+
+        assert [h["role"] for h in history] == ["user", "assistant"]
+        assert history[0]["content"] == "How was my week?"
+        assert store.get_conversation(first.conversation_id).user_id == "user-1"
+
+    @pytest.mark.asyncio
+    async def test_lazy_load_limits_messages(self, store):
+        for i in range(30):
+            store.append_messages(
+                "conv-1",
+                [ChatMessage(role="user", content=f"m{i}").to_record()],
+            )
+        service = _make_service(conversation_store=store)
+        service.MAX_HISTORY_LENGTH = 4
+
+        conversation = await service.get_conversation_history("conv-1")
+
+        assert [m.content for m in conversation.messages] == ["m26", "m27", "m28", "m29"]
+        assert conversation.stored_message_count == 30
+
+    @pytest.mark.asyncio
+    async def test_picks_up_messages_from_other_worker(self, store):
+        worker_a = _make_service(conversation_store=store)
+        worker_b = _make_service(conversation_store=store)
+        first = await worker_a.process_message(ChatRequest(message="Hi"))
+        conversation_id = first.conversation_id
+
+        # Worker A has the conversation hot; worker B appends to it
+        await worker_b.record_exchange(conversation_id, "Second question", "Second answer")
+
+        history = await worker_a.get_agent_history(conversation_id)
+        assert [h["content"] for h in history][-2:] == ["Second question", "Second answer"]
+
+    @pytest.mark.asyncio
+    async def test_clear_removes_from_store(self, store):
+        service = _make_service(conversation_store=store)
+        first = await service.process_message(ChatRequest(message="Hi"))
+
+        assert await service.clear_conversation(first.conversation_id) is True
+        assert store.get_conversation(first.conversation_id) is None
+        assert await service.get_conversation_history(first.conversation_id) is None
+
+    @pytest.mark.asyncio
+    async def test_other_users_conversation_is_not_found(self, store):
+        service = _make_service(conversation_store=store)
+        first = await service.process_message(
+            ChatRequest(message="How was my week?"), user_id="user-1"
+        )
+        conversation_id = first.conversation_id
+
+        assert await service.get_conversation_history(conversation_id, user_id="user-2") is None
+        assert await service.get_agent_history(conversation_id, user_id="user-2") == []
+        assert await service.clear_conversation(conversation_id, user_id="user-2") is False
+        assert store.get_conversation(conversation_id) is not None
+
+        assert await service.get_conversation_history(conversation_id, user_id="user-1") is not None
+        assert await service.clear_conversation(conversation_id, user_id="user-1") is True
+
+    @pytest.mark.asyncio
+    async def test_other_user_cannot_continue_conversation(self, store):
+        service = _make_service(conversation_store=store)
+        first = await service.process_message(
+            ChatRequest(message="my secret injury"), user_id="alice"
+        )
+        conversation_id = first.conversation_id
+        service._chat_agent.chat.reset_mock()
+
+        with pytest.raises(ConversationNotFoundError):
+            await service.process_message(
+                ChatRequest(message="What did Alice say?", conversation_id=conversation_id),
+                user_id="bob",
+            )
+        with pytest.raises(ConversationNotFoundError):
+            await service.record_exchange(conversation_id, "Hi", "Hello", user_id="bob")
+        with pytest.raises(ConversationNotFoundError):
+            await service.check_conversation_access(conversation_id, user_id="bob")
+
+        service._chat_agent.chat.assert_not_called()
+        restarted = _make_service(conversation_store=store)
+        history = await restarted.get_agent_history(conversation_id, user_id="alice")
+        assert [h["content"] for h in history] == ["my secret injury", "Nice work!"]
+        await service.check_conversation_access(conversation_id, user_id="alice")
+        await service.check_conversation_access("new-conversation", user_id="bob")
+
+    @pytest.mark.asyncio
+    async def test_hot_tier_evicts_idle_conversations(self, store):
+        service = _make_service(conversation_store=store)
+        first = await service.process_message(ChatRequest(message="Hi"))
+        conversation_id = first.conversation_id
+        service._touched_at[conversation_id] -= service.CONVERSATION_TTL_SECONDS + 1
+
+        service._evict_expired()
+
+        assert conversation_id not in service._conversations
+        # Still recoverable from the store
+        assert await service.get_conversation_history(conversation_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_hot_tier_is_bounded(self):
+        service = _make_service()
+        service.MAX_HOT_CONVERSATIONS = 2
+        for _ in range(3):
+            await service.process_message(ChatRequest(message="Hi"))
+
+        assert len(service._conversations) == 2
+        assert len(service._touched_at) == 2
@@ -0,0 +1,167 @@
+"""Tests for the batched data retention purge."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from training_analyzer.db.database import TrainingDatabase
+from training_analyzer.services.data_retention_service import DataRetentionService
+
+
+@pytest.fixture(autouse=True)
+def settings():
+    settings = SimpleNamespace(
+        retention_sessions_days=30,
+        retention_ai_usage_logs_days=90,
+        retention_sync_history_days=90,
+        retention_activity_data_days=0,
+        retention_chat_conversations_days=180,
+        retention_batch_size=50,
+        retention_batch_pause_ms=0,
+        retention_vacuum_pages=16,
+    )
+    with patch(
+        "training_analyzer.services.data_retention_service.get_settings",
+        return_value=settings,
+    ):
+        yield settings
+
+
+@pytest.fixture
+def training_db(tmp_path):
+    return TrainingDatabase(str(tmp_path / "training.db"))
+
+
+@pytest.fixture
+def service(training_db):
+    return DataRetentionService(training_db)
+
+
+def iso_days_ago(days):
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+
+def add_sync_history(training_db, count, days_ago):
+    with sqlite3.connect(training_db.db_path) as conn:
+        conn.executemany(
+            """
+            INSERT INTO garmin_sync_history (user_id, sync_type, started_at, error_message)
+            VALUES ('u1', 'scheduled', ?, ?)
+            """,
+            [(iso_days_ago(days_ago), "x" * 2000) for _ in range(count)],
+        )
+
+
+def count_rows(training_db, table):
+    with sqlite3.connect(training_db.db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_purge_deletes_in_batches(service, training_db, monkeypatch):
+    add_sync_history(training_db, 120, days_ago=200)
+    add_sync_history(training_db, 10, days_ago=1)
+    add_sync_history(training_db, 100, days_ago=300)
+
+    batches = []
+    original = training_db._get_connection
+
+    def counting_connection():
+        batches.append(1)
+        return original()
+
+    monkeypatch.setattr(training_db, "_get_connection", counting_connection)
+    result = service.cleanup_sync_history(retention_days=90)
+
+    assert result.success
+    assert result.records_deleted == 220
+    assert count_rows(training_db, "garmin_sync_history") == 10
+    # Five batches of at most 50 rows, plus the table check and final probe
+    assert len(batches) >= 5
+
+
+def test_purge_skips_missing_table(service):
+    assert service._purge("no_such_table", "1 = 1") == 0
+
+
+def test_ai_request_logs_are_purged(service, training_db):
+    with sqlite3.connect(training_db.db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE ai_usage_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                request_id TEXT UNIQUE NOT NULL,
+                created_at TEXT,
+                model_id TEXT NOT NULL,
+                analysis_type TEXT NOT NULL
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO ai_usage_logs (request_id, created_at, model_id, analysis_type) "
+            "VALUES (?, ?, 'gpt', 'chat')",
+            [(f"r{i}", iso_days_ago(364.5 - i)) for i in range(365)],
+        )
+
+    result = service.cleanup_ai_usage_logs(retention_days=90)
+
+    assert result.success
+    assert result.records_deleted == 275
+    assert count_rows(training_db, "ai_usage_logs") == 90
+
+
+def test_inactive_chat_conversations_are_purged(service, training_db):
+    from training_analyzer.db.repositories.chat_repository import (
+        ChatMessageRecord,
+        ChatRepository,
+    )
+
+    chat_repo = ChatRepository(str(training_db.db_path))
+    for conversation_id in ("old", "new"):
+        chat_repo.append_messages(conversation_id, [ChatMessageRecord(role="user", content="hi")])
+    with sqlite3.connect(training_db.db_path) as conn:
+        conn.execute(
+            "UPDATE chat_conversations SET last_activity = ? WHERE id = 'old'",
+            ((datetime.utcnow() - timedelta(days=200)).isoformat(),),
+        )
+
+    result = service.cleanup_chat_conversations()
+
+    assert result.success
+    assert result.records_deleted == 1
+    assert chat_repo.get_conversation("old") is None
+    assert chat_repo.get_recent_messages("old", limit=5) == []
+    assert chat_repo.get_conversation("new") is not None
+
+
+def test_chat_cleanup_without_chat_tables(service):
+    result = service.cleanup_chat_conversations()
+
+    assert result.success
+    assert result.records_deleted == 0
+
+
+def test_full_cleanup_reclaims_space(service, training_db):
+    add_sync_history(training_db, 500, days_ago=200)
+
+    report = service.run_full_cleanup()
+
+    assert report.total_deleted >= 500
+    assert report.bytes_reclaimed > 0
+    assert report.free_bytes == 0
+    assert report.to_dict()["bytes_reclaimed"] == report.bytes_reclaimed
+
+
+def test_enable_incremental_vacuum_on_legacy_database(tmp_path):
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE legacy (id INTEGER PRIMARY KEY)")
+    service = DataRetentionService(TrainingDatabase(str(path)))
+
+    assert service.reclaim_space() == 0
+    assert service.enable_incremental_vacuum() is True
+    assert service.enable_incremental_vacuum() is False
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
@@ -0,0 +1,214 @@
+"""Tests for the cached explanation factors."""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from training_analyzer.db.database import (
+    ActivityMetrics,
+    TrainingDatabase,
+    WellnessHRVRecord,
+    WellnessSleepRecord,
+)
+from training_analyzer.recommendations.factors import (
+    DEFAULT_DAYS_SINCE_HARD,
+    DEFAULT_DAYS_SINCE_LONG,
+    LOOKBACK_DAYS,
+    ExplanationFactors,
+    compute_explanation_factors,
+)
+from training_analyzer.services.explanation_factor_service import ExplanationFactorService
+
+
+TARGET = date(2024, 3, 15)
+
+
+def _day(offset):
+    return (TARGET - timedelta(days=offset)).isoformat()
+
+
+def _activity(activity_id, day, **values):
+    fields = dict(
+        activity_id=activity_id,
+        date=day,
+        activity_name=None,
+        avg_hr=None,
+        max_hr=None,
+        pace_sec_per_km=None,
+        zone1_pct=None,
+        zone2_pct=None,
+        zone3_pct=None,
+        zone4_pct=None,
+        zone5_pct=None,
+        activity_type="running",
+        trimp=None,
+        distance_km=None,
+    )
+    fields.update(values)
+    return ActivityMetrics(**fields)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return TrainingDatabase(str(tmp_path / "training.db"))
+
+
+@pytest.fixture
+def service(db):
+    return ExplanationFactorService(training_db=db)
+
+
+def _cached_days(db):
+    with db._get_connection() as conn:
+        return [row[0] for row in conn.execute(
+            "SELECT date FROM explanation_factors ORDER BY date"
+        )]
+
+
+class TestComputeExplanationFactors:
+    def test_recency_in_one_pass(self):
+        activities = [
+            {"date": _day(1), "duration_min": 40, "hrss": 30},
+            {"date": _day(2), "duration_min": 50, "hrss": 90},
+            {"date": _day(4), "duration_min": 95, "trimp": 80},
+            {"date": _day(5), "duration_min": 30, "trimp": 120},
+            # Outside the window or after the target day
+            {"date": _day(LOOKBACK_DAYS + 1), "duration_min": 150, "hrss": 200},
+            {"date": _day(-1), "duration_min": 150, "hrss": 200},
+        ]
+
+        factors = compute_explanation_factors(activities, {}, TARGET)
+
+        assert factors.days_since_hard == 2
+        assert factors.days_since_long == 4
+        assert factors.days_since_rest == 3
+        assert factors.session_count == 4
+        assert factors.hard_session_count == 2
+        assert factors.long_session_count == 1
+        assert factors.active_days == 4
+        assert factors.total_duration_min == 215
+        assert factors.total_load == 30 + 90 + 80 + 120
+
+    def test_defaults_without_activities(self):
+        factors = compute_explanation_factors([], {}, TARGET)
+
+        assert factors.days_since_hard == DEFAULT_DAYS_SINCE_HARD
+        assert factors.days_since_long == DEFAULT_DAYS_SINCE_LONG
+        assert factors.days_since_rest == 1
+        assert factors.intensity_mix == {}
+
+    def test_rest_capped_at_window(self):
+        activities = [{"date": _day(i), "duration_min": 30} for i in range(LOOKBACK_DAYS + 1)]
+
+        assert compute_explanation_factors(activities, {}, TARGET).days_since_rest == LOOKBACK_DAYS
+
+    def test_intensity_mix(self):
+        activities = [
+            {"date": _day(1), "duration_min": 60, "zone1_pct": 20, "zone2_pct": 60, "zone3_pct": 20},
+            {"date": _day(2), "duration_min": 40, "zone3_pct": 50, "zone4_pct": 25, "zone5_pct": 25},
+        ]
+
+        mix = compute_explanation_factors(activities, {}, TARGET).intensity_mix
+
+        assert mix == {"low": 48.0, "moderate": 32.0, "high": 20.0}
+
+    def test_wellness_deltas(self):
+        wellness = {
+            _day(0): {"hrv": {"hrv_last_night_avg": 40}, "sleep": {"total_sleep_hours": 6.0}},
+            _day(1): {"hrv": {"hrv_last_night_avg": 50}, "sleep": {"total_sleep_hours": 8.0}},
+            _day(2): {"hrv": {"hrv_last_night_avg": 60}},
+            _day(LOOKBACK_DAYS + 1): {"hrv": {"hrv_last_night_avg": 500}},
+        }
+
+        factors = compute_explanation_factors([], wellness, TARGET)
+
+        assert factors.wellness == wellness[_day(0)]
+        assert factors.wellness_deltas["hrv"] == {
+            "value": 40.0, "baseline": 55.0, "delta": -15.0, "delta_pct": -27.3,
+        }
+        assert factors.wellness_deltas["sleep_hours"]["delta"] == -2.0
+        assert "resting_hr" not in factors.wellness_deltas
+
+    def test_round_trip(self):
+        factors = compute_explanation_factors(
+            [{"date": _day(1), "duration_min": 70, "hrss": 80, "zone2_pct": 100}], {}, TARGET
+        )
+
+        assert ExplanationFactors.from_dict(factors.to_dict()) == factors
+
+
+class TestExplanationFactorService:
+    def test_computes_and_caches(self, db, service):
+        db.save_activity_metrics(_activity("a", _day(2), duration_min=80.0, hrss=90.0))
+
+        factors = service.get_factors(TARGET)
+
+        assert factors.days_since_hard == 2
+        assert factors.days_since_long == 2
+        assert _cached_days(db) == [TARGET.isoformat()]
+        assert service.get_factors(TARGET) == factors
+
+    def test_serves_cached_set(self, db, service):
+        service.get_factors(TARGET)
+        with db._get_connection() as conn:
+            conn.execute(
+                "UPDATE explanation_factors SET factors = ?",
+                (json.dumps(ExplanationFactors(date=TARGET.isoformat(), days_since_hard=9).to_dict()),),
+            )
+
+        assert service.get_factors(TARGET).days_since_hard == 9
+
+    def test_new_activity_invalidates_later_days(self, db, service):
+        for offset in (0, 3, 6):
+            service.get_factors(TARGET - timedelta(days=offset))
+
+        db.save_activity_metrics(_activity("a", _day(3), duration_min=30.0, hrss=100.0))
+
+        assert _cached_days(db) == [_day(6)]
+        assert service.get_factors(TARGET).days_since_hard == 3
+
+    def test_activity_edits_and_deletes_invalidate(self, db, service):
+        db.save_activity_metrics(_activity("a", _day(1), duration_min=30.0, hrss=100.0))
+        service.get_factors(TARGET)
+        service.get_factors(TARGET - timedelta(days=5))
+
+        # Replacing the activity with an earlier date clears from the earlier date
+        db.save_activity_metrics(_activity("a", _day(5), duration_min=30.0, hrss=100.0))
+        assert _cached_days(db) == []
+        assert service.get_factors(TARGET).days_since_hard == 5
+
+        with db._get_connection() as conn:
+            conn.execute("DELETE FROM activity_metrics WHERE activity_id = 'a'")
+        assert _cached_days(db) == []
+        assert service.get_factors(TARGET).days_since_hard == DEFAULT_DAYS_SINCE_HARD
+
+    def test_wellness_day_invalidates(self, db, service):
+        db.save_hrv_record(WellnessHRVRecord(date=_day(1), hrv_last_night_avg=60))
+        assert service.get_factors(TARGET).wellness == {}
+
+        db.save_hrv_record(WellnessHRVRecord(date=_day(0), hrv_last_night_avg=45, hrv_weekly_avg=55))
+        db.save_sleep_record(WellnessSleepRecord(date=_day(0), total_sleep_seconds=7 * 3600))
+
+        factors = service.get_factors(TARGET)
+        assert factors.wellness["hrv"]["hrv_last_night_avg"] == 45
+        assert factors.wellness["sleep"]["total_sleep_hours"] == 7.0
+        assert factors.wellness_deltas["hrv"]["delta"] == -15.0
+
+    def test_wellness_synced_for_another_user_invalidates(self, db, service):
+        assert service.get_factors(TARGET).wellness == {}
+
+        db.save_sleep_record(
+            WellnessSleepRecord(date=_day(0), user_id="user-123", total_sleep_seconds=8 * 3600)
+        )
+
+        assert _cached_days(db) == []
+        assert service.get_factors(TARGET).wellness["sleep"]["total_sleep_hours"] == 8.0
+
+    def test_invalidate(self, db, service):
+        for offset in (0, 2, 4):
+            service.get_factors(TARGET - timedelta(days=offset))
+
+        assert service.invalidate(since=TARGET - timedelta(days=2)) == 2
+        assert _cached_days(db) == [_day(4)]
+        assert service.invalidate() == 1
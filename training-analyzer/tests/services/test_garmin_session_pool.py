@@ -0,0 +1,172 @@
+"""Tests for the Garmin authenticated session pool."""
+
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from training_analyzer.db.database import TrainingDatabase
+from training_analyzer.services.encryption import CredentialEncryption
+from training_analyzer.services.garmin_session_pool import GarminSessionPool
+from training_analyzer.services.garmin_sync_service import GarminSyncService
+
+
+class GarminConnectAuthenticationError(Exception):
+    """Stand-in for garminconnect's authentication error."""
+
+
+class FakeTokenClient:
+    """Mimics garminconnect's token client (`client.client`)."""
+
+    def __init__(self, owner):
+        self.owner = owner
+
+    def dumps(self):
+        return f"tokens-for-{self.owner.email}-" + "x" * 600
+
+
+class FakeGarmin:
+    """Fake garminconnect.Garmin that counts logins."""
+
+    full_logins = 0
+    token_logins = 0
+    reject_tokens = False
+
+    def __init__(self, email, password):
+        self.email = email
+        self.password = password
+        self.client = FakeTokenClient(self)
+
+    def login(self, tokenstore=None):
+        if tokenstore:
+            if FakeGarmin.reject_tokens:
+                raise GarminConnectAuthenticationError("expired tokens")
+            FakeGarmin.token_logins += 1
+            return None, None
+        if self.password != "secret":
+            raise GarminConnectAuthenticationError("bad password")
+        time.sleep(0.01)  # SSO handshake
+        FakeGarmin.full_logins += 1
+        return None, None
+
+    def get_activities_by_date(self, start, end):
+        return []
+
+    def get_max_metrics(self, date):
+        return None
+
+
+class MemoryTokenStore:
+    """In-memory GarminTokenStore."""
+
+    def __init__(self):
+        self.tokens = {}
+
+    def get_session_tokens(self, user_id):
+        return self.tokens.get(user_id)
+
+    def save_session_tokens(self, user_id, tokens):
+        self.tokens[user_id] = tokens
+
+    def clear_session_tokens(self, user_id):
+        self.tokens.pop(user_id, None)
+
+
+@pytest.fixture(autouse=True)
+def reset_fake():
+    FakeGarmin.full_logins = 0
+    FakeGarmin.token_logins = 0
+    FakeGarmin.reject_tokens = False
+
+
+@pytest.fixture
+def pool():
+    return GarminSessionPool(client_factory=FakeGarmin)
+
+
+def test_reuses_session_for_same_credentials(pool):
+    first = pool.get_client("u1", "a@example.com", "secret")
+    second = pool.get_client("u1", "a@example.com", "secret")
+
+    assert first is second
+    assert FakeGarmin.full_logins == 1
+    assert pool.hits == 1
+
+
+def test_different_password_never_gets_cached_session(pool):
+    pool.get_client("u1", "a@example.com", "secret")
+
+    with pytest.raises(GarminConnectAuthenticationError):
+        pool.get_client("u1", "a@example.com", "wrong")
+    assert FakeGarmin.full_logins == 1
+
+
+def test_resumes_from_persisted_tokens_without_login():
+    store = MemoryTokenStore()
+    GarminSessionPool(client_factory=FakeGarmin).get_client("u1", "a@example.com", "secret", store)
+    assert "u1" in store.tokens
+
+    # A new process starts with an empty pool
+    fresh_pool = GarminSessionPool(client_factory=FakeGarmin)
+    fresh_pool.get_client("u1", "a@example.com", "secret", store)
+
+    assert FakeGarmin.full_logins == 1
+    assert FakeGarmin.token_logins == 1
+    assert fresh_pool.token_resumes == 1
+
+
+def test_rejected_tokens_fall_back_to_login():
+    store = MemoryTokenStore()
+    store.save_session_tokens("u1", "stale" * 200)
+    FakeGarmin.reject_tokens = True
+
+    pool = GarminSessionPool(client_factory=FakeGarmin)
+    pool.get_client("u1", "a@example.com", "secret", store)
+
+    assert FakeGarmin.full_logins == 1
+    assert store.tokens["u1"].startswith("tokens-for-")
+
+
+def test_auth_error_during_use_invalidates_session(pool):
+    store = MemoryTokenStore()
+    with pytest.raises(GarminConnectAuthenticationError):
+        with pool.session("u1", "a@example.com", "secret", store):
+            raise GarminConnectAuthenticationError("session expired")
+
+    assert "u1" not in store.tokens
+    pool.get_client("u1", "a@example.com", "secret", store)
+    assert FakeGarmin.full_logins == 2
+
+
+def test_concurrent_requests_share_one_login(pool):
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(pool.get_client("u1", "a@example.com", "secret")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert FakeGarmin.full_logins == 1
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_full_sync_logs_in_once(pool):
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    try:
+        service = GarminSyncService(TrainingDatabase(db_path), session_pool=pool)
+        service.repo._encryption = CredentialEncryption(CredentialEncryption.generate_key())
+        service.repo.save_credentials("u1", "a@example.com", "secret")
+
+        result = service.full_sync("u1", days=3)
+
+        assert result.success
+        assert FakeGarmin.full_logins == 1
+        assert service.repo.get_session_tokens("u1").startswith("tokens-for-")
+    finally:
+        os.unlink(db_path)
@@ -0,0 +1,34 @@
+"""Tests for PlanService plan listing."""
+
+import pytest
+
+from training_analyzer.db.repositories.plan_repository import PlanRepository
+from training_analyzer.exceptions import PlanValidationError
+from training_analyzer.services.base import PaginationParams
+from training_analyzer.services.plan_service import PlanFilters, PlanService
+
+
+@pytest.fixture
+def service(tmp_path):
+    return PlanService(
+        plan_agent=None,
+        workout_service=None,
+        coach_service=None,
+        plan_repository=PlanRepository(db_path=str(tmp_path / "plans.db")),
+    )
+
+
+class TestGetPlans:
+    @pytest.mark.asyncio
+    async def test_active_filter(self, service):
+        result = await service.get_plans(PaginationParams(), PlanFilters(status="active"))
+
+        assert result.items == []
+        assert result.total == 0
+
+    @pytest.mark.asyncio
+    async def test_unsupported_status_is_rejected(self, service):
+        with pytest.raises(PlanValidationError) as exc:
+            await service.get_plans(PaginationParams(), PlanFilters(status="draft"))
+
+        assert exc.value.status_code == 400
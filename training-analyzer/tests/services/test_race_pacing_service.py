@@ -0,0 +1,133 @@
+"""Tests for course-based race pacing plans."""
+
+import os
+import tempfile
+
+import pytest
+
+from training_analyzer.db.database import ActivityMetrics, TrainingDatabase
+from training_analyzer.db.repositories import strava_repository
+from training_analyzer.db.repositories.strava_repository import StravaRepository
+from training_analyzer.models.race_pacing import (
+    CourseProfile,
+    ElevationPoint,
+    PacingStrategy,
+    RaceDistance,
+)
+from training_analyzer.services.race_pacing_service import RacePacingService
+
+
+GPX = """<?xml version="1.0"?>
+<gpx version="1.1" xmlns="http://www.topografix.com/GPX/1/1"><trk><trkseg>
+{points}
+</trkseg></trk></gpx>"""
+
+
+@pytest.fixture
+def service():
+    return RacePacingService()
+
+
+@pytest.fixture
+def stores(monkeypatch):
+    """Temporary training database and Strava repository."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+
+    db = TrainingDatabase(db_path)
+    repo = StravaRepository(db_path)
+    monkeypatch.setattr(strava_repository, "get_strava_repository", lambda: repo)
+    yield db, repo
+
+    os.unlink(db_path)
+
+
+def _hilly_profile():
+    return CourseProfile(
+        total_distance_km=10.0,
+        elevation_points=[
+            ElevationPoint(distance_km=0, elevation_m=100),
+            ElevationPoint(distance_km=5, elevation_m=150),
+            ElevationPoint(distance_km=10, elevation_m=100),
+        ],
+    )
+
+
+class TestSplits:
+    @pytest.mark.parametrize("unit,count", [("km", 10), ("100m", 100), ("mile", 7)])
+    def test_split_units(self, service, unit, count):
+        plan = service.generate_pacing_plan(
+            target_time_sec=3000,
+            distance_km=10.0,
+            race_distance=RaceDistance.TEN_K,
+            strategy=PacingStrategy.EVEN,
+            split_unit=unit,
+        )
+
+        assert len(plan.splits) == count
+        assert plan.splits[-1].distance_km == 10.0
+        assert plan.splits[-1].cumulative_time_sec == pytest.approx(3000, abs=1)
+
+    def test_unknown_split_unit(self, service):
+        with pytest.raises(ValueError):
+            service.generate_pacing_plan(3000, 10.0, RaceDistance.TEN_K, split_unit="furlong")
+
+    def test_profile_adjusts_splits(self, service):
+        plan = service.generate_pacing_plan(
+            target_time_sec=3000,
+            distance_km=10.0,
+            race_distance=RaceDistance.TEN_K,
+            course_profile=_hilly_profile(),
+            strategy=PacingStrategy.COURSE_SPECIFIC,
+        )
+
+        # 1% up for 5 km, then 1% down
+        assert [s.elevation_adjustment_pct for s in plan.splits[:4]] == [8.0] * 4
+        assert [s.elevation_adjustment_pct for s in plan.splits[6:]] == [-3.0] * 4
+        assert plan.splits[0].target_pace_sec_km > plan.splits[-1].target_pace_sec_km
+        assert plan.course_profile.total_elevation_gain_m == 50
+
+
+class TestCourseSources:
+    def test_course_file_builds_profile(self, service):
+        points = "\n".join(
+            f'<trkpt lat="{45 + i * 0.0009:.6f}" lon="7.0"><ele>{100 + i:.1f}</ele></trkpt>'
+            for i in range(51)
+        )
+        course = service.load_course_file(GPX.format(points=points).encode(), "race.gpx", 5.0)
+
+        plan = service.generate_pacing_plan(
+            target_time_sec=1500,
+            distance_km=5.0,
+            race_distance=RaceDistance.FIVE_K,
+            race_name="Hill 5K",
+            course=course,
+        )
+
+        assert course.total_distance_km == pytest.approx(5.0)
+        assert plan.course_profile.name == "Hill 5K"
+        assert plan.course_profile.total_elevation_gain_m == pytest.approx(50, abs=0.5)
+        assert all(s.elevation_adjustment_pct > 7 for s in plan.splits)
+
+    def test_unsupported_course_file(self, service):
+        with pytest.raises(ValueError):
+            service.load_course_file(b"lat,lon", "course.csv")
+
+    def test_activity_course(self, service, stores):
+        db, repo = stores
+        db.save_activity_metrics(ActivityMetrics(
+            activity_id="strava_1", date="2024-01-01", activity_type="running",
+            activity_name="Run", hrss=None, trimp=None, avg_hr=None, max_hr=None,
+            duration_min=10, distance_km=2.0, pace_sec_per_km=300,
+            zone1_pct=None, zone2_pct=None, zone3_pct=None, zone4_pct=None, zone5_pct=None,
+        ))
+        repo.save_activity_streams("strava_1", {
+            "pace_or_speed": [{"timestamp": t, "value": 300.0} for t in range(0, 601, 10)],
+            "elevation": [{"timestamp": t, "elevation": 100 + t / 30} for t in range(0, 601, 30)],
+        })
+
+        course = service.load_activity_course(db, "strava_1", distance_km=3.0)
+
+        assert course.total_distance_km == pytest.approx(3.0)
+        assert course.elevation_gain_m == pytest.approx(20, abs=0.5)
+        assert service.load_activity_course(db, "garmin_2") is None
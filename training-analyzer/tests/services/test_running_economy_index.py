@@ -0,0 +1,141 @@
+"""Tests for the persisted per-workout running economy index."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from training_analyzer.db.database import ActivityMetrics, TrainingDatabase
+from training_analyzer.services.running_economy_service import RunningEconomyService
+
+
+@pytest.fixture
+def db(tmp_path):
+    return TrainingDatabase(str(tmp_path / "training.db"))
+
+
+def _activity(activity_id, day, rng, **overrides):
+    fields = dict(
+        activity_id=activity_id,
+        date=day.isoformat(),
+        activity_name=None,
+        activity_type=rng.choice(["running", "running", "trail_running", "cycling"]),
+        hrss=None,
+        trimp=None,
+        avg_hr=rng.choice([None, 135, 148, 156, 171]),
+        max_hr=None,
+        duration_min=rng.choice([8.0, 35.0, 52.0, 90.0]),
+        distance_km=rng.choice([1.0, 6.5, 10.0, 18.0]),
+        pace_sec_per_km=rng.choice([250.0, 272.0, 295.0, 318.0, 370.0]),
+        zone1_pct=None,
+        zone2_pct=None,
+        zone3_pct=None,
+        zone4_pct=None,
+        zone5_pct=None,
+    )
+    fields.update(overrides)
+    return ActivityMetrics(**fields)
+
+
+def _seed(db, rng, days_back=900, count=150):
+    today = date.today()
+    for i in range(count):
+        day = today - timedelta(days=rng.randint(0, days_back))
+        db.save_activity_metrics(_activity(f"a{i:03d}", day, rng))
+
+
+def _scanned(db, days):
+    """Activities as the routes used to load them for a period."""
+    end_date = date.today()
+    start_date = end_date - timedelta(days=days)
+    return [
+        a.to_dict()
+        for a in db.get_activities_range(start_date.isoformat(), end_date.isoformat())
+    ]
+
+
+def _assert_matches_scan(service, db, days):
+    activities = _scanned(db, days)
+    assert service.get_indexed_economy_trend(db, days) == service.get_economy_trend(activities, days)
+    assert (
+        service.get_indexed_pace_specific_economy(db, days)
+        == service.get_pace_specific_economy(activities, days)
+    )
+    assert service.get_indexed_current_economy(db) == service.get_current_economy(
+        _scanned(db, 365)
+    )
+
+
+@pytest.mark.parametrize("days", [30, 365, 1000])
+def test_index_matches_per_request_computation(db, days):
+    _seed(db, random.Random(days))
+
+    _assert_matches_scan(RunningEconomyService(), db, days)
+
+
+def test_runs_are_computed_once(db):
+    service = RunningEconomyService()
+    _seed(db, random.Random(3))
+
+    assert service.refresh_index(db, date.today() - timedelta(days=1000), date.today()) > 0
+    assert service.refresh_index(db, date.today() - timedelta(days=1000), date.today()) == 0
+
+
+def test_reingest_edit_and_delete_are_recomputed(db):
+    rng = random.Random(5)
+    service = RunningEconomyService()
+    _seed(db, rng, days_back=60, count=40)
+    _assert_matches_scan(service, db, 90)
+
+    today = date.today()
+    db.save_activity_metrics(
+        _activity("a000", today, rng, activity_type="running", avg_hr=150, pace_sec_per_km=300.0)
+    )
+    db.save_activity_metrics(_activity("a001", today, rng, activity_type="cycling"))
+    with db._get_connection() as conn:
+        conn.execute(
+            "UPDATE activity_metrics SET avg_hr = 140, activity_type = 'running' "
+            "WHERE activity_id = 'a002'"
+        )
+        conn.execute("DELETE FROM activity_metrics WHERE activity_id = 'a003'")
+
+    _assert_matches_scan(service, db, 90)
+    with db._get_connection() as conn:
+        ids = {row[0] for row in conn.execute("SELECT activity_id FROM running_economy")}
+    assert "a001" not in ids and "a003" not in ids
+
+
+def test_zone_change_reclassifies_stored_runs(db):
+    _seed(db, random.Random(9), days_back=200)
+    RunningEconomyService().get_indexed_pace_specific_economy(db, 365)
+
+    faster = RunningEconomyService(easy_pace=330, tempo_pace=280, threshold_pace=265)
+    _assert_matches_scan(faster, db, 365)
+
+    with db._get_connection() as conn:
+        keys = {row[0] for row in conn.execute(
+            "SELECT zones_key FROM running_economy WHERE economy_ratio IS NOT NULL"
+        )}
+    assert keys == {faster.zones_key}
+
+
+def test_drift_from_ingest_survives_recompute(db):
+    service = RunningEconomyService()
+    rng = random.Random(1)
+    run = _activity(
+        "run", date.today() - timedelta(days=2), rng,
+        activity_type="running", avg_hr=150, pace_sec_per_km=300.0,
+        duration_min=50.0, distance_km=10.0,
+    )
+    db.save_activity_metrics(run)
+    hr_stream = [{"timestamp": i, "hr": 140 if i < 30 else 152} for i in range(60)]
+    service.record_workout(db, run.to_dict(), hr_stream)
+
+    # Re-synced summary without a time series
+    db.save_activity_metrics(run)
+    trend = service.get_indexed_cardiac_drift_trend(db, 30)
+    expected = service.detect_cardiac_drift(run.to_dict(), hr_stream)
+
+    assert [p["drift_percent"] for p in trend.data_points] == [expected.drift_percent]
+    assert trend.concerning_count == 1
+    assert service.get_indexed_economy_trend(db, 30).workout_count == 1
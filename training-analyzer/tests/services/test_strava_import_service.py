@@ -0,0 +1,188 @@
+"""Tests for the bulk Strava history import."""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from training_analyzer.db.database import ActivityMetrics, TrainingDatabase
+from training_analyzer.db.repositories.strava_repository import StravaRepository
+from training_analyzer.integrations.base import OAuthCredentials
+from training_analyzer.integrations.http_pool import ProviderHTTPPool
+from training_analyzer.integrations.strava import StravaClient
+from training_analyzer.models.strava import SyncStatus
+from training_analyzer.services.strava_import_service import (
+    MAX_CHART_POINTS,
+    StravaImportService,
+    enrich_metrics_from_streams,
+    strava_streams_to_time_series,
+)
+
+
+def _activity(activity_id: int, start: str) -> dict:
+    return {
+        "id": activity_id,
+        "name": f"Run {activity_id}",
+        "sport_type": "Run",
+        "start_date": start,
+        "elapsed_time": 3000,
+        "moving_time": 3000,
+        "distance": 10000,
+        "average_heartrate": 150,
+        "max_heartrate": 170,
+    }
+
+
+STREAMS = {
+    "time": {"data": [0, 10, 20, 30]},
+    "heartrate": {"data": [120, 150, 180, 180]},
+    "velocity_smooth": {"data": [3.0, 3.2, 3.4, 0]},
+    "altitude": {"data": [10.0, 11.0, 12.0, 12.5]},
+    "cadence": {"data": [85, 86, 87, 0]},
+    "latlng": {"data": [[41.0, 2.0], [41.1, 2.1]]},
+}
+
+
+@pytest.fixture
+def stores():
+    """Temporary training database and Strava repository."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+
+    db = TrainingDatabase(db_path)
+    db.update_user_profile(max_hr=190, rest_hr=50, threshold_hr=170)
+    repo = StravaRepository(db_path)
+    yield db, repo
+
+    os.unlink(db_path)
+
+
+def _client(handler, limit_15min: int = 200) -> StravaClient:
+    pool = ProviderHTTPPool("strava", transport=httpx.MockTransport(handler))
+    pool.rate_budget.limit_15min = limit_15min
+    credentials = OAuthCredentials(
+        provider="strava",
+        access_token="token",
+        expires_at=datetime.now() + timedelta(hours=6),
+    )
+    return StravaClient(credentials, http_pool=pool)
+
+
+class TestStreamConversion:
+    """Tests for stream conversion helpers."""
+
+    def test_running_streams_match_garmin_shape(self):
+        """Running streams become pace, doubled cadence and GPS points."""
+        time_series, gps = strava_streams_to_time_series(STREAMS, is_running=True)
+
+        assert time_series["heart_rate"][1] == {"timestamp": 10, "hr": 150}
+        assert time_series["pace_or_speed"][0] == {"timestamp": 0, "value": 333.3}
+        assert len(time_series["pace_or_speed"]) == 3  # stopped sample skipped
+        assert time_series["cadence"][0] == {"timestamp": 0, "cadence": 170}
+        assert gps == [{"lat": 41.0, "lon": 2.0}, {"lat": 41.1, "lon": 2.1}]
+
+    def test_long_streams_are_downsampled(self):
+        """Series are capped at the Garmin chart resolution."""
+        n = MAX_CHART_POINTS * 3
+        streams = {"time": list(range(n)), "heartrate": [140] * n}
+
+        time_series, _ = strava_streams_to_time_series(streams, is_running=True)
+
+        assert len(time_series["heart_rate"]) == MAX_CHART_POINTS
+
+    def test_zone_percentages_weighted_by_duration(self, stores):
+        """Zone time uses the gap between samples, not the sample count."""
+        db, _ = stores
+        metrics = ActivityMetrics(
+            activity_id="strava_1", date="2024-01-01", activity_type="running",
+            activity_name="Run", hrss=None, trimp=None, avg_hr=None, max_hr=None,
+            duration_min=None, distance_km=None, pace_sec_per_km=None,
+            zone1_pct=None, zone2_pct=None, zone3_pct=None, zone4_pct=None, zone5_pct=None,
+        )
+        streams = {"time": [0, 90, 100], "heartrate": [125, 185, 185]}
+
+        enriched = enrich_metrics_from_streams(metrics, streams, db.get_user_profile())
+
+        assert enriched.zone1_pct == 90.0
+        assert enriched.zone5_pct == 10.0
+
+
+class TestStravaImportService:
+    """Tests for StravaImportService."""
+
+    async def test_imports_history_and_streams(self, stores):
+        """Listing and streams are stored and checkpointed as synced."""
+        db, repo = stores
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/athlete/activities"):
+                return httpx.Response(200, json=[
+                    _activity(2, "2024-01-02T07:00:00Z"),
+                    _activity(1, "2024-01-01T07:00:00Z"),
+                ])
+            return httpx.Response(200, json=STREAMS)
+
+        result = await StravaImportService(db, repo).run(_client(handler))
+
+        assert result.success
+        assert result.history_complete
+        assert result.activities_discovered == 2
+        assert result.streams_imported == 2
+        assert result.pending == 0
+
+        metrics = db.get_activity_metrics("strava_1")
+        assert metrics.distance_km == 10.0
+        assert metrics.zone1_pct is not None
+        assert repo.get_activity_sync("strava_1").sync_status == SyncStatus.SYNCED
+        assert repo.get_activity_streams("strava_2")["time_series"]["heart_rate"]
+
+    async def test_failed_stream_download_does_not_block_queue(self, stores):
+        """One failing activity is marked failed; the rest of the batch imports."""
+        db, repo = stores
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/athlete/activities"):
+                return httpx.Response(200, json=[
+                    _activity(i, f"2024-01-{i:02d}T07:00:00Z") for i in range(1, 4)
+                ])
+            if "/activities/2/" in request.url.path:
+                return httpx.Response(503, json={"message": "unavailable"})
+            return httpx.Response(200, json=STREAMS)
+
+        result = await StravaImportService(db, repo).run(_client(handler))
+
+        assert result.success
+        assert result.streams_imported == 2
+        assert result.streams_failed == 1
+        assert result.pending == 0
+        failed = repo.get_activity_sync("strava_2")
+        assert failed.sync_status == SyncStatus.FAILED
+        assert failed.error_message
+        assert repo.get_activity_sync("strava_3").sync_status == SyncStatus.SYNCED
+
+    async def test_stream_downloads_fit_remaining_budget(self, stores):
+        """Downloads stop at the budget (minus reserve) and resume later."""
+        db, repo = stores
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if request.url.path.endswith("/athlete/activities"):
+                return httpx.Response(200, json=[
+                    _activity(i, f"2024-01-{i:02d}T07:00:00Z") for i in range(1, 6)
+                ])
+            return httpx.Response(200, json=STREAMS)
+
+        # 1 listing request + 2 stream downloads fit before the reserve of 2
+        client = _client(handler, limit_15min=5)
+        service = StravaImportService(db, repo, request_reserve=2, max_wait_seconds=0)
+
+        result = await service.run(client)
+
+        assert result.streams_imported == 2
+        assert result.pending == 3
+        assert result.resume_after is not None
+        assert len(requests) == 3
+        assert repo.get_import_stats()[SyncStatus.PENDING.value] == 3
@@ -0,0 +1,201 @@
+"""Tests for the durable Garmin sync job queue."""
+
+import asyncio
+import sqlite3
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from training_analyzer.db.database import TrainingDatabase
+from training_analyzer.services.encryption import CredentialEncryption
+from training_analyzer.services.sync_job_queue import (
+    SyncCredentials,
+    SyncJobQueue,
+    SyncJobStatus,
+    split_date_range,
+)
+
+
+class GarminConnectAuthenticationError(Exception):
+    """Stand-in for garminconnect's authentication error."""
+
+
+class FakeRunner:
+    """Records the chunks it runs and fails on request."""
+
+    def __init__(self, fail_on=None, error=None, failures=1):
+        self.calls = []
+        self.fail_on = fail_on
+        self.error = error or RuntimeError("Garmin timed out")
+        self.failures = failures
+
+    def __call__(self, job, chunk, credentials, progress):
+        self.calls.append((chunk.chunk_index, credentials.email))
+        progress(f"Syncing {chunk.start_date}", 0.5)
+        if chunk.chunk_index == self.fail_on and self.failures > 0:
+            self.failures -= 1
+            raise self.error
+        return 2, 10
+
+
+CREDS = SyncCredentials(email="runner@example.com", password="secret")
+START, END = date(2024, 1, 1), date(2024, 3, 30)
+
+
+@pytest.fixture
+def training_db(tmp_path):
+    return TrainingDatabase(str(tmp_path / "training.db"))
+
+
+@pytest.fixture
+def encryption():
+    return CredentialEncryption(key=CredentialEncryption.generate_key())
+
+
+def make_queue(training_db, encryption, runner):
+    return SyncJobQueue(training_db, runner, chunk_days=30, encryption=encryption)
+
+
+def test_split_date_range_newest_first():
+    windows = split_date_range(START, END, 30)
+
+    assert windows == [
+        ("2024-03-01", "2024-03-30"),
+        ("2024-01-31", "2024-02-29"),
+        ("2024-01-01", "2024-01-30"),
+    ]
+
+
+def test_duplicate_request_returns_active_job(training_db, encryption):
+    queue = make_queue(training_db, encryption, FakeRunner())
+
+    job, created = queue.enqueue("runner@example.com", CREDS, START, END)
+    again, created_again = queue.enqueue("runner@example.com", CREDS, START, END)
+    other, created_other = queue.enqueue("other@example.com", CREDS, START, END)
+
+    assert created and not created_again and created_other
+    assert again.id == job.id
+    assert other.id != job.id
+    assert job.chunks_total == 3
+
+
+async def test_run_job_completes_all_chunks(training_db, encryption):
+    runner = FakeRunner()
+    queue = make_queue(training_db, encryption, runner)
+    job, _ = queue.enqueue("runner@example.com", CREDS, START, END)
+
+    finished = await queue.run_job(job.id)
+
+    assert [index for index, _ in runner.calls] == [0, 1, 2]
+    assert finished.status == SyncJobStatus.COMPLETED
+    assert finished.progress_percent == 100
+    assert finished.activities_synced == 6
+    assert finished.result == {"synced_count": 6, "fitness_days": 30}
+
+    with sqlite3.connect(training_db.db_path) as conn:
+        stored = conn.execute(
+            "SELECT encrypted_credentials FROM sync_jobs WHERE id = ?", (job.id,)
+        ).fetchone()[0]
+    assert stored is None
+
+
+async def test_transient_failure_is_retried(training_db, encryption):
+    runner = FakeRunner(fail_on=1, failures=1)
+    queue = make_queue(training_db, encryption, runner)
+    job, _ = queue.enqueue("runner@example.com", CREDS, START, END)
+
+    finished = await queue.run_job(job.id)
+
+    assert finished.status == SyncJobStatus.COMPLETED
+    assert [index for index, _ in runner.calls] == [0, 1, 1, 2]
+
+
+async def test_auth_failure_fails_without_retry(training_db, encryption):
+    runner = FakeRunner(fail_on=0, error=GarminConnectAuthenticationError("bad password"))
+    queue = make_queue(training_db, encryption, runner)
+    job, _ = queue.enqueue("runner@example.com", CREDS, START, END)
+
+    finished = await queue.run_job(job.id)
+
+    assert finished.status == SyncJobStatus.FAILED
+    assert finished.error == "Invalid Garmin Connect credentials"
+    assert len(runner.calls) == 1
+
+
+async def test_interrupted_job_resumes_after_restart(training_db, encryption):
+    # First process finishes one chunk, then dies mid-job
+    queue = make_queue(training_db, encryption, FakeRunner())
+    job, _ = queue.enqueue("runner@example.com", CREDS, START, END)
+    assert queue._claim(job.id)
+    queue._complete_chunk(queue._pending_chunks(job.id)[0], 2, 10)
+    stale = (datetime.now() - timedelta(hours=1)).isoformat()
+    with sqlite3.connect(training_db.db_path) as conn:
+        conn.execute("UPDATE sync_jobs SET heartbeat_at = ? WHERE id = ?", (stale, job.id))
+
+    # A new process picks it up using the stored credentials
+    runner = FakeRunner()
+    restarted = make_queue(training_db, encryption, runner)
+    resumed = restarted.resume_interrupted()
+    await asyncio.gather(*restarted._tasks)
+
+    finished = restarted.get_job(job.id)
+    assert resumed == [job.id]
+    assert runner.calls == [(1, CREDS.email), (2, CREDS.email)]
+    assert finished.status == SyncJobStatus.COMPLETED
+    assert finished.activities_synced == 6
+
+
+async def test_running_job_is_not_claimed_twice(training_db, encryption):
+    queue = make_queue(training_db, encryption, FakeRunner())
+    job, _ = queue.enqueue("runner@example.com", CREDS, START, END)
+    assert queue._claim(job.id)
+
+    other = make_queue(training_db, encryption, FakeRunner())
+
+    assert other.resume_interrupted() == []
+    assert await other.run_job(job.id) is None
+
+
+async def test_lease_renewed_while_chunk_reports_no_progress(training_db, encryption):
+    heartbeats = []
+
+    def read_heartbeat(job_id):
+        with sqlite3.connect(training_db.db_path) as conn:
+            return conn.execute(
+                "SELECT heartbeat_at FROM sync_jobs WHERE id = ?", (job_id,)
+            ).fetchone()[0]
+
+    def slow_runner(job, chunk, credentials, progress):
+        # Like the fitness data sync: a long step with no progress reports
+        heartbeats.append(read_heartbeat(job.id))
+        time.sleep(0.3)
+        heartbeats.append(read_heartbeat(job.id))
+        return 0, 0
+
+    queue = SyncJobQueue(
+        training_db,
+        slow_runner,
+        chunk_days=90,
+        encryption=encryption,
+        lease_renew_interval=timedelta(seconds=0.05),
+    )
+    job, _ = queue.enqueue("runner@example.com", CREDS, START, END)
+
+    finished = await queue.run_job(job.id)
+
+    assert finished.status == SyncJobStatus.COMPLETED
+    assert heartbeats[1] > heartbeats[0]
+
+
+async def test_stream_yields_progress_until_finished(training_db, encryption):
+    queue = make_queue(training_db, encryption, FakeRunner())
+    job, _ = queue.enqueue("runner@example.com", CREDS, START, END)
+    queue.start(job.id)
+
+    updates = [update async for update in queue.stream(job.id, poll_interval=0.05)]
+
+    assert updates[-1].status == SyncJobStatus.COMPLETED
+    percents = [update.progress_percent for update in updates]
+    assert percents == sorted(percents)
+    assert len(updates) > 1
@@ -0,0 +1,154 @@
+"""Tests for the incrementally maintained training pattern profile."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from training_analyzer.db.database import ActivityMetrics, TrainingDatabase
+from training_analyzer.services.training_pattern_service import TrainingPatternService
+
+
+SPORTS = [
+    ("running", "running"),
+    ("running", "trail_running"),
+    ("cycling", "road_biking"),
+    ("strength", "strength_training"),
+    ("swimming", "lap_swimming"),
+    (None, "walking"),
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    return TrainingDatabase(str(tmp_path / "training.db"))
+
+
+def _activity(activity_id, day, rng):
+    sport, kind = rng.choice(SPORTS)
+    return ActivityMetrics(
+        activity_id=activity_id,
+        date=day.isoformat(),
+        activity_name=None,
+        avg_hr=None,
+        max_hr=None,
+        pace_sec_per_km=None,
+        zone1_pct=None,
+        zone2_pct=None,
+        zone3_pct=None,
+        zone4_pct=None,
+        zone5_pct=None,
+        start_time=f"{day.isoformat()}T{rng.randint(4, 23):02d}:15:00",
+        sport_type=sport,
+        activity_type=kind,
+        duration_min=rng.choice([0, 25.0, 45.5, 60.0, 95.0, 130.0]),
+        distance_km=rng.choice([None, 5.0, 10.2, 16.0, 21.1]),
+        hrss=rng.choice([None, 0, 40.0, 85.5]),
+        trimp=rng.choice([None, 30.0, 70.0]),
+    )
+
+
+def _seed(db, rng, days_back=80, count=90):
+    today = date.today()
+    activities = [
+        _activity(f"a{i}", today - timedelta(days=rng.randint(0, days_back)), rng)
+        for i in range(count)
+    ]
+    for activity in activities:
+        db.save_activity_metrics(activity)
+    return activities
+
+
+def _detected_by_scan(service):
+    """What the original detectors compute from a full window scan."""
+    end_date = date.today()
+    start_date = end_date - timedelta(weeks=service.WEEKS_TO_ANALYZE)
+    activities = service._fetch_activities(start_date, end_date)
+    return {
+        "avg_days_per_week": service._detect_avg_days_per_week(activities, start_date, end_date),
+        "typical_long_run_day": service._detect_long_run_day(activities),
+        "typical_rest_days": service._detect_rest_days(activities, start_date, end_date),
+        "max_session_duration_min": service._detect_max_session_duration(activities),
+        "does_strength": service._detect_strength_training(activities),
+        "does_cross_training": service._detect_cross_training(activities),
+        "preferred_time_of_day": service._detect_preferred_time(activities),
+        "avg_weekly_distance_km": service._detect_avg_weekly_distance(activities, start_date, end_date),
+        "avg_weekly_load": service._detect_avg_weekly_load(activities, start_date, end_date),
+    }
+
+
+def _assert_matches_scan(service):
+    patterns = service.detect_all()
+    for name, expected in _detected_by_scan(service).items():
+        assert getattr(patterns, name) == pytest.approx(expected), name
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_profile_matches_detectors(db, seed):
+    _seed(db, random.Random(seed))
+
+    _assert_matches_scan(TrainingPatternService(training_db=db))
+
+
+def test_profile_follows_ingest_update_and_delete(db):
+    rng = random.Random(7)
+    service = TrainingPatternService(training_db=db)
+    activities = _seed(db, rng, count=40)
+    _assert_matches_scan(service)
+
+    # New activities, a moved activity and deletions after the first build
+    for i in range(10):
+        db.save_activity_metrics(_activity(f"new{i}", date.today() - timedelta(days=i), rng))
+    with db._get_connection() as conn:
+        conn.execute(
+            "UPDATE activity_metrics SET date = ? WHERE activity_id = ?",
+            ((date.today() - timedelta(days=3)).isoformat(), activities[0].activity_id),
+        )
+        conn.execute(
+            "DELETE FROM activity_metrics WHERE activity_id IN (?, ?)",
+            (activities[1].activity_id, "new4"),
+        )
+    _assert_matches_scan(service)
+
+    with db._get_connection() as conn:
+        stale = conn.execute(
+            "SELECT COUNT(*) FROM training_pattern_days WHERE stale = 1"
+        ).fetchone()[0]
+    assert stale == 0
+
+
+def test_old_days_are_evicted_and_reads_skip_activities(db):
+    service = TrainingPatternService(training_db=db)
+    _seed(db, random.Random(11), days_back=56, count=30)
+    service.detect_all()
+
+    with db._get_connection() as conn:
+        conn.execute(
+            "INSERT INTO training_pattern_days (date, activity_count, stale) VALUES (?, 1, 0)",
+            ((date.today() - timedelta(days=90)).isoformat(),),
+        )
+        # Rows read from the profile, not rescanned from activity_metrics
+        conn.execute("UPDATE activity_metrics SET duration_min = 999")
+        conn.execute("UPDATE training_pattern_days SET stale = 0")
+
+    profile = service.get_profile()
+
+    assert min(profile.active_dates) >= profile.window_start.isoformat()
+    assert 999 not in profile.durations
+
+
+def test_build_from_existing_history_and_defaults(tmp_path):
+    db = TrainingDatabase(str(tmp_path / "training.db"))
+    assert TrainingPatternService(training_db=db).detect_all().typical_rest_days == list(range(7))
+
+    _seed(db, random.Random(5))
+    with db._get_connection() as conn:
+        conn.execute("DELETE FROM training_pattern_days")
+        conn.execute("DELETE FROM training_pattern_profile")
+
+    # Own connection by path, as the singleton uses
+    service = TrainingPatternService(db_path=db.db_path)
+    _assert_matches_scan(service)
+    expected_day = _detected_by_scan(service)["typical_long_run_day"]
+    assert service.get_long_run_pattern()[0] == expected_day
+    assert service.get_cross_training_types() == ["cycling", "road_biking", "swimming"]
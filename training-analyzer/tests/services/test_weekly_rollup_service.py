@@ -0,0 +1,223 @@
+"""Tests for the persisted weekly rollup."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from training_analyzer.analysis.weekly import WeeklyRollup
+from training_analyzer.db.database import ActivityMetrics, TrainingDatabase
+from training_analyzer.services.weekly_rollup_service import (
+    WeeklyRollupService,
+    week_start_of,
+)
+
+
+KINDS = ["running", "trail_running", "road_biking", "lap_swimming", None]
+
+# A Monday, so weeks line up with the test data
+MONDAY = date(2024, 1, 1)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return TrainingDatabase(str(tmp_path / "training.db"))
+
+
+@pytest.fixture
+def service(db):
+    return WeeklyRollupService(training_db=db)
+
+
+def _activity(activity_id, day, rng, **overrides):
+    zones = [rng.choice([None, 10.0, 20.0, 30.0]) for _ in range(5)]
+    values = dict(
+        activity_id=activity_id,
+        date=day.isoformat(),
+        activity_name=None,
+        avg_hr=None,
+        max_hr=None,
+        pace_sec_per_km=None,
+        zone1_pct=zones[0],
+        zone2_pct=zones[1],
+        zone3_pct=zones[2],
+        zone4_pct=zones[3],
+        zone5_pct=zones[4],
+        activity_type=rng.choice(KINDS),
+        duration_min=rng.choice([None, 25.0, 45.5, 60.0, 130.0]),
+        distance_km=rng.choice([None, 5.0, 10.2, 21.1]),
+        hrss=rng.choice([None, 0, 40.0, 85.5]),
+        trimp=rng.choice([None, 30.0, 120.0]),
+        elevation_gain_m=rng.choice([None, 50.0, 310.0]),
+    )
+    values.update(overrides)
+    return ActivityMetrics(**values)
+
+
+def _seed(db, rng, weeks=20, count=120):
+    activities = [
+        _activity(f"a{i}", MONDAY + timedelta(days=rng.randint(0, weeks * 7 - 1)), rng)
+        for i in range(count)
+    ]
+    for activity in activities:
+        db.save_activity_metrics(activity)
+    return activities
+
+
+def _expected(activities, week, sport=None):
+    return WeeklyRollup.from_activities(
+        [
+            a.to_dict() for a in activities
+            if week_start_of(date.fromisoformat(a.date)) == week
+            and (sport is None or (a.activity_type or "other") == sport)
+        ],
+        week,
+        sport=sport,
+    )
+
+
+def _assert_same(actual, expected):
+    assert actual.week_start == expected.week_start
+    assert actual.session_count == expected.session_count
+    assert actual.hard_session_count == expected.hard_session_count
+    assert actual.active_day_mask == expected.active_day_mask
+    assert actual.distance_km == pytest.approx(expected.distance_km)
+    assert actual.duration_min == pytest.approx(expected.duration_min)
+    assert actual.load == pytest.approx(expected.load)
+    assert actual.elevation_gain_m == pytest.approx(expected.elevation_gain_m)
+    assert actual.zone_minutes == pytest.approx(expected.zone_minutes)
+    assert actual.longest_session_min == pytest.approx(expected.longest_session_min)
+    assert actual.longest_distance_km == pytest.approx(expected.longest_distance_km)
+
+
+def _current(db):
+    return db.get_activities_range("0000-01-01", "9999-12-31")
+
+
+class TestWeeklyRollupService:
+    def test_matches_activity_totals(self, db, service):
+        activities = _seed(db, random.Random(1))
+
+        weeks = service.get_weeks(MONDAY, MONDAY + timedelta(weeks=19))
+
+        assert len(weeks) == 20
+        for week in weeks:
+            _assert_same(week, _expected(activities, week.week_start))
+
+    def test_sport_filter(self, db, service):
+        activities = _seed(db, random.Random(2))
+
+        for week in service.get_weeks(MONDAY, MONDAY + timedelta(weeks=19), sport="running"):
+            assert week.sport == "running"
+            _assert_same(week, _expected(activities, week.week_start, "running"))
+
+    def test_missing_type_is_other(self, db, service):
+        rng = random.Random(3)
+        db.save_activity_metrics(_activity("x", MONDAY, rng, activity_type=None))
+
+        assert service.get_week(MONDAY, sport="other").session_count == 1
+
+    def test_empty_weeks_are_zero(self, service):
+        weeks = service.get_weeks(MONDAY, MONDAY + timedelta(days=20))
+
+        assert [w.week_start for w in weeks] == [
+            MONDAY, MONDAY + timedelta(weeks=1), MONDAY + timedelta(weeks=2)
+        ]
+        assert all(w.session_count == 0 and w.load == 0 for w in weeks)
+
+    def test_any_day_selects_its_week(self, db, service):
+        db.save_activity_metrics(
+            _activity("x", MONDAY + timedelta(days=6), random.Random(4), duration_min=40.0)
+        )
+
+        week = service.get_week(MONDAY + timedelta(days=3))
+
+        assert week.week_start == MONDAY
+        assert week.duration_min == 40.0
+        assert week.active_day_mask == 1 << 6
+
+    def test_follows_inserts_edits_and_deletes(self, db, service):
+        rng = random.Random(5)
+        _seed(db, rng)
+        end = MONDAY + timedelta(weeks=19)
+        service.get_weeks(MONDAY, end)
+
+        # New activity, an edit that moves an activity to another week and
+        # changes its sport, a replace, and a delete
+        db.save_activity_metrics(_activity("new", MONDAY + timedelta(days=9), rng))
+        db.save_activity_metrics(_activity("a0", MONDAY + timedelta(days=100), rng))
+        with db._get_connection() as conn:
+            conn.execute(
+                "UPDATE activity_metrics SET date = ?, activity_type = ? WHERE activity_id = 'a1'",
+                ((MONDAY + timedelta(days=40)).isoformat(), "road_biking"),
+            )
+            conn.execute("DELETE FROM activity_metrics WHERE activity_id = 'a2'")
+
+        activities = _current(db)
+        for week in service.get_weeks(MONDAY, end):
+            _assert_same(week, _expected(activities, week.week_start))
+        for week in service.get_weeks(MONDAY, end, sport="road_biking"):
+            _assert_same(week, _expected(activities, week.week_start, "road_biking"))
+
+        with db._get_connection() as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM weekly_rollups WHERE stale = 1"
+            ).fetchone()[0] == 0
+
+    def test_existing_history_is_built_on_first_read(self, db, service):
+        activities = _seed(db, random.Random(6))
+        with db._get_connection() as conn:
+            conn.execute("DELETE FROM weekly_rollups")
+
+        for week in service.get_weeks(MONDAY, MONDAY + timedelta(weeks=19)):
+            _assert_same(week, _expected(activities, week.week_start))
+
+    def test_recent_weeks(self, db, service):
+        activities = _seed(db, random.Random(7))
+        end = MONDAY + timedelta(weeks=19, days=2)
+
+        weeks = service.get_recent_weeks(52, end=end)
+
+        assert len(weeks) == 52
+        assert weeks[-1].week_start == MONDAY + timedelta(weeks=19)
+        assert sum(w.session_count for w in weeks) == len(activities)
+
+    def test_range_read_uses_primary_key(self, db, service):
+        service.get_recent_weeks(52, end=MONDAY)
+        with db._get_connection() as conn:
+            plan = " ".join(
+                row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM weekly_rollups "
+                    "WHERE user_id = ? AND week_start >= ? AND week_start <= ?",
+                    ("default", "2023-01-02", "2023-12-25"),
+                )
+            )
+        assert "USING INDEX sqlite_autoindex_weekly_rollups_1" in plan
+
+    def test_year_in_review(self, db, service):
+        rng = random.Random(8)
+        activities = _seed(db, rng, weeks=30, count=150)
+        # ISO year 2024 starts on 2024-01-01; this run belongs to the previous ISO year
+        db.save_activity_metrics(_activity("old", date(2023, 12, 31), rng))
+
+        review = service.year_in_review(2024)
+
+        total = WeeklyRollup.from_activities([a.to_dict() for a in activities], MONDAY)
+        assert review["start"] == "2024-01-01"
+        assert review["end"] == "2024-12-29"
+        assert review["total_weeks"] == 52
+        assert review["totals"]["session_count"] == len(activities)
+        assert review["totals"]["duration_min"] == pytest.approx(round(total.duration_min, 1))
+        assert review["longest_session_min"] == pytest.approx(round(total.longest_session_min, 1))
+        assert sum(s["session_count"] for s in review["sports"].values()) == len(activities)
+        assert review["active_weeks"] <= 30
+        assert review["biggest_load_week"]["load"] == max(
+            round(w.load, 1) for w in service.get_weeks(MONDAY, MONDAY + timedelta(weeks=29))
+        )
+
+    def test_year_in_review_without_activities(self, service):
+        review = service.year_in_review(2020)
+
+        assert review["active_weeks"] == 0
+        assert review["total_weeks"] == 53
+        assert review["biggest_load_week"] is None
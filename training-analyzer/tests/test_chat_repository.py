@@ -0,0 +1,116 @@
+"""Tests for ChatRepository - durable, append-only chat conversation storage."""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from training_analyzer.db.repositories.chat_repository import (
+    ChatMessageRecord,
+    ChatRepository,
+)
+
+
+@pytest.fixture
+def temp_db_path():
+    """Create a temporary database file path."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    yield db_path
+    try:
+        os.unlink(db_path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def chat_repo(temp_db_path):
+    """Create a ChatRepository with a temporary database."""
+    return ChatRepository(db_path=temp_db_path)
+
+
+def _messages(*pairs):
+    return [
+        ChatMessageRecord(role=role, content=content, token_count=tokens)
+        for role, content, tokens in pairs
+    ]
+
+
+class TestAppendMessages:
+    """Tests for appending messages."""
+
+    def test_creates_conversation_on_first_append(self, chat_repo):
+        header = chat_repo.append_messages(
+            "conv-1",
+            _messages(("user", "hi", 5), ("assistant", "hello", 6)),
+            user_id="user-1",
+        )
+
+        assert header.conversation_id == "conv-1"
+        assert header.user_id == "user-1"
+        assert header.message_count == 2
+        assert header.total_tokens == 11
+
+    def test_sequence_continues_across_appends(self, chat_repo):
+        chat_repo.append_messages("conv-1", _messages(("user", "a", 1), ("assistant", "b", 1)))
+        records = _messages(("user", "c", 1), ("assistant", "d", 1))
+        header = chat_repo.append_messages("conv-1", records)
+
+        assert header.message_count == 4
+        assert [r.seq for r in records] == [2, 3]
+
+    def test_visible_to_second_repository_instance(self, chat_repo, temp_db_path):
+        """A second worker sees conversations written by the first."""
+        chat_repo.append_messages("conv-1", _messages(("user", "hi", 5)))
+
+        other = ChatRepository(db_path=temp_db_path)
+
+        assert other.get_conversation("conv-1").message_count == 1
+        assert other.get_recent_messages("conv-1", limit=10)[0].content == "hi"
+
+
+class TestGetRecentMessages:
+    """Tests for lazy loading of the conversation tail."""
+
+    def test_returns_last_n_oldest_first(self, chat_repo):
+        for i in range(10):
+            chat_repo.append_messages("conv-1", _messages(("user", f"m{i}", 1)))
+
+        recent = chat_repo.get_recent_messages("conv-1", limit=3)
+
+        assert [r.content for r in recent] == ["m7", "m8", "m9"]
+        assert [r.seq for r in recent] == [7, 8, 9]
+
+    def test_unknown_conversation(self, chat_repo):
+        assert chat_repo.get_conversation("missing") is None
+        assert chat_repo.get_recent_messages("missing", limit=5) == []
+
+
+class TestDeletion:
+    """Tests for deleting conversations."""
+
+    def test_delete_conversation(self, chat_repo):
+        chat_repo.append_messages("conv-1", _messages(("user", "hi", 5)))
+
+        assert chat_repo.delete_conversation("conv-1") is True
+        assert chat_repo.get_conversation("conv-1") is None
+        assert chat_repo.get_recent_messages("conv-1", limit=5) == []
+        assert chat_repo.delete_conversation("conv-1") is False
+
+    def test_delete_inactive_conversations(self, chat_repo):
+        chat_repo.append_messages("old", _messages(("user", "hi", 5)))
+        chat_repo.append_messages("new", _messages(("user", "hi", 5)))
+        with chat_repo._get_connection() as conn:
+            conn.execute(
+                "UPDATE chat_conversations SET last_activity = ? WHERE id = 'old'",
+                ((datetime.utcnow() - timedelta(days=30)).isoformat(),),
+            )
+
+        deleted = chat_repo.delete_inactive_conversations(
+            datetime.utcnow() - timedelta(days=7)
+        )
+
+        assert deleted == 1
+        assert chat_repo.get_conversation("old") is None
+        assert chat_repo.get_conversation("new") is not None
@@ -0,0 +1,179 @@
+"""Tests for CohortDistributionRepository - incremental cohort percentiles.
+
+This module tests:
+1. Percentile lookups against the histogram sketch
+2. Incremental updates when an athlete's value changes
+3. Age group cohorts and the fallback to the whole sport
+4. Rebuilding distributions from stored training data
+5. Social proof rankings backed by the distributions
+"""
+
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from training_analyzer.db.database import DailyFitnessMetrics, TrainingDatabase
+from training_analyzer.db.repositories.cohort_repository import (
+    ALL,
+    MIN_COHORT_SIZE,
+    CohortDistributionRepository,
+    age_group,
+)
+from training_analyzer.services.achievement_service import AchievementService
+from training_analyzer.services.social_proof_service import SocialProofService
+
+
+@pytest.fixture
+def temp_db_path():
+    """Create a temporary database file path."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    yield db_path
+    try:
+        os.unlink(db_path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def repo(temp_db_path):
+    """Create a CohortDistributionRepository with a temporary database."""
+    return CohortDistributionRepository(db_path=temp_db_path)
+
+
+def histogram_rows(repo):
+    with sqlite3.connect(str(repo.db_path)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM cohort_histograms").fetchone()[0]
+
+
+class TestPercentiles:
+    def test_empty_cohort_has_no_percentile(self, repo):
+        assert repo.percentile("ctl", 50) is None
+
+    def test_percentile_matches_distribution(self, repo):
+        for i in range(100):
+            repo.record_value(f"u{i}", "ctl", i + 0.5)
+
+        assert repo.percentile("ctl", 75.0) == 75
+        assert repo.percentile("ctl", 0.0) == 0
+        assert repo.percentile("ctl", 500.0) == 100
+
+    def test_lower_is_better_metric(self, repo):
+        for i, pace in enumerate([4.0, 5.0, 6.0, 7.0]):
+            repo.record_value(f"u{i}", "pace", pace)
+
+        assert repo.percentile("pace", 4.5) > repo.percentile("pace", 6.5)
+
+    def test_unknown_metric_raises(self, repo):
+        with pytest.raises(ValueError):
+            repo.record_value("u1", "heartbeats", 10)
+
+
+class TestIncrementalUpdates:
+    def test_changed_value_moves_between_buckets(self, repo):
+        repo.record_value("u1", "streak", 3)
+        repo.record_value("u2", "streak", 10)
+        assert repo.percentile("streak", 5) == 50
+
+        repo.record_value("u1", "streak", 20)
+
+        assert repo.get_cohort_size("streak") == 2
+        assert repo.percentile("streak", 5) == 0
+
+    def test_remove_value(self, repo):
+        repo.record_value("u1", "vdot", 50)
+        repo.record_value("u1", "vdot", None)
+
+        assert repo.get_cohort_size("vdot") == 0
+
+    def test_histogram_is_independent_of_athlete_count(self, repo):
+        for i in range(500):
+            repo.record_value(f"u{i}", "level", 5)
+
+        # One bucket for the value, stored for the overall cohort only
+        assert histogram_rows(repo) == 1
+
+
+class TestAgeGroups:
+    def test_age_group_mapping(self):
+        assert age_group(None) == ALL
+        assert age_group(22) == "under_25"
+        assert age_group(40) == "35_44"
+        assert age_group(70) == "65_plus"
+
+    def test_ranks_within_age_group_when_large_enough(self, repo):
+        for i in range(MIN_COHORT_SIZE):
+            repo.set_age(f"young{i}", 25)
+            repo.record_value(f"young{i}", "ctl", 80)
+            repo.set_age(f"older{i}", 50)
+            repo.record_value(f"older{i}", "ctl", 40)
+
+        # Beats every 45-54 athlete, but only half of everyone
+        assert repo.percentile("ctl", 60, age=50) == 100
+        assert repo.percentile("ctl", 60) == 50
+
+    def test_small_age_group_falls_back_to_everyone(self, repo):
+        repo.set_age("u1", 50)
+        repo.record_value("u1", "ctl", 40)
+        repo.record_value("u2", "ctl", 80)
+
+        assert repo.percentile("ctl", 60, age=50) == 50
+
+    def test_changing_age_moves_values(self, repo):
+        repo.record_value("u1", "ctl", 40)
+        repo.set_age("u1", 30)
+
+        assert repo.get_cohort_size("ctl", group="25_34") == 1
+        assert repo.get_cohort_size("ctl") == 1
+
+
+class TestRebuild:
+    def test_rebuild_from_training_data(self, temp_db_path):
+        training_db = TrainingDatabase(temp_db_path)
+        training_db.save_fitness_metrics(DailyFitnessMetrics(
+            date="2024-01-01", daily_load=50, ctl=45.0, atl=50.0, tsb=-5.0,
+            acwr=1.1, risk_zone="optimal",
+        ))
+        achievements = AchievementService(temp_db_path)
+        achievements.update_streak("2024-01-01", "u1")
+        achievements.update_streak("2024-01-01", "u2")
+
+        repo = CohortDistributionRepository(temp_db_path)
+        repo.record_value("stale", "ctl", 10)
+        counts = repo.rebuild(owner_user_id="u1")
+
+        assert counts["streak"] == 2
+        assert counts["ctl"] == 1
+        assert repo.get_cohort_size("ctl") == 1
+        assert repo.percentile("ctl", 45.0) is not None
+
+    def test_streak_updates_are_recorded_incrementally(self, temp_db_path):
+        achievements = AchievementService(temp_db_path)
+        achievements.update_streak("2024-01-01", "u1")
+        achievements.update_streak("2024-01-02", "u1")
+
+        repo = CohortDistributionRepository(temp_db_path)
+        assert repo.get_cohort_size("streak") == 1
+        assert repo.percentile("streak", 3) == 100
+
+
+class TestSocialProofRankings:
+    def test_rankings_come_from_cohorts(self, temp_db_path):
+        service = SocialProofService(temp_db_path)
+        for i in range(10):
+            service.record_user_values(f"u{i}", {"ctl": 10.0 * i + 5})
+
+        stats = service.get_social_proof_stats(user_ctl=75.0, user_streak=3)
+
+        assert stats.ctl_percentile.percentile == 70
+        assert stats.ctl_percentile.value == 75.0
+        # Nobody has a streak recorded yet
+        assert stats.streak_percentile is None
+
+    def test_no_rankings_without_database(self):
+        stats = SocialProofService().get_social_proof_stats(user_level=10, user_avg_pace=5.0)
+
+        assert stats.level_percentile is None
+        assert stats.pace_percentile is None
@@ -4,13 +4,17 @@ import os
 import pytest
 import tempfile
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 from training_analyzer.db.database import (
     TrainingDatabase,
     UserProfile,
     ActivityMetrics,
     DailyFitnessMetrics,
+    WellnessHRVRecord,
+    WellnessRestingHRRecord,
+    WellnessSleepRecord,
+    WellnessStressRecord,
     get_default_db_path,
 )
 
@@ -372,6 +376,28 @@ class TestDailyLoadTotals:
         assert totals[0]["activity_count"] == 3
 
 
+class TestWellnessData:
+    """Tests for combined wellness data retrieval."""
+
+    def test_get_wellness_data_returns_all_sources(self, temp_db):
+        """Should return sleep, HRV, stress and resting HR within the window."""
+        today = date.today()
+        for offset in (0, 1, 40):
+            day = (today - timedelta(days=offset)).isoformat()
+            temp_db.save_sleep_record(WellnessSleepRecord(date=day, total_sleep_seconds=28800))
+            temp_db.save_hrv_record(WellnessHRVRecord(date=day, hrv_last_night_avg=55))
+            temp_db.save_stress_record(WellnessStressRecord(date=day, body_battery_high=80))
+            temp_db.save_resting_hr_record(WellnessRestingHRRecord(date=day, resting_hr=48))
+
+        data = temp_db.get_wellness_data(days=30)
+
+        for key in ("sleep", "hrv", "stress", "resting_hr"):
+            assert len(data[key]) == 2
+            assert data[key][0].date == today.isoformat()  # Newest first
+        assert data["stress"][0].body_battery_high == 80
+        assert data["date_range"]["end"] == today.isoformat()
+
+
 class TestDatabaseStats:
     """Tests for database statistics."""
 
@@ -0,0 +1,183 @@
+"""Tests for the SQLite to Supabase migration script.
+
+This module tests:
+1. Keyset pagination over primary keys and rowids
+2. Isolating bad rows by bisecting failed batches
+3. Resuming from the checkpoint file
+4. Retrying failed rows on the next run
+"""
+
+import importlib.util
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "migrate_to_supabase.py"
+_spec = importlib.util.spec_from_file_location("migrate_to_supabase", SCRIPT_PATH)
+migrate = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(migrate)
+
+
+class FakeSupabase:
+    """Records upserts and rejects any batch containing a bad row."""
+
+    def __init__(self, bad_ids=(), fail_after=None):
+        self.bad_ids = set(bad_ids)
+        self.fail_after = fail_after
+        self.requests = []
+        self.rows = {}
+        self._lock = threading.Lock()
+
+    def table(self, table_name):
+        return FakeUpsert(self, table_name)
+
+    def is_bad(self, row):
+        return row.get("id") in self.bad_ids
+
+    def store(self, table_name, rows):
+        with self._lock:
+            self.requests.append(len(rows))
+            if self.fail_after is not None and len(self.rows) >= self.fail_after:
+                raise KeyboardInterrupt
+            if any(self.is_bad(row) for row in rows):
+                raise RuntimeError("invalid input syntax")
+            for row in rows:
+                self.rows[(table_name, row.get("id", row.get("name")))] = row
+
+
+class FakeUpsert:
+    def __init__(self, client, table_name):
+        self.client = client
+        self.table_name = table_name
+
+    def upsert(self, rows):
+        self.rows = rows
+        return self
+
+    def execute(self):
+        self.client.store(self.table_name, self.rows)
+
+
+@pytest.fixture
+def sqlite_conn():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany(
+        "INSERT INTO items (id, name) VALUES (?, ?)",
+        [(i, f"item-{i}") for i in range(1, 21)],
+    )
+    conn.execute("CREATE TABLE notes (name TEXT)")
+    conn.executemany("INSERT INTO notes (name) VALUES (?)", [(f"n{i}",) for i in range(5)])
+    yield conn
+    conn.close()
+
+
+def _migrate(conn, client, checkpoint, path, table="items", batch_size=5):
+    return migrate.migrate_table(
+        conn,
+        client,
+        table,
+        batch_size=batch_size,
+        workers=2,
+        checkpoint=checkpoint,
+        checkpoint_path=str(path),
+    )
+
+
+class TestKeysetPagination:
+    def test_pages_cover_table_in_key_order(self, sqlite_conn):
+        keys = migrate.get_keyset_columns(sqlite_conn, "items")
+        seen, after = [], None
+        while rows := migrate.fetch_rows_after(sqlite_conn, "items", keys, after, 6):
+            seen.extend(row["id"] for row in rows)
+            after = migrate.row_key(rows[-1], keys)
+
+        assert keys == ["id"]
+        assert seen == list(range(1, 21))
+
+    def test_rowid_fallback(self, sqlite_conn):
+        keys = migrate.get_keyset_columns(sqlite_conn, "notes")
+        rows = migrate.fetch_rows_after(sqlite_conn, "notes", keys, [2], 10)
+
+        assert keys == [migrate.ROWID_COLUMN]
+        assert [row["name"] for row in rows] == ["n2", "n3", "n4"]
+
+
+class TestUpsertWithBisect:
+    def test_isolates_bad_row(self):
+        client = FakeSupabase(bad_ids={6})
+        rows = [{"id": i} for i in range(8)]
+
+        migrated, failed = migrate.upsert_with_bisect(client, "items", rows)
+
+        assert migrated == 7
+        assert [row["id"] for row, _ in failed] == [6]
+        assert "invalid input" in failed[0][1]
+        # 8 -> 4 -> 2 -> 1 + 1, plus the good halves
+        assert len(client.requests) == 7
+
+
+class TestMigrateTable:
+    def test_resumes_after_interruption(self, sqlite_conn, tmp_path):
+        path = tmp_path / "checkpoint.json"
+        client = FakeSupabase(fail_after=10)
+
+        with pytest.raises(KeyboardInterrupt):
+            _migrate(sqlite_conn, client, {"tables": {}}, path)
+
+        checkpoint = migrate.load_checkpoint(str(path))
+        progress = checkpoint["tables"]["items"]
+        assert progress["done"] is False
+        assert progress["last_key"] is not None
+        resumed_after = progress["last_key"][0]
+
+        client.fail_after = None
+        client.requests.clear()
+        assert _migrate(sqlite_conn, client, checkpoint, path) == (20, 0)
+
+        assert sorted(k for _, k in client.rows) == list(range(1, 21))
+        # Completed batches are not uploaded again
+        assert sum(client.requests) == 20 - resumed_after
+        assert migrate.load_checkpoint(str(path))["tables"]["items"]["done"] is True
+
+    def test_failed_rows_keep_table_open_and_are_retried(self, sqlite_conn, tmp_path):
+        path = tmp_path / "checkpoint.json"
+        client = FakeSupabase(bad_ids={3, 12})
+
+        assert _migrate(sqlite_conn, client, {"tables": {}}, path) == (18, 2)
+
+        checkpoint = migrate.load_checkpoint(str(path))
+        progress = checkpoint["tables"]["items"]
+        assert progress["done"] is False
+        assert progress["failed_keys"] == [[3], [12]]
+
+        # Row 12 is fixed upstream; row 3 still fails
+        client.bad_ids = {3}
+        client.requests.clear()
+        assert _migrate(sqlite_conn, client, checkpoint, path) == (19, 1)
+        assert ("items", 12) in client.rows
+        assert sum(client.requests) < 20
+
+        client.bad_ids = set()
+        assert _migrate(sqlite_conn, client, checkpoint, path) == (20, 0)
+        progress = migrate.load_checkpoint(str(path))["tables"]["items"]
+        assert progress["done"] is True
+        assert progress["failed_keys"] == []
+
+    def test_failed_rowid_rows_are_retried(self, sqlite_conn, tmp_path):
+        path = tmp_path / "checkpoint.json"
+        sqlite_conn.execute("UPDATE notes SET name = 'bad' WHERE name = 'n1'")
+
+        client = FakeSupabase()
+        client.is_bad = lambda row: row["name"] == "bad"
+        checkpoint = {"tables": {}}
+        assert _migrate(sqlite_conn, client, checkpoint, path, table="notes") == (4, 1)
+        assert checkpoint["tables"]["notes"]["failed_keys"] == [[2]]
+
+        sqlite_conn.execute("UPDATE notes SET name = 'n1' WHERE name = 'bad'")
+        assert _migrate(sqlite_conn, client, checkpoint, path, table="notes") == (5, 0)
+        assert ("notes", "n1") in client.rows
@@ -0,0 +1,246 @@
+"""Tests for PlanRepository - plans with weeks and sessions stored per row."""
+
+import json
+import os
+import sqlite3
+import tempfile
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from training_analyzer.db.repositories.plan_repository import PlanRepository
+from training_analyzer.models.plans import (
+    PeriodizationType,
+    PlannedSession,
+    RaceDistance,
+    RaceGoal,
+    TrainingPhase,
+    TrainingPlan,
+    TrainingWeek,
+    WorkoutType,
+)
+
+
+@pytest.fixture
+def temp_db_path():
+    """Create a temporary database file path."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    yield db_path
+    try:
+        os.unlink(db_path)
+    except OSError:
+        pass
+
+
+@pytest.fixture
+def plan_repo(temp_db_path):
+    """Create a PlanRepository with a temporary database."""
+    return PlanRepository(db_path=temp_db_path)
+
+
+def _plan(plan_id, created_at=None, weeks=3, is_active=False):
+    sessions = [
+        PlannedSession(
+            day_of_week=1,
+            workout_type=WorkoutType.TEMPO,
+            description="Tempo run",
+            target_duration_min=45,
+            target_load=70.0,
+            intervals=[{"reps": 3, "duration_min": 8}],
+        ),
+        PlannedSession(
+            day_of_week=6,
+            workout_type=WorkoutType.LONG,
+            description="Long run",
+            target_duration_min=100,
+            target_load=110.0,
+            target_hr_zone="Zone 2",
+        ),
+    ]
+    return TrainingPlan(
+        id=plan_id,
+        goal=RaceGoal(
+            race_date=date.today() + timedelta(weeks=weeks + 1),
+            distance=RaceDistance.HALF_MARATHON,
+            target_time_seconds=5400,
+        ),
+        weeks=[
+            TrainingWeek(
+                week_number=n,
+                phase=TrainingPhase.BUILD,
+                target_load=180.0 + n,
+                sessions=list(sessions),
+                focus="Threshold",
+                is_cutback=n == weeks,
+            )
+            for n in range(1, weeks + 1)
+        ],
+        periodization=PeriodizationType.LINEAR,
+        peak_week=weeks,
+        created_at=created_at or datetime.now(),
+        name=f"Plan {plan_id}",
+        is_active=is_active,
+    )
+
+
+def _rows(db_path, table, plan_id):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE plan_id = ?", (plan_id,)
+        ).fetchone()[0]
+
+
+class TestWeekStorage:
+    """Tests for storing weeks and sessions as rows."""
+
+    def test_round_trip(self, plan_repo, temp_db_path):
+        plan = _plan("p1")
+        plan_repo.save(plan)
+
+        loaded = plan_repo.get("p1")
+
+        assert [w.to_dict() for w in loaded.weeks] == [w.to_dict() for w in plan.weeks]
+        assert _rows(temp_db_path, "training_plan_weeks", "p1") == 3
+        assert _rows(temp_db_path, "training_plan_sessions", "p1") == 6
+
+    def test_resave_replaces_weeks(self, plan_repo):
+        plan = _plan("p1", weeks=4)
+        plan_repo.save(plan)
+        plan.weeks = plan.weeks[:2]
+        plan_repo.save(plan)
+
+        assert [w.week_number for w in plan_repo.get("p1").weeks] == [1, 2]
+
+    def test_save_weeks_writes_only_given_weeks(self, plan_repo, temp_db_path):
+        plan = _plan("p1", weeks=4)
+        full = list(plan.weeks)
+        plan.weeks = full[:2]
+        plan_repo.save_weeks(plan, [1, 2])
+
+        plan.weeks = full
+        plan.weeks[0].focus = "Changed in memory only"
+        plan_repo.save_weeks(plan, [3, 4])
+
+        loaded = plan_repo.get("p1")
+        assert [w.week_number for w in loaded.weeks] == [1, 2, 3, 4]
+        assert loaded.weeks[0].focus == "Threshold"
+        assert loaded.total_weeks == 4
+        assert _rows(temp_db_path, "training_plan_sessions", "p1") == 8
+
+    def test_save_dict_stores_rows(self, plan_repo):
+        data = _plan("p1").to_dict()
+        data["weeks"] = data["weeks"][:1]
+        plan_repo.save_dict(data)
+
+        assert plan_repo.get_week("p1", 1).sessions[1].description == "Long run"
+        assert plan_repo.get_week("p1", 2) is None
+
+    def test_delete_removes_weeks(self, plan_repo, temp_db_path):
+        plan_repo.save(_plan("p1"))
+
+        assert plan_repo.delete("p1")
+        assert _rows(temp_db_path, "training_plan_weeks", "p1") == 0
+        assert _rows(temp_db_path, "training_plan_sessions", "p1") == 0
+
+    def test_legacy_weeks_json_is_migrated(self, plan_repo, temp_db_path):
+        plan = _plan("legacy")
+        plan_repo.save(plan)
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute("DELETE FROM training_plan_sessions")
+            conn.execute("DELETE FROM training_plan_weeks")
+            conn.execute(
+                "UPDATE training_plans SET weeks_json = ? WHERE id = 'legacy'",
+                (json.dumps([w.to_dict() for w in plan.weeks]),)
+            )
+
+        migrated = PlanRepository(db_path=temp_db_path).get("legacy")
+
+        assert [w.to_dict() for w in migrated.weeks] == [w.to_dict() for w in plan.weeks]
+        with sqlite3.connect(temp_db_path) as conn:
+            assert conn.execute("SELECT weeks_json FROM training_plans").fetchone()[0] == "[]"
+
+
+class TestSessionUpdates:
+    """Tests for updating a single session."""
+
+    def test_update_session_changes_one_row(self, plan_repo):
+        plan_repo.save(_plan("p1"))
+
+        session = plan_repo.update_session(
+            "p1", 2, 0, workout_type=WorkoutType.INTERVALS, notes="Track", intervals=None
+        )
+
+        assert session.workout_type == WorkoutType.INTERVALS
+        assert session.intervals is None
+        weeks = plan_repo.get("p1").weeks
+        assert weeks[1].sessions[0].notes == "Track"
+        assert weeks[0].sessions[0].workout_type == WorkoutType.TEMPO
+        assert weeks[2].sessions[0].intervals == [{"reps": 3, "duration_min": 8}]
+
+    def test_update_missing_session(self, plan_repo):
+        plan_repo.save(_plan("p1"))
+
+        assert plan_repo.update_session("p1", 9, 0, notes="x") is None
+        assert plan_repo.update_session("p1", 1, 5, notes="x") is None
+
+    def test_update_unknown_field(self, plan_repo):
+        plan_repo.save(_plan("p1"))
+
+        with pytest.raises(ValueError):
+            plan_repo.update_session("p1", 1, 0, weeks_json="[]")
+
+    def test_save_session(self, plan_repo):
+        plan_repo.save(_plan("p1"))
+        session = plan_repo.get_week("p1", 1).sessions[1]
+        session.target_duration_min = 120
+
+        plan_repo.save_session("p1", 1, 1, session)
+
+        assert plan_repo.get_week("p1", 1).sessions[1].target_duration_min == 120
+
+
+class TestListing:
+    """Tests for keyset-paginated listing and the active plan lookup."""
+
+    def test_cursor_pages_cover_all_plans(self, plan_repo):
+        base = datetime(2025, 1, 1)
+        for i in range(7):
+            # Two plans share each timestamp to exercise the id tie-break
+            plan_repo.save(_plan(f"p{i}", created_at=base + timedelta(hours=i // 2)))
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = plan_repo.list_summaries(limit=3, cursor=cursor)
+            seen.extend(summary["id"] for summary in page)
+            if cursor is None:
+                break
+
+        assert seen == [p.id for p in plan_repo.get_all(limit=10)]
+        assert len(set(seen)) == 7
+
+    def test_summaries_match_plan(self, plan_repo):
+        plan = _plan("p1")
+        plan_repo.save(plan)
+
+        (summary,), cursor = plan_repo.list_summaries()
+
+        assert cursor is None
+        assert summary["goal"]["target_time"] == plan.goal.target_time_formatted
+        assert summary["phases_summary"] == plan.phases_summary
+        assert summary["total_weeks"] == 3
+
+    def test_active_only_and_get_active(self, plan_repo):
+        plan_repo.save(_plan("old", created_at=datetime(2025, 1, 1)))
+        plan_repo.save(_plan("new", created_at=datetime(2025, 2, 1)))
+        plan_repo.set_active("old")
+
+        page, _ = plan_repo.list_summaries(active_only=True)
+
+        assert [s["id"] for s in page] == ["old"]
+        assert plan_repo.get_active().id == "old"
+        assert len(plan_repo.get_active().weeks) == 3
+
+    def test_invalid_cursor(self, plan_repo):
+        with pytest.raises(ValueError):
+            plan_repo.list_summaries(cursor="garbage")
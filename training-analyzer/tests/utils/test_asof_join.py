@@ -0,0 +1,89 @@
+"""Tests for the as-of join and its use in pattern analytics."""
+
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from training_analyzer.services.pattern_recognition_service import PatternRecognitionService
+from training_analyzer.utils.asof_join import asof_join
+
+
+def test_matches_latest_row_on_or_before():
+    left = [{"date": "2024-01-05"}, {"date": "2024-01-01"}, {"date": "2024-01-03"}]
+    right = [{"date": "2024-01-04", "v": 4}, {"date": "2024-01-02", "v": 2}]
+
+    matches = asof_join(left, right)
+
+    assert [m and m["v"] for m in matches] == [4, None, 2]
+
+
+def test_exact_date_and_duplicate_history():
+    left = [{"date": "2024-01-02"}]
+    right = [{"date": "2024-01-02", "v": 1}, {"date": "2024-01-02", "v": 2}]
+
+    assert asof_join(left, right)[0]["v"] == 2
+
+
+def test_max_gap_and_missing_dates():
+    left = [{"date": "2024-01-10"}, {"date": None}, {"date": "2024-01-02"}]
+    right = [SimpleNamespace(date="2024-01-01", v=1)]
+
+    assert asof_join(left, right, max_gap_days=0) == [None, None, None]
+    assert asof_join(left, right, max_gap_days=1) == [None, None, right[0]]
+
+
+def test_key_functions_and_mixed_date_types():
+    left = [date(2024, 3, 1), "2024-03-02T07:30:00"]
+    right = [{"day": date(2024, 2, 28)}, {"day": "2024-03-02"}]
+
+    matches = asof_join(left, right, left_key=lambda d: d, right_key="day")
+
+    assert matches == [right[0], right[1]]
+
+
+def test_multi_year_join_is_fast():
+    start = date(2020, 1, 1)
+    fitness = [{"date": (start + timedelta(days=i)).isoformat(), "ctl": i} for i in range(0, 2000, 3)]
+    workouts = [{"date": (start + timedelta(days=i)).isoformat()} for i in range(2000)] * 3
+
+    began = time.perf_counter()
+    matches = asof_join(workouts, fitness)
+    elapsed = time.perf_counter() - began
+
+    assert matches[4]["ctl"] == 3
+    assert elapsed < 0.5
+
+
+def test_correlation_context_is_attached():
+    start = date.today() - timedelta(days=20)
+    days = [(start + timedelta(days=i)).isoformat() for i in range(14)]
+    db = MagicMock()
+    db.get_activities_range.return_value = [
+        {"date": d, "hrss": 50.0} for d in days[::2]
+    ]
+    db.get_fitness_range.return_value = [
+        {"date": d, "ctl": 40.0 + i, "atl": 45.0, "tsb": -5.0 + i} for i, d in enumerate(days)
+    ]
+    db.get_sleep_range.return_value = [SimpleNamespace(date=days[4], total_sleep_hours=7.5)]
+    db.get_hrv_range.return_value = [
+        SimpleNamespace(date=days[4], hrv_last_night_avg=55, hrv_weekly_avg=50)
+    ]
+
+    service = PatternRecognitionService(db)
+    workouts = service._get_workouts_with_context("u", start, date.today())
+    by_date = {w["date"]: w for w in workouts}
+
+    assert by_date[days[2]]["tsb"] == -3.0
+    assert by_date[days[4]]["prev_night_sleep_hours"] == 7.5
+    assert by_date[days[4]]["hrv_vs_baseline"] == 1.1
+    assert "prev_night_sleep_hours" not in by_date[days[6]]
+    assert by_date[days[0]]["days_since_last_workout"] is None
+    assert by_date[days[2]]["days_since_last_workout"] == 2
+
+    first_of_week = min(
+        w["date"] for w in workouts
+        if date.fromisoformat(w["date"]).isocalendar()[:2]
+        == date.fromisoformat(days[6]).isocalendar()[:2]
+    )
+    assert by_date[first_of_week]["weekly_load_so_far"] == 0.0
@@ -0,0 +1,122 @@
+"""Tests for deferred imports and the startup path."""
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from training_analyzer.utils import lazy_import as lazy_module
+from training_analyzer.utils.lazy_import import LazyObject, lazy_exports, lazy_import
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def fake_module(tmp_path, monkeypatch):
+    """A throwaway module on sys.path that records when it is imported."""
+    (tmp_path / "lazy_fake_mod.py").write_text(
+        textwrap.dedent(
+            """
+            IMPORTED = True
+
+            def double(x):
+                return 2 * x
+
+            class Thing:
+                LIMIT = 3
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(lazy_module, "_deferred_modules", {})
+    yield "lazy_fake_mod"
+    sys.modules.pop("lazy_fake_mod", None)
+
+
+def test_lazy_object_imports_on_first_use(fake_module):
+    double = lazy_import(fake_module, "double")
+    thing = lazy_import(fake_module, "Thing")
+
+    assert fake_module not in sys.modules
+    assert "deferred" in repr(double)
+    assert double(21) == 42
+    assert fake_module in sys.modules
+    assert thing.LIMIT == 3
+
+
+def test_introspection_does_not_import(fake_module):
+    from typing import Optional
+
+    thing = lazy_import(fake_module, "Thing")
+    Optional[thing]
+
+    assert not hasattr(thing, "__wrapped__")
+    assert fake_module not in sys.modules
+
+
+def test_relative_module_names_resolve_against_package():
+    obj = lazy_import("..lazy_import", "LazyObject", "training_analyzer.utils.sub")
+
+    assert obj.resolve() is LazyObject
+
+
+def test_warm_up_imports_deferred_modules(fake_module):
+    lazy_import(fake_module, "double")
+    lazy_import("lazy_missing_mod", "anything")
+
+    assert lazy_module.deferred_modules() == [fake_module, "lazy_missing_mod"]
+    timings = lazy_module.warm_up()
+
+    assert list(timings) == [fake_module]
+    assert lazy_module.deferred_modules() == ["lazy_missing_mod"]
+
+
+def test_lazy_exports_caches_in_namespace():
+    namespace = sys.modules["training_analyzer.utils"].__dict__
+    getattr_ = lazy_exports(
+        "training_analyzer.utils", {"_LazyAlias": ".lazy_import:LazyObject"}
+    )
+    try:
+        assert getattr_("_LazyAlias") is LazyObject
+        assert namespace["_LazyAlias"] is LazyObject
+        with pytest.raises(AttributeError):
+            getattr_("nope")
+    finally:
+        namespace.pop("_LazyAlias", None)
+
+
+def test_patched_lazy_route_attribute_is_used():
+    from training_analyzer.api.routes import plans
+
+    with patch("training_analyzer.api.routes.plans.PlanAgent") as agent_cls:
+        plans.PlanAgent()
+    agent_cls.assert_called_once()
+    assert isinstance(plans.PlanAgent, LazyObject)
+
+
+def test_app_import_defers_heavy_subsystems():
+    script = textwrap.dedent(
+        """
+        import sys
+        import training_analyzer.main
+        heavy = ["langgraph", "langchain_core", "openai", "anthropic", "garminconnect"]
+        print(",".join(m for m in heavy if m in sys.modules))
+        """
+    )
+    env = dict(os.environ, JWT_SECRET_KEY="lazy-import-test-secret-0123456789abcdef")
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PACKAGE_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
@@ -84,6 +84,27 @@ class TestTokenCounter:
         # 1 token for "hello" + 4 overhead + 2 priming = 7
         assert tokens == 7
 
+    def test_count_message_tokens_uses_precomputed_count(self):
+        """Test that a stored token_count is trusted instead of re-encoding."""
+        from src.utils.token_counter import count_message_tokens
+
+        messages = [{"role": "user", "content": "hello", "token_count": 42}]
+
+        # 42 precomputed + 2 priming
+        assert count_message_tokens(messages) == 44
+
+    def test_select_recent_within_budget(self):
+        """Test selecting the newest messages that fit a budget."""
+        from src.utils.token_counter import select_recent_within_budget
+
+        counts = [50, 10, 20, 30]
+
+        assert select_recent_within_budget(counts, 1000) == 0
+        assert select_recent_within_budget(counts, 60) == 1
+        assert select_recent_within_budget(counts, 49) == 3
+        assert select_recent_within_budget(counts, 5) == 4
+        assert select_recent_within_budget([], 100) == 0
+
     def test_estimate_cost_sonnet(self):
         """Test cost estimation for Claude Sonnet."""
         from src.utils.token_counter import estimate_cost
@@ -0,0 +1,187 @@
+"""Concurrent wellness history backfill.
+
+Fetches many days from Garmin Connect with a small pool of workers:
+
+- Dates whose stored record is already final are skipped, as are dates
+  an earlier run found empty on Garmin's side (unless refetching).
+- A day where some sources failed transiently (server errors, timeouts)
+  is stored as 'partial' and fetched again on the next run; if nothing
+  came back it is 'failed' rather than empty.
+- When Garmin rate-limits a request, every worker pauses until the
+  Retry-After (or an exponential backoff) has passed, then the date is
+  retried.
+- Fetched days are written to the local store in batches, and each
+  outcome is recorded in fetch_progress, so an interrupted backfill
+  resumes where it stopped.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence
+
+from garmin_client import Database, DailyWellness, RateLimitError
+
+
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 14
+MAX_RATE_LIMIT_RETRIES = 5
+BASE_BACKOFF_SEC = 2.0
+MAX_BACKOFF_SEC = 120.0
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of a backfill run."""
+    requested: int = 0
+    skipped: int = 0
+    fetched: int = 0
+    no_data: int = 0
+    rate_limited: int = 0
+    partial: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+
+
+class RateLimitGate:
+    """Pause shared by all workers after a rate-limited request."""
+
+    def __init__(self, sleep: Callable[[float], None] = time.sleep):
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        """Block until no pause is in effect."""
+        while True:
+            with self._lock:
+                delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            self._sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every worker for at least `seconds` from now."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def _has_data(wellness: DailyWellness) -> bool:
+    return any((
+        wellness.sleep, wellness.hrv, wellness.stress,
+        wellness.activity, wellness.resting_heart_rate,
+    ))
+
+
+def _pending_dates(db: Database, dates: Sequence[str], refetch: bool) -> List[str]:
+    """Dates that still need fetching, in the given order."""
+    if refetch or not dates:
+        return list(dates)
+    start, end = min(dates), max(dates)
+    done = db.get_complete_dates(start, end)
+    # An empty day only counts as final once it was checked after it ended
+    empty = {
+        date for date, row in db.get_fetch_progress(start, end).items()
+        if row["status"] == "no_data" and row["updated_at"][:10] > date
+    }
+    return [d for d in dates if d not in done and d not in empty]
+
+
+def backfill(
+    fetch: Callable[[str], DailyWellness],
+    db: Database,
+    dates: Sequence[str],
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    refetch: bool = False,
+    max_retries: int = MAX_RATE_LIMIT_RETRIES,
+    base_backoff: float = BASE_BACKOFF_SEC,
+    on_result: Optional[Callable[[str, str], None]] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> BackfillResult:
+    """
+    Fetch and store wellness data for many dates concurrently.
+
+    Args:
+        fetch: Returns the DailyWellness for a date (GarminClient.fetch_wellness)
+        db: Local wellness store
+        dates: Dates (YYYY-MM-DD) to backfill, fetched in this order
+        workers: Maximum concurrent fetches
+        batch_size: Records written per transaction
+        refetch: Fetch dates even if already stored and complete
+        max_retries: Rate-limit retries per date before giving up on it
+        base_backoff: First backoff when the server sends no Retry-After
+        on_result: Called with (date, status) as each date finishes
+        sleep: Sleep function (injectable for tests)
+
+    Returns:
+        BackfillResult with per-outcome counts
+    """
+    result = BackfillResult(requested=len(dates))
+    pending = _pending_dates(db, dates, refetch)
+    result.skipped = len(dates) - len(pending)
+
+    gate = RateLimitGate(sleep)
+    counter_lock = threading.Lock()
+
+    def fetch_one(date_str: str) -> DailyWellness:
+        for attempt in range(max_retries + 1):
+            gate.wait()
+            try:
+                return fetch(date_str)
+            except RateLimitError as e:
+                with counter_lock:
+                    result.rate_limited += 1
+                if attempt == max_retries:
+                    raise
+                gate.pause(e.retry_after or min(MAX_BACKOFF_SEC, base_backoff * 2 ** attempt))
+
+    records: List[DailyWellness] = []
+    progress = []
+
+    def flush() -> None:
+        if records:
+            db.save_wellness_batch(records)
+            records.clear()
+        if progress:
+            db.save_fetch_progress(progress)
+            progress.clear()
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = {pool.submit(fetch_one, date_str): date_str for date_str in pending}
+        for future in as_completed(futures):
+            date_str = futures[future]
+            try:
+                wellness = future.result()
+            except Exception as e:
+                status, error = "failed", str(e)
+                result.failed.append(date_str)
+            else:
+                error = "; ".join(
+                    f"{source}: {message}" for source, message in wellness.fetch_errors.items()
+                ) or None
+                if not _has_data(wellness):
+                    if error:
+                        status = "failed"
+                        result.failed.append(date_str)
+                    else:
+                        status = "no_data"
+                        result.no_data += 1
+                else:
+                    status = "partial" if error else "fetched"
+                    records.append(wellness)
+                    result.fetched += 1
+                    if error:
+                        result.partial.append(date_str)
+            progress.append((date_str, status, error))
+            if on_result:
+                on_result(date_str, status)
+            if len(progress) >= batch_size:
+                flush()
+    finally:
+        # On interrupt, drop queued dates but keep what was fetched
+        pool.shutdown(wait=True, cancel_futures=True)
+        flush()
+
+    return result
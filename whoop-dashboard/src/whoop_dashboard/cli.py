@@ -7,6 +7,7 @@ Fetch wellness data and calculate recovery scores.
 Usage:
     whoop fetch              # Fetch today's data
     whoop fetch --days 7     # Backfill 7 days
+    whoop fetch --days 365 --workers 8  # Backfill a year concurrently
     whoop show               # Show today's recovery
     whoop stats              # Database stats
 """
@@ -19,6 +20,8 @@ from pathlib import Path
 
 from garmin_client import GarminClient, Database
 
+from .backfill import DEFAULT_WORKERS, backfill
+
 
 def calculate_recovery(wellness) -> int:
     """Calculate WHOOP-style recovery score (0-100)."""
@@ -79,17 +82,32 @@ def cmd_fetch(args):
         end = datetime.now().date()
         dates = [(end - timedelta(days=i)).isoformat() for i in range(args.days)]
 
-    # Fetch and store
-    success = 0
-    for date_str in dates:
-        try:
-            wellness = client.fetch_wellness(date_str)
-            db.save_wellness(wellness)
-            success += 1
-        except Exception as e:
-            print(f"  Error: {e}")
-
-    print(f"\nFetched {success}/{len(dates)} days")
+    # Fetch concurrently, skipping days already stored and complete
+    def report(date_str, status):
+        if status in ("failed", "partial"):
+            print(f"  {date_str}: {status}")
+
+    result = backfill(
+        client.fetch_wellness,
+        db,
+        dates,
+        workers=args.workers,
+        refetch=args.refetch,
+        on_result=report,
+    )
+
+    print(f"\nFetched {result.fetched}/{len(dates)} days", end="")
+    if result.skipped:
+        print(f", {result.skipped} already stored", end="")
+    if result.no_data:
+        print(f", {result.no_data} without data", end="")
+    if result.rate_limited:
+        print(f", {result.rate_limited} rate-limited retries", end="")
+    print()
+    if result.partial:
+        print(f"{len(result.partial)} days incomplete; run again to complete them")
+    if result.failed:
+        print(f"{len(result.failed)} days failed; run again to retry them")
 
 
 def cmd_show(args):
@@ -158,6 +176,10 @@ def main():
     fetch_p = subparsers.add_parser("fetch", help="Fetch wellness data")
     fetch_p.add_argument("--date", "-d", help="Specific date (YYYY-MM-DD)")
     fetch_p.add_argument("--days", "-n", type=int, default=1, help="Days to fetch")
+    fetch_p.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS,
+                         help="Concurrent fetches")
+    fetch_p.add_argument("--refetch", action="store_true",
+                         help="Refetch days already stored")
 
     # Show
     show_p = subparsers.add_parser("show", help="Show recovery")
@@ -0,0 +1,219 @@
+"""Tests for the concurrent wellness backfill, run against a local fake API."""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from garmin_client import Database, RateLimitError
+from garmin_client.db.models import ActivityData, DailyWellness
+
+from whoop_dashboard.backfill import backfill
+
+
+class FakeGarmin:
+    """In-process HTTP server standing in for Garmin Connect."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.rate_limited = 0  # Next N requests get a 429
+        self.empty = set()
+        self.broken = set()
+        self.flaky = set()  # Days where another source fails transiently
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                day = self.path.rsplit("/", 1)[-1]
+                with fake._lock:
+                    fake.requests.append(day)
+                    fake.in_flight += 1
+                    fake.max_in_flight = max(fake.max_in_flight, fake.in_flight)
+                    limited = fake.rate_limited > 0
+                    if limited:
+                        fake.rate_limited -= 1
+                try:
+                    time.sleep(fake.delay)
+                    if limited:
+                        self.send_response(429)
+                        self.send_header("Retry-After", "0.05")
+                        self.end_headers()
+                    elif day in fake.broken:
+                        self.send_response(500)
+                        self.end_headers()
+                    else:
+                        steps = 0 if day in fake.empty else 8000
+                        body = json.dumps({"steps": steps}).encode()
+                        self.send_response(200)
+                        self.send_header("Content-Type", "application/json")
+                        self.end_headers()
+                        self.wfile.write(body)
+                finally:
+                    with fake._lock:
+                        fake.in_flight -= 1
+
+        return Handler
+
+    def fetch(self, date_str: str) -> DailyWellness:
+        """Minimal client: one request per day, 429 raised as RateLimitError."""
+        try:
+            with urllib.request.urlopen(f"{self.url}/wellness/{date_str}") as resp:
+                data = json.load(resp)
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                raise RateLimitError(float(e.headers["Retry-After"]))
+            raise
+        activity = ActivityData(date=date_str, steps=data["steps"]) if data["steps"] else None
+        errors = {"sleep": "HTTP 503"} if date_str in self.flaky else {}
+        return DailyWellness(
+            date=date_str, fetched_at=datetime.now().isoformat(), activity=activity,
+            fetch_errors=errors,
+        )
+
+
+@pytest.fixture
+def api():
+    fake = FakeGarmin()
+    thread = threading.Thread(target=fake.server.serve_forever, daemon=True)
+    thread.start()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
+
+
+@pytest.fixture
+def db(tmp_path):
+    return Database(str(tmp_path / "wellness.db"))
+
+
+def past_dates(n, end=None):
+    end = end or date.today() - timedelta(days=1)
+    return [(end - timedelta(days=i)).isoformat() for i in range(n)]
+
+
+def test_fetches_all_dates_with_bounded_concurrency(api, db):
+    dates = past_dates(20)
+
+    result = backfill(api.fetch, db, dates, workers=4)
+
+    assert result.fetched == 20
+    assert sorted(api.requests) == sorted(dates)
+    assert 1 < api.max_in_flight <= 4
+    assert all(db.get_wellness(d).activity.steps == 8000 for d in dates)
+
+
+def test_rate_limit_pauses_and_retries(api, db):
+    api.rate_limited = 3
+    dates = past_dates(6)
+
+    result = backfill(api.fetch, db, dates, workers=3)
+
+    assert result.rate_limited == 3
+    assert result.fetched == 6
+    assert not result.failed
+
+
+def test_gives_up_after_max_retries(api, db):
+    api.rate_limited = 100
+    dates = past_dates(1)
+
+    result = backfill(api.fetch, db, dates, workers=1, max_retries=2)
+
+    assert result.failed == dates
+    assert len(api.requests) == 3
+    assert db.get_fetch_progress(dates[0], dates[0])[dates[0]]["status"] == "failed"
+
+
+def test_skips_complete_dates(api, db):
+    dates = past_dates(10)
+    backfill(api.fetch, db, dates[:5])
+    api.requests.clear()
+
+    result = backfill(api.fetch, db, dates)
+
+    assert result.skipped == 5
+    assert sorted(api.requests) == sorted(dates[5:])
+
+
+def test_refetches_when_asked(api, db):
+    dates = past_dates(3)
+    backfill(api.fetch, db, dates)
+    api.requests.clear()
+
+    result = backfill(api.fetch, db, dates, refetch=True)
+
+    assert result.skipped == 0
+    assert sorted(api.requests) == sorted(dates)
+
+
+def test_resume_skips_empty_days_and_retries_failures(api, db):
+    dates = past_dates(6)
+    api.empty = {dates[0]}
+    api.broken = {dates[1]}
+
+    first = backfill(api.fetch, db, dates)
+    assert (first.fetched, first.no_data, first.failed) == (4, 1, [dates[1]])
+
+    api.broken.clear()
+    api.requests.clear()
+    second = backfill(api.fetch, db, dates)
+
+    assert api.requests == [dates[1]]
+    assert second.fetched == 1
+    progress = db.get_fetch_progress(dates[-1], dates[0])
+    assert progress[dates[1]]["attempts"] == 2
+    assert progress[dates[1]]["status"] == "fetched"
+
+
+def test_transient_errors_leave_days_incomplete(api, db):
+    dates = past_dates(4)
+    api.flaky = {dates[0], dates[1]}
+    api.empty = {dates[1]}
+
+    first = backfill(api.fetch, db, dates)
+
+    assert (first.fetched, first.no_data) == (3, 0)
+    assert first.partial == [dates[0]]
+    assert first.failed == [dates[1]]
+    progress = db.get_fetch_progress(dates[-1], dates[0])
+    assert progress[dates[0]]["status"] == "partial"
+    assert progress[dates[0]]["last_error"] == "sleep: HTTP 503"
+    assert db.get_wellness(dates[0]).activity.steps == 8000
+
+    api.flaky.clear()
+    api.requests.clear()
+    second = backfill(api.fetch, db, dates)
+
+    assert sorted(api.requests) == sorted(dates[:2])
+    assert (second.fetched, second.no_data, second.partial) == (1, 1, [])
+    assert dates[0] in db.get_complete_dates(dates[-1], dates[0])
+
+
+def test_writes_in_batches(api, db, monkeypatch):
+    batches = []
+    save = db.save_wellness_batch
+    monkeypatch.setattr(db, "save_wellness_batch", lambda rows: batches.append(len(rows)) or save(rows))
+
+    backfill(api.fetch, db, past_dates(12), batch_size=5)
+
+    assert batches == [5, 5, 2]